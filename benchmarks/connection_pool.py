@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+"""Measures the connections opened by RequestsClient under concurrency.
+
+A local HTTP server answers every request after a fixed latency. Requests
+are sent in bursts of one request per thread, as the parallel paginators do
+for each page, through a RequestsClient keeping 10 connections per host, the
+previous default of requests, then through one with the current defaults.
+Throughput and the counters of the connection pool are printed for each:
+the connections discarded at the end of a burst because the pool was full
+are opened again, with a new handshake, by the next one.
+
+Usage:
+    python benchmarks/connection_pool.py [--threads 32] [--bursts 100]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cohesity_management_sdk.http.http_method_enum import HttpMethodEnum
+from cohesity_management_sdk.http.http_request import HttpRequest
+from cohesity_management_sdk.http.requests_client import RequestsClient
+
+BODY = b'{"views": []}'
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    latency = 0.02
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header('content-type', 'application/json')
+        self.send_header('content-length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingMixIn, HTTPServer):
+
+    daemon_threads = True
+
+    request_queue_size = 256
+
+
+def run(client, url, threads, bursts):
+    request = HttpRequest(HttpMethodEnum.GET, url)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for _ in range(bursts):
+            for _ in executor.map(lambda _: client.execute_as_string(request), range(threads)):
+                pass
+    return threads * bursts / (time.perf_counter() - start), client.get_pool_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--bursts', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.02)
+    args = parser.parse_args()
+
+    Handler.latency = args.latency
+    server = Server(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    url = 'http://127.0.0.1:{}/views'.format(server.server_address[1])
+
+    print('{} bursts of {} requests, {:.0f} ms latency'.format(
+        args.bursts, args.threads, args.latency * 1000))
+    print('{:<22} {:>10} {:>9} {:>10} {:>7}'.format(
+        'client', 'requests/s', 'created', 'discarded', 'reused'))
+    for name, client in [('pool_maxsize=10', RequestsClient(pool_maxsize=10)),
+                         ('defaults', RequestsClient())]:
+        throughput, stats = run(client, url, args.threads, args.bursts)
+        print('{:<22} {:>10.0f} {:>9} {:>10} {:>7}'.format(
+            name, throughput, stats['created'], stats['discarded'], stats['reused']))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
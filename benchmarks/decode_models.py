@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+"""Measures how fast responses are decoded into models.
+
+A synthetic payload is built for each model out of its _names and _types
+mappings: every field is set, nested structures down to a fixed depth and
+two items in every array of structures. Each payload is decoded eagerly and
+into lazy models, then a list of protection runs is decoded and three
+fields are read from every run, as most scripts do.
+
+Usage:
+    python benchmarks/decode_models.py [--depth 4] [--repeat 15]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cohesity_management_sdk.model_decoder import get_decoder, resolve_model
+from cohesity_management_sdk.models.protection_run_instance import ProtectionRunInstance
+
+MODELS = [
+    'backup_job_proto.BackupJobProto',
+    'protection_job.ProtectionJob',
+    'perform_restore_task_state_proto.PerformRestoreTaskStateProto',
+    'protection_run_instance.ProtectionRunInstance',
+]
+
+
+def build_payload(cls, depth):
+    payload = {}
+    types = getattr(cls, '_types', {})
+    for index, (name, key) in enumerate(sorted(cls._names.items())):
+        model = types.get(name)
+        if model is None:
+            payload[key] = index
+        elif depth > 0:
+            if isinstance(model, list):
+                item = build_payload(resolve_model(model[0]), depth - 1)
+                payload[key] = [item, item]
+            else:
+                payload[key] = build_payload(resolve_model(model), depth - 1)
+    return payload
+
+
+def measure(func, repeat):
+    number = 1
+    while True:
+        start = time.time()
+        for _ in range(number):
+            func()
+        if time.time() - start > 0.05:
+            break
+        number *= 2
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        for _ in range(number):
+            func()
+        elapsed = (time.time() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def read_runs(runs):
+    for run in runs:
+        run.job_name, run.backup_run.status, run.backup_run.stats.start_time_usecs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--depth', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=15)
+    args = parser.parse_args()
+
+    print('{:<30} {:>10} {:>12} {:>10} {:>12}'.format(
+        'model', 'bytes', 'usec/decode', 'MB/s', 'usec/lazy'))
+    for path in MODELS:
+        module, _, name = path.rpartition('.')
+        cls = getattr(importlib.import_module('cohesity_management_sdk.models.' + module), name)
+        payload = build_payload(cls, args.depth)
+        size = len(json.dumps(payload))
+        decode, decode_lazy = get_decoder(cls), get_decoder(cls, lazy=True)
+        elapsed = measure(lambda: decode(payload), args.repeat)
+        elapsed_lazy = measure(lambda: decode_lazy(payload), args.repeat)
+        print('{:<30} {:>10} {:>12.1f} {:>10.1f} {:>12.1f}'.format(
+            name, size, elapsed * 1e6, size / elapsed / 1e6, elapsed_lazy * 1e6))
+
+    runs = [build_payload(ProtectionRunInstance, args.depth)] * 100
+    print('')
+    print('100 protection runs, reading job_name, backup_run.status and '
+          'backup_run.stats.start_time_usecs')
+    for lazy in (False, True):
+        decode = get_decoder(ProtectionRunInstance, lazy)
+        elapsed = measure(lambda: read_runs([decode(run) for run in runs]), args.repeat)
+        print('{:<10} {:>10.1f} usec'.format('lazy' if lazy else 'eager', elapsed * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+"""Measures the time taken to import the SDK.
+
+Every run is a fresh interpreter, timing the import of CohesityClient, the
+creation of a client and the first access of one of its controllers. The
+number of SDK modules loaded after each step is reported as well.
+
+Usage:
+    python benchmarks/import_time.py [--runs 10]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import sys
+import time
+
+def sdk_modules():
+    return sum(1 for name in sys.modules if name.startswith('cohesity_management_sdk'))
+
+steps = []
+start = time.perf_counter()
+from cohesity_management_sdk.cohesity_client import CohesityClient
+steps.append(('import', time.perf_counter() - start, sdk_modules()))
+start = time.perf_counter()
+client = CohesityClient(cluster_vip='cluster.example.com')
+steps.append(('client', time.perf_counter() - start, sdk_modules()))
+start = time.perf_counter()
+client.protection_runs
+steps.append(('first controller', time.perf_counter() - start, sdk_modules()))
+print(json.dumps(steps))
+"""
+
+
+def run_once():
+    output = subprocess.check_output(
+        [sys.executable, '-c', 'import json\n' + CHILD], cwd=ROOT)
+    return json.loads(output.decode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    # The first run compiles the bytecode caches.
+    run_once()
+    runs = [run_once() for _ in range(args.runs)]
+    print('{:<18} {:>10} {:>10} {:>12}'.format('step', 'best ms', 'median ms', 'SDK modules'))
+    for index, (name, _, modules) in enumerate(runs[0]):
+        times = sorted(run[index][1] * 1000 for run in runs)
+        print('{:<18} {:>10.1f} {:>10.1f} {:>12}'.format(
+            name, times[0], times[len(times) // 2], modules))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+"""Measures the memory held by decoded models.
+
+A synthetic list of ProtectionSourceNode, as returned by
+list_protection_sources for a large VMware inventory, is decoded twice: with
+the models of the SDK, which keep their properties in __slots__, and with
+copies of the same models keeping them in a per instance __dict__.
+
+Usage:
+    python benchmarks/model_memory.py [--nodes 100000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cohesity_management_sdk.model_decoder import get_decoder, resolve_model
+from cohesity_management_sdk.models.protection_source_node import ProtectionSourceNode
+
+
+def build_payload(count):
+    nodes = []
+    for index in range(count):
+        nodes.append({
+            'protectionSource': {
+                'id': index,
+                'parentId': index // 1000,
+                'name': 'vm-{}'.format(index),
+                'environment': 'kVMware',
+                'vmWareProtectionSource': {
+                    'type': 'kVirtualMachine',
+                    'name': 'vm-{}'.format(index),
+                    'id': {'morItem': 'vm-{}'.format(index), 'morType': 'VirtualMachine',
+                           'uuid': '5000{:028x}'.format(index)},
+                    'toolsRunningStatus': 'kGuestToolsRunning',
+                },
+            },
+            'logicalSize': 1073741824,
+            'protectedSourcesSummary': [
+                {'environment': 'kVMware', 'leavesCount': 1, 'totalLogicalSize': 1073741824},
+            ],
+        })
+    return nodes
+
+
+def with_dict(cls, copies):
+    """Copies a model and its nested models without __slots__."""
+    if cls not in copies:
+        attributes = dict((name, value) for name, value in vars(cls).items()
+                          if name not in cls.__slots__ and name not in ('__slots__', '__dict__'))
+        copies[cls] = copy = type(cls.__name__, (object,), attributes)
+        types = {}
+        for name, model in getattr(cls, '_types', {}).items():
+            if isinstance(model, list):
+                types[name] = [with_dict(resolve_model(model[0]), copies)]
+            else:
+                types[name] = with_dict(resolve_model(model), copies)
+        copy._types = types
+    return copies[cls]
+
+
+def measure(cls, payload):
+    decode = get_decoder(cls)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    models = [decode(node) for node in payload]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del models
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--nodes', type=int, default=100000)
+    args = parser.parse_args()
+
+    payload = build_payload(args.nodes)
+    slots = measure(ProtectionSourceNode, payload)
+    dicts = measure(with_dict(ProtectionSourceNode, {}), payload)
+
+    print('{} ProtectionSourceNode'.format(args.nodes))
+    print('{:<10} {:>10} {:>12}'.format('storage', 'MiB', 'bytes/node'))
+    for name, used in (('__dict__', dicts), ('__slots__', slots)):
+        print('{:<10} {:>10.1f} {:>12.0f}'.format(name, used / 1048576.0, float(used) / args.nodes))
+    print('saved {:.0%}'.format(1 - float(slots) / dicts))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+"""Measures lookups in a ProtectionSourceTree against walking the nested
+nodes of the list_protection_sources response.
+
+A synthetic vCenter hierarchy is built: datacenters, hosts and VMs, as
+returned by list_protection_sources. VMs are then looked up by id and by
+name, by scanning the response recursively and through the indexes of the
+tree.
+
+Usage:
+    python benchmarks/source_tree.py [--vms 200000] [--lookups 1000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cohesity_management_sdk.protection_source_tree import ProtectionSourceTree
+
+
+def source(id, parent_id, name, type):
+    return {'protectionSource': {'id': id, 'parentId': parent_id, 'name': name,
+                                 'environment': 'kVMware',
+                                 'vmWareProtectionSource': {'type': type, 'name': name}}}
+
+
+def build_payload(vm_count, vms_per_host=50, hosts_per_datacenter=100):
+    root = source(1, None, 'vcenter', 'kVCenter')
+    root['nodes'] = []
+    next_id = 2
+    datacenter = host = None
+    for index in range(vm_count):
+        if index % (vms_per_host * hosts_per_datacenter) == 0:
+            datacenter = source(next_id, 1, 'dc-{}'.format(next_id), 'kDatacenter')
+            datacenter['nodes'] = []
+            root['nodes'].append(datacenter)
+            next_id += 1
+        if index % vms_per_host == 0:
+            host = source(next_id, datacenter['protectionSource']['id'],
+                          'host-{}'.format(next_id), 'kHostSystem')
+            host['nodes'] = []
+            datacenter['nodes'].append(host)
+            next_id += 1
+        host['nodes'].append(source(next_id, host['protectionSource']['id'],
+                                    'vm-{}'.format(index), 'kVirtualMachine'))
+        next_id += 1
+    return [root], next_id
+
+
+def scan(nodes, key, value):
+    for node in nodes:
+        if node['protectionSource'][key] == value:
+            return node
+        found = scan(node.get('nodes') or [], key, value)
+        if found is not None:
+            return found
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vms', type=int, default=200000)
+    parser.add_argument('--lookups', type=int, default=1000)
+    parser.add_argument('--scans', type=int, default=20)
+    args = parser.parse_args()
+
+    payload, _ = build_payload(args.vms)
+    random.seed(0)
+    names = ['vm-{}'.format(random.randrange(args.vms)) for _ in range(args.lookups)]
+
+    start = time.perf_counter()
+    tree = ProtectionSourceTree(payload)
+    build = time.perf_counter() - start
+    ids = [tree.find_by_name(name)[0].id for name in names]
+
+    start = time.perf_counter()
+    for name in names[:args.scans]:
+        scan(payload, 'name', name)
+    scan_name = (time.perf_counter() - start) / args.scans
+    start = time.perf_counter()
+    for id in ids[:args.scans]:
+        scan(payload, 'id', id)
+    scan_id = (time.perf_counter() - start) / args.scans
+
+    start = time.perf_counter()
+    for name in names:
+        tree.find_by_name(name)
+    tree_name = (time.perf_counter() - start) / len(names)
+    start = time.perf_counter()
+    for id in ids:
+        tree.get(id)
+    tree_id = (time.perf_counter() - start) / len(ids)
+    start = time.perf_counter()
+    for id in ids:
+        tree.path(id)
+    tree_path = (time.perf_counter() - start) / len(ids)
+
+    print('{} nodes, tree built in {:.0f} ms'.format(len(tree), build * 1000))
+    print('{:<24} {:>14}'.format('lookup', 'us per lookup'))
+    print('{:<24} {:>14.1f}'.format('scan by id', scan_id * 1e6))
+    print('{:<24} {:>14.1f}'.format('scan by name', scan_name * 1e6))
+    print('{:<24} {:>14.2f}'.format('tree.get(id)', tree_id * 1e6))
+    print('{:<24} {:>14.2f}'.format('tree.find_by_name', tree_name * 1e6))
+    print('{:<24} {:>14.2f}'.format('tree.path(id)', tree_path * 1e6))
+
+
+if __name__ == '__main__':
+    main()
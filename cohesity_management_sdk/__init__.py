@@ -6,5 +6,24 @@ __all__ = [
     'http',
     'exceptions',
     'decorators',
+    'json_codec',
+    'model_decoder',
+    'pagination',
+    'batch_loader',
     'cohesity_client',
+    'async_controllers',
+    'async_cohesity_client',
+    'async_pagination',
+    'async_batch_loader',
+    'cohesity_fleet',
+    'sync_store',
+    'token_cache',
+    'retry',
+    'hedging',
+    'circuit_breaker',
+    'concurrency_limiter',
+    'async_concurrency_limiter',
+    'endpoint_pool',
+    'async_endpoint_pool',
+    'protection_source_tree',
 ]
\ No newline at end of file
@@ -8,10 +8,11 @@ import calendar
 import email.utils as eut
 from time import mktime
 
-import jsonpickle
 import dateutil.parser
 from requests.utils import quote
 
+from cohesity_management_sdk.json_codec import get_codec
+
 class APIHelper(object):
 
     """A Helper Class for various functions associated with API Calls.
@@ -43,11 +44,15 @@ class APIHelper(object):
         return temp
 
     @staticmethod
-    def json_serialize(obj):
+    def json_serialize(obj, codec=None):
         """JSON Serialization of a given object.
 
+        Models and CustomDate values are converted by the encoder itself.
+
         Args:
             obj (object): The object to serialise.
+            codec (string|JsonCodec, optional): The JSON codec to use. The
+                standard library json module is used when None.
 
         Returns:
             str: The JSON serialized string of the object.
@@ -56,27 +61,18 @@ class APIHelper(object):
         if obj is None:
             return None
 
-        # Resolve any Names if it's one of our objects that needs to have this called on
-        if isinstance(obj, list):
-            value = list()
-            for item in obj:
-                if hasattr(item, "_names"):
-                    value.append(APIHelper.to_dictionary(item))
-                else:
-                    value.append(item)
-            obj = value
-        else:
-            if hasattr(obj, "_names"):
-                obj = APIHelper.to_dictionary(obj)
-
-        return jsonpickle.encode(obj, False)
+        return get_codec(codec).encode(obj)
 
     @staticmethod
-    def json_deserialize(json, unboxing_function=None):
+    def json_deserialize(json, unboxing_function=None, codec=None):
         """JSON Deerialization of a given string.
 
         Args:
-            json (str): The JSON serialized string to deserialize.
+            json (str|bytes): The JSON serialized string to deserialize.
+            unboxing_function (callable, optional): The function creating a
+                model out of each decoded object.
+            codec (string|JsonCodec, optional): The JSON codec to use. The
+                standard library json module is used when None.
 
         Returns:
             dict: A dictionary representing the data contained in the
@@ -87,8 +83,8 @@ class APIHelper(object):
             return None
 
         try:
-            decoded = jsonpickle.decode(json)
-        except:
+            decoded = get_codec(codec).decode(json)
+        except ValueError:
             return json
 
         if unboxing_function is None:
@@ -98,6 +94,56 @@ class APIHelper(object):
         else:
             return unboxing_function(decoded)
 
+    @staticmethod
+    def field_tree(fields):
+        """Converts field paths into the tree used by project.
+
+        Args:
+            fields (list of string): The paths of the fields to keep, made
+                of API property names separated by dots, e.g.
+                'backupRun.stats.startTimeUsecs'.
+
+        Returns:
+            dict: The tree of the fields, a leaf is True.
+
+        """
+        tree = {}
+        for field in fields:
+            node = tree
+            keys = field.split('.')
+            for key in keys[:-1]:
+                child = node.get(key)
+                if child is True:
+                    break
+                node = node.setdefault(key, {})
+            else:
+                node[keys[-1]] = True
+        return tree
+
+    @staticmethod
+    def project(obj, tree):
+        """Keeps only the fields of a tree in a decoded JSON document. The
+        paths go through arrays, they apply to each of their items.
+
+        Args:
+            obj (object): The decoded JSON document.
+            tree (dict): The fields to keep, as built by field_tree.
+
+        Returns:
+            object: The projected document.
+
+        """
+        if isinstance(obj, dict):
+            projected = {}
+            for key, subtree in tree.items():
+                if key in obj:
+                    value = obj[key]
+                    projected[key] = value if subtree is True else APIHelper.project(value, subtree)
+            return projected
+        elif isinstance(obj, list):
+            return [APIHelper.project(item, tree) for item in obj]
+        return obj
+
     @staticmethod
     def serialize_array(key, array, formatting="indexed"):
         """Converts an array parameter to a list of key value tuples.
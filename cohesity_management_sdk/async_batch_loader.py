@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import asyncio
+from collections import OrderedDict
+
+from cohesity_management_sdk.batch_loader import BatchLoader
+
+
+class AsyncBatchLoader(BatchLoader):
+
+    """Coalesces lookups of single items by id, made by the tasks of an
+    event loop, into requests of a list endpoint filtered by ids. fetch
+    returns a coroutine.
+
+    The lookups made in the same iteration of the loop, such as those of an
+    asyncio.gather, are sent together. The requests of a batch are sent
+    concurrently.
+
+    Example:
+        loader = client.protection_jobs.protection_job_loader()
+        jobs = await asyncio.gather(*[loader.get(id) for id in job_ids])
+
+    """
+
+    def load(self, id):
+        """Adds an id to the pending batch.
+
+        Args:
+            id (long|int|string): The id of the item.
+
+        Returns:
+            asyncio.Future: The future of the item, resolved with None when
+                the endpoint does not return it.
+
+        """
+        future = self._pending.get(id)
+        if future is None:
+            loop = asyncio.get_event_loop()
+            future = self._pending[id] = loop.create_future()
+            if self._timer is None:
+                self._timer = loop.call_later(self.wait, self.schedule)
+        return future
+
+    async def get(self, id):
+        """Looks an item up by id, along with the other ids looked up at the
+        same time.
+
+        Args:
+            id (long|int|string): The id of the item.
+
+        Returns:
+            object: The item, None when the endpoint does not return it.
+
+        Raises:
+            APIException: When the request of the batch fails.
+
+        """
+        return await self.load(id)
+
+    async def get_many(self, ids):
+        """Looks items up by id, sending the pending batch right away.
+
+        Args:
+            ids (list of long|int|string): The ids of the items.
+
+        Returns:
+            list: The items, in the order of the ids. None for the ids the
+                endpoint does not return.
+
+        Raises:
+            APIException: When the request of a batch fails.
+
+        """
+        futures = [self.load(id) for id in ids]
+        await self.dispatch()
+        return [await future for future in futures]
+
+    def take(self):
+        pending, self._pending = self._pending, OrderedDict()
+        timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        return pending
+
+    def schedule(self):
+        self._timer = None
+        asyncio.ensure_future(self.dispatch())
+
+    async def fetch_chunk(self, chunk, pending):
+        futures = OrderedDict((id, pending[id]) for id in chunk)
+        try:
+            items = await self.fetch(chunk)
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            self.resolve(futures, error=e)
+        else:
+            self.resolve(futures, items)
+
+    async def dispatch(self):
+        """Sends the pending batch, and resolves the futures of its ids."""
+        pending = self.take()
+        chunks = self.chunks(list(pending))
+        if chunks:
+            await asyncio.gather(*[self.fetch_chunk(chunk, pending) for chunk in chunks])
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+from cohesity_management_sdk.decorators import lazy_property
+from cohesity_management_sdk.configuration import Configuration
+from cohesity_management_sdk.http.auth.async_auth_manager import AsyncAuthManager
+from cohesity_management_sdk.http.aiohttp_client import AiohttpClient
+
+
+class AsyncCohesityClient(object):
+
+    auth = AsyncAuthManager
+    config = Configuration
+
+    @lazy_property
+    def access_tokens(self):
+        from cohesity_management_sdk.async_controllers.access_tokens_controller import AsyncAccessTokensController
+        return AsyncAccessTokensController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def active_directory(self):
+        from cohesity_management_sdk.async_controllers.active_directory_controller import AsyncActiveDirectoryController
+        return AsyncActiveDirectoryController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def alerts(self):
+        from cohesity_management_sdk.async_controllers.alerts_controller import AsyncAlertsController
+        return AsyncAlertsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def antivirus_service_group(self):
+        from cohesity_management_sdk.async_controllers.antivirus_service_group_controller import AsyncAntivirusServiceGroupController
+        return AsyncAntivirusServiceGroupController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def audit(self):
+        from cohesity_management_sdk.async_controllers.audit_controller import AsyncAuditController
+        return AsyncAuditController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def cluster(self):
+        from cohesity_management_sdk.async_controllers.cluster_controller import AsyncClusterController
+        return AsyncClusterController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def certificates(self):
+        from cohesity_management_sdk.async_controllers.certificates_controller import AsyncCertificatesController
+        return AsyncCertificatesController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def clusters(self):
+        from cohesity_management_sdk.async_controllers.clusters_controller import AsyncClustersController
+        return AsyncClustersController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def cluster_partitions(self):
+        from cohesity_management_sdk.async_controllers.cluster_partitions_controller import AsyncClusterPartitionsController
+        return AsyncClusterPartitionsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def nodes(self):
+        from cohesity_management_sdk.async_controllers.nodes_controller import AsyncNodesController
+        return AsyncNodesController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def groups(self):
+        from cohesity_management_sdk.async_controllers.groups_controller import AsyncGroupsController
+        return AsyncGroupsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def idps(self):
+        from cohesity_management_sdk.async_controllers.idps_controller import AsyncIdpsController
+        return AsyncIdpsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def interface_group(self):
+        from cohesity_management_sdk.async_controllers.interface_group_controller import AsyncInterfaceGroupController
+        return AsyncInterfaceGroupController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def kms_configuration(self):
+        from cohesity_management_sdk.async_controllers.kms_configuration_controller import AsyncKmsConfigurationController
+        return AsyncKmsConfigurationController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def ldap_provider(self):
+        from cohesity_management_sdk.async_controllers.ldap_provider_controller import AsyncLdapProviderController
+        return AsyncLdapProviderController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def monitoring(self):
+        from cohesity_management_sdk.async_controllers.monitoring_controller import AsyncMonitoringController
+        return AsyncMonitoringController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def network(self):
+        from cohesity_management_sdk.async_controllers.network_controller import AsyncNetworkController
+        return AsyncNetworkController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def views(self):
+        from cohesity_management_sdk.async_controllers.views_controller import AsyncViewsController
+        return AsyncViewsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def packages(self):
+        from cohesity_management_sdk.async_controllers.packages_controller import AsyncPackagesController
+        return AsyncPackagesController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def protection_sources(self):
+        from cohesity_management_sdk.async_controllers.protection_sources_controller import AsyncProtectionSourcesController
+        return AsyncProtectionSourcesController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def custom_reporting(self):
+        from cohesity_management_sdk.async_controllers.custom_reporting_controller import AsyncCustomReportingController
+        return AsyncCustomReportingController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def principals(self):
+        from cohesity_management_sdk.async_controllers.principals_controller import AsyncPrincipalsController
+        return AsyncPrincipalsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def privileges(self):
+        from cohesity_management_sdk.async_controllers.privileges_controller import AsyncPrivilegesController
+        return AsyncPrivilegesController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def protection_jobs(self):
+        from cohesity_management_sdk.async_controllers.protection_jobs_controller import AsyncProtectionJobsController
+        return AsyncProtectionJobsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def protection_objects(self):
+        from cohesity_management_sdk.async_controllers.protection_objects_controller import AsyncProtectionObjectsController
+        return AsyncProtectionObjectsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def protection_policies(self):
+        from cohesity_management_sdk.async_controllers.protection_policies_controller import AsyncProtectionPoliciesController
+        return AsyncProtectionPoliciesController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def protection_runs(self):
+        from cohesity_management_sdk.async_controllers.protection_runs_controller import AsyncProtectionRunsController
+        return AsyncProtectionRunsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def remote_cluster(self):
+        from cohesity_management_sdk.async_controllers.remote_cluster_controller import AsyncRemoteClusterController
+        return AsyncRemoteClusterController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def remote_restore(self):
+        from cohesity_management_sdk.async_controllers.remote_restore_controller import AsyncRemoteRestoreController
+        return AsyncRemoteRestoreController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def restore_tasks(self):
+        from cohesity_management_sdk.async_controllers.restore_tasks_controller import AsyncRestoreTasksController
+        return AsyncRestoreTasksController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def clone_refresh_tasks(self):
+        from cohesity_management_sdk.async_controllers.clone_refresh_tasks_controller import AsyncCloneRefreshTasksController
+        return AsyncCloneRefreshTasksController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def roles(self):
+        from cohesity_management_sdk.async_controllers.roles_controller import AsyncRolesController
+        return AsyncRolesController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def routes(self):
+        from cohesity_management_sdk.async_controllers.routes_controller import AsyncRoutesController
+        return AsyncRoutesController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def search(self):
+        from cohesity_management_sdk.async_controllers.search_controller import AsyncSearchController
+        return AsyncSearchController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def notifications(self):
+        from cohesity_management_sdk.async_controllers.notifications_controller import AsyncNotificationsController
+        return AsyncNotificationsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def preferences(self):
+        from cohesity_management_sdk.async_controllers.preferences_controller import AsyncPreferencesController
+        return AsyncPreferencesController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def smb_file_opens(self):
+        from cohesity_management_sdk.async_controllers.smb_file_opens_controller import AsyncSMBFileOpensController
+        return AsyncSMBFileOpensController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def static_route(self):
+        from cohesity_management_sdk.async_controllers.static_route_controller import AsyncStaticRouteController
+        return AsyncStaticRouteController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def statistics(self):
+        from cohesity_management_sdk.async_controllers.statistics_controller import AsyncStatisticsController
+        return AsyncStatisticsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def stats(self):
+        from cohesity_management_sdk.async_controllers.stats_controller import AsyncStatsController
+        return AsyncStatsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def tenant(self):
+        from cohesity_management_sdk.async_controllers.tenant_controller import AsyncTenantController
+        return AsyncTenantController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def vaults(self):
+        from cohesity_management_sdk.async_controllers.vaults_controller import AsyncVaultsController
+        return AsyncVaultsController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def view_boxes(self):
+        from cohesity_management_sdk.async_controllers.view_boxes_controller import AsyncViewBoxesController
+        return AsyncViewBoxesController(self.http_client, config=self.config, auth=self.auth)
+
+    @lazy_property
+    def vlan(self):
+        from cohesity_management_sdk.async_controllers.vlan_controller import AsyncVlanController
+        return AsyncVlanController(self.http_client, config=self.config, auth=self.auth)
+
+
+    def __init__(self,
+                 cluster_vip=None,
+                 username=None,
+                 password=None,
+                 domain=None,
+                 auth_token=None,
+                 http_client=None,
+                 token_cache=None):
+        if cluster_vip is None:
+            raise Exception("Specify cluster VIP")
+        if password is not None:
+            auth_token = None  # Flushing existing token.
+        # Every client has its own configuration, token and connection pool,
+        # so clients of different clusters can be used side by side.
+        self.config = Configuration(cluster_vip=cluster_vip,
+                                    username=username,
+                                    password=password,
+                                    domain=domain,
+                                    auth_token=auth_token,
+                                    token_cache=token_cache)
+        if http_client is None:
+            http_client = AiohttpClient(config=self.config)
+        elif getattr(http_client, 'config', None) is Configuration:
+            # An HTTP client created without a configuration follows the SSL
+            # and retry settings of this client, not the class level ones.
+            http_client.config = self.config
+        self.http_client = http_client
+        self.auth = AsyncAuthManager(self.config, self.http_client)
+
+    async def enable_node_pool(self, max_workers=8, refresh_interval=300.0, **kwargs):
+        """Spreads the GET requests of the client across the nodes of the
+        cluster, to the node with the fewest requests in flight, instead of
+        sending all of them to the cluster VIP. Logins and the other
+        requests stay on the VIP.
+
+        The nodes are discovered and health checked now, then again every
+        refresh_interval seconds in a task of the event loop.
+
+        Args:
+            max_workers (int, optional): The maximum number of nodes health
+                checked at once.
+            refresh_interval (float, optional): The time in seconds between
+                two discoveries, None to discover the nodes once.
+            kwargs: The other parameters of EndpointPool, e.g.
+                failure_threshold or retry_interval.
+
+        Returns:
+            AsyncEndpointPool: The pool, set as the endpoint_pool of the
+                client configuration.
+
+        """
+        from cohesity_management_sdk.async_endpoint_pool import AsyncEndpointPool
+
+        async def refresh():
+            return [host async for host in self.nodes.paginate_node_hosts(max_workers)]
+
+        pool = AsyncEndpointPool(refresh, refresh_interval, **kwargs)
+        pool.set_hosts(await refresh())
+        self.config.endpoint_pool = pool
+        return pool
+
+    async def close(self):
+        """Close the connection pool of this client."""
+        await self.http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import asyncio
+from collections import deque
+
+from cohesity_management_sdk.concurrency_limiter import ConcurrencyLimiter
+
+
+class AsyncConcurrencyLimiter(ConcurrencyLimiter):
+
+    """Limits the number of requests in flight to a cluster from the tasks
+    of an event loop, adapting the limit to how the cluster copes with the
+    load (AIMD). acquire is a coroutine, the waiting tasks are let through
+    in order.
+
+    Example:
+        client.config.concurrency_limiter = AsyncConcurrencyLimiter(max_limit=16)
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncConcurrencyLimiter, self).__init__(*args, **kwargs)
+        self._waiters = deque()
+
+    async def acquire(self):
+        """Waits until a request may be sent."""
+        if not self._waiters and self.in_flight < self.get_limit():
+            self.in_flight += 1
+            return
+        future = asyncio.get_event_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted as the task was cancelled.
+                self.in_flight -= 1
+                self.wake()
+            elif future in self._waiters:
+                self._waiters.remove(future)
+            raise
+
+    def release(self, latency=None, failed=None, name=None):
+        """Records the end of a request and lets the waiting tasks through.
+
+        Args:
+            latency (float, optional): The time in seconds the request took.
+            failed (bool, optional): True when the request failed because of
+                the load of the cluster, None when its outcome says nothing
+                of it, e.g. it was cancelled.
+            name (string, optional): The name of its endpoint.
+
+        """
+        self.in_flight -= 1
+        self.update(latency, failed, name)
+        self.wake()
+
+    def wake(self):
+        while self._waiters and self.in_flight < self.get_limit():
+            future = self._waiters.popleft()
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
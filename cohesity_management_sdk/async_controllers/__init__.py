@@ -0,0 +1,47 @@
+__all__ = [
+    'base_controller',
+    'access_tokens_controller',
+    'active_directory_controller',
+    'alerts_controller',
+    'antivirus_service_group_controller',
+    'audit_controller',
+    'cluster_controller',
+    'certificates_controller',
+    'clusters_controller',
+    'cluster_partitions_controller',
+    'nodes_controller',
+    'groups_controller',
+    'idps_controller',
+    'interface_group_controller',
+    'kms_configuration_controller',
+    'ldap_provider_controller',
+    'monitoring_controller',
+    'network_controller',
+    'views_controller',
+    'packages_controller',
+    'protection_sources_controller',
+    'custom_reporting_controller',
+    'principals_controller',
+    'privileges_controller',
+    'protection_jobs_controller',
+    'protection_objects_controller',
+    'protection_policies_controller',
+    'protection_runs_controller',
+    'remote_cluster_controller',
+    'remote_restore_controller',
+    'restore_tasks_controller',
+    'clone_refresh_tasks_controller',
+    'roles_controller',
+    'routes_controller',
+    'search_controller',
+    'notifications_controller',
+    'preferences_controller',
+    'smb_file_opens_controller',
+    'static_route_controller',
+    'statistics_controller',
+    'stats_controller',
+    'tenant_controller',
+    'vaults_controller',
+    'view_boxes_controller',
+    'vlan_controller',
+]
\ No newline at end of file
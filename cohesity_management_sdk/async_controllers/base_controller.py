@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import asyncio
+import inspect
+import logging
+import time
+
+from requests.compat import urlparse
+
+from cohesity_management_sdk.api_helper import APIHelper
+from cohesity_management_sdk.async_batch_loader import AsyncBatchLoader
+from cohesity_management_sdk.async_pagination import AsyncCookiePaginator, AsyncOffsetPaginator, \
+    AsyncShardPaginator, AsyncWindowPaginator
+from cohesity_management_sdk.controllers.base_controller import BaseController
+from cohesity_management_sdk.http.auth.async_auth_manager import AsyncAuthManager
+from cohesity_management_sdk.http.http_context import HttpContext
+from cohesity_management_sdk.http.aiohttp_client import AiohttpClient
+from cohesity_management_sdk.json_codec import JsonArrayStream
+
+class AsyncBaseController(BaseController):
+
+    """All asynchronous controllers inherit from this base class.
+
+    Attributes:
+        http_client (AsyncHttpClient): The AsyncHttpClient which a specific
+            controller instance will use. By default all the controller
+            objects share the same AsyncHttpClient. A user can use his own
+            custom AsyncHttpClient as well.
+        http_call_back (AsyncHttpCallBack): An object which holds call back
+            methods to be called before and after the execution of an
+            HttpRequest. Both coroutine and plain HttpCallBack methods are
+            supported.
+        global_headers (dict): The global headers of the API which are sent with
+            every request.
+        config (Configuration): The configuration used to build the URLs of
+            the requests. By default the class level Configuration is used.
+        auth (AsyncAuthManager): The object which adds authentication to the
+            requests. By default it uses the class level Configuration.
+
+    """
+
+    http_client = AiohttpClient()
+
+    auth = AsyncAuthManager
+
+    batch_loader_class = AsyncBatchLoader
+
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        if config != None and auth == None:
+            auth = AsyncAuthManager(config, client if client != None else self.http_client)
+        super(AsyncBaseController, self).__init__(client, call_back, config, auth)
+
+    def paginate(self, fetch_page, items, cookie, page_size=None, prefetch=True):
+        """Returns an asynchronous iterable over the items of an endpoint
+        paginated by a cookie, requesting the pages as it goes.
+
+        Args:
+            fetch_page (callable): The coroutine function calling the
+                endpoint with a cookie, None for the first page, and a page
+                size.
+            items (string|callable): The API name of the array holding the
+                items of a page, or a function returning them from a page.
+            cookie (string|callable): The API name of the cookie of the next
+                page, or a function returning it from a page.
+            page_size (int, optional): The number of items per page, the
+                default of the endpoint when None.
+            prefetch (bool, optional): False to request each page only once
+                the previous one has been consumed.
+
+        Returns:
+            AsyncCookiePaginator: The items of all the pages.
+
+        """
+        return AsyncCookiePaginator(fetch_page, items, cookie, page_size, prefetch)
+
+    def paginate_offsets(self, fetch_page, items, total, page_size=None, max_workers=4):
+        """Returns an asynchronous iterable over the items of an endpoint
+        paginated by the index of the first item of each page, requesting
+        the pages after the first one concurrently.
+
+        Args:
+            fetch_page (callable): The coroutine function calling the
+                endpoint with the index of the first item of a page and a
+                page size.
+            items (string|callable): The API name of the array holding the
+                items of a page, or a function returning them from a page.
+            total (string|callable): The API name of the total number of
+                items, or a function returning it from a page.
+            page_size (int, optional): The number of items per page, the size
+                of the first page when None.
+            max_workers (int, optional): The maximum number of pages
+                requested at once.
+
+        Returns:
+            AsyncOffsetPaginator: The items of all the pages, in order.
+
+        """
+        return AsyncOffsetPaginator(fetch_page, items, total, page_size, max_workers)
+
+    def paginate_windows(self, fetch_window, start, end, window, time_field,
+                         key_fields=None, partitions=None, max_workers=4,
+                         max_items=None, min_window=1, overlap=0):
+        """Returns an asynchronous iterable over the items of an endpoint
+        filtered by a time range, requesting windows of the range
+        concurrently.
+
+        Args:
+            fetch_window (callable): The coroutine function calling the
+                endpoint with the start and end time of a window, the maximum
+                number of items and a partition.
+            start (int): The start of the range.
+            end (int): The end of the range, the current time when None.
+            window (int): The initial width of the windows.
+            time_field (string|callable): The path of the start time of an
+                item, or a function returning it.
+            key_fields (list of string|callable, optional): The paths of the
+                fields identifying an item, or a function returning its
+                identity, to yield the items seen in several windows once.
+            partitions (list, optional): The values the windows are further
+                split by.
+            max_workers (int, optional): The maximum number of windows
+                requested at once.
+            max_items (int, optional): The maximum number of items per
+                window. Windows reaching it are split.
+            min_window (int, optional): The width under which windows are not
+                split.
+            overlap (int, optional): The time requested after the end of
+                every window.
+
+        Returns:
+            AsyncWindowPaginator: The items of all the windows, newest first.
+
+        """
+        return AsyncWindowPaginator(fetch_window, start, end, window, time_field,
+                                    key_fields, partitions, max_workers, max_items,
+                                    min_window, overlap)
+
+    def paginate_shards(self, list_shards, fetch_shard, merge=None, max_workers=4):
+        """Returns an asynchronous iterable over the results of an endpoint
+        called once per shard of a listing, requesting the shards
+        concurrently and yielding their results as they complete.
+
+        Args:
+            list_shards (callable): The coroutine function returning the
+                shards, e.g. by calling a listing endpoint.
+            fetch_shard (callable): The coroutine function calling the
+                endpoint for a shard.
+            merge (callable, optional): The function called with a shard and
+                its result, returning the items to yield. The results are
+                yielded as they are when None.
+            max_workers (int, optional): The maximum number of shards
+                requested at once.
+
+        Returns:
+            AsyncShardPaginator: The results of all the shards, in the order
+                they complete.
+
+        """
+        return AsyncShardPaginator(list_shards, fetch_shard, merge, max_workers)
+
+    async def execute_request(self, request, binary=False, name = None):
+        """Executes an HttpRequest.
+
+        Args:
+            request (HttpRequest): The HttpRequest to execute.
+            binary (bool): A flag which should be set to True if
+                a binary response is expected.
+
+        Returns:
+            HttpContext: The HttpContext of the request. It contains,
+                both, the request itself and the HttpResponse object.
+
+        """
+        # Invoke the on before request HttpCallBack if specified
+        if self.http_call_back != None:
+            self.logger.info("Calling the on_before_request method of http_call_back for {}.".format(name))
+            result = self.http_call_back.on_before_request(request)
+            if inspect.isawaitable(result):
+                await result
+
+        # Add global headers to request
+        self.logger.info("Merging global headers with endpoint headers for {}.".format(name))
+        request.headers = APIHelper.merge_dicts(self.global_headers, request.headers)
+
+        # Invoke the API call to fetch the response.
+        response = await self.send_with_retries(request, binary, name)
+        if self.is_token_expired(response) and await self.auth.refresh(request):
+            self.logger.info("Replaying the request for {} with a new access token.".format(name))
+            response = await self.send_with_retries(request, binary, name)
+        self.logger.info("Wrapping request and response in a context object for {}.".format(name))
+        context = HttpContext(request, response)
+
+        # Invoke the on after response HttpCallBack if specified
+        if self.http_call_back != None:
+            self.logger.info("Calling on_after_response method of http_call_back for {}.".format(name))
+            result = self.http_call_back.on_after_response(context)
+            if inspect.isawaitable(result):
+                await result
+
+        return context
+
+    async def send_request(self, request, binary=False, name=None):
+        """Sends an HttpRequest within the circuit breaker and the
+        concurrency limiter of the configuration. The request is counted in
+        flight until its response is received, before the body of a
+        streamed response is read. It is sent to the pinned host of the
+        controller, or to a node of the endpoint pool of the configuration
+        when it is routed by the pool, and to the cluster VIP otherwise.
+
+        Args:
+            request (HttpRequest): The HttpRequest to send.
+            binary (bool): True if a binary response is expected.
+            name (string, optional): The name of the endpoint.
+
+        Returns:
+            HttpResponse: The response.
+
+        Raises:
+            CircuitOpenException: When the circuit of the host is open.
+
+        """
+        breaker = self.config.circuit_breaker
+        limiter = self.config.concurrency_limiter
+        pool = self.config.endpoint_pool
+        node = None
+        if self.pinned_host is not None:
+            request = self.route_request(request, self.pinned_host)
+        elif pool is not None and pool.is_routed(request):
+            node = pool.acquire(breaker.is_available if breaker is not None else None)
+            if node is not None:
+                request = self.route_request(request, node)
+        host = urlparse(request.query_url).netloc
+        failed = None
+        try:
+            probe = breaker.before_request(host) if breaker is not None else False
+            try:
+                if limiter is not None:
+                    await limiter.acquire()
+                start = time.time()
+                overloaded = None
+                try:
+                    response = await self.send_to_client(request, binary, name)
+                    failed = response.status_code >= 500
+                    overloaded = failed or response.status_code == 429
+                    return response
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if self.http_client.is_transient_error(e):
+                        failed = overloaded = True
+                    raise
+                finally:
+                    if limiter is not None:
+                        limiter.release(time.time() - start, overloaded, name)
+            finally:
+                if breaker is not None:
+                    breaker.after_request(host, probe, failed)
+        finally:
+            if node is not None:
+                pool.release(node, failed)
+
+    async def send_to_client(self, request, binary=False, name=None):
+        """Sends an HttpRequest through the AsyncHttpClient.
+
+        Args:
+            request (HttpRequest): The HttpRequest to send.
+            binary (bool): True if a binary response is expected.
+            name (string, optional): The name of the endpoint, for logging.
+
+        Returns:
+            HttpResponse: The response. The body of a successful response is
+                left unread by a streaming controller.
+
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Raw request for {} is: {}".format(name, vars(request)))
+        if self.stream_items is not None and not binary:
+            response = await self.http_client.execute_as_stream(request)
+            if (response.status_code < 200) or (response.status_code > 208):
+                # Errors are read at once to be validated as usual.
+                try:
+                    response.content = b''.join([chunk async for chunk in response.chunks])
+                finally:
+                    await self.release_response(response)
+        else:
+            func = self.http_client.execute_as_binary if binary else self.http_client.execute_as_string
+            response = await func(request)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Raw response for {} is: {}".format(name, vars(response)))
+        return response
+
+    async def send_hedged(self, request, binary=False, name=None):
+        """Sends an HttpRequest, and a duplicate of it when it is slow to
+        answer, as decided by the hedging_policy of the configuration. The
+        request answered last is cancelled.
+
+        Args:
+            request (HttpRequest): The HttpRequest to send.
+            binary (bool): True if a binary response is expected.
+            name (string, optional): The name of the endpoint.
+
+        Returns:
+            HttpResponse: The first response received.
+
+        """
+        policy = self.config.hedging_policy
+        if policy is None or not policy.is_hedged(request, name):
+            return await self.send_request(request, binary, name)
+        policy.add_request()
+        delay = policy.get_delay(name)
+        futures = [asyncio.ensure_future(self.send_timed(policy, request, binary, name))]
+        winner = None
+        try:
+            denied = False
+            if delay is not None and not (await asyncio.wait(futures, timeout=delay))[0]:
+                if policy.take_hedge():
+                    self.logger.info("Hedging {} after {:.3f}s.".format(name, delay))
+                    futures.append(asyncio.ensure_future(
+                        self.send_timed(policy, request, binary, name)))
+                else:
+                    denied = True
+            pending = futures
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((future for future in futures if future in done and
+                               not future.cancelled() and future.exception() is None), None)
+            hedged = len(futures) > 1
+            policy.metrics.record(hedged, hedged and winner is futures[1], denied)
+            return (winner or futures[0]).result()
+        finally:
+            for future in futures:
+                if future is winner:
+                    continue
+                if not future.done():
+                    future.cancel()
+                elif not future.cancelled() and future.exception() is None:
+                    try:
+                        await self.release_response(future.result())
+                    except Exception as e:
+                        # The response which won is returned all the same.
+                        self.logger.warning("Releasing a hedged response failed: {}".format(e))
+
+    async def send_timed(self, policy, request, binary=False, name=None):
+        start = time.time()
+        response = await self.send_request(request, binary, name)
+        policy.record_latency(name, time.time() - start)
+        return response
+
+    async def send_with_retries(self, request, binary=False, name=None):
+        """Sends an HttpRequest, retrying it as decided by the retry_policy
+        of the configuration.
+
+        Args:
+            request (HttpRequest): The HttpRequest to send.
+            binary (bool): True if a binary response is expected.
+            name (string, optional): The name of the endpoint.
+
+        Returns:
+            HttpResponse: The response of the last attempt.
+
+        """
+        policy = self.get_retry_policy()
+        if policy is None:
+            return await self.send_hedged(request, binary, name)
+        call = policy.begin(policy.is_idempotent(request, name, self.idempotent_endpoints))
+        try:
+            while True:
+                try:
+                    response = await self.send_hedged(request, binary, name)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if not self.http_client.is_transient_error(e):
+                        raise
+                    delay = call.next_delay(error=e,
+                                            sent=not self.http_client.is_connect_error(e),
+                                            timeout=self.http_client.is_timeout_error(e))
+                    if delay is None:
+                        raise
+                    self.logger.warning("Retrying {} in {:.2f}s after {!r}.".format(name, delay, e))
+                else:
+                    delay = call.next_delay(response)
+                    if delay is None:
+                        return response
+                    self.logger.warning("Retrying {} in {:.2f}s after status {}.".format(
+                        name, delay, response.status_code))
+                await asyncio.sleep(delay)
+        finally:
+            call.finish()
+
+    def deserialize_response(self, context, unboxing_function=None):
+        """Deserializes the JSON body of a response with the JSON codec of
+        the configuration.
+
+        Args:
+            context (HttpContext): The HttpContext of the API call.
+            unboxing_function (callable, optional): The function creating a
+                model out of each decoded object.
+
+        Returns:
+            object: The deserialized body, an async generator of the items of
+                the streamed array for a streaming controller.
+
+        """
+        if self.stream_items is not None:
+            return self.iter_response_items(context.response,
+                                            self.get_unboxing_function(unboxing_function))
+        return super(AsyncBaseController, self).deserialize_response(context, unboxing_function)
+
+    async def iter_response_items(self, response, unboxing_function=None):
+        """Yields the items of the JSON array streamed in a response. The
+        connection is released once the array has been read or the
+        generator is closed.
+
+        Args:
+            response (HttpStreamResponse): The streamed response.
+            unboxing_function (callable, optional): The function creating a
+                model out of each item.
+
+        Returns:
+            async generator: The items of the array.
+
+        """
+        item_path, item_unboxing_function = self.stream_items
+        if item_unboxing_function is not None:
+            unboxing_function = self.get_unboxing_function(item_unboxing_function)
+        stream = JsonArrayStream(item_path)
+        try:
+            async for chunk in response.chunks:
+                for item in stream.feed(chunk):
+                    yield unboxing_function(item) if unboxing_function else item
+            for item in stream.close():
+                yield unboxing_function(item) if unboxing_function else item
+        finally:
+            await self.release_response(response)
+
+    @staticmethod
+    async def release_response(response):
+        """Releases the connection of a streamed response. Buffered
+        responses hold no connection and are left as they are.
+
+        Args:
+            response (HttpResponse|HttpStreamResponse): The response.
+
+        """
+        release = getattr(response, 'release', None)
+        if release is None:
+            return
+        result = release()
+        if inspect.isawaitable(result):
+            await result
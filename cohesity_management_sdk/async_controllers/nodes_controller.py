@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import logging
+from cohesity_management_sdk.api_helper import APIHelper
+from cohesity_management_sdk.async_controllers.base_controller import AsyncBaseController
+from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
+
+class AsyncNodesController(AsyncBaseController):
+
+    """An asynchronous Controller to access Endpoints in the
+    cohesity_management_sdk API."""
+
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(AsyncNodesController, self).__init__(client, call_back, config, auth)
+        self.logger = logging.getLogger(__name__)
+
+    async def list_free_nodes(self):
+        """Does a GET request to /public/freeNodes.
+
+        Sends a request to any Node to list all of the free Nodes that are
+        present on
+        the network.
+
+        Returns:
+            list of FreeNodeInformation: Response from the API. Success
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('list_free_nodes called.')
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for list_free_nodes.')
+            _url_path = '/public/freeNodes'
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for list_free_nodes.')
+            _headers = {
+                'accept': 'application/json'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for list_free_nodes.')
+            _request = self.http_client.get(_query_url, headers=_headers)
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'list_free_nodes')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for list_free_nodes.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+            # Return appropriate type
+            from cohesity_management_sdk.models.free_node_information import FreeNodeInformation
+            return self.deserialize_response(_context, FreeNodeInformation.from_dictionary)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    async def get_nodes(self):
+        """Does a GET request to /public/nodes.
+
+        If no parameters are specified, all Nodes currently on the Cohesity
+        Cluster are
+        returned.
+        Specifying parameters filters the results that are returned.
+
+        Returns:
+            list of Node: Response from the API. Success
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('get_nodes called.')
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for get_nodes.')
+            _url_path = '/public/nodes'
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for get_nodes.')
+            _headers = {
+                'accept': 'application/json'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for get_nodes.')
+            _request = self.http_client.get(_query_url, headers=_headers)
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'get_nodes')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for get_nodes.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+            # Return appropriate type
+            from cohesity_management_sdk.models.node import Node
+            return self.deserialize_response(_context, Node.from_dictionary)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    async def update_upgrade_node(self,
+                                  body):
+        """Does a PUT request to /public/nodes/software.
+
+        Sends a request to upgrade the software version of a Node. By default,
+        the
+        Node that the request is sent to is the only one upgraded, but the
+        user can
+        specify if they want to attempt to upgrade all free nodes on the
+        network.
+        Before using this, you need to upload a new package to the Node you
+        want to
+        upgrade by using the /public/packages endpoint.
+
+        Args:
+            body (UpgradeNodeParameters): TODO: type description here.
+                Example:
+
+        Returns:
+            UpgradeNodeResult: Response from the API. Success
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('update_upgrade_node called.')
+
+            # Validate required parameters
+            self.logger.info('Validating required parameters for update_upgrade_node.')
+            self.validate_parameters(body=body)
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for update_upgrade_node.')
+            _url_path = '/public/nodes/software'
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for update_upgrade_node.')
+            _headers = {
+                'accept': 'application/json',
+                'content-type': 'application/json; charset=utf-8'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for update_upgrade_node.')
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'update_upgrade_node')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for update_upgrade_node.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+            # Return appropriate type
+            from cohesity_management_sdk.models.upgrade_node_result import UpgradeNodeResult
+            return self.deserialize_response(_context, UpgradeNodeResult.from_dictionary)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    async def get_node_by_id(self,
+                             id):
+        """Does a GET request to /public/nodes/{id}.
+
+        Returns the Node corresponding to the specified Node Id.
+
+        Args:
+            id (long|int): Id of the Node
+
+        Returns:
+            list of Node: Response from the API. Success
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('get_node_by_id called.')
+
+            # Validate required parameters
+            self.logger.info('Validating required parameters for get_node_by_id.')
+            self.validate_parameters(id=id)
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for get_node_by_id.')
+            _url_path = '/public/nodes/{id}'
+            _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
+                'id': id
+            })
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for get_node_by_id.')
+            _headers = {
+                'accept': 'application/json'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for get_node_by_id.')
+            _request = self.http_client.get(_query_url, headers=_headers)
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'get_node_by_id')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for get_node_by_id.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+            # Return appropriate type
+            from cohesity_management_sdk.models.node import Node
+            return self.deserialize_response(_context, Node.from_dictionary)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    def node_loader(self):
+        """Returns the loader coalescing lookups of Nodes by id into
+        get_nodes() requests, instead of calling get_node_by_id once per
+        id.
+
+        get_nodes has no filter, so each batch requests all the Nodes once
+        and picks the ids out of them.
+
+        Lookups made at the same time, from several threads or tasks, or
+        passed to get_many at once, are sent together.
+
+        Returns:
+            AsyncBatchLoader of Node: The loader of the controller.
+
+        """
+        return self.batch_loader(
+            'node',
+            lambda ids: self.get_nodes(),
+            max_batch_size=None)
+
+    def paginate_node_hosts(self, max_workers=8):
+        """Discovers the nodes of the cluster with get_nodes, then checks
+        that each of them answers, several in parallel.
+
+        Each node is sent get_node_by_id with its own id, without retries.
+        The nodes marked for removal are left out.
+
+        Args:
+            max_workers (int, optional): The maximum number of nodes checked
+                at once.
+
+        Returns:
+            AsyncShardPaginator of string: The addresses of the nodes which
+                answered, with the port of the cluster VIP, in the order they
+                answered.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        from cohesity_management_sdk.endpoint_pool import get_node_host
+        raw = self.raw(['id', 'ip', 'isMarkedForRemoval'])
+        return self.paginate_shards(
+            lambda: raw.get_nodes(),
+            self.check_node,
+            lambda node, healthy: [get_node_host(node, self.config.cluster_vip)] if healthy else [],
+            max_workers)
+
+    async def check_node(self, node):
+        """Checks that a node of the cluster answers the API.
+
+        Args:
+            node (dict): The raw Node, with its id, ip and isMarkedForRemoval.
+
+        Returns:
+            bool: True when the node answered get_node_by_id with itself.
+
+        """
+        from cohesity_management_sdk.endpoint_pool import get_node_host
+        from cohesity_management_sdk.retry import NO_RETRY
+        if not node.get('ip') or node.get('isMarkedForRemoval'):
+            return False
+        host = get_node_host(node, self.config.cluster_vip)
+        try:
+            nodes = await self.on_host(host).with_retry_policy(NO_RETRY).raw(['id']).get_node_by_id(node['id'])
+        except Exception as e:
+            self.logger.warning("Node {} failed its health check: {!r}".format(host, e))
+            return False
+        return bool(nodes)
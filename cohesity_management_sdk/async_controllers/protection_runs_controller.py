@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import logging
+from cohesity_management_sdk.api_helper import APIHelper
+from cohesity_management_sdk.async_controllers.base_controller import AsyncBaseController
+from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
+
+class AsyncProtectionRunsController(AsyncBaseController):
+
+    """An asynchronous Controller to access Endpoints in the
+    cohesity_management_sdk API."""
+
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(AsyncProtectionRunsController, self).__init__(client, call_back, config, auth)
+        self.logger = logging.getLogger(__name__)
+
+    async def get_protection_runs(self,
+                                  job_id=None,
+                                  include_rpo_snapshots=None,
+                                  started_time_usecs=None,
+                                  start_time_usecs=None,
+                                  end_time_usecs=None,
+                                  num_runs=None,
+                                  exclude_tasks=None,
+                                  source_id=None,
+                                  run_types=None,
+                                  exclude_error_runs=None,
+                                  exclude_non_restoreable_runs=None):
+        """Does a GET request to /public/protectionRuns.
+
+        If no parameters are specified, Job Runs currently
+        on the Cohesity Cluster are returned. Both running and completed Job
+        Runs
+        are reported.
+        Specifying parameters filters the results that are returned.
+
+        Args:
+            job_id (long|int, optional): Filter by a Protection Job that is
+                specified by id. If not specified, all Job Runs for all
+                Protection Jobs are returned.
+            include_rpo_snapshots (bool, optional): If true, then the
+                snapshots for Protection Sources protected by Rpo policies
+                will also be returned.
+            started_time_usecs (long|int, optional): Return a specific Job Run
+                by specifying a time and a jobId. Specify the time when the
+                Job Run started as a Unix epoch Timestamp (in microseconds).
+                If this field is specified, jobId must also be specified.
+            start_time_usecs (long|int, optional): Filter by a start time.
+                Only Job Runs that started after the specified time are
+                returned. Specify the start time as a Unix epoch Timestamp (in
+                microseconds).
+            end_time_usecs (long|int, optional): Filter by a end time
+                specified as a Unix epoch Timestamp (in microseconds). Only
+                Job Runs that completed before the specified end time are
+                returned.
+            num_runs (long|int, optional): Specify the number of Job Runs to
+                return. The newest Job Runs are returned.
+            exclude_tasks (bool, optional): If true, the individual backup
+                status for all the objects protected by the Job Run are not
+                populated in the response. For example in a VMware
+                environment, the status of backing up each VM associated with
+                a Job is not returned.
+            source_id (long|int, optional): Filter by source id. Only Job Runs
+                protecting the specified source (such as a VM or View) are
+                returned. The source id is assigned by the Cohesity Cluster.
+            run_types (list of string, optional): Filter by run type such as
+                'kFull', 'kRegular' or 'kLog'. If not specified, Job Runs of
+                all types are returned.
+            exclude_error_runs (bool, optional): Filter out Jobs Runs with
+                errors by setting this field to 'true'. If not set or set to
+                'false', Job Runs with errors are returned.
+            exclude_non_restoreable_runs (bool, optional): Filter out jobs
+                runs that cannot be restored by setting this field to 'true'.
+                If not set or set to 'false', Runs without any successful
+                object will be returned. The default value is false.
+
+        Returns:
+            list of ProtectionRunInstance: Response from the API. Success
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('get_protection_runs called.')
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for get_protection_runs.')
+            _url_path = '/public/protectionRuns'
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_parameters = {
+                'jobId': job_id,
+                'includeRpoSnapshots': include_rpo_snapshots,
+                'startedTimeUsecs': started_time_usecs,
+                'startTimeUsecs': start_time_usecs,
+                'endTimeUsecs': end_time_usecs,
+                'numRuns': num_runs,
+                'excludeTasks': exclude_tasks,
+                'sourceId': source_id,
+                'runTypes': run_types,
+                'excludeErrorRuns': exclude_error_runs,
+                'excludeNonRestoreableRuns': exclude_non_restoreable_runs
+            }
+            _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
+                _query_parameters, self.config.array_serialization)
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for get_protection_runs.')
+            _headers = {
+                'accept': 'application/json'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for get_protection_runs.')
+            _request = self.http_client.get(_query_url, headers=_headers)
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'get_protection_runs')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for get_protection_runs.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+            # Return appropriate type
+            from cohesity_management_sdk.models.protection_run_instance import ProtectionRunInstance
+            return self.deserialize_response(_context, ProtectionRunInstance.from_dictionary)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    async def iter_protection_runs(self, *args, **kwargs):
+        """Streams the Job Runs returned by get_protection_runs.
+
+        The items of the response are yielded one at a time, as the body is
+        received. Only one item is decoded at a time, so the memory used does
+        not grow with the size of the response. The connection is held until
+        all the items have been read or the generator is closed.
+
+        Args:
+            args, kwargs: The parameters of get_protection_runs.
+
+        Returns:
+            async generator of ProtectionRunInstance: The items of the response.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        async for item in await self.streaming().get_protection_runs(*args, **kwargs):
+            yield item
+
+    def paginate_protection_runs(self,
+                                 start_time_usecs,
+                                 end_time_usecs=None,
+                                 window_usecs=7 * 86400000000,
+                                 job_ids=None,
+                                 max_workers=4,
+                                 max_runs_per_window=1000,
+                                 min_window_usecs=60000000,
+                                 max_run_duration_usecs=86400000000,
+                                 **kwargs):
+        """Iterates over the Job Runs started within a time range, splitting
+        the range into windows requested in parallel, instead of requesting
+        the whole history at once.
+
+        Each window is requested with numRuns set to max_runs_per_window. A
+        window returning that many Job Runs, or whose request times out, is
+        split in two halves which are requested instead. Job Runs are
+        yielded from the newest windows to the oldest, once per jobId and
+        jobRunId.
+
+        Since endTimeUsecs filters on the end of the Job Runs, each window is
+        requested up to max_run_duration_usecs after its end, and the Job
+        Runs which started after its end are left to the next window. Runs
+        lasting longer may be missed. A window returning
+        max_runs_per_window Job Runs which all started after its end is
+        requested again with half that time instead of being split, since
+        splitting would not get rid of them: when more than
+        max_runs_per_window Job Runs start within max_run_duration_usecs,
+        the runs ending after the narrowed time are missed. Request such
+        clusters per Protection Job with job_ids.
+
+        Args:
+            start_time_usecs (long|int): The start of the range as a Unix
+                epoch Timestamp (in microseconds).
+            end_time_usecs (long|int, optional): The end of the range, the
+                current time when None.
+            window_usecs (long|int, optional): The initial width of the
+                windows, 7 days by default. None starts from the whole range
+                and relies on splitting alone.
+            job_ids (list of long|int, optional): Requests the windows of
+                each of these Protection Jobs separately.
+            max_workers (int, optional): The maximum number of windows
+                requested at once.
+            max_runs_per_window (int, optional): The numRuns of each request.
+            min_window_usecs (long|int, optional): The width under which
+                windows are not split, 1 minute by default.
+            max_run_duration_usecs (long|int, optional): The time requested
+                after the end of every window, 1 day by default.
+            kwargs: The other parameters of get_protection_runs.
+
+        Returns:
+            AsyncWindowPaginator of ProtectionRunInstance: The Job Runs of all the
+                windows.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        controller = self
+        policy = self.get_retry_policy()
+        if policy is not None:
+            # Windows timing out are split instead of being sent again.
+            controller = self.with_retry_policy(policy.evolve(
+                retry_statuses=policy.retry_statuses - set([504]), retry_timeouts=False))
+        return self.paginate_windows(
+            lambda start, end, num_runs, job_id: controller.get_protection_runs(
+                job_id=job_id,
+                start_time_usecs=start,
+                end_time_usecs=end,
+                num_runs=num_runs,
+                **kwargs),
+            start_time_usecs, end_time_usecs, window_usecs,
+            'backupRun.stats.startTimeUsecs', ['jobId', 'backupRun.jobRunId'],
+            job_ids, max_workers, max_runs_per_window, min_window_usecs,
+            max_run_duration_usecs)
+
+    async def update_protection_runs(self,
+                                     body):
+        """Does a PUT request to /public/protectionRuns.
+
+        Update the expiration date (retention period) for the specified
+        Protection
+        Job Runs and their snapshots.
+        After an expiration time is reached, the Job Run and its snapshots are
+        deleted.
+        If an expiration time of 0 is specified, a Job Run and its snapshots
+        are immediately deleted.
+
+        Args:
+            body (UpdateProtectionJobRunsParam): Request to update the
+                expiration time of Protection Job Runs.
+
+        Returns:
+            void: Response from the API. No Content
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('update_protection_runs called.')
+
+            # Validate required parameters
+            self.logger.info('Validating required parameters for update_protection_runs.')
+            self.validate_parameters(body=body)
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for update_protection_runs.')
+            _url_path = '/public/protectionRuns'
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for update_protection_runs.')
+            _headers = {
+                'content-type': 'application/json; charset=utf-8'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for update_protection_runs.')
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'update_protection_runs')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for update_protection_runs.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    async def create_cancel_protection_job_run(self,
+                                               id,
+                                               body=None):
+        """Does a POST request to /public/protectionRuns/cancel/{id}.
+
+        Cancel a Protection Job run.
+
+        Args:
+            id (long|int): Specifies a unique id of the Protection Job.
+            body (CancelProtectionJobRunParam, optional): TODO: type
+                description here. Example:
+
+        Returns:
+            void: Response from the API. No Content
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('create_cancel_protection_job_run called.')
+
+            # Validate required parameters
+            self.logger.info('Validating required parameters for create_cancel_protection_job_run.')
+            self.validate_parameters(id=id)
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for create_cancel_protection_job_run.')
+            _url_path = '/public/protectionRuns/cancel/{id}'
+            _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
+                'id': id
+            })
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for create_cancel_protection_job_run.')
+            _headers = {
+                'content-type': 'application/json; charset=utf-8'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for create_cancel_protection_job_run.')
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'create_cancel_protection_job_run')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for create_cancel_protection_job_run.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    async def get_protection_run_errors(self,
+                                        job_id,
+                                        start_time_usecs,
+                                        task_id,
+                                        limit_number_of_errors=None,
+                                        pagination_cookie=None):
+        """Does a GET request to /public/protectionRuns/errors.
+
+        jobId, startTimeUsecs and taskId have to be provided to get the a list
+        of
+        errors for a job run task.
+
+        Args:
+            job_id (long|int): Specifies the id of the Protection Job whose
+                runs are to be returned. This field is required.
+            start_time_usecs (long|int): Specifies the time when the Job Run
+                started as a Unix epoch Timestamp (in microseconds). This
+                field is required
+            task_id (long|int): Specifies the id of the Protection Run task
+                for which errors are to be returned. This field is required to
+                get the errors list.
+            limit_number_of_errors (long|int, optional): Specifies the number
+                of the results expected.
+            pagination_cookie (string, optional): Specifies the cookie for
+                next set of results.
+
+        Returns:
+            ProtectionRunErrors: Response from the API. Success
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('get_protection_run_errors called.')
+
+            # Validate required parameters
+            self.logger.info('Validating required parameters for get_protection_run_errors.')
+            self.validate_parameters(job_id=job_id,
+                                     start_time_usecs=start_time_usecs,
+                                     task_id=task_id)
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for get_protection_run_errors.')
+            _url_path = '/public/protectionRuns/errors'
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_parameters = {
+                'jobId': job_id,
+                'startTimeUsecs': start_time_usecs,
+                'taskId': task_id,
+                'limitNumberOfErrors': limit_number_of_errors,
+                'paginationCookie': pagination_cookie
+            }
+            _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
+                _query_parameters, self.config.array_serialization)
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for get_protection_run_errors.')
+            _headers = {
+                'accept': 'application/json'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for get_protection_run_errors.')
+            _request = self.http_client.get(_query_url, headers=_headers)
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'get_protection_run_errors')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for get_protection_run_errors.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+            # Return appropriate type
+            from cohesity_management_sdk.models.protection_run_errors import ProtectionRunErrors
+            return self.deserialize_response(_context, ProtectionRunErrors.from_dictionary)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    def paginate_protection_run_errors(self,
+                                       job_id,
+                                       start_time_usecs,
+                                       task_id,
+                                       page_size=None,
+                                       prefetch=True):
+        """Iterates over all the errors of a Protection Run task returned by
+        get_protection_run_errors, following the pagination cookie of each
+        page.
+
+        The next page is requested in the background while the items of the
+        current one are consumed, unless prefetch is False.
+
+        Args:
+            job_id (long|int): The id of the Protection Job.
+            start_time_usecs (long|int): The start time of the Job Run.
+            task_id (long|int): The id of the Protection Run task.
+            page_size (int, optional): The limitNumberOfErrors of each
+                request, the default of the cluster when None.
+            prefetch (bool, optional): False to request each page only once
+                the previous one has been consumed.
+
+        Returns:
+            AsyncCookiePaginator of RequestError: The errors of all the pages.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.paginate(
+            lambda cookie, page_size: self.get_protection_run_errors(
+                job_id, start_time_usecs, task_id,
+                limit_number_of_errors=page_size,
+                pagination_cookie=cookie),
+            'errors', 'paginationCookie', page_size, prefetch)
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import logging
+from cohesity_management_sdk.api_helper import APIHelper
+from cohesity_management_sdk.async_controllers.base_controller import AsyncBaseController
+from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
+
+class AsyncSMBFileOpensController(AsyncBaseController):
+
+    """An asynchronous Controller to access Endpoints in the
+    cohesity_management_sdk API."""
+
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(AsyncSMBFileOpensController, self).__init__(client, call_back, config, auth)
+        self.logger = logging.getLogger(__name__)
+
+    async def get_smb_file_opens(self,
+                                 file_path=None,
+                                 view_name=None,
+                                 page_count=None,
+                                 cookie=None):
+        """Does a GET request to /public/smbFileOpens.
+
+        If no parameters are specified, all active SMB file opens currently on
+        the
+        Cohesity Cluster are returned. Specifying parameters filters the
+        results that
+        are returned.
+
+        Args:
+            file_path (string, optional): Specifies the filepath in the view
+                relative to the root filesystem. If this field is specified,
+                viewName field must also be specified.
+            view_name (string, optional): Specifies the name of the View in
+                which to search. If a view name is not specified, all the
+                views in the Cluster is searched. This field is mandatory if
+                filePath field is specified.
+            page_count (int, optional): Specifies the maximum number of active
+                opens to return in the response. This field cannot be set
+                above 1000. If this is not set, maximum of 1000 entries are
+                returned.
+            cookie (string, optional): Specifies the opaque string returned in
+                the previous response. If this is set, next set of active
+                opens just after the previous response are returned. If this
+                is not set, first set of active opens are returned.
+
+        Returns:
+            SmbActiveFileOpensResponse: Response from the API. Success
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('get_smb_file_opens called.')
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for get_smb_file_opens.')
+            _url_path = '/public/smbFileOpens'
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_parameters = {
+                'filePath': file_path,
+                'viewName': view_name,
+                'pageCount': page_count,
+                'cookie': cookie
+            }
+            _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
+                _query_parameters, self.config.array_serialization)
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for get_smb_file_opens.')
+            _headers = {
+                'accept': 'application/json'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for get_smb_file_opens.')
+            _request = self.http_client.get(_query_url, headers=_headers)
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'get_smb_file_opens')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for get_smb_file_opens.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+            # Return appropriate type
+            from cohesity_management_sdk.models.smb_active_file_opens_response import SmbActiveFileOpensResponse
+            return self.deserialize_response(_context, SmbActiveFileOpensResponse.from_dictionary)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    def paginate_smb_file_opens(self,
+                                page_size=None,
+                                prefetch=True,
+                                **kwargs):
+        """Iterates over all the active SMB file opens returned by
+        get_smb_file_opens, following the cookie of each page.
+
+        The next page is requested in the background while the items of the
+        current one are consumed, unless prefetch is False.
+
+        Args:
+            page_size (int, optional): The pageCount of each request, the
+                default of the cluster when None.
+            prefetch (bool, optional): False to request each page only once
+                the previous one has been consumed.
+            kwargs: The other parameters of get_smb_file_opens.
+
+        Returns:
+            AsyncCookiePaginator of SmbActiveFilePath: The active file paths of all the pages.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.paginate(
+            lambda cookie, page_size: self.get_smb_file_opens(cookie=cookie,
+                                                              page_count=page_size,
+                                                              **kwargs),
+            'activeFilePaths', 'cookie', page_size, prefetch)
+
+    async def create_close_smb_file_open(self,
+                                         body):
+        """Does a POST request to /public/smbFileOpens.
+
+        Returns nothing upon success.
+
+        Args:
+            body (CloseSmbFileOpenParameters): Request to close an active SMB
+                file open.
+
+        Returns:
+            void: Response from the API. No Content
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('create_close_smb_file_open called.')
+
+            # Validate required parameters
+            self.logger.info('Validating required parameters for create_close_smb_file_open.')
+            self.validate_parameters(body=body)
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for create_close_smb_file_open.')
+            _url_path = '/public/smbFileOpens'
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for create_close_smb_file_open.')
+            _headers = {
+                'content-type': 'application/json; charset=utf-8'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for create_close_smb_file_open.')
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'create_close_smb_file_open')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for create_close_smb_file_open.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
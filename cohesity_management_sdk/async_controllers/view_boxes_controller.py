@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import logging
+from cohesity_management_sdk.api_helper import APIHelper
+from cohesity_management_sdk.async_controllers.base_controller import AsyncBaseController
+from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
+from cohesity_management_sdk.exceptions.api_exception import APIException
+
+class AsyncViewBoxesController(AsyncBaseController):
+
+    """An asynchronous Controller to access Endpoints in the
+    cohesity_management_sdk API."""
+
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(AsyncViewBoxesController, self).__init__(client, call_back, config, auth)
+        self.logger = logging.getLogger(__name__)
+
+    async def get_view_boxes(self,
+                             tenant_ids=None,
+                             all_under_hierarchy=None,
+                             ids=None,
+                             names=None,
+                             cluster_partition_ids=None,
+                             fetch_stats=None,
+                             fetch_time_series_schema=None):
+        """Does a GET request to /public/viewBoxes.
+
+        If no parameters are specified, all Domains (View Boxes) currently on
+        the Cohesity Cluster are returned.
+        Specifying parameters filters the results that are returned.
+
+        Args:
+            tenant_ids (list of string, optional): TenantIds contains ids of
+                the tenants for which objects are to be returned.
+            all_under_hierarchy (bool, optional): AllUnderHierarchy specifies
+                if objects of all the tenants under the hierarchy of the
+                logged in user's organization should be returned.
+            ids (list of long|int, optional): Filter by a list of Storage
+                Domain (View Box) ids. If empty, View Boxes are not filtered
+                by id.
+            names (list of string, optional): Filter by a list of Storage
+                Domain (View Box) Names. If empty, Storage Domains (View
+                Boxes) are not filtered by Name.
+            cluster_partition_ids (list of long|int, optional): Filter by a
+                list of Cluster Partition Ids.
+            fetch_stats (bool, optional): Specifies whether to include usage
+                and performance statistics.
+            fetch_time_series_schema (bool, optional): Specifies whether to
+                get time series schema info of the view box.
+
+        Returns:
+            list of ViewBox: Response from the API. Success
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('get_view_boxes called.')
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for get_view_boxes.')
+            _url_path = '/public/viewBoxes'
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_parameters = {
+                'tenantIds': tenant_ids,
+                'allUnderHierarchy': all_under_hierarchy,
+                'ids': ids,
+                'names': names,
+                'clusterPartitionIds': cluster_partition_ids,
+                'fetchStats': fetch_stats,
+                'fetchTimeSeriesSchema': fetch_time_series_schema
+            }
+            _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
+                _query_parameters, self.config.array_serialization)
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for get_view_boxes.')
+            _headers = {
+                'accept': 'application/json'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for get_view_boxes.')
+            _request = self.http_client.get(_query_url, headers=_headers)
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'get_view_boxes')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for get_view_boxes.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+            # Return appropriate type
+            from cohesity_management_sdk.models.view_box import ViewBox
+            return self.deserialize_response(_context, ViewBox.from_dictionary)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    async def create_view_box(self,
+                              body):
+        """Does a POST request to /public/viewBoxes.
+
+        Returns the created Domain (View Box).
+
+        Args:
+            body (CreateViewBoxParams): Request to create a Storage Domain
+                (View Box) configuration.
+
+        Returns:
+            ViewBox: Response from the API. Success
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('create_view_box called.')
+
+            # Validate required parameters
+            self.logger.info('Validating required parameters for create_view_box.')
+            self.validate_parameters(body=body)
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for create_view_box.')
+            _url_path = '/public/viewBoxes'
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for create_view_box.')
+            _headers = {
+                'accept': 'application/json',
+                'content-type': 'application/json; charset=utf-8'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for create_view_box.')
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'create_view_box')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for create_view_box.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+            # Return appropriate type
+            from cohesity_management_sdk.models.view_box import ViewBox
+            return self.deserialize_response(_context, ViewBox.from_dictionary)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    async def get_view_box_by_id(self,
+                                 id,
+                                 fetch_stats=None):
+        """Does a GET request to /public/viewBoxes/{id}.
+
+        Returns the Domain (View Box) corresponding to the specified Domain
+        (View Box)
+        Id.
+
+        Args:
+            id (long|int): Id of the Storage Domain (View Box)
+            fetch_stats (bool, optional): Specifies whether to include usage
+                and performance statistics.
+
+        Returns:
+            ViewBox: Response from the API. Success
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('get_view_box_by_id called.')
+
+            # Validate required parameters
+            self.logger.info('Validating required parameters for get_view_box_by_id.')
+            self.validate_parameters(id=id)
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for get_view_box_by_id.')
+            _url_path = '/public/viewBoxes/{id}'
+            _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
+                'id': id
+            })
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_parameters = {
+                'fetchStats': fetch_stats
+            }
+            _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
+                _query_parameters, self.config.array_serialization)
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for get_view_box_by_id.')
+            _headers = {
+                'accept': 'application/json'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for get_view_box_by_id.')
+            _request = self.http_client.get(_query_url, headers=_headers)
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'get_view_box_by_id')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for get_view_box_by_id.')
+            if _context.response.status_code == 404:
+                raise APIException('Not Found', _context)
+            elif (_context.response.status_code < 200) or (_context.response.status_code > 208):
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+            # Return appropriate type
+            from cohesity_management_sdk.models.view_box import ViewBox
+            return self.deserialize_response(_context, ViewBox.from_dictionary)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
+
+    def view_box_loader(self):
+        """Returns the loader coalescing lookups of Domains (View Boxes) by
+        id into get_view_boxes(ids=...) requests, instead of calling
+        get_view_box_by_id once per id.
+
+        Lookups made at the same time, from several threads or tasks, or
+        passed to get_many at once, are sent together.
+
+        Returns:
+            AsyncBatchLoader of ViewBox: The loader of the controller.
+
+        """
+        return self.batch_loader(
+            'view_box',
+            lambda ids: self.get_view_boxes(ids=ids),
+            url_path='/public/viewBoxes',
+            parameter='ids')
+
+    async def update_view_box(self,
+                              id,
+                              body):
+        """Does a PUT request to /public/viewBoxes/{id}.
+
+        Returns the updated Domain (View Box).
+
+        Args:
+            id (long|int): Id of the Storage Domain (View Box)
+            body (CreateViewBoxParams): Request to update a Storage Domain
+                (View Box) configuration.
+
+        Returns:
+            ViewBox: Response from the API. Success
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        try:
+            self.logger.info('update_view_box called.')
+
+            # Validate required parameters
+            self.logger.info('Validating required parameters for update_view_box.')
+            self.validate_parameters(id=id,
+                                     body=body)
+
+            # Prepare query URL
+            self.logger.info('Preparing query URL for update_view_box.')
+            _url_path = '/public/viewBoxes/{id}'
+            _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
+                'id': id
+            })
+            _query_builder = self.config.get_base_uri()
+            _query_builder += _url_path
+            _query_url = APIHelper.clean_url(_query_builder)
+
+            # Prepare headers
+            self.logger.info('Preparing headers for update_view_box.')
+            _headers = {
+                'accept': 'application/json',
+                'content-type': 'application/json; charset=utf-8'
+            }
+
+            # Prepare and execute request
+            self.logger.info('Preparing and executing request for update_view_box.')
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            await self.auth.apply(_request)
+            _context = await self.execute_request(_request, name = 'update_view_box')
+
+            # Endpoint and global error handling using HTTP status codes.
+            self.logger.info('Validating response for update_view_box.')
+            if _context.response.status_code == 0:
+                raise RequestErrorErrorException('Error', _context)
+            self.validate_response(_context)
+
+            # Return appropriate type
+            from cohesity_management_sdk.models.view_box import ViewBox
+            return self.deserialize_response(_context, ViewBox.from_dictionary)
+
+        except Exception as e:
+            self.logger.error(e, exc_info = True)
+            raise
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import asyncio
+import time
+
+from cohesity_management_sdk.endpoint_pool import EndpointPool
+
+
+class AsyncEndpointPool(EndpointPool):
+
+    """Spreads the read-only GET requests of an asynchronous client across
+    the nodes of its cluster. refresh is a coroutine function, run as a task
+    of the event loop.
+
+    Example:
+        pool = await client.enable_node_pool()
+
+    """
+
+    _task = None
+
+    def schedule_refresh(self):
+        self._task = asyncio.ensure_future(self.run_refresh())
+
+    async def run_refresh(self):
+        """Discovers and health checks the nodes again with the refresh
+        function. The current nodes are kept when it fails."""
+        try:
+            self.set_hosts(await self.refresh())
+        except Exception as e:
+            self.logger.warning("Could not refresh the nodes of the pool: {!r}".format(e))
+            with self._lock:
+                self._refreshed_at = time.time()
+        finally:
+            self._refreshing = False
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import asyncio
+import itertools
+from collections import deque
+
+from cohesity_management_sdk.pagination import CookiePaginator, OffsetPaginator, ShardPaginator, \
+    WindowPaginator
+
+
+class AsyncCookiePaginator(CookiePaginator):
+
+    """Iterates asynchronously over the items of an endpoint which returns
+    its results in pages linked by a cookie.
+
+    The next page is requested in a task of the event loop while the items
+    of the current one are consumed. fetch_page returns a coroutine.
+
+    Example:
+        async for view in client.views.paginate_views(page_size=500):
+            handle(view)
+
+    """
+
+    def __iter__(self):
+        raise TypeError("Use 'async for' to iterate over an AsyncCookiePaginator.")
+
+    async def __aiter__(self):
+        pages = self.pages()
+        try:
+            async for page in pages:
+                for item in self.get_items(page):
+                    yield item
+        finally:
+            # Cancels the page being prefetched when the iteration is stopped.
+            await pages.aclose()
+
+    async def pages(self):
+        """Requests the pages one after the other.
+
+        Returns:
+            async generator: The pages, as returned by the endpoint.
+
+        """
+        next_page = None
+        try:
+            page = await self.fetch_page(None, self.page_size)
+            previous = None
+            while True:
+                cookie = self.get_cookie(page)
+                if not cookie or cookie == previous:
+                    yield page
+                    return
+                previous = cookie
+                if self.prefetch:
+                    next_page = asyncio.ensure_future(self.fetch_page(cookie, self.page_size))
+                    yield page
+                    page = await next_page
+                    next_page = None
+                else:
+                    yield page
+                    page = await self.fetch_page(cookie, self.page_size)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+
+class AsyncOffsetPaginator(OffsetPaginator):
+
+    """Iterates asynchronously over the items of an endpoint which returns
+    its results in pages selected by the index of their first item, along
+    with the total number of items.
+
+    The pages after the first one are requested concurrently by tasks of the
+    event loop, at most max_workers at once, and yielded in order. fetch_page
+    returns a coroutine.
+
+    """
+
+    def __iter__(self):
+        raise TypeError("Use 'async for' to iterate over an AsyncOffsetPaginator.")
+
+    async def __aiter__(self):
+        pages = self.pages()
+        try:
+            async for page in pages:
+                for item in self.get_items(page):
+                    yield item
+        finally:
+            await pages.aclose()
+
+    async def pages(self):
+        """Requests the first page, then the others concurrently.
+
+        Returns:
+            async generator: The pages in order, as returned by the endpoint.
+
+        """
+        page = await self.fetch_page(0, self.page_size)
+        yield page
+        total = self.get_total(page)
+        if total is None:
+            page_size = self.page_size or len(self.get_items(page))
+            if not page_size or len(self.get_items(page)) < page_size:
+                return
+            start_index = page_size
+            while True:
+                page = await self.fetch_page(start_index, page_size)
+                yield page
+                if len(self.get_items(page)) < page_size:
+                    return
+                start_index += page_size
+
+        # The cluster may return fewer items than requested per page, the
+        # pages are planned from the size of the first one.
+        page_size = self.plan_page_size(page, total)
+        if not page_size:
+            return
+        start_indexes = iter(range(page_size, total, page_size))
+        pending = deque()
+        try:
+            for start_index in itertools.islice(start_indexes, self.max_workers):
+                pending.append(asyncio.ensure_future(self.fetch_page(start_index, page_size)))
+            while pending:
+                page = await pending.popleft()
+                start_index = next(start_indexes, None)
+                if start_index is not None:
+                    pending.append(asyncio.ensure_future(self.fetch_page(start_index, page_size)))
+                yield page
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class AsyncWindowPaginator(WindowPaginator):
+
+    """Iterates asynchronously over the items of an endpoint filtered by a
+    time range, splitting the range into windows requested concurrently by
+    tasks of the event loop. fetch_window returns a coroutine.
+
+    """
+
+    timeout_errors = (asyncio.TimeoutError,)
+
+    def __iter__(self):
+        raise TypeError("Use 'async for' to iterate over an AsyncWindowPaginator.")
+
+    async def __aiter__(self):
+        windows = deque([window, None, self.overlap] for window in self.plan())
+        latest = windows[0][0][1] if windows else None
+        seen = set()
+        try:
+            while windows:
+                for slot in itertools.islice(windows, self.max_workers):
+                    if slot[1] is None:
+                        slot[1] = asyncio.ensure_future(
+                            self.fetch_window(*self.request(slot[0], latest, slot[2])))
+                window, task, overlap = windows.popleft()
+                try:
+                    items = await task
+                    narrower = self.narrow(window, latest, items, overlap)
+                    if narrower is not None:
+                        windows.appendleft([window, None, narrower])
+                        continue
+                    halves = self.split(window, items)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    halves = self.split(window, error=e)
+                if halves is not None:
+                    windows.extendleft([half, None, overlap] for half in reversed(halves))
+                    continue
+                for item in self.select(window, latest, items, seen):
+                    yield item
+        finally:
+            for window, task, overlap in windows:
+                if task is not None:
+                    task.cancel()
+
+
+class AsyncShardPaginator(ShardPaginator):
+
+    """Iterates asynchronously over the results of an endpoint called once
+    per shard of a listing, requesting the shards concurrently in tasks of
+    the event loop and yielding the results as they complete. list_shards
+    and fetch_shard return coroutines.
+
+    """
+
+    def __iter__(self):
+        raise TypeError("Use 'async for' to iterate over an AsyncShardPaginator.")
+
+    async def __aiter__(self):
+        shards = iter(await self.list_shards() or [])
+        pending = {}
+        try:
+            for shard in itertools.islice(shards, self.max_workers):
+                pending[asyncio.ensure_future(self.fetch_shard(shard))] = shard
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    shard = pending.pop(task)
+                    result = task.result()
+                    for next_shard in itertools.islice(shards, 1):
+                        pending[asyncio.ensure_future(self.fetch_shard(next_shard))] = next_shard
+                    for item in self.get_items(shard, result):
+                        yield item
+        finally:
+            for task in pending:
+                task.cancel()
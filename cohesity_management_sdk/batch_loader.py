@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from cohesity_management_sdk.pagination import get_field
+
+
+class BatchLoader(object):
+
+    """Coalesces lookups of single items by id into requests of a list
+    endpoint filtered by ids, such as get_protection_jobs(ids=...).
+
+    The ids looked up while a batch is pending, from any thread, are sent
+    together once the batch has waited for wait seconds, in as few requests
+    as the limits on the size of a request allow. Each lookup then gets the
+    item of its id from the responses. get_many sends its ids at once
+    without waiting.
+
+    Nothing is cached between batches, an id looked up again once its batch
+    has been sent is requested again.
+
+    Example:
+        loader = client.protection_jobs.protection_job_loader()
+        jobs = loader.get_many(job_ids)
+        with ThreadPoolExecutor(8) as executor:
+            jobs = list(executor.map(loader.get, job_ids))
+
+    Attributes:
+        fetch (callable): The function calling the list endpoint with a list
+            of ids, returning the items.
+        key (string|callable): The API name of the id of an item, or a
+            function returning it.
+        url_length (callable): The function returning the length of the URL
+            requesting a list of ids, None when the ids are not in the URL.
+        max_url_length (int): The maximum length of the URL of a request.
+        max_batch_size (int): The maximum number of ids per request, None
+            for no limit.
+        wait (float): The time in seconds lookups are collected for before
+            their batch is sent.
+
+    """
+
+    def __init__(self, fetch, key, url_length=None, max_url_length=2000,
+                 max_batch_size=100, wait=0.005):
+        """Constructor for the BatchLoader class
+
+        Args:
+            fetch (callable): The function requesting a list of ids.
+            key (string|callable): The id of an item.
+            url_length (callable, optional): The length of the URL
+                requesting a list of ids.
+            max_url_length (int, optional): The maximum length of a URL.
+            max_batch_size (int, optional): The maximum number of ids per
+                request.
+            wait (float, optional): The time lookups are collected for.
+
+        """
+        self.fetch = fetch
+        self.key = key
+        self.url_length = url_length
+        self.max_url_length = max_url_length
+        self.max_batch_size = max_batch_size
+        self.wait = wait
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._timer = None
+
+    def get_key(self, item):
+        key = self.key(item) if callable(self.key) else get_field(item, self.key)
+        return str(key)
+
+    def load(self, id):
+        """Adds an id to the pending batch.
+
+        Args:
+            id (long|int|string): The id of the item.
+
+        Returns:
+            Future: The future of the item, resolved with None when the
+                endpoint does not return it.
+
+        """
+        with self._lock:
+            future = self._pending.get(id)
+            if future is None:
+                future = self._pending[id] = Future()
+                if self._timer is None:
+                    self._timer = threading.Timer(self.wait, self.dispatch)
+                    self._timer.daemon = True
+                    self._timer.start()
+        return future
+
+    def get(self, id):
+        """Looks an item up by id, along with the other ids looked up at the
+        same time.
+
+        Args:
+            id (long|int|string): The id of the item.
+
+        Returns:
+            object: The item, None when the endpoint does not return it.
+
+        Raises:
+            APIException: When the request of the batch fails.
+
+        """
+        return self.load(id).result()
+
+    def get_many(self, ids):
+        """Looks items up by id, sending the pending batch right away.
+
+        Args:
+            ids (list of long|int|string): The ids of the items.
+
+        Returns:
+            list: The items, in the order of the ids. None for the ids the
+                endpoint does not return.
+
+        Raises:
+            APIException: When the request of a batch fails.
+
+        """
+        futures = [self.load(id) for id in ids]
+        self.dispatch()
+        return [future.result() for future in futures]
+
+    def take(self):
+        with self._lock:
+            pending, self._pending = self._pending, OrderedDict()
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        return pending
+
+    def chunks(self, ids):
+        """Splits ids into the lists requested at once, within
+        max_batch_size ids and max_url_length characters.
+
+        Args:
+            ids (list): The ids.
+
+        Returns:
+            list of list: The ids of each request.
+
+        """
+        chunks = []
+        chunk = []
+        for id in ids:
+            if chunk and self.max_batch_size and len(chunk) >= self.max_batch_size:
+                chunks.append(chunk)
+                chunk = []
+            if chunk and self.url_length is not None and \
+                    self.url_length(chunk + [id]) > self.max_url_length:
+                chunks.append(chunk)
+                chunk = []
+            chunk.append(id)
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def resolve(self, futures, items=None, error=None):
+        if error is not None:
+            for future in futures.values():
+                future.set_exception(error)
+            return
+        items_by_key = dict((self.get_key(item), item) for item in items or [])
+        for id, future in futures.items():
+            future.set_result(items_by_key.get(str(id)))
+
+    def dispatch(self):
+        """Sends the pending batch, and resolves the futures of its ids."""
+        pending = self.take()
+        for chunk in self.chunks(list(pending)):
+            futures = OrderedDict((id, pending[id]) for id in chunk)
+            try:
+                items = self.fetch(chunk)
+            except Exception as e:
+                self.resolve(futures, error=e)
+            else:
+                self.resolve(futures, items)
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import logging
+import threading
+import time
+
+from cohesity_management_sdk.exceptions.circuit_open_exception import CircuitOpenException
+
+
+class CircuitState(object):
+
+    """The states of the circuit of a host."""
+
+    CLOSED = 'closed'
+
+    OPEN = 'open'
+
+    HALF_OPEN = 'half_open'
+
+
+class Circuit(object):
+
+    """The state of the circuit of one host.
+
+    Attributes:
+        state (string): The CircuitState.
+        failures (int): The number of consecutive failures while closed.
+        opened_at (float): The time the circuit last opened at.
+        probes (int): The number of trial requests in flight while
+            half-open.
+        successes (int): The number of trial requests which succeeded since
+            the circuit became half-open.
+
+    """
+
+    def __init__(self):
+        """Constructor for the Circuit class"""
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.probes = 0
+        self.successes = 0
+
+
+class CircuitBreaker(object):
+
+    """Stops sending requests to a host after consecutive failures, so that
+    callers fail at once instead of waiting out the timeout of each request
+    while the cluster is degraded.
+
+    Each host has its own circuit. It is closed at first and opens after
+    failure_threshold consecutive failures: connection errors, timeouts and
+    5xx responses. While it is open, requests raise CircuitOpenException
+    without being sent. After reset_timeout seconds the circuit becomes
+    half-open and lets half_open_max_calls trial requests through. It closes
+    once success_threshold of them succeed, and opens again as soon as one
+    of them fails.
+
+    Example:
+        client.config.circuit_breaker = CircuitBreaker(failure_threshold=3,
+                                                       reset_timeout=60)
+        ...
+        print(client.config.circuit_breaker.get_state(client.config.cluster_vip))
+
+    Attributes:
+        failure_threshold (int): The number of consecutive failures opening
+            the circuit.
+        reset_timeout (float): The time in seconds a circuit stays open
+            before trial requests are sent.
+        half_open_max_calls (int): The maximum number of trial requests in
+            flight while half-open.
+        success_threshold (int): The number of successful trial requests
+            closing the circuit.
+
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0,
+                 half_open_max_calls=1, success_threshold=1):
+        """Constructor for the CircuitBreaker class
+
+        Args:
+            failure_threshold (int, optional): The number of consecutive
+                failures opening a circuit.
+            reset_timeout (float, optional): The time a circuit stays open.
+            half_open_max_calls (int, optional): The maximum number of
+                trial requests at once.
+            success_threshold (int, optional): The number of successful
+                trial requests closing a circuit.
+
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._circuits = {}
+
+    def get_state(self, host):
+        """Returns the state of the circuit of a host.
+
+        Args:
+            host (string): The host.
+
+        Returns:
+            string: The CircuitState of the host. An open circuit is
+                reported half-open once its reset_timeout has elapsed.
+
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                return CircuitState.CLOSED
+            if circuit.state == CircuitState.OPEN and \
+                    time.time() - circuit.opened_at >= self.reset_timeout:
+                return CircuitState.HALF_OPEN
+            return circuit.state
+
+    def is_available(self, host):
+        """Tells whether requests may be sent to a host.
+
+        Args:
+            host (string): The host.
+
+        Returns:
+            bool: False while the circuit of the host is open.
+
+        """
+        return self.get_state(host) != CircuitState.OPEN
+
+    def reset(self, host=None):
+        """Closes the circuit of a host, or of all the hosts.
+
+        Args:
+            host (string, optional): The host, None for all of them.
+
+        """
+        with self._lock:
+            if host is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(host, None)
+
+    def before_request(self, host):
+        """Checks that a request may be sent to a host. Its outcome must
+        then be passed to after_request.
+
+        Args:
+            host (string): The host.
+
+        Returns:
+            bool: True when the request is a trial request of a half-open
+                circuit.
+
+        Raises:
+            CircuitOpenException: When the circuit of the host is open, or
+                half-open with enough trial requests in flight.
+
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.state == CircuitState.CLOSED:
+                return False
+            if circuit.state == CircuitState.OPEN:
+                remaining = circuit.opened_at + self.reset_timeout - time.time()
+                if remaining > 0:
+                    raise CircuitOpenException(host, remaining)
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.probes = 0
+                circuit.successes = 0
+                self.logger.info("Circuit of {} is half-open, sending a trial request.".format(host))
+            if circuit.probes >= self.half_open_max_calls:
+                raise CircuitOpenException(host)
+            circuit.probes += 1
+            return True
+
+    def after_request(self, host, probe, failed):
+        """Records the outcome of a request.
+
+        Args:
+            host (string): The host.
+            probe (bool): The value returned by before_request.
+            failed (bool): True when the request failed, False when it
+                succeeded, None when its outcome says nothing of the host,
+                e.g. it was cancelled.
+
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                if not failed:
+                    return
+                circuit = self._circuits[host] = Circuit()
+            if circuit.state == CircuitState.HALF_OPEN:
+                # Only trial requests tell whether the host has recovered,
+                # the others were sent before the circuit opened.
+                if not probe:
+                    return
+                circuit.probes -= 1
+                if failed:
+                    self.open(host, circuit)
+                elif failed is not None:
+                    circuit.successes += 1
+                    if circuit.successes >= self.success_threshold:
+                        self.logger.info("Circuit of {} is closed.".format(host))
+                        del self._circuits[host]
+            elif circuit.state == CircuitState.CLOSED and failed is not None:
+                circuit.failures = circuit.failures + 1 if failed else 0
+                if circuit.failures >= self.failure_threshold:
+                    self.open(host, circuit)
+
+    def open(self, host, circuit):
+        self.logger.warning("Circuit of {} is open for {:.1f}s after {} failures.".format(
+            host, self.reset_timeout, max(circuit.failures, 1)))
+        circuit.state = CircuitState.OPEN
+        circuit.opened_at = time.time()
+        circuit.failures = 0
+        circuit.probes = 0
+        circuit.successes = 0
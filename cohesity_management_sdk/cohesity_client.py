@@ -4,50 +4,7 @@
 from cohesity_management_sdk.decorators import lazy_property
 from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.controllers.access_tokens_controller import AccessTokensController
-from cohesity_management_sdk.controllers.active_directory_controller import ActiveDirectoryController
-from cohesity_management_sdk.controllers.alerts_controller import AlertsController
-from cohesity_management_sdk.controllers.antivirus_service_group_controller import AntivirusServiceGroupController
-from cohesity_management_sdk.controllers.audit_controller import AuditController
-from cohesity_management_sdk.controllers.cluster_controller import ClusterController
-from cohesity_management_sdk.controllers.certificates_controller import CertificatesController
-from cohesity_management_sdk.controllers.clusters_controller import ClustersController
-from cohesity_management_sdk.controllers.cluster_partitions_controller import ClusterPartitionsController
-from cohesity_management_sdk.controllers.nodes_controller import NodesController
-from cohesity_management_sdk.controllers.groups_controller import GroupsController
-from cohesity_management_sdk.controllers.idps_controller import IdpsController
-from cohesity_management_sdk.controllers.interface_group_controller import InterfaceGroupController
-from cohesity_management_sdk.controllers.kms_configuration_controller import KmsConfigurationController
-from cohesity_management_sdk.controllers.ldap_provider_controller import LdapProviderController
-from cohesity_management_sdk.controllers.monitoring_controller import MonitoringController
-from cohesity_management_sdk.controllers.network_controller import NetworkController
-from cohesity_management_sdk.controllers.views_controller import ViewsController
-from cohesity_management_sdk.controllers.packages_controller import PackagesController
-from cohesity_management_sdk.controllers.protection_sources_controller import ProtectionSourcesController
-from cohesity_management_sdk.controllers.custom_reporting_controller import CustomReportingController
-from cohesity_management_sdk.controllers.principals_controller import PrincipalsController
-from cohesity_management_sdk.controllers.privileges_controller import PrivilegesController
-from cohesity_management_sdk.controllers.protection_jobs_controller import ProtectionJobsController
-from cohesity_management_sdk.controllers.protection_objects_controller import ProtectionObjectsController
-from cohesity_management_sdk.controllers.protection_policies_controller import ProtectionPoliciesController
-from cohesity_management_sdk.controllers.protection_runs_controller import ProtectionRunsController
-from cohesity_management_sdk.controllers.remote_cluster_controller import RemoteClusterController
-from cohesity_management_sdk.controllers.remote_restore_controller import RemoteRestoreController
-from cohesity_management_sdk.controllers.restore_tasks_controller import RestoreTasksController
-from cohesity_management_sdk.controllers.clone_refresh_tasks_controller import CloneRefreshTasksController
-from cohesity_management_sdk.controllers.roles_controller import RolesController
-from cohesity_management_sdk.controllers.routes_controller import RoutesController
-from cohesity_management_sdk.controllers.search_controller import SearchController
-from cohesity_management_sdk.controllers.notifications_controller import NotificationsController
-from cohesity_management_sdk.controllers.preferences_controller import PreferencesController
-from cohesity_management_sdk.controllers.smb_file_opens_controller import SMBFileOpensController
-from cohesity_management_sdk.controllers.static_route_controller import StaticRouteController
-from cohesity_management_sdk.controllers.statistics_controller import StatisticsController
-from cohesity_management_sdk.controllers.stats_controller import StatsController
-from cohesity_management_sdk.controllers.tenant_controller import TenantController
-from cohesity_management_sdk.controllers.vaults_controller import VaultsController
-from cohesity_management_sdk.controllers.view_boxes_controller import ViewBoxesController
-from cohesity_management_sdk.controllers.vlan_controller import VlanController
+from cohesity_management_sdk.http.requests_client import RequestsClient
 
 
 class CohesityClient(object):
@@ -57,179 +14,223 @@ class CohesityClient(object):
 
     @lazy_property
     def access_tokens(self):
-        return AccessTokensController()
+        from cohesity_management_sdk.controllers.access_tokens_controller import AccessTokensController
+        return AccessTokensController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def active_directory(self):
-        return ActiveDirectoryController()
+        from cohesity_management_sdk.controllers.active_directory_controller import ActiveDirectoryController
+        return ActiveDirectoryController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def alerts(self):
-        return AlertsController()
+        from cohesity_management_sdk.controllers.alerts_controller import AlertsController
+        return AlertsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def antivirus_service_group(self):
-        return AntivirusServiceGroupController()
+        from cohesity_management_sdk.controllers.antivirus_service_group_controller import AntivirusServiceGroupController
+        return AntivirusServiceGroupController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def audit(self):
-        return AuditController()
+        from cohesity_management_sdk.controllers.audit_controller import AuditController
+        return AuditController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def cluster(self):
-        return ClusterController()
+        from cohesity_management_sdk.controllers.cluster_controller import ClusterController
+        return ClusterController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def certificates(self):
-        return CertificatesController()
+        from cohesity_management_sdk.controllers.certificates_controller import CertificatesController
+        return CertificatesController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def clusters(self):
-        return ClustersController()
+        from cohesity_management_sdk.controllers.clusters_controller import ClustersController
+        return ClustersController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def cluster_partitions(self):
-        return ClusterPartitionsController()
+        from cohesity_management_sdk.controllers.cluster_partitions_controller import ClusterPartitionsController
+        return ClusterPartitionsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def nodes(self):
-        return NodesController()
+        from cohesity_management_sdk.controllers.nodes_controller import NodesController
+        return NodesController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def groups(self):
-        return GroupsController()
+        from cohesity_management_sdk.controllers.groups_controller import GroupsController
+        return GroupsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def idps(self):
-        return IdpsController()
+        from cohesity_management_sdk.controllers.idps_controller import IdpsController
+        return IdpsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def interface_group(self):
-        return InterfaceGroupController()
+        from cohesity_management_sdk.controllers.interface_group_controller import InterfaceGroupController
+        return InterfaceGroupController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def kms_configuration(self):
-        return KmsConfigurationController()
+        from cohesity_management_sdk.controllers.kms_configuration_controller import KmsConfigurationController
+        return KmsConfigurationController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def ldap_provider(self):
-        return LdapProviderController()
+        from cohesity_management_sdk.controllers.ldap_provider_controller import LdapProviderController
+        return LdapProviderController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def monitoring(self):
-        return MonitoringController()
+        from cohesity_management_sdk.controllers.monitoring_controller import MonitoringController
+        return MonitoringController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def network(self):
-        return NetworkController()
+        from cohesity_management_sdk.controllers.network_controller import NetworkController
+        return NetworkController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def views(self):
-        return ViewsController()
+        from cohesity_management_sdk.controllers.views_controller import ViewsController
+        return ViewsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def packages(self):
-        return PackagesController()
+        from cohesity_management_sdk.controllers.packages_controller import PackagesController
+        return PackagesController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def protection_sources(self):
-        return ProtectionSourcesController()
+        from cohesity_management_sdk.controllers.protection_sources_controller import ProtectionSourcesController
+        return ProtectionSourcesController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def custom_reporting(self):
-        return CustomReportingController()
+        from cohesity_management_sdk.controllers.custom_reporting_controller import CustomReportingController
+        return CustomReportingController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def principals(self):
-        return PrincipalsController()
+        from cohesity_management_sdk.controllers.principals_controller import PrincipalsController
+        return PrincipalsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def privileges(self):
-        return PrivilegesController()
+        from cohesity_management_sdk.controllers.privileges_controller import PrivilegesController
+        return PrivilegesController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def protection_jobs(self):
-        return ProtectionJobsController()
+        from cohesity_management_sdk.controllers.protection_jobs_controller import ProtectionJobsController
+        return ProtectionJobsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def protection_objects(self):
-        return ProtectionObjectsController()
+        from cohesity_management_sdk.controllers.protection_objects_controller import ProtectionObjectsController
+        return ProtectionObjectsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def protection_policies(self):
-        return ProtectionPoliciesController()
+        from cohesity_management_sdk.controllers.protection_policies_controller import ProtectionPoliciesController
+        return ProtectionPoliciesController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def protection_runs(self):
-        return ProtectionRunsController()
+        from cohesity_management_sdk.controllers.protection_runs_controller import ProtectionRunsController
+        return ProtectionRunsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def remote_cluster(self):
-        return RemoteClusterController()
+        from cohesity_management_sdk.controllers.remote_cluster_controller import RemoteClusterController
+        return RemoteClusterController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def remote_restore(self):
-        return RemoteRestoreController()
+        from cohesity_management_sdk.controllers.remote_restore_controller import RemoteRestoreController
+        return RemoteRestoreController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def restore_tasks(self):
-        return RestoreTasksController()
+        from cohesity_management_sdk.controllers.restore_tasks_controller import RestoreTasksController
+        return RestoreTasksController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def clone_refresh_tasks(self):
-        return CloneRefreshTasksController()
+        from cohesity_management_sdk.controllers.clone_refresh_tasks_controller import CloneRefreshTasksController
+        return CloneRefreshTasksController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def roles(self):
-        return RolesController()
+        from cohesity_management_sdk.controllers.roles_controller import RolesController
+        return RolesController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def routes(self):
-        return RoutesController()
+        from cohesity_management_sdk.controllers.routes_controller import RoutesController
+        return RoutesController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def search(self):
-        return SearchController()
+        from cohesity_management_sdk.controllers.search_controller import SearchController
+        return SearchController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def notifications(self):
-        return NotificationsController()
+        from cohesity_management_sdk.controllers.notifications_controller import NotificationsController
+        return NotificationsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def preferences(self):
-        return PreferencesController()
+        from cohesity_management_sdk.controllers.preferences_controller import PreferencesController
+        return PreferencesController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def smb_file_opens(self):
-        return SMBFileOpensController()
+        from cohesity_management_sdk.controllers.smb_file_opens_controller import SMBFileOpensController
+        return SMBFileOpensController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def static_route(self):
-        return StaticRouteController()
+        from cohesity_management_sdk.controllers.static_route_controller import StaticRouteController
+        return StaticRouteController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def statistics(self):
-        return StatisticsController()
+        from cohesity_management_sdk.controllers.statistics_controller import StatisticsController
+        return StatisticsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def stats(self):
-        return StatsController()
+        from cohesity_management_sdk.controllers.stats_controller import StatsController
+        return StatsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def tenant(self):
-        return TenantController()
+        from cohesity_management_sdk.controllers.tenant_controller import TenantController
+        return TenantController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def vaults(self):
-        return VaultsController()
+        from cohesity_management_sdk.controllers.vaults_controller import VaultsController
+        return VaultsController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def view_boxes(self):
-        return ViewBoxesController()
+        from cohesity_management_sdk.controllers.view_boxes_controller import ViewBoxesController
+        return ViewBoxesController(self.http_client, config=self.config, auth=self.auth)
 
     @lazy_property
     def vlan(self):
-        return VlanController()
+        from cohesity_management_sdk.controllers.vlan_controller import VlanController
+        return VlanController(self.http_client, config=self.config, auth=self.auth)
 
 
     def __init__(self,
@@ -237,16 +238,55 @@ class CohesityClient(object):
                  username=None,
                  password=None,
                  domain=None,
-                 auth_token=None):
+                 auth_token=None,
+                 http_client=None,
+                 token_cache=None):
         if cluster_vip is None:
             raise Exception("Specify cluster VIP")
-        if auth_token is not None:
-            Configuration.auth_token = auth_token
-        if username is not None:
-            Configuration.username = username
         if password is not None:
-            Configuration.password = password
-            Configuration.auth_token = None  # Flushing existing token.
-        if domain is not None:
-            Configuration.domain = domain
-        Configuration.cluster_vip = cluster_vip
+            auth_token = None  # Flushing existing token.
+        # Every client has its own configuration, token and connection pool,
+        # so clients of different clusters can be used side by side.
+        self.config = Configuration(cluster_vip=cluster_vip,
+                                    username=username,
+                                    password=password,
+                                    domain=domain,
+                                    auth_token=auth_token,
+                                    token_cache=token_cache)
+        if http_client is None:
+            http_client = RequestsClient(config=self.config)
+        elif getattr(http_client, 'config', None) is Configuration:
+            # An HTTP client created without a configuration follows the SSL
+            # and retry settings of this client, not the class level ones.
+            http_client.config = self.config
+        self.http_client = http_client
+        self.auth = AuthManager(self.config, self.http_client)
+
+    def enable_node_pool(self, max_workers=8, refresh_interval=300.0, **kwargs):
+        """Spreads the GET requests of the client across the nodes of the
+        cluster, to the node with the fewest requests in flight, instead of
+        sending all of them to the cluster VIP. Logins and the other
+        requests stay on the VIP.
+
+        The nodes are discovered and health checked now, then again every
+        refresh_interval seconds in the background.
+
+        Args:
+            max_workers (int, optional): The maximum number of nodes health
+                checked at once.
+            refresh_interval (float, optional): The time in seconds between
+                two discoveries, None to discover the nodes once.
+            kwargs: The other parameters of EndpointPool, e.g.
+                failure_threshold or retry_interval.
+
+        Returns:
+            EndpointPool: The pool, set as the endpoint_pool of the client
+                configuration.
+
+        """
+        from cohesity_management_sdk.endpoint_pool import EndpointPool
+        refresh = lambda: list(self.nodes.paginate_node_hosts(max_workers))
+        pool = EndpointPool(refresh, refresh_interval, **kwargs)
+        pool.set_hosts(refresh())
+        self.config.endpoint_pool = pool
+        return pool
@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import inspect
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, wait, FIRST_COMPLETED
+
+from cohesity_management_sdk.cohesity_client import CohesityClient
+from cohesity_management_sdk.decorators import lazy_property
+from cohesity_management_sdk.pagination import CookiePaginator, OffsetPaginator, WindowPaginator, ShardPaginator
+
+
+class ClusterResult(object):
+
+    """The outcome of a call on one cluster of a fleet.
+
+    Attributes:
+        cluster_vip (string): The cluster the call was made on.
+        result (object): The value returned by the controller method, None
+            if the call failed. The items of a generator or paginator, as
+            returned by the iter_* and paginate_* methods, are collected
+            into a list.
+        error (Exception): The exception raised by the call, None if it
+            succeeded. A call which did not finish within the timeout of the
+            fleet has a TimeoutError.
+        elapsed (float): The time(seconds) the call took on the cluster.
+
+    """
+
+    def __init__(self, cluster_vip, result=None, error=None, elapsed=None):
+        self.cluster_vip = cluster_vip
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = 'ok' if self.succeeded else repr(self.error)
+        return '<ClusterResult {}: {}>'.format(self.cluster_vip, status)
+
+
+class FleetResult(object):
+
+    """The outcomes of a call made on every cluster of a fleet.
+
+    Iterating over it yields a ClusterResult per cluster, in the order the
+    clusters were given to the fleet.
+
+    """
+
+    def __init__(self, results):
+        self.results = results
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    def __getitem__(self, cluster_vip):
+        for result in self.results:
+            if result.cluster_vip == cluster_vip:
+                return result
+        raise KeyError(cluster_vip)
+
+    @property
+    def succeeded(self):
+        """list of ClusterResult: The calls which succeeded."""
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self):
+        """list of ClusterResult: The calls which raised or timed out."""
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def errors(self):
+        """dict: The exception raised by each failed cluster."""
+        return OrderedDict((result.cluster_vip, result.error) for result in self.failed)
+
+    def merged(self):
+        """Merges the results of the successful calls into one list.
+
+        List results are flattened, any other result is kept as one item.
+
+        Returns:
+            list of tuple: (cluster_vip, item) pairs tagging every item with
+                the cluster it came from.
+
+        """
+        merged = []
+        for result in self.succeeded:
+            if isinstance(result.result, list):
+                merged.extend((result.cluster_vip, item) for item in result.result)
+            elif result.result is not None:
+                merged.append((result.cluster_vip, result.result))
+        return merged
+
+
+class FleetController(object):
+
+    """Fans out the endpoint methods of one controller to all the clusters
+    of a fleet.
+
+    Any endpoint method of the underlying controller can be called on it with
+    the same arguments. The call returns a FleetResult.
+
+    """
+
+    def __init__(self, fleet, name):
+        self.fleet = fleet
+        self.name = name
+
+    def __getattr__(self, method):
+        if method.startswith('_'):
+            raise AttributeError(method)
+
+        def fan_out(*args, **kwargs):
+            return self.fleet.execute(
+                lambda client: getattr(getattr(client, self.name), method)(*args, **kwargs))
+
+        fan_out.__name__ = method
+        return fan_out
+
+
+class CohesityFleet(object):
+
+    """Runs the same API call on many clusters in parallel.
+
+    The fleet exposes the controllers of CohesityClient, e.g.
+    fleet.protection_runs.get_protection_runs(), and runs every call on all
+    its clusters through a bounded pool of worker threads. Each cluster is
+    served by its own CohesityClient.
+
+    A call which times out cannot be interrupted and keeps its worker until
+    it returns. The fleet then moves on to a new pool of workers, so that
+    other calls do not queue behind it, and fails the calls made on that
+    cluster in the meantime with a TimeoutError at once. At most one
+    abandoned call per cluster is left running.
+
+    Attributes:
+        clients (OrderedDict): The CohesityClient of every cluster, by
+            cluster VIP.
+        max_workers (int): The maximum number of clusters called at once.
+        timeout (float): The time(seconds) a call may take on one cluster
+            before it is reported as timed out. It is also used as the HTTP
+            timeout of the clients created by the fleet. None means no limit.
+
+    """
+
+    def __init__(self,
+                 clusters,
+                 username=None,
+                 password=None,
+                 domain=None,
+                 max_workers=8,
+                 timeout=None):
+        """Constructor for the CohesityFleet class
+
+        Args:
+            clusters (list): The clusters of the fleet. An item is either a
+                cluster VIP using the credentials given to the fleet, a dict
+                of CohesityClient arguments or a CohesityClient.
+            username (string, optional): The username for the clusters given
+                by VIP.
+            password (string, optional): The password for the clusters given
+                by VIP.
+            domain (string, optional): The domain for the clusters given by
+                VIP.
+            max_workers (int, optional): The size of the worker pool.
+            timeout (float, optional): The per cluster timeout(seconds).
+
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.clients = OrderedDict()
+        for cluster in clusters:
+            if isinstance(cluster, CohesityClient):
+                client = cluster
+            else:
+                if not isinstance(cluster, dict):
+                    cluster = dict(cluster_vip=cluster, username=username,
+                                   password=password, domain=domain)
+                client = CohesityClient(**cluster)
+                if timeout is not None:
+                    client.http_client.timeout = timeout
+            if client.config.cluster_vip in self.clients:
+                raise ValueError('Cluster {} is given more than once.'.format(
+                    client.config.cluster_vip))
+            self.clients[client.config.cluster_vip] = client
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._abandoned = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        controller = vars(CohesityClient).get(name)
+        if not isinstance(controller, lazy_property):
+            raise AttributeError(name)
+        return FleetController(self, name)
+
+    def execute(self, func, timeout=None):
+        """Calls a function with the client of every cluster, in parallel.
+
+        Args:
+            func (callable): A function taking a CohesityClient.
+            timeout (float, optional): The per cluster timeout(seconds),
+                overriding the one of the fleet.
+
+        Returns:
+            FleetResult: The outcome of the call on every cluster.
+
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = {}
+        lock = threading.Lock()
+
+        def run(cluster_vip, client):
+            start = time.time()
+            with lock:
+                started[cluster_vip] = start
+            try:
+                return ClusterResult(cluster_vip, result=self.consume(func(client)),
+                                     elapsed=time.time() - start)
+            except Exception as e:
+                return ClusterResult(cluster_vip, error=e,
+                                     elapsed=time.time() - start)
+
+        def submit(cluster_vip):
+            with self._lock:
+                future = self._executor.submit(run, cluster_vip, self.clients[cluster_vip])
+            futures[future] = cluster_vip
+            return future
+
+        futures = OrderedDict()
+        results = {}
+        pending = set()
+        for cluster_vip in self.clients:
+            if self.is_busy(cluster_vip):
+                results[cluster_vip] = ClusterResult(
+                    cluster_vip,
+                    error=TimeoutError('{} is still running a call which timed out.'.format(
+                        cluster_vip)),
+                    elapsed=0.0)
+            else:
+                pending.add(submit(cluster_vip))
+        while pending:
+            wait_time = None
+            if timeout is not None:
+                now = time.time()
+                with lock:
+                    running = [(started[futures[f]], f) for f in pending
+                               if futures[f] in started]
+                # Report the calls which ran out of time without waiting on them.
+                abandoned = False
+                for start, future in running:
+                    if now - start >= timeout and not future.done():
+                        pending.discard(future)
+                        cluster_vip = futures[future]
+                        results[cluster_vip] = ClusterResult(
+                            cluster_vip,
+                            error=TimeoutError('No response from {} within {} seconds.'.format(
+                                cluster_vip, timeout)),
+                            elapsed=now - start)
+                        self.abandon(cluster_vip, future)
+                        abandoned = True
+                if abandoned:
+                    # The calls still queued behind the abandoned ones move to
+                    # the new pool.
+                    for future in list(pending):
+                        if futures[future] not in started and future.cancel():
+                            pending.discard(future)
+                            pending.add(submit(futures[future]))
+                deadlines = [start + timeout - now for start, future in running
+                             if future in pending]
+                # Calls still queued for a worker are polled until they start.
+                wait_time = min(deadlines) if deadlines else timeout
+            if not pending:
+                break
+            done, pending = wait(pending, timeout=wait_time, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures[future]] = future.result()
+
+        return FleetResult([results[cluster_vip] for cluster_vip in self.clients])
+
+    @staticmethod
+    def consume(result):
+        """Collects the items of a generator or paginator into a list, so
+        that they are requested by the worker within the timeout.
+
+        Args:
+            result (object): The value returned by a controller method.
+
+        Returns:
+            object: The list of the items, or the result itself.
+
+        """
+        if inspect.isgenerator(result) or isinstance(
+                result, (CookiePaginator, OffsetPaginator, WindowPaginator, ShardPaginator)):
+            return list(result)
+        return result
+
+    def is_busy(self, cluster_vip):
+        """Tells whether a cluster is still running a call which timed out.
+
+        Args:
+            cluster_vip (string): The cluster.
+
+        Returns:
+            bool: True while the abandoned call has not returned.
+
+        """
+        with self._lock:
+            future = self._abandoned.get(cluster_vip)
+            if future is not None and future.done():
+                del self._abandoned[cluster_vip]
+                future = None
+            return future is not None
+
+    def abandon(self, cluster_vip, future):
+        """Leaves a call which timed out to its worker, and replaces the
+        worker pool so that the next calls are not queued behind it.
+
+        Args:
+            cluster_vip (string): The cluster of the call.
+            future (Future): The call.
+
+        """
+        with self._lock:
+            self._abandoned[cluster_vip] = future
+            self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def close(self):
+        """Shuts down the worker pool of the fleet."""
+        with self._lock:
+            self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
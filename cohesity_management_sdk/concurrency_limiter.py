@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import logging
+import threading
+import time
+
+
+class ConcurrencyLimiter(object):
+
+    """Limits the number of requests in flight to a cluster, adapting the
+    limit to how the cluster copes with the load (AIMD).
+
+    Each successful request raises the limit by 1 / limit, about 1 per round
+    of requests, as long as the limit is being used. A failed request, a
+    429 or 5xx response, a connection error or a timeout, multiplies the
+    limit by backoff_ratio, at most once per cooldown seconds, down to
+    min_limit. Requests over the limit wait for others to complete.
+
+    With a latency_tolerance, a request slower than that many times the
+    usual latency of its endpoint counts as a failure as well. Latencies are
+    kept per endpoint whatever its parameters, so this suits endpoints
+    whose cost does not depend on them.
+
+    Example:
+        client.config.concurrency_limiter = ConcurrencyLimiter(max_limit=16)
+        ...
+        print(client.config.concurrency_limiter.snapshot())
+
+    Attributes:
+        limit (float): The current limit.
+        min_limit (int): The lowest limit.
+        max_limit (int): The highest limit.
+        backoff_ratio (float): The factor applied to the limit on failures.
+        latency_tolerance (float): The ratio of the usual latency of an
+            endpoint over which a request counts as a sign of overload, None
+            for latencies not to count.
+        min_latency (float): The latency in seconds under which a request
+            never counts as slow.
+        cooldown (float): The minimum time in seconds between two
+            decreases of the limit.
+        smoothing (float): The weight of a new latency in the moving average
+            of its endpoint.
+        in_flight (int): The number of requests in flight.
+
+    """
+
+    def __init__(self, initial_limit=32, min_limit=4, max_limit=256,
+                 backoff_ratio=0.5, latency_tolerance=None, min_latency=1.0,
+                 cooldown=1.0, smoothing=0.1):
+        """Constructor for the ConcurrencyLimiter class
+
+        Args:
+            initial_limit (int, optional): The limit to start with.
+            min_limit (int, optional): The lowest limit.
+            max_limit (int, optional): The highest limit.
+            backoff_ratio (float, optional): The factor applied on failures.
+            latency_tolerance (float, optional): The ratio of the usual
+                latency making a request slow, None not to slow down on
+                latencies.
+            min_latency (float, optional): The latency under which a request
+                is never slow.
+            cooldown (float, optional): The time between two decreases.
+            smoothing (float, optional): The weight of new latencies.
+
+        """
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.min_latency = min_latency
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self.logger = logging.getLogger(__name__)
+        self._latencies = {}
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def get_limit(self):
+        """Returns the number of requests allowed in flight.
+
+        Returns:
+            int: The current limit, rounded down.
+
+        """
+        return max(self.min_limit, int(self.limit))
+
+    def snapshot(self):
+        """Returns the state of the limiter.
+
+        Returns:
+            dict: The limit, the number of requests in flight and the usual
+                latency of each endpoint.
+
+        """
+        return {
+            'limit': self.get_limit(),
+            'in_flight': self.in_flight,
+            'latencies': dict(self._latencies)
+        }
+
+    def acquire(self):
+        """Waits until a request may be sent."""
+        with self._condition:
+            while self.in_flight >= self.get_limit():
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency=None, failed=None, name=None):
+        """Records the end of a request and lets the waiting ones through.
+
+        Args:
+            latency (float, optional): The time in seconds the request took.
+            failed (bool, optional): True when the request failed because of
+                the load of the cluster, None when its outcome says nothing
+                of it, e.g. it was cancelled.
+            name (string, optional): The name of its endpoint.
+
+        """
+        with self._condition:
+            self.in_flight -= 1
+            self.update(latency, failed, name)
+            self._condition.notify_all()
+
+    def update(self, latency, failed, name):
+        if failed is None:
+            return
+        if not failed and latency is not None and self.latency_tolerance is not None:
+            failed = self.is_slow(latency, name)
+        if failed:
+            now = time.time()
+            if now - self._last_decrease >= self.cooldown:
+                self._last_decrease = now
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                self.logger.info("Lowered the concurrency limit to {}.".format(self.get_limit()))
+        elif self.in_flight + 1 >= self.limit / 2:
+            # The limit is only raised while it is being used.
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def is_slow(self, latency, name):
+        usual = self._latencies.get(name)
+        if usual is None:
+            self._latencies[name] = latency
+            return False
+        self._latencies[name] = usual + self.smoothing * (latency - usual)
+        return latency > max(self.min_latency, usual * self.latency_tolerance)
@@ -5,6 +5,7 @@ import sys
 import logging
 
 from cohesity_management_sdk.api_helper import APIHelper
+from cohesity_management_sdk.decorators import hybrid_method
 #CohesityPatch
 logging.basicConfig(stream=sys.stdout, level=logging.ERROR)
 
@@ -14,7 +15,12 @@ class Configuration(object):
     """A class used for configuring the SDK by a user.
 
     This class need not be instantiated and all properties and methods
-    are accessible without instance creation.
+    are accessible without instance creation. The class level properties
+    are the global configuration used by controllers created on their own.
+
+    An instance holds the configuration of a single client. Its properties
+    default to the class level ones, so several clients can talk to
+    different clusters in the same process without affecting each other.
 
     """
 
@@ -25,6 +31,40 @@ class Configuration(object):
     # True if the client should skip verification of SSL certificates
     skip_ssl_verification = True
 
+    # The JSON codec used to serialize requests and deserialize responses
+    # (allowed: json, orjson, auto or a JsonCodec instance). auto selects
+    # orjson when it is installed.
+    json_codec = "json"
+
+    # True to decode the nested structures of the models in a response only
+    # when they are first read. The response is kept in memory meanwhile.
+    lazy_models = False
+
+    # True to return the decoded JSON of the responses, dictionaries and
+    # lists, instead of models
+    raw_responses = False
+
+    # The RetryPolicy deciding which failed requests are sent again, None
+    # not to retry. Set one per client, each policy counts its own retries.
+    retry_policy = None
+
+    # The CircuitBreaker failing the requests to a host at once after it
+    # failed repeatedly, None to always send them. Set one per client.
+    circuit_breaker = None
+
+    # The ConcurrencyLimiter adapting the number of requests in flight to
+    # the load of the cluster, None for no limit. Set one per client.
+    concurrency_limiter = None
+
+    # The EndpointPool spreading the GET requests across the nodes of the
+    # cluster, None to send all the requests to cluster_vip. It is set by
+    # enable_node_pool of a client.
+    endpoint_pool = None
+
+    # The HedgingPolicy sending a duplicate of the GET requests slow to
+    # answer, None not to hedge them.
+    hedging_policy = None
+
     # An enum for SDK environments
     class Environment(object):
         PRODUCTION = 0
@@ -59,6 +99,11 @@ class Configuration(object):
     # AccessToken object, containing the fields access_token, privileges and token_type
     auth_token = None
 
+    # Where the access tokens are kept between processes: a TokenCache, the
+    # path of its directory, or True for the default directory. None to log
+    # in once per client.
+    token_cache = None
+
     # All the environments the SDK can run in
     environments = {
         Environment.PRODUCTION: {
@@ -66,10 +111,27 @@ class Configuration(object):
         },
     }
 
-    @classmethod
-    def get_base_uri(cls, server=Server.DEFAULT_HOST):
+    def __init__(self, **kwargs):
+        """Constructor for the Configuration class
+
+        Args:
+            kwargs: Properties overriding the class level defaults for this
+                instance, e.g. cluster_vip, username, password, domain or
+                auth_token.
+
+        """
+        for name, value in kwargs.items():
+            if not hasattr(Configuration, name):
+                raise TypeError("Unknown configuration property: {}".format(name))
+            setattr(self, name, value)
+
+    @hybrid_method
+    def get_base_uri(self, server=Server.DEFAULT_HOST):
         """Generates the appropriate base URI for the environment and the server.
 
+        It uses the instance properties when called on an instance and the
+        class level ones otherwise.
+
         Args:
             server (Configuration.Server): The server enum for which the base URI is required.
 
@@ -78,10 +140,10 @@ class Configuration(object):
 
         """
         parameters = {
-            "cluster_vip": cls.cluster_vip,
+            "cluster_vip": self.cluster_vip,
         }
         return APIHelper.append_url_with_template_parameters(
-            cls.environments[cls.environment][server], parameters, False)
+            self.environments[self.environment][server], parameters, False)
 
     @classmethod
     def disable_logging(cls):
@@ -3,17 +3,18 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.models.access_token import AccessToken
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class AccessTokensController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(AccessTokensController, self).__init__(client, call_back)
+    # Logging in again only creates another access token.
+    idempotent_endpoints = frozenset(['create_generate_access_token'])
+
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(AccessTokensController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def create_generate_access_token(self,
@@ -56,7 +57,7 @@ class AccessTokensController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_generate_access_token.')
             _url_path = '/public/accessTokens'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -69,7 +70,7 @@ class AccessTokensController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_generate_access_token.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
             _context = self.execute_request(_request, name = 'create_generate_access_token')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -79,7 +80,8 @@ class AccessTokensController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AccessToken.from_dictionary)
+            from cohesity_management_sdk.models.access_token import AccessToken
+            return self.deserialize_response(_context, AccessToken.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,22 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.active_directory_entry import ActiveDirectoryEntry
-from cohesity_management_sdk.models.list_centrify_zone import ListCentrifyZone
-from cohesity_management_sdk.models.domain_controllers import DomainControllers
-from cohesity_management_sdk.models.active_directory_principal import ActiveDirectoryPrincipal
-from cohesity_management_sdk.models.added_active_directory_principal import AddedActiveDirectoryPrincipal
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class ActiveDirectoryController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(ActiveDirectoryController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(ActiveDirectoryController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def delete_active_directory_entry(self,
@@ -56,7 +49,7 @@ class ActiveDirectoryController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_active_directory_entry.')
             _url_path = '/public/activeDirectory'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -68,8 +61,8 @@ class ActiveDirectoryController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_active_directory_entry.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_active_directory_entry')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -121,7 +114,7 @@ class ActiveDirectoryController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_active_directory_entry.')
             _url_path = '/public/activeDirectory'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'domains': domains,
@@ -129,7 +122,7 @@ class ActiveDirectoryController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -141,7 +134,7 @@ class ActiveDirectoryController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_active_directory_entry.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_active_directory_entry')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -151,7 +144,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ActiveDirectoryEntry.from_dictionary)
+            from cohesity_management_sdk.models.active_directory_entry import ActiveDirectoryEntry
+            return self.deserialize_response(_context, ActiveDirectoryEntry.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -191,7 +185,7 @@ class ActiveDirectoryController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_active_directory_entry.')
             _url_path = '/public/activeDirectory'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -204,8 +198,8 @@ class ActiveDirectoryController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_active_directory_entry.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_active_directory_entry')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -215,7 +209,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ActiveDirectoryEntry.from_dictionary)
+            from cohesity_management_sdk.models.active_directory_entry import ActiveDirectoryEntry
+            return self.deserialize_response(_context, ActiveDirectoryEntry.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -247,13 +242,13 @@ class ActiveDirectoryController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_centrify_zones.')
             _url_path = '/public/activeDirectory/centrifyZones'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'domainName': domain_name
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -265,7 +260,7 @@ class ActiveDirectoryController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_centrify_zones.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_centrify_zones')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -275,7 +270,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ListCentrifyZone.from_dictionary)
+            from cohesity_management_sdk.models.list_centrify_zone import ListCentrifyZone
+            return self.deserialize_response(_context, ListCentrifyZone.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -302,7 +298,7 @@ class ActiveDirectoryController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_active_directory_domain_controllers.')
             _url_path = '/public/activeDirectory/domainControllers'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -315,7 +311,7 @@ class ActiveDirectoryController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_active_directory_domain_controllers.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_active_directory_domain_controllers')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -325,7 +321,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, DomainControllers.from_dictionary)
+            from cohesity_management_sdk.models.domain_controllers import DomainControllers
+            return self.deserialize_response(_context, DomainControllers.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -388,7 +385,7 @@ class ActiveDirectoryController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for search_active_directory_principals.')
             _url_path = '/public/activeDirectory/principals'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'domain': domain,
@@ -398,7 +395,7 @@ class ActiveDirectoryController(BaseController):
                 'includeComputers': include_computers
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -410,7 +407,7 @@ class ActiveDirectoryController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for search_active_directory_principals.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'search_active_directory_principals')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -420,7 +417,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ActiveDirectoryPrincipal.from_dictionary)
+            from cohesity_management_sdk.models.active_directory_principal import ActiveDirectoryPrincipal
+            return self.deserialize_response(_context, ActiveDirectoryPrincipal.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -473,7 +471,7 @@ class ActiveDirectoryController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for add_active_directory_principals.')
             _url_path = '/public/activeDirectory/principals'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -486,8 +484,8 @@ class ActiveDirectoryController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for add_active_directory_principals.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'add_active_directory_principals')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -497,7 +495,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AddedActiveDirectoryPrincipal.from_dictionary)
+            from cohesity_management_sdk.models.added_active_directory_principal import AddedActiveDirectoryPrincipal
+            return self.deserialize_response(_context, AddedActiveDirectoryPrincipal.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -539,7 +538,7 @@ class ActiveDirectoryController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -553,7 +552,7 @@ class ActiveDirectoryController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_enable_trusted_domain_discovery.')
             _request = self.http_client.post(_query_url, headers=_headers, parameters=str(trusted_domains_enabled))
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_enable_trusted_domain_discovery')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -563,7 +562,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ActiveDirectoryEntry.from_dictionary)
+            from cohesity_management_sdk.models.active_directory_entry import ActiveDirectoryEntry
+            return self.deserialize_response(_context, ActiveDirectoryEntry.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -605,7 +605,7 @@ class ActiveDirectoryController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -618,8 +618,8 @@ class ActiveDirectoryController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_active_directory_id_mapping.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_active_directory_id_mapping')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -629,7 +629,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ActiveDirectoryEntry.from_dictionary)
+            from cohesity_management_sdk.models.active_directory_entry import ActiveDirectoryEntry
+            return self.deserialize_response(_context, ActiveDirectoryEntry.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -672,7 +673,7 @@ class ActiveDirectoryController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -685,8 +686,8 @@ class ActiveDirectoryController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_active_directory_ignored_trusted_domains.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_active_directory_ignored_trusted_domains')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -696,7 +697,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ActiveDirectoryEntry.from_dictionary)
+            from cohesity_management_sdk.models.active_directory_entry import ActiveDirectoryEntry
+            return self.deserialize_response(_context, ActiveDirectoryEntry.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -738,7 +740,7 @@ class ActiveDirectoryController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -751,8 +753,8 @@ class ActiveDirectoryController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_active_directory_ldap_provider.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_active_directory_ldap_provider')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -762,7 +764,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ActiveDirectoryEntry.from_dictionary)
+            from cohesity_management_sdk.models.active_directory_entry import ActiveDirectoryEntry
+            return self.deserialize_response(_context, ActiveDirectoryEntry.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -804,7 +807,7 @@ class ActiveDirectoryController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -817,8 +820,8 @@ class ActiveDirectoryController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_active_directory_machine_accounts.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_active_directory_machine_accounts')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -828,7 +831,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ActiveDirectoryEntry.from_dictionary)
+            from cohesity_management_sdk.models.active_directory_entry import ActiveDirectoryEntry
+            return self.deserialize_response(_context, ActiveDirectoryEntry.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -870,7 +874,7 @@ class ActiveDirectoryController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -883,8 +887,8 @@ class ActiveDirectoryController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_preferred_domain_controllers.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_preferred_domain_controllers')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -894,7 +898,8 @@ class ActiveDirectoryController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ActiveDirectoryEntry.from_dictionary)
+            from cohesity_management_sdk.models.active_directory_entry import ActiveDirectoryEntry
+            return self.deserialize_response(_context, ActiveDirectoryEntry.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
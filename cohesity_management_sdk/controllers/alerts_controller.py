@@ -3,22 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.alert_category_name import AlertCategoryName
-from cohesity_management_sdk.models.notification_rule import NotificationRule
-from cohesity_management_sdk.models.alert_resolution import AlertResolution
-from cohesity_management_sdk.models.alert_metadata import AlertMetadata
-from cohesity_management_sdk.models.alert import Alert
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class AlertsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(AlertsController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(AlertsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_alert_categories(self):
@@ -42,7 +35,7 @@ class AlertsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_alert_categories.')
             _url_path = '/public/alertCategories'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -55,7 +48,7 @@ class AlertsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_alert_categories.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_alert_categories')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -65,7 +58,8 @@ class AlertsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AlertCategoryName.from_dictionary)
+            from cohesity_management_sdk.models.alert_category_name import AlertCategoryName
+            return self.deserialize_response(_context, AlertCategoryName.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -95,7 +89,7 @@ class AlertsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_notification_rules.')
             _url_path = '/public/alertNotificationRules'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -108,7 +102,7 @@ class AlertsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_notification_rules.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_notification_rules')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -118,7 +112,8 @@ class AlertsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, NotificationRule.from_dictionary)
+            from cohesity_management_sdk.models.notification_rule import NotificationRule
+            return self.deserialize_response(_context, NotificationRule.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -152,7 +147,7 @@ class AlertsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_notification_rule.')
             _url_path = '/public/alertNotificationRules'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -165,8 +160,8 @@ class AlertsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_notification_rule.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_notification_rule')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -176,7 +171,8 @@ class AlertsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, NotificationRule.from_dictionary)
+            from cohesity_management_sdk.models.notification_rule import NotificationRule
+            return self.deserialize_response(_context, NotificationRule.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -205,7 +201,7 @@ class AlertsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_notification_rule.')
             _url_path = '/public/alertNotificationRules'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -218,7 +214,7 @@ class AlertsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_notification_rule.')
             _request = self.http_client.put(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_notification_rule')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -228,7 +224,8 @@ class AlertsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, NotificationRule.from_dictionary)
+            from cohesity_management_sdk.models.notification_rule import NotificationRule
+            return self.deserialize_response(_context, NotificationRule.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -266,14 +263,14 @@ class AlertsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'ruleId': rule_id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_notification_rule.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_notification_rule')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -341,7 +338,7 @@ class AlertsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_resolutions.')
             _url_path = '/public/alertResolutions'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'maxResolutions': max_resolutions,
@@ -353,7 +350,7 @@ class AlertsController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -365,7 +362,7 @@ class AlertsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_resolutions.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_resolutions')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -375,7 +372,8 @@ class AlertsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AlertResolution.from_dictionary)
+            from cohesity_management_sdk.models.alert_resolution import AlertResolution
+            return self.deserialize_response(_context, AlertResolution.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -412,7 +410,7 @@ class AlertsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_resolution.')
             _url_path = '/public/alertResolutions'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -425,8 +423,8 @@ class AlertsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_resolution.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_resolution')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -436,7 +434,8 @@ class AlertsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AlertResolution.from_dictionary)
+            from cohesity_management_sdk.models.alert_resolution import AlertResolution
+            return self.deserialize_response(_context, AlertResolution.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -475,7 +474,7 @@ class AlertsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -488,7 +487,7 @@ class AlertsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_resolution_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_resolution_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -498,7 +497,8 @@ class AlertsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AlertResolution.from_dictionary)
+            from cohesity_management_sdk.models.alert_resolution import AlertResolution
+            return self.deserialize_response(_context, AlertResolution.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -541,7 +541,7 @@ class AlertsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -554,8 +554,8 @@ class AlertsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_resolution.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_resolution')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -565,7 +565,8 @@ class AlertsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AlertResolution.from_dictionary)
+            from cohesity_management_sdk.models.alert_resolution import AlertResolution
+            return self.deserialize_response(_context, AlertResolution.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -596,7 +597,7 @@ class AlertsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_alert_types.')
             _url_path = '/public/alertTypes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -609,7 +610,7 @@ class AlertsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_alert_types.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_alert_types')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -619,7 +620,8 @@ class AlertsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AlertMetadata.from_dictionary)
+            from cohesity_management_sdk.models.alert_metadata import AlertMetadata
+            return self.deserialize_response(_context, AlertMetadata.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -708,7 +710,7 @@ class AlertsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_alerts.')
             _url_path = '/public/alerts'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'maxAlerts': max_alerts,
@@ -727,7 +729,7 @@ class AlertsController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -739,7 +741,7 @@ class AlertsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_alerts.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_alerts')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -749,12 +751,36 @@ class AlertsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Alert.from_dictionary)
+            from cohesity_management_sdk.models.alert import Alert
+            return self.deserialize_response(_context, Alert.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def iter_alerts(self, *args, **kwargs):
+        """Streams the alerts returned by get_alerts.
+
+        The items of the response are yielded one at a time, as the body is
+        received. Only one item is decoded at a time, so the memory used does
+        not grow with the size of the response. The connection is held until
+        all the items have been read or the generator is closed.
+
+        Args:
+            args, kwargs: The parameters of get_alerts.
+
+        Returns:
+            generator of Alert: The items of the response.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.streaming().get_alerts(*args, **kwargs)
+
     def get_alert_by_id(self,
                         id):
         """Does a GET request to /public/alerts/{id}.
@@ -787,7 +813,7 @@ class AlertsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -800,7 +826,7 @@ class AlertsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_alert_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_alert_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -810,8 +836,27 @@ class AlertsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Alert.from_dictionary)
+            from cohesity_management_sdk.models.alert import Alert
+            return self.deserialize_response(_context, Alert.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
+
+    def alert_loader(self):
+        """Returns the loader coalescing lookups of Alerts by id into
+        get_alerts(alert_id_list=...) requests, instead of calling
+        get_alert_by_id once per id.
+
+        Lookups made at the same time, from several threads or tasks, or
+        passed to get_many at once, are sent together.
+
+        Returns:
+            BatchLoader of Alert: The loader of the controller.
+
+        """
+        return self.batch_loader(
+            'alert',
+            lambda ids: self.get_alerts(max_alerts=len(ids), alert_id_list=ids),
+            url_path='/public/alerts',
+            parameter='alertIdList')
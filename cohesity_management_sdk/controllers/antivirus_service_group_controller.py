@@ -3,23 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.antivirus_service_group import AntivirusServiceGroup
-from cohesity_management_sdk.models.antivirus_service_group_state_params import AntivirusServiceGroupStateParams
-from cohesity_management_sdk.models.icap_connection_status_response import IcapConnectionStatusResponse
-from cohesity_management_sdk.models.delete_infected_file_response import DeleteInfectedFileResponse
-from cohesity_management_sdk.models.infected_files import InfectedFiles
-from cohesity_management_sdk.models.update_infected_file_response import UpdateInfectedFileResponse
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class AntivirusServiceGroupController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(AntivirusServiceGroupController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(AntivirusServiceGroupController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_antivirus_service_group(self):
@@ -43,7 +35,7 @@ class AntivirusServiceGroupController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_antivirus_service_group.')
             _url_path = '/public/antivirusGroups'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -56,7 +48,7 @@ class AntivirusServiceGroupController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_antivirus_service_group.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_antivirus_service_group')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -66,7 +58,8 @@ class AntivirusServiceGroupController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AntivirusServiceGroup.from_dictionary)
+            from cohesity_management_sdk.models.antivirus_service_group import AntivirusServiceGroup
+            return self.deserialize_response(_context, AntivirusServiceGroup.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -102,7 +95,7 @@ class AntivirusServiceGroupController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_antivirus_service_group.')
             _url_path = '/public/antivirusGroups'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -115,8 +108,8 @@ class AntivirusServiceGroupController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_antivirus_service_group.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_antivirus_service_group')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -126,7 +119,8 @@ class AntivirusServiceGroupController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AntivirusServiceGroup.from_dictionary)
+            from cohesity_management_sdk.models.antivirus_service_group import AntivirusServiceGroup
+            return self.deserialize_response(_context, AntivirusServiceGroup.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -162,7 +156,7 @@ class AntivirusServiceGroupController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_antivirus_service_group.')
             _url_path = '/public/antivirusGroups'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -175,8 +169,8 @@ class AntivirusServiceGroupController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_antivirus_service_group.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_antivirus_service_group')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -186,7 +180,8 @@ class AntivirusServiceGroupController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AntivirusServiceGroup.from_dictionary)
+            from cohesity_management_sdk.models.antivirus_service_group import AntivirusServiceGroup
+            return self.deserialize_response(_context, AntivirusServiceGroup.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -218,7 +213,7 @@ class AntivirusServiceGroupController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_antivirus_service_group_state.')
             _url_path = '/public/antivirusGroups/states'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -231,8 +226,8 @@ class AntivirusServiceGroupController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_antivirus_service_group_state.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_antivirus_service_group_state')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -242,7 +237,8 @@ class AntivirusServiceGroupController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AntivirusServiceGroupStateParams.from_dictionary)
+            from cohesity_management_sdk.models.antivirus_service_group_state_params import AntivirusServiceGroupStateParams
+            return self.deserialize_response(_context, AntivirusServiceGroupStateParams.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -280,14 +276,14 @@ class AntivirusServiceGroupController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_antivirus_service_group.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_antivirus_service_group')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -327,13 +323,13 @@ class AntivirusServiceGroupController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_icap_connection_status.')
             _url_path = '/public/icapConnectionStatus'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'icapUris': icap_uris
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -345,7 +341,7 @@ class AntivirusServiceGroupController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_icap_connection_status.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_icap_connection_status')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -355,7 +351,8 @@ class AntivirusServiceGroupController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, IcapConnectionStatusResponse.from_dictionary)
+            from cohesity_management_sdk.models.icap_connection_status_response import IcapConnectionStatusResponse
+            return self.deserialize_response(_context, IcapConnectionStatusResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -392,7 +389,7 @@ class AntivirusServiceGroupController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_infected_files.')
             _url_path = '/public/infectedFiles'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -405,8 +402,8 @@ class AntivirusServiceGroupController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_infected_files.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_infected_files')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -416,7 +413,8 @@ class AntivirusServiceGroupController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, DeleteInfectedFileResponse.from_dictionary)
+            from cohesity_management_sdk.models.delete_infected_file_response import DeleteInfectedFileResponse
+            return self.deserialize_response(_context, DeleteInfectedFileResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -468,7 +466,7 @@ class AntivirusServiceGroupController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_infected_files.')
             _url_path = '/public/infectedFiles'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'viewNames': view_names,
@@ -479,7 +477,7 @@ class AntivirusServiceGroupController(BaseController):
                 'paginationCookie': pagination_cookie
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -491,7 +489,7 @@ class AntivirusServiceGroupController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_infected_files.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_infected_files')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -501,12 +499,46 @@ class AntivirusServiceGroupController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, InfectedFiles.from_dictionary)
+            from cohesity_management_sdk.models.infected_files import InfectedFiles
+            return self.deserialize_response(_context, InfectedFiles.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def paginate_infected_files(self,
+                                page_size=None,
+                                prefetch=True,
+                                **kwargs):
+        """Iterates over all the infected files returned by
+        get_infected_files, following the pagination cookie of each page.
+
+        The next page is requested in the background while the items of the
+        current one are consumed, unless prefetch is False.
+
+        Args:
+            page_size (int, optional): The pageCount of each request, the
+                default of the cluster when None.
+            prefetch (bool, optional): False to request each page only once
+                the previous one has been consumed.
+            kwargs: The other parameters of get_infected_files.
+
+        Returns:
+            CookiePaginator of InfectedFile: The infected files of all the pages.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.paginate(
+            lambda cookie, page_size: self.get_infected_files(pagination_cookie=cookie,
+                                                              page_count=page_size,
+                                                              **kwargs),
+            'infectedFiles', 'paginationCookie', page_size, prefetch)
+
     def update_infected_files(self,
                               body):
         """Does a PUT request to /public/infectedFiles.
@@ -538,7 +570,7 @@ class AntivirusServiceGroupController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_infected_files.')
             _url_path = '/public/infectedFiles'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -551,8 +583,8 @@ class AntivirusServiceGroupController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_infected_files.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_infected_files')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -562,7 +594,8 @@ class AntivirusServiceGroupController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, UpdateInfectedFileResponse.from_dictionary)
+            from cohesity_management_sdk.models.update_infected_file_response import UpdateInfectedFileResponse
+            return self.deserialize_response(_context, UpdateInfectedFileResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
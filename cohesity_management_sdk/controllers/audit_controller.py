@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.cluster_audit_logs_search_result import ClusterAuditLogsSearchResult
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class AuditController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(AuditController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(AuditController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_audit_logs_actions(self):
@@ -38,7 +35,7 @@ class AuditController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_audit_logs_actions.')
             _url_path = '/public/auditLogs/actions'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -51,7 +48,7 @@ class AuditController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_audit_logs_actions.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_audit_logs_actions')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -61,7 +58,7 @@ class AuditController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body)
+            return self.deserialize_response(_context)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -88,7 +85,7 @@ class AuditController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_audit_logs_categories.')
             _url_path = '/public/auditLogs/categories'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -101,7 +98,7 @@ class AuditController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_audit_logs_categories.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_audit_logs_categories')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -111,7 +108,7 @@ class AuditController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body)
+            return self.deserialize_response(_context)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -202,7 +199,7 @@ class AuditController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for search_cluster_audit_logs.')
             _url_path = '/public/auditLogs/cluster'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'userNames': user_names,
@@ -219,7 +216,7 @@ class AuditController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -231,7 +228,7 @@ class AuditController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for search_cluster_audit_logs.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'search_cluster_audit_logs')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -241,8 +238,43 @@ class AuditController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ClusterAuditLogsSearchResult.from_dictionary)
+            from cohesity_management_sdk.models.cluster_audit_logs_search_result import ClusterAuditLogsSearchResult
+            return self.deserialize_response(_context, ClusterAuditLogsSearchResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
+
+    def paginate_cluster_audit_logs(self,
+                                    page_size=None,
+                                    max_workers=4,
+                                    **kwargs):
+        """Iterates over all the cluster audit logs matching the filter
+        criteria of search_cluster_audit_logs.
+
+        The first page gives the total count of items. The other pages are
+        then requested in parallel, at most max_workers at once, and their
+        items are yielded in order.
+
+        Args:
+            page_size (int, optional): The pageCount of each request, the
+                default of the cluster when None.
+            max_workers (int, optional): The maximum number of pages
+                requested at once.
+            kwargs: The other parameters of search_cluster_audit_logs, except startIndex.
+
+        Returns:
+            OffsetPaginator of ClusterAuditLog: The audit logs of all the pages.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.paginate_offsets(
+            lambda start_index, page_size: self.search_cluster_audit_logs(start_index=start_index,
+                                                                          page_count=page_size,
+                                                                          **kwargs),
+            'clusterAuditLogs', 'totalCount', page_size, max_workers)
@@ -1,11 +1,24 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
-import json
-import jsonpickle
+import copy
+import functools
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from requests.compat import urlparse, urlunparse
+from requests.utils import quote
 from cohesity_management_sdk.api_helper import APIHelper
+from cohesity_management_sdk.batch_loader import BatchLoader
+from cohesity_management_sdk.configuration import Configuration
+from cohesity_management_sdk.http.auth.auth_manager import AuthManager
 from cohesity_management_sdk.http.http_context import HttpContext
 from cohesity_management_sdk.http.requests_client import RequestsClient
 from cohesity_management_sdk.exceptions.api_exception import APIException, ExpiredTokenException
+from cohesity_management_sdk.json_codec import JsonArrayStream
+from cohesity_management_sdk.model_decoder import get_decoder
+from cohesity_management_sdk.retry import NO_RETRY
+from cohesity_management_sdk.pagination import CookiePaginator, OffsetPaginator, ShardPaginator, \
+    WindowPaginator
 
 class BaseController(object):
 
@@ -20,6 +33,31 @@ class BaseController(object):
             methods to be called before and after the execution of an HttpRequest.
         global_headers (dict): The global headers of the API which are sent with
             every request.
+        config (Configuration): The configuration used to build the URLs of
+            the requests. By default the class level Configuration is used.
+        auth (AuthManager): The object which adds authentication to the
+            requests. By default it uses the class level Configuration.
+        stream_items (tuple): The (item_path, unboxing_function) of the
+            array streamed out of the responses, None when the responses are
+            read at once. It is set on the copies made by streaming.
+        raw_responses (bool): True to return the decoded JSON of the
+            responses instead of models, None to follow the configuration.
+            It is set on the copies made by raw.
+        response_fields (dict): The tree of the fields kept in the raw
+            responses, None to keep all of them.
+        batch_loader_class (type): The class of the loaders returned by
+            batch_loader.
+        loaders (dict): The loaders of the controller by name, created
+            when first used.
+        idempotent_endpoints (frozenset of string): The names of the
+            endpoints of the controller which are safe to retry although
+            their HTTP method is not idempotent.
+        retry_policy (RetryPolicy): The retry policy of the copies made by
+            with_retry_policy, NO_RETRY not to retry their requests. None
+            uses the one of the configuration.
+        pinned_host (string): The node the requests of the copies made by
+            on_host are sent to, None to use the cluster VIP or the endpoint
+            pool of the configuration.
 
     """
 
@@ -31,11 +69,265 @@ class BaseController(object):
         'user-agent': 'cohesity-Python-sdk-1.1.1'
     }
 
-    def __init__(self, client=None, call_back=None):
+    config = Configuration
+
+    auth = AuthManager
+
+    stream_items = None
+
+    raw_responses = None
+
+    response_fields = None
+
+    batch_loader_class = BatchLoader
+
+    idempotent_endpoints = frozenset()
+
+    retry_policy = None
+
+    pinned_host = None
+
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        self.loaders = {}
         if client != None:
             self.http_client = client
         if call_back != None:
             self.http_call_back = call_back
+        if config != None:
+            self.config = config
+            self.auth = AuthManager(config, self.http_client)
+        if auth != None:
+            self.auth = auth
+
+    def streaming(self, item_path=None, unboxing_function=None):
+        """Returns a copy of the controller whose endpoints yield the items of
+        the JSON array in their response as the body is received, instead
+        of returning the whole list once it has been read.
+
+        Args:
+            item_path (list of string, optional): The keys of the array in
+                the response, when the response is an object wrapping it.
+            unboxing_function (callable, optional): The function creating a
+                model out of each item, by default the one of the endpoint.
+
+        Returns:
+            BaseController: The streaming copy of the controller.
+
+        """
+        controller = copy.copy(self)
+        controller.stream_items = (item_path, unboxing_function)
+        controller.loaders = {}
+        return controller
+
+    def raw(self, fields=None):
+        """Returns a copy of the controller whose endpoints return the
+        decoded JSON of the responses, dictionaries and lists, without
+        creating models.
+
+        Args:
+            fields (list of string, optional): The paths of the fields to
+                keep in each response, or in each item of a list response,
+                e.g. ['jobName', 'backupRun.stats.startTimeUsecs']. Paths
+                are made of API property names and go through arrays. All
+                the fields are kept when None.
+
+        Returns:
+            BaseController: The raw copy of the controller.
+
+        """
+        controller = copy.copy(self)
+        controller.raw_responses = True
+        controller.loaders = {}
+        controller.response_fields = APIHelper.field_tree(fields) if fields else None
+        return controller
+
+    def with_retry_policy(self, policy):
+        """Returns a copy of the controller whose requests are retried by
+        another policy than the one of the configuration.
+
+        Args:
+            policy (RetryPolicy): The retry policy of the copy, NO_RETRY not
+                to retry its requests, None for the one of the
+                configuration.
+
+        Returns:
+            BaseController: The copy of the controller.
+
+        """
+        controller = copy.copy(self)
+        controller.retry_policy = policy
+        controller.loaders = {}
+        return controller
+
+    def on_host(self, host):
+        """Returns a copy of the controller whose requests are sent to one
+        node of the cluster, e.g. to check its health.
+
+        Args:
+            host (string): The address of the node, as in cluster_vip.
+
+        Returns:
+            BaseController: The copy of the controller.
+
+        """
+        controller = copy.copy(self)
+        controller.pinned_host = host
+        controller.loaders = {}
+        return controller
+
+    def get_retry_policy(self):
+        """Returns the retry policy of the requests of the controller.
+
+        Returns:
+            RetryPolicy: The policy, None not to retry.
+
+        """
+        if self.retry_policy is NO_RETRY:
+            return None
+        if self.retry_policy is not None:
+            return self.retry_policy
+        return self.config.retry_policy
+
+    def paginate(self, fetch_page, items, cookie, page_size=None, prefetch=True):
+        """Returns an iterable over the items of an endpoint paginated by a
+        cookie, requesting the pages as it goes.
+
+        Args:
+            fetch_page (callable): The function calling the endpoint with a
+                cookie, None for the first page, and a page size.
+            items (string|callable): The API name of the array holding the
+                items of a page, or a function returning them from a page.
+            cookie (string|callable): The API name of the cookie of the next
+                page, or a function returning it from a page.
+            page_size (int, optional): The number of items per page, the
+                default of the endpoint when None.
+            prefetch (bool, optional): False to request each page only once
+                the previous one has been consumed.
+
+        Returns:
+            CookiePaginator: The items of all the pages.
+
+        """
+        return CookiePaginator(fetch_page, items, cookie, page_size, prefetch)
+
+    def paginate_offsets(self, fetch_page, items, total, page_size=None, max_workers=4):
+        """Returns an iterable over the items of an endpoint paginated by
+        the index of the first item of each page, requesting the pages after
+        the first one in parallel.
+
+        Args:
+            fetch_page (callable): The function calling the endpoint with
+                the index of the first item of a page and a page size.
+            items (string|callable): The API name of the array holding the
+                items of a page, or a function returning them from a page.
+            total (string|callable): The API name of the total number of
+                items, or a function returning it from a page.
+            page_size (int, optional): The number of items per page, the size
+                of the first page when None.
+            max_workers (int, optional): The maximum number of pages
+                requested at once.
+
+        Returns:
+            OffsetPaginator: The items of all the pages, in order.
+
+        """
+        return OffsetPaginator(fetch_page, items, total, page_size, max_workers)
+
+    def paginate_windows(self, fetch_window, start, end, window, time_field,
+                         key_fields=None, partitions=None, max_workers=4,
+                         max_items=None, min_window=1, overlap=0):
+        """Returns an iterable over the items of an endpoint filtered by a
+        time range, requesting windows of the range in parallel.
+
+        Args:
+            fetch_window (callable): The function calling the endpoint
+                with the start and end time of a window, the maximum number
+                of items and a partition.
+            start (int): The start of the range.
+            end (int): The end of the range, the current time when None.
+            window (int): The initial width of the windows.
+            time_field (string|callable): The path of the start time of an
+                item, or a function returning it.
+            key_fields (list of string|callable, optional): The paths of the
+                fields identifying an item, or a function returning its
+                identity, to yield the items seen in several windows once.
+            partitions (list, optional): The values the windows are further
+                split by.
+            max_workers (int, optional): The maximum number of windows
+                requested at once.
+            max_items (int, optional): The maximum number of items per
+                window. Windows reaching it are split.
+            min_window (int, optional): The width under which windows are not
+                split.
+            overlap (int, optional): The time requested after the end of
+                every window.
+
+        Returns:
+            WindowPaginator: The items of all the windows, newest first.
+
+        """
+        return WindowPaginator(fetch_window, start, end, window, time_field,
+                               key_fields, partitions, max_workers, max_items,
+                               min_window, overlap)
+
+    def paginate_shards(self, list_shards, fetch_shard, merge=None, max_workers=4):
+        """Returns an iterable over the results of an endpoint called once
+        per shard of a listing, requesting the shards in parallel and
+        yielding their results as they complete.
+
+        Args:
+            list_shards (callable): The function returning the shards, e.g.
+                by calling a listing endpoint.
+            fetch_shard (callable): The function calling the endpoint for a
+                shard.
+            merge (callable, optional): The function called with a shard and
+                its result, returning the items to yield. The results are
+                yielded as they are when None.
+            max_workers (int, optional): The maximum number of shards
+                requested at once.
+
+        Returns:
+            ShardPaginator: The results of all the shards, in the order they
+                complete.
+
+        """
+        return ShardPaginator(list_shards, fetch_shard, merge, max_workers)
+
+    def batch_loader(self, name, fetch, key='id', url_path=None, parameter=None,
+                     max_url_length=2000, max_batch_size=100, wait=0.005):
+        """Returns the loader of the controller coalescing lookups by id into
+        requests of a list endpoint, creating it the first time.
+
+        Args:
+            name (string): The name of the loader.
+            fetch (callable): The function calling the list endpoint with a
+                list of ids.
+            key (string|callable, optional): The API name of the id of an
+                item, or a function returning it.
+            url_path (string, optional): The path of the list endpoint.
+            parameter (string, optional): The query parameter of the ids,
+                used with url_path to keep the URLs under max_url_length.
+            max_url_length (int, optional): The maximum length of a URL.
+            max_batch_size (int, optional): The maximum number of ids per
+                request, None for no limit.
+            wait (float, optional): The time in seconds lookups are
+                collected for before being sent.
+
+        Returns:
+            BatchLoader: The loader.
+
+        """
+        loader = self.loaders.get(name)
+        if loader is None:
+            url_length = None
+            if parameter is not None:
+                url = self.config.get_base_uri() + url_path
+                # The brackets of indexed arrays are percent-encoded when sent.
+                url_length = lambda ids: len(quote(APIHelper.append_url_with_query_parameters(
+                    url, {parameter: ids}, self.config.array_serialization), safe=':/?&=%'))
+            loader = self.loaders.setdefault(name, self.batch_loader_class(
+                fetch, key, url_length, max_url_length, max_batch_size, wait))
+        return loader
 
     def validate_parameters(self, **kwargs):
         """Validates required parameters of an endpoint.
@@ -71,10 +363,10 @@ class BaseController(object):
         request.headers = APIHelper.merge_dicts(self.global_headers, request.headers)
 
         # Invoke the API call to fetch the response.
-        self.logger.debug("Raw request for {} is: {}".format(name, vars(request)))
-        func = self.http_client.execute_as_binary if binary else self.http_client.execute_as_string
-        response = func(request)
-        self.logger.debug("Raw response for {} is: {}".format(name, vars(response)))
+        response = self.send_with_retries(request, binary, name)
+        if self.is_token_expired(response) and self.auth.refresh(request):
+            self.logger.info("Replaying the request for {} with a new access token.".format(name))
+            response = self.send_with_retries(request, binary, name)
         self.logger.info("Wrapping request and response in a context object for {}.".format(name))
         context = HttpContext(request, response)
 
@@ -85,6 +377,299 @@ class BaseController(object):
 
         return context
 
+    def send_request(self, request, binary=False, name=None):
+        """Sends an HttpRequest within the circuit breaker and the
+        concurrency limiter of the configuration. The request is counted in
+        flight until its response is received, before the body of a
+        streamed response is read. It is sent to the pinned host of the
+        controller, or to a node of the endpoint pool of the configuration
+        when it is routed by the pool, and to the cluster VIP otherwise.
+
+        Args:
+            request (HttpRequest): The HttpRequest to send.
+            binary (bool): True if a binary response is expected.
+            name (string, optional): The name of the endpoint.
+
+        Returns:
+            HttpResponse: The response.
+
+        Raises:
+            CircuitOpenException: When the circuit of the host is open.
+
+        """
+        breaker = self.config.circuit_breaker
+        limiter = self.config.concurrency_limiter
+        pool = self.config.endpoint_pool
+        node = None
+        if self.pinned_host is not None:
+            request = self.route_request(request, self.pinned_host)
+        elif pool is not None and pool.is_routed(request):
+            node = pool.acquire(breaker.is_available if breaker is not None else None)
+            if node is not None:
+                request = self.route_request(request, node)
+        host = urlparse(request.query_url).netloc
+        failed = None
+        try:
+            probe = breaker.before_request(host) if breaker is not None else False
+            try:
+                if limiter is not None:
+                    limiter.acquire()
+                start = time.time()
+                overloaded = None
+                try:
+                    response = self.send_to_client(request, binary, name)
+                    failed = response.status_code >= 500
+                    overloaded = failed or response.status_code == 429
+                    return response
+                except Exception as e:
+                    if self.http_client.is_transient_error(e):
+                        failed = overloaded = True
+                    raise
+                finally:
+                    if limiter is not None:
+                        limiter.release(time.time() - start, overloaded, name)
+            finally:
+                if breaker is not None:
+                    breaker.after_request(host, probe, failed)
+        finally:
+            if node is not None:
+                pool.release(node, failed)
+
+    @staticmethod
+    def route_request(request, host):
+        """Returns a copy of an HttpRequest sent to another host.
+
+        Args:
+            request (HttpRequest): The request.
+            host (string): The host and port to send it to.
+
+        Returns:
+            HttpRequest: The copy of the request.
+
+        """
+        request = copy.copy(request)
+        request.query_url = urlunparse(urlparse(request.query_url)._replace(netloc=host))
+        return request
+
+    def send_to_client(self, request, binary=False, name=None):
+        """Sends an HttpRequest through the HttpClient.
+
+        Args:
+            request (HttpRequest): The HttpRequest to send.
+            binary (bool): True if a binary response is expected.
+            name (string, optional): The name of the endpoint, for logging.
+
+        Returns:
+            HttpResponse: The response. The body of a successful response is
+                left unread by a streaming controller.
+
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Raw request for {} is: {}".format(name, vars(request)))
+        if self.stream_items is not None and not binary:
+            response = self.http_client.execute_as_stream(request)
+            if (response.status_code < 200) or (response.status_code > 208):
+                # Errors are read at once to be validated as usual.
+                try:
+                    response.content = b''.join(response.chunks)
+                finally:
+                    response.release()
+        else:
+            func = self.http_client.execute_as_binary if binary else self.http_client.execute_as_string
+            response = func(request)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Raw response for {} is: {}".format(name, vars(response)))
+        return response
+
+    def send_hedged(self, request, binary=False, name=None):
+        """Sends an HttpRequest, and a duplicate of it when it is slow to
+        answer, as decided by the hedging_policy of the configuration.
+
+        Args:
+            request (HttpRequest): The HttpRequest to send.
+            binary (bool): True if a binary response is expected.
+            name (string, optional): The name of the endpoint.
+
+        Returns:
+            HttpResponse: The first response received.
+
+        """
+        policy = self.config.hedging_policy
+        if policy is None or not policy.is_hedged(request, name):
+            return self.send_request(request, binary, name)
+        policy.add_request()
+        delay = policy.get_delay(name)
+        executor = policy.get_executor()
+        futures = [executor.submit(self.send_timed, policy, request, binary, name)]
+        denied = False
+        if delay is not None and not wait(futures, delay).done:
+            if policy.take_hedge():
+                self.logger.info("Hedging {} after {:.3f}s.".format(name, delay))
+                futures.append(executor.submit(self.send_timed, policy, request, binary, name))
+            else:
+                denied = True
+        pending = futures
+        winner = None
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in futures
+                           if future in done and future.exception() is None), None)
+        hedged = len(futures) > 1
+        policy.metrics.record(hedged, hedged and winner is futures[1], denied)
+        for future in futures:
+            if future is not winner:
+                # The request cannot be interrupted, its response is dropped.
+                future.add_done_callback(self.discard_response)
+        return (winner or futures[0]).result()
+
+    def send_timed(self, policy, request, binary=False, name=None):
+        start = time.time()
+        response = self.send_request(request, binary, name)
+        policy.record_latency(name, time.time() - start)
+        return response
+
+    @staticmethod
+    def discard_response(future):
+        if not future.cancelled() and future.exception() is None:
+            release = getattr(future.result(), 'release', None)
+            if release is not None:
+                release()
+
+    def send_with_retries(self, request, binary=False, name=None):
+        """Sends an HttpRequest, retrying it as decided by the retry_policy
+        of the configuration.
+
+        Args:
+            request (HttpRequest): The HttpRequest to send.
+            binary (bool): True if a binary response is expected.
+            name (string, optional): The name of the endpoint.
+
+        Returns:
+            HttpResponse: The response of the last attempt.
+
+        """
+        policy = self.get_retry_policy()
+        if policy is None:
+            return self.send_hedged(request, binary, name)
+        call = policy.begin(policy.is_idempotent(request, name, self.idempotent_endpoints))
+        try:
+            while True:
+                try:
+                    response = self.send_hedged(request, binary, name)
+                except Exception as e:
+                    if not self.http_client.is_transient_error(e):
+                        raise
+                    delay = call.next_delay(error=e,
+                                            sent=not self.http_client.is_connect_error(e),
+                                            timeout=self.http_client.is_timeout_error(e))
+                    if delay is None:
+                        raise
+                    self.logger.warning("Retrying {} in {:.2f}s after {!r}.".format(name, delay, e))
+                else:
+                    delay = call.next_delay(response)
+                    if delay is None:
+                        return response
+                    self.logger.warning("Retrying {} in {:.2f}s after status {}.".format(
+                        name, delay, response.status_code))
+                time.sleep(delay)
+        finally:
+            call.finish()
+
+    def is_token_expired(self, response):
+        """Checks whether a request was rejected because its access token
+        has expired.
+
+        Args:
+            response (HttpResponse): The response of the request.
+
+        Returns:
+            bool: True for an expired access token.
+
+        """
+        if response.status_code != 401:
+            return False
+        body = APIHelper.json_deserialize(response.raw_body, codec=self.config.json_codec)
+        return isinstance(body, dict) and \
+            body.get('errorCode') == 'KStatusUnauthorized' and \
+            body.get('message') == "The access token is invalid."
+
+    def deserialize_response(self, context, unboxing_function=None):
+        """Deserializes the JSON body of a response with the JSON codec of
+        the configuration. UTF-8 bodies are parsed straight from the bytes
+        received, without being decoded into a string first.
+
+        Args:
+            context (HttpContext): The HttpContext of the API call.
+            unboxing_function (callable, optional): The function creating a
+                model out of each decoded object.
+
+        Returns:
+            object: The deserialized body, a generator of the items of the
+                streamed array for a streaming controller.
+
+        """
+        unboxing_function = self.get_unboxing_function(unboxing_function)
+        if self.stream_items is not None:
+            return self.iter_response_items(context.response, unboxing_function)
+        return APIHelper.json_deserialize(context.response.json_body, unboxing_function,
+                                          self.config.json_codec)
+
+    def get_unboxing_function(self, unboxing_function):
+        """Returns the function to create the models of a response with.
+
+        No models are created for raw responses, their fields are projected
+        instead if fields were given. The from_dictionary of a model is
+        replaced by its lazy decoder when the configuration asks for lazy
+        models.
+
+        Args:
+            unboxing_function (callable): The function given by the endpoint.
+
+        Returns:
+            callable: The function creating a model out of each decoded
+                object, None to keep the decoded objects as they are.
+
+        """
+        raw_responses = self.raw_responses
+        if raw_responses is None:
+            raw_responses = self.config.raw_responses
+        if raw_responses:
+            if self.response_fields is None:
+                return None
+            return functools.partial(APIHelper.project, tree=self.response_fields)
+        model = getattr(unboxing_function, '__self__', None)
+        if self.config.lazy_models and hasattr(model, '_names') and \
+                unboxing_function.__name__ == 'from_dictionary':
+            return get_decoder(model, lazy=True)
+        return unboxing_function
+
+    def iter_response_items(self, response, unboxing_function=None):
+        """Yields the items of the JSON array streamed in a response. The
+        connection is released once the array has been read or the
+        generator is closed.
+
+        Args:
+            response (HttpStreamResponse): The streamed response.
+            unboxing_function (callable, optional): The function creating a
+                model out of each item.
+
+        Returns:
+            generator: The items of the array.
+
+        """
+        item_path, item_unboxing_function = self.stream_items
+        if item_unboxing_function is not None:
+            unboxing_function = self.get_unboxing_function(item_unboxing_function)
+        stream = JsonArrayStream(item_path)
+        try:
+            for chunk in response.chunks:
+                for item in stream.feed(chunk):
+                    yield unboxing_function(item) if unboxing_function else item
+            for item in stream.close():
+                yield unboxing_function(item) if unboxing_function else item
+        finally:
+            response.release()
+
     def validate_response(self, context):
         """Validates an HTTP response by checking for global errors.
 
@@ -95,11 +680,10 @@ class BaseController(object):
         #CohesityPatch
         if (context.response.status_code < 200) or (context.response.status_code > 208):  # [200,208] = HTTP OK
             status = context.response.status_code
-            message = jsonpickle.decode(context.response.raw_body)['message']
+            body = APIHelper.json_deserialize(context.response.raw_body, codec=self.config.json_codec)
+            message = body['message']
             raise_except = APIException('Response status code: %s, Response message: %s' % (status, message), context)
-            if context.response.status_code == 401 and \
-                    json.loads(context.response.raw_body)['errorCode'] == 'KStatusUnauthorized' and \
-                    json.loads(context.response.raw_body)['message'] == "The access token is invalid.":
+            if self.is_token_expired(context.response):
                 raise_except = ExpiredTokenException('Response status code: %s, Response message: %s' %
                                                      (status, message), context)
             raise raise_except
@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.ssl_certificate_config import SslCertificateConfig
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class CertificatesController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(CertificatesController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(CertificatesController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def delete_web_server_certificate(self):
@@ -38,14 +35,14 @@ class CertificatesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_web_server_certificate.')
             _url_path = '/public/certificates/webServer'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_web_server_certificate.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_web_server_certificate')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -79,7 +76,7 @@ class CertificatesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_web_server_certificate.')
             _url_path = '/public/certificates/webServer'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -92,7 +89,7 @@ class CertificatesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_web_server_certificate.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_web_server_certificate')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -102,7 +99,8 @@ class CertificatesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, SslCertificateConfig.from_dictionary)
+            from cohesity_management_sdk.models.ssl_certificate_config import SslCertificateConfig
+            return self.deserialize_response(_context, SslCertificateConfig.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -134,7 +132,7 @@ class CertificatesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_web_server_certificate.')
             _url_path = '/public/certificates/webServer'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -147,8 +145,8 @@ class CertificatesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_web_server_certificate.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_web_server_certificate')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -158,7 +156,8 @@ class CertificatesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, SslCertificateConfig.from_dictionary)
+            from cohesity_management_sdk.models.ssl_certificate_config import SslCertificateConfig
+            return self.deserialize_response(_context, SslCertificateConfig.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
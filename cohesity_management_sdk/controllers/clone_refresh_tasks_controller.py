@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.restore_task_wrapper import RestoreTaskWrapper
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class CloneRefreshTasksController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(CloneRefreshTasksController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(CloneRefreshTasksController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def create_clone_refresh_task(self,
@@ -49,7 +46,7 @@ class CloneRefreshTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_clone_refresh_task.')
             _url_path = '/public/restore/applicationsClone/refresh'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -62,8 +59,8 @@ class CloneRefreshTasksController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_clone_refresh_task.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_clone_refresh_task')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -73,7 +70,8 @@ class CloneRefreshTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreTaskWrapper.from_dictionary)
+            from cohesity_management_sdk.models.restore_task_wrapper import RestoreTaskWrapper
+            return self.deserialize_response(_context, RestoreTaskWrapper.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
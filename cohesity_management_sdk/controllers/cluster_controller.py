@@ -3,19 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.basic_cluster_info import BasicClusterInfo
-from cohesity_management_sdk.models.cluster import Cluster
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class ClusterController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(ClusterController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(ClusterController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_basic_cluster_info(self):
@@ -44,7 +40,7 @@ class ClusterController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_basic_cluster_info.')
             _url_path = '/public/basicClusterInfo'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -66,7 +62,8 @@ class ClusterController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, BasicClusterInfo.from_dictionary)
+            from cohesity_management_sdk.models.basic_cluster_info import BasicClusterInfo
+            return self.deserialize_response(_context, BasicClusterInfo.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -101,14 +98,14 @@ class ClusterController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_cluster.')
             _url_path = '/public/cluster'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'fetchStats': fetch_stats,
                 'fetchTimeSeriesSchema': fetch_time_series_schema
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -120,7 +117,7 @@ class ClusterController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_cluster.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -130,7 +127,8 @@ class ClusterController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Cluster.from_dictionary)
+            from cohesity_management_sdk.models.cluster import Cluster
+            return self.deserialize_response(_context, Cluster.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -161,7 +159,7 @@ class ClusterController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_cluster.')
             _url_path = '/public/cluster'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -174,8 +172,8 @@ class ClusterController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_cluster.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -185,7 +183,8 @@ class ClusterController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Cluster.from_dictionary)
+            from cohesity_management_sdk.models.cluster import Cluster
+            return self.deserialize_response(_context, Cluster.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,10 +3,7 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.cluster_partition import ClusterPartition
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 from cohesity_management_sdk.exceptions.api_exception import APIException
 
@@ -14,8 +11,8 @@ class ClusterPartitionsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(ClusterPartitionsController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(ClusterPartitionsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_cluster_partitions(self,
@@ -51,14 +48,14 @@ class ClusterPartitionsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_cluster_partitions.')
             _url_path = '/public/clusterPartitions'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'ids': ids,
                 'names': names
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -70,7 +67,7 @@ class ClusterPartitionsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_cluster_partitions.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_cluster_partitions')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -80,7 +77,8 @@ class ClusterPartitionsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ClusterPartition.from_dictionary)
+            from cohesity_management_sdk.models.cluster_partition import ClusterPartition
+            return self.deserialize_response(_context, ClusterPartition.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -120,7 +118,7 @@ class ClusterPartitionsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -133,7 +131,7 @@ class ClusterPartitionsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_cluster_partition_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_cluster_partition_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -145,7 +143,8 @@ class ClusterPartitionsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ClusterPartition.from_dictionary)
+            from cohesity_management_sdk.models.cluster_partition import ClusterPartition
+            return self.deserialize_response(_context, ClusterPartition.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,17 +3,7 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.cluster_public_keys import ClusterPublicKeys
-from cohesity_management_sdk.models.create_cluster_result import CreateClusterResult
-from cohesity_management_sdk.models.cluster_creation_progress_result import ClusterCreationProgressResult
-from cohesity_management_sdk.models.io_preferential_tier import IoPreferentialTier
-from cohesity_management_sdk.models.service_state_result import ServiceStateResult
-from cohesity_management_sdk.models.change_service_state_result import ChangeServiceStateResult
-from cohesity_management_sdk.models.upgrade_cluster_result import UpgradeClusterResult
-from cohesity_management_sdk.models.external_client_subnets import ExternalClientSubnets
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 from cohesity_management_sdk.exceptions.error_exception import ErrorException
 
@@ -21,8 +11,8 @@ class ClustersController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(ClustersController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(ClustersController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_cluster_keys(self):
@@ -46,7 +36,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_cluster_keys.')
             _url_path = '/public/cluster/keys'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -59,7 +49,7 @@ class ClustersController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_cluster_keys.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_cluster_keys')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -69,7 +59,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ClusterPublicKeys.from_dictionary)
+            from cohesity_management_sdk.models.cluster_public_keys import ClusterPublicKeys
+            return self.deserialize_response(_context, ClusterPublicKeys.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -98,14 +89,14 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for destroy_cluster.')
             _url_path = '/public/clusters'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for destroy_cluster.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'destroy_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -152,7 +143,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_cloud_cluster.')
             _url_path = '/public/clusters/cloudEdition'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -165,8 +156,8 @@ class ClustersController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_cloud_cluster.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_cloud_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -176,7 +167,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, CreateClusterResult.from_dictionary)
+            from cohesity_management_sdk.models.create_cluster_result import CreateClusterResult
+            return self.deserialize_response(_context, CreateClusterResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -214,7 +206,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_expand_cloud_cluster.')
             _url_path = '/public/clusters/cloudEdition/nodes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -227,8 +219,8 @@ class ClustersController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_expand_cloud_cluster.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_expand_cloud_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -238,7 +230,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, CreateClusterResult.from_dictionary)
+            from cohesity_management_sdk.models.create_cluster_result import CreateClusterResult
+            return self.deserialize_response(_context, CreateClusterResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -268,7 +261,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_cluster_creation_progress.')
             _url_path = '/public/clusters/creationProgress'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -281,7 +274,7 @@ class ClustersController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_cluster_creation_progress.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_cluster_creation_progress')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -291,7 +284,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ClusterCreationProgressResult.from_dictionary)
+            from cohesity_management_sdk.models.cluster_creation_progress_result import ClusterCreationProgressResult
+            return self.deserialize_response(_context, ClusterCreationProgressResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -318,7 +312,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_io_preferential_tier.')
             _url_path = '/public/clusters/ioPreferentialTier'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -331,7 +325,7 @@ class ClustersController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_io_preferential_tier.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_io_preferential_tier')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -341,7 +335,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, IoPreferentialTier.from_dictionary)
+            from cohesity_management_sdk.models.io_preferential_tier import IoPreferentialTier
+            return self.deserialize_response(_context, IoPreferentialTier.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -379,14 +374,14 @@ class ClustersController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for remove_node.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'remove_node')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -433,7 +428,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_physical_cluster.')
             _url_path = '/public/clusters/physicalEdition'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -446,8 +441,8 @@ class ClustersController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_physical_cluster.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_physical_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -457,7 +452,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, CreateClusterResult.from_dictionary)
+            from cohesity_management_sdk.models.create_cluster_result import CreateClusterResult
+            return self.deserialize_response(_context, CreateClusterResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -495,7 +491,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_expand_physical_cluster.')
             _url_path = '/public/clusters/physicalEdition/nodes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -508,8 +504,8 @@ class ClustersController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_expand_physical_cluster.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_expand_physical_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -519,7 +515,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, CreateClusterResult.from_dictionary)
+            from cohesity_management_sdk.models.create_cluster_result import CreateClusterResult
+            return self.deserialize_response(_context, CreateClusterResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -547,7 +544,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_service_states.')
             _url_path = '/public/clusters/services/states'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -560,7 +557,7 @@ class ClustersController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_service_states.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_service_states')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -570,7 +567,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ServiceStateResult.from_dictionary)
+            from cohesity_management_sdk.models.service_state_result import ServiceStateResult
+            return self.deserialize_response(_context, ServiceStateResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -608,7 +606,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for change_service_state.')
             _url_path = '/public/clusters/services/states'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -621,8 +619,8 @@ class ClustersController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for change_service_state.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'change_service_state')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -632,7 +630,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ChangeServiceStateResult.from_dictionary)
+            from cohesity_management_sdk.models.change_service_state_result import ChangeServiceStateResult
+            return self.deserialize_response(_context, ChangeServiceStateResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -672,7 +671,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_upgrade_cluster.')
             _url_path = '/public/clusters/software'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -685,8 +684,8 @@ class ClustersController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_upgrade_cluster.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_upgrade_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -696,7 +695,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, UpgradeClusterResult.from_dictionary)
+            from cohesity_management_sdk.models.upgrade_cluster_result import UpgradeClusterResult
+            return self.deserialize_response(_context, UpgradeClusterResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -734,7 +734,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_virtual_cluster.')
             _url_path = '/public/clusters/virtualEdition'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -747,8 +747,8 @@ class ClustersController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_virtual_cluster.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_virtual_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -758,7 +758,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, CreateClusterResult.from_dictionary)
+            from cohesity_management_sdk.models.create_cluster_result import CreateClusterResult
+            return self.deserialize_response(_context, CreateClusterResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -785,7 +786,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_external_client_subnets.')
             _url_path = '/public/externalClientSubnets'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -798,7 +799,7 @@ class ClustersController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_external_client_subnets.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_external_client_subnets')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -808,7 +809,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ExternalClientSubnets.from_dictionary)
+            from cohesity_management_sdk.models.external_client_subnets import ExternalClientSubnets
+            return self.deserialize_response(_context, ExternalClientSubnets.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -840,7 +842,7 @@ class ClustersController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_external_client_subnets.')
             _url_path = '/public/externalClientSubnets'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -853,8 +855,8 @@ class ClustersController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_external_client_subnets.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_external_client_subnets')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -864,7 +866,8 @@ class ClustersController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ExternalClientSubnets.from_dictionary)
+            from cohesity_management_sdk.models.external_client_subnets import ExternalClientSubnets
+            return self.deserialize_response(_context, ExternalClientSubnets.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
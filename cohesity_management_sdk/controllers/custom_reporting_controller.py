@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.postgres_node_info import PostgresNodeInfo
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class CustomReportingController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(CustomReportingController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(CustomReportingController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_postgres(self):
@@ -38,7 +35,7 @@ class CustomReportingController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_postgres.')
             _url_path = '/public/postgres'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -51,7 +48,7 @@ class CustomReportingController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_postgres.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_postgres')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -61,7 +58,8 @@ class CustomReportingController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, PostgresNodeInfo.from_dictionary)
+            from cohesity_management_sdk.models.postgres_node_info import PostgresNodeInfo
+            return self.deserialize_response(_context, PostgresNodeInfo.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.group import Group
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class GroupsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(GroupsController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(GroupsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def delete_groups(self,
@@ -48,7 +45,7 @@ class GroupsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_groups.')
             _url_path = '/public/groups'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -60,8 +57,8 @@ class GroupsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_groups.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_groups')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -115,7 +112,7 @@ class GroupsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_groups.')
             _url_path = '/public/groups'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'name': name,
@@ -124,7 +121,7 @@ class GroupsController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -136,7 +133,7 @@ class GroupsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_groups.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_groups')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -146,7 +143,8 @@ class GroupsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Group.from_dictionary)
+            from cohesity_management_sdk.models.group import Group
+            return self.deserialize_response(_context, Group.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -183,7 +181,7 @@ class GroupsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_group.')
             _url_path = '/public/groups'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -196,8 +194,8 @@ class GroupsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_group.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_group')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -207,7 +205,8 @@ class GroupsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Group.from_dictionary)
+            from cohesity_management_sdk.models.group import Group
+            return self.deserialize_response(_context, Group.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -238,7 +237,7 @@ class GroupsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_group.')
             _url_path = '/public/groups'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -251,8 +250,8 @@ class GroupsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_group.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_group')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -262,7 +261,8 @@ class GroupsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Group.from_dictionary)
+            from cohesity_management_sdk.models.group import Group
+            return self.deserialize_response(_context, Group.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,19 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.added_idp_principal import AddedIdpPrincipal
-from cohesity_management_sdk.models.idp_service_configuration import IdpServiceConfiguration
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class IdpsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(IdpsController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(IdpsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def add_active_idp_principals(self):
@@ -56,7 +52,7 @@ class IdpsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for add_active_idp_principals.')
             _url_path = '/public/idp/principals'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -69,7 +65,7 @@ class IdpsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for add_active_idp_principals.')
             _request = self.http_client.post(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'add_active_idp_principals')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -79,7 +75,8 @@ class IdpsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AddedIdpPrincipal.from_dictionary)
+            from cohesity_management_sdk.models.added_idp_principal import AddedIdpPrincipal
+            return self.deserialize_response(_context, AddedIdpPrincipal.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -128,7 +125,7 @@ class IdpsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_idps.')
             _url_path = '/public/idps'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'names': names,
@@ -137,7 +134,7 @@ class IdpsController(BaseController):
                 'domains': domains
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -149,7 +146,7 @@ class IdpsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_idps.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_idps')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -159,7 +156,8 @@ class IdpsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, IdpServiceConfiguration.from_dictionary)
+            from cohesity_management_sdk.models.idp_service_configuration import IdpServiceConfiguration
+            return self.deserialize_response(_context, IdpServiceConfiguration.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -191,7 +189,7 @@ class IdpsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_idp.')
             _url_path = '/public/idps'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -204,8 +202,8 @@ class IdpsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_idp.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_idp')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -215,7 +213,8 @@ class IdpsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, IdpServiceConfiguration.from_dictionary)
+            from cohesity_management_sdk.models.idp_service_configuration import IdpServiceConfiguration
+            return self.deserialize_response(_context, IdpServiceConfiguration.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -248,19 +247,19 @@ class IdpsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_idp_login.')
             _url_path = '/public/idps/login'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'tenantId': tenant_id
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_idp_login.')
             _request = self.http_client.get(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_idp_login')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -306,14 +305,14 @@ class IdpsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_idp.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_idp')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -362,7 +361,7 @@ class IdpsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -375,8 +374,8 @@ class IdpsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_idp.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_idp')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -386,7 +385,8 @@ class IdpsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, IdpServiceConfiguration.from_dictionary)
+            from cohesity_management_sdk.models.idp_service_configuration import IdpServiceConfiguration
+            return self.deserialize_response(_context, IdpServiceConfiguration.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.interface_group import InterfaceGroup
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class InterfaceGroupController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(InterfaceGroupController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(InterfaceGroupController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_interface_groups(self):
@@ -38,7 +35,7 @@ class InterfaceGroupController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_interface_groups.')
             _url_path = '/public/interfaceGroups'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -51,7 +48,7 @@ class InterfaceGroupController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_interface_groups.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_interface_groups')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -61,7 +58,8 @@ class InterfaceGroupController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, InterfaceGroup.from_dictionary)
+            from cohesity_management_sdk.models.interface_group import InterfaceGroup
+            return self.deserialize_response(_context, InterfaceGroup.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -93,7 +91,7 @@ class InterfaceGroupController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_interface_group.')
             _url_path = '/public/interfaceGroups'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -106,8 +104,8 @@ class InterfaceGroupController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_interface_group.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_interface_group')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -117,7 +115,8 @@ class InterfaceGroupController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, InterfaceGroup.from_dictionary)
+            from cohesity_management_sdk.models.interface_group import InterfaceGroup
+            return self.deserialize_response(_context, InterfaceGroup.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -149,7 +148,7 @@ class InterfaceGroupController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_interface_group.')
             _url_path = '/public/interfaceGroups'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -162,8 +161,8 @@ class InterfaceGroupController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_interface_group.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_interface_group')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -173,7 +172,8 @@ class InterfaceGroupController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, InterfaceGroup.from_dictionary)
+            from cohesity_management_sdk.models.interface_group import InterfaceGroup
+            return self.deserialize_response(_context, InterfaceGroup.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -211,14 +211,14 @@ class InterfaceGroupController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_interface_group.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_interface_group')
 
             # Endpoint and global error handling using HTTP status codes.
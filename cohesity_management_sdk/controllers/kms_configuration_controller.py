@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.kms_configuration_response import KmsConfigurationResponse
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class KmsConfigurationController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(KmsConfigurationController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(KmsConfigurationController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_kms_config(self,
@@ -45,13 +42,13 @@ class KmsConfigurationController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_kms_config.')
             _url_path = '/public/kmsConfig'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'serverIp': server_ip
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -63,7 +60,7 @@ class KmsConfigurationController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_kms_config.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_kms_config')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -73,7 +70,8 @@ class KmsConfigurationController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, KmsConfigurationResponse.from_dictionary)
+            from cohesity_management_sdk.models.kms_configuration_response import KmsConfigurationResponse
+            return self.deserialize_response(_context, KmsConfigurationResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -106,7 +104,7 @@ class KmsConfigurationController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_kms_config.')
             _url_path = '/public/kmsConfig'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -119,8 +117,8 @@ class KmsConfigurationController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_kms_config.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_kms_config')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -130,7 +128,8 @@ class KmsConfigurationController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, KmsConfigurationResponse.from_dictionary)
+            from cohesity_management_sdk.models.kms_configuration_response import KmsConfigurationResponse
+            return self.deserialize_response(_context, KmsConfigurationResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -163,7 +162,7 @@ class KmsConfigurationController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_kms_config.')
             _url_path = '/public/kmsConfig'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -176,8 +175,8 @@ class KmsConfigurationController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_kms_config.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_kms_config')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -187,7 +186,8 @@ class KmsConfigurationController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, KmsConfigurationResponse.from_dictionary)
+            from cohesity_management_sdk.models.kms_configuration_response import KmsConfigurationResponse
+            return self.deserialize_response(_context, KmsConfigurationResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
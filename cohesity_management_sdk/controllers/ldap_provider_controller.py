@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.ldap_provider_response import LdapProviderResponse
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class LdapProviderController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(LdapProviderController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(LdapProviderController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_ldap_provider(self,
@@ -50,7 +47,7 @@ class LdapProviderController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_ldap_provider.')
             _url_path = '/public/ldapProvider'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'ids': ids,
@@ -58,7 +55,7 @@ class LdapProviderController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -70,7 +67,7 @@ class LdapProviderController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_ldap_provider.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_ldap_provider')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -80,7 +77,8 @@ class LdapProviderController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, LdapProviderResponse.from_dictionary)
+            from cohesity_management_sdk.models.ldap_provider_response import LdapProviderResponse
+            return self.deserialize_response(_context, LdapProviderResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -115,7 +113,7 @@ class LdapProviderController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_ldap_provider.')
             _url_path = '/public/ldapProvider'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -128,8 +126,8 @@ class LdapProviderController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_ldap_provider.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_ldap_provider')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -139,7 +137,8 @@ class LdapProviderController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, LdapProviderResponse.from_dictionary)
+            from cohesity_management_sdk.models.ldap_provider_response import LdapProviderResponse
+            return self.deserialize_response(_context, LdapProviderResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -175,7 +174,7 @@ class LdapProviderController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_ldap_provider.')
             _url_path = '/public/ldapProvider'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -188,8 +187,8 @@ class LdapProviderController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_ldap_provider.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_ldap_provider')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -199,7 +198,8 @@ class LdapProviderController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, LdapProviderResponse.from_dictionary)
+            from cohesity_management_sdk.models.ldap_provider_response import LdapProviderResponse
+            return self.deserialize_response(_context, LdapProviderResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -237,14 +237,14 @@ class LdapProviderController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_ldap_provider.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_ldap_provider')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -289,14 +289,14 @@ class LdapProviderController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_ldap_provider_status.')
             _request = self.http_client.get(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_ldap_provider_status')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -3,17 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class MonitoringController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(MonitoringController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(MonitoringController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_all_job_runs(self,
@@ -62,7 +60,7 @@ protection, replication,
             # Prepare query URL
             self.logger.info('Preparing query URL for get_all_job_runs.')
             _url_path = '/public/monitoring/jobs'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'startTime': start_time,
@@ -72,13 +70,13 @@ protection, replication,
                 'pageSize': page_size
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_all_job_runs.')
             _request = self.http_client.get(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_all_job_runs')
 
             # Endpoint and global error handling using HTTP status codes.
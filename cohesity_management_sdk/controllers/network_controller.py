@@ -3,22 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.create_bond_result import CreateBondResult
-from cohesity_management_sdk.models.update_bond_result import UpdateBondResult
-from cohesity_management_sdk.models.host_result import HostResult
-from cohesity_management_sdk.models.host_entry import HostEntry
-from cohesity_management_sdk.models.node_network_interfaces import NodeNetworkInterfaces
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class NetworkController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(NetworkController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(NetworkController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def create_bond(self,
@@ -52,7 +45,7 @@ class NetworkController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_bond.')
             _url_path = '/public/network/bonds'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -65,8 +58,8 @@ class NetworkController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_bond.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_bond')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -76,7 +69,8 @@ class NetworkController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, CreateBondResult.from_dictionary)
+            from cohesity_management_sdk.models.create_bond_result import CreateBondResult
+            return self.deserialize_response(_context, CreateBondResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -113,7 +107,7 @@ class NetworkController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_bond.')
             _url_path = '/public/network/bonds'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -126,8 +120,8 @@ class NetworkController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_bond.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_bond')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -137,7 +131,8 @@ class NetworkController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, UpdateBondResult.from_dictionary)
+            from cohesity_management_sdk.models.update_bond_result import UpdateBondResult
+            return self.deserialize_response(_context, UpdateBondResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -177,14 +172,14 @@ class NetworkController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_bond.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_bond')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -228,13 +223,13 @@ class NetworkController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_hosts.')
             _url_path = '/public/network/hosts'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'ips': ips
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -246,7 +241,7 @@ class NetworkController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_hosts.')
             _request = self.http_client.delete(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_hosts')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -256,7 +251,8 @@ class NetworkController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, HostResult.from_dictionary)
+            from cohesity_management_sdk.models.host_result import HostResult
+            return self.deserialize_response(_context, HostResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -285,7 +281,7 @@ class NetworkController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_hosts.')
             _url_path = '/public/network/hosts'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -298,7 +294,7 @@ class NetworkController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_hosts.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_hosts')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -308,7 +304,8 @@ class NetworkController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, HostEntry.from_dictionary)
+            from cohesity_management_sdk.models.host_entry import HostEntry
+            return self.deserialize_response(_context, HostEntry.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -346,7 +343,7 @@ class NetworkController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_append_hosts.')
             _url_path = '/public/network/hosts'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -359,8 +356,8 @@ class NetworkController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_append_hosts.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_append_hosts')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -370,7 +367,8 @@ class NetworkController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, HostResult.from_dictionary)
+            from cohesity_management_sdk.models.host_result import HostResult
+            return self.deserialize_response(_context, HostResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -406,7 +404,7 @@ class NetworkController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_edit_hosts.')
             _url_path = '/public/network/hosts'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -419,8 +417,8 @@ class NetworkController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_edit_hosts.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_edit_hosts')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -430,7 +428,8 @@ class NetworkController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, HostResult.from_dictionary)
+            from cohesity_management_sdk.models.host_result import HostResult
+            return self.deserialize_response(_context, HostResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -459,7 +458,7 @@ class NetworkController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_network_interfaces.')
             _url_path = '/public/network/interfaces'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -472,7 +471,7 @@ class NetworkController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_network_interfaces.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_network_interfaces')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -482,7 +481,8 @@ class NetworkController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, NodeNetworkInterfaces.from_dictionary)
+            from cohesity_management_sdk.models.node_network_interfaces import NodeNetworkInterfaces
+            return self.deserialize_response(_context, NodeNetworkInterfaces.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,20 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.free_node_information import FreeNodeInformation
-from cohesity_management_sdk.models.node import Node
-from cohesity_management_sdk.models.upgrade_node_result import UpgradeNodeResult
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class NodesController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(NodesController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(NodesController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def list_free_nodes(self):
@@ -42,7 +37,7 @@ class NodesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_free_nodes.')
             _url_path = '/public/freeNodes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -55,7 +50,7 @@ class NodesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_free_nodes.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_free_nodes')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -65,7 +60,8 @@ class NodesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, FreeNodeInformation.from_dictionary)
+            from cohesity_management_sdk.models.free_node_information import FreeNodeInformation
+            return self.deserialize_response(_context, FreeNodeInformation.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -95,7 +91,7 @@ class NodesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_nodes.')
             _url_path = '/public/nodes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -108,7 +104,7 @@ class NodesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_nodes.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_nodes')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -118,7 +114,8 @@ class NodesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Node.from_dictionary)
+            from cohesity_management_sdk.models.node import Node
+            return self.deserialize_response(_context, Node.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -162,7 +159,7 @@ class NodesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_upgrade_node.')
             _url_path = '/public/nodes/software'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -175,8 +172,8 @@ class NodesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_upgrade_node.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_upgrade_node')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -186,7 +183,8 @@ class NodesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, UpgradeNodeResult.from_dictionary)
+            from cohesity_management_sdk.models.upgrade_node_result import UpgradeNodeResult
+            return self.deserialize_response(_context, UpgradeNodeResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -224,7 +222,7 @@ class NodesController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -237,7 +235,7 @@ class NodesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_node_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_node_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -247,8 +245,82 @@ class NodesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Node.from_dictionary)
+            from cohesity_management_sdk.models.node import Node
+            return self.deserialize_response(_context, Node.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
+
+    def node_loader(self):
+        """Returns the loader coalescing lookups of Nodes by id into
+        get_nodes() requests, instead of calling get_node_by_id once per
+        id.
+
+        get_nodes has no filter, so each batch requests all the Nodes once
+        and picks the ids out of them.
+
+        Lookups made at the same time, from several threads or tasks, or
+        passed to get_many at once, are sent together.
+
+        Returns:
+            BatchLoader of Node: The loader of the controller.
+
+        """
+        return self.batch_loader(
+            'node',
+            lambda ids: self.get_nodes(),
+            max_batch_size=None)
+
+    def paginate_node_hosts(self, max_workers=8):
+        """Discovers the nodes of the cluster with get_nodes, then checks
+        that each of them answers, several in parallel.
+
+        Each node is sent get_node_by_id with its own id, without retries.
+        The nodes marked for removal are left out.
+
+        Args:
+            max_workers (int, optional): The maximum number of nodes checked
+                at once.
+
+        Returns:
+            ShardPaginator of string: The addresses of the nodes which
+                answered, with the port of the cluster VIP, in the order they
+                answered.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        from cohesity_management_sdk.endpoint_pool import get_node_host
+        raw = self.raw(['id', 'ip', 'isMarkedForRemoval'])
+        return self.paginate_shards(
+            lambda: raw.get_nodes(),
+            self.check_node,
+            lambda node, healthy: [get_node_host(node, self.config.cluster_vip)] if healthy else [],
+            max_workers)
+
+    def check_node(self, node):
+        """Checks that a node of the cluster answers the API.
+
+        Args:
+            node (dict): The raw Node, with its id, ip and isMarkedForRemoval.
+
+        Returns:
+            bool: True when the node answered get_node_by_id with itself.
+
+        """
+        from cohesity_management_sdk.endpoint_pool import get_node_host
+        from cohesity_management_sdk.retry import NO_RETRY
+        if not node.get('ip') or node.get('isMarkedForRemoval'):
+            return False
+        host = get_node_host(node, self.config.cluster_vip)
+        try:
+            nodes = self.on_host(host).with_retry_policy(NO_RETRY).raw(['id']).get_node_by_id(node['id'])
+        except Exception as e:
+            self.logger.warning("Node {} failed its health check: {!r}".format(host, e))
+            return False
+        return bool(nodes)
@@ -3,19 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.package_details import PackageDetails
-from cohesity_management_sdk.models.download_package_result import DownloadPackageResult
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class PackagesController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(PackagesController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(PackagesController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def list_packages(self):
@@ -41,7 +37,7 @@ class PackagesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_packages.')
             _url_path = '/public/packages'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -54,7 +50,7 @@ class PackagesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_packages.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_packages')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -64,7 +60,8 @@ class PackagesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, PackageDetails.from_dictionary)
+            from cohesity_management_sdk.models.package_details import PackageDetails
+            return self.deserialize_response(_context, PackageDetails.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -100,7 +97,7 @@ class PackagesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_download_package.')
             _url_path = '/public/packages/url'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -113,8 +110,8 @@ class PackagesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_download_package.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_download_package')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -124,7 +121,8 @@ class PackagesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, DownloadPackageResult.from_dictionary)
+            from cohesity_management_sdk.models.download_package_result import DownloadPackageResult
+            return self.deserialize_response(_context, DownloadPackageResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
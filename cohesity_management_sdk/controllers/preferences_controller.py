@@ -3,17 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class PreferencesController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(PreferencesController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(PreferencesController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_user_preferences(self):
@@ -37,14 +35,14 @@ class PreferencesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_user_preferences.')
             _url_path = '/public/sessionUser/preferences'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_user_preferences.')
             _request = self.http_client.get(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_user_preferences')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -86,7 +84,7 @@ class PreferencesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for patch_user_preferences.')
             _url_path = '/public/sessionUser/preferences'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -99,7 +97,7 @@ class PreferencesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for patch_user_preferences.')
             _request = self.http_client.patch(_query_url, headers=_headers, parameters=preferences)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'patch_user_preferences')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -141,7 +139,7 @@ class PreferencesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_user_preferences.')
             _url_path = '/public/sessionUser/preferences'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -154,7 +152,7 @@ class PreferencesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_user_preferences.')
             _request = self.http_client.put(_query_url, headers=_headers, parameters=preferences)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_user_preferences')
 
             # Endpoint and global error handling using HTTP status codes.
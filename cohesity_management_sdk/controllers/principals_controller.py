@@ -3,21 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.sources_for_sid import SourcesForSid
-from cohesity_management_sdk.models.principal import Principal
-from cohesity_management_sdk.models.user import User
-from cohesity_management_sdk.models.new_s_3_secret_access_key import NewS3SecretAccessKey
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class PrincipalsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(PrincipalsController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(PrincipalsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def list_sources_for_principals(self,
@@ -49,13 +43,13 @@ class PrincipalsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_sources_for_principals.')
             _url_path = '/public/principals/protectionSources'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'sids': sids
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -67,7 +61,7 @@ class PrincipalsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_sources_for_principals.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_sources_for_principals')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -77,7 +71,8 @@ class PrincipalsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, SourcesForSid.from_dictionary)
+            from cohesity_management_sdk.models.sources_for_sid import SourcesForSid
+            return self.deserialize_response(_context, SourcesForSid.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -115,7 +110,7 @@ class PrincipalsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_sources_for_principals.')
             _url_path = '/public/principals/protectionSources'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -127,8 +122,8 @@ class PrincipalsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_sources_for_principals.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_sources_for_principals')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -198,7 +193,7 @@ class PrincipalsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for search_principals.')
             _url_path = '/public/principals/searchPrincipals'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'domain': domain,
@@ -208,7 +203,7 @@ class PrincipalsController(BaseController):
                 'includeComputers': include_computers
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -220,7 +215,7 @@ class PrincipalsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for search_principals.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'search_principals')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -230,7 +225,8 @@ class PrincipalsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Principal.from_dictionary)
+            from cohesity_management_sdk.models.principal import Principal
+            return self.deserialize_response(_context, Principal.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -257,7 +253,7 @@ class PrincipalsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_session_user.')
             _url_path = '/public/sessionUser'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -270,7 +266,7 @@ class PrincipalsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_session_user.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_session_user')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -280,7 +276,8 @@ class PrincipalsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, User.from_dictionary)
+            from cohesity_management_sdk.models.user import User
+            return self.deserialize_response(_context, User.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -317,7 +314,7 @@ class PrincipalsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_users.')
             _url_path = '/public/users'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -329,8 +326,8 @@ class PrincipalsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_users.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_users')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -395,7 +392,7 @@ class PrincipalsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_users.')
             _url_path = '/public/users'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'tenantIds': tenant_ids,
@@ -406,7 +403,7 @@ class PrincipalsController(BaseController):
                 'partialMatch': partial_match
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -418,7 +415,7 @@ class PrincipalsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_users.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_users')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -428,7 +425,8 @@ class PrincipalsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, User.from_dictionary)
+            from cohesity_management_sdk.models.user import User
+            return self.deserialize_response(_context, User.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -465,7 +463,7 @@ class PrincipalsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_user.')
             _url_path = '/public/users'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -478,8 +476,8 @@ class PrincipalsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_user.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_user')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -489,7 +487,8 @@ class PrincipalsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, User.from_dictionary)
+            from cohesity_management_sdk.models.user import User
+            return self.deserialize_response(_context, User.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -521,7 +520,7 @@ class PrincipalsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_user.')
             _url_path = '/public/users'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -534,8 +533,8 @@ class PrincipalsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_user.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_user')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -545,7 +544,8 @@ class PrincipalsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, User.from_dictionary)
+            from cohesity_management_sdk.models.user import User
+            return self.deserialize_response(_context, User.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -572,7 +572,7 @@ class PrincipalsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_user_privileges.')
             _url_path = '/public/users/privileges'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -585,7 +585,7 @@ class PrincipalsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_user_privileges.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_user_privileges')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -595,7 +595,7 @@ class PrincipalsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body)
+            return self.deserialize_response(_context)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -628,7 +628,7 @@ class PrincipalsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_reset_s_3_secret_key.')
             _url_path = '/public/users/s3SecretKey'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -641,8 +641,8 @@ class PrincipalsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_reset_s_3_secret_key.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_reset_s_3_secret_key')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -652,7 +652,8 @@ class PrincipalsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, NewS3SecretAccessKey.from_dictionary)
+            from cohesity_management_sdk.models.new_s_3_secret_access_key import NewS3SecretAccessKey
+            return self.deserialize_response(_context, NewS3SecretAccessKey.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.privilege_info import PrivilegeInfo
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class PrivilegesController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(PrivilegesController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(PrivilegesController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_privileges(self,
@@ -49,13 +46,13 @@ class PrivilegesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_privileges.')
             _url_path = '/public/privileges'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'name': name
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -67,7 +64,7 @@ class PrivilegesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_privileges.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_privileges')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -77,7 +74,8 @@ class PrivilegesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, PrivilegeInfo.from_dictionary)
+            from cohesity_management_sdk.models.privilege_info import PrivilegeInfo
+            return self.deserialize_response(_context, PrivilegeInfo.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
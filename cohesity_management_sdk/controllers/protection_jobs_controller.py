@@ -3,20 +3,18 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.protection_job import ProtectionJob
-from cohesity_management_sdk.models.update_protection_jobs_state import UpdateProtectionJobsState
-from cohesity_management_sdk.models.protection_job_audit_trail import ProtectionJobAuditTrail
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class ProtectionJobsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(ProtectionJobsController, self).__init__(client, call_back)
+    # Setting the state of a Job to the same value twice has no further effect.
+    idempotent_endpoints = frozenset(['change_protection_job_state'])
+
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(ProtectionJobsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def change_protection_job_state(self,
@@ -65,7 +63,7 @@ class ProtectionJobsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -77,8 +75,8 @@ class ProtectionJobsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for change_protection_job_state.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'change_protection_job_state')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -175,7 +173,7 @@ class ProtectionJobsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_protection_jobs.')
             _url_path = '/public/protectionJobs'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'ids': ids,
@@ -193,7 +191,7 @@ class ProtectionJobsController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -205,7 +203,7 @@ class ProtectionJobsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_jobs.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_jobs')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -215,7 +213,8 @@ class ProtectionJobsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionJob.from_dictionary)
+            from cohesity_management_sdk.models.protection_job import ProtectionJob
+            return self.deserialize_response(_context, ProtectionJob.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -251,7 +250,7 @@ class ProtectionJobsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_protection_job.')
             _url_path = '/public/protectionJobs'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -264,8 +263,8 @@ class ProtectionJobsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_protection_job.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_protection_job')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -275,7 +274,8 @@ class ProtectionJobsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionJob.from_dictionary)
+            from cohesity_management_sdk.models.protection_job import ProtectionJob
+            return self.deserialize_response(_context, ProtectionJob.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -328,7 +328,7 @@ class ProtectionJobsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -340,8 +340,8 @@ class ProtectionJobsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_run_protection_job.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_run_protection_job')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -390,7 +390,7 @@ class ProtectionJobsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_protection_jobs_state.')
             _url_path = '/public/protectionJobs/states'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -403,8 +403,8 @@ class ProtectionJobsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_protection_jobs_state.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_protection_jobs_state')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -414,7 +414,8 @@ class ProtectionJobsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, UpdateProtectionJobsState.from_dictionary)
+            from cohesity_management_sdk.models.update_protection_jobs_state import UpdateProtectionJobsState
+            return self.deserialize_response(_context, UpdateProtectionJobsState.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -455,7 +456,7 @@ class ProtectionJobsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -467,8 +468,8 @@ class ProtectionJobsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_protection_job.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_protection_job')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -513,7 +514,7 @@ class ProtectionJobsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -526,7 +527,7 @@ class ProtectionJobsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_job_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_job_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -536,12 +537,31 @@ class ProtectionJobsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionJob.from_dictionary)
+            from cohesity_management_sdk.models.protection_job import ProtectionJob
+            return self.deserialize_response(_context, ProtectionJob.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def protection_job_loader(self):
+        """Returns the loader coalescing lookups of Protection Jobs by id
+        into get_protection_jobs(ids=...) requests, instead of calling
+        get_protection_job_by_id once per id.
+
+        Lookups made at the same time, from several threads or tasks, or
+        passed to get_many at once, are sent together.
+
+        Returns:
+            BatchLoader of ProtectionJob: The loader of the controller.
+
+        """
+        return self.batch_loader(
+            'protection_job',
+            lambda ids: self.get_protection_jobs(ids=ids),
+            url_path='/public/protectionJobs',
+            parameter='ids')
+
     def update_protection_job(self,
                               body,
                               id):
@@ -578,7 +598,7 @@ class ProtectionJobsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -591,8 +611,8 @@ class ProtectionJobsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_protection_job.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_protection_job')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -602,7 +622,8 @@ class ProtectionJobsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionJob.from_dictionary)
+            from cohesity_management_sdk.models.protection_job import ProtectionJob
+            return self.deserialize_response(_context, ProtectionJob.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -640,7 +661,7 @@ class ProtectionJobsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -653,7 +674,7 @@ class ProtectionJobsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_job_audit.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_job_audit')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -663,7 +684,8 @@ class ProtectionJobsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionJobAuditTrail.from_dictionary)
+            from cohesity_management_sdk.models.protection_job_audit_trail import ProtectionJobAuditTrail
+            return self.deserialize_response(_context, ProtectionJobAuditTrail.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
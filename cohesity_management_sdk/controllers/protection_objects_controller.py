@@ -3,20 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.protected_object import ProtectedObject
-from cohesity_management_sdk.models.protection_job import ProtectionJob
-from cohesity_management_sdk.models.protection_object_summary import ProtectionObjectSummary
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class ProtectionObjectsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(ProtectionObjectsController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(ProtectionObjectsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def delete_unprotect_object(self,
@@ -45,7 +40,7 @@ class ProtectionObjectsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_unprotect_object.')
             _url_path = '/public/protectionObjects'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -57,8 +52,8 @@ class ProtectionObjectsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_unprotect_object.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_unprotect_object')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -98,7 +93,7 @@ class ProtectionObjectsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_protect_object.')
             _url_path = '/public/protectionObjects'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -111,8 +106,8 @@ class ProtectionObjectsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_protect_object.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_protect_object')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -122,7 +117,8 @@ class ProtectionObjectsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectedObject.from_dictionary)
+            from cohesity_management_sdk.models.protected_object import ProtectedObject
+            return self.deserialize_response(_context, ProtectedObject.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -158,7 +154,7 @@ Success
             # Prepare query URL
             self.logger.info('Preparing query URL for update_protection_object.')
             _url_path = '/public/protectionObjects'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -171,8 +167,8 @@ Success
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_protection_object.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_protection_object')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -182,7 +178,8 @@ Success
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionJob.from_dictionary)
+            from cohesity_management_sdk.models.protection_job import ProtectionJob
+            return self.deserialize_response(_context, ProtectionJob.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -219,13 +216,13 @@ Success
             # Prepare query URL
             self.logger.info('Preparing query URL for get_protection_object_summary.')
             _url_path = '/public/protectionObjects/summary'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'protectionSourceId': protection_source_id
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -237,7 +234,7 @@ Success
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_object_summary.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_object_summary')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -247,7 +244,8 @@ Success
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionObjectSummary.from_dictionary)
+            from cohesity_management_sdk.models.protection_object_summary import ProtectionObjectSummary
+            return self.deserialize_response(_context, ProtectionObjectSummary.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,19 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.protection_policy import ProtectionPolicy
-from cohesity_management_sdk.models.protection_policy_summary import ProtectionPolicySummary
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class ProtectionPoliciesController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(ProtectionPoliciesController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(ProtectionPoliciesController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_protection_policies(self,
@@ -67,7 +63,7 @@ class ProtectionPoliciesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_protection_policies.')
             _url_path = '/public/protectionPolicies'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'ids': ids,
@@ -78,7 +74,7 @@ class ProtectionPoliciesController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -90,7 +86,7 @@ class ProtectionPoliciesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_policies.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_policies')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -100,7 +96,8 @@ class ProtectionPoliciesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionPolicy.from_dictionary)
+            from cohesity_management_sdk.models.protection_policy import ProtectionPolicy
+            return self.deserialize_response(_context, ProtectionPolicy.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -136,7 +133,7 @@ class ProtectionPoliciesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_protection_policy.')
             _url_path = '/public/protectionPolicies'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -149,8 +146,8 @@ class ProtectionPoliciesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_protection_policy.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_protection_policy')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -160,7 +157,8 @@ class ProtectionPoliciesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionPolicy.from_dictionary)
+            from cohesity_management_sdk.models.protection_policy import ProtectionPolicy
+            return self.deserialize_response(_context, ProtectionPolicy.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -199,14 +197,14 @@ class ProtectionPoliciesController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_protection_policy.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_protection_policy')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -253,7 +251,7 @@ class ProtectionPoliciesController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -266,7 +264,7 @@ class ProtectionPoliciesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_policy_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_policy_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -276,12 +274,31 @@ class ProtectionPoliciesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionPolicy.from_dictionary)
+            from cohesity_management_sdk.models.protection_policy import ProtectionPolicy
+            return self.deserialize_response(_context, ProtectionPolicy.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def protection_policy_loader(self):
+        """Returns the loader coalescing lookups of Protection Policies by id
+        into get_protection_policies(ids=...) requests, instead of calling
+        get_protection_policy_by_id once per id.
+
+        Lookups made at the same time, from several threads or tasks, or
+        passed to get_many at once, are sent together.
+
+        Returns:
+            BatchLoader of ProtectionPolicy: The loader of the controller.
+
+        """
+        return self.batch_loader(
+            'protection_policy',
+            lambda ids: self.get_protection_policies(ids=ids),
+            url_path='/public/protectionPolicies',
+            parameter='ids')
+
     def update_protection_policy(self,
                                  body,
                                  id):
@@ -319,7 +336,7 @@ class ProtectionPoliciesController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -332,8 +349,8 @@ class ProtectionPoliciesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_protection_policy.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_protection_policy')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -343,7 +360,8 @@ class ProtectionPoliciesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionPolicy.from_dictionary)
+            from cohesity_management_sdk.models.protection_policy import ProtectionPolicy
+            return self.deserialize_response(_context, ProtectionPolicy.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -408,7 +426,7 @@ class ProtectionPoliciesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_protection_policy_summary.')
             _url_path = '/public/protectionPolicySummary'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'id': id,
@@ -420,7 +438,7 @@ class ProtectionPoliciesController(BaseController):
                 'paginationCookie': pagination_cookie
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -432,7 +450,7 @@ class ProtectionPoliciesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_policy_summary.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_policy_summary')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -442,7 +460,8 @@ class ProtectionPoliciesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionPolicySummary.from_dictionary)
+            from cohesity_management_sdk.models.protection_policy_summary import ProtectionPolicySummary
+            return self.deserialize_response(_context, ProtectionPolicySummary.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
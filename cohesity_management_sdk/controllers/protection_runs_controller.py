@@ -3,19 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.protection_run_instance import ProtectionRunInstance
-from cohesity_management_sdk.models.protection_run_errors import ProtectionRunErrors
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class ProtectionRunsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(ProtectionRunsController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(ProtectionRunsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_protection_runs(self,
@@ -94,7 +90,7 @@ class ProtectionRunsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_protection_runs.')
             _url_path = '/public/protectionRuns'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'jobId': job_id,
@@ -110,7 +106,7 @@ class ProtectionRunsController(BaseController):
                 'excludeNonRestoreableRuns': exclude_non_restoreable_runs
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -122,7 +118,7 @@ class ProtectionRunsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_runs.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_runs')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -132,12 +128,115 @@ class ProtectionRunsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionRunInstance.from_dictionary)
+            from cohesity_management_sdk.models.protection_run_instance import ProtectionRunInstance
+            return self.deserialize_response(_context, ProtectionRunInstance.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def iter_protection_runs(self, *args, **kwargs):
+        """Streams the Job Runs returned by get_protection_runs.
+
+        The items of the response are yielded one at a time, as the body is
+        received. Only one item is decoded at a time, so the memory used does
+        not grow with the size of the response. The connection is held until
+        all the items have been read or the generator is closed.
+
+        Args:
+            args, kwargs: The parameters of get_protection_runs.
+
+        Returns:
+            generator of ProtectionRunInstance: The items of the response.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.streaming().get_protection_runs(*args, **kwargs)
+
+    def paginate_protection_runs(self,
+                                 start_time_usecs,
+                                 end_time_usecs=None,
+                                 window_usecs=7 * 86400000000,
+                                 job_ids=None,
+                                 max_workers=4,
+                                 max_runs_per_window=1000,
+                                 min_window_usecs=60000000,
+                                 max_run_duration_usecs=86400000000,
+                                 **kwargs):
+        """Iterates over the Job Runs started within a time range, splitting
+        the range into windows requested in parallel, instead of requesting
+        the whole history at once.
+
+        Each window is requested with numRuns set to max_runs_per_window. A
+        window returning that many Job Runs, or whose request times out, is
+        split in two halves which are requested instead. Job Runs are
+        yielded from the newest windows to the oldest, once per jobId and
+        jobRunId.
+
+        Since endTimeUsecs filters on the end of the Job Runs, each window is
+        requested up to max_run_duration_usecs after its end, and the Job
+        Runs which started after its end are left to the next window. Runs
+        lasting longer may be missed. A window returning
+        max_runs_per_window Job Runs which all started after its end is
+        requested again with half that time instead of being split, since
+        splitting would not get rid of them: when more than
+        max_runs_per_window Job Runs start within max_run_duration_usecs,
+        the runs ending after the narrowed time are missed. Request such
+        clusters per Protection Job with job_ids.
+
+        Args:
+            start_time_usecs (long|int): The start of the range as a Unix
+                epoch Timestamp (in microseconds).
+            end_time_usecs (long|int, optional): The end of the range, the
+                current time when None.
+            window_usecs (long|int, optional): The initial width of the
+                windows, 7 days by default. None starts from the whole range
+                and relies on splitting alone.
+            job_ids (list of long|int, optional): Requests the windows of
+                each of these Protection Jobs separately.
+            max_workers (int, optional): The maximum number of windows
+                requested at once.
+            max_runs_per_window (int, optional): The numRuns of each request.
+            min_window_usecs (long|int, optional): The width under which
+                windows are not split, 1 minute by default.
+            max_run_duration_usecs (long|int, optional): The time requested
+                after the end of every window, 1 day by default.
+            kwargs: The other parameters of get_protection_runs.
+
+        Returns:
+            WindowPaginator of ProtectionRunInstance: The Job Runs of all the
+                windows.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        controller = self
+        policy = self.get_retry_policy()
+        if policy is not None:
+            # Windows timing out are split instead of being sent again.
+            controller = self.with_retry_policy(policy.evolve(
+                retry_statuses=policy.retry_statuses - set([504]), retry_timeouts=False))
+        return self.paginate_windows(
+            lambda start, end, num_runs, job_id: controller.get_protection_runs(
+                job_id=job_id,
+                start_time_usecs=start,
+                end_time_usecs=end,
+                num_runs=num_runs,
+                **kwargs),
+            start_time_usecs, end_time_usecs, window_usecs,
+            'backupRun.stats.startTimeUsecs', ['jobId', 'backupRun.jobRunId'],
+            job_ids, max_workers, max_runs_per_window, min_window_usecs,
+            max_run_duration_usecs)
+
     def update_protection_runs(self,
                                body):
         """Does a PUT request to /public/protectionRuns.
@@ -174,7 +273,7 @@ class ProtectionRunsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_protection_runs.')
             _url_path = '/public/protectionRuns'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -186,8 +285,8 @@ class ProtectionRunsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_protection_runs.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_protection_runs')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -235,7 +334,7 @@ class ProtectionRunsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -247,8 +346,8 @@ class ProtectionRunsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_cancel_protection_job_run.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_cancel_protection_job_run')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -309,7 +408,7 @@ class ProtectionRunsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_protection_run_errors.')
             _url_path = '/public/protectionRuns/errors'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'jobId': job_id,
@@ -319,7 +418,7 @@ class ProtectionRunsController(BaseController):
                 'paginationCookie': pagination_cookie
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -331,7 +430,7 @@ class ProtectionRunsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_run_errors.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_run_errors')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -341,8 +440,48 @@ class ProtectionRunsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionRunErrors.from_dictionary)
+            from cohesity_management_sdk.models.protection_run_errors import ProtectionRunErrors
+            return self.deserialize_response(_context, ProtectionRunErrors.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
+
+    def paginate_protection_run_errors(self,
+                                       job_id,
+                                       start_time_usecs,
+                                       task_id,
+                                       page_size=None,
+                                       prefetch=True):
+        """Iterates over all the errors of a Protection Run task returned by
+        get_protection_run_errors, following the pagination cookie of each
+        page.
+
+        The next page is requested in the background while the items of the
+        current one are consumed, unless prefetch is False.
+
+        Args:
+            job_id (long|int): The id of the Protection Job.
+            start_time_usecs (long|int): The start time of the Job Run.
+            task_id (long|int): The id of the Protection Run task.
+            page_size (int, optional): The limitNumberOfErrors of each
+                request, the default of the cluster when None.
+            prefetch (bool, optional): False to request each page only once
+                the previous one has been consumed.
+
+        Returns:
+            CookiePaginator of RequestError: The errors of all the pages.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.paginate(
+            lambda cookie, page_size: self.get_protection_run_errors(
+                job_id, start_time_usecs, task_id,
+                limit_number_of_errors=page_size,
+                pagination_cookie=cookie),
+            'errors', 'paginationCookie', page_size, prefetch)
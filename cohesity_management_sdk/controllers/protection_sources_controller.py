@@ -3,24 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.upgrade_physical_agents_message import UpgradePhysicalAgentsMessage
-from cohesity_management_sdk.models.protection_source_node import ProtectionSourceNode
-from cohesity_management_sdk.models.registered_application_server import RegisteredApplicationServer
-from cohesity_management_sdk.models.protection_source import ProtectionSource
-from cohesity_management_sdk.models.protected_vm_info import ProtectedVmInfo
-from cohesity_management_sdk.models.get_registration_info_response import GetRegistrationInfoResponse
-from cohesity_management_sdk.models.sql_aag_host_and_databases import SqlAagHostAndDatabases
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class ProtectionSourcesController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(ProtectionSourcesController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(ProtectionSourcesController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_download_physical_agent(self,
@@ -71,7 +62,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_download_physical_agent.')
             _url_path = '/public/physicalAgents/download'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'hostType': host_type,
@@ -79,7 +70,7 @@ class ProtectionSourcesController(BaseController):
                 'agentType': agent_type
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -91,7 +82,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_download_physical_agent.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_download_physical_agent')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -101,7 +92,7 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body)
+            return self.deserialize_response(_context)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -152,7 +143,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_upgrade_physical_agents.')
             _url_path = '/public/physicalAgents/upgrade'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -165,8 +156,8 @@ class ProtectionSourcesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_upgrade_physical_agents.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_upgrade_physical_agents')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -176,7 +167,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, UpgradePhysicalAgentsMessage.from_dictionary)
+            from cohesity_management_sdk.models.upgrade_physical_agents_message import UpgradePhysicalAgentsMessage
+            return self.deserialize_response(_context, UpgradePhysicalAgentsMessage.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -274,7 +266,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_protection_sources.')
             _url_path = '/public/protectionSources'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'id': id,
@@ -291,7 +283,7 @@ class ProtectionSourcesController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -303,7 +295,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_protection_sources.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_protection_sources')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -313,12 +305,124 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSourceNode.from_dictionary)
+            from cohesity_management_sdk.models.protection_source_node import ProtectionSourceNode
+            return self.deserialize_response(_context, ProtectionSourceNode.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def iter_protection_sources(self, *args, **kwargs):
+        """Streams the Protection Source trees returned by list_protection_sources.
+
+        The items of the response are yielded one at a time, as the body is
+        received. Only one item is decoded at a time, so the memory used does
+        not grow with the size of the response. The connection is held until
+        all the items have been read or the generator is closed.
+
+        Args:
+            args, kwargs: The parameters of list_protection_sources.
+
+        Returns:
+            generator of ProtectionSourceNode: The items of the response.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.streaming().list_protection_sources(*args, **kwargs)
+
+    def get_protection_source_tree(self, max_workers=None, **kwargs):
+        """Returns the hierarchy of list_protection_sources as a
+        ProtectionSourceTree, indexed by id, name, parent id and environment.
+
+        The response is read as raw JSON, each node is only decoded into a
+        model when it is read from the tree.
+
+        Args:
+            max_workers (int, optional): When set, the subtree of each root
+                Protection Source is requested separately, this many at once,
+                as done by paginate_protection_source_roots. The whole
+                hierarchy is requested at once when None.
+            kwargs: The parameters of list_protection_sources.
+
+        Returns:
+            ProtectionSourceTree: The hierarchy of the Protection Sources.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        from cohesity_management_sdk.protection_source_tree import ProtectionSourceTree
+        if max_workers:
+            tree = ProtectionSourceTree()
+            for _ in self.paginate_protection_source_roots(tree, max_workers, **kwargs):
+                pass
+            return tree
+        nodes = self.raw().list_protection_sources(**kwargs)
+        return ProtectionSourceTree(nodes)
+
+    def paginate_protection_source_roots(self,
+                                         tree=None,
+                                         max_workers=4,
+                                         environments=None,
+                                         environment=None,
+                                         **kwargs):
+        """Requests the hierarchy of list_protection_sources one root
+        Protection Source at a time, several roots in parallel.
+
+        The root Protection Sources are listed by
+        list_protection_sources_root_nodes, then the subtree of each of them
+        is requested by list_protection_sources with its id. Each response
+        only holds one registered Source, such as a vCenter, instead of all
+        of them at once. The subtrees are added to the tree and their roots
+        are yielded as they are received.
+
+        Args:
+            tree (ProtectionSourceTree, optional): The tree the subtrees are
+                added to, a new one when None.
+            max_workers (int, optional): The maximum number of subtrees
+                requested at once.
+            environments (list of EnvironmentListProtectionSourcesEnum,
+                optional): Return only the root Protection Sources that match
+                the passed in environment types, and their subtrees.
+            environment (string, optional): This field is deprecated. Use
+                environments instead.
+            kwargs: The other parameters of list_protection_sources.
+
+        Returns:
+            ShardPaginator of SourceTreeNode: The root nodes, in the order
+                their subtrees are received.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        from cohesity_management_sdk.pagination import get_path
+        from cohesity_management_sdk.protection_source_tree import ProtectionSourceTree
+        if tree is None:
+            tree = ProtectionSourceTree()
+        raw = self.raw()
+        return self.paginate_shards(
+            lambda: raw.list_protection_sources_root_nodes(
+                environments=environments, environment=environment),
+            lambda root: raw.list_protection_sources(
+                id=get_path(root, 'protectionSource.id'),
+                environments=environments,
+                environment=environment,
+                **kwargs),
+            lambda root, nodes: [tree.add(node) for node in nodes or []],
+            max_workers)
+
     def list_application_servers(self,
                                  protection_sources_root_node_id=None,
                                  environment=None,
@@ -435,7 +539,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_application_servers.')
             _url_path = '/public/protectionSources/applicationServers'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'protectionSourcesRootNodeId': protection_sources_root_node_id,
@@ -444,7 +548,7 @@ class ProtectionSourcesController(BaseController):
                 'application': application
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -456,7 +560,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_application_servers.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_application_servers')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -466,7 +570,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RegisteredApplicationServer.from_dictionary)
+            from cohesity_management_sdk.models.registered_application_server import RegisteredApplicationServer
+            return self.deserialize_response(_context, RegisteredApplicationServer.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -505,7 +610,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_register_application_servers.')
             _url_path = '/public/protectionSources/applicationServers'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -518,8 +623,8 @@ class ProtectionSourcesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_register_application_servers.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_register_application_servers')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -529,7 +634,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSource.from_dictionary)
+            from cohesity_management_sdk.models.protection_source import ProtectionSource
+            return self.deserialize_response(_context, ProtectionSource.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -566,7 +672,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_application_servers.')
             _url_path = '/public/protectionSources/applicationServers'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -579,8 +685,8 @@ class ProtectionSourcesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_application_servers.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_application_servers')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -590,7 +696,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSource.from_dictionary)
+            from cohesity_management_sdk.models.protection_source import ProtectionSource
+            return self.deserialize_response(_context, ProtectionSource.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -639,7 +746,7 @@ class ProtectionSourcesController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -652,8 +759,8 @@ class ProtectionSourcesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_unregister_application_servers.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_unregister_application_servers')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -663,7 +770,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSource.from_dictionary)
+            from cohesity_management_sdk.models.protection_source import ProtectionSource
+            return self.deserialize_response(_context, ProtectionSource.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -699,13 +807,13 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_data_store_information.')
             _url_path = '/public/protectionSources/datastores'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'sourceId': source_id
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -717,7 +825,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_data_store_information.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_data_store_information')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -727,7 +835,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSource.from_dictionary)
+            from cohesity_management_sdk.models.protection_source import ProtectionSource
+            return self.deserialize_response(_context, ProtectionSource.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -760,13 +869,13 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_protection_sources_objects.')
             _url_path = '/public/protectionSources/objects'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'objectIds': object_ids
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -778,7 +887,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_sources_objects.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_sources_objects')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -788,7 +897,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSource.from_dictionary)
+            from cohesity_management_sdk.models.protection_source import ProtectionSource
+            return self.deserialize_response(_context, ProtectionSource.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -828,7 +938,7 @@ class ProtectionSourcesController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -841,7 +951,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_sources_object_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_sources_object_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -851,7 +961,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSource.from_dictionary)
+            from cohesity_management_sdk.models.protection_source import ProtectionSource
+            return self.deserialize_response(_context, ProtectionSource.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -941,7 +1052,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_protected_objects.')
             _url_path = '/public/protectionSources/protectedObjects'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'environment': environment,
@@ -950,7 +1061,7 @@ class ProtectionSourcesController(BaseController):
                 'includeRpoSnapshots': include_rpo_snapshots
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -962,7 +1073,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_protected_objects.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_protected_objects')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -972,7 +1083,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectedVmInfo.from_dictionary)
+            from cohesity_management_sdk.models.protected_vm_info import ProtectedVmInfo
+            return self.deserialize_response(_context, ProtectedVmInfo.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1023,14 +1135,14 @@ class ProtectionSourcesController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_refresh_protection_source_by_id.')
             _request = self.http_client.post(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_refresh_protection_source_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1075,7 +1187,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_register_protection_source.')
             _url_path = '/public/protectionSources/register'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1088,8 +1200,8 @@ class ProtectionSourcesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_register_protection_source.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_register_protection_source')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1099,7 +1211,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSource.from_dictionary)
+            from cohesity_management_sdk.models.protection_source import ProtectionSource
+            return self.deserialize_response(_context, ProtectionSource.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1157,7 +1270,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_protection_sources_registration_info.')
             _url_path = '/public/protectionSources/registrationInfo'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'environments': environments,
@@ -1168,7 +1281,7 @@ class ProtectionSourcesController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -1180,7 +1293,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_protection_sources_registration_info.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_protection_sources_registration_info')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1190,7 +1303,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, GetRegistrationInfoResponse.from_dictionary)
+            from cohesity_management_sdk.models.get_registration_info_response import GetRegistrationInfoResponse
+            return self.deserialize_response(_context, GetRegistrationInfoResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1239,7 +1353,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_protection_sources_root_nodes.')
             _url_path = '/public/protectionSources/rootNodes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'id': id,
@@ -1247,7 +1361,7 @@ class ProtectionSourcesController(BaseController):
                 'environment': environment
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -1259,7 +1373,7 @@ class ProtectionSourcesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_protection_sources_root_nodes.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_protection_sources_root_nodes')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1269,7 +1383,8 @@ class ProtectionSourcesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSourceNode.from_dictionary)
+            from cohesity_management_sdk.models.protection_source_node import ProtectionSourceNode
+            return self.deserialize_response(_context, ProtectionSourceNode.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1311,13 +1426,13 @@ Success
             # Prepare query URL
             self.logger.info('Preparing query URL for list_sql_aag_hosts_and_databases.')
             _url_path = '/public/protectionSources/sqlAagHostsAndDatabases'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'sqlProtectionSourceIds': sql_protection_source_ids
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -1329,7 +1444,7 @@ Success
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_sql_aag_hosts_and_databases.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_sql_aag_hosts_and_databases')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1339,7 +1454,8 @@ Success
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, SqlAagHostAndDatabases.from_dictionary)
+            from cohesity_management_sdk.models.sql_aag_host_and_databases import SqlAagHostAndDatabases
+            return self.deserialize_response(_context, SqlAagHostAndDatabases.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1394,7 +1510,7 @@ Success
             # Prepare query URL
             self.logger.info('Preparing query URL for list_virtual_machines.')
             _url_path = '/public/protectionSources/virtualMachines'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'vCenterId': v_center_id,
@@ -1403,7 +1519,7 @@ Success
                 'protected': protected
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -1415,7 +1531,7 @@ Success
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_virtual_machines.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_virtual_machines')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1425,7 +1541,8 @@ Success
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSource.from_dictionary)
+            from cohesity_management_sdk.models.protection_source import ProtectionSource
+            return self.deserialize_response(_context, ProtectionSource.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1465,14 +1582,14 @@ Success
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_unregister_protection_source.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_unregister_protection_source')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1521,7 +1638,7 @@ Success
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1534,8 +1651,8 @@ Success
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_protection_source.')
-            _request = self.http_client.patch(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.patch(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_protection_source')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1545,7 +1662,8 @@ Success
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSourceNode.from_dictionary)
+            from cohesity_management_sdk.models.protection_source_node import ProtectionSourceNode
+            return self.deserialize_response(_context, ProtectionSourceNode.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,19 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.remote_cluster import RemoteCluster
-from cohesity_management_sdk.models.replication_encryption_key_reponse import ReplicationEncryptionKeyReponse
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class RemoteClusterController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(RemoteClusterController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(RemoteClusterController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_remote_clusters(self,
@@ -58,7 +54,7 @@ class RemoteClusterController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_remote_clusters.')
             _url_path = '/public/remoteClusters'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'clusterIds': cluster_ids,
@@ -67,7 +63,7 @@ class RemoteClusterController(BaseController):
                 'purposeRemoteAccess': purpose_remote_access
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -79,7 +75,7 @@ class RemoteClusterController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_remote_clusters.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_remote_clusters')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -89,7 +85,8 @@ class RemoteClusterController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RemoteCluster.from_dictionary)
+            from cohesity_management_sdk.models.remote_cluster import RemoteCluster
+            return self.deserialize_response(_context, RemoteCluster.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -129,7 +126,7 @@ class RemoteClusterController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_remote_cluster.')
             _url_path = '/public/remoteClusters'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -142,8 +139,8 @@ class RemoteClusterController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_remote_cluster.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_remote_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -153,7 +150,8 @@ class RemoteClusterController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RemoteCluster.from_dictionary)
+            from cohesity_management_sdk.models.remote_cluster import RemoteCluster
+            return self.deserialize_response(_context, RemoteCluster.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -192,14 +190,14 @@ class RemoteClusterController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_remote_cluster.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_remote_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -246,7 +244,7 @@ class RemoteClusterController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -259,7 +257,7 @@ class RemoteClusterController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_remote_cluster_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_remote_cluster_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -269,7 +267,8 @@ class RemoteClusterController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RemoteCluster.from_dictionary)
+            from cohesity_management_sdk.models.remote_cluster import RemoteCluster
+            return self.deserialize_response(_context, RemoteCluster.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -312,7 +311,7 @@ class RemoteClusterController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -325,8 +324,8 @@ class RemoteClusterController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_remote_cluster.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_remote_cluster')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -336,7 +335,8 @@ class RemoteClusterController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RemoteCluster.from_dictionary)
+            from cohesity_management_sdk.models.remote_cluster import RemoteCluster
+            return self.deserialize_response(_context, RemoteCluster.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -364,7 +364,7 @@ class RemoteClusterController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_replication_encryption_key.')
             _url_path = '/public/replicationEncryptionKey'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -377,7 +377,7 @@ class RemoteClusterController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_replication_encryption_key.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_replication_encryption_key')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -387,7 +387,8 @@ class RemoteClusterController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ReplicationEncryptionKeyReponse.from_dictionary)
+            from cohesity_management_sdk.models.replication_encryption_key_reponse import ReplicationEncryptionKeyReponse
+            return self.deserialize_response(_context, ReplicationEncryptionKeyReponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,22 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.remote_vault_restore_task_status import RemoteVaultRestoreTaskStatus
-from cohesity_management_sdk.models.universal_id import UniversalId
-from cohesity_management_sdk.models.remote_vault_search_job_results import RemoteVaultSearchJobResults
-from cohesity_management_sdk.models.remote_vault_search_job_information import RemoteVaultSearchJobInformation
-from cohesity_management_sdk.models.created_remote_vault_search_job_uid import CreatedRemoteVaultSearchJobUid
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class RemoteRestoreController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(RemoteRestoreController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(RemoteRestoreController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def upload_vault_encryption_keys(self,
@@ -62,7 +55,7 @@ class RemoteRestoreController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -74,8 +67,8 @@ class RemoteRestoreController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for upload_vault_encryption_keys.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'upload_vault_encryption_keys')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -115,7 +108,7 @@ class RemoteRestoreController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_remote_vault_restore_tasks.')
             _url_path = '/public/remoteVaults/restoreTasks'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -128,7 +121,7 @@ class RemoteRestoreController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_remote_vault_restore_tasks.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_remote_vault_restore_tasks')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -138,7 +131,8 @@ class RemoteRestoreController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RemoteVaultRestoreTaskStatus.from_dictionary)
+            from cohesity_management_sdk.models.remote_vault_restore_task_status import RemoteVaultRestoreTaskStatus
+            return self.deserialize_response(_context, RemoteVaultRestoreTaskStatus.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -183,7 +177,7 @@ class RemoteRestoreController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_remote_vault_restore_task.')
             _url_path = '/public/remoteVaults/restoreTasks'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -196,8 +190,8 @@ class RemoteRestoreController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_remote_vault_restore_task.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_remote_vault_restore_task')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -207,7 +201,8 @@ class RemoteRestoreController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, UniversalId.from_dictionary)
+            from cohesity_management_sdk.models.universal_id import UniversalId
+            return self.deserialize_response(_context, UniversalId.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -273,7 +268,7 @@ class RemoteRestoreController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_remote_vault_search_job_results.')
             _url_path = '/public/remoteVaults/searchJobResults'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'searchJobId': search_job_id,
@@ -284,7 +279,7 @@ class RemoteRestoreController(BaseController):
                 'cookie': cookie
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -296,7 +291,7 @@ class RemoteRestoreController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_remote_vault_search_job_results.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_remote_vault_search_job_results')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -306,7 +301,8 @@ class RemoteRestoreController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RemoteVaultSearchJobResults.from_dictionary)
+            from cohesity_management_sdk.models.remote_vault_search_job_results import RemoteVaultSearchJobResults
+            return self.deserialize_response(_context, RemoteVaultSearchJobResults.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -345,7 +341,7 @@ class RemoteRestoreController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_stop_remote_vault_search_job.')
             _url_path = '/public/remoteVaults/searchJobs'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -357,8 +353,8 @@ class RemoteRestoreController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_stop_remote_vault_search_job.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_stop_remote_vault_search_job')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -404,7 +400,7 @@ class RemoteRestoreController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_remote_vault_search_jobs.')
             _url_path = '/public/remoteVaults/searchJobs'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -417,7 +413,7 @@ class RemoteRestoreController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_remote_vault_search_jobs.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_remote_vault_search_jobs')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -427,7 +423,8 @@ class RemoteRestoreController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RemoteVaultSearchJobInformation.from_dictionary)
+            from cohesity_management_sdk.models.remote_vault_search_job_information import RemoteVaultSearchJobInformation
+            return self.deserialize_response(_context, RemoteVaultSearchJobInformation.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -476,7 +473,7 @@ class RemoteRestoreController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_remote_vault_search_job.')
             _url_path = '/public/remoteVaults/searchJobs'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -489,8 +486,8 @@ class RemoteRestoreController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_remote_vault_search_job.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_remote_vault_search_job')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -500,7 +497,8 @@ class RemoteRestoreController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, CreatedRemoteVaultSearchJobUid.from_dictionary)
+            from cohesity_management_sdk.models.created_remote_vault_search_job_uid import CreatedRemoteVaultSearchJobUid
+            return self.deserialize_response(_context, CreatedRemoteVaultSearchJobUid.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -546,7 +544,7 @@ class RemoteRestoreController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -559,7 +557,7 @@ class RemoteRestoreController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_remote_vault_search_job_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_remote_vault_search_job_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -569,7 +567,8 @@ class RemoteRestoreController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RemoteVaultSearchJobInformation.from_dictionary)
+            from cohesity_management_sdk.models.remote_vault_search_job_information import RemoteVaultSearchJobInformation
+            return self.deserialize_response(_context, RemoteVaultSearchJobInformation.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
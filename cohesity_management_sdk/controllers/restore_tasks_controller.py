@@ -3,27 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.ad_root_topology_object import AdRootTopologyObject
-from cohesity_management_sdk.models.compared_ad_object import ComparedADObject
-from cohesity_management_sdk.models.ad_object import ADObject
-from cohesity_management_sdk.models.ad_objects_restore_status import AdObjectsRestoreStatus
-from cohesity_management_sdk.models.restore_task import RestoreTask
-from cohesity_management_sdk.models.file_search_results import FileSearchResults
-from cohesity_management_sdk.models.file_snapshot_information import FileSnapshotInformation
-from cohesity_management_sdk.models.object_search_results import ObjectSearchResults
-from cohesity_management_sdk.models.virtual_disk_information import VirtualDiskInformation
-from cohesity_management_sdk.models.vm_volumes_information import VmVolumesInformation
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class RestoreTasksController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(RestoreTasksController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(RestoreTasksController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_ad_domain_root_topology(self,
@@ -56,13 +44,13 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_ad_domain_root_topology.')
             _url_path = '/public/restore/adDomainRootTopology'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'restoreTaskId': restore_task_id
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -74,7 +62,7 @@ class RestoreTasksController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_ad_domain_root_topology.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_ad_domain_root_topology')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -84,7 +72,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AdRootTopologyObject.from_dictionary)
+            from cohesity_management_sdk.models.ad_root_topology_object import AdRootTopologyObject
+            return self.deserialize_response(_context, AdRootTopologyObject.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -122,7 +111,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_compare_ad_objects.')
             _url_path = '/public/restore/adObjectAttributes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -135,8 +124,8 @@ class RestoreTasksController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_compare_ad_objects.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_compare_ad_objects')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -146,7 +135,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ComparedADObject.from_dictionary)
+            from cohesity_management_sdk.models.compared_ad_object import ComparedADObject
+            return self.deserialize_response(_context, ComparedADObject.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -220,7 +210,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for search_ad_objects.')
             _url_path = '/public/restore/adObjects'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'restoreTaskId': restore_task_id,
@@ -233,7 +223,7 @@ class RestoreTasksController(BaseController):
                 'recordOffset': record_offset
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -245,7 +235,7 @@ class RestoreTasksController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for search_ad_objects.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'search_ad_objects')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -255,7 +245,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ADObject.from_dictionary)
+            from cohesity_management_sdk.models.ad_object import ADObject
+            return self.deserialize_response(_context, ADObject.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -292,13 +283,13 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_ad_objects_restore_status.')
             _url_path = '/public/restore/adObjects/status'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'restoreTaskId': restore_task_id
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -310,7 +301,7 @@ class RestoreTasksController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_ad_objects_restore_status.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_ad_objects_restore_status')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -320,7 +311,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, AdObjectsRestoreStatus.from_dictionary)
+            from cohesity_management_sdk.models.ad_objects_restore_status import AdObjectsRestoreStatus
+            return self.deserialize_response(_context, AdObjectsRestoreStatus.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -356,7 +348,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_applications_clone_task.')
             _url_path = '/public/restore/applicationsClone'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -369,8 +361,8 @@ class RestoreTasksController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_applications_clone_task.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_applications_clone_task')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -380,7 +372,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreTask.from_dictionary)
+            from cohesity_management_sdk.models.restore_task import RestoreTask
+            return self.deserialize_response(_context, RestoreTask.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -417,7 +410,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_applications_recover_task.')
             _url_path = '/public/restore/applicationsRecover'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -430,8 +423,8 @@ class RestoreTasksController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_applications_recover_task.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_applications_recover_task')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -441,7 +434,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreTask.from_dictionary)
+            from cohesity_management_sdk.models.restore_task import RestoreTask
+            return self.deserialize_response(_context, RestoreTask.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -477,7 +471,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_clone_task.')
             _url_path = '/public/restore/clone'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -490,8 +484,8 @@ class RestoreTasksController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_clone_task.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_clone_task')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -501,7 +495,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreTask.from_dictionary)
+            from cohesity_management_sdk.models.restore_task import RestoreTask
+            return self.deserialize_response(_context, RestoreTask.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -540,14 +535,14 @@ class RestoreTasksController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_public_destroy_clone_task.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_public_destroy_clone_task')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -594,7 +589,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_deploy_task.')
             _url_path = '/public/restore/deploy'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -607,8 +602,8 @@ class RestoreTasksController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_deploy_task.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_deploy_task')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -618,7 +613,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreTask.from_dictionary)
+            from cohesity_management_sdk.models.restore_task import RestoreTask
+            return self.deserialize_response(_context, RestoreTask.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -655,7 +651,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_download_files_and_folders.')
             _url_path = '/public/restore/downloadFilesAndFolders'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -668,8 +664,8 @@ class RestoreTasksController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_download_files_and_folders.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_download_files_and_folders')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -679,7 +675,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreTask.from_dictionary)
+            from cohesity_management_sdk.models.restore_task import RestoreTask
+            return self.deserialize_response(_context, RestoreTask.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -779,7 +776,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for search_restored_files.')
             _url_path = '/public/restore/files'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'search': search,
@@ -797,7 +794,7 @@ class RestoreTasksController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -809,7 +806,7 @@ class RestoreTasksController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for search_restored_files.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'search_restored_files')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -819,12 +816,47 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, FileSearchResults.from_dictionary)
+            from cohesity_management_sdk.models.file_search_results import FileSearchResults
+            return self.deserialize_response(_context, FileSearchResults.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def paginate_restored_files(self,
+                                page_size=None,
+                                max_workers=4,
+                                **kwargs):
+        """Iterates over all the files and folders matching the filter
+        criteria of search_restored_files.
+
+        The first page gives the total count of items. The other pages are
+        then requested in parallel, at most max_workers at once, and their
+        items are yielded in order.
+
+        Args:
+            page_size (int, optional): The pageCount of each request, the
+                default of the cluster when None.
+            max_workers (int, optional): The maximum number of pages
+                requested at once.
+            kwargs: The other parameters of search_restored_files, except startIndex.
+
+        Returns:
+            OffsetPaginator of FileSearchResult: The files and folders of all the pages.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.paginate_offsets(
+            lambda start_index, page_size: self.search_restored_files(start_index=start_index,
+                                                                      page_count=page_size,
+                                                                      **kwargs),
+            'files', 'totalCount', page_size, max_workers)
+
     def create_restore_files_task(self,
                                   body):
         """Does a POST request to /public/restore/files.
@@ -855,7 +887,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_restore_files_task.')
             _url_path = '/public/restore/files'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -868,8 +900,8 @@ class RestoreTasksController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_restore_files_task.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_restore_files_task')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -879,7 +911,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreTask.from_dictionary)
+            from cohesity_management_sdk.models.restore_task import RestoreTask
+            return self.deserialize_response(_context, RestoreTask.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -939,7 +972,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_file_snapshots_information.')
             _url_path = '/public/restore/files/snapshotsInformation'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'jobId': job_id,
@@ -949,7 +982,7 @@ class RestoreTasksController(BaseController):
                 'filename': filename
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -961,7 +994,7 @@ class RestoreTasksController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_file_snapshots_information.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_file_snapshots_information')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -971,7 +1004,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, FileSnapshotInformation.from_dictionary)
+            from cohesity_management_sdk.models.file_snapshot_information import FileSnapshotInformation
+            return self.deserialize_response(_context, FileSnapshotInformation.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1078,7 +1112,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for search_objects.')
             _url_path = '/public/restore/objects'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'search': search,
@@ -1097,7 +1131,7 @@ class RestoreTasksController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -1109,7 +1143,7 @@ class RestoreTasksController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for search_objects.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'search_objects')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1119,12 +1153,72 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ObjectSearchResults.from_dictionary)
+            from cohesity_management_sdk.models.object_search_results import ObjectSearchResults
+            return self.deserialize_response(_context, ObjectSearchResults.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def iter_objects(self, *args, **kwargs):
+        """Streams the objects found by search_objects.
+
+        The items of the objectSnapshotInfo array of the response are yielded
+        one at a time, as the body is received. Only one item is decoded at a
+        time, so the memory used does not grow with the size of the response.
+        The connection is held until all the items have been read or the
+        generator is closed.
+
+        Args:
+            args, kwargs: The parameters of search_objects.
+
+        Returns:
+            generator of ObjectSnapshotInfo: The items of the response.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        from cohesity_management_sdk.models.object_snapshot_info import ObjectSnapshotInfo
+        return self.streaming(['objectSnapshotInfo'], ObjectSnapshotInfo.from_dictionary).search_objects(*args, **kwargs)
+
+    def paginate_objects(self,
+                         page_size=None,
+                         max_workers=4,
+                         **kwargs):
+        """Iterates over all the objects matching the filter criteria of
+        search_objects.
+
+        The first page gives the total count of items. The other pages are
+        then requested in parallel, at most max_workers at once, and their
+        items are yielded in order.
+
+        Args:
+            page_size (int, optional): The pageCount of each request, the
+                default of the cluster when None.
+            max_workers (int, optional): The maximum number of pages
+                requested at once.
+            kwargs: The other parameters of search_objects, except startIndex.
+
+        Returns:
+            OffsetPaginator of ObjectSnapshotInfo: The objects of all the pages.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.paginate_offsets(
+            lambda start_index, page_size: self.search_objects(start_index=start_index,
+                                                               page_count=page_size,
+                                                               **kwargs),
+            'objectSnapshotInfo', 'totalCount', page_size, max_workers)
+
     def get_outlook_emails(self,
                            has_attachments=None,
                            sender_address=None,
@@ -1203,7 +1297,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_outlook_emails.')
             _url_path = '/public/restore/office365/outlook/emails'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'hasAttachments': has_attachments,
@@ -1225,7 +1319,7 @@ class RestoreTasksController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -1237,7 +1331,7 @@ class RestoreTasksController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_outlook_emails.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_outlook_emails')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1247,7 +1341,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, FileSearchResults.from_dictionary)
+            from cohesity_management_sdk.models.file_search_results import FileSearchResults
+            return self.deserialize_response(_context, FileSearchResults.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1302,7 +1397,7 @@ class RestoreTasksController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_recover_task.')
             _url_path = '/public/restore/recover'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1315,8 +1410,8 @@ class RestoreTasksController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_recover_task.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_recover_task')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1326,7 +1421,8 @@ class RestoreTasksController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreTask.from_dictionary)
+            from cohesity_management_sdk.models.restore_task import RestoreTask
+            return self.deserialize_response(_context, RestoreTask.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1366,7 +1462,7 @@ Success
             # Prepare query URL
             self.logger.info('Preparing query URL for update_restore_task.')
             _url_path = '/public/restore/recover'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1379,8 +1475,8 @@ Success
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_restore_task.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_restore_task')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1390,7 +1486,8 @@ Success
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreTask.from_dictionary)
+            from cohesity_management_sdk.models.restore_task import RestoreTask
+            return self.deserialize_response(_context, RestoreTask.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1488,7 +1585,7 @@ Success
             # Prepare query URL
             self.logger.info('Preparing query URL for get_restore_tasks.')
             _url_path = '/public/restore/tasks'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'taskIds': task_ids,
@@ -1499,7 +1596,7 @@ Success
                 'environment': environment
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -1511,7 +1608,7 @@ Success
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_restore_tasks.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_restore_tasks')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1521,7 +1618,8 @@ Success
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreTask.from_dictionary)
+            from cohesity_management_sdk.models.restore_task import RestoreTask
+            return self.deserialize_response(_context, RestoreTask.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1559,14 +1657,14 @@ Success
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_cancel_restore_task.')
             _request = self.http_client.put(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_cancel_restore_task')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1612,7 +1710,7 @@ Success
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1625,7 +1723,7 @@ Success
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_restore_task_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_restore_task_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1635,7 +1733,8 @@ Success
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreTask.from_dictionary)
+            from cohesity_management_sdk.models.restore_task import RestoreTask
+            return self.deserialize_response(_context, RestoreTask.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1691,7 +1790,7 @@ Success
             # Prepare query URL
             self.logger.info('Preparing query URL for get_virtual_disk_information.')
             _url_path = '/public/restore/virtualDiskInformation'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'clusterId': cluster_id,
@@ -1702,7 +1801,7 @@ Success
                 'sourceId': source_id
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -1714,7 +1813,7 @@ Success
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_virtual_disk_information.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_virtual_disk_information')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1724,7 +1823,8 @@ Success
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, VirtualDiskInformation.from_dictionary)
+            from cohesity_management_sdk.models.virtual_disk_information import VirtualDiskInformation
+            return self.deserialize_response(_context, VirtualDiskInformation.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1812,7 +1912,7 @@ Success
             # Prepare query URL
             self.logger.info('Preparing query URL for get_vm_volumes_information.')
             _url_path = '/public/restore/vms/volumesInformation'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'jobId': job_id,
@@ -1826,7 +1926,7 @@ Success
                 'supportedVolumesOnly': supported_volumes_only
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -1838,7 +1938,7 @@ Success
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_vm_volumes_information.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_vm_volumes_information')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1848,7 +1948,8 @@ Success
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, VmVolumesInformation.from_dictionary)
+            from cohesity_management_sdk.models.vm_volumes_information import VmVolumesInformation
+            return self.deserialize_response(_context, VmVolumesInformation.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
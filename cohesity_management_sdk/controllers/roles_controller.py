@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.role import Role
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class RolesController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(RolesController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(RolesController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def delete_roles(self,
@@ -43,7 +40,7 @@ class RolesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_roles.')
             _url_path = '/public/roles'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -55,8 +52,8 @@ class RolesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_roles.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_roles')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -107,7 +104,7 @@ class RolesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_roles.')
             _url_path = '/public/roles'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'name': name,
@@ -115,7 +112,7 @@ class RolesController(BaseController):
                 'allUnderHierarchy': all_under_hierarchy
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -127,7 +124,7 @@ class RolesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_roles.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_roles')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -137,7 +134,8 @@ class RolesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Role.from_dictionary)
+            from cohesity_management_sdk.models.role import Role
+            return self.deserialize_response(_context, Role.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -172,7 +170,7 @@ class RolesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_role.')
             _url_path = '/public/roles'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -185,8 +183,8 @@ class RolesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_role.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_role')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -196,7 +194,8 @@ class RolesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Role.from_dictionary)
+            from cohesity_management_sdk.models.role import Role
+            return self.deserialize_response(_context, Role.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -238,7 +237,7 @@ class RolesController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -251,8 +250,8 @@ class RolesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_role.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_role')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -262,7 +261,8 @@ class RolesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Role.from_dictionary)
+            from cohesity_management_sdk.models.role import Role
+            return self.deserialize_response(_context, Role.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
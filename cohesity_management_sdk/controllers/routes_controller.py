@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.route import Route
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class RoutesController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(RoutesController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(RoutesController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def delete_route(self,
@@ -43,7 +40,7 @@ class RoutesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_route.')
             _url_path = '/public/routes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -55,8 +52,8 @@ class RoutesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_route.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_route')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -90,7 +87,7 @@ class RoutesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_routes.')
             _url_path = '/public/routes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -103,7 +100,7 @@ class RoutesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_routes.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_routes')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -113,7 +110,8 @@ class RoutesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Route.from_dictionary)
+            from cohesity_management_sdk.models.route import Route
+            return self.deserialize_response(_context, Route.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -144,7 +142,7 @@ class RoutesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for add_route.')
             _url_path = '/public/routes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -157,8 +155,8 @@ class RoutesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for add_route.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'add_route')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -168,7 +166,8 @@ class RoutesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Route.from_dictionary)
+            from cohesity_management_sdk.models.route import Route
+            return self.deserialize_response(_context, Route.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
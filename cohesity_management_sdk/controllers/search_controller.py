@@ -3,19 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.protection_run_response import ProtectionRunResponse
-from cohesity_management_sdk.models.protection_source_response import ProtectionSourceResponse
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class SearchController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(SearchController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(SearchController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def search_protection_runs(self,
@@ -49,13 +45,13 @@ class SearchController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for search_protection_runs.')
             _url_path = '/public/search/protectionRuns'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'uuid': uuid
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -67,7 +63,7 @@ class SearchController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for search_protection_runs.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'search_protection_runs')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -77,7 +73,8 @@ class SearchController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionRunResponse.from_dictionary)
+            from cohesity_management_sdk.models.protection_run_response import ProtectionRunResponse
+            return self.deserialize_response(_context, ProtectionRunResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -191,7 +188,7 @@ class SearchController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for search_protection_sources.')
             _url_path = '/public/search/protectionSources'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'searchString': search_string,
@@ -204,7 +201,7 @@ class SearchController(BaseController):
                 'pageCount': page_count
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -216,7 +213,7 @@ class SearchController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for search_protection_sources.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'search_protection_sources')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -226,7 +223,8 @@ class SearchController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionSourceResponse.from_dictionary)
+            from cohesity_management_sdk.models.protection_source_response import ProtectionSourceResponse
+            return self.deserialize_response(_context, ProtectionSourceResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
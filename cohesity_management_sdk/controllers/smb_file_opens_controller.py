@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.smb_active_file_opens_response import SmbActiveFileOpensResponse
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class SMBFileOpensController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(SMBFileOpensController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(SMBFileOpensController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_smb_file_opens(self,
@@ -63,7 +60,7 @@ class SMBFileOpensController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_smb_file_opens.')
             _url_path = '/public/smbFileOpens'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'filePath': file_path,
@@ -72,7 +69,7 @@ class SMBFileOpensController(BaseController):
                 'cookie': cookie
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -84,7 +81,7 @@ class SMBFileOpensController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_smb_file_opens.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_smb_file_opens')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -94,12 +91,46 @@ class SMBFileOpensController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, SmbActiveFileOpensResponse.from_dictionary)
+            from cohesity_management_sdk.models.smb_active_file_opens_response import SmbActiveFileOpensResponse
+            return self.deserialize_response(_context, SmbActiveFileOpensResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def paginate_smb_file_opens(self,
+                                page_size=None,
+                                prefetch=True,
+                                **kwargs):
+        """Iterates over all the active SMB file opens returned by
+        get_smb_file_opens, following the cookie of each page.
+
+        The next page is requested in the background while the items of the
+        current one are consumed, unless prefetch is False.
+
+        Args:
+            page_size (int, optional): The pageCount of each request, the
+                default of the cluster when None.
+            prefetch (bool, optional): False to request each page only once
+                the previous one has been consumed.
+            kwargs: The other parameters of get_smb_file_opens.
+
+        Returns:
+            CookiePaginator of SmbActiveFilePath: The active file paths of all the pages.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.paginate(
+            lambda cookie, page_size: self.get_smb_file_opens(cookie=cookie,
+                                                              page_count=page_size,
+                                                              **kwargs),
+            'activeFilePaths', 'cookie', page_size, prefetch)
+
     def create_close_smb_file_open(self,
                                    body):
         """Does a POST request to /public/smbFileOpens.
@@ -130,7 +161,7 @@ class SMBFileOpensController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_close_smb_file_open.')
             _url_path = '/public/smbFileOpens'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -142,8 +173,8 @@ class SMBFileOpensController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_close_smb_file_open.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_close_smb_file_open')
 
             # Endpoint and global error handling using HTTP status codes.
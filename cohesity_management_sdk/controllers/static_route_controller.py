@@ -3,18 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.static_route import StaticRoute
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class StaticRouteController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(StaticRouteController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(StaticRouteController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_static_routes(self):
@@ -38,7 +35,7 @@ class StaticRouteController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_static_routes.')
             _url_path = '/public/staticRoutes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -51,7 +48,7 @@ class StaticRouteController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_static_routes.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_static_routes')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -61,7 +58,8 @@ class StaticRouteController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, StaticRoute.from_dictionary)
+            from cohesity_management_sdk.models.static_route import StaticRoute
+            return self.deserialize_response(_context, StaticRoute.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -100,14 +98,14 @@ class StaticRouteController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'ip': ip
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for remove_static_route.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'remove_static_route')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -156,7 +154,7 @@ class StaticRouteController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'ip': ip
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -169,8 +167,8 @@ class StaticRouteController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_static_route.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_static_route')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -180,7 +178,8 @@ class StaticRouteController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, StaticRoute.from_dictionary)
+            from cohesity_management_sdk.models.static_route import StaticRoute
+            return self.deserialize_response(_context, StaticRoute.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
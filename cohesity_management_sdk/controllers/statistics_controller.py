@@ -3,22 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.entity_proto import EntityProto
-from cohesity_management_sdk.models.entity_schema_proto import EntitySchemaProto
-from cohesity_management_sdk.models.time_series_schema_response import TimeSeriesSchemaResponse
-from cohesity_management_sdk.models.metric_data_block import MetricDataBlock
-from cohesity_management_sdk.models.task import Task
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class StatisticsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(StatisticsController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(StatisticsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_entities(self,
@@ -64,7 +57,7 @@ class StatisticsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_entities.')
             _url_path = '/public/statistics/entities'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'schemaName': schema_name,
@@ -72,7 +65,7 @@ class StatisticsController(BaseController):
                 'metricNames': metric_names
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -84,7 +77,7 @@ class StatisticsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_entities.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_entities')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -94,7 +87,8 @@ class StatisticsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, EntityProto.from_dictionary)
+            from cohesity_management_sdk.models.entity_proto import EntityProto
+            return self.deserialize_response(_context, EntityProto.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -149,14 +143,14 @@ class StatisticsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_entities_schema.')
             _url_path = '/public/statistics/entitiesSchema'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'schemaNames': schema_names,
                 'metricNames': metric_names
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -168,7 +162,7 @@ class StatisticsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_entities_schema.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_entities_schema')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -178,7 +172,8 @@ class StatisticsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, EntitySchemaProto.from_dictionary)
+            from cohesity_management_sdk.models.entity_schema_proto import EntitySchemaProto
+            return self.deserialize_response(_context, EntitySchemaProto.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -228,7 +223,7 @@ class StatisticsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'schemaName': schema_name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -241,7 +236,7 @@ class StatisticsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_entity_schema_by_name.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_entity_schema_by_name')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -251,7 +246,8 @@ class StatisticsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, EntitySchemaProto.from_dictionary)
+            from cohesity_management_sdk.models.entity_schema_proto import EntitySchemaProto
+            return self.deserialize_response(_context, EntitySchemaProto.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -298,7 +294,7 @@ class StatisticsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_time_series_schema.')
             _url_path = '/public/statistics/timeSeriesSchema'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'entityType': entity_type,
@@ -306,7 +302,7 @@ class StatisticsController(BaseController):
                 'entityName': entity_name
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -318,7 +314,7 @@ class StatisticsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_time_series_schema.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_time_series_schema')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -328,7 +324,8 @@ class StatisticsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, TimeSeriesSchemaResponse.from_dictionary)
+            from cohesity_management_sdk.models.time_series_schema_response import TimeSeriesSchemaResponse
+            return self.deserialize_response(_context, TimeSeriesSchemaResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -417,7 +414,7 @@ class StatisticsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_time_series_stats.')
             _url_path = '/public/statistics/timeSeriesStats'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'schemaName': schema_name,
@@ -430,7 +427,7 @@ class StatisticsController(BaseController):
                 'rollupIntervalSecs': rollup_interval_secs
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -442,7 +439,7 @@ class StatisticsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_time_series_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_time_series_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -452,7 +449,8 @@ class StatisticsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, MetricDataBlock.from_dictionary)
+            from cohesity_management_sdk.models.metric_data_block import MetricDataBlock
+            return self.deserialize_response(_context, MetricDataBlock.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -515,7 +513,7 @@ class StatisticsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_tasks.')
             _url_path = '/public/tasks/status'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'taskPaths': task_paths,
@@ -527,7 +525,7 @@ class StatisticsController(BaseController):
                 'attributes': attributes
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -539,7 +537,7 @@ class StatisticsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_tasks.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_tasks')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -549,7 +547,8 @@ class StatisticsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Task.from_dictionary)
+            from cohesity_management_sdk.models.task import Task
+            return self.deserialize_response(_context, Task.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,24 +3,7 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.active_alerts_stats import ActiveAlertsStats
-from cohesity_management_sdk.models.get_consumer_stats_result import GetConsumerStatsResult
-from cohesity_management_sdk.models.file_distribution_stats import FileDistributionStats
-from cohesity_management_sdk.models.protection_runs_stats import ProtectionRunsStats
-from cohesity_management_sdk.models.last_protection_run_stats import LastProtectionRunStats
-from cohesity_management_sdk.models.protected_objects_summary import ProtectedObjectsSummary
-from cohesity_management_sdk.models.restore_stats import RestoreStats
-from cohesity_management_sdk.models.storage_stats import StorageStats
-from cohesity_management_sdk.models.get_tenant_stats_result import GetTenantStatsResult
-from cohesity_management_sdk.models.vault_stats import VaultStats
-from cohesity_management_sdk.models.vault_provider_stats_info import VaultProviderStatsInfo
-from cohesity_management_sdk.models.vault_run_stats_summary import VaultRunStatsSummary
-from cohesity_management_sdk.models.get_view_box_stats_result import GetViewBoxStatsResult
-from cohesity_management_sdk.models.view_stats_snapshot import ViewStatsSnapshot
-from cohesity_management_sdk.models.view_protocol_stats import ViewProtocolStats
 from cohesity_management_sdk.exceptions.error_exception import ErrorException
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
@@ -28,8 +11,8 @@ class StatsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(StatsController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(StatsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_active_alerts_stats(self,
@@ -69,14 +52,14 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_active_alerts_stats.')
             _url_path = '/public/stats/alerts'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'startTimeUsecs': start_time_usecs,
                 'endTimeUsecs': end_time_usecs
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -88,7 +71,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_active_alerts_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_active_alerts_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -98,7 +81,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ActiveAlertsStats.from_dictionary)
+            from cohesity_management_sdk.models.active_alerts_stats import ActiveAlertsStats
+            return self.deserialize_response(_context, ActiveAlertsStats.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -154,7 +138,7 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_consumer_stats.')
             _url_path = '/public/stats/consumers'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'consumerType': consumer_type,
@@ -165,7 +149,7 @@ class StatsController(BaseController):
                 'organizationsIdList': organizations_id_list
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -177,7 +161,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_consumer_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_consumer_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -187,12 +171,46 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, GetConsumerStatsResult.from_dictionary)
+            from cohesity_management_sdk.models.get_consumer_stats_result import GetConsumerStatsResult
+            return self.deserialize_response(_context, GetConsumerStatsResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def paginate_consumer_stats(self,
+                                page_size=None,
+                                prefetch=True,
+                                **kwargs):
+        """Iterates over all the consumer stats returned by
+        get_consumer_stats, following the cookie of each page.
+
+        The next page is requested in the background while the items of the
+        current one are consumed, unless prefetch is False.
+
+        Args:
+            page_size (int, optional): The maxCount of each request, the
+                default of the cluster when None.
+            prefetch (bool, optional): False to request each page only once
+                the previous one has been consumed.
+            kwargs: The other parameters of get_consumer_stats.
+
+        Returns:
+            CookiePaginator of ConsumerStats: The stats of all the pages.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.paginate(
+            lambda cookie, page_size: self.get_consumer_stats(cookie=cookie,
+                                                              max_count=page_size,
+                                                              **kwargs),
+            'statsList', 'cookie', page_size, prefetch)
+
     def get_file_distribution_stats(self,
                                     entity_type):
         """Does a GET request to /public/stats/files.
@@ -225,13 +243,13 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_file_distribution_stats.')
             _url_path = '/public/stats/files'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'entityType': entity_type
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -243,7 +261,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_file_distribution_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_file_distribution_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -253,7 +271,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, FileDistributionStats.from_dictionary)
+            from cohesity_management_sdk.models.file_distribution_stats import FileDistributionStats
+            return self.deserialize_response(_context, FileDistributionStats.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -301,7 +320,7 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_protection_runs_stats.')
             _url_path = '/public/stats/protectionRuns'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'status': status,
@@ -309,7 +328,7 @@ class StatsController(BaseController):
                 'endTimeUsecs': end_time_usecs
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -321,7 +340,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protection_runs_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protection_runs_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -331,7 +350,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectionRunsStats.from_dictionary)
+            from cohesity_management_sdk.models.protection_runs_stats import ProtectionRunsStats
+            return self.deserialize_response(_context, ProtectionRunsStats.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -358,7 +378,7 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_last_protection_run_stats.')
             _url_path = '/public/stats/protectionRuns/lastRun'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -371,7 +391,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_last_protection_run_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_last_protection_run_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -381,7 +401,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, LastProtectionRunStats.from_dictionary)
+            from cohesity_management_sdk.models.last_protection_run_stats import LastProtectionRunStats
+            return self.deserialize_response(_context, LastProtectionRunStats.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -413,13 +434,13 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_protected_objects_summary.')
             _url_path = '/public/stats/protectionSummary'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'excludeTypes': exclude_types
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -431,7 +452,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_protected_objects_summary.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_protected_objects_summary')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -441,7 +462,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ProtectedObjectsSummary.from_dictionary)
+            from cohesity_management_sdk.models.protected_objects_summary import ProtectedObjectsSummary
+            return self.deserialize_response(_context, ProtectedObjectsSummary.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -483,14 +505,14 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_restore_stats.')
             _url_path = '/public/stats/restores'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'startTimeUsecs': start_time_usecs,
                 'endTimeUsecs': end_time_usecs
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -502,7 +524,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_restore_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_restore_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -512,7 +534,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, RestoreStats.from_dictionary)
+            from cohesity_management_sdk.models.restore_stats import RestoreStats
+            return self.deserialize_response(_context, RestoreStats.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -539,7 +562,7 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_storage_stats.')
             _url_path = '/public/stats/storage'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -552,7 +575,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_storage_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_storage_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -562,7 +585,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, StorageStats.from_dictionary)
+            from cohesity_management_sdk.models.storage_stats import StorageStats
+            return self.deserialize_response(_context, StorageStats.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -615,7 +639,7 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_tenant_stats.')
             _url_path = '/public/stats/tenants'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'consumerType': consumer_type,
@@ -625,7 +649,7 @@ class StatsController(BaseController):
                 'organizationsIdList': organizations_id_list
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -637,7 +661,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_tenant_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_tenant_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -647,7 +671,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, GetTenantStatsResult.from_dictionary)
+            from cohesity_management_sdk.models.get_tenant_stats_result import GetTenantStatsResult
+            return self.deserialize_response(_context, GetTenantStatsResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -674,7 +699,7 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_vault_stats.')
             _url_path = '/public/stats/vaults'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -687,7 +712,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_vault_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_vault_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -697,7 +722,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, VaultStats.from_dictionary)
+            from cohesity_management_sdk.models.vault_stats import VaultStats
+            return self.deserialize_response(_context, VaultStats.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -733,13 +759,13 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_vault_provider_stats.')
             _url_path = '/public/stats/vaults/providers'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'runType': run_type
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -751,7 +777,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_vault_provider_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_vault_provider_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -761,7 +787,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, VaultProviderStatsInfo.from_dictionary)
+            from cohesity_management_sdk.models.vault_provider_stats_info import VaultProviderStatsInfo
+            return self.deserialize_response(_context, VaultProviderStatsInfo.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -811,7 +838,7 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_vault_run_stats.')
             _url_path = '/public/stats/vaults/runs'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'runType': run_type,
@@ -820,7 +847,7 @@ class StatsController(BaseController):
                 'interval': interval
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -832,7 +859,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_vault_run_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_vault_run_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -842,7 +869,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, VaultRunStatsSummary.from_dictionary)
+            from cohesity_management_sdk.models.vault_run_stats_summary import VaultRunStatsSummary
+            return self.deserialize_response(_context, VaultRunStatsSummary.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -877,14 +905,14 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_view_box_stats.')
             _url_path = '/public/stats/viewBoxes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'viewBoxesIdList': view_boxes_id_list,
                 'organizationsIdList': organizations_id_list
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -896,7 +924,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_view_box_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_view_box_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -906,7 +934,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, GetViewBoxStatsResult.from_dictionary)
+            from cohesity_management_sdk.models.get_view_box_stats_result import GetViewBoxStatsResult
+            return self.deserialize_response(_context, GetViewBoxStatsResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -945,14 +974,14 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_view_stats.')
             _url_path = '/public/stats/views'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'metric': metric,
                 'numTopViews': num_top_views
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -964,7 +993,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_view_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_view_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -974,7 +1003,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ViewStatsSnapshot.from_dictionary)
+            from cohesity_management_sdk.models.view_stats_snapshot import ViewStatsSnapshot
+            return self.deserialize_response(_context, ViewStatsSnapshot.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1001,7 +1031,7 @@ class StatsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_view_protocol_stats.')
             _url_path = '/public/stats/views/protocols'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1014,7 +1044,7 @@ class StatsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_view_protocol_stats.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_view_protocol_stats')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1024,7 +1054,8 @@ class StatsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ViewProtocolStats.from_dictionary)
+            from cohesity_management_sdk.models.view_protocol_stats import ViewProtocolStats
+            return self.deserialize_response(_context, ViewProtocolStats.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
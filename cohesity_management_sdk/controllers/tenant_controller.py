@@ -3,29 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.tenant import Tenant
-from cohesity_management_sdk.models.tenant_active_directory_update import TenantActiveDirectoryUpdate
-from cohesity_management_sdk.models.tenant_entity_update import TenantEntityUpdate
-from cohesity_management_sdk.models.group import Group
-from cohesity_management_sdk.models.tenant_ldap_provider_update import TenantLdapProviderUpdate
-from cohesity_management_sdk.models.tenant_protection_policy_update import TenantProtectionPolicyUpdate
-from cohesity_management_sdk.models.tenant_protection_job_update import TenantProtectionJobUpdate
-from cohesity_management_sdk.models.tenant_proxy import TenantProxy
-from cohesity_management_sdk.models.user import User
-from cohesity_management_sdk.models.tenant_view_update import TenantViewUpdate
-from cohesity_management_sdk.models.tenant_view_box_update import TenantViewBoxUpdate
-from cohesity_management_sdk.models.tenant_vlan_update import TenantVlanUpdate
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class TenantController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(TenantController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(TenantController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def delete_tenant(self,
@@ -54,7 +40,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_tenant.')
             _url_path = '/public/tenants'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -68,7 +54,7 @@ class TenantController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_tenant.')
             _request = self.http_client.delete(_query_url, headers=_headers, parameters=tenant_id)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_tenant')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -78,7 +64,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Tenant.from_dictionary)
+            from cohesity_management_sdk.models.tenant import Tenant
+            return self.deserialize_response(_context, Tenant.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -127,7 +114,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_tenants.')
             _url_path = '/public/tenants'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'ids': ids,
@@ -137,7 +124,7 @@ class TenantController(BaseController):
                 'status': status
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -149,7 +136,7 @@ class TenantController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_tenants.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_tenants')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -159,7 +146,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Tenant.from_dictionary)
+            from cohesity_management_sdk.models.tenant import Tenant
+            return self.deserialize_response(_context, Tenant.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -195,7 +183,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_tenant.')
             _url_path = '/public/tenants'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -208,8 +196,8 @@ class TenantController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_tenant.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_tenant')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -219,7 +207,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Tenant.from_dictionary)
+            from cohesity_management_sdk.models.tenant import Tenant
+            return self.deserialize_response(_context, Tenant.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -250,7 +239,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_tenant.')
             _url_path = '/public/tenants'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -263,8 +252,8 @@ class TenantController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_tenant.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_tenant')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -274,7 +263,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Tenant.from_dictionary)
+            from cohesity_management_sdk.models.tenant import Tenant
+            return self.deserialize_response(_context, Tenant.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -309,7 +299,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_tenant_active_directory.')
             _url_path = '/public/tenants/activeDirectory'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -322,8 +312,8 @@ class TenantController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_tenant_active_directory.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_tenant_active_directory')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -333,7 +323,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, TenantActiveDirectoryUpdate.from_dictionary)
+            from cohesity_management_sdk.models.tenant_active_directory_update import TenantActiveDirectoryUpdate
+            return self.deserialize_response(_context, TenantActiveDirectoryUpdate.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -368,7 +359,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_tenant_entity.')
             _url_path = '/public/tenants/entity'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -381,8 +372,8 @@ class TenantController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_tenant_entity.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_tenant_entity')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -392,7 +383,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, TenantEntityUpdate.from_dictionary)
+            from cohesity_management_sdk.models.tenant_entity_update import TenantEntityUpdate
+            return self.deserialize_response(_context, TenantEntityUpdate.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -421,7 +413,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_tenant_groups.')
             _url_path = '/public/tenants/groups'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -434,7 +426,7 @@ class TenantController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_tenant_groups.')
             _request = self.http_client.put(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_tenant_groups')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -444,7 +436,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Group.from_dictionary)
+            from cohesity_management_sdk.models.group import Group
+            return self.deserialize_response(_context, Group.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -479,7 +472,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_tenant_ldap_provider.')
             _url_path = '/public/tenants/ldapProvider'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -492,8 +485,8 @@ class TenantController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_tenant_ldap_provider.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_tenant_ldap_provider')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -503,7 +496,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, TenantLdapProviderUpdate.from_dictionary)
+            from cohesity_management_sdk.models.tenant_ldap_provider_update import TenantLdapProviderUpdate
+            return self.deserialize_response(_context, TenantLdapProviderUpdate.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -538,7 +532,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_tenant_protection_policy.')
             _url_path = '/public/tenants/policy'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -551,8 +545,8 @@ class TenantController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_tenant_protection_policy.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_tenant_protection_policy')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -562,7 +556,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, TenantProtectionPolicyUpdate.from_dictionary)
+            from cohesity_management_sdk.models.tenant_protection_policy_update import TenantProtectionPolicyUpdate
+            return self.deserialize_response(_context, TenantProtectionPolicyUpdate.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -597,7 +592,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_tenant_protection_job.')
             _url_path = '/public/tenants/protectionJob'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -610,8 +605,8 @@ class TenantController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_tenant_protection_job.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_tenant_protection_job')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -621,7 +616,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, TenantProtectionJobUpdate.from_dictionary)
+            from cohesity_management_sdk.models.tenant_protection_job_update import TenantProtectionJobUpdate
+            return self.deserialize_response(_context, TenantProtectionJobUpdate.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -654,13 +650,13 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_tenants_proxies.')
             _url_path = '/public/tenants/proxies'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'ids': ids
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -672,7 +668,7 @@ class TenantController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_tenants_proxies.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_tenants_proxies')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -682,7 +678,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, TenantProxy.from_dictionary)
+            from cohesity_management_sdk.models.tenant_proxy import TenantProxy
+            return self.deserialize_response(_context, TenantProxy.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -710,7 +707,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_tenants_proxy_config_request.')
             _url_path = '/public/tenants/proxy/config'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -723,7 +720,7 @@ class TenantController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_tenants_proxy_config_request.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_tenants_proxy_config_request')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -733,7 +730,7 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body)
+            return self.deserialize_response(_context)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -765,13 +762,13 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_download_tenants_proxy.')
             _url_path = '/public/tenants/proxy/image'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'id': id
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -783,7 +780,7 @@ class TenantController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_download_tenants_proxy.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_download_tenants_proxy')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -793,7 +790,7 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body)
+            return self.deserialize_response(_context)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -827,7 +824,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_tenant_users.')
             _url_path = '/public/tenants/users'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -840,8 +837,8 @@ class TenantController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_tenant_users.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_tenant_users')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -851,7 +848,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, User.from_dictionary)
+            from cohesity_management_sdk.models.user import User
+            return self.deserialize_response(_context, User.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -886,7 +884,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_tenant_view.')
             _url_path = '/public/tenants/view'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -899,8 +897,8 @@ class TenantController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_tenant_view.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_tenant_view')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -910,7 +908,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, TenantViewUpdate.from_dictionary)
+            from cohesity_management_sdk.models.tenant_view_update import TenantViewUpdate
+            return self.deserialize_response(_context, TenantViewUpdate.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -945,7 +944,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_tenant_view_box.')
             _url_path = '/public/tenants/viewBox'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -958,8 +957,8 @@ class TenantController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_tenant_view_box.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_tenant_view_box')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -969,7 +968,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, TenantViewBoxUpdate.from_dictionary)
+            from cohesity_management_sdk.models.tenant_view_box_update import TenantViewBoxUpdate
+            return self.deserialize_response(_context, TenantViewBoxUpdate.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1003,7 +1003,7 @@ class TenantController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_tenant_vlan.')
             _url_path = '/public/tenants/vlan'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1016,8 +1016,8 @@ class TenantController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_tenant_vlan.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_tenant_vlan')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1027,7 +1027,8 @@ class TenantController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, TenantVlanUpdate.from_dictionary)
+            from cohesity_management_sdk.models.tenant_vlan_update import TenantVlanUpdate
+            return self.deserialize_response(_context, TenantVlanUpdate.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
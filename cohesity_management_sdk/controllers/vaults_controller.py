@@ -3,21 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.vault import Vault
-from cohesity_management_sdk.models.tape_media_information import TapeMediaInformation
-from cohesity_management_sdk.models.vault_bandwidth_limits import VaultBandwidthLimits
-from cohesity_management_sdk.models.vault_encryption_key import VaultEncryptionKey
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class VaultsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(VaultsController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(VaultsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_vaults(self,
@@ -57,7 +51,7 @@ class VaultsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_vaults.')
             _url_path = '/public/vaults'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'id': id,
@@ -65,7 +59,7 @@ class VaultsController(BaseController):
                 'includeMarkedForRemoval': include_marked_for_removal
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -77,7 +71,7 @@ class VaultsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_vaults.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_vaults')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -87,7 +81,8 @@ class VaultsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Vault.from_dictionary)
+            from cohesity_management_sdk.models.vault import Vault
+            return self.deserialize_response(_context, Vault.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -124,7 +119,7 @@ class VaultsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_vault.')
             _url_path = '/public/vaults'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -137,8 +132,8 @@ class VaultsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_vault.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_vault')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -148,7 +143,8 @@ class VaultsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Vault.from_dictionary)
+            from cohesity_management_sdk.models.vault import Vault
+            return self.deserialize_response(_context, Vault.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -205,7 +201,7 @@ class VaultsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_archive_media_info.')
             _url_path = '/public/vaults/archiveMediaInfo'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'clusterId': cluster_id,
@@ -215,7 +211,7 @@ class VaultsController(BaseController):
                 'entityIds': entity_ids
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -227,7 +223,7 @@ class VaultsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_archive_media_info.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_archive_media_info')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -237,7 +233,8 @@ class VaultsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, TapeMediaInformation.from_dictionary)
+            from cohesity_management_sdk.models.tape_media_information import TapeMediaInformation
+            return self.deserialize_response(_context, TapeMediaInformation.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -264,7 +261,7 @@ class VaultsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_bandwidth_settings.')
             _url_path = '/public/vaults/bandwidthSettings'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -277,7 +274,7 @@ class VaultsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_bandwidth_settings.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_bandwidth_settings')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -287,7 +284,8 @@ class VaultsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, VaultBandwidthLimits.from_dictionary)
+            from cohesity_management_sdk.models.vault_bandwidth_limits import VaultBandwidthLimits
+            return self.deserialize_response(_context, VaultBandwidthLimits.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -323,7 +321,7 @@ class VaultsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_bandwidth_settings.')
             _url_path = '/public/vaults/bandwidthSettings'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -336,8 +334,8 @@ class VaultsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_bandwidth_settings.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_bandwidth_settings')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -347,7 +345,8 @@ class VaultsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, VaultBandwidthLimits.from_dictionary)
+            from cohesity_management_sdk.models.vault_bandwidth_limits import VaultBandwidthLimits
+            return self.deserialize_response(_context, VaultBandwidthLimits.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -396,7 +395,7 @@ class VaultsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -409,7 +408,7 @@ class VaultsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_vault_encryption_key.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_vault_encryption_key')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -419,7 +418,8 @@ class VaultsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, VaultEncryptionKey.from_dictionary)
+            from cohesity_management_sdk.models.vault_encryption_key import VaultEncryptionKey
+            return self.deserialize_response(_context, VaultEncryptionKey.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -459,7 +459,7 @@ class VaultsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -472,7 +472,7 @@ class VaultsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_vault_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_vault_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -482,12 +482,33 @@ class VaultsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Vault.from_dictionary)
+            from cohesity_management_sdk.models.vault import Vault
+            return self.deserialize_response(_context, Vault.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def vault_loader(self):
+        """Returns the loader coalescing lookups of Vaults by id into
+        get_vaults() requests, instead of calling get_vault_by_id once per
+        id.
+
+        get_vaults only filters by a single id, so each batch requests all
+        the Vaults once and picks the ids out of them.
+
+        Lookups made at the same time, from several threads or tasks, or
+        passed to get_many at once, are sent together.
+
+        Returns:
+            BatchLoader of Vault: The loader of the controller.
+
+        """
+        return self.batch_loader(
+            'vault',
+            lambda ids: self.get_vaults(),
+            max_batch_size=None)
+
     def update_vault(self,
                      id,
                      body):
@@ -526,7 +547,7 @@ class VaultsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -539,8 +560,8 @@ class VaultsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_vault.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_vault')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -550,7 +571,8 @@ class VaultsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Vault.from_dictionary)
+            from cohesity_management_sdk.models.vault import Vault
+            return self.deserialize_response(_context, Vault.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,10 +3,7 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.view_box import ViewBox
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 from cohesity_management_sdk.exceptions.api_exception import APIException
 
@@ -14,8 +11,8 @@ class ViewBoxesController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(ViewBoxesController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(ViewBoxesController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_view_boxes(self,
@@ -67,7 +64,7 @@ class ViewBoxesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_view_boxes.')
             _url_path = '/public/viewBoxes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'tenantIds': tenant_ids,
@@ -79,7 +76,7 @@ class ViewBoxesController(BaseController):
                 'fetchTimeSeriesSchema': fetch_time_series_schema
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -91,7 +88,7 @@ class ViewBoxesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_view_boxes.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_view_boxes')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -101,7 +98,8 @@ class ViewBoxesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ViewBox.from_dictionary)
+            from cohesity_management_sdk.models.view_box import ViewBox
+            return self.deserialize_response(_context, ViewBox.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -137,7 +135,7 @@ class ViewBoxesController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_view_box.')
             _url_path = '/public/viewBoxes'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -150,8 +148,8 @@ class ViewBoxesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_view_box.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_view_box')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -161,7 +159,8 @@ class ViewBoxesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ViewBox.from_dictionary)
+            from cohesity_management_sdk.models.view_box import ViewBox
+            return self.deserialize_response(_context, ViewBox.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -204,13 +203,13 @@ class ViewBoxesController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'fetchStats': fetch_stats
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -222,7 +221,7 @@ class ViewBoxesController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_view_box_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_view_box_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -234,12 +233,31 @@ class ViewBoxesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ViewBox.from_dictionary)
+            from cohesity_management_sdk.models.view_box import ViewBox
+            return self.deserialize_response(_context, ViewBox.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def view_box_loader(self):
+        """Returns the loader coalescing lookups of Domains (View Boxes) by
+        id into get_view_boxes(ids=...) requests, instead of calling
+        get_view_box_by_id once per id.
+
+        Lookups made at the same time, from several threads or tasks, or
+        passed to get_many at once, are sent together.
+
+        Returns:
+            BatchLoader of ViewBox: The loader of the controller.
+
+        """
+        return self.batch_loader(
+            'view_box',
+            lambda ids: self.get_view_boxes(ids=ids),
+            url_path='/public/viewBoxes',
+            parameter='ids')
+
     def update_view_box(self,
                         id,
                         body):
@@ -276,7 +294,7 @@ class ViewBoxesController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -289,8 +307,8 @@ class ViewBoxesController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_view_box.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_view_box')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -300,7 +318,8 @@ class ViewBoxesController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ViewBox.from_dictionary)
+            from cohesity_management_sdk.models.view_box import ViewBox
+            return self.deserialize_response(_context, ViewBox.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
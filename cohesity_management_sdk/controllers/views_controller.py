@@ -3,30 +3,15 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.list_nlm_locks_response import ListNlmLocksResponse
-from cohesity_management_sdk.models.qo_s_policy import QoSPolicy
-from cohesity_management_sdk.models.get_views_by_share_name_result import GetViewsByShareNameResult
-from cohesity_management_sdk.models.smb_connection import SmbConnection
-from cohesity_management_sdk.models.view_alias import ViewAlias
-from cohesity_management_sdk.models.activate_view_aliases_result import ActivateViewAliasesResult
-from cohesity_management_sdk.models.dir_quota_info import DirQuotaInfo
-from cohesity_management_sdk.models.view_user_quotas import ViewUserQuotas
-from cohesity_management_sdk.models.user_quota_and_usage import UserQuotaAndUsage
-from cohesity_management_sdk.models.user_quota_settings import UserQuotaSettings
-from cohesity_management_sdk.models.get_views_result import GetViewsResult
-from cohesity_management_sdk.models.view import View
-from cohesity_management_sdk.models.file_lock_status import FileLockStatus
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 
 class ViewsController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(ViewsController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(ViewsController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def delete_clear_nlm_locks(self,
@@ -58,7 +43,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_clear_nlm_locks.')
             _url_path = '/public/nlmLocks'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -70,8 +55,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_clear_nlm_locks.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_clear_nlm_locks')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -129,7 +114,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for list_nlm_locks.')
             _url_path = '/public/nlmLocks'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'filePath': file_path,
@@ -138,7 +123,7 @@ class ViewsController(BaseController):
                 'cookie': cookie
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -150,7 +135,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for list_nlm_locks.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'list_nlm_locks')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -160,12 +145,46 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ListNlmLocksResponse.from_dictionary)
+            from cohesity_management_sdk.models.list_nlm_locks_response import ListNlmLocksResponse
+            return self.deserialize_response(_context, ListNlmLocksResponse.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def paginate_nlm_locks(self,
+                           page_size=None,
+                           prefetch=True,
+                           **kwargs):
+        """Iterates over all the NLM locks returned by list_nlm_locks,
+        following the cookie of each page.
+
+        The next page is requested in the background while the items of the
+        current one are consumed, unless prefetch is False.
+
+        Args:
+            page_size (int, optional): The pageCount of each request, the
+                default of the cluster when None.
+            prefetch (bool, optional): False to request each page only once
+                the previous one has been consumed.
+            kwargs: The other parameters of list_nlm_locks.
+
+        Returns:
+            CookiePaginator of FileNlmLocks: The locked files of all the pages.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        return self.paginate(
+            lambda cookie, page_size: self.list_nlm_locks(cookie=cookie,
+                                                          page_count=page_size,
+                                                          **kwargs),
+            'filesNlmLocks', 'cookie', page_size, prefetch)
+
     def get_qo_s_policies(self,
                           ids=None,
                           names=None):
@@ -195,14 +214,14 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_qo_s_policies.')
             _url_path = '/public/qosPolicies'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'ids': ids,
                 'names': names
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -214,7 +233,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_qo_s_policies.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_qo_s_policies')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -224,7 +243,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, QoSPolicy.from_dictionary)
+            from cohesity_management_sdk.models.qo_s_policy import QoSPolicy
+            return self.deserialize_response(_context, QoSPolicy.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -280,7 +300,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_views_by_share_name.')
             _url_path = '/public/shares'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'tenantIds': tenant_ids,
@@ -290,7 +310,7 @@ class ViewsController(BaseController):
                 'paginationCookie': pagination_cookie
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -302,7 +322,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_views_by_share_name.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_views_by_share_name')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -312,7 +332,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, GetViewsByShareNameResult.from_dictionary)
+            from cohesity_management_sdk.models.get_views_by_share_name_result import GetViewsByShareNameResult
+            return self.deserialize_response(_context, GetViewsByShareNameResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -353,7 +374,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_smb_connections.')
             _url_path = '/public/smbConnections'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'viewNames': view_names,
@@ -362,7 +383,7 @@ class ViewsController(BaseController):
                 'includeSid': include_sid
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -374,7 +395,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_smb_connections.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_smb_connections')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -384,7 +405,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, SmbConnection.from_dictionary)
+            from cohesity_management_sdk.models.smb_connection import SmbConnection
+            return self.deserialize_response(_context, SmbConnection.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -419,7 +441,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_view_alias.')
             _url_path = '/public/viewAliases'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -432,8 +454,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_view_alias.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_view_alias')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -443,7 +465,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ViewAlias.from_dictionary)
+            from cohesity_management_sdk.models.view_alias import ViewAlias
+            return self.deserialize_response(_context, ViewAlias.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -478,7 +501,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_view_alias.')
             _url_path = '/public/viewAliases'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -491,8 +514,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_view_alias.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_view_alias')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -502,7 +525,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ViewAlias.from_dictionary)
+            from cohesity_management_sdk.models.view_alias import ViewAlias
+            return self.deserialize_response(_context, ViewAlias.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -540,14 +564,14 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_view_alias.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_view_alias')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -592,7 +616,7 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -605,7 +629,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_activate_view_aliases.')
             _request = self.http_client.post(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_activate_view_aliases')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -615,7 +639,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ActivateViewAliasesResult.from_dictionary)
+            from cohesity_management_sdk.models.activate_view_aliases_result import ActivateViewAliasesResult
+            return self.deserialize_response(_context, ActivateViewAliasesResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -650,13 +675,13 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_view_dir_quota_info.')
             _url_path = '/public/viewDirectoryQuotas'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'viewName': view_name
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -668,7 +693,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_view_dir_quota_info.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_view_dir_quota_info')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -678,7 +703,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, DirQuotaInfo.from_dictionary)
+            from cohesity_management_sdk.models.dir_quota_info import DirQuotaInfo
+            return self.deserialize_response(_context, DirQuotaInfo.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -715,7 +741,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_view_dir_quota.')
             _url_path = '/public/viewDirectoryQuotas'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -728,8 +754,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_view_dir_quota.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_view_dir_quota')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -739,7 +765,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, DirQuotaInfo.from_dictionary)
+            from cohesity_management_sdk.models.dir_quota_info import DirQuotaInfo
+            return self.deserialize_response(_context, DirQuotaInfo.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -771,7 +798,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for delete_view_users_quota.')
             _url_path = '/public/viewUserQuotas'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -783,8 +810,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_view_users_quota.')
-            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.delete(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_view_users_quota')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -892,7 +919,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_view_user_quotas.')
             _url_path = '/public/viewUserQuotas'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'viewName': view_name,
@@ -910,7 +937,7 @@ class ViewsController(BaseController):
                 'outputFormat': output_format
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -922,7 +949,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_view_user_quotas.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_view_user_quotas')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -932,7 +959,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, ViewUserQuotas.from_dictionary)
+            from cohesity_management_sdk.models.view_user_quotas import ViewUserQuotas
+            return self.deserialize_response(_context, ViewUserQuotas.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -964,7 +992,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_view_user_quota.')
             _url_path = '/public/viewUserQuotas'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -977,8 +1005,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_view_user_quota.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_view_user_quota')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -988,7 +1016,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, UserQuotaAndUsage.from_dictionary)
+            from cohesity_management_sdk.models.user_quota_and_usage import UserQuotaAndUsage
+            return self.deserialize_response(_context, UserQuotaAndUsage.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1020,7 +1049,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_view_user_quota.')
             _url_path = '/public/viewUserQuotas'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1033,8 +1062,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_view_user_quota.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_view_user_quota')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1044,7 +1073,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, UserQuotaAndUsage.from_dictionary)
+            from cohesity_management_sdk.models.user_quota_and_usage import UserQuotaAndUsage
+            return self.deserialize_response(_context, UserQuotaAndUsage.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1077,7 +1107,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_user_quota_settings.')
             _url_path = '/public/viewUserQuotasSettings'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1090,8 +1120,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_user_quota_settings.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_user_quota_settings')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1101,7 +1131,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, UserQuotaSettings.from_dictionary)
+            from cohesity_management_sdk.models.user_quota_settings import UserQuotaSettings
+            return self.deserialize_response(_context, UserQuotaSettings.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1196,7 +1227,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_views.')
             _url_path = '/public/views'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'tenantIds': tenant_ids,
@@ -1217,7 +1248,7 @@ class ViewsController(BaseController):
                 'includeStats': include_stats
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -1229,7 +1260,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_views.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_views')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1239,12 +1270,79 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, GetViewsResult.from_dictionary)
+            from cohesity_management_sdk.models.get_views_result import GetViewsResult
+            return self.deserialize_response(_context, GetViewsResult.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
             raise
 
+    def iter_views(self, *args, **kwargs):
+        """Streams the Views returned by get_views.
+
+        The items of the views array of the response are yielded one at a
+        time, as the body is received. Only one item is decoded at a time, so
+        the memory used does not grow with the size of the response. The
+        connection is held until all the items have been read or the generator
+        is closed.
+
+        Args:
+            args, kwargs: The parameters of get_views.
+
+        Returns:
+            generator of View: The items of the response.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        from cohesity_management_sdk.models.view import View
+        return self.streaming(['views'], View.from_dictionary).get_views(*args, **kwargs)
+
+    def paginate_views(self,
+                       page_size=None,
+                       prefetch=True,
+                       **kwargs):
+        """Iterates over all the Views returned by get_views, requesting the
+        next set of Views after the last one of a page as long as lastResult
+        is false.
+
+        The next page is requested in the background while the items of the
+        current one are consumed, unless prefetch is False.
+
+        Args:
+            page_size (int, optional): The maxCount of each request, the
+                default of the cluster when None.
+            prefetch (bool, optional): False to request each page only once
+                the previous one has been consumed.
+            kwargs: The other parameters of get_views.
+
+        Returns:
+            CookiePaginator of View: The Views of all the pages.
+
+        Raises:
+            APIException: When an error occurs while fetching the data from
+                the remote API. This exception includes the HTTP Response
+                code, an error message, and the HTTP body that was received in
+                the request.
+
+        """
+        from cohesity_management_sdk.pagination import get_field
+
+        def next_max_view_id(page):
+            views = get_field(page, 'views')
+            if get_field(page, 'lastResult') is False and views:
+                return get_field(views[-1], 'viewId')
+
+        return self.paginate(
+            lambda cookie, page_size: self.get_views(max_view_id=cookie,
+                                                     max_count=page_size,
+                                                     **kwargs),
+            'views', next_max_view_id, page_size, prefetch)
+
     def create_view(self,
                     body):
         """Does a POST request to /public/views.
@@ -1274,7 +1372,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_view.')
             _url_path = '/public/views'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1287,8 +1385,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_view.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_view')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1298,7 +1396,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, View.from_dictionary)
+            from cohesity_management_sdk.models.view import View
+            return self.deserialize_response(_context, View.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1333,7 +1432,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for update_view.')
             _url_path = '/public/views'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1346,8 +1445,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_view.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_view')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1357,7 +1456,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, View.from_dictionary)
+            from cohesity_management_sdk.models.view import View
+            return self.deserialize_response(_context, View.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1392,7 +1492,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_clone_view.')
             _url_path = '/public/views/clone'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1405,8 +1505,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_clone_view.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_clone_view')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1416,7 +1516,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, View.from_dictionary)
+            from cohesity_management_sdk.models.view import View
+            return self.deserialize_response(_context, View.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1451,7 +1552,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_clone_directory.')
             _url_path = '/public/views/cloneDirectory'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1463,8 +1564,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_clone_directory.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_clone_directory')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1509,14 +1610,14 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_view_by_id.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_view_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1561,7 +1662,7 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1574,7 +1675,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_view_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_view_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1584,7 +1685,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, View.from_dictionary)
+            from cohesity_management_sdk.models.view import View
+            return self.deserialize_response(_context, View.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1626,13 +1728,13 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'path': path
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -1644,7 +1746,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_file_lock_status_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_file_lock_status_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1654,7 +1756,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, FileLockStatus.from_dictionary)
+            from cohesity_management_sdk.models.file_lock_status import FileLockStatus
+            return self.deserialize_response(_context, FileLockStatus.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1695,7 +1798,7 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1708,8 +1811,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_lock_file_by_id.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_lock_file_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1719,7 +1822,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, FileLockStatus.from_dictionary)
+            from cohesity_management_sdk.models.file_lock_status import FileLockStatus
+            return self.deserialize_response(_context, FileLockStatus.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1756,7 +1860,7 @@ class ViewsController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_overwrite_view.')
             _url_path = '/public/views/overwrite'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1769,8 +1873,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_overwrite_view.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_overwrite_view')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1780,7 +1884,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, View.from_dictionary)
+            from cohesity_management_sdk.models.view import View
+            return self.deserialize_response(_context, View.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1822,7 +1927,7 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1835,8 +1940,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_rename_view_by_id.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_rename_view_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1846,7 +1951,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, View.from_dictionary)
+            from cohesity_management_sdk.models.view import View
+            return self.deserialize_response(_context, View.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1888,7 +1994,7 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -1901,8 +2007,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_rename_view.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_rename_view')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -1912,7 +2018,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, View.from_dictionary)
+            from cohesity_management_sdk.models.view import View
+            return self.deserialize_response(_context, View.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -1950,14 +2057,14 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for delete_view.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'delete_view')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -2002,7 +2109,7 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -2015,7 +2122,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_view_by_name.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_view_by_name')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -2025,7 +2132,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, View.from_dictionary)
+            from cohesity_management_sdk.models.view import View
+            return self.deserialize_response(_context, View.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -2066,7 +2174,7 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -2079,8 +2187,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_view_by_name.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_view_by_name')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -2090,7 +2198,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, View.from_dictionary)
+            from cohesity_management_sdk.models.view import View
+            return self.deserialize_response(_context, View.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -2132,13 +2241,13 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'path': path
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -2150,7 +2259,7 @@ class ViewsController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_file_lock_status.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_file_lock_status')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -2160,7 +2269,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, FileLockStatus.from_dictionary)
+            from cohesity_management_sdk.models.file_lock_status import FileLockStatus
+            return self.deserialize_response(_context, FileLockStatus.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -2201,7 +2311,7 @@ class ViewsController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'name': name
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -2214,8 +2324,8 @@ class ViewsController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_lock_file.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_lock_file')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -2225,7 +2335,8 @@ class ViewsController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, FileLockStatus.from_dictionary)
+            from cohesity_management_sdk.models.file_lock_status import FileLockStatus
+            return self.deserialize_response(_context, FileLockStatus.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -3,10 +3,7 @@
 
 import logging
 from cohesity_management_sdk.api_helper import APIHelper
-from cohesity_management_sdk.configuration import Configuration
 from cohesity_management_sdk.controllers.base_controller import BaseController
-from cohesity_management_sdk.http.auth.auth_manager import AuthManager
-from cohesity_management_sdk.models.vlan import Vlan
 from cohesity_management_sdk.exceptions.request_error_error_exception import RequestErrorErrorException
 from cohesity_management_sdk.exceptions.api_exception import APIException
 
@@ -14,8 +11,8 @@ class VlanController(BaseController):
 
     """A Controller to access Endpoints in the cohesity_management_sdk API."""
 
-    def __init__(self, client=None, call_back=None):
-        super(VlanController, self).__init__(client, call_back)
+    def __init__(self, client=None, call_back=None, config=None, auth=None):
+        super(VlanController, self).__init__(client, call_back, config, auth)
         self.logger = logging.getLogger(__name__)
 
     def get_vlans(self,
@@ -52,7 +49,7 @@ class VlanController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for get_vlans.')
             _url_path = '/public/vlans'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_parameters = {
                 'tenantIds': tenant_ids,
@@ -60,7 +57,7 @@ class VlanController(BaseController):
                 'skipPrimaryAndBondIface': skip_primary_and_bond_iface
             }
             _query_builder = APIHelper.append_url_with_query_parameters(_query_builder,
-                _query_parameters, Configuration.array_serialization)
+                _query_parameters, self.config.array_serialization)
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare headers
@@ -72,7 +69,7 @@ class VlanController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_vlans.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_vlans')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -82,7 +79,8 @@ class VlanController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Vlan.from_dictionary)
+            from cohesity_management_sdk.models.vlan import Vlan
+            return self.deserialize_response(_context, Vlan.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -117,7 +115,7 @@ class VlanController(BaseController):
             # Prepare query URL
             self.logger.info('Preparing query URL for create_vlan.')
             _url_path = '/public/vlans'
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -130,8 +128,8 @@ class VlanController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for create_vlan.')
-            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.post(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'create_vlan')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -141,7 +139,8 @@ class VlanController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Vlan.from_dictionary)
+            from cohesity_management_sdk.models.vlan import Vlan
+            return self.deserialize_response(_context, Vlan.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -179,14 +178,14 @@ class VlanController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for remove_vlan.')
             _request = self.http_client.delete(_query_url)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'remove_vlan')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -234,7 +233,7 @@ class VlanController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -247,7 +246,7 @@ class VlanController(BaseController):
             # Prepare and execute request
             self.logger.info('Preparing and executing request for get_vlan_by_id.')
             _request = self.http_client.get(_query_url, headers=_headers)
-            AuthManager.apply(_request)
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'get_vlan_by_id')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -259,7 +258,8 @@ class VlanController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Vlan.from_dictionary)
+            from cohesity_management_sdk.models.vlan import Vlan
+            return self.deserialize_response(_context, Vlan.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
@@ -299,7 +299,7 @@ class VlanController(BaseController):
             _url_path = APIHelper.append_url_with_template_parameters(_url_path, {
                 'id': id
             })
-            _query_builder = Configuration.get_base_uri()
+            _query_builder = self.config.get_base_uri()
             _query_builder += _url_path
             _query_url = APIHelper.clean_url(_query_builder)
 
@@ -312,8 +312,8 @@ class VlanController(BaseController):
 
             # Prepare and execute request
             self.logger.info('Preparing and executing request for update_vlan.')
-            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body))
-            AuthManager.apply(_request)
+            _request = self.http_client.put(_query_url, headers=_headers, parameters=APIHelper.json_serialize(body, self.config.json_codec))
+            self.auth.apply(_request)
             _context = self.execute_request(_request, name = 'update_vlan')
 
             # Endpoint and global error handling using HTTP status codes.
@@ -323,7 +323,8 @@ class VlanController(BaseController):
             self.validate_response(_context)
 
             # Return appropriate type
-            return APIHelper.json_deserialize(_context.response.raw_body, Vlan.from_dictionary)
+            from cohesity_management_sdk.models.vlan import Vlan
+            return self.deserialize_response(_context, Vlan.from_dictionary)
 
         except Exception as e:
             self.logger.error(e, exc_info = True)
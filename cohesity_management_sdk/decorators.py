@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+import types
+
+
 class lazy_property(object):
 
     """A decorator class for lazy instantiation."""
@@ -15,3 +18,21 @@ class lazy_property(object):
         value = self.fget(obj)
         setattr(obj, self.func_name, value)
         return value
+
+
+class hybrid_method(object):
+
+    """A decorator for methods that can be called on a class as well as on
+    its instances.
+
+    The first argument passed to the method is the instance when called on
+    one, and the class itself otherwise.
+
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, cls):
+        return types.MethodType(self.func, cls if obj is None else obj)
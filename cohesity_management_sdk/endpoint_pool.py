@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from requests.compat import urlparse
+
+from cohesity_management_sdk.http.http_method_enum import HttpMethodEnum
+
+
+def get_node_host(node, cluster_vip):
+    """Returns the address the API of a node is reached at.
+
+    Args:
+        node (dict): The raw Node.
+        cluster_vip (string): The cluster VIP, whose port is kept.
+
+    Returns:
+        string: The IP of the node, with the port of the cluster VIP.
+
+    """
+    ip = node['ip']
+    host = '[{}]'.format(ip) if ':' in ip else ip
+    port = urlparse('//' + cluster_vip).port
+    return host if port is None else '{}:{}'.format(host, port)
+
+
+class Endpoint(object):
+
+    """The state of one node of an EndpointPool.
+
+    Attributes:
+        host (string): The address of the node, with the port of the
+            cluster VIP.
+        outstanding (int): The number of requests in flight to the node.
+        requests (int): The number of requests sent to the node.
+        errors (int): The number of requests to the node which failed.
+        failures (int): The number of consecutive failures.
+        down_until (float): The time until which the node is left out.
+
+    """
+
+    def __init__(self, host):
+        """Constructor for the Endpoint class
+
+        Args:
+            host (string): The address of the node.
+
+        """
+        self.host = host
+        self.outstanding = 0
+        self.requests = 0
+        self.errors = 0
+        self.failures = 0
+        self.down_until = 0.0
+
+
+class EndpointPool(object):
+
+    """Spreads the read-only GET requests of a client across the nodes of
+    its cluster, instead of sending all of them to the node holding the
+    cluster VIP. Logins and the other requests stay on the VIP.
+
+    Each request goes to the node with the fewest requests in flight. A
+    node is left out for retry_interval seconds after failure_threshold
+    consecutive connection errors, timeouts or 5xx responses, and while its
+    circuit breaker is open. Every refresh_interval seconds the nodes are
+    discovered and health checked again in the background by the refresh
+    function. Requests go to the VIP when no node is available.
+
+    Example:
+        pool = client.enable_node_pool()
+        ...
+        print(pool.snapshot())
+
+    Attributes:
+        refresh (callable): The function returning the addresses of the
+            healthy nodes, None not to refresh them.
+        refresh_interval (float): The time in seconds between two refreshes,
+            None not to refresh the nodes.
+        failure_threshold (int): The number of consecutive failures leaving
+            a node out.
+        retry_interval (float): The time in seconds a failing node is left
+            out for.
+
+    """
+
+    def __init__(self, refresh=None, refresh_interval=300.0, failure_threshold=3,
+                 retry_interval=30.0):
+        """Constructor for the EndpointPool class
+
+        Args:
+            refresh (callable, optional): The function returning the
+                addresses of the healthy nodes.
+            refresh_interval (float, optional): The time between two
+                refreshes.
+            failure_threshold (int, optional): The number of consecutive
+                failures leaving a node out.
+            retry_interval (float, optional): The time a failing node is
+                left out for.
+
+        """
+        self.refresh = refresh
+        self.refresh_interval = refresh_interval
+        self.failure_threshold = failure_threshold
+        self.retry_interval = retry_interval
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._endpoints = OrderedDict()
+        self._refreshed_at = time.time()
+        self._refreshing = False
+
+    @property
+    def hosts(self):
+        """list of string: The addresses of the nodes in the pool."""
+        return list(self._endpoints)
+
+    def set_hosts(self, hosts):
+        """Replaces the nodes of the pool, keeping the state of those which
+        remain.
+
+        Args:
+            hosts (list of string): The addresses of the nodes.
+
+        """
+        with self._lock:
+            endpoints = OrderedDict()
+            for host in hosts:
+                endpoints[host] = self._endpoints.get(host) or Endpoint(host)
+            self._endpoints = endpoints
+            self._refreshed_at = time.time()
+
+    def snapshot(self):
+        """Returns the state of the nodes.
+
+        Returns:
+            dict: The outstanding, requests, errors and available values of
+                each node by address.
+
+        """
+        with self._lock:
+            now = time.time()
+            return OrderedDict((endpoint.host, {
+                'outstanding': endpoint.outstanding,
+                'requests': endpoint.requests,
+                'errors': endpoint.errors,
+                'available': endpoint.down_until <= now
+            }) for endpoint in self._endpoints.values())
+
+    def is_routed(self, request):
+        """Tells whether a request may be sent to any node.
+
+        Args:
+            request (HttpRequest): The request.
+
+        Returns:
+            bool: True for GET requests.
+
+        """
+        return request.http_method == HttpMethodEnum.GET
+
+    def acquire(self, is_available=None):
+        """Picks the node a request is sent to, the one with the fewest
+        requests in flight. Its outcome must then be passed to release.
+
+        Args:
+            is_available (callable, optional): The function telling whether
+                a node may be used, e.g. whether its circuit is closed.
+
+        Returns:
+            string: The address of the node, None when no node is
+                available.
+
+        """
+        self.check_refresh()
+        with self._lock:
+            now = time.time()
+            candidates = [endpoint for endpoint in self._endpoints.values()
+                          if endpoint.down_until <= now and
+                          (is_available is None or is_available(endpoint.host))]
+            if not candidates:
+                return None
+            least = min(endpoint.outstanding for endpoint in candidates)
+            endpoint = random.choice([endpoint for endpoint in candidates
+                                      if endpoint.outstanding == least])
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint.host
+
+    def release(self, host, failed):
+        """Records the outcome of a request sent to a node.
+
+        Args:
+            host (string): The address returned by acquire.
+            failed (bool): True when the request failed, None when its
+                outcome says nothing of the node.
+
+        """
+        with self._lock:
+            endpoint = self._endpoints.get(host)
+            if endpoint is None:
+                return
+            endpoint.outstanding -= 1
+            if failed is None:
+                return
+            if not failed:
+                endpoint.failures = 0
+                return
+            endpoint.errors += 1
+            endpoint.failures += 1
+            if endpoint.failures >= self.failure_threshold:
+                self.logger.warning("Leaving node {} out for {:.1f}s after {} failures.".format(
+                    host, self.retry_interval, endpoint.failures))
+                endpoint.failures = 0
+                endpoint.down_until = time.time() + self.retry_interval
+
+    def check_refresh(self):
+        if self.refresh is None or self.refresh_interval is None:
+            return
+        with self._lock:
+            if self._refreshing or time.time() - self._refreshed_at < self.refresh_interval:
+                return
+            self._refreshing = True
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        thread = threading.Thread(target=self.run_refresh)
+        thread.daemon = True
+        thread.start()
+
+    def run_refresh(self):
+        """Discovers and health checks the nodes again with the refresh
+        function. The current nodes are kept when it fails."""
+        try:
+            self.set_hosts(self.refresh())
+        except Exception as e:
+            self.logger.warning("Could not refresh the nodes of the pool: {!r}".format(e))
+            with self._lock:
+                self._refreshed_at = time.time()
+        finally:
+            self._refreshing = False
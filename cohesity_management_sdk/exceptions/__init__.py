@@ -1,5 +1,6 @@
 __all__ = [
     'api_exception',
+    'circuit_open_exception',
     'error_exception',
     'request_error_error_exception',
 ]
\ No newline at end of file
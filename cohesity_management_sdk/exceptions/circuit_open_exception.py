@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+class CircuitOpenException(Exception):
+
+    """Raised instead of sending a request to a host whose circuit breaker
+    is open, after too many of its requests failed.
+
+    Attributes:
+        host (string): The host the request was for.
+        retry_after (float): The number of seconds before the host is tried
+            again, None when a trial request is already being sent.
+
+    """
+
+    def __init__(self, host, retry_after=None):
+        """Constructor for the CircuitOpenException class
+
+        Args:
+            host (string): The host the request was for.
+            retry_after (float, optional): The number of seconds before the
+                host is tried again.
+
+        """
+        if retry_after is None:
+            reason = 'The circuit of {} is half-open, a trial request is in flight.'.format(host)
+        else:
+            reason = 'The circuit of {} is open, retry in {:.1f}s.'.format(host, retry_after)
+        super(CircuitOpenException, self).__init__(reason)
+        self.host = host
+        self.retry_after = retry_after
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from cohesity_management_sdk.http.http_method_enum import HttpMethodEnum
+
+
+class HedgingMetrics(object):
+
+    """Counts the requests hedged under a HedgingPolicy. It is safe to share
+    between threads.
+
+    Attributes:
+        requests (int): The number of requests which could be hedged.
+        hedges (int): The number of duplicate requests sent.
+        wins (int): The number of hedges answered before their original
+            request.
+        denied (int): The number of hedges not sent because the budget was
+            spent.
+
+    """
+
+    def __init__(self):
+        """Constructor for the HedgingMetrics class"""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Sets all the counters back to zero."""
+        with self._lock:
+            self.requests = 0
+            self.hedges = 0
+            self.wins = 0
+            self.denied = 0
+
+    def record(self, hedged, won=False, denied=False):
+        with self._lock:
+            self.requests += 1
+            self.hedges += 1 if hedged else 0
+            self.wins += 1 if won else 0
+            self.denied += 1 if denied else 0
+
+    def snapshot(self):
+        """Returns the counters.
+
+        Returns:
+            dict: The counters by name, along with the hit rate, the share of
+                the hedges which answered first, and the extra load, the
+                number of hedges per request.
+
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'hedges': self.hedges,
+                'wins': self.wins,
+                'denied': self.denied,
+                'hit_rate': float(self.wins) / self.hedges if self.hedges else 0.0,
+                'extra_load': float(self.hedges) / self.requests if self.requests else 0.0
+            }
+
+
+class HedgingPolicy(object):
+
+    """Sends a duplicate of the GET requests which are slow to answer, and
+    keeps the first response, to cut the tail latency of the endpoints.
+
+    A request which has not been answered once the percentile of the recent
+    latencies of its endpoint has elapsed is sent again, to another node
+    when the client has a node pool, or over another connection. The first
+    response received is returned. The other request is cancelled by the
+    asynchronous client. The synchronous client cannot interrupt it, its
+    response is discarded when it arrives.
+
+    Each request adds budget to a bucket of hedges, and each hedge takes one
+    out of it, so that hedges add at most budget times the requests to the
+    load of the cluster. Endpoints are hedged once min_samples of their
+    latencies are known.
+
+    Example:
+        client.config.hedging_policy = HedgingPolicy(
+            percentile=95, budget=0.05,
+            endpoints=['get_storage_stats', 'get_time_series_stats'])
+        ...
+        print(client.config.hedging_policy.metrics.snapshot())
+
+    Attributes:
+        percentile (float): The percentile of the latencies after which a
+            request is hedged, between 0 and 100.
+        budget (float): The maximum number of hedges per request.
+        max_burst (float): The maximum number of hedges sent in a row when
+            the budget has not been used for a while.
+        min_delay (float): The minimum time in seconds before a hedge.
+        max_delay (float): The maximum time in seconds before a hedge, None
+            for no maximum.
+        min_samples (int): The number of latencies of an endpoint needed
+            before it is hedged.
+        window (int): The number of recent latencies kept per endpoint.
+        endpoints (set of string): The names of the endpoints hedged, None
+            for all the GET endpoints.
+        max_workers (int): The maximum number of requests in flight through
+            the thread pool of the synchronous client.
+        metrics (HedgingMetrics): The counters of the hedged requests.
+
+    """
+
+    def __init__(self, percentile=95.0, budget=0.05, max_burst=10.0, min_delay=0.01,
+                 max_delay=None, min_samples=20, window=1000, endpoints=None,
+                 max_workers=64, metrics=None):
+        """Constructor for the HedgingPolicy class
+
+        Args:
+            percentile (float, optional): The percentile of the latencies
+                after which a request is hedged.
+            budget (float, optional): The maximum number of hedges per
+                request.
+            max_burst (float, optional): The maximum number of hedges in a
+                row.
+            min_delay (float, optional): The minimum time before a hedge.
+            max_delay (float, optional): The maximum time before a hedge.
+            min_samples (int, optional): The number of latencies needed.
+            window (int, optional): The number of latencies kept.
+            endpoints (list of string, optional): The names of the endpoints
+                hedged, all the GET endpoints when None.
+            max_workers (int, optional): The size of the thread pool.
+            metrics (HedgingMetrics, optional): The counters, new ones when
+                None.
+
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.max_burst = max_burst
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.endpoints = set(endpoints) if endpoints is not None else None
+        self.max_workers = max_workers
+        self.metrics = metrics if metrics is not None else HedgingMetrics()
+        self._lock = threading.Lock()
+        self._latencies = {}
+        self._tokens = max_burst
+        self._executor = None
+
+    def is_hedged(self, request, name=None):
+        """Tells whether a request may be hedged.
+
+        Args:
+            request (HttpRequest): The request.
+            name (string, optional): The name of its endpoint.
+
+        Returns:
+            bool: True for the GET requests of the endpoints hedged.
+
+        """
+        return request.http_method == HttpMethodEnum.GET and \
+            (self.endpoints is None or name in self.endpoints)
+
+    def get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def get_delay(self, name):
+        """Returns the time to wait for a response before hedging.
+
+        Args:
+            name (string): The name of the endpoint.
+
+        Returns:
+            float: The percentile of the recent latencies of the endpoint
+                in seconds, None while fewer than min_samples are known.
+
+        """
+        with self._lock:
+            latencies = self._latencies.get(name)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            latencies = sorted(latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile / 100.0))
+        delay = max(self.min_delay, latencies[index])
+        return delay if self.max_delay is None else min(delay, self.max_delay)
+
+    def record_latency(self, name, latency):
+        with self._lock:
+            latencies = self._latencies.get(name)
+            if latencies is None:
+                latencies = self._latencies[name] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    def add_request(self):
+        with self._lock:
+            self._tokens = min(self.max_burst, self._tokens + self.budget)
+
+    def take_hedge(self):
+        """Takes a hedge out of the budget.
+
+        Returns:
+            bool: False when the budget is spent.
+
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
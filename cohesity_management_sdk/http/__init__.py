@@ -3,8 +3,13 @@ __all__ = [
     'http_method_enum',
     'http_request',
     'http_response',
+    'http_stream_response',
     'http_client',
     'http_context',
     'requests_client',
+    'connection_pool',
     'http_call_back',
+    'async_http_client',
+    'aiohttp_client',
+    'async_http_call_back',
 ]
\ No newline at end of file
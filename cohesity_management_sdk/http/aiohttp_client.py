@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import asyncio
+
+import aiohttp
+
+from cohesity_management_sdk.configuration import Configuration
+from cohesity_management_sdk.http.async_http_client import AsyncHttpClient
+from cohesity_management_sdk.http.http_method_enum import HttpMethodEnum
+from cohesity_management_sdk.http.http_response import HttpResponse
+from cohesity_management_sdk.http.http_stream_response import HttpStreamResponse
+
+
+class AiohttpClient(AsyncHttpClient):
+
+    """An implementation of AsyncHttpClient that uses aiohttp as its HTTP
+    Client.
+
+    All the requests issued through one instance share a single connection
+    pool, so a large number of concurrent calls can be multiplexed over a
+    bounded number of keep-alive connections on one event loop.
+
+    A streamed response is not bound by timeout as a whole, only its
+    connection and each of its reads are.
+
+    Attributes:
+        timeout (int): The default timeout for all API requests.
+        connection_limit (int): The maximum number of simultaneous
+            connections in the pool. 0 means no limit.
+        connection_limit_per_host (int): The maximum number of simultaneous
+            connections to a single host. 0 means no limit.
+        keepalive_timeout (float): The number of seconds an idle connection
+            is kept open for reuse.
+        config (Configuration): The configuration deciding whether SSL
+            certificates are verified.
+        stream_chunk_size (int): The size(bytes) of the chunks a streamed
+            response body is read in.
+
+    """
+
+    stream_chunk_size = 64 * 1024
+
+    def __init__(self, timeout=60, connection_limit=100,
+                 connection_limit_per_host=0, keepalive_timeout=15, config=None):
+        """The constructor.
+
+        Args:
+            timeout (float): The default global timeout(seconds).
+            connection_limit (int): The size of the connection pool.
+            connection_limit_per_host (int): The size of the connection pool
+                for a single host.
+            keepalive_timeout (float): The idle timeout(seconds) of pooled
+                connections.
+            config (Configuration, optional): The configuration of the client
+                owning this AsyncHttpClient. The class level Configuration is
+                used when None.
+
+        """
+        self.timeout = timeout
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.config = config if config != None else Configuration
+        self.session = None
+        self._loop = None
+
+    def get_session(self):
+        """Returns the aiohttp session bound to the running event loop,
+        creating it on first use. The session of another event loop is
+        closed.
+
+        Returns:
+            aiohttp.ClientSession: The session used to execute requests.
+
+        """
+        loop = asyncio.get_event_loop()
+        if self.session is None or self.session.closed or self._loop is not loop:
+            self.close_session()
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout))
+            self._loop = loop
+        return self.session
+
+    def close_session(self):
+        """Closes the session of an event loop other than the running one.
+
+        The session is closed by its own event loop when it is running in
+        another thread. The connections of a loop which stopped cannot be
+        closed gracefully any more, they are dropped.
+
+        """
+        session, loop = self.session, self._loop
+        self.session = None
+        self._loop = None
+        if session is None or session.closed:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        connector = session.connector
+        session.detach()
+        if connector is not None:
+            connector._close()
+
+    def get_request_kwargs(self, request, stream=False):
+        """Returns the arguments of ClientSession.request for a request.
+
+        The parameters of a request with files are sent along with them as
+        multipart form data. SSL certificates are verified as set by the
+        configuration at the time of the request.
+
+        Args:
+            request (HttpRequest): The request.
+            stream (bool, optional): Whether the response body is streamed,
+                its reads being bound by timeout one by one.
+
+        Returns:
+            dict: The keyword arguments.
+
+        """
+        kwargs = {
+            'headers': request.headers,
+            'params': request.query_parameters or None,
+            'data': request.parameters
+        }
+        if request.files:
+            form = aiohttp.FormData()
+            for name, value in (request.parameters or {}).items():
+                for item in value if isinstance(value, (list, tuple)) else [value]:
+                    form.add_field(name, str(item))
+            for name, value in request.files.items():
+                if isinstance(value, tuple):
+                    # (filename, file) or (filename, file, content_type), as
+                    # sent by requests.
+                    form.add_field(name, value[1], filename=value[0],
+                                   content_type=value[2] if len(value) > 2 else None)
+                else:
+                    form.add_field(name, value)
+            kwargs['data'] = form
+        if self.config.skip_ssl_verification:
+            kwargs['ssl'] = False
+        if stream:
+            kwargs['timeout'] = aiohttp.ClientTimeout(
+                total=None, connect=self.timeout, sock_read=self.timeout)
+        return kwargs
+
+    async def execute_as_string(self, request):
+        """Execute a given HttpRequest to get a string response back
+
+        Args:
+            request (HttpRequest): The given HttpRequest to execute.
+
+        Returns:
+            HttpResponse: The response of the HttpRequest.
+
+        """
+        return await self._execute(request, False)
+
+    async def execute_as_binary(self, request):
+        """Execute a given HttpRequest to get a binary response back
+
+        Args:
+            request (HttpRequest): The given HttpRequest to execute.
+
+        Returns:
+            HttpResponse: The response of the HttpRequest.
+
+        """
+        return await self._execute(request, True)
+
+    async def execute_as_stream(self, request):
+        """Execute a given HttpRequest without reading its response body
+
+        Args:
+            request (HttpRequest): The given HttpRequest to execute.
+
+        Returns:
+            HttpStreamResponse: The response of the HttpRequest, its body is
+                read chunk by chunk.
+
+        """
+        session = self.get_session()
+        response = await session.request(HttpMethodEnum.to_string(request.http_method),
+                                         request.query_url,
+                                         **self.get_request_kwargs(request, stream=True))
+        return HttpStreamResponse(response.status, response.headers,
+                                  response.content.iter_chunked(self.stream_chunk_size),
+                                  response.release,
+                                  encoding=response.charset)
+
+    async def _execute(self, request, binary):
+        session = self.get_session()
+        async with session.request(HttpMethodEnum.to_string(request.http_method),
+                                   request.query_url,
+                                   **self.get_request_kwargs(request)) as response:
+            return await self.convert_response(response, binary)
+
+    def is_transient_error(self, error):
+        """Tells whether an error raised while executing a request, such as
+        a connection reset or a timeout, may not happen again.
+
+        Args:
+            error (Exception): The error.
+
+        Returns:
+            bool: True when the request may be retried.
+
+        """
+        return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)) and \
+            not isinstance(error, aiohttp.ClientSSLError)
+
+    def is_timeout_error(self, error):
+        """Tells whether an error is the response to a request timing out.
+
+        Args:
+            error (Exception): The error.
+
+        Returns:
+            bool: True for a timeout waiting for the response.
+
+        """
+        return isinstance(error, asyncio.TimeoutError)
+
+    def is_connect_error(self, error):
+        """Tells whether an error happened before the request was sent, such
+        as a refused connection.
+
+        Args:
+            error (Exception): The error.
+
+        Returns:
+            bool: True when the request did not reach the server.
+
+        """
+        return isinstance(error, aiohttp.ClientConnectorError) and \
+            not isinstance(error, aiohttp.ClientSSLError)
+
+    async def convert_response(self, response, binary):
+        """Converts the Response object of the HttpClient into an
+        HttpResponse object.
+
+        The body of a text response is kept as bytes and decoded with the
+        charset declared by the server, UTF-8 if there is none, only when it
+        is read as a string.
+
+        Args:
+            response (aiohttp.ClientResponse): The original response object.
+
+        Returns:
+            HttpResponse: The converted HttpResponse object.
+
+        """
+        if binary:
+            return HttpResponse(response.status, response.headers, await response.read())
+        else:
+            return HttpResponse(response.status, response.headers,
+                                content=await response.read(),
+                                encoding=response.charset)
+
+    async def close(self):
+        """Close the session and release its pooled connections."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._loop = None
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+class AsyncHttpCallBack(object):
+
+    """An interface for the coroutine callbacks to be awaited before and after
+    the HTTP call for an endpoint of an asynchronous controller is made.
+
+    This class should not be instantiated but should be used as a base class
+    for AsyncHttpCallBack classes.
+
+    """
+
+    async def on_before_request(self,
+                                request):
+        """The controller will await this method before making the HttpRequest.
+
+        Args:
+            request (HttpRequest): The request object which will be sent
+                to the AsyncHttpClient to be executed.
+        """
+        raise NotImplementedError("This method has not been implemented.")
+
+    async def on_after_response(self,
+                                context):
+        """The controller will await this method after making the HttpRequest.
+
+        Args:
+            context (HttpContext): The HttpContext of the API call.
+        """
+        raise NotImplementedError("This method has not been implemented.")
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+from cohesity_management_sdk.http.http_client import HttpClient
+
+
+class AsyncHttpClient(HttpClient):
+
+    """An interface for the methods that an asynchronous HTTP Client must
+    implement.
+
+    The request factory methods (get, post, put, ...) are inherited from
+    HttpClient, only the execution of a request is a coroutine.
+
+    This class should not be instantiated but should be used as a base class
+    for asynchronous HTTP Client classes.
+
+    """
+
+    async def execute_as_string(self, request):
+        """Execute a given HttpRequest to get a string response back
+
+        Args:
+            request (HttpRequest): The given HttpRequest to execute.
+
+        Returns:
+            HttpResponse: The response of the HttpRequest.
+
+        """
+        raise NotImplementedError("Please Implement this method")
+
+    async def execute_as_binary(self, request):
+        """Execute a given HttpRequest to get a binary response back
+
+        Args:
+            request (HttpRequest): The given HttpRequest to execute.
+
+        Returns:
+            HttpResponse: The response of the HttpRequest.
+
+        """
+        raise NotImplementedError("Please Implement this method")
+
+    async def execute_as_stream(self, request):
+        """Execute a given HttpRequest without reading its response body
+
+        Args:
+            request (HttpRequest): The given HttpRequest to execute.
+
+        Returns:
+            HttpStreamResponse: The response of the HttpRequest, its body is
+                read chunk by chunk.
+
+        """
+        raise NotImplementedError("Please Implement this method")
+
+    async def close(self):
+        """Release the connections held by this client."""
+        raise NotImplementedError("Please Implement this method")
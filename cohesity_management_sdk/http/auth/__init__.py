@@ -1,3 +1,4 @@
 __all__ = [
     'auth_manager',
+    'async_auth_manager',
 ]
\ No newline at end of file
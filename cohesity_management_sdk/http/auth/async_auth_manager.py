@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import asyncio
+
+from cohesity_management_sdk.configuration import Configuration
+from cohesity_management_sdk.decorators import hybrid_method
+from cohesity_management_sdk.models.access_token_credential import AccessTokenCredential
+from cohesity_management_sdk.token_cache import TokenCache
+
+
+class AsyncAuthManager(object):
+
+    """Adds authentication to the requests of an asynchronous client.
+
+    The methods can be called on the class, in which case the class level
+    Configuration is used, or on an instance bound to the Configuration and
+    AsyncHttpClient of a single client.
+
+    Logging in is single-flight: the tasks which find the access token
+    missing or expired at the same time wait for one login and then use its
+    token.
+
+    Attributes:
+        config (Configuration): The configuration holding the credentials
+            and the access token.
+        http_client (AsyncHttpClient): The client used to log in. The shared
+            default client of the controllers is used when None.
+
+    """
+
+    config = Configuration
+
+    http_client = None
+
+    _lock = None
+
+    def __init__(self, config=None, http_client=None):
+        """Constructor for the AsyncAuthManager class
+
+        Args:
+            config (Configuration, optional): The configuration to
+                authenticate with.
+            http_client (AsyncHttpClient, optional): The client used to log
+                in.
+
+        """
+        if config != None:
+            self.config = config
+        if http_client != None:
+            self.http_client = http_client
+        self._lock = None
+
+    @hybrid_method
+    async def apply(self, http_request):
+        """ Add authentication to the request.
+
+        Args:
+            http_request (HttpRequest): The HttpRequest object to which
+                authentication header will be added.
+
+        """
+        await self.check_auth()
+        http_request.headers['Authorization'] = self.get_authorization()
+
+    @hybrid_method
+    def get_authorization(self):
+        """ Returns the Authorization header of the access token.
+
+        Returns:
+            string: The header, None when there is no access token.
+
+        """
+        auth_token = self.config.auth_token
+        if not auth_token:
+            return None
+        return auth_token.token_type+" "+auth_token.access_token
+
+    @hybrid_method
+    async def check_auth(self):
+        """ Checks if access token is valid.
+
+        Concurrent callers that find no token wait for a single login
+        instead of each issuing their own.
+
+        """
+        if self.config.auth_token:
+            return
+        async with self.get_lock():
+            if not self.config.auth_token:
+                await self.login()
+
+    @hybrid_method
+    async def refresh(self, http_request):
+        """ Replaces the expired access token of a request and applies the
+        new one to it, for the request to be sent again.
+
+        The first caller with the expired token logs in again. The callers
+        waiting for it meanwhile find the token replaced and use the new one.
+
+        Args:
+            http_request (HttpRequest): The request rejected because of its
+                expired access token.
+
+        Returns:
+            bool: False when the request was not authenticated by an access
+                token, and cannot be refreshed.
+
+        """
+        expired = http_request.headers.get('Authorization')
+        if expired is None:
+            return False
+        async with self.get_lock():
+            if self.get_authorization() in (expired, None):
+                await self.login(expired)
+        http_request.headers['Authorization'] = self.get_authorization()
+        return True
+
+    @hybrid_method
+    def get_lock(self):
+        # Created on first use, within the event loop.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    @hybrid_method
+    async def login(self, expired=None):
+        """ Sets the access token from the token cache of the configuration,
+        or else by logging in.
+
+        Args:
+            expired (string, optional): The Authorization header of a token
+                rejected as expired, which is not taken from the cache.
+
+        Returns:
+            AccessToken: The access token.
+
+        """
+        config = self.config
+        token_cache = TokenCache.resolve(config.token_cache)
+        if token_cache is not None:
+            token = token_cache.load(config.cluster_vip, config.username, config.domain)
+            if token is not None and token.token_type+" "+token.access_token != expired:
+                config.auth_token = token
+                return token
+        return await self.authorize()
+
+    @hybrid_method
+    async def authorize(self):
+        """ Authorizes the client.
+
+        Returns:
+            AccessToken: The access token.
+
+        """
+        # Imported here as the controllers depend on this module.
+        from cohesity_management_sdk.async_controllers.access_tokens_controller import AsyncAccessTokensController
+
+        body = AccessTokenCredential()
+        body.username = self.config.username
+        body.password = self.config.password
+        if self.config.domain is not None:
+            body.domain = self.config.domain
+
+        token = await AsyncAccessTokensController(self.http_client, config=self.config).create_generate_access_token(body)
+        self.config.auth_token = token
+        token_cache = TokenCache.resolve(self.config.token_cache)
+        if token_cache is not None:
+            token_cache.save(self.config.cluster_vip, self.config.username, self.config.domain, token)
+        return token
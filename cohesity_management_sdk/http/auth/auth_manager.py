@@ -1,15 +1,57 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+import threading
+
 from cohesity_management_sdk.configuration import Configuration
-from cohesity_management_sdk.controllers.access_tokens_controller import AccessTokensController
+from cohesity_management_sdk.decorators import hybrid_method
 from cohesity_management_sdk.models.access_token_credential import AccessTokenCredential
+from cohesity_management_sdk.token_cache import TokenCache
+
+
+class AuthManager(object):
+
+    """Adds authentication to the requests of a client.
+
+    The methods can be called on the class, in which case the class level
+    Configuration is used, or on an instance bound to the Configuration and
+    HttpClient of a single client.
+
+    Logging in is single-flight: the threads which find the access token
+    missing or expired at the same time wait for one login and then use its
+    token.
+
+    Attributes:
+        config (Configuration): The configuration holding the credentials
+            and the access token.
+        http_client (HttpClient): The client used to log in. The shared
+            default client of the controllers is used when None.
+
+    """
+
+    config = Configuration
 
+    http_client = None
 
-class AuthManager:
+    _lock = threading.Lock()
 
-    @classmethod
-    def apply(cls, http_request):
+    def __init__(self, config=None, http_client=None):
+        """Constructor for the AuthManager class
+
+        Args:
+            config (Configuration, optional): The configuration to
+                authenticate with.
+            http_client (HttpClient, optional): The client used to log in.
+
+        """
+        if config != None:
+            self.config = config
+        if http_client != None:
+            self.http_client = http_client
+        self._lock = threading.Lock()
+
+    @hybrid_method
+    def apply(self, http_request):
         """ Add authentication to the request.
 
         Args:
@@ -17,32 +59,99 @@ class AuthManager:
                 authentication header will be added.
 
         """
-        cls.check_auth()
-        token = Configuration.auth_token.access_token
-        token_type = Configuration.auth_token.token_type
-        http_request.headers['Authorization'] = token_type+" "+token
+        self.check_auth()
+        http_request.headers['Authorization'] = self.get_authorization()
 
-    @classmethod
-    def check_auth(cls):
+    @hybrid_method
+    def get_authorization(self):
+        """ Returns the Authorization header of the access token.
+
+        Returns:
+            string: The header, None when there is no access token.
+
+        """
+        auth_token = self.config.auth_token
+        if not auth_token:
+            return None
+        return auth_token.token_type+" "+auth_token.access_token
+
+    @hybrid_method
+    def check_auth(self):
         """ Checks if access token is valid."""
-        if not Configuration.auth_token:
-            cls.authorize()
+        if self.config.auth_token:
+            return
+        with self._lock:
+            if not self.config.auth_token:
+                self.login()
+
+    @hybrid_method
+    def refresh(self, http_request):
+        """ Replaces the expired access token of a request and applies the
+        new one to it, for the request to be sent again.
+
+        The first caller with the expired token logs in again. The callers
+        waiting for it meanwhile find the token replaced and use the new one.
+
+        Args:
+            http_request (HttpRequest): The request rejected because of its
+                expired access token.
+
+        Returns:
+            bool: False when the request was not authenticated by an access
+                token, and cannot be refreshed.
+
+        """
+        expired = http_request.headers.get('Authorization')
+        if expired is None:
+            return False
+        with self._lock:
+            if self.get_authorization() in (expired, None):
+                self.login(expired)
+        http_request.headers['Authorization'] = self.get_authorization()
+        return True
+
+    @hybrid_method
+    def login(self, expired=None):
+        """ Sets the access token from the token cache of the configuration,
+        or else by logging in.
+
+        Args:
+            expired (string, optional): The Authorization header of a token
+                rejected as expired, which is not taken from the cache.
+
+        Returns:
+            AccessToken: The access token.
+
+        """
+        config = self.config
+        token_cache = TokenCache.resolve(config.token_cache)
+        if token_cache is not None:
+            token = token_cache.load(config.cluster_vip, config.username, config.domain)
+            if token is not None and token.token_type+" "+token.access_token != expired:
+                config.auth_token = token
+                return token
+        return self.authorize()
 
-    @classmethod
-    def authorize(cls):
+    @hybrid_method
+    def authorize(self):
         """ Authorizes the client.
 
         Returns:
             AccessToken: The access token.
 
         """
+        # Imported here as the controllers depend on this module.
+        from cohesity_management_sdk.controllers.access_tokens_controller import AccessTokensController
 
         body = AccessTokenCredential()
-        body.username = Configuration.username
-        body.password = Configuration.password
-        if Configuration.domain is not None:
-            body.domain = Configuration.domain
+        body.username = self.config.username
+        body.password = self.config.password
+        if self.config.domain is not None:
+            body.domain = self.config.domain
 
-        token = AccessTokensController().create_generate_access_token(body)
-        Configuration.auth_token = token
+        token = AccessTokensController(self.http_client, config=self.config).create_generate_access_token(body)
+        self.config.auth_token = token
+        token_cache = TokenCache.resolve(self.config.token_cache)
+        if token_cache is not None:
+            token_cache.save(self.config.cluster_vip, self.config.username, self.config.domain, token)
         return token
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import threading
+import time
+import weakref
+
+from cachecontrol.adapter import CacheControlAdapter
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class PoolStats(object):
+
+    """Counts the connections of the pools of a RequestsClient. It is safe
+    to share between threads.
+
+    Attributes:
+        created (int): The number of connections opened, each with a TCP
+            and TLS handshake.
+        reused (int): The number of requests sent over a kept alive
+            connection.
+        discarded (int): The number of connections closed because the pool
+            of their host was full. Raise pool_maxsize when it grows.
+        evicted (int): The number of connections closed because they were
+            idle for longer than idle_timeout.
+        in_use (int): The number of connections currently sending a request
+            or holding a streamed response.
+
+    """
+
+    def __init__(self):
+        """Constructor for the PoolStats class"""
+        self._lock = threading.Lock()
+        self._pools = weakref.WeakSet()
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.evicted = 0
+        self.in_use = 0
+
+    def add(self, name, value=1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    def add_pool(self, pool):
+        with self._lock:
+            self._pools.add(pool)
+
+    def get_idle(self):
+        with self._lock:
+            pools = list(self._pools)
+        idle = 0
+        for pool in pools:
+            queue = getattr(pool.pool, 'queue', None)
+            if queue is not None:
+                idle += sum(1 for conn in list(queue)
+                            if conn is not None and getattr(conn, 'sock', None) is not None)
+        return idle
+
+    def snapshot(self):
+        """Returns the counters.
+
+        Returns:
+            dict: The counters by name, along with the number of idle
+                connections kept open in the pools.
+
+        """
+        idle = self.get_idle()
+        with self._lock:
+            return {
+                'created': self.created,
+                'reused': self.reused,
+                'discarded': self.discarded,
+                'evicted': self.evicted,
+                'in_use': self.in_use,
+                'idle': idle
+            }
+
+
+class TrackedPoolMixin(object):
+
+    """Counts the connections of a urllib3 pool in its PoolStats, and closes
+    the connections idle for longer than idle_timeout instead of reusing
+    them, before the server closes them while a request is sent."""
+
+    stats = None
+
+    idle_timeout = None
+
+    def __init__(self, *args, **kwargs):
+        super(TrackedPoolMixin, self).__init__(*args, **kwargs)
+        stats = self.stats
+
+        class TrackedConnection(self.ConnectionCls):
+
+            def connect(self):
+                super(TrackedConnection, self).connect()
+                stats.add('created')
+
+        self.ConnectionCls = TrackedConnection
+        stats.add_pool(self)
+
+    def _get_conn(self, timeout=None):
+        conn = super(TrackedPoolMixin, self)._get_conn(timeout)
+        if getattr(conn, 'sock', None) is not None:
+            idle_since = getattr(conn, 'idle_since', None)
+            if self.idle_timeout is not None and idle_since is not None and \
+                    time.time() - idle_since > self.idle_timeout:
+                conn.close()
+                self.stats.add('evicted')
+            else:
+                self.stats.add('reused')
+        self.stats.add('in_use')
+        return conn
+
+    def _put_conn(self, conn):
+        self.stats.add('in_use', -1)
+        if conn is None:
+            return super(TrackedPoolMixin, self)._put_conn(conn)
+        was_open = getattr(conn, 'sock', None) is not None
+        conn.idle_since = time.time()
+        super(TrackedPoolMixin, self)._put_conn(conn)
+        if was_open and getattr(conn, 'sock', None) is None:
+            self.stats.add('discarded')
+
+
+class TrackedHTTPConnectionPool(TrackedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class TrackedHTTPSConnectionPool(TrackedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+
+    """An HTTPAdapter whose connection pools are counted in a PoolStats and
+    evict idle connections. It is given its socket options and SSL context
+    once, instead of with every request.
+
+    Attributes:
+        stats (PoolStats): The counters of the connections.
+        idle_timeout (float): The number of seconds after which an idle
+            connection is closed instead of being reused, None to keep it.
+        socket_options (list of tuple): The options set on the sockets, None
+            for the defaults of urllib3.
+        ssl_context (ssl.SSLContext): The SSL context shared by the HTTPS
+            connections, None to let urllib3 create one per connection.
+
+    """
+
+    def __init__(self, stats=None, idle_timeout=None, socket_options=None,
+                 ssl_context=None, **kwargs):
+        """Constructor for the PooledHTTPAdapter class
+
+        Args:
+            stats (PoolStats, optional): The counters, new ones when None.
+            idle_timeout (float, optional): The idle timeout of connections.
+            socket_options (list of tuple, optional): The socket options.
+            ssl_context (ssl.SSLContext, optional): The shared SSL context.
+            kwargs: The parameters of HTTPAdapter, e.g. pool_connections,
+                pool_maxsize, pool_block and max_retries.
+
+        """
+        self.stats = stats if stats is not None else PoolStats()
+        self.idle_timeout = idle_timeout
+        self.socket_options = socket_options
+        self.ssl_context = ssl_context
+        super(PooledHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.socket_options is not None:
+            pool_kwargs['socket_options'] = self.socket_options
+        if self.ssl_context is not None:
+            pool_kwargs['ssl_context'] = self.ssl_context
+        super(PooledHTTPAdapter, self).init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        attributes = {'stats': self.stats, 'idle_timeout': self.idle_timeout}
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': type('TrackedHTTPConnectionPool', (TrackedHTTPConnectionPool,), attributes),
+            'https': type('TrackedHTTPSConnectionPool', (TrackedHTTPSConnectionPool,), attributes)
+        }
+
+    def __setstate__(self, state):
+        # The pool manager is created again when an adapter is unpickled.
+        self.stats = state.get('stats') or PoolStats()
+        self.idle_timeout = state.get('idle_timeout')
+        self.socket_options = state.get('socket_options')
+        self.ssl_context = state.get('ssl_context')
+        super(PooledHTTPAdapter, self).__setstate__(state)
+
+
+class CachingPooledHTTPAdapter(PooledHTTPAdapter, CacheControlAdapter):
+
+    """A PooledHTTPAdapter caching the responses as instructed by their HTTP
+    caching headers."""
+
+    pass
@@ -38,6 +38,57 @@ class HttpClient(object):
         """
         raise NotImplementedError("Please Implement this method")
 
+    def execute_as_stream(self, request):
+        """Execute a given HttpRequest without reading its response body
+
+        Args:
+            request (HttpRequest): The given HttpRequest to execute.
+
+        Returns:
+            HttpStreamResponse: The response of the HttpRequest, its body is
+                read chunk by chunk.
+
+        """
+        raise NotImplementedError("Please Implement this method")
+
+    def is_transient_error(self, error):
+        """Tells whether an error raised while executing a request, such as
+        a connection reset or a timeout, may not happen again.
+
+        Args:
+            error (Exception): The error.
+
+        Returns:
+            bool: True when the request may be retried.
+
+        """
+        return False
+
+    def is_timeout_error(self, error):
+        """Tells whether an error is the response to a request timing out.
+
+        Args:
+            error (Exception): The error.
+
+        Returns:
+            bool: True for a timeout waiting for the response.
+
+        """
+        return False
+
+    def is_connect_error(self, error):
+        """Tells whether an error happened before the request was sent, such
+        as a refused connection.
+
+        Args:
+            error (Exception): The error.
+
+        Returns:
+            bool: True when the request did not reach the server.
+
+        """
+        return False
+
     def convert_response(self, response, binary):
         """Converts the Response object of the HttpClient into an
         HttpResponse object.
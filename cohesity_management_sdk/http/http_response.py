@@ -6,27 +6,60 @@ class HttpResponse(object):
     """Information about an HTTP Response including its status code, returned
         headers, and raw body
 
+    The body of a text response can be kept as the bytes received from the
+    server, in which case raw_body is only decoded when it is first read.
+
     Attributes:
         status_code (int): The status code response from the server that
             corresponds to this response.
         headers (dict): A dictionary of headers (key : value) that were
             returned with the response
         raw_body (string): The Raw body of the HTTP Response as a string
+        content (bytes): The undecoded body of a text response, None if
+            the body was given as a string.
+        encoding (string): The encoding of content. UTF-8 is assumed when
+            the server did not declare one.
 
     """
 
     def __init__(self,
                  status_code,
                  headers,
-                 raw_body):
+                 raw_body=None,
+                 content=None,
+                 encoding=None):
         """Constructor for the HttpResponse class
 
         Args:
             status_code (int): The response status code.
             headers (dict): The response headers.
             raw_body (string): The raw body from the server.
+            content (bytes, optional): The undecoded body from the server,
+                decoded into raw_body on demand.
+            encoding (string, optional): The encoding of content.
 
         """
         self.status_code = status_code
         self.headers = headers
-        self.raw_body = raw_body
+        self._raw_body = raw_body
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+
+    @property
+    def raw_body(self):
+        if self._raw_body is None and self.content is not None:
+            self._raw_body = self.content.decode(self.encoding, 'replace')
+        return self._raw_body
+
+    @raw_body.setter
+    def raw_body(self, value):
+        self._raw_body = value
+
+    @property
+    def json_body(self):
+        """The body to hand to a JSON decoder: the undecoded bytes when they
+        are UTF-8, which every decoder reads directly, and raw_body otherwise.
+        """
+        if self.content is not None and self.encoding.lower().replace('-', '') == 'utf8':
+            return self.content
+        return self.raw_body
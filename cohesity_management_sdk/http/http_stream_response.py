@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+from cohesity_management_sdk.http.http_response import HttpResponse
+
+
+class HttpStreamResponse(HttpResponse):
+
+    """An HTTP Response whose body is read from the connection in chunks
+    instead of being loaded into memory at once.
+
+    The connection stays open until the body has been read or release is
+    called, whichever comes first.
+
+    Attributes:
+        chunks (iterable): The chunks(bytes) of the body, an async iterable
+            for an AsyncHttpClient.
+        release (callable): Releases the connection of the response. It may
+            return an awaitable for an AsyncHttpClient.
+
+    """
+
+    def __init__(self,
+                 status_code,
+                 headers,
+                 chunks,
+                 release,
+                 encoding=None):
+        """Constructor for the HttpStreamResponse class
+
+        Args:
+            status_code (int): The response status code.
+            headers (dict): The response headers.
+            chunks (iterable): The chunks of the body.
+            release (callable): The function releasing the connection.
+            encoding (string, optional): The encoding of the body.
+
+        """
+        super(HttpStreamResponse, self).__init__(status_code, headers, encoding=encoding)
+        self.chunks = chunks
+        self.release = release
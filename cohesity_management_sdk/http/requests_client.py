@@ -1,17 +1,24 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+import socket
+import ssl
+import threading
+
 import requests
 
-from cachecontrol import CacheControl
-from requests.adapters import HTTPAdapter
+from cachecontrol.cache import DictCache
 from requests.packages import urllib3
+from requests.packages.urllib3.connection import HTTPConnection
 from requests.packages.urllib3.util.retry import Retry
+from requests.packages.urllib3.util.ssl_ import create_urllib3_context
 
 from cohesity_management_sdk.configuration import Configuration
+from cohesity_management_sdk.http.connection_pool import CachingPooledHTTPAdapter, PooledHTTPAdapter, PoolStats
 from cohesity_management_sdk.http.http_client import HttpClient
 from cohesity_management_sdk.http.http_method_enum import HttpMethodEnum
 from cohesity_management_sdk.http.http_response import HttpResponse
+from cohesity_management_sdk.http.http_stream_response import HttpStreamResponse
 
 
 class RequestsClient(HttpClient):
@@ -20,27 +27,133 @@ class RequestsClient(HttpClient):
 
     Attributes:
         timeout (int): The default timeout for all API requests.
+        config (Configuration): The configuration deciding whether SSL
+            certificates are verified.
+        stream_chunk_size (int): The size(bytes) of the chunks a streamed
+            response body is read in.
+        stats (PoolStats): The counters of the connections of the session.
 
     """
 
-    def __init__(self, timeout=60, cache=False, max_retries=None, retry_interval=None):
+    stream_chunk_size = 64 * 1024
+
+    def __init__(self, timeout=60, cache=False, max_retries=None, retry_interval=None, config=None,
+                 pool_connections=20, pool_maxsize=32, pool_block=False, idle_timeout=30.0,
+                 tcp_keepalive=True):
         """The constructor.
 
         Args:
             timeout (float): The default global timeout(seconds).
+            cache (bool, optional): Whether responses are cached as instructed
+                by their HTTP caching headers.
+            max_retries (int, optional): The retries made by urllib3, for
+                every HTTP method alike. They are made in addition to those
+                of a Configuration.retry_policy, which should be preferred
+                to them: leave it None along with a policy.
+            retry_interval (float, optional): The backoff factor of the
+                urllib3 retries.
+            config (Configuration, optional): The configuration of the client
+                owning this HttpClient. The class level Configuration is used
+                when None.
+            pool_connections (int, optional): The number of hosts, such as
+                the nodes of a node pool, whose connections are kept.
+            pool_maxsize (int, optional): The number of connections kept
+                open per host. Requests sent by more threads at once open
+                extra connections, closed once answered, unless pool_block
+                is set. Raise it along with the concurrency of the client.
+            pool_block (bool, optional): Whether requests wait for a
+                connection of the pool instead of opening extra ones.
+            idle_timeout (float, optional): The number of seconds after
+                which an idle connection is closed instead of being reused,
+                before the cluster closes it. None to keep them open.
+            tcp_keepalive (bool, optional): Whether TCP keep-alive probes are
+                sent on the connections, so that connections dropped by a
+                firewall are detected.
 
         """
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         self.timeout = timeout
+        self.config = config if config != None else Configuration
         self.session = requests.session()
+        self.stats = PoolStats()
+        self._lock = threading.Lock()
+        self._verify = None
 
+        adapter_kwargs = {
+            'stats': self.stats,
+            'idle_timeout': idle_timeout,
+            'pool_connections': pool_connections,
+            'pool_maxsize': pool_maxsize,
+            'pool_block': pool_block
+        }
+        if tcp_keepalive:
+            adapter_kwargs['socket_options'] = HTTPConnection.default_socket_options + \
+                [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
         if max_retries and retry_interval:
-            retries = Retry(total=max_retries, backoff_factor=retry_interval)
-            self.session.mount('http://', HTTPAdapter(max_retries=retries))
-            self.session.mount('https://', HTTPAdapter(max_retries=retries))
-
+            adapter_kwargs['max_retries'] = Retry(total=max_retries, backoff_factor=retry_interval)
         if cache:
-            self.session = CacheControl(self.session)
+            # One cache for both schemes, kept when the adapters are mounted
+            # again.
+            adapter_kwargs['cache'] = DictCache()
+        self._adapter_class = CachingPooledHTTPAdapter if cache else PooledHTTPAdapter
+        self._adapter_kwargs = adapter_kwargs
+
+    def get_session(self):
+        """Returns the session, configured for the current SSL verification
+        setting of the configuration.
+
+        The setting is applied once, then again only when
+        Configuration.skip_ssl_verification changes, instead of with every
+        request. Requests pass session.verify explicitly all the same, since
+        requests otherwise lets the REQUESTS_CA_BUNDLE environment variable
+        turn verification back on.
+
+        Returns:
+            requests.Session: The session.
+
+        """
+        verify = not self.config.skip_ssl_verification
+        if verify != self._verify:
+            with self._lock:
+                if verify != self._verify:
+                    self.configure(verify)
+        return self.session
+
+    def configure(self, verify):
+        """Mounts the adapters of the session for an SSL verification
+        setting. The HTTPS connections of the adapters share one SSL context.
+
+        The adapters mounted before are closed along with their idle
+        connections, the connections in use being closed once released.
+        Their counters are kept in stats.
+
+        Args:
+            verify (bool): Whether SSL certificates are verified.
+
+        """
+        ssl_context = None
+        if not verify:
+            ssl_context = create_urllib3_context(cert_reqs=ssl.CERT_NONE)
+            ssl_context.check_hostname = False
+        kwargs = dict(self._adapter_kwargs, ssl_context=ssl_context)
+        previous = list(self.session.adapters.values())
+        self.session.verify = verify
+        self.session.mount('http://', self._adapter_class(**kwargs))
+        self.session.mount('https://', self._adapter_class(**kwargs))
+        for adapter in previous:
+            adapter.close()
+        self._verify = verify
+
+    def get_pool_stats(self):
+        """Returns the counters of the connections of the session.
+
+        Returns:
+            dict: The connections created, reused, discarded because the
+                pool was full and evicted because they were idle, along
+                with the connections in use and idle now.
+
+        """
+        return self.stats.snapshot()
 
     def execute_as_string(self, request):
         """Execute a given HttpRequest to get a string response back
@@ -52,15 +165,15 @@ class RequestsClient(HttpClient):
             HttpResponse: The response of the HttpRequest.
 
         """
-        self.session.verify = not Configuration.skip_ssl_verification
-
-        response = self.session.request(HttpMethodEnum.to_string(request.http_method),
-                                        request.query_url,
-                                        headers=request.headers,
-                                        params=request.query_parameters,
-                                        data=request.parameters,
-                                        files=request.files,
-                                        timeout=self.timeout)
+        session = self.get_session()
+        response = session.request(HttpMethodEnum.to_string(request.http_method),
+                                   request.query_url,
+                                   headers=request.headers,
+                                   params=request.query_parameters,
+                                   data=request.parameters,
+                                   files=request.files,
+                                   timeout=self.timeout,
+                                   verify=session.verify)
 
         return self.convert_response(response, False)
 
@@ -74,22 +187,97 @@ class RequestsClient(HttpClient):
             HttpResponse: The response of the HttpRequest.
 
         """
-        self.session.verify = not Configuration.skip_ssl_verification
-
-        response = self.session.request(HttpMethodEnum.to_string(request.http_method),
-                                        request.query_url,
-                                        headers=request.headers,
-                                        params=request.query_parameters,
-                                        data=request.parameters,
-                                        files=request.files,
-                                        timeout=self.timeout)
+        session = self.get_session()
+        response = session.request(HttpMethodEnum.to_string(request.http_method),
+                                   request.query_url,
+                                   headers=request.headers,
+                                   params=request.query_parameters,
+                                   data=request.parameters,
+                                   files=request.files,
+                                   timeout=self.timeout,
+                                   verify=session.verify)
 
         return self.convert_response(response, True)
 
+    def execute_as_stream(self, request):
+        """Execute a given HttpRequest without reading its response body
+
+        Args:
+            request (HttpRequest): The given HttpRequest to execute.
+
+        Returns:
+            HttpStreamResponse: The response of the HttpRequest, its body is
+                read chunk by chunk.
+
+        """
+        session = self.get_session()
+        response = session.request(HttpMethodEnum.to_string(request.http_method),
+                                   request.query_url,
+                                   headers=request.headers,
+                                   params=request.query_parameters,
+                                   data=request.parameters,
+                                   files=request.files,
+                                   timeout=self.timeout,
+                                   verify=session.verify,
+                                   stream=True)
+
+        return HttpStreamResponse(response.status_code, response.headers,
+                                  response.iter_content(self.stream_chunk_size),
+                                  response.close,
+                                  encoding=self.get_charset(response.headers))
+
+    def is_transient_error(self, error):
+        """Tells whether an error raised while executing a request, such as
+        a connection reset or a timeout, may not happen again.
+
+        Args:
+            error (Exception): The error.
+
+        Returns:
+            bool: True when the request may be retried.
+
+        """
+        return isinstance(error, (requests.exceptions.ConnectionError,
+                                  requests.exceptions.Timeout)) and \
+            not isinstance(error, requests.exceptions.SSLError)
+
+    def is_timeout_error(self, error):
+        """Tells whether an error is the response to a request timing out.
+
+        Args:
+            error (Exception): The error.
+
+        Returns:
+            bool: True for a timeout waiting for the response.
+
+        """
+        return isinstance(error, requests.exceptions.ReadTimeout)
+
+    def is_connect_error(self, error):
+        """Tells whether an error happened before the request was sent, such
+        as a refused connection.
+
+        Args:
+            error (Exception): The error.
+
+        Returns:
+            bool: True when the request did not reach the server.
+
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(error, requests.exceptions.ConnectionError) and \
+            isinstance(reason, urllib3.exceptions.NewConnectionError)
+
     def convert_response(self, response, binary):
         """Converts the Response object of the HttpClient into an
         HttpResponse object.
 
+        The body of a text response is kept as bytes and decoded with the
+        charset declared by the server, UTF-8 if there is none, only when it
+        is read as a string.
+
         Args:
             response (dynamic): The original response object.
 
@@ -100,4 +288,24 @@ class RequestsClient(HttpClient):
         if binary:
             return HttpResponse(response.status_code, response.headers, response.content)
         else:
-            return HttpResponse(response.status_code, response.headers, response.text)
+            return HttpResponse(response.status_code, response.headers,
+                                content=response.content,
+                                encoding=self.get_charset(response.headers))
+
+    @staticmethod
+    def get_charset(headers):
+        """Extracts the charset declared in the Content-Type header.
+
+        Args:
+            headers (dict): The response headers.
+
+        Returns:
+            string: The declared charset, None if there is none.
+
+        """
+        content_type = headers.get('content-type') or ''
+        for param in content_type.split(';')[1:]:
+            key, _, value = param.strip().partition('=')
+            if key.strip().lower() == 'charset':
+                return value.strip().strip('"\'') or None
+        return None
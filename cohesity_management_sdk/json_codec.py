@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import json
+import codecs
+import datetime
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_default(obj):
+    """Converts the objects the JSON backends do not know about.
+
+    Models are converted to dictionaries keyed by their API property names
+    and CustomDate wrappers to their serialized value.
+
+    Args:
+        obj (object): The object to convert.
+
+    Returns:
+        object: A JSON serializable representation of the object.
+
+    """
+    from cohesity_management_sdk.api_helper import APIHelper
+
+    if hasattr(obj, '_names'):
+        return APIHelper.to_dictionary(obj)
+    if isinstance(obj, APIHelper.CustomDate):
+        return obj.value
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, '__dict__'):
+        return vars(obj)
+    raise TypeError("Object of type {} is not JSON serializable".format(type(obj).__name__))
+
+
+class JsonCodec(object):
+
+    """An interface for the JSON backends used to serialize request bodies
+    and deserialize response bodies.
+
+    This class should not be instantiated but should be used as a base class
+    for JsonCodec classes.
+
+    Attributes:
+        name (string): The name the codec is registered under.
+
+    """
+
+    name = None
+
+    def encode(self, obj):
+        """Serializes an object to a JSON string.
+
+        Args:
+            obj (object): The object to serialize.
+
+        Returns:
+            str: The JSON serialized string of the object.
+
+        """
+        raise NotImplementedError("Please Implement this method")
+
+    def decode(self, data):
+        """Deserializes a JSON document.
+
+        Args:
+            data (str|bytes): The JSON document to deserialize.
+
+        Returns:
+            object: The deserialized document.
+
+        Raises:
+            ValueError: When the document is not valid JSON.
+
+        """
+        raise NotImplementedError("Please Implement this method")
+
+
+class StdlibJsonCodec(JsonCodec):
+
+    """A JsonCodec using the json module of the standard library."""
+
+    name = 'json'
+
+    def encode(self, obj):
+        return json.dumps(obj, default=encode_default, separators=(',', ':'))
+
+    def decode(self, data):
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+
+class OrjsonCodec(StdlibJsonCodec):
+
+    """A JsonCodec using orjson. It falls back on the standard library for
+    documents orjson does not support, such as integers above 64 bits.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson codec requires the orjson package.")
+
+    def encode(self, obj):
+        try:
+            return orjson.dumps(obj, default=encode_default,
+                                option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            return super(OrjsonCodec, self).encode(obj)
+
+    def decode(self, data):
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            return super(OrjsonCodec, self).decode(data)
+
+
+codec_classes = {
+    StdlibJsonCodec.name: StdlibJsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+_codecs = {}
+
+
+def register_codec(codec_class):
+    """Makes a JsonCodec selectable by its name.
+
+    Args:
+        codec_class (type): The JsonCodec subclass to register.
+
+    """
+    codec_classes[codec_class.name] = codec_class
+    _codecs.pop(codec_class.name, None)
+
+
+def get_codec(codec=None):
+    """Resolves the JsonCodec to use.
+
+    Args:
+        codec (string|JsonCodec, optional): A codec, or the name of one.
+            'auto' selects the fastest codec installed. The standard library
+            codec is used when None.
+
+    Returns:
+        JsonCodec: The codec.
+
+    """
+    if codec is None:
+        codec = StdlibJsonCodec.name
+    elif isinstance(codec, JsonCodec):
+        return codec
+    elif codec == 'auto':
+        codec = OrjsonCodec.name if orjson is not None else StdlibJsonCodec.name
+    try:
+        return _codecs[codec]
+    except KeyError:
+        if codec not in codec_classes:
+            raise ValueError("Unknown JSON codec: {}".format(codec))
+        _codecs[codec] = codec_classes[codec]()
+        return _codecs[codec]
+
+
+class JsonArrayStream(object):
+
+    """An incremental decoder yielding the items of a JSON array as the
+    document arrives in chunks.
+
+    Only one item is held in memory at a time, besides the chunk being
+    parsed, so the memory used does not depend on the size of the array.
+    The chunks of an item are scanned once as they arrive, keeping track of
+    its nesting, and the item is decoded once it is complete.
+    The array is either the document itself or found under a path of
+    object keys, e.g. ['views'] for {"views": [...], "lastResult": true}.
+
+    Example:
+        stream = JsonArrayStream(['views'])
+        for chunk in chunks:
+            for item in stream.feed(chunk):
+                handle(item)
+        for item in stream.close():
+            handle(item)
+
+    """
+
+    _whitespace = ' \t\n\r'
+    _number_chars = '0123456789.eE+-'
+    _string = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+    _non_bracket = re.compile(r'[^\[\]{}]+')
+    _token = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}"]')
+    _string_end = re.compile(r'["\\]')
+
+    def __init__(self, path=None):
+        """Constructor for the JsonArrayStream class
+
+        Args:
+            path (list of string, optional): The keys leading to the array.
+                The document itself is the array when None.
+
+        """
+        self.path = list(path or [])
+        self._depth = 0
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')('strict')
+        self._buffer = ''
+        self._pos = 0
+        self._state = 'start'
+        # The nesting depth, string and escape state of an incomplete value,
+        # and the chunks received since it started.
+        self._scan = None
+        self._chunks = []
+
+    def feed(self, chunk):
+        """Parses the next chunk of the document.
+
+        Args:
+            chunk (bytes|str): The next part of the document.
+
+        Returns:
+            list: The array items completed by this chunk.
+
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+        if self._scan is not None:
+            self._chunks.append(chunk)
+            if self._scan_value(chunk, 0) < 0:
+                return []
+            chunk = ''.join(self._chunks)
+            self._chunks = []
+            self._scan = None
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return self._parse(False)
+
+    def close(self):
+        """Parses the end of the document.
+
+        Returns:
+            list: The array items completed by the end of the document.
+
+        Raises:
+            ValueError: When the document is truncated or not valid JSON.
+
+        """
+        self._chunks.append(self._text_decoder.decode(b'', True))
+        self._buffer = self._buffer[self._pos:] + ''.join(self._chunks)
+        self._pos = 0
+        self._chunks = []
+        self._scan = None
+        items = self._parse(True)
+        if self._state != 'done':
+            raise ValueError("Incomplete JSON document.")
+        return items
+
+    def _next_char(self):
+        """Skips whitespace and returns the next character, None when more
+        data is needed."""
+        buffer = self._buffer
+        pos = self._pos
+        while pos < len(buffer) and buffer[pos] in self._whitespace:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else None
+
+    def _scan_value(self, text, pos):
+        """Scans text for the end of the object, array or string started
+        before, from the state left by the previous chunks. Returns the
+        position following it, -1 when it goes on past text."""
+        depth, in_string, escaped = self._scan
+        end = len(text)
+        skipped = False
+        while pos < end:
+            if in_string:
+                if escaped:
+                    pos += 1
+                    escaped = False
+                    continue
+                match = self._string_end.search(text, pos)
+                if match is None:
+                    pos = end
+                    break
+                pos = match.end()
+                if match.group() == '\\':
+                    escaped = True
+                    continue
+                in_string = False
+                if depth == 0:
+                    return pos
+                continue
+            if depth > 0 and not skipped:
+                skipped = True
+                if self._skip(text, pos, depth):
+                    return -1
+            # Whole strings are skipped by one match, a string going on past
+            # text only matches its opening quote.
+            match = self._token.search(text, pos)
+            if match is None:
+                break
+            pos = match.end()
+            token = match.group()
+            if token == '"':
+                in_string = True
+            elif token in '[{':
+                depth += 1
+            elif token in ']}':
+                depth -= 1
+                if depth == 0:
+                    return pos
+        self._scan = [depth, in_string, escaped]
+        return -1
+
+    def _skip(self, text, pos, depth):
+        """Skips the rest of text in one go when it closes fewer brackets
+        than the depth, and so cannot hold the end of the value. Returns
+        False when it may, to scan it token by token."""
+        rest = self._string.sub('', text[pos:])
+        # What follows a quote left is a string going on past text.
+        quote = rest.find('"')
+        if quote >= 0:
+            rest = rest[:quote]
+        brackets = self._non_bracket.sub('', rest)
+        while True:
+            # Matching pairs cancel out, leaving the brackets closed ahead of
+            # those opened.
+            paired = brackets.replace('[]', '').replace('{}', '')
+            if len(paired) == len(brackets):
+                break
+            brackets = paired
+        closing = len(brackets) - len(brackets.lstrip(']}'))
+        if closing >= depth:
+            return False
+        escaped = quote >= 0 and (len(text) - len(text.rstrip('\\'))) % 2 == 1
+        self._scan = [depth + len(brackets) - 2 * closing, quote >= 0, escaped]
+        return True
+
+    def _value(self, final):
+        """Decodes the value at the current position, None when more data is
+        needed. A value touching the end of the data read so far may still
+        continue, e.g. a number, so it is only decoded once more data or the
+        end of the document arrives. Incomplete objects, arrays and strings
+        are scanned instead, and decoded again once their end arrives."""
+        char = self._next_char()
+        if char is None and not final:
+            return None
+        scanned = char is not None and char in '[{"'
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except ValueError:
+            if final:
+                raise
+            if scanned:
+                # Scan the value as it arrives, to decode it only once it is
+                # complete.
+                self._scan = [0, False, False]
+                if self._scan_value(self._buffer, self._pos) >= 0:
+                    raise
+            return None
+        if not final and not scanned:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                # '1.' or '1e' decode as a shorter number.
+                while end < len(self._buffer) and self._buffer[end] in self._number_chars:
+                    end += 1
+            if end == len(self._buffer):
+                return None
+        self._pos = end
+        return (value,)
+
+    def _expect(self, char, final):
+        """Consumes the expected character, False when more data is needed."""
+        found = self._next_char()
+        if found is None:
+            if final:
+                raise ValueError("Incomplete JSON document.")
+            return False
+        if found != char:
+            raise ValueError("Expected '{}' at position {}.".format(char, self._pos))
+        self._pos += 1
+        return True
+
+    def _parse(self, final):
+        items = []
+        while self._state != 'done':
+            if self._state == 'start':
+                if not self._expect('[' if not self.path else '{', final):
+                    break
+                self._state = 'first_item' if not self.path else 'first_key'
+            elif self._state in ('first_key', 'key'):
+                char = self._next_char()
+                if char is None:
+                    if final:
+                        raise ValueError("Incomplete JSON document.")
+                    break
+                if char == '}':
+                    # The path is not in the document, there are no items.
+                    self._state = 'done'
+                    break
+                start = self._pos
+                if self._state == 'key':
+                    if char != ',':
+                        raise ValueError("Expected ',' at position {}.".format(self._pos))
+                    self._pos += 1
+                key = self._value(final)
+                if key is None or not self._expect(':', final):
+                    self._pos = start
+                    break
+                if key[0] != self.path[self._depth]:
+                    value = self._value(final)
+                    if value is None:
+                        self._pos = start
+                        break
+                    self._state = 'key'
+                elif self._depth + 1 < len(self.path):
+                    if not self._expect('{', final):
+                        self._pos = start
+                        break
+                    self._depth += 1
+                    self._state = 'first_key'
+                else:
+                    char = self._next_char()
+                    if char is None:
+                        self._pos = start
+                        if final:
+                            raise ValueError("Incomplete JSON document.")
+                        break
+                    if char == 'n':
+                        # A null array has no items.
+                        self._state = 'done'
+                        break
+                    self._expect('[', final)
+                    self._state = 'first_item'
+            else:
+                char = self._next_char()
+                if char is None:
+                    if final:
+                        raise ValueError("Incomplete JSON document.")
+                    break
+                if char == ']':
+                    self._pos += 1
+                    self._state = 'done'
+                    break
+                start = self._pos
+                if self._state == 'item':
+                    if char != ',':
+                        raise ValueError("Expected ',' at position {}.".format(self._pos))
+                    self._pos += 1
+                item = self._value(final)
+                if item is None:
+                    self._pos = start
+                    break
+                items.append(item[0])
+                self._state = 'item'
+        return items
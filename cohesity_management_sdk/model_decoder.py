@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import importlib
+import threading
+
+MODELS_PACKAGE = 'cohesity_management_sdk.models'
+
+_decoders = {}
+_lazy_decoders = {}
+_lock = threading.RLock()
+
+
+def decode_model(cls, dictionary, lazy=False):
+    """Creates an instance of a model from a dictionary.
+
+    Args:
+        cls (type): The model class.
+        dictionary (dict): A dictionary representation of the object as
+            obtained from the deserialization of the server's response.
+        lazy (bool, optional): True to decode the nested structures only
+            when their property is first read.
+
+    Returns:
+        object: An instance of the model, None if the dictionary is None.
+
+    """
+    try:
+        decoder = (_lazy_decoders if lazy else _decoders)[cls]
+    except KeyError:
+        decoder = get_decoder(cls, lazy)
+    return decoder(dictionary)
+
+
+def get_decoder(cls, lazy=False):
+    """Returns the function decoding dictionaries into instances of a model,
+    compiling it on first use.
+
+    Args:
+        cls (type): The model class.
+        lazy (bool, optional): True for the decoder of lazy instances.
+
+    Returns:
+        callable: The decoder of the model.
+
+    """
+    decoders = _lazy_decoders if lazy else _decoders
+    try:
+        return decoders[cls]
+    except KeyError:
+        with _lock:
+            if cls not in decoders:
+                decoders[cls] = compile_decoder(cls, lazy)
+            return decoders[cls]
+
+
+def get_fields(cls):
+    """Builds the field schema of a model out of its _names and _types
+    mappings.
+
+    Args:
+        cls (type): The model class.
+
+    Returns:
+        list of tuple: A (name, API name, model, is a list) tuple for every
+            field. The model is None for the fields holding plain JSON values.
+
+    """
+    types = getattr(cls, '_types', {})
+    fields = []
+    for name, key in cls._names.items():
+        model = types.get(name)
+        is_list = isinstance(model, list)
+        if is_list:
+            model = model[0]
+        fields.append((name, key, resolve_model(model), is_list))
+    return fields
+
+
+def resolve_model(model):
+    """Resolves a nested model named in the _types of a model.
+
+    Args:
+        model (string|type): The nested model, or its 'module.Class' path in
+            the models package.
+
+    Returns:
+        type: The nested model class, None if model is None.
+
+    """
+    if model is None or isinstance(model, type):
+        return model
+    module, _, name = model.rpartition('.')
+    return getattr(importlib.import_module('{}.{}'.format(MODELS_PACKAGE, module)), name)
+
+
+def compile_decoder(cls, lazy=False):
+    """Compiles the decoder of a model into a function specialized for its
+    fields: every key is read once and nested models are decoded by their
+    own compiled decoders, without going through from_dictionary.
+
+    The constructors of the generated models only store their arguments, so
+    the fields of their instances are set directly. The constructor of any
+    other model is called with the decoded fields as keyword arguments.
+
+    A lazy decoder creates an instance of the lazy subclass of the model,
+    which keeps the dictionary and decodes its nested structures when they
+    are first read. Models with their own constructor are always decoded
+    eagerly.
+
+    Args:
+        cls (type): The model class.
+        lazy (bool, optional): True to compile the decoder of lazy instances.
+
+    Returns:
+        callable: The decoder of the model.
+
+    """
+    generated = cls.__init__.__module__.startswith(MODELS_PACKAGE + '.')
+    lazy = lazy and generated
+    namespace = {'cls': lazy_class(cls) if lazy else cls, 'new': object.__new__}
+    lines = ['def decode(dictionary):',
+             '    if dictionary is None:',
+             '        return None',
+             '    get = dictionary.get']
+    values = []
+    for index, (name, key, model, is_list) in enumerate(get_fields(cls)):
+        if model is None:
+            values.append((name, 'get({!r})'.format(key)))
+            continue
+        if lazy:
+            continue
+        decoder = 'decode_{}'.format(index)
+        namespace[decoder] = _deferred(namespace, decoder, model)
+        lines.append('    value_{} = get({!r})'.format(index, key))
+        if is_list:
+            values.append((name, 'list(map({0}, value_{1})) if value_{1} is not None else None'
+                                 .format(decoder, index)))
+        else:
+            values.append((name, '{0}(value_{1}) if value_{1} else None'.format(decoder, index)))
+    if generated:
+        lines.append('    instance = new(cls)')
+        if lazy:
+            lines.append('    instance._raw = dictionary')
+        lines.extend('    instance.{} = {}'.format(name, value) for name, value in values)
+        lines.append('    return instance')
+    else:
+        lines.append('    return cls({})'.format(',\n               '.join(
+            '{}={}'.format(name, value) for name, value in values)))
+    exec(compile('\n'.join(lines), '<decoder of {}>'.format(cls.__name__), 'exec'), namespace)
+    return namespace['decode']
+
+
+_lazy_classes = {}
+
+
+def lazy_class(cls):
+    """Returns the lazy subclass of a model, creating it on first use.
+
+    Its instances keep the dictionary they were decoded from, in _raw, and
+    decode each nested structure the first time its property is read. The
+    decoded value is then cached in the instance. They are instances of the
+    model as well and are pickled and copied as regular instances of it.
+
+    Args:
+        cls (type): The model class.
+
+    Returns:
+        type: The lazy subclass.
+
+    """
+    with _lock:
+        if cls not in _lazy_classes:
+            attributes = {
+                '__module__': cls.__module__,
+                '__doc__': cls.__doc__,
+                '__reduce__': _reduce_lazy,
+            }
+            for name, key, model, is_list in get_fields(cls):
+                if model is not None:
+                    attributes[name] = LazyField(name, key, model, is_list)
+            _lazy_classes[cls] = type(cls.__name__, (cls,), attributes)
+        return _lazy_classes[cls]
+
+
+def _reduce_lazy(self):
+    from cohesity_management_sdk.api_helper import APIHelper
+    return decode_model, (type(self).__bases__[0], APIHelper.to_dictionary(self))
+
+
+class LazyField(object):
+
+    """The property of a nested structure of a lazy model instance. It
+    decodes the structure from the dictionary of the instance when it is
+    first read, and caches it in the instance.
+
+    Attributes:
+        name (string): The name of the property.
+        key (string): The API name of the property.
+        model (type): The model of the structure.
+        is_list (bool): True if the property holds an array of structures.
+
+    """
+
+    def __init__(self, name, key, model, is_list):
+        self.name = name
+        self.key = key
+        self.model = model
+        self.is_list = is_list
+        self.decoder = None
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if self.decoder is None:
+            self.decoder = get_decoder(self.model, lazy=True)
+        value = instance._raw.get(self.key)
+        if self.is_list:
+            value = list(map(self.decoder, value)) if value is not None else None
+        else:
+            value = self.decoder(value) if value else None
+        instance.__dict__[self.name] = value
+        return value
+
+
+def _deferred(namespace, decoder, model):
+    """Stands in for the decoder of a nested model until it is first needed,
+    then replaces itself in the namespace of the compiled function. Models
+    are only compiled once they are met in a response, and recursive models
+    do not have to be compiled ahead of themselves."""
+    def decode(dictionary):
+        namespace[decoder] = get_decoder(model)
+        return namespace[decoder](dictionary)
+    return decode
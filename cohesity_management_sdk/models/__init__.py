@@ -1116,4 +1116,1144 @@ __all__ = [
     'worm_retention_type_data_migration_policy_enum',
     'worm_retention_type_protection_policy_enum',
     'worm_retention_type_protection_policy_request_enum',
-]
\ No newline at end of file
+]
+
+# The module of every model, for the models imported from the package itself,
+# e.g. from cohesity_management_sdk.models import ProtectionJob
+_modules = {
+    'ADAttributeRestoreParam': 'ad_attribute_restore_param',
+    'ADGuidPairADAttributeRestoreParam': 'ad_guid_pair_ad_attribute_restore_param',
+    'ADObject': 'ad_object',
+    'ADObjectRestoreParam': 'ad_object_restore_param',
+    'ADObjectRestoreStatus': 'ad_object_restore_status',
+    'ADObjectRestoreStatusADAttributeRestoreStatus': 'ad_object_restore_status_ad_attribute_restore_status',
+    'ADRestoreStatus': 'ad_restore_status',
+    'ADUpdateRestoreTaskOptions': 'ad_update_restore_task_options',
+    'AWSSnapshotManagerParams': 'aws_snapshot_manager_params',
+    'AagAndDatabases': 'aag_and_databases',
+    'AagPreferenceEnum': 'aag_preference_enum',
+    'AccessEnum': 'access_enum',
+    'AccessInfoListEnum': 'access_info_list_enum',
+    'AccessToken': 'access_token',
+    'AccessTokenCredential': 'access_token_credential',
+    'AclModeEnum': 'acl_mode_enum',
+    'AcropolisProtectionSource': 'acropolis_protection_source',
+    'AcropolisRestoreParameters': 'acropolis_restore_parameters',
+    'ActionEnum': 'action_enum',
+    'ActionUpdateProtectionJobsStateParamsEnum': 'action_update_protection_jobs_state_params_enum',
+    'ActivateViewAliasesResult': 'activate_view_aliases_result',
+    'ActiveAlertsStats': 'active_alerts_stats',
+    'ActiveDirectoryEntry': 'active_directory_entry',
+    'ActiveDirectoryPrincipal': 'active_directory_principal',
+    'ActiveDirectoryPrincipalsAddParameters': 'active_directory_principals_add_parameters',
+    'AdAttribute': 'ad_attribute',
+    'AdAttributeFlagEnum': 'ad_attribute_flag_enum',
+    'AdDomain': 'ad_domain',
+    'AdDomainController': 'ad_domain_controller',
+    'AdDomainIdentity': 'ad_domain_identity',
+    'AdGuidPair': 'ad_guid_pair',
+    'AdObjectAttributeParameters': 'ad_object_attribute_parameters',
+    'AdObjectFlagEnum': 'ad_object_flag_enum',
+    'AdObjectMetaData': 'ad_object_meta_data',
+    'AdObjectRestoreInformation': 'ad_object_restore_information',
+    'AdObjectRestoreParameters': 'ad_object_restore_parameters',
+    'AdObjectsRestoreStatus': 'ad_objects_restore_status',
+    'AdProtectionSource': 'ad_protection_source',
+    'AdRestoreOptions': 'ad_restore_options',
+    'AdRestoreParameters': 'ad_restore_parameters',
+    'AdRootTopologyObject': 'ad_root_topology_object',
+    'AddedActiveDirectoryPrincipal': 'added_active_directory_principal',
+    'AddedIdpPrincipal': 'added_idp_principal',
+    'AdditionalOracleDBParams': 'additional_oracle_db_params',
+    'AgentDeploymentStatusResponse': 'agent_deployment_status_response',
+    'AgentInformation': 'agent_information',
+    'AgentTypeEnum': 'agent_type_enum',
+    'AggregatedSubtreeInfo': 'aggregated_subtree_info',
+    'Alert': 'alert',
+    'AlertCategoryEnum': 'alert_category_enum',
+    'AlertCategoryListEnum': 'alert_category_list_enum',
+    'AlertCategoryListGetAlertsEnum': 'alert_category_list_get_alerts_enum',
+    'AlertCategoryName': 'alert_category_name',
+    'AlertDocument': 'alert_document',
+    'AlertMetadata': 'alert_metadata',
+    'AlertProperty': 'alert_property',
+    'AlertResolution': 'alert_resolution',
+    'AlertResolutionDetails': 'alert_resolution_details',
+    'AlertResolutionInfo': 'alert_resolution_info',
+    'AlertResolutionRequest': 'alert_resolution_request',
+    'AlertSeverityListEnum': 'alert_severity_list_enum',
+    'AlertStateEnum': 'alert_state_enum',
+    'AlertStateListEnum': 'alert_state_list_enum',
+    'AlertTypeBucketEnum': 'alert_type_bucket_enum',
+    'AlertTypeBucketListEnum': 'alert_type_bucket_list_enum',
+    'AlertingConfig': 'alerting_config',
+    'AlertingPolicyEnum': 'alerting_policy_enum',
+    'AlertingPolicyProto': 'alerting_policy_proto',
+    'AlgorithmEnum': 'algorithm_enum',
+    'AliasSmbConfig': 'alias_smb_config',
+    'AmazonCloudCredentials': 'amazon_cloud_credentials',
+    'AntivirusScanConfig': 'antivirus_scan_config',
+    'AntivirusServiceConfig': 'antivirus_service_config',
+    'AntivirusServiceConfigParams': 'antivirus_service_config_params',
+    'AntivirusServiceGroup': 'antivirus_service_group',
+    'AntivirusServiceGroupParams': 'antivirus_service_group_params',
+    'AntivirusServiceGroupStateParams': 'antivirus_service_group_state_params',
+    'ApolloIOPreferentialTierEnum': 'apollo_io_preferential_tier_enum',
+    'ApolloWalIOPreferentialTierEnum': 'apollo_wal_io_preferential_tier_enum',
+    'AppMetadata': 'app_metadata',
+    'AppOwnerRestoreInfo': 'app_owner_restore_info',
+    'AppendHostsParameters': 'append_hosts_parameters',
+    'ApplicationEnum': 'application_enum',
+    'ApplicationEnvironmentApplicationsRestoreTaskRequestEnum': 'application_environment_applications_restore_task_request_enum',
+    'ApplicationEnvironmentEnum': 'application_environment_enum',
+    'ApplicationInfo': 'application_info',
+    'ApplicationParameters': 'application_parameters',
+    'ApplicationRestoreObject': 'application_restore_object',
+    'ApplicationRestoreParameters': 'application_restore_parameters',
+    'ApplicationSpecialParameters': 'application_special_parameters',
+    'ApplicationsRestoreTaskRequest': 'applications_restore_task_request',
+    'AppsConfig': 'apps_config',
+    'AppsModeEnum': 'apps_mode_enum',
+    'ArchivalExternalTarget': 'archival_external_target',
+    'ArchivalTarget': 'archival_target',
+    'AthenaIOPreferentialTierEnum': 'athena_io_preferential_tier_enum',
+    'AthenaSlowerIOPreferentialTierEnum': 'athena_slower_io_preferential_tier_enum',
+    'AttributeRestoreInformation': 'attribute_restore_information',
+    'AttributeValue': 'attribute_value',
+    'AuditLogsTile': 'audit_logs_tile',
+    'AuthTypeEnum': 'auth_type_enum',
+    'AuthenticationStatusEnum': 'authentication_status_enum',
+    'AuthenticationTypeEnum': 'authentication_type_enum',
+    'AuthenticationTypeUserEnum': 'authentication_type_user_enum',
+    'AwsCredentials': 'aws_credentials',
+    'AwsParams': 'aws_params',
+    'AwsProtectionSource': 'aws_protection_source',
+    'AwsSnapshotManagerParameters': 'aws_snapshot_manager_parameters',
+    'AwsTypeEnum': 'aws_type_enum',
+    'AzureCloudCredentials': 'azure_cloud_credentials',
+    'AzureCredentials': 'azure_credentials',
+    'AzureManagedDiskParams': 'azure_managed_disk_params',
+    'AzureParams': 'azure_params',
+    'AzureProtectionSource': 'azure_protection_source',
+    'AzureTypeEnum': 'azure_type_enum',
+    'BackupJobPreOrPostScript': 'backup_job_pre_or_post_script',
+    'BackupJobProto': 'backup_job_proto',
+    'BackupJobProtoBackupSource': 'backup_job_proto_backup_source',
+    'BackupJobProtoDRToCloudParams': 'backup_job_proto_dr_to_cloud_params',
+    'BackupJobProtoExcludeSource': 'backup_job_proto_exclude_source',
+    'BackupJobProtoExclusionTimeRange': 'backup_job_proto_exclusion_time_range',
+    'BackupPolicyProto': 'backup_policy_proto',
+    'BackupPolicyProtoContinuousSchedule': 'backup_policy_proto_continuous_schedule',
+    'BackupPolicyProtoDailySchedule': 'backup_policy_proto_daily_schedule',
+    'BackupPolicyProtoExclusionTimeRange': 'backup_policy_proto_exclusion_time_range',
+    'BackupPolicyProtoMonthlySchedule': 'backup_policy_proto_monthly_schedule',
+    'BackupPolicyProtoOneOffSchedule': 'backup_policy_proto_one_off_schedule',
+    'BackupPolicyProtoScheduleEnd': 'backup_policy_proto_schedule_end',
+    'BackupRun': 'backup_run',
+    'BackupRunTypeEnum': 'backup_run_type_enum',
+    'BackupScript': 'backup_script',
+    'BackupSourceParams': 'backup_source_params',
+    'BackupSourceStats': 'backup_source_stats',
+    'BackupTaskInfo': 'backup_task_info',
+    'BackupTypeEnum': 'backup_type_enum',
+    'BackupTypeSqlEnvJobParametersEnum': 'backup_type_sql_env_job_parameters_enum',
+    'BandwidthLimit': 'bandwidth_limit',
+    'BandwidthLimitOverride': 'bandwidth_limit_override',
+    'BasicClusterInfo': 'basic_cluster_info',
+    'BasicTaskInfo': 'basic_task_info',
+    'BlackoutPeriod': 'blackout_period',
+    'BondingModeCreateBondParametersEnum': 'bonding_mode_create_bond_parameters_enum',
+    'BondingModeEnum': 'bonding_mode_enum',
+    'BondingModeNetworkInterfaceEnum': 'bonding_mode_network_interface_enum',
+    'BondingModeUpdateBondParametersEnum': 'bonding_mode_update_bond_parameters_enum',
+    'C2SAccessPortal': 'c_2_s_access_portal',
+    'CancelProtectionJobRunParam': 'cancel_protection_job_run_param',
+    'CapacityByTier': 'capacity_by_tier',
+    'CategoryAlertMetadataEnum': 'category_alert_metadata_enum',
+    'CategoryEnum': 'category_enum',
+    'CategoryNotificationRuleEnum': 'category_notification_rule_enum',
+    'CentrifySchemaEnum': 'centrify_schema_enum',
+    'CentrifyZone': 'centrify_zone',
+    'CertificateDetails': 'certificate_details',
+    'ChangeEnum': 'change_enum',
+    'ChangeProtectionJobStateParam': 'change_protection_job_state_param',
+    'ChangeServiceStateParameters': 'change_service_state_parameters',
+    'ChangeServiceStateResult': 'change_service_state_result',
+    'ChassisInfo': 'chassis_info',
+    'CifsShareInfo': 'cifs_share_info',
+    'ClearNlmLocksParameters': 'clear_nlm_locks_parameters',
+    'CloneAppViewInfoOracle': 'clone_app_view_info_oracle',
+    'CloneAppViewInfoProto': 'clone_app_view_info_proto',
+    'CloneAppViewParams': 'clone_app_view_params',
+    'CloneDirectoryParams': 'clone_directory_params',
+    'CloneRefreshRequest': 'clone_refresh_request',
+    'CloneTaskInfo': 'clone_task_info',
+    'CloneTaskRequest': 'clone_task_request',
+    'CloneViewRequest': 'clone_view_request',
+    'CloseSmbFileOpenParameters': 'close_smb_file_open_parameters',
+    'CloudDeployInfoProto': 'cloud_deploy_info_proto',
+    'CloudDeployInfoProtoCloudDeployEntity': 'cloud_deploy_info_proto_cloud_deploy_entity',
+    'CloudDeployTarget': 'cloud_deploy_target',
+    'CloudDeployTargetDetails': 'cloud_deploy_target_details',
+    'CloudNetworkConfiguration': 'cloud_network_configuration',
+    'CloudParameters': 'cloud_parameters',
+    'Cluster': 'cluster',
+    'ClusterAuditLog': 'cluster_audit_log',
+    'ClusterAuditLogConfiguration': 'cluster_audit_log_configuration',
+    'ClusterAuditLogsSearchResult': 'cluster_audit_logs_search_result',
+    'ClusterConfigProtoQoSMapping': 'cluster_config_proto_qo_s_mapping',
+    'ClusterConfigProtoQoSMappingQoSContext': 'cluster_config_proto_qo_s_mapping_qo_s_context',
+    'ClusterConfigProtoSID': 'cluster_config_proto_sid',
+    'ClusterConfigProtoStoragePolicyOverride': 'cluster_config_proto_storage_policy_override',
+    'ClusterConfigProtoSubnet': 'cluster_config_proto_subnet',
+    'ClusterCreationProgressResult': 'cluster_creation_progress_result',
+    'ClusterHardwareInfo': 'cluster_hardware_info',
+    'ClusterIdentifier': 'cluster_identifier',
+    'ClusterNetworkingEndpoint': 'cluster_networking_endpoint',
+    'ClusterNetworkingResourceInformation': 'cluster_networking_resource_information',
+    'ClusterPartition': 'cluster_partition',
+    'ClusterPublicKeys': 'cluster_public_keys',
+    'ClusterStats': 'cluster_stats',
+    'ClusterTypeClusterEnum': 'cluster_type_cluster_enum',
+    'ClusterTypeEnum': 'cluster_type_enum',
+    'CombineMethodEnum': 'combine_method_enum',
+    'CompareADObjectsResultADAttribute': 'compare_ad_objects_result_ad_attribute',
+    'CompareADObjectsResultADAttributeValue': 'compare_ad_objects_result_ad_attribute_value',
+    'CompareADObjectsResultADObject': 'compare_ad_objects_result_ad_object',
+    'CompareAdObjectsRequest': 'compare_ad_objects_request',
+    'ComparedADObject': 'compared_ad_object',
+    'CompressionPolicyEnum': 'compression_policy_enum',
+    'CompressionPolicyVaultEnum': 'compression_policy_vault_enum',
+    'ConnectionStateEnum': 'connection_state_enum',
+    'ConnectorParameters': 'connector_parameters',
+    'ConnectorParams': 'connector_params',
+    'Consumer': 'consumer',
+    'ConsumerStats': 'consumer_stats',
+    'ConsumerTypeEnum': 'consumer_type_enum',
+    'ConsumerTypeGetConsumerStatsEnum': 'consumer_type_get_consumer_stats_enum',
+    'ConsumerTypeGetTenantStatsEnum': 'consumer_type_get_tenant_stats_enum',
+    'ContinuousSchedule': 'continuous_schedule',
+    'CopyRun': 'copy_run',
+    'CopyRunStats': 'copy_run_stats',
+    'CopySnapshotTaskStatus': 'copy_snapshot_task_status',
+    'CountByTier': 'count_by_tier',
+    'CreateActiveDirectoryEntryParams': 'create_active_directory_entry_params',
+    'CreateBondParameters': 'create_bond_parameters',
+    'CreateBondResult': 'create_bond_result',
+    'CreateCloudClusterParameters': 'create_cloud_cluster_parameters',
+    'CreateClusterResult': 'create_cluster_result',
+    'CreateIdpConfigurationRequest': 'create_idp_configuration_request',
+    'CreatePhysicalClusterParameters': 'create_physical_cluster_parameters',
+    'CreateRemoteVaultRestoreTaskParameters': 'create_remote_vault_restore_task_parameters',
+    'CreateRemoteVaultSearchJobParameters': 'create_remote_vault_search_job_parameters',
+    'CreateViewBoxParams': 'create_view_box_params',
+    'CreateViewRequest': 'create_view_request',
+    'CreateVirtualClusterParameters': 'create_virtual_cluster_parameters',
+    'CreatedRemoteVaultSearchJobUid': 'created_remote_vault_search_job_uid',
+    'Credentials': 'credentials',
+    'CurrentOperationEnum': 'current_operation_enum',
+    'CustomUnixIdAttributes': 'custom_unix_id_attributes',
+    'DailySchedule': 'daily_schedule',
+    'DataDiskTypeEnum': 'data_disk_type_enum',
+    'DataMigrationJobParameters': 'data_migration_job_parameters',
+    'DataMigrationPolicy': 'data_migration_policy',
+    'DataProtocolEnum': 'data_protocol_enum',
+    'DataTransferFromVaultPerTask': 'data_transfer_from_vault_per_task',
+    'DataTransferFromVaultSummary': 'data_transfer_from_vault_summary',
+    'DataUsageStats': 'data_usage_stats',
+    'DatastoreInfo': 'datastore_info',
+    'DayBlackoutPeriodEnum': 'day_blackout_period_enum',
+    'DayCountEnum': 'day_count_enum',
+    'DayEnum': 'day_enum',
+    'DayMonthlyScheduleEnum': 'day_monthly_schedule_enum',
+    'DbFileInfo': 'db_file_info',
+    'DbTypeEnum': 'db_type_enum',
+    'DeleteInfectedFileParams': 'delete_infected_file_params',
+    'DeleteInfectedFileResponse': 'delete_infected_file_response',
+    'DeleteProtectionJobParam': 'delete_protection_job_param',
+    'DeleteRouteParam': 'delete_route_param',
+    'DeleteViewUsersQuotaParameters': 'delete_view_users_quota_parameters',
+    'DeliveryRuleProtoDeliveryTarget': 'delivery_rule_proto_delivery_target',
+    'DeployCertParameters': 'deploy_cert_parameters',
+    'DeployDBInstancesToRDSParams': 'deploy_db_instances_to_rds_params',
+    'DeployDBInstancesToRDSParamsPointInTimeRestoreParams': 'deploy_db_instances_to_rds_params_point_in_time_restore_params',
+    'DeployTaskRequest': 'deploy_task_request',
+    'DeployVMsToAWSParams': 'deploy_v_ms_to_aws_params',
+    'DeployVMsToAzureParams': 'deploy_v_ms_to_azure_params',
+    'DeployVMsToCloudParams': 'deploy_v_ms_to_cloud_params',
+    'DeployVMsToCloudTaskStateProto': 'deploy_v_ms_to_cloud_task_state_proto',
+    'DeployVMsToGCPParams': 'deploy_v_ms_to_gcp_params',
+    'DeployVmsToCloud': 'deploy_vms_to_cloud',
+    'DesiredWalLocationEnum': 'desired_wal_location_enum',
+    'DestroyCloneAppTaskInfoProto': 'destroy_clone_app_task_info_proto',
+    'DestroyClonedEntityInfoProto': 'destroy_cloned_entity_info_proto',
+    'DestroyClonedEntityInfoProtoClonedEntity': 'destroy_cloned_entity_info_proto_cloned_entity',
+    'DestroyClonedTaskStateProto': 'destroy_cloned_task_state_proto',
+    'DestroyClonedVMTaskInfoProto': 'destroy_cloned_vm_task_info_proto',
+    'DestroyMountVolumesTaskInfoProto': 'destroy_mount_volumes_task_info_proto',
+    'DeviceNode': 'device_node',
+    'DeviceTree': 'device_tree',
+    'DeviceTreeChildDevice': 'device_tree_child_device',
+    'DeviceTreeDetails': 'device_tree_details',
+    'DeviceTreePartitionSlice': 'device_tree_partition_slice',
+    'DirQuotaConfig': 'dir_quota_config',
+    'DirQuotaInfo': 'dir_quota_info',
+    'DirQuotaPolicy': 'dir_quota_policy',
+    'Disk': 'disk',
+    'DiskBlock': 'disk_block',
+    'DiskFormatEnum': 'disk_format_enum',
+    'DiskPartition': 'disk_partition',
+    'DiskUnit': 'disk_unit',
+    'DomainControllers': 'domain_controllers',
+    'DownloadFilesAndFoldersParams': 'download_files_and_folders_params',
+    'DownloadPackageParameters': 'download_package_parameters',
+    'DownloadPackageResult': 'download_package_result',
+    'EditHostsParameters': 'edit_hosts_parameters',
+    'EmailDeliveryTarget': 'email_delivery_target',
+    'EmailMetaData': 'email_meta_data',
+    'EncryptionConfiguration': 'encryption_configuration',
+    'EncryptionPolicyEnum': 'encryption_policy_enum',
+    'EncryptionPolicyVaultEnum': 'encryption_policy_vault_enum',
+    'EntityIdentifier': 'entity_identifier',
+    'EntityPermissionInformation': 'entity_permission_information',
+    'EntityProto': 'entity_proto',
+    'EntitySchemaProto': 'entity_schema_proto',
+    'EntitySchemaProtoAttributesDescriptor': 'entity_schema_proto_attributes_descriptor',
+    'EntitySchemaProtoKeyValueDescriptor': 'entity_schema_proto_key_value_descriptor',
+    'EntitySchemaProtoTimeSeriesDescriptor': 'entity_schema_proto_time_series_descriptor',
+    'EntitySchemaProtoTimeSeriesDescriptorMetricUnit': 'entity_schema_proto_time_series_descriptor_metric_unit',
+    'EntityTypeEnum': 'entity_type_enum',
+    'EntityTypeGetFileDistributionStatsEnum': 'entity_type_get_file_distribution_stats_enum',
+    'EnvBackupParams': 'env_backup_params',
+    'EnvironmentAggregatedSubtreeInfoEnum': 'environment_aggregated_subtree_info_enum',
+    'EnvironmentApplicationInfoEnum': 'environment_application_info_enum',
+    'EnvironmentBackupRunEnum': 'environment_backup_run_enum',
+    'EnvironmentConnectorParametersEnum': 'environment_connector_parameters_enum',
+    'EnvironmentEnum': 'environment_enum',
+    'EnvironmentGetProtectionJobsEnum': 'environment_get_protection_jobs_enum',
+    'EnvironmentGetProtectionPoliciesEnum': 'environment_get_protection_policies_enum',
+    'EnvironmentGetRestoreTasksEnum': 'environment_get_restore_tasks_enum',
+    'EnvironmentLastProtectionRunStatsByEnvEnum': 'environment_last_protection_run_stats_by_env_enum',
+    'EnvironmentListApplicationServersEnum': 'environment_list_application_servers_enum',
+    'EnvironmentListProtectedObjectsEnum': 'environment_list_protected_objects_enum',
+    'EnvironmentListProtectionSourcesEnum': 'environment_list_protection_sources_enum',
+    'EnvironmentListProtectionSourcesRegistrationInfoEnum': 'environment_list_protection_sources_registration_info_enum',
+    'EnvironmentListProtectionSourcesRootNodesEnum': 'environment_list_protection_sources_root_nodes_enum',
+    'EnvironmentProtectedObjectsSummaryByEnvEnum': 'environment_protected_objects_summary_by_env_enum',
+    'EnvironmentProtectionJobEnum': 'environment_protection_job_enum',
+    'EnvironmentProtectionJobRequestBodyEnum': 'environment_protection_job_request_body_enum',
+    'EnvironmentProtectionSummaryByEnvEnum': 'environment_protection_summary_by_env_enum',
+    'EnvironmentRegisterProtectionSourceParametersEnum': 'environment_register_protection_source_parameters_enum',
+    'EnvironmentRegisteredSourceInfoEnum': 'environment_registered_source_info_enum',
+    'EnvironmentRemoteProtectionJobInformationEnum': 'environment_remote_protection_job_information_enum',
+    'EnvironmentRemoteProtectionJobRunInformationEnum': 'environment_remote_protection_job_run_information_enum',
+    'EnvironmentRestoreEnvStatsEnum': 'environment_restore_env_stats_enum',
+    'EnvironmentRestoreObjectDetailsEnum': 'environment_restore_object_details_enum',
+    'EnvironmentRestorePointsForTimeRangeParamEnum': 'environment_restore_points_for_time_range_param_enum',
+    'EnvironmentSearchObjectsEnum': 'environment_search_objects_enum',
+    'EnvironmentSearchProtectionSourcesEnum': 'environment_search_protection_sources_enum',
+    'EnvironmentSearchRestoredFilesEnum': 'environment_search_restored_files_enum',
+    'EnvironmentSnapshotInfoEnum': 'environment_snapshot_info_enum',
+    'EnvironmentTypeJobParameters': 'environment_type_job_parameters',
+    'EnvironmentVaultProviderStatsByEnvEnum': 'environment_vault_provider_stats_by_env_enum',
+    'ErasureCodingInfo': 'erasure_coding_info',
+    'ErrorProto': 'error_proto',
+    'EulaConfig': 'eula_config',
+    'ExcludeOffice365TypeEnum': 'exclude_office_365_type_enum',
+    'ExcludeTypeEnum': 'exclude_type_enum',
+    'ExcludeTypeGetProtectedObjectsSummaryEnum': 'exclude_type_get_protected_objects_summary_enum',
+    'ExpandCloudClusterParameters': 'expand_cloud_cluster_parameters',
+    'ExpandPhysicalClusterParameters': 'expand_physical_cluster_parameters',
+    'ExtendedRetentionPolicy': 'extended_retention_policy',
+    'ExternalClientSubnets': 'external_client_subnets',
+    'ExternalTargetTypeEnum': 'external_target_type_enum',
+    'FileDistributionMetrics': 'file_distribution_metrics',
+    'FileDistributionStats': 'file_distribution_stats',
+    'FileExtensionFilter': 'file_extension_filter',
+    'FileId': 'file_id',
+    'FileLevelDataLockConfig': 'file_level_data_lock_config',
+    'FileLockStatus': 'file_lock_status',
+    'FileLockStatusParams': 'file_lock_status_params',
+    'FileNlmLocks': 'file_nlm_locks',
+    'FilePartitionBlock': 'file_partition_block',
+    'FilePathFilter': 'file_path_filter',
+    'FilePathParameters': 'file_path_parameters',
+    'FileRestoreInfo': 'file_restore_info',
+    'FileSearchResult': 'file_search_result',
+    'FileSearchResults': 'file_search_results',
+    'FileSelectionPolicyEnum': 'file_selection_policy_enum',
+    'FileSizePolicyEnum': 'file_size_policy_enum',
+    'FileSnapshotInformation': 'file_snapshot_information',
+    'FileStubbingParams': 'file_stubbing_params',
+    'FileTypeEnum': 'file_type_enum',
+    'FileVersion': 'file_version',
+    'FilenamePatternToDirectory': 'filename_pattern_to_directory',
+    'FilerAuditLogConfiguration': 'filer_audit_log_configuration',
+    'FilesAndFoldersInfo': 'files_and_folders_info',
+    'FilesToDirectoryMapping': 'files_to_directory_mapping',
+    'FilesystemVolume': 'filesystem_volume',
+    'FilteringPolicyProto': 'filtering_policy_proto',
+    'FixedUnixIdMapping': 'fixed_unix_id_mapping',
+    'FlagEnum': 'flag_enum',
+    'FlashBladeFileSystem': 'flash_blade_file_system',
+    'FlashBladeNetworkInterface': 'flash_blade_network_interface',
+    'FlashBladeNfsInfo': 'flash_blade_nfs_info',
+    'FlashBladeProtectionSource': 'flash_blade_protection_source',
+    'FlashBladeSmbInfo': 'flash_blade_smb_info',
+    'FlashBladeStorageArray': 'flash_blade_storage_array',
+    'FolderTypeEnum': 'folder_type_enum',
+    'FreeNodeInformation': 'free_node_information',
+    'FullSnapshotInfo': 'full_snapshot_info',
+    'GcpCredentials': 'gcp_credentials',
+    'GcpParams': 'gcp_params',
+    'GcpProtectionSource': 'gcp_protection_source',
+    'GcpTypeEnum': 'gcp_type_enum',
+    'GdprCopyTask': 'gdpr_copy_task',
+    'GetAlertTypesParams': 'get_alert_types_params',
+    'GetConsumerStatsResult': 'get_consumer_stats_result',
+    'GetRegistrationInfoResponse': 'get_registration_info_response',
+    'GetTenantStatsResult': 'get_tenant_stats_result',
+    'GetViewBoxStatsResult': 'get_view_box_stats_result',
+    'GetViewsByShareNameResult': 'get_views_by_share_name_result',
+    'GetViewsResult': 'get_views_result',
+    'GlacierRetrievalTypeEnum': 'glacier_retrieval_type_enum',
+    'GoogleAccountInfo': 'google_account_info',
+    'GoogleCloudCredentials': 'google_cloud_credentials',
+    'GpfsCluster': 'gpfs_cluster',
+    'GpfsFileset': 'gpfs_fileset',
+    'GpfsFilesystem': 'gpfs_filesystem',
+    'GpfsProtectionSource': 'gpfs_protection_source',
+    'GranularityBucket': 'granularity_bucket',
+    'GrootIOPreferentialTierEnum': 'groot_io_preferential_tier_enum',
+    'Group': 'group',
+    'GroupDeleteParameters': 'group_delete_parameters',
+    'GroupInfo': 'group_info',
+    'GroupParameters': 'group_parameters',
+    'GuidPair': 'guid_pair',
+    'HardwareInfo': 'hardware_info',
+    'HealthStatusEnum': 'health_status_enum',
+    'HealthTile': 'health_tile',
+    'HostEntry': 'host_entry',
+    'HostOsTypeEnum': 'host_os_type_enum',
+    'HostResult': 'host_result',
+    'HostTypeAgentInformationEnum': 'host_type_agent_information_enum',
+    'HostTypeDownloadPhysicalAgentEnum': 'host_type_download_physical_agent_enum',
+    'HostTypeEnum': 'host_type_enum',
+    'HostTypeHypervProtectionSourceEnum': 'host_type_hyperv_protection_source_enum',
+    'HostTypePhysicalProtectionSourceEnum': 'host_type_physical_protection_source_enum',
+    'HostTypeRegisterProtectionSourceParametersEnum': 'host_type_register_protection_source_parameters_enum',
+    'HostTypeUpdateProtectionSourceParametersEnum': 'host_type_update_protection_source_parameters_enum',
+    'HostTypeVmwareProtectionSourceEnum': 'host_type_vmware_protection_source_enum',
+    'HydraDowntierIOPreferentialTierEnum': 'hydra_downtier_io_preferential_tier_enum',
+    'HydraIOPreferentialTierEnum': 'hydra_io_preferential_tier_enum',
+    'HyperFlexProtectionSource': 'hyper_flex_protection_source',
+    'HypervBackupEnvParams': 'hyperv_backup_env_params',
+    'HypervCloneParameters': 'hyperv_clone_parameters',
+    'HypervDatastore': 'hyperv_datastore',
+    'HypervEnvJobParameters': 'hyperv_env_job_parameters',
+    'HypervProtectionSource': 'hyperv_protection_source',
+    'HypervRestoreParameters': 'hyperv_restore_parameters',
+    'HypervTypeEnum': 'hyperv_type_enum',
+    'HypervVirtualMachine': 'hyperv_virtual_machine',
+    'IcapConnectionStatusResponse': 'icap_connection_status_response',
+    'IdMappingInfo': 'id_mapping_info',
+    'IdpPrincipalsAddParameters': 'idp_principals_add_parameters',
+    'IdpReachabilityTestResult': 'idp_reachability_test_result',
+    'IdpServiceConfiguration': 'idp_service_configuration',
+    'IdpUserInfo': 'idp_user_info',
+    'IndexAndSnapshots': 'index_and_snapshots',
+    'IndexingPolicy': 'indexing_policy',
+    'IndexingPolicyProto': 'indexing_policy_proto',
+    'IndexingTaskStatusEnum': 'indexing_task_status_enum',
+    'InfectedFile': 'infected_file',
+    'InfectedFileId': 'infected_file_id',
+    'InfectedFileParam': 'infected_file_param',
+    'InfectedFiles': 'infected_files',
+    'InterfaceGroup': 'interface_group',
+    'IntervalEnum': 'interval_enum',
+    'IntervalUnitEnum': 'interval_unit_enum',
+    'IoPreferentialTier': 'io_preferential_tier',
+    'IopsTile': 'iops_tile',
+    'IpmiConfiguration': 'ipmi_configuration',
+    'IscsiSanPort': 'iscsi_san_port',
+    'IsilonAccessZone': 'isilon_access_zone',
+    'IsilonCluster': 'isilon_cluster',
+    'IsilonMountPoint': 'isilon_mount_point',
+    'IsilonNfsMountPoint': 'isilon_nfs_mount_point',
+    'IsilonProtectionSource': 'isilon_protection_source',
+    'IsilonSmbMountPoint': 'isilon_smb_mount_point',
+    'JobPolicyProto': 'job_policy_proto',
+    'JobRunsTile': 'job_runs_tile',
+    'KeyValuePair': 'key_value_pair',
+    'KmsConfiguration': 'kms_configuration',
+    'KmsConfigurationResponse': 'kms_configuration_response',
+    'KubernetesCredentials': 'kubernetes_credentials',
+    'KubernetesProtectionSource': 'kubernetes_protection_source',
+    'KubernetesTypeEnum': 'kubernetes_type_enum',
+    'KvmProtectionSource': 'kvm_protection_source',
+    'LastProtectionRunStats': 'last_protection_run_stats',
+    'LastProtectionRunStatsByEnv': 'last_protection_run_stats_by_env',
+    'LastProtectionRunSummary': 'last_protection_run_summary',
+    'LastUpgradeStatusEnum': 'last_upgrade_status_enum',
+    'LatencyThresholds': 'latency_thresholds',
+    'LatestProtectionJobRunInfo': 'latest_protection_job_run_info',
+    'LatestProtectionRun': 'latest_protection_run',
+    'LdapProvider': 'ldap_provider',
+    'LdapProviderResponse': 'ldap_provider_response',
+    'LdapProviderStatus': 'ldap_provider_status',
+    'LegalHoldings': 'legal_holdings',
+    'LibrarianIOPreferentialTierEnum': 'librarian_io_preferential_tier_enum',
+    'LicenseState': 'license_state',
+    'ListCentrifyZone': 'list_centrify_zone',
+    'ListNlmLocksResponse': 'list_nlm_locks_response',
+    'LockFileParams': 'lock_file_params',
+    'LockRange': 'lock_range',
+    'LockingProtocolEnum': 'locking_protocol_enum',
+    'LogicalStats': 'logical_stats',
+    'LogicalVolume': 'logical_volume',
+    'LogicalVolumeTypeEnum': 'logical_volume_type_enum',
+    'MORef': 'mo_ref',
+    'MSExchangeParams': 'ms_exchange_params',
+    'MagnetoInstanceId': 'magneto_instance_id',
+    'MagnetoObjectId': 'magneto_object_id',
+    'MapReduceAuxData': 'map_reduce_aux_data',
+    'MetricDataBlock': 'metric_data_block',
+    'MetricDataPoint': 'metric_data_point',
+    'MetricEnum': 'metric_enum',
+    'MetricValue': 'metric_value',
+    'ModeEnum': 'mode_enum',
+    'ModeFileExtensionFilterEnum': 'mode_file_extension_filter_enum',
+    'ModeFileLevelDataLockConfigEnum': 'mode_file_level_data_lock_config_enum',
+    'ModeFileLockStatusEnum': 'mode_file_lock_status_enum',
+    'ModeSmbPermissionEnum': 'mode_smb_permission_enum',
+    'MonthlySchedule': 'monthly_schedule',
+    'MountVolumeResult': 'mount_volume_result',
+    'MountVolumeResultDetails': 'mount_volume_result_details',
+    'MountVolumesHypervParams': 'mount_volumes_hyperv_params',
+    'MountVolumesInfoProto': 'mount_volumes_info_proto',
+    'MountVolumesParameters': 'mount_volumes_parameters',
+    'MountVolumesParams': 'mount_volumes_params',
+    'MountVolumesState': 'mount_volumes_state',
+    'MountVolumesTaskStateProto': 'mount_volumes_task_state_proto',
+    'MountVolumesVmwareParams': 'mount_volumes_vmware_params',
+    'NasBackupParams': 'nas_backup_params',
+    'NasCredentials': 'nas_credentials',
+    'NasEnvJobParameters': 'nas_env_job_parameters',
+    'NasMountCredentialParams': 'nas_mount_credential_params',
+    'NasProtectionSource': 'nas_protection_source',
+    'NasProtocolEnum': 'nas_protocol_enum',
+    'NasProtocolNasEnvJobParametersEnum': 'nas_protocol_nas_env_job_parameters_enum',
+    'NasTypeEnum': 'nas_type_enum',
+    'NetappClusterInfo': 'netapp_cluster_info',
+    'NetappProtectionSource': 'netapp_protection_source',
+    'NetappTypeEnum': 'netapp_type_enum',
+    'NetappVolumeInfo': 'netapp_volume_info',
+    'NetappVserverInfo': 'netapp_vserver_info',
+    'NetworkConfiguration': 'network_configuration',
+    'NetworkInterface': 'network_interface',
+    'NetworkMapping': 'network_mapping',
+    'NetworkMappingProto': 'network_mapping_proto',
+    'NetworkingInformation': 'networking_information',
+    'NewS3SecretAccessKey': 'new_s_3_secret_access_key',
+    'NfsAccessEnum': 'nfs_access_enum',
+    'NfsRootPermissions': 'nfs_root_permissions',
+    'NlmLock': 'nlm_lock',
+    'Node': 'node',
+    'NodeHardwareInfo': 'node_hardware_info',
+    'NodeNetworkInterfaces': 'node_network_interfaces',
+    'NodeStats': 'node_stats',
+    'NodeStatus': 'node_status',
+    'NodeSystemDiskInfo': 'node_system_disk_info',
+    'NotificationRule': 'notification_rule',
+    'Notifications': 'notifications',
+    'NtpSettingsConfig': 'ntp_settings_config',
+    'O365BackupEnvParams': 'o_365_backup_env_params',
+    'ObjectClassActiveDirectoryPrincipalsAddParametersEnum': 'object_class_active_directory_principals_add_parameters_enum',
+    'ObjectClassAddedActiveDirectoryPrincipalEnum': 'object_class_added_active_directory_principal_enum',
+    'ObjectClassAddedIdpPrincipalEnum': 'object_class_added_idp_principal_enum',
+    'ObjectClassEnum': 'object_class_enum',
+    'ObjectClassIdpPrincipalsAddParametersEnum': 'object_class_idp_principals_add_parameters_enum',
+    'ObjectClassSearchActiveDirectoryPrincipalsEnum': 'object_class_search_active_directory_principals_enum',
+    'ObjectClassSearchPrincipalsEnum': 'object_class_search_principals_enum',
+    'ObjectSearchResults': 'object_search_results',
+    'ObjectSnapshotInfo': 'object_snapshot_info',
+    'ObjectSnapshotType': 'object_snapshot_type',
+    'ObjectStatusEnum': 'object_status_enum',
+    'ObjectsByEnv': 'objects_by_env',
+    'ObjectsProtectedByPolicy': 'objects_protected_by_policy',
+    'Office365Credentials': 'office_365_credentials',
+    'Office365ProtectionSource': 'office_365_protection_source',
+    'Office365TypeEnum': 'office_365_type_enum',
+    'OracleAppParams': 'oracle_app_params',
+    'OracleCloudCredentials': 'oracle_cloud_credentials',
+    'OracleDBChannelInfo': 'oracle_db_channel_info',
+    'OracleDBChannelInfoHostInfo': 'oracle_db_channel_info_host_info',
+    'OracleDBConfig': 'oracle_db_config',
+    'OracleDBConfigRedoLogGroupConf': 'oracle_db_config_redo_log_group_conf',
+    'OracleDatabaseNode': 'oracle_database_node',
+    'OracleDatabaseNodeChannel': 'oracle_database_node_channel',
+    'OracleHost': 'oracle_host',
+    'OracleProtectionSource': 'oracle_protection_source',
+    'OracleSession': 'oracle_session',
+    'OracleSourceParams': 'oracle_source_params',
+    'OracleSpecialParameters': 'oracle_special_parameters',
+    'OsDiskTypeEnum': 'os_disk_type_enum',
+    'OutlookBackupEnvParams': 'outlook_backup_env_params',
+    'OutlookEnvJobParameters': 'outlook_env_job_parameters',
+    'OutlookFolder': 'outlook_folder',
+    'OutlookMailbox': 'outlook_mailbox',
+    'OutlookRestoreParameters': 'outlook_restore_parameters',
+    'OutputSpec': 'output_spec',
+    'OverwriteViewParam': 'overwrite_view_param',
+    'PackageDetails': 'package_details',
+    'PartitionTableFormatEnum': 'partition_table_format_enum',
+    'Pattern': 'pattern',
+    'PerformRestoreJobStateProto': 'perform_restore_job_state_proto',
+    'PerformRestoreJobStateProtoRestoreTask': 'perform_restore_job_state_proto_restore_task',
+    'PerformRestoreTaskStateProto': 'perform_restore_task_state_proto',
+    'PeriodicityEnum': 'periodicity_enum',
+    'PeriodicityExtendedRetentionPolicyEnum': 'periodicity_extended_retention_policy_enum',
+    'PeriodicitySnapshotArchivalCopyPolicyEnum': 'periodicity_snapshot_archival_copy_policy_enum',
+    'PeriodicitySnapshotCloudCopyPolicyEnum': 'periodicity_snapshot_cloud_copy_policy_enum',
+    'PeriodicitySnapshotReplicationCopyPolicyEnum': 'periodicity_snapshot_replication_copy_policy_enum',
+    'PhysicalBackupEnvParams': 'physical_backup_env_params',
+    'PhysicalBackupSourceParams': 'physical_backup_source_params',
+    'PhysicalEnvJobParameters': 'physical_env_job_parameters',
+    'PhysicalFileBackupParams': 'physical_file_backup_params',
+    'PhysicalFileBackupParamsBackupPathInfo': 'physical_file_backup_params_backup_path_info',
+    'PhysicalNodeConfiguration': 'physical_node_configuration',
+    'PhysicalProtectionSource': 'physical_protection_source',
+    'PhysicalServerHostTypeEnum': 'physical_server_host_type_enum',
+    'PhysicalSnapshotParams': 'physical_snapshot_params',
+    'PhysicalSpecialParameters': 'physical_special_parameters',
+    'PhysicalTypeEnum': 'physical_type_enum',
+    'PhysicalVolume': 'physical_volume',
+    'PkgTypeEnum': 'pkg_type_enum',
+    'PostgresNodeInfo': 'postgres_node_info',
+    'PowerStateConfigProto': 'power_state_config_proto',
+    'Preferences': 'preferences',
+    'PreferredDomainController': 'preferred_domain_controller',
+    'Principal': 'principal',
+    'PriorityEnum': 'priority_enum',
+    'PriorityQoSPolicyEnum': 'priority_qo_s_policy_enum',
+    'PrivilegeIdEnum': 'privilege_id_enum',
+    'PrivilegeIdUserEnum': 'privilege_id_user_enum',
+    'PrivilegeIdUserParametersEnum': 'privilege_id_user_parameters_enum',
+    'PrivilegeInfo': 'privilege_info',
+    'ProductModelInterfaceTuple': 'product_model_interface_tuple',
+    'PropertyEnum': 'property_enum',
+    'ProtectObjectParameters': 'protect_object_parameters',
+    'ProtectedObject': 'protected_object',
+    'ProtectedObjectsByEnv': 'protected_objects_by_env',
+    'ProtectedObjectsSummary': 'protected_objects_summary',
+    'ProtectedObjectsSummaryByEnv': 'protected_objects_summary_by_env',
+    'ProtectedObjectsTile': 'protected_objects_tile',
+    'ProtectedSourceSummary': 'protected_source_summary',
+    'ProtectedVmInfo': 'protected_vm_info',
+    'ProtectionInfo': 'protection_info',
+    'ProtectionJob': 'protection_job',
+    'ProtectionJobAuditTrail': 'protection_job_audit_trail',
+    'ProtectionJobInfo': 'protection_job_info',
+    'ProtectionJobRequestBody': 'protection_job_request_body',
+    'ProtectionJobRunStats': 'protection_job_run_stats',
+    'ProtectionJobSummary': 'protection_job_summary',
+    'ProtectionJobSummaryForPolicies': 'protection_job_summary_for_policies',
+    'ProtectionJobSummaryStats': 'protection_job_summary_stats',
+    'ProtectionObjectSummary': 'protection_object_summary',
+    'ProtectionPolicy': 'protection_policy',
+    'ProtectionPolicyRequest': 'protection_policy_request',
+    'ProtectionPolicySummary': 'protection_policy_summary',
+    'ProtectionRunErrors': 'protection_run_errors',
+    'ProtectionRunInstance': 'protection_run_instance',
+    'ProtectionRunResponse': 'protection_run_response',
+    'ProtectionRunsStats': 'protection_runs_stats',
+    'ProtectionRunsSummary': 'protection_runs_summary',
+    'ProtectionSource': 'protection_source',
+    'ProtectionSourceEnvironmentEnum': 'protection_source_environment_enum',
+    'ProtectionSourceNode': 'protection_source_node',
+    'ProtectionSourceResponse': 'protection_source_response',
+    'ProtectionSourceTreeInfo': 'protection_source_tree_info',
+    'ProtectionSourceUid': 'protection_source_uid',
+    'ProtectionStats': 'protection_stats',
+    'ProtectionSummary': 'protection_summary',
+    'ProtectionSummaryByEnv': 'protection_summary_by_env',
+    'ProtectionTile': 'protection_tile',
+    'ProtocolAccessEnum': 'protocol_access_enum',
+    'ProtocolEnum': 'protocol_enum',
+    'ProtocolGpfsFilesetEnum': 'protocol_gpfs_fileset_enum',
+    'ProtocolIsilonMountPointEnum': 'protocol_isilon_mount_point_enum',
+    'ProtocolNasProtectionSourceEnum': 'protocol_nas_protection_source_enum',
+    'ProtocolSyslogServerEnum': 'protocol_syslog_server_enum',
+    'ProtocolViewProtocolStatsEnum': 'protocol_view_protocol_stats_enum',
+    'ProtocolViewStatInfoEnum': 'protocol_view_stat_info_enum',
+    'PureEnvJobParameters': 'pure_env_job_parameters',
+    'PureProtectionSource': 'pure_protection_source',
+    'PureStorageArray': 'pure_storage_array',
+    'PureTypeEnum': 'pure_type_enum',
+    'PureVolume': 'pure_volume',
+    'QStarServerCredentials': 'q_star_server_credentials',
+    'QoS': 'qo_s',
+    'QoSPolicy': 'qo_s_policy',
+    'QosTypeEnum': 'qos_type_enum',
+    'QosTypeRpoPolicySettingsEnum': 'qos_type_rpo_policy_settings_enum',
+    'QuotaAndUsageInView': 'quota_and_usage_in_view',
+    'QuotaPolicy': 'quota_policy',
+    'RandomIOPreferentialTierEnum': 'random_io_preferential_tier_enum',
+    'RdsParams': 'rds_params',
+    'RecoverDisksTaskStateProto': 'recover_disks_task_state_proto',
+    'RecoverTaskRequest': 'recover_task_request',
+    'RecoverVirtualDiskInfoProto': 'recover_virtual_disk_info_proto',
+    'RecoverVirtualDiskParams': 'recover_virtual_disk_params',
+    'RecoverVirtualDiskParamsVirtualDiskMapping': 'recover_virtual_disk_params_virtual_disk_mapping',
+    'RecoverVolumesParams': 'recover_volumes_params',
+    'RecoverVolumesParamsMapping': 'recover_volumes_params_mapping',
+    'RecoverVolumesTaskStateProto': 'recover_volumes_task_state_proto',
+    'RecoverVolumesTaskStateProtoTaskResult': 'recover_volumes_task_state_proto_task_result',
+    'RecoveriesTile': 'recoveries_tile',
+    'RecoveryModelEnum': 'recovery_model_enum',
+    'RecoveryTaskInfo': 'recovery_task_info',
+    'RegisterApplicationServersParameters': 'register_application_servers_parameters',
+    'RegisterProtectionSourceParameters': 'register_protection_source_parameters',
+    'RegisterRemoteCluster': 'register_remote_cluster',
+    'RegisteredApplicationServer': 'registered_application_server',
+    'RegisteredSourceInfo': 'registered_source_info',
+    'RemediationStateEnum': 'remediation_state_enum',
+    'RemediationStateUpdateInfectedFileParamsEnum': 'remediation_state_update_infected_file_params_enum',
+    'RemoteCluster': 'remote_cluster',
+    'RemoteHost': 'remote_host',
+    'RemoteHostConnectorParams': 'remote_host_connector_params',
+    'RemoteJobScript': 'remote_job_script',
+    'RemoteProtectionJobInformation': 'remote_protection_job_information',
+    'RemoteProtectionJobRunInformation': 'remote_protection_job_run_information',
+    'RemoteProtectionJobRunInstance': 'remote_protection_job_run_instance',
+    'RemoteRestoreIndexingStatus': 'remote_restore_indexing_status',
+    'RemoteRestoreSnapshotStatus': 'remote_restore_snapshot_status',
+    'RemoteScriptPathAndParams': 'remote_script_path_and_params',
+    'RemoteVaultRestoreTaskStatus': 'remote_vault_restore_task_status',
+    'RemoteVaultSearchJobInformation': 'remote_vault_search_job_information',
+    'RemoteVaultSearchJobResults': 'remote_vault_search_job_results',
+    'RemovalReasonEnum': 'removal_reason_enum',
+    'RemovalStateEnum': 'removal_state_enum',
+    'RemovalStateViewBoxEnum': 'removal_state_view_box_enum',
+    'RenameObjectParamProto': 'rename_object_param_proto',
+    'RenameViewParam': 'rename_view_param',
+    'ReplicateSnapshotsToAWSParams': 'replicate_snapshots_to_aws_params',
+    'ReplicationEncryptionKeyReponse': 'replication_encryption_key_reponse',
+    'ReplicationTarget': 'replication_target',
+    'ReplicationTargetSettings': 'replication_target_settings',
+    'RequestError': 'request_error',
+    'ResetS3SecretKeyParameters': 'reset_s_3_secret_key_parameters',
+    'RestoreADAppObjectParams': 'restore_ad_app_object_params',
+    'RestoreAcropolisVMParam': 'restore_acropolis_vm_param',
+    'RestoreAcropolisVMParamNetworkConfigInfo': 'restore_acropolis_vm_param_network_config_info',
+    'RestoreAcropolisVMParamNetworkConfigInfoNICSpec': 'restore_acropolis_vm_param_network_config_info_nic_spec',
+    'RestoreAcropolisVMsParams': 'restore_acropolis_v_ms_params',
+    'RestoreAppObject': 'restore_app_object',
+    'RestoreAppObjectParams': 'restore_app_object_params',
+    'RestoreAppParams': 'restore_app_params',
+    'RestoreAppTaskStateProto': 'restore_app_task_state_proto',
+    'RestoreCountByObjectType': 'restore_count_by_object_type',
+    'RestoreEnvStats': 'restore_env_stats',
+    'RestoreFileCopyStats': 'restore_file_copy_stats',
+    'RestoreFileResultInfo': 'restore_file_result_info',
+    'RestoreFilesInfoProto': 'restore_files_info_proto',
+    'RestoreFilesParams': 'restore_files_params',
+    'RestoreFilesPreferences': 'restore_files_preferences',
+    'RestoreFilesTaskRequest': 'restore_files_task_request',
+    'RestoreFilesTaskStateProto': 'restore_files_task_state_proto',
+    'RestoreHypervVMParams': 'restore_hyperv_vm_params',
+    'RestoreInfo': 'restore_info',
+    'RestoreInfoProto': 'restore_info_proto',
+    'RestoreInfoProtoRestoreEntity': 'restore_info_proto_restore_entity',
+    'RestoreKVMVMsParams': 'restore_kvmv_ms_params',
+    'RestoreKubernetesNamespacesParams': 'restore_kubernetes_namespaces_params',
+    'RestoreObject': 'restore_object',
+    'RestoreObjectDetails': 'restore_object_details',
+    'RestoreObjectParams': 'restore_object_params',
+    'RestoreObjectState': 'restore_object_state',
+    'RestoreOneDriveParams': 'restore_one_drive_params',
+    'RestoreOneDriveParamsDriveItem': 'restore_one_drive_params_drive_item',
+    'RestoreOneDriveParamsDriveOwner': 'restore_one_drive_params_drive_owner',
+    'RestoreOneDriveParamsDriveOwnerDrive': 'restore_one_drive_params_drive_owner_drive',
+    'RestoreOracleAppObjectParams': 'restore_oracle_app_object_params',
+    'RestoreOracleAppObjectParamsAlternateLocationParams': 'restore_oracle_app_object_params_alternate_location_params',
+    'RestoreOutlookParams': 'restore_outlook_params',
+    'RestoreOutlookParamsFolder': 'restore_outlook_params_folder',
+    'RestoreOutlookParamsMailbox': 'restore_outlook_params_mailbox',
+    'RestorePointsForTimeRange': 'restore_points_for_time_range',
+    'RestorePointsForTimeRangeParam': 'restore_points_for_time_range_param',
+    'RestoreSqlAppObjectParams': 'restore_sql_app_object_params',
+    'RestoreStats': 'restore_stats',
+    'RestoreTask': 'restore_task',
+    'RestoreTaskStateBaseProto': 'restore_task_state_base_proto',
+    'RestoreTaskWrapper': 'restore_task_wrapper',
+    'RestoreVlanParams': 'restore_vlan_params',
+    'RestoreVmwareVMParams': 'restore_vmware_vm_params',
+    'RestoreWrapperProto': 'restore_wrapper_proto',
+    'RestoredFileInfo': 'restored_file_info',
+    'RestoredObjectNetworkConfigProto': 'restored_object_network_config_proto',
+    'RestoredObjectVCDConfigProto': 'restored_object_vcd_config_proto',
+    'RetentionPolicyProto': 'retention_policy_proto',
+    'RetrieveArchiveInfo': 'retrieve_archive_info',
+    'RetrieveArchiveInfoRetrievedEntity': 'retrieve_archive_info_retrieved_entity',
+    'RetrieveArchiveTaskStateProto': 'retrieve_archive_task_state_proto',
+    'RetrieveArchiveTaskStateProtoDownloadFilesInfo': 'retrieve_archive_task_state_proto_download_files_info',
+    'Role': 'role',
+    'RoleCreateParameters': 'role_create_parameters',
+    'RoleDeleteParameters': 'role_delete_parameters',
+    'RoleNetworkInterfaceEnum': 'role_network_interface_enum',
+    'RoleUpdateParameters': 'role_update_parameters',
+    'Route': 'route',
+    'RpoPolicySettings': 'rpo_policy_settings',
+    'RpoSchedule': 'rpo_schedule',
+    'RunDiagnosticsMessage': 'run_diagnostics_message',
+    'RunJobSnapshotTarget': 'run_job_snapshot_target',
+    'RunNowParameters': 'run_now_parameters',
+    'RunProtectionJobParam': 'run_protection_job_param',
+    'RunTypeEnum': 'run_type_enum',
+    'RunTypeGetVaultProviderStatsEnum': 'run_type_get_vault_provider_stats_enum',
+    'RunTypeGetVaultRunStatsEnum': 'run_type_get_vault_run_stats_enum',
+    'RunTypeRunProtectionJobParamEnum': 'run_type_run_protection_job_param_enum',
+    'RunUid': 'run_uid',
+    'S3KeyMappingConfigCreateViewRequestEnum': 's_3_key_mapping_config_create_view_request_enum',
+    'S3KeyMappingConfigEnum': 's_3_key_mapping_config_enum',
+    'SQLServerInstanceVersion': 'sql_server_instance_version',
+    'SalesforceAccountInfo': 'salesforce_account_info',
+    'Sample': 'sample',
+    'SchedulerProtoSchedulerJobSchedule': 'scheduler_proto_scheduler_job_schedule',
+    'SchedulingPolicy': 'scheduling_policy',
+    'SchedulingPolicyProto': 'scheduling_policy_proto',
+    'SchedulingPolicyProtoContinuousSchedule': 'scheduling_policy_proto_continuous_schedule',
+    'SchedulingPolicyProtoDailySchedule': 'scheduling_policy_proto_daily_schedule',
+    'SchedulingPolicyProtoMonthlySchedule': 'scheduling_policy_proto_monthly_schedule',
+    'SchedulingPolicyProtoRPOSchedule': 'scheduling_policy_proto_rpo_schedule',
+    'SchemaInfo': 'schema_info',
+    'ScribeIOPreferentialTierEnum': 'scribe_io_preferential_tier_enum',
+    'ScriptExecutionStatus': 'script_execution_status',
+    'ScriptPathAndParams': 'script_path_and_params',
+    'SearchJobStatusEnum': 'search_job_status_enum',
+    'SearchJobStatusRemoteVaultSearchJobResultsEnum': 'search_job_status_remote_vault_search_job_results_enum',
+    'SearchResultFlagEnum': 'search_result_flag_enum',
+    'SecurityModeEnum': 'security_mode_enum',
+    'SendSnmpTestTrapResult': 'send_snmp_test_trap_result',
+    'SequentialIOPreferentialTierEnum': 'sequential_io_preferential_tier_enum',
+    'ServerTypeEnum': 'server_type_enum',
+    'ServiceEnum': 'service_enum',
+    'ServiceNetworkInterfaceEnum': 'service_network_interface_enum',
+    'ServiceServiceStateResultEnum': 'service_service_state_result_enum',
+    'ServiceStateResult': 'service_state_result',
+    'SetupRestoreDiskTaskInfoProto': 'setup_restore_disk_task_info_proto',
+    'SeverityEnum': 'severity_enum',
+    'SeverityNotificationRuleEnum': 'severity_notification_rule_enum',
+    'Share': 'share',
+    'ShareTypeEnum': 'share_type_enum',
+    'ShowSystemLedInfoParameters': 'show_system_led_info_parameters',
+    'ShowSystemLedInfoResult': 'show_system_led_info_result',
+    'SmbAccessEnum': 'smb_access_enum',
+    'SmbActiveFileOpensResponse': 'smb_active_file_opens_response',
+    'SmbActiveFilePath': 'smb_active_file_path',
+    'SmbActiveOpen': 'smb_active_open',
+    'SmbActiveSession': 'smb_active_session',
+    'SmbConnection': 'smb_connection',
+    'SmbPermission': 'smb_permission',
+    'SmbPermissionsInfo': 'smb_permissions_info',
+    'SmbPrincipal': 'smb_principal',
+    'SnapshotArchivalCopyPolicy': 'snapshot_archival_copy_policy',
+    'SnapshotAttempt': 'snapshot_attempt',
+    'SnapshotCloudCopyPolicy': 'snapshot_cloud_copy_policy',
+    'SnapshotCopyTask': 'snapshot_copy_task',
+    'SnapshotInfo': 'snapshot_info',
+    'SnapshotInfoProto': 'snapshot_info_proto',
+    'SnapshotManagerParams': 'snapshot_manager_params',
+    'SnapshotReplicationCopyPolicy': 'snapshot_replication_copy_policy',
+    'SnapshotTarget': 'snapshot_target',
+    'SnapshotTargetPolicyProto': 'snapshot_target_policy_proto',
+    'SnapshotTargetSettings': 'snapshot_target_settings',
+    'SnapshotTaskStatusEnum': 'snapshot_task_status_enum',
+    'SnapshotVersion': 'snapshot_version',
+    'SourceAppParams': 'source_app_params',
+    'SourceBackupStatus': 'source_backup_status',
+    'SourceForPrincipalParam': 'source_for_principal_param',
+    'SourceSpecialParameter': 'source_special_parameter',
+    'SourcesForSid': 'sources_for_sid',
+    'SqlAagHostAndDatabases': 'sql_aag_host_and_databases',
+    'SqlBackupJobParams': 'sql_backup_job_params',
+    'SqlEnvJobParameters': 'sql_env_job_parameters',
+    'SqlOptionsEnum': 'sql_options_enum',
+    'SqlProtectionSource': 'sql_protection_source',
+    'SqlRestoreParameters': 'sql_restore_parameters',
+    'SqlServerDbStateEnum': 'sql_server_db_state_enum',
+    'SqlSourceId': 'sql_source_id',
+    'SqlUpdateRestoreTaskOptions': 'sql_update_restore_task_options',
+    'SslCertificateConfig': 'ssl_certificate_config',
+    'SslVerification': 'ssl_verification',
+    'StateEnum': 'state_enum',
+    'StateLicenseStateEnum': 'state_license_state_enum',
+    'StateServiceStateResultEnum': 'state_service_state_result_enum',
+    'StaticRoute': 'static_route',
+    'StatsGroup': 'stats_group',
+    'StatusBackupRunEnum': 'status_backup_run_enum',
+    'StatusCopyRunEnum': 'status_copy_run_enum',
+    'StatusCopySnapshotTaskStatusEnum': 'status_copy_snapshot_task_status_enum',
+    'StatusEnum': 'status_enum',
+    'StatusGetProtectionRunsStatsEnum': 'status_get_protection_runs_stats_enum',
+    'StatusGetTenantsEnum': 'status_get_tenants_enum',
+    'StatusRestoreTaskEnum': 'status_restore_task_enum',
+    'StatusSourceBackupStatusEnum': 'status_source_backup_status_enum',
+    'StatusTaskEnum': 'status_task_enum',
+    'StatusTaskNotificationEnum': 'status_task_notification_enum',
+    'StopRemoteVaultSearchJobParameters': 'stop_remote_vault_search_job_parameters',
+    'StorageDomainStats': 'storage_domain_stats',
+    'StorageEfficiencyTile': 'storage_efficiency_tile',
+    'StoragePolicy': 'storage_policy',
+    'StoragePolicyOverride': 'storage_policy_override',
+    'StorageSnapshotProviderParams': 'storage_snapshot_provider_params',
+    'StorageStats': 'storage_stats',
+    'StorageTierEnum': 'storage_tier_enum',
+    'StubbingPolicyProto': 'stubbing_policy_proto',
+    'StyleEnum': 'style_enum',
+    'Subnet': 'subnet',
+    'SubscriptionTypeEnum': 'subscription_type_enum',
+    'SupportedConfig': 'supported_config',
+    'SyslogServer': 'syslog_server',
+    'TagAttribute': 'tag_attribute',
+    'TapeMediaInformation': 'tape_media_information',
+    'TargetHostTypeEnum': 'target_host_type_enum',
+    'Task': 'task',
+    'TaskAttribute': 'task_attribute',
+    'TaskEvent': 'task_event',
+    'TaskNotification': 'task_notification',
+    'TaskStateEnum': 'task_state_enum',
+    'TaskTypeEnum': 'task_type_enum',
+    'Tenant': 'tenant',
+    'TenantActiveDirectoryUpdate': 'tenant_active_directory_update',
+    'TenantActiveDirectoryUpdateParameters': 'tenant_active_directory_update_parameters',
+    'TenantCreateParameters': 'tenant_create_parameters',
+    'TenantDeletionInfo': 'tenant_deletion_info',
+    'TenantEntityUpdate': 'tenant_entity_update',
+    'TenantEntityUpdateParameters': 'tenant_entity_update_parameters',
+    'TenantInfo': 'tenant_info',
+    'TenantLdapProviderUpdate': 'tenant_ldap_provider_update',
+    'TenantLdapProviderUpdateParameters': 'tenant_ldap_provider_update_parameters',
+    'TenantProtectionJobUpdate': 'tenant_protection_job_update',
+    'TenantProtectionJobUpdateParameters': 'tenant_protection_job_update_parameters',
+    'TenantProtectionPolicyUpdate': 'tenant_protection_policy_update',
+    'TenantProtectionPolicyUpdateParameters': 'tenant_protection_policy_update_parameters',
+    'TenantProxy': 'tenant_proxy',
+    'TenantStats': 'tenant_stats',
+    'TenantUpdate': 'tenant_update',
+    'TenantUserUpdateParameters': 'tenant_user_update_parameters',
+    'TenantViewBoxUpdate': 'tenant_view_box_update',
+    'TenantViewBoxUpdateParameters': 'tenant_view_box_update_parameters',
+    'TenantViewUpdate': 'tenant_view_update',
+    'TenantViewUpdateParameters': 'tenant_view_update_parameters',
+    'TenantVlanUpdate': 'tenant_vlan_update',
+    'TenantVlanUpdateParameters': 'tenant_vlan_update_parameters',
+    'TestIdpReachability': 'test_idp_reachability',
+    'ThrottlingPolicyOverride': 'throttling_policy_override',
+    'ThrottlingPolicyParameters': 'throttling_policy_parameters',
+    'ThroughputTile': 'throughput_tile',
+    'TierTypeAzureCloudCredentialsEnum': 'tier_type_azure_cloud_credentials_enum',
+    'TierTypeEnum': 'tier_type_enum',
+    'TierTypeGoogleCloudCredentialsEnum': 'tier_type_google_cloud_credentials_enum',
+    'TierTypeOracleCloudCredentialsEnum': 'tier_type_oracle_cloud_credentials_enum',
+    'Time': 'time',
+    'TimeOfAWeek': 'time_of_a_week',
+    'TimeOfDay': 'time_of_day',
+    'TimeRangeSettings': 'time_range_settings',
+    'TimeSeriesSchemaResponse': 'time_series_schema_response',
+    'ToolsRunningStatusEnum': 'tools_running_status_enum',
+    'TrendingData': 'trending_data',
+    'TypeAdRestoreOptionsEnum': 'type_ad_restore_options_enum',
+    'TypeAwsProtectionSourceEnum': 'type_aws_protection_source_enum',
+    'TypeAzureProtectionSourceEnum': 'type_azure_protection_source_enum',
+    'TypeCloneTaskRequestEnum': 'type_clone_task_request_enum',
+    'TypeCloudDeployTargetDetailsEnum': 'type_cloud_deploy_target_details_enum',
+    'TypeConsumerEnum': 'type_consumer_enum',
+    'TypeEnum': 'type_enum',
+    'TypeFileSearchResultEnum': 'type_file_search_result_enum',
+    'TypeFlashBladeProtectionSourceEnum': 'type_flash_blade_protection_source_enum',
+    'TypeGcpProtectionSourceEnum': 'type_gcp_protection_source_enum',
+    'TypeGpfsProtectionSourceEnum': 'type_gpfs_protection_source_enum',
+    'TypeHyperFlexProtectionSourceEnum': 'type_hyper_flex_protection_source_enum',
+    'TypeHypervDatastoreEnum': 'type_hyperv_datastore_enum',
+    'TypeHypervProtectionSourceEnum': 'type_hyperv_protection_source_enum',
+    'TypeIsilonProtectionSourceEnum': 'type_isilon_protection_source_enum',
+    'TypeKubernetesProtectionSourceEnum': 'type_kubernetes_protection_source_enum',
+    'TypeKvmProtectionSourceEnum': 'type_kvm_protection_source_enum',
+    'TypeNasProtectionSourceEnum': 'type_nas_protection_source_enum',
+    'TypeNetappProtectionSourceEnum': 'type_netapp_protection_source_enum',
+    'TypeNetappVolumeInfoEnum': 'type_netapp_volume_info_enum',
+    'TypeNetappVserverInfoEnum': 'type_netapp_vserver_info_enum',
+    'TypeNetworkInterfaceEnum': 'type_network_interface_enum',
+    'TypeOffice365ProtectionSourceEnum': 'type_office_365_protection_source_enum',
+    'TypeOracleProtectionSourceEnum': 'type_oracle_protection_source_enum',
+    'TypePhysicalProtectionSourceEnum': 'type_physical_protection_source_enum',
+    'TypeProtectionJobInfoEnum': 'type_protection_job_info_enum',
+    'TypeProtectionPolicyEnum': 'type_protection_policy_enum',
+    'TypeProtectionPolicyRequestEnum': 'type_protection_policy_request_enum',
+    'TypePureProtectionSourceEnum': 'type_pure_protection_source_enum',
+    'TypeRecoverTaskRequestEnum': 'type_recover_task_request_enum',
+    'TypeRecoveryTaskInfoEnum': 'type_recovery_task_info_enum',
+    'TypeRemoteHostEnum': 'type_remote_host_enum',
+    'TypeRestoreTaskEnum': 'type_restore_task_enum',
+    'TypeRunJobSnapshotTargetEnum': 'type_run_job_snapshot_target_enum',
+    'TypeSmbPermissionEnum': 'type_smb_permission_enum',
+    'TypeSnapshotTargetSettingsEnum': 'type_snapshot_target_settings_enum',
+    'TypeSqlProtectionSourceEnum': 'type_sql_protection_source_enum',
+    'TypeUserIdMappingEnum': 'type_user_id_mapping_enum',
+    'TypeVaultEnum': 'type_vault_enum',
+    'TypeVaultStatsInfoEnum': 'type_vault_stats_info_enum',
+    'TypeViewProtectionSourceEnum': 'type_view_protection_source_enum',
+    'TypeVmwareProtectionSourceEnum': 'type_vmware_protection_source_enum',
+    'UnRegisterApplicationServersParameters': 'un_register_application_servers_parameters',
+    'UniversalId': 'universal_id',
+    'UniversalIdProto': 'universal_id_proto',
+    'UnprotectObjectParams': 'unprotect_object_params',
+    'UpdateAntivirusServiceGroupParams': 'update_antivirus_service_group_params',
+    'UpdateApplicationServerParameters': 'update_application_server_parameters',
+    'UpdateBondParameters': 'update_bond_parameters',
+    'UpdateBondResult': 'update_bond_result',
+    'UpdateClusterParams': 'update_cluster_params',
+    'UpdateDirQuotaArgs': 'update_dir_quota_args',
+    'UpdateEulaConfig': 'update_eula_config',
+    'UpdateIdpConfigurationRequest': 'update_idp_configuration_request',
+    'UpdateIgnoredTrustedDomainsParams': 'update_ignored_trusted_domains_params',
+    'UpdateInfectedFileParams': 'update_infected_file_params',
+    'UpdateInfectedFileResponse': 'update_infected_file_response',
+    'UpdateLdapProviderParam': 'update_ldap_provider_param',
+    'UpdateLdapProviderParams': 'update_ldap_provider_params',
+    'UpdateLinuxPasswordReqParams': 'update_linux_password_req_params',
+    'UpdateLinuxPasswordResult': 'update_linux_password_result',
+    'UpdateMachineAccountsParams': 'update_machine_accounts_params',
+    'UpdateProtectionJobRun': 'update_protection_job_run',
+    'UpdateProtectionJobRunsParam': 'update_protection_job_runs_param',
+    'UpdateProtectionJobsState': 'update_protection_jobs_state',
+    'UpdateProtectionJobsStateParams': 'update_protection_jobs_state_params',
+    'UpdateProtectionObjectParameters': 'update_protection_object_parameters',
+    'UpdateProtectionSourceParameters': 'update_protection_source_parameters',
+    'UpdateResolutionParams': 'update_resolution_params',
+    'UpdateRestoreTaskParams': 'update_restore_task_params',
+    'UpdateSourcesForPrincipalsParams': 'update_sources_for_principals_params',
+    'UpdateUserQuotaSettingsForView': 'update_user_quota_settings_for_view',
+    'UpdateViewAliasParam': 'update_view_alias_param',
+    'UpdateViewParam': 'update_view_param',
+    'UpgradabilityAgentDeploymentStatusResponseEnum': 'upgradability_agent_deployment_status_response_enum',
+    'UpgradabilityEnum': 'upgradability_enum',
+    'UpgradeClusterParameters': 'upgrade_cluster_parameters',
+    'UpgradeClusterResult': 'upgrade_cluster_result',
+    'UpgradeNodeParameters': 'upgrade_node_parameters',
+    'UpgradeNodeResult': 'upgrade_node_result',
+    'UpgradePhysicalAgentsMessage': 'upgrade_physical_agents_message',
+    'UpgradePhysicalServerAgents': 'upgrade_physical_server_agents',
+    'UpgradeStatusEnum': 'upgrade_status_enum',
+    'UploadPackageResult': 'upload_package_result',
+    'UsageAndPerformanceStats': 'usage_and_performance_stats',
+    'UsageSchemaInfo': 'usage_schema_info',
+    'UsageTypeEnum': 'usage_type_enum',
+    'User': 'user',
+    'UserDatabasePreferenceEnum': 'user_database_preference_enum',
+    'UserDeleteParameters': 'user_delete_parameters',
+    'UserId': 'user_id',
+    'UserIdMapping': 'user_id_mapping',
+    'UserInfo': 'user_info',
+    'UserInformation': 'user_information',
+    'UserParameters': 'user_parameters',
+    'UserQuota': 'user_quota',
+    'UserQuotaAndUsage': 'user_quota_and_usage',
+    'UserQuotaSettings': 'user_quota_settings',
+    'UserQuotaSummaryForUser': 'user_quota_summary_for_user',
+    'UserQuotaSummaryForView': 'user_quota_summary_for_view',
+    'UuidConfigProto': 'uuid_config_proto',
+    'Value': 'value',
+    'ValueData': 'value_data',
+    'ValueTypeEnum': 'value_type_enum',
+    'Vault': 'vault',
+    'VaultBandwidthLimits': 'vault_bandwidth_limits',
+    'VaultConfig': 'vault_config',
+    'VaultEncryptionKey': 'vault_encryption_key',
+    'VaultGroupEnum': 'vault_group_enum',
+    'VaultParamsRestoreParams': 'vault_params_restore_params',
+    'VaultParamsRestoreParamsGlacier': 'vault_params_restore_params_glacier',
+    'VaultProviderStatsByEnv': 'vault_provider_stats_by_env',
+    'VaultProviderStatsInfo': 'vault_provider_stats_info',
+    'VaultRunInfo': 'vault_run_info',
+    'VaultRunStatsSummary': 'vault_run_stats_summary',
+    'VaultStats': 'vault_stats',
+    'VaultStatsInfo': 'vault_stats_info',
+    'VaultTypeEnum': 'vault_type_enum',
+    'VaultTypeVaultProviderStatsInfoEnum': 'vault_type_vault_provider_stats_info_enum',
+    'VcloudDirectorInfo': 'vcloud_director_info',
+    'View': 'view',
+    'ViewAlias': 'view_alias',
+    'ViewAliasInfo': 'view_alias_info',
+    'ViewBox': 'view_box',
+    'ViewBoxPairInfo': 'view_box_pair_info',
+    'ViewBoxStats': 'view_box_stats',
+    'ViewIdMappingProtoProtocolAccessInfo': 'view_id_mapping_proto_protocol_access_info',
+    'ViewParams': 'view_params',
+    'ViewProtection': 'view_protection',
+    'ViewProtectionSource': 'view_protection_source',
+    'ViewProtocolStats': 'view_protocol_stats',
+    'ViewStatInfo': 'view_stat_info',
+    'ViewStats': 'view_stats',
+    'ViewStatsSnapshot': 'view_stats_snapshot',
+    'ViewUserQuotaParameters': 'view_user_quota_parameters',
+    'ViewUserQuotas': 'view_user_quotas',
+    'VirtualDiskId': 'virtual_disk_id',
+    'VirtualDiskIdInformation': 'virtual_disk_id_information',
+    'VirtualDiskInfo': 'virtual_disk_info',
+    'VirtualDiskInformation': 'virtual_disk_information',
+    'VirtualDiskMapping': 'virtual_disk_mapping',
+    'VirtualDiskMappingResponse': 'virtual_disk_mapping_response',
+    'VirtualDiskRecoverTaskState': 'virtual_disk_recover_task_state',
+    'VirtualDiskRestoreParameters': 'virtual_disk_restore_parameters',
+    'VirtualDiskRestoreResponse': 'virtual_disk_restore_response',
+    'VirtualNodeConfiguration': 'virtual_node_configuration',
+    'Vlan': 'vlan',
+    'VlanParameters': 'vlan_parameters',
+    'VmBackupStatusEnum': 'vm_backup_status_enum',
+    'VmBackupTypeEnum': 'vm_backup_type_enum',
+    'VmVolumesInformation': 'vm_volumes_information',
+    'VmwareBackupEnvParams': 'vmware_backup_env_params',
+    'VmwareBackupSourceParams': 'vmware_backup_source_params',
+    'VmwareCloneParameters': 'vmware_clone_parameters',
+    'VmwareDiskExclusionProto': 'vmware_disk_exclusion_proto',
+    'VmwareEnvJobParameters': 'vmware_env_job_parameters',
+    'VmwareObjectId': 'vmware_object_id',
+    'VmwareProtectionSource': 'vmware_protection_source',
+    'VmwareRestoreParameters': 'vmware_restore_parameters',
+    'VmwareSpecialParameters': 'vmware_special_parameters',
+    'VmwareTypeEnum': 'vmware_type_enum',
+    'VolumeInfo': 'volume_info',
+    'VolumeInfoDiskInfo': 'volume_info_disk_info',
+    'VolumeInfoDiskInfoPartitionInfo': 'volume_info_disk_info_partition_info',
+    'VolumeInfoDiskInfoPhysicalRange': 'volume_info_disk_info_physical_range',
+    'VolumeInfoLogicalVolumeInfo': 'volume_info_logical_volume_info',
+    'VolumeSecurityInfo': 'volume_security_info',
+    'VserverNetworkInterface': 'vserver_network_interface',
+    'WebHookDeliveryTarget': 'web_hook_delivery_target',
+    'WindowsHostSnapshotParameters': 'windows_host_snapshot_parameters',
+    'WormRetentionProto': 'worm_retention_proto',
+    'WormRetentionTypeDataMigrationPolicyEnum': 'worm_retention_type_data_migration_policy_enum',
+    'WormRetentionTypeEnum': 'worm_retention_type_enum',
+    'WormRetentionTypeProtectionPolicyEnum': 'worm_retention_type_protection_policy_enum',
+    'WormRetentionTypeProtectionPolicyRequestEnum': 'worm_retention_type_protection_policy_request_enum',
+    'YodaIOPreferentialTierEnum': 'yoda_io_preferential_tier_enum',
+}
+
+
+def __getattr__(name):
+    """Imports the module of a model the first time the model is read from
+    the package (Python 3.7+), instead of importing all the models with it.
+    """
+    if name not in _modules:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    import importlib
+    model = getattr(importlib.import_module('{}.{}'.format(__name__, _modules[name])), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_modules))
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_source
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AagAndDatabases(object):
 
@@ -24,6 +24,16 @@ class AagAndDatabases(object):
         "databases":'databases'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "aag":'protection_source.ProtectionSource',
+        "databases":['protection_source.ProtectionSource']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  aag=None,
                  databases=None):
@@ -48,19 +58,6 @@ class AagAndDatabases(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        aag = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('aag')) if dictionary.get('aag') else None
-        databases = None
-        if dictionary.get('databases') != None:
-            databases = list()
-            for structure in dictionary.get('databases'):
-                databases.append(cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(aag,
-                   databases)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AccessToken(object):
 
@@ -24,6 +25,9 @@ class AccessToken(object):
         "token_type":'tokenType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_token=None,
                  privileges=None,
@@ -50,17 +54,6 @@ class AccessToken(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_token = dictionary.get('accessToken')
-        privileges = dictionary.get('privileges')
-        token_type = dictionary.get('tokenType')
-
-        # Return an object of this model
-        return cls(access_token,
-                   privileges,
-                   token_type)
+        return decode_model(cls, dictionary)
 
 
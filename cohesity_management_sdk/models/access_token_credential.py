@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AccessTokenCredential(object):
 
@@ -28,6 +29,9 @@ class AccessTokenCredential(object):
         "domain":'domain'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  password=None,
                  username=None,
@@ -54,17 +58,6 @@ class AccessTokenCredential(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        password = dictionary.get('password')
-        username = dictionary.get('username')
-        domain = dictionary.get('domain')
-
-        # Return an object of this model
-        return cls(password,
-                   username,
-                   domain)
+        return decode_model(cls, dictionary)
 
 
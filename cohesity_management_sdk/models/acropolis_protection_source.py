@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AcropolisProtectionSource(object):
 
@@ -42,6 +43,9 @@ class AcropolisProtectionSource(object):
         "uuid":'uuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_uuid=None,
                  description=None,
@@ -74,23 +78,6 @@ class AcropolisProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_uuid = dictionary.get('clusterUuid')
-        description = dictionary.get('description')
-        mount_path = dictionary.get('mountPath')
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-        uuid = dictionary.get('uuid')
-
-        # Return an object of this model
-        return cls(cluster_uuid,
-                   description,
-                   mount_path,
-                   name,
-                   mtype,
-                   uuid)
+        return decode_model(cls, dictionary)
 
 
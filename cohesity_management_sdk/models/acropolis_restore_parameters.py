@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AcropolisRestoreParameters(object):
 
@@ -58,6 +59,9 @@ class AcropolisRestoreParameters(object):
         "suffix":'suffix'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disable_network=None,
                  network_id=None,
@@ -90,23 +94,6 @@ class AcropolisRestoreParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disable_network = dictionary.get('disableNetwork')
-        network_id = dictionary.get('networkId')
-        powered_on = dictionary.get('poweredOn')
-        prefix = dictionary.get('prefix')
-        storage_container_id = dictionary.get('storageContainerId')
-        suffix = dictionary.get('suffix')
-
-        # Return an object of this model
-        return cls(disable_network,
-                   network_id,
-                   powered_on,
-                   prefix,
-                   storage_container_id,
-                   suffix)
+        return decode_model(cls, dictionary)
 
 
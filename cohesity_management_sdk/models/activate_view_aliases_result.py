@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.view_alias_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ActivateViewAliasesResult(object):
 
@@ -22,6 +22,15 @@ class ActivateViewAliasesResult(object):
         "aliases":'aliases'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "aliases":['view_alias_info.ViewAliasInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  aliases=None):
         """Constructor for the ActivateViewAliasesResult class"""
@@ -44,17 +53,6 @@ class ActivateViewAliasesResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        aliases = None
-        if dictionary.get('aliases') != None:
-            aliases = list()
-            for structure in dictionary.get('aliases'):
-                aliases.append(cohesity_management_sdk.models.view_alias_info.ViewAliasInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(aliases)
+        return decode_model(cls, dictionary)
 
 
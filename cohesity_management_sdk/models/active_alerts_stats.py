@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ActiveAlertsStats(object):
 
@@ -61,6 +62,9 @@ class ActiveAlertsStats(object):
         "num_warning_alerts":'numWarningAlerts'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  num_critical_alerts=None,
                  num_hardware_alerts=None,
@@ -111,41 +115,6 @@ class ActiveAlertsStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        num_critical_alerts = dictionary.get('numCriticalAlerts')
-        num_hardware_alerts = dictionary.get('numHardwareAlerts')
-        num_hardware_critical_alerts = dictionary.get('numHardwareCriticalAlerts')
-        num_hardware_info_alerts = dictionary.get('numHardwareInfoAlerts')
-        num_hardware_warning_alerts = dictionary.get('numHardwareWarningAlerts')
-        num_info_alerts = dictionary.get('numInfoAlerts')
-        num_service_alerts = dictionary.get('numServiceAlerts')
-        num_service_critical_alerts = dictionary.get('numServiceCriticalAlerts')
-        num_service_info_alerts = dictionary.get('numServiceInfoAlerts')
-        num_service_warning_alerts = dictionary.get('numServiceWarningAlerts')
-        num_software_alerts = dictionary.get('numSoftwareAlerts')
-        num_software_critical_alerts = dictionary.get('numSoftwareCriticalAlerts')
-        num_software_info_alerts = dictionary.get('numSoftwareInfoAlerts')
-        num_software_warning_alerts = dictionary.get('numSoftwareWarningAlerts')
-        num_warning_alerts = dictionary.get('numWarningAlerts')
-
-        # Return an object of this model
-        return cls(num_critical_alerts,
-                   num_hardware_alerts,
-                   num_hardware_critical_alerts,
-                   num_hardware_info_alerts,
-                   num_hardware_warning_alerts,
-                   num_info_alerts,
-                   num_service_alerts,
-                   num_service_critical_alerts,
-                   num_service_info_alerts,
-                   num_service_warning_alerts,
-                   num_software_alerts,
-                   num_software_critical_alerts,
-                   num_software_info_alerts,
-                   num_software_warning_alerts,
-                   num_warning_alerts)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.user_id_mapping
-import cohesity_management_sdk.models.preferred_domain_controller
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ActiveDirectoryEntry(object):
 
@@ -62,6 +61,17 @@ class ActiveDirectoryEntry(object):
         "workgroup":'workgroup'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "fallback_user_id_mapping_info":'user_id_mapping.UserIdMapping',
+        "preferred_domain_controllers":['preferred_domain_controller.PreferredDomainController'],
+        "user_id_mapping_info":'user_id_mapping.UserIdMapping'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain_name=None,
                  fallback_user_id_mapping_info=None,
@@ -112,45 +122,6 @@ class ActiveDirectoryEntry(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain_name = dictionary.get('domainName')
-        fallback_user_id_mapping_info = cohesity_management_sdk.models.user_id_mapping.UserIdMapping.from_dictionary(dictionary.get('fallbackUserIdMappingInfo')) if dictionary.get('fallbackUserIdMappingInfo') else None
-        ignored_trusted_domains = dictionary.get('ignoredTrustedDomains')
-        ldap_provider_id = dictionary.get('ldapProviderId')
-        machine_accounts = dictionary.get('machineAccounts')
-        ou_name = dictionary.get('ouName')
-        password = dictionary.get('password')
-        preferred_domain_controllers = None
-        if dictionary.get('preferredDomainControllers') != None:
-            preferred_domain_controllers = list()
-            for structure in dictionary.get('preferredDomainControllers'):
-                preferred_domain_controllers.append(cohesity_management_sdk.models.preferred_domain_controller.PreferredDomainController.from_dictionary(structure))
-        tenant_id = dictionary.get('tenantId')
-        trusted_domains = dictionary.get('trustedDomains')
-        trusted_domains_enabled = dictionary.get('trustedDomainsEnabled')
-        unix_root_sid = dictionary.get('unixRootSid')
-        user_id_mapping_info = cohesity_management_sdk.models.user_id_mapping.UserIdMapping.from_dictionary(dictionary.get('userIdMappingInfo')) if dictionary.get('userIdMappingInfo') else None
-        user_name = dictionary.get('userName')
-        workgroup = dictionary.get('workgroup')
-
-        # Return an object of this model
-        return cls(domain_name,
-                   fallback_user_id_mapping_info,
-                   ignored_trusted_domains,
-                   ldap_provider_id,
-                   machine_accounts,
-                   ou_name,
-                   password,
-                   preferred_domain_controllers,
-                   tenant_id,
-                   trusted_domains,
-                   trusted_domains_enabled,
-                   unix_root_sid,
-                   user_id_mapping_info,
-                   user_name,
-                   workgroup)
+        return decode_model(cls, dictionary)
 
 
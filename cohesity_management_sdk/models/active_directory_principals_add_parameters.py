@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ActiveDirectoryPrincipalsAddParameters(object):
 
@@ -52,6 +53,9 @@ class ActiveDirectoryPrincipalsAddParameters(object):
         "roles":'roles'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  description=None,
                  domain=None,
@@ -84,23 +88,6 @@ class ActiveDirectoryPrincipalsAddParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        description = dictionary.get('description')
-        domain = dictionary.get('domain')
-        object_class = dictionary.get('objectClass')
-        principal_name = dictionary.get('principalName')
-        restricted = dictionary.get('restricted')
-        roles = dictionary.get('roles')
-
-        # Return an object of this model
-        return cls(description,
-                   domain,
-                   object_class,
-                   principal_name,
-                   restricted,
-                   roles)
+        return decode_model(cls, dictionary)
 
 
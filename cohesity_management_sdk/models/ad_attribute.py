@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.attribute_value
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdAttribute(object):
 
@@ -46,6 +46,17 @@ class AdAttribute(object):
         "source_value":'sourceValue'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "destination_value":'attribute_value.AttributeValue',
+        "same_value":'attribute_value.AttributeValue',
+        "source_value":'attribute_value.AttributeValue'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_attribute_flags=None,
                  destination_value=None,
@@ -78,23 +89,6 @@ class AdAttribute(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_attribute_flags = dictionary.get('adAttributeFlags')
-        destination_value = cohesity_management_sdk.models.attribute_value.AttributeValue.from_dictionary(dictionary.get('destinationValue')) if dictionary.get('destinationValue') else None
-        error_message = dictionary.get('errorMessage')
-        name = dictionary.get('name')
-        same_value = cohesity_management_sdk.models.attribute_value.AttributeValue.from_dictionary(dictionary.get('sameValue')) if dictionary.get('sameValue') else None
-        source_value = cohesity_management_sdk.models.attribute_value.AttributeValue.from_dictionary(dictionary.get('sourceValue')) if dictionary.get('sourceValue') else None
-
-        # Return an object of this model
-        return cls(ad_attribute_flags,
-                   destination_value,
-                   error_message,
-                   name,
-                   same_value,
-                   source_value)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_guid_pair_ad_attribute_restore_param
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ADAttributeRestoreParam(object):
 
@@ -45,6 +45,15 @@ class ADAttributeRestoreParam(object):
         "property_vec":'propertyVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "guidpair_vec":['ad_guid_pair_ad_attribute_restore_param.ADGuidPairADAttributeRestoreParam']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  excluded_property_vec=None,
                  guidpair_vec=None,
@@ -73,23 +82,6 @@ class ADAttributeRestoreParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        excluded_property_vec = dictionary.get('excludedPropertyVec')
-        guidpair_vec = None
-        if dictionary.get('guidpairVec') != None:
-            guidpair_vec = list()
-            for structure in dictionary.get('guidpairVec'):
-                guidpair_vec.append(cohesity_management_sdk.models.ad_guid_pair_ad_attribute_restore_param.ADGuidPairADAttributeRestoreParam.from_dictionary(structure))
-        option_flags = dictionary.get('optionFlags')
-        property_vec = dictionary.get('propertyVec')
-
-        # Return an object of this model
-        return cls(excluded_property_vec,
-                   guidpair_vec,
-                   option_flags,
-                   property_vec)
+        return decode_model(cls, dictionary)
 
 
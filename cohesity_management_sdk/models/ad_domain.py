@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_domain_identity
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdDomain(object):
 
@@ -29,6 +29,15 @@ class AdDomain(object):
         "tombstone_days":'tombstoneDays'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "identity":'ad_domain_identity.AdDomainIdentity'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  dns_root=None,
                  forest=None,
@@ -61,23 +70,6 @@ class AdDomain(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        dns_root = dictionary.get('dnsRoot')
-        forest = dictionary.get('forest')
-        identity = cohesity_management_sdk.models.ad_domain_identity.AdDomainIdentity.from_dictionary(dictionary.get('identity')) if dictionary.get('identity') else None
-        netbios_name = dictionary.get('netbiosName')
-        parent_domain = dictionary.get('parentDomain')
-        tombstone_days = dictionary.get('tombstoneDays')
-
-        # Return an object of this model
-        return cls(dns_root,
-                   forest,
-                   identity,
-                   netbios_name,
-                   parent_domain,
-                   tombstone_days)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_domain
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdDomainController(object):
 
@@ -37,6 +37,15 @@ class AdDomainController(object):
         "utc_offset_min":'utcOffsetMin'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "domain":'ad_domain.AdDomain'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_supported=None,
                  backup_unsupported_reasons=None,
@@ -71,25 +80,6 @@ class AdDomainController(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_supported = dictionary.get('backupSupported')
-        backup_unsupported_reasons = dictionary.get('backupUnsupportedReasons')
-        domain = cohesity_management_sdk.models.ad_domain.AdDomain.from_dictionary(dictionary.get('domain')) if dictionary.get('domain') else None
-        host_name = dictionary.get('hostName')
-        is_global_catalog = dictionary.get('isGlobalCatalog')
-        is_read_only = dictionary.get('isReadOnly')
-        utc_offset_min = dictionary.get('utcOffsetMin')
-
-        # Return an object of this model
-        return cls(backup_supported,
-                   backup_unsupported_reasons,
-                   domain,
-                   host_name,
-                   is_global_catalog,
-                   is_read_only,
-                   utc_offset_min)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdDomainIdentity(object):
 
@@ -24,6 +25,9 @@ class AdDomainIdentity(object):
         "sid":'sid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  dn=None,
                  guid=None,
@@ -52,19 +56,6 @@ class AdDomainIdentity(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        dn = dictionary.get('dn')
-        guid = dictionary.get('guid')
-        name = dictionary.get('name')
-        sid = dictionary.get('sid')
-
-        # Return an object of this model
-        return cls(dn,
-                   guid,
-                   name,
-                   sid)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ADGuidPairADAttributeRestoreParam(object):
 
@@ -23,6 +24,9 @@ class ADGuidPairADAttributeRestoreParam(object):
         "source":'source'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  destination=None,
                  source=None):
@@ -47,15 +51,6 @@ class ADGuidPairADAttributeRestoreParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        destination = dictionary.get('destination')
-        source = dictionary.get('source')
-
-        # Return an object of this model
-        return cls(destination,
-                   source)
+        return decode_model(cls, dictionary)
 
 
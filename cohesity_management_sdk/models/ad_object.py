@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ADObject(object):
 
@@ -48,6 +49,9 @@ class ADObject(object):
         "source_guid":'sourceGuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  description=None,
                  destination_guid=None,
@@ -84,27 +88,6 @@ class ADObject(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        description = dictionary.get('description')
-        destination_guid = dictionary.get('destinationGuid')
-        display_name = dictionary.get('displayName')
-        distinguished_name = dictionary.get('distinguishedName')
-        error_message = dictionary.get('errorMessage')
-        object_class = dictionary.get('objectClass')
-        search_result_flags = dictionary.get('searchResultFlags')
-        source_guid = dictionary.get('sourceGuid')
-
-        # Return an object of this model
-        return cls(description,
-                   destination_guid,
-                   display_name,
-                   distinguished_name,
-                   error_message,
-                   object_class,
-                   search_result_flags,
-                   source_guid)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_guid_pair
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdObjectAttributeParameters(object):
 
@@ -46,6 +46,15 @@ class AdObjectAttributeParameters(object):
         "merge_multi_val_properties":'mergeMultiValProperties'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ad_guid_pairs":['ad_guid_pair.AdGuidPair']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_guid_pairs=None,
                  exclude_ldap_properties=None,
@@ -74,23 +83,6 @@ class AdObjectAttributeParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_guid_pairs = None
-        if dictionary.get('adGuidPairs') != None:
-            ad_guid_pairs = list()
-            for structure in dictionary.get('adGuidPairs'):
-                ad_guid_pairs.append(cohesity_management_sdk.models.ad_guid_pair.AdGuidPair.from_dictionary(structure))
-        exclude_ldap_properties = dictionary.get('excludeLdapProperties')
-        ldap_properties = dictionary.get('ldapProperties')
-        merge_multi_val_properties = dictionary.get('mergeMultiValProperties')
-
-        # Return an object of this model
-        return cls(ad_guid_pairs,
-                   exclude_ldap_properties,
-                   ldap_properties,
-                   merge_multi_val_properties)
+        return decode_model(cls, dictionary)
 
 
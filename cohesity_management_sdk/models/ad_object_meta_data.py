@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdObjectMetaData(object):
 
@@ -23,6 +24,9 @@ class AdObjectMetaData(object):
         "sam_account_name":'samAccountName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  guid=None,
                  name=None,
@@ -49,17 +53,6 @@ class AdObjectMetaData(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        guid = dictionary.get('guid')
-        name = dictionary.get('name')
-        sam_account_name = dictionary.get('samAccountName')
-
-        # Return an object of this model
-        return cls(guid,
-                   name,
-                   sam_account_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.attribute_restore_information
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdObjectRestoreInformation(object):
 
@@ -33,6 +33,15 @@ class AdObjectRestoreInformation(object):
         "time_taken_msecs":'timeTakenMsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "attribute_restore_info":['attribute_restore_information.AttributeRestoreInformation']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  attribute_restore_info=None,
                  error_message=None,
@@ -63,25 +72,6 @@ class AdObjectRestoreInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        attribute_restore_info = None
-        if dictionary.get('attributeRestoreInfo') != None:
-            attribute_restore_info = list()
-            for structure in dictionary.get('attributeRestoreInfo'):
-                attribute_restore_info.append(cohesity_management_sdk.models.attribute_restore_information.AttributeRestoreInformation.from_dictionary(structure))
-        error_message = dictionary.get('errorMessage')
-        name = dictionary.get('name')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        time_taken_msecs = dictionary.get('timeTakenMsecs')
-
-        # Return an object of this model
-        return cls(attribute_restore_info,
-                   error_message,
-                   name,
-                   start_time_usecs,
-                   time_taken_msecs)
+        return decode_model(cls, dictionary)
 
 
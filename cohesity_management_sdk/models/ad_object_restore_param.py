@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.credentials
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ADObjectRestoreParam(object):
 
@@ -35,6 +35,15 @@ class ADObjectRestoreParam(object):
         "ou_path":'ouPath'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "credentials":'credentials.Credentials'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  credentials=None,
                  guid_vec=None,
@@ -63,19 +72,6 @@ class ADObjectRestoreParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('credentials')) if dictionary.get('credentials') else None
-        guid_vec = dictionary.get('guidVec')
-        option_flags = dictionary.get('optionFlags')
-        ou_path = dictionary.get('ouPath')
-
-        # Return an object of this model
-        return cls(credentials,
-                   guid_vec,
-                   option_flags,
-                   ou_path)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdObjectRestoreParameters(object):
 
@@ -51,6 +52,9 @@ class AdObjectRestoreParameters(object):
         "password":'password'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  change_password_on_next_logon=None,
                  leave_state_disabled=None,
@@ -81,21 +85,6 @@ class AdObjectRestoreParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        change_password_on_next_logon = dictionary.get('changePasswordOnNextLogon')
-        leave_state_disabled = dictionary.get('leaveStateDisabled')
-        object_guids = dictionary.get('objectGuids')
-        organization_unit_path = dictionary.get('organizationUnitPath')
-        password = dictionary.get('password')
-
-        # Return an object of this model
-        return cls(change_password_on_next_logon,
-                   leave_state_disabled,
-                   object_guids,
-                   organization_unit_path,
-                   password)
+        return decode_model(cls, dictionary)
 
 
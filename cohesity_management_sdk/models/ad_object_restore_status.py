@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_object_restore_status_ad_attribute_restore_status
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ADObjectRestoreStatus(object):
 
@@ -46,6 +45,16 @@ class ADObjectRestoreStatus(object):
         "timetaken_ms":'timetakenMs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "property_status_vec":['ad_object_restore_status_ad_attribute_restore_status.ADObjectRestoreStatusADAttributeRestoreStatus'],
+        "status":'error_proto.ErrorProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  dest_guid=None,
                  object_flags=None,
@@ -78,27 +87,6 @@ class ADObjectRestoreStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        dest_guid = dictionary.get('destGuid')
-        object_flags = dictionary.get('objectFlags')
-        property_status_vec = None
-        if dictionary.get('propertyStatusVec') != None:
-            property_status_vec = list()
-            for structure in dictionary.get('propertyStatusVec'):
-                property_status_vec.append(cohesity_management_sdk.models.ad_object_restore_status_ad_attribute_restore_status.ADObjectRestoreStatusADAttributeRestoreStatus.from_dictionary(structure))
-        source_guid = dictionary.get('sourceGuid')
-        status = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('status')) if dictionary.get('status') else None
-        timetaken_ms = dictionary.get('timetakenMs')
-
-        # Return an object of this model
-        return cls(dest_guid,
-                   object_flags,
-                   property_status_vec,
-                   source_guid,
-                   status,
-                   timetaken_ms)
+        return decode_model(cls, dictionary)
 
 
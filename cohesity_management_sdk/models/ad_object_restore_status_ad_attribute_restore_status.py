@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ADObjectRestoreStatusADAttributeRestoreStatus(object):
 
@@ -25,6 +25,15 @@ class ADObjectRestoreStatusADAttributeRestoreStatus(object):
         "ldap_name":'ldapName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "attrstatus_vec":['error_proto.ErrorProto']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  attrstatus_vec=None,
                  ldap_name=None):
@@ -49,19 +58,6 @@ class ADObjectRestoreStatusADAttributeRestoreStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        attrstatus_vec = None
-        if dictionary.get('attrstatusVec') != None:
-            attrstatus_vec = list()
-            for structure in dictionary.get('attrstatusVec'):
-                attrstatus_vec.append(cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(structure))
-        ldap_name = dictionary.get('ldapName')
-
-        # Return an object of this model
-        return cls(attrstatus_vec,
-                   ldap_name)
+        return decode_model(cls, dictionary)
 
 
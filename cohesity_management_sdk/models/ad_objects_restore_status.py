@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_object_restore_information
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdObjectsRestoreStatus(object):
 
@@ -29,6 +29,15 @@ class AdObjectsRestoreStatus(object):
         "num_objects_succeeded":'numObjectsSucceeded'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ad_objects_restore_info":['ad_object_restore_information.AdObjectRestoreInformation']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_objects_restore_info=None,
                  num_objects_failed=None,
@@ -55,21 +64,6 @@ class AdObjectsRestoreStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_objects_restore_info = None
-        if dictionary.get('adObjectsRestoreInfo') != None:
-            ad_objects_restore_info = list()
-            for structure in dictionary.get('adObjectsRestoreInfo'):
-                ad_objects_restore_info.append(cohesity_management_sdk.models.ad_object_restore_information.AdObjectRestoreInformation.from_dictionary(structure))
-        num_objects_failed = dictionary.get('numObjectsFailed')
-        num_objects_succeeded = dictionary.get('numObjectsSucceeded')
-
-        # Return an object of this model
-        return cls(ad_objects_restore_info,
-                   num_objects_failed,
-                   num_objects_succeeded)
+        return decode_model(cls, dictionary)
 
 
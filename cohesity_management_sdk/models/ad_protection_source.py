@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_domain_controller
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdProtectionSource(object):
 
@@ -29,6 +29,15 @@ class AdProtectionSource(object):
         "uuid":'uuid'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "domain_controller":'ad_domain_controller.AdDomainController'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain_controller=None,
                  name=None,
@@ -59,21 +68,6 @@ class AdProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain_controller = cohesity_management_sdk.models.ad_domain_controller.AdDomainController.from_dictionary(dictionary.get('domainController')) if dictionary.get('domainController') else None
-        name = dictionary.get('name')
-        owner_id = dictionary.get('ownerId')
-        mtype = dictionary.get('type')
-        uuid = dictionary.get('uuid')
-
-        # Return an object of this model
-        return cls(domain_controller,
-                   name,
-                   owner_id,
-                   mtype,
-                   uuid)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_object_attribute_parameters
-import cohesity_management_sdk.models.ad_object_restore_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdRestoreOptions(object):
 
@@ -34,6 +33,16 @@ class AdRestoreOptions(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "object_attribute_parameters":'ad_object_attribute_parameters.AdObjectAttributeParameters',
+        "object_parameters":'ad_object_restore_parameters.AdObjectRestoreParameters'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  object_attribute_parameters=None,
                  object_parameters=None,
@@ -60,17 +69,6 @@ class AdRestoreOptions(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        object_attribute_parameters = cohesity_management_sdk.models.ad_object_attribute_parameters.AdObjectAttributeParameters.from_dictionary(dictionary.get('objectAttributeParameters')) if dictionary.get('objectAttributeParameters') else None
-        object_parameters = cohesity_management_sdk.models.ad_object_restore_parameters.AdObjectRestoreParameters.from_dictionary(dictionary.get('objectParameters')) if dictionary.get('objectParameters') else None
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(object_attribute_parameters,
-                   object_parameters,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.credentials
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdRestoreParameters(object):
 
@@ -23,6 +23,15 @@ class AdRestoreParameters(object):
         "port":'port'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "credentials":'credentials.Credentials'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  credentials=None,
                  port=None):
@@ -47,15 +56,6 @@ class AdRestoreParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('credentials')) if dictionary.get('credentials') else None
-        port = dictionary.get('port')
-
-        # Return an object of this model
-        return cls(credentials,
-                   port)
+        return decode_model(cls, dictionary)
 
 
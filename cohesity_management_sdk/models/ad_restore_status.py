@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.compare_ad_objects_result_ad_object
-import cohesity_management_sdk.models.ad_object_restore_status
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ADRestoreStatus(object):
 
@@ -27,6 +26,16 @@ class ADRestoreStatus(object):
         "status":'status'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "object_info":'compare_ad_objects_result_ad_object.CompareADObjectsResultADObject',
+        "status":'ad_object_restore_status.ADObjectRestoreStatus'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  object_info=None,
                  status=None):
@@ -51,15 +60,6 @@ class ADRestoreStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        object_info = cohesity_management_sdk.models.compare_ad_objects_result_ad_object.CompareADObjectsResultADObject.from_dictionary(dictionary.get('objectInfo')) if dictionary.get('objectInfo') else None
-        status = cohesity_management_sdk.models.ad_object_restore_status.ADObjectRestoreStatus.from_dictionary(dictionary.get('status')) if dictionary.get('status') else None
-
-        # Return an object of this model
-        return cls(object_info,
-                   status)
+        return decode_model(cls, dictionary)
 
 
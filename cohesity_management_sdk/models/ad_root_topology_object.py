@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdRootTopologyObject(object):
 
@@ -41,6 +42,9 @@ class AdRootTopologyObject(object):
         "source_guid":'sourceGuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  child_objects=None,
                  description=None,
@@ -77,27 +81,6 @@ class AdRootTopologyObject(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        child_objects = dictionary.get('childObjects')
-        description = dictionary.get('description')
-        dest_guid = dictionary.get('destGuid')
-        display_name = dictionary.get('displayName')
-        distinguished_name = dictionary.get('distinguishedName')
-        error_message = dictionary.get('errorMessage')
-        object_class = dictionary.get('objectClass')
-        source_guid = dictionary.get('sourceGuid')
-
-        # Return an object of this model
-        return cls(child_objects,
-                   description,
-                   dest_guid,
-                   display_name,
-                   distinguished_name,
-                   error_message,
-                   object_class,
-                   source_guid)
+        return decode_model(cls, dictionary)
 
 
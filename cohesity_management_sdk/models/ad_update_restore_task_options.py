@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_attribute_restore_param
-import cohesity_management_sdk.models.ad_object_restore_param
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ADUpdateRestoreTaskOptions(object):
 
@@ -25,6 +24,16 @@ class ADUpdateRestoreTaskOptions(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "object_attributes_param":'ad_attribute_restore_param.ADAttributeRestoreParam',
+        "object_param":'ad_object_restore_param.ADObjectRestoreParam'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  object_attributes_param=None,
                  object_param=None,
@@ -51,17 +60,6 @@ class ADUpdateRestoreTaskOptions(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        object_attributes_param = cohesity_management_sdk.models.ad_attribute_restore_param.ADAttributeRestoreParam.from_dictionary(dictionary.get('objectAttributesParam')) if dictionary.get('objectAttributesParam') else None
-        object_param = cohesity_management_sdk.models.ad_object_restore_param.ADObjectRestoreParam.from_dictionary(dictionary.get('objectParam')) if dictionary.get('objectParam') else None
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(object_attributes_param,
-                   object_param,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AddedActiveDirectoryPrincipal(object):
 
@@ -60,6 +61,9 @@ class AddedActiveDirectoryPrincipal(object):
         "sid":'sid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  created_time_msecs=None,
                  description=None,
@@ -98,29 +102,6 @@ class AddedActiveDirectoryPrincipal(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        created_time_msecs = dictionary.get('createdTimeMsecs')
-        description = dictionary.get('description')
-        domain = dictionary.get('domain')
-        last_updated_time_msecs = dictionary.get('lastUpdatedTimeMsecs')
-        object_class = dictionary.get('objectClass')
-        principal_name = dictionary.get('principalName')
-        restricted = dictionary.get('restricted')
-        roles = dictionary.get('roles')
-        sid = dictionary.get('sid')
-
-        # Return an object of this model
-        return cls(created_time_msecs,
-                   description,
-                   domain,
-                   last_updated_time_msecs,
-                   object_class,
-                   principal_name,
-                   restricted,
-                   roles,
-                   sid)
+        return decode_model(cls, dictionary)
 
 
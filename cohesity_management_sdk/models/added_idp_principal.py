@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AddedIdpPrincipal(object):
 
@@ -56,6 +57,9 @@ class AddedIdpPrincipal(object):
         "sid":'sid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  created_time_msecs=None,
                  domain=None,
@@ -92,27 +96,6 @@ class AddedIdpPrincipal(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        created_time_msecs = dictionary.get('createdTimeMsecs')
-        domain = dictionary.get('domain')
-        last_updated_time_msecs = dictionary.get('lastUpdatedTimeMsecs')
-        object_class = dictionary.get('objectClass')
-        principal_name = dictionary.get('principalName')
-        restricted = dictionary.get('restricted')
-        roles = dictionary.get('roles')
-        sid = dictionary.get('sid')
-
-        # Return an object of this model
-        return cls(created_time_msecs,
-                   domain,
-                   last_updated_time_msecs,
-                   object_class,
-                   principal_name,
-                   restricted,
-                   roles,
-                   sid)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.oracle_db_channel_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AdditionalOracleDBParams(object):
 
@@ -24,6 +24,15 @@ class AdditionalOracleDBParams(object):
         "db_info_channel_vec":'dbInfoChannelVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "db_info_channel_vec":['oracle_db_channel_info.OracleDBChannelInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  app_entity_id=None,
                  db_info_channel_vec=None):
@@ -48,19 +57,6 @@ class AdditionalOracleDBParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        app_entity_id = dictionary.get('appEntityId')
-        db_info_channel_vec = None
-        if dictionary.get('dbInfoChannelVec') != None:
-            db_info_channel_vec = list()
-            for structure in dictionary.get('dbInfoChannelVec'):
-                db_info_channel_vec.append(cohesity_management_sdk.models.oracle_db_channel_info.OracleDBChannelInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(app_entity_id,
-                   db_info_channel_vec)
+        return decode_model(cls, dictionary)
 
 
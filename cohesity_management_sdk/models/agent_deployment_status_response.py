@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AgentDeploymentStatusResponse(object):
 
@@ -65,6 +66,9 @@ class AgentDeploymentStatusResponse(object):
         "version":'version'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  compact_version=None,
                  health_status=None,
@@ -101,27 +105,6 @@ class AgentDeploymentStatusResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        compact_version = dictionary.get('compactVersion')
-        health_status = dictionary.get('healthStatus')
-        host_ip = dictionary.get('hostIp')
-        host_os_type = dictionary.get('hostOsType')
-        last_upgrade_status = dictionary.get('lastUpgradeStatus')
-        upgradability = dictionary.get('upgradability')
-        upgrade_status_message = dictionary.get('upgradeStatusMessage')
-        version = dictionary.get('version')
-
-        # Return an object of this model
-        return cls(compact_version,
-                   health_status,
-                   host_ip,
-                   host_os_type,
-                   last_upgrade_status,
-                   upgradability,
-                   upgrade_status_message,
-                   version)
+        return decode_model(cls, dictionary)
 
 
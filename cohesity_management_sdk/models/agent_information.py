@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.registered_source_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AgentInformation(object):
 
@@ -79,6 +79,15 @@ class AgentInformation(object):
         "version":'version'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "registration_info":'registered_source_info.RegisteredSourceInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cbmr_version=None,
                  host_type=None,
@@ -125,37 +134,6 @@ class AgentInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cbmr_version = dictionary.get('cbmrVersion')
-        host_type = dictionary.get('hostType')
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        oracle_multi_node_channel_supported = dictionary.get('oracleMultiNodeChannelSupported')
-        registration_info = cohesity_management_sdk.models.registered_source_info.RegisteredSourceInfo.from_dictionary(dictionary.get('registrationInfo')) if dictionary.get('registrationInfo') else None
-        source_side_dedup_enabled = dictionary.get('sourceSideDedupEnabled')
-        status = dictionary.get('status')
-        status_message = dictionary.get('statusMessage')
-        upgradability = dictionary.get('upgradability')
-        upgrade_status = dictionary.get('upgradeStatus')
-        upgrade_status_message = dictionary.get('upgradeStatusMessage')
-        version = dictionary.get('version')
-
-        # Return an object of this model
-        return cls(cbmr_version,
-                   host_type,
-                   id,
-                   name,
-                   oracle_multi_node_channel_supported,
-                   registration_info,
-                   source_side_dedup_enabled,
-                   status,
-                   status_message,
-                   upgradability,
-                   upgrade_status,
-                   upgrade_status_message,
-                   version)
+        return decode_model(cls, dictionary)
 
 
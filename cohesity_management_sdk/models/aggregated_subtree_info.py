@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AggregatedSubtreeInfo(object):
 
@@ -60,6 +61,9 @@ class AggregatedSubtreeInfo(object):
         "total_logical_size":'totalLogicalSize'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  environment=None,
                  leaves_count=None,
@@ -86,17 +90,6 @@ class AggregatedSubtreeInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        environment = dictionary.get('environment')
-        leaves_count = dictionary.get('leavesCount')
-        total_logical_size = dictionary.get('totalLogicalSize')
-
-        # Return an object of this model
-        return cls(environment,
-                   leaves_count,
-                   total_logical_size)
+        return decode_model(cls, dictionary)
 
 
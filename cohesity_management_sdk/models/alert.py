@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.alert_document
-import cohesity_management_sdk.models.alert_property
-import cohesity_management_sdk.models.alert_resolution_details
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Alert(object):
 
@@ -111,6 +109,17 @@ class Alert(object):
         "tenant_ids":'tenantIds'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "alert_document":'alert_document.AlertDocument',
+        "property_list":['alert_property.AlertProperty'],
+        "resolution_details":'alert_resolution_details.AlertResolutionDetails'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alert_category=None,
                  alert_code=None,
@@ -169,53 +178,6 @@ class Alert(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alert_category = dictionary.get('alertCategory')
-        alert_code = dictionary.get('alertCode')
-        alert_document = cohesity_management_sdk.models.alert_document.AlertDocument.from_dictionary(dictionary.get('alertDocument')) if dictionary.get('alertDocument') else None
-        alert_state = dictionary.get('alertState')
-        alert_type = dictionary.get('alertType')
-        alert_type_bucket = dictionary.get('alertTypeBucket')
-        cluster_id = dictionary.get('clusterId')
-        cluster_name = dictionary.get('clusterName')
-        dedup_count = dictionary.get('dedupCount')
-        dedup_timestamps = dictionary.get('dedupTimestamps')
-        event_source = dictionary.get('eventSource')
-        first_timestamp_usecs = dictionary.get('firstTimestampUsecs')
-        id = dictionary.get('id')
-        latest_timestamp_usecs = dictionary.get('latestTimestampUsecs')
-        property_list = None
-        if dictionary.get('propertyList') != None:
-            property_list = list()
-            for structure in dictionary.get('propertyList'):
-                property_list.append(cohesity_management_sdk.models.alert_property.AlertProperty.from_dictionary(structure))
-        resolution_details = cohesity_management_sdk.models.alert_resolution_details.AlertResolutionDetails.from_dictionary(dictionary.get('resolutionDetails')) if dictionary.get('resolutionDetails') else None
-        severity = dictionary.get('severity')
-        suppression_id = dictionary.get('suppressionId')
-        tenant_ids = dictionary.get('tenantIds')
-
-        # Return an object of this model
-        return cls(alert_category,
-                   alert_code,
-                   alert_document,
-                   alert_state,
-                   alert_type,
-                   alert_type_bucket,
-                   cluster_id,
-                   cluster_name,
-                   dedup_count,
-                   dedup_timestamps,
-                   event_source,
-                   first_timestamp_usecs,
-                   id,
-                   latest_timestamp_usecs,
-                   property_list,
-                   resolution_details,
-                   severity,
-                   suppression_id,
-                   tenant_ids)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AlertCategoryName(object):
 
@@ -35,6 +36,9 @@ class AlertCategoryName(object):
         "name":'name'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  category=None,
                  name=None):
@@ -59,15 +63,6 @@ class AlertCategoryName(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        category = dictionary.get('category')
-        name = dictionary.get('name')
-
-        # Return an object of this model
-        return cls(category,
-                   name)
+        return decode_model(cls, dictionary)
 
 
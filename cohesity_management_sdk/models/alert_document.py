@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AlertDocument(object):
 
@@ -31,6 +32,9 @@ class AlertDocument(object):
         "alert_name":'alertName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alert_cause=None,
                  alert_description=None,
@@ -59,19 +63,6 @@ class AlertDocument(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alert_cause = dictionary.get('alertCause')
-        alert_description = dictionary.get('alertDescription')
-        alert_help_text = dictionary.get('alertHelpText')
-        alert_name = dictionary.get('alertName')
-
-        # Return an object of this model
-        return cls(alert_cause,
-                   alert_description,
-                   alert_help_text,
-                   alert_name)
+        return decode_model(cls, dictionary)
 
 
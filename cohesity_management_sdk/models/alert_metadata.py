@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.alert_document
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AlertMetadata(object):
 
@@ -75,6 +75,15 @@ class AlertMetadata(object):
         "version":'version'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "alert_document_list":['alert_document.AlertDocument']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alert_document_list=None,
                  alert_type_bucket=None,
@@ -121,41 +130,6 @@ class AlertMetadata(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alert_document_list = None
-        if dictionary.get('alertDocumentList') != None:
-            alert_document_list = list()
-            for structure in dictionary.get('alertDocumentList'):
-                alert_document_list.append(cohesity_management_sdk.models.alert_document.AlertDocument.from_dictionary(structure))
-        alert_type_bucket = dictionary.get('alertTypeBucket')
-        alert_type_id = dictionary.get('alertTypeId')
-        category = dictionary.get('category')
-        dedup_interval_seconds = dictionary.get('dedupIntervalSeconds')
-        dedup_until_resolved = dictionary.get('dedupUntilResolved')
-        hide_alert_from_user = dictionary.get('hideAlertFromUser')
-        ignore_duplicate_occurrences = dictionary.get('ignoreDuplicateOccurrences')
-        primary_key_list = dictionary.get('primaryKeyList')
-        property_list = dictionary.get('propertyList')
-        send_support_notification = dictionary.get('sendSupportNotification')
-        snmp_notification = dictionary.get('snmpNotification')
-        version = dictionary.get('version')
-
-        # Return an object of this model
-        return cls(alert_document_list,
-                   alert_type_bucket,
-                   alert_type_id,
-                   category,
-                   dedup_interval_seconds,
-                   dedup_until_resolved,
-                   hide_alert_from_user,
-                   ignore_duplicate_occurrences,
-                   primary_key_list,
-                   property_list,
-                   send_support_notification,
-                   snmp_notification,
-                   version)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AlertProperty(object):
 
@@ -20,6 +21,9 @@ class AlertProperty(object):
         "value":'value'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  key=None,
                  value=None):
@@ -44,15 +48,6 @@ class AlertProperty(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        key = dictionary.get('key')
-        value = dictionary.get('value')
-
-        # Return an object of this model
-        return cls(key,
-                   value)
+        return decode_model(cls, dictionary)
 
 
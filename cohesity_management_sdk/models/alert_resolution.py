@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.alert_resolution_details
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AlertResolution(object):
 
@@ -29,6 +29,15 @@ class AlertResolution(object):
         "tenant_ids":'tenantIds'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "resolution_details":'alert_resolution_details.AlertResolutionDetails'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alert_id_list=None,
                  resolution_details=None,
@@ -55,17 +64,6 @@ class AlertResolution(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alert_id_list = dictionary.get('alertIdList')
-        resolution_details = cohesity_management_sdk.models.alert_resolution_details.AlertResolutionDetails.from_dictionary(dictionary.get('resolutionDetails')) if dictionary.get('resolutionDetails') else None
-        tenant_ids = dictionary.get('tenantIds')
-
-        # Return an object of this model
-        return cls(alert_id_list,
-                   resolution_details,
-                   tenant_ids)
+        return decode_model(cls, dictionary)
 
 
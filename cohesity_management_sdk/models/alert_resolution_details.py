@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AlertResolutionDetails(object):
 
@@ -32,6 +33,9 @@ class AlertResolutionDetails(object):
         "user_name":'userName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  resolution_details=None,
                  resolution_id=None,
@@ -62,21 +66,6 @@ class AlertResolutionDetails(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        resolution_details = dictionary.get('resolutionDetails')
-        resolution_id = dictionary.get('resolutionId')
-        resolution_summary = dictionary.get('resolutionSummary')
-        timestamp_usecs = dictionary.get('timestampUsecs')
-        user_name = dictionary.get('userName')
-
-        # Return an object of this model
-        return cls(resolution_details,
-                   resolution_id,
-                   resolution_summary,
-                   timestamp_usecs,
-                   user_name)
+        return decode_model(cls, dictionary)
 
 
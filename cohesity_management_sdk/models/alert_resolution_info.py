@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AlertResolutionInfo(object):
 
@@ -22,6 +23,9 @@ class AlertResolutionInfo(object):
         "resolution_summary":'resolutionSummary'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  resolution_details=None,
                  resolution_summary=None):
@@ -46,15 +50,6 @@ class AlertResolutionInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        resolution_details = dictionary.get('resolutionDetails')
-        resolution_summary = dictionary.get('resolutionSummary')
-
-        # Return an object of this model
-        return cls(resolution_details,
-                   resolution_summary)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.alert_resolution_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AlertResolutionRequest(object):
 
@@ -24,6 +24,15 @@ class AlertResolutionRequest(object):
         "resolution_details":'resolutionDetails'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "resolution_details":'alert_resolution_info.AlertResolutionInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alert_id_list=None,
                  resolution_details=None):
@@ -48,15 +57,6 @@ class AlertResolutionRequest(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alert_id_list = dictionary.get('alertIdList')
-        resolution_details = cohesity_management_sdk.models.alert_resolution_info.AlertResolutionInfo.from_dictionary(dictionary.get('resolutionDetails')) if dictionary.get('resolutionDetails') else None
-
-        # Return an object of this model
-        return cls(alert_id_list,
-                   resolution_details)
+        return decode_model(cls, dictionary)
 
 
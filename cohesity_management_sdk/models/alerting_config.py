@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.email_delivery_target
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AlertingConfig(object):
 
@@ -24,6 +24,15 @@ class AlertingConfig(object):
         "raise_object_level_failure_alert":'raiseObjectLevelFailureAlert'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "email_delivery_targets":['email_delivery_target.EmailDeliveryTarget']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  email_delivery_targets=None,
                  raise_object_level_failure_alert=None):
@@ -48,19 +57,6 @@ class AlertingConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        email_delivery_targets = None
-        if dictionary.get('emailDeliveryTargets') != None:
-            email_delivery_targets = list()
-            for structure in dictionary.get('emailDeliveryTargets'):
-                email_delivery_targets.append(cohesity_management_sdk.models.email_delivery_target.EmailDeliveryTarget.from_dictionary(structure))
-        raise_object_level_failure_alert = dictionary.get('raiseObjectLevelFailureAlert')
-
-        # Return an object of this model
-        return cls(email_delivery_targets,
-                   raise_object_level_failure_alert)
+        return decode_model(cls, dictionary)
 
 
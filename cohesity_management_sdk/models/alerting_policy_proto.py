@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.delivery_rule_proto_delivery_target
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AlertingPolicyProto(object):
 
@@ -34,6 +34,15 @@ class AlertingPolicyProto(object):
         "raise_object_level_failure_alert":'raiseObjectLevelFailureAlert'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "delivery_target_vec":['delivery_rule_proto_delivery_target.DeliveryRuleProtoDeliveryTarget']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  delivery_target_vec=None,
                  emails=None,
@@ -62,23 +71,6 @@ class AlertingPolicyProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        delivery_target_vec = None
-        if dictionary.get('deliveryTargetVec') != None:
-            delivery_target_vec = list()
-            for structure in dictionary.get('deliveryTargetVec'):
-                delivery_target_vec.append(cohesity_management_sdk.models.delivery_rule_proto_delivery_target.DeliveryRuleProtoDeliveryTarget.from_dictionary(structure))
-        emails = dictionary.get('emails')
-        policy = dictionary.get('policy')
-        raise_object_level_failure_alert = dictionary.get('raiseObjectLevelFailureAlert')
-
-        # Return an object of this model
-        return cls(delivery_target_vec,
-                   emails,
-                   policy,
-                   raise_object_level_failure_alert)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.smb_permission
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AliasSmbConfig(object):
 
@@ -36,6 +36,15 @@ class AliasSmbConfig(object):
         "permissions":'permissions'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "permissions":['smb_permission.SmbPermission']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  caching_enabled=None,
                  discovery_enabled=None,
@@ -68,27 +77,6 @@ class AliasSmbConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        caching_enabled = dictionary.get('cachingEnabled')
-        discovery_enabled = dictionary.get('discoveryEnabled')
-        encryption_enabled = dictionary.get('encryptionEnabled')
-        encryption_required = dictionary.get('encryptionRequired')
-        is_share_level_permission_empty = dictionary.get('isShareLevelPermissionEmpty')
-        permissions = None
-        if dictionary.get('permissions') != None:
-            permissions = list()
-            for structure in dictionary.get('permissions'):
-                permissions.append(cohesity_management_sdk.models.smb_permission.SmbPermission.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(caching_enabled,
-                   discovery_enabled,
-                   encryption_enabled,
-                   encryption_required,
-                   is_share_level_permission_empty,
-                   permissions)
+        return decode_model(cls, dictionary)
 
 
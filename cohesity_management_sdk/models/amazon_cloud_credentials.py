@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.c_2_s_access_portal
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AmazonCloudCredentials(object):
 
@@ -67,6 +67,15 @@ class AmazonCloudCredentials(object):
         "use_https":'useHttps'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "c_2_s_access_portal":'c_2_s_access_portal.C2SAccessPortal'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_key_id=None,
                  c_2_s_access_portal=None,
@@ -103,27 +112,6 @@ class AmazonCloudCredentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_key_id = dictionary.get('accessKeyId')
-        c_2_s_access_portal = cohesity_management_sdk.models.c_2_s_access_portal.C2SAccessPortal.from_dictionary(dictionary.get('c2sAccessPortal')) if dictionary.get('c2sAccessPortal') else None
-        region = dictionary.get('region')
-        secret_access_key = dictionary.get('secretAccessKey')
-        service_url = dictionary.get('serviceUrl')
-        signature_version = dictionary.get('signatureVersion')
-        tier_type = dictionary.get('tierType')
-        use_https = dictionary.get('useHttps')
-
-        # Return an object of this model
-        return cls(access_key_id,
-                   c_2_s_access_portal,
-                   region,
-                   secret_access_key,
-                   service_url,
-                   signature_version,
-                   tier_type,
-                   use_https)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.file_extension_filter
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AntivirusScanConfig(object):
 
@@ -39,6 +39,15 @@ class AntivirusScanConfig(object):
         "scan_timeout_usecs":'scanTimeoutUsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "scan_filter":'file_extension_filter.FileExtensionFilter'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  block_access_on_scan_failure=None,
                  is_enabled=None,
@@ -73,25 +82,6 @@ class AntivirusScanConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        block_access_on_scan_failure = dictionary.get('blockAccessOnScanFailure')
-        is_enabled = dictionary.get('isEnabled')
-        maximum_scan_file_size = dictionary.get('maximumScanFileSize')
-        scan_filter = cohesity_management_sdk.models.file_extension_filter.FileExtensionFilter.from_dictionary(dictionary.get('scanFilter')) if dictionary.get('scanFilter') else None
-        scan_on_access = dictionary.get('scanOnAccess')
-        scan_on_close = dictionary.get('scanOnClose')
-        scan_timeout_usecs = dictionary.get('scanTimeoutUsecs')
-
-        # Return an object of this model
-        return cls(block_access_on_scan_failure,
-                   is_enabled,
-                   maximum_scan_file_size,
-                   scan_filter,
-                   scan_on_access,
-                   scan_on_close,
-                   scan_timeout_usecs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AntivirusServiceConfig(object):
 
@@ -34,6 +35,9 @@ class AntivirusServiceConfig(object):
         "tag_id":'tagId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  icap_uri=None,
                  description=None,
@@ -62,19 +66,6 @@ class AntivirusServiceConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        icap_uri = dictionary.get('icapUri')
-        description = dictionary.get('description')
-        tag = dictionary.get('tag')
-        tag_id = dictionary.get('tagId')
-
-        # Return an object of this model
-        return cls(icap_uri,
-                   description,
-                   tag,
-                   tag_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AntivirusServiceConfigParams(object):
 
@@ -23,6 +24,9 @@ class AntivirusServiceConfigParams(object):
         "description":'description'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  icap_uri=None,
                  description=None):
@@ -47,15 +51,6 @@ class AntivirusServiceConfigParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        icap_uri = dictionary.get('icapUri')
-        description = dictionary.get('description')
-
-        # Return an object of this model
-        return cls(icap_uri,
-                   description)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.antivirus_service_config
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AntivirusServiceGroup(object):
 
@@ -30,6 +30,15 @@ class AntivirusServiceGroup(object):
         "is_enabled":'isEnabled'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "antivirus_services":['antivirus_service_config.AntivirusServiceConfig']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  id=None,
                  name=None,
@@ -60,25 +69,6 @@ class AntivirusServiceGroup(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        antivirus_services = None
-        if dictionary.get('antivirusServices') != None:
-            antivirus_services = list()
-            for structure in dictionary.get('antivirusServices'):
-                antivirus_services.append(cohesity_management_sdk.models.antivirus_service_config.AntivirusServiceConfig.from_dictionary(structure))
-        description = dictionary.get('description')
-        is_enabled = dictionary.get('isEnabled')
-
-        # Return an object of this model
-        return cls(id,
-                   name,
-                   antivirus_services,
-                   description,
-                   is_enabled)
+        return decode_model(cls, dictionary)
 
 
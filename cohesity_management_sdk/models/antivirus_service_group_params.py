@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.antivirus_service_config_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AntivirusServiceGroupParams(object):
 
@@ -25,6 +25,15 @@ class AntivirusServiceGroupParams(object):
         "description":'description'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "antivirus_services":['antivirus_service_config_params.AntivirusServiceConfigParams']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  antivirus_services=None,
@@ -51,21 +60,6 @@ class AntivirusServiceGroupParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        antivirus_services = None
-        if dictionary.get('antivirusServices') != None:
-            antivirus_services = list()
-            for structure in dictionary.get('antivirusServices'):
-                antivirus_services.append(cohesity_management_sdk.models.antivirus_service_config_params.AntivirusServiceConfigParams.from_dictionary(structure))
-        description = dictionary.get('description')
-
-        # Return an object of this model
-        return cls(name,
-                   antivirus_services,
-                   description)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AntivirusServiceGroupStateParams(object):
 
@@ -22,6 +23,9 @@ class AntivirusServiceGroupStateParams(object):
         "id":'id'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  enable=None,
                  id=None):
@@ -46,15 +50,6 @@ class AntivirusServiceGroupStateParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        enable = dictionary.get('enable')
-        id = dictionary.get('id')
-
-        # Return an object of this model
-        return cls(enable,
-                   id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AppMetadata(object):
 
@@ -33,6 +34,9 @@ class AppMetadata(object):
         "name":'name'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  author=None,
                  created_date=None,
@@ -67,25 +71,6 @@ class AppMetadata(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        author = dictionary.get('author')
-        created_date = dictionary.get('createdDate')
-        description = dictionary.get('description')
-        dev_version = dictionary.get('devVersion')
-        icon_image = dictionary.get('iconImage')
-        last_modified_date = dictionary.get('lastModifiedDate')
-        name = dictionary.get('name')
-
-        # Return an object of this model
-        return cls(author,
-                   created_date,
-                   description,
-                   dev_version,
-                   icon_image,
-                   last_modified_date,
-                   name)
+        return decode_model(cls, dictionary)
 
 
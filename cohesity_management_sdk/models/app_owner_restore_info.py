@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_object
-import cohesity_management_sdk.models.restore_object_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AppOwnerRestoreInfo(object):
 
@@ -29,6 +28,16 @@ class AppOwnerRestoreInfo(object):
         "perform_restore":'performRestore'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "owner_object":'restore_object.RestoreObject',
+        "owner_restore_params":'restore_object_params.RestoreObjectParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  owner_object=None,
                  owner_restore_params=None,
@@ -55,17 +64,6 @@ class AppOwnerRestoreInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        owner_object = cohesity_management_sdk.models.restore_object.RestoreObject.from_dictionary(dictionary.get('ownerObject')) if dictionary.get('ownerObject') else None
-        owner_restore_params = cohesity_management_sdk.models.restore_object_params.RestoreObjectParams.from_dictionary(dictionary.get('ownerRestoreParams')) if dictionary.get('ownerRestoreParams') else None
-        perform_restore = dictionary.get('performRestore')
-
-        # Return an object of this model
-        return cls(owner_object,
-                   owner_restore_params,
-                   perform_restore)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_source_node
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ApplicationInfo(object):
 
@@ -63,6 +63,15 @@ class ApplicationInfo(object):
         "environment":'environment'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "application_tree_info":['protection_source_node.ProtectionSourceNode']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  application_tree_info=None,
                  environment=None):
@@ -87,19 +96,6 @@ class ApplicationInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        application_tree_info = None
-        if dictionary.get('applicationTreeInfo') != None:
-            application_tree_info = list()
-            for structure in dictionary.get('applicationTreeInfo'):
-                application_tree_info.append(cohesity_management_sdk.models.protection_source_node.ProtectionSourceNode.from_dictionary(structure))
-        environment = dictionary.get('environment')
-
-        # Return an object of this model
-        return cls(application_tree_info,
-                   environment)
+        return decode_model(cls, dictionary)
 
 
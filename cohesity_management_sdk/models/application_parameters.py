@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ApplicationParameters(object):
 
@@ -21,6 +22,9 @@ class ApplicationParameters(object):
         "truncate_exchange_log":'truncateExchangeLog'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  truncate_exchange_log=None):
         """Constructor for the ApplicationParameters class"""
@@ -43,13 +47,6 @@ class ApplicationParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        truncate_exchange_log = dictionary.get('truncateExchangeLog')
-
-        # Return an object of this model
-        return cls(truncate_exchange_log)
+        return decode_model(cls, dictionary)
 
 
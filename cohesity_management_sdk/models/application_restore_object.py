@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_restore_parameters
-import cohesity_management_sdk.models.sql_restore_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ApplicationRestoreObject(object):
 
@@ -38,6 +37,16 @@ class ApplicationRestoreObject(object):
         "target_root_node_id":'targetRootNodeId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ad_restore_parameters":'ad_restore_parameters.AdRestoreParameters',
+        "sql_restore_parameters":'sql_restore_parameters.SqlRestoreParameters'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_restore_parameters=None,
                  application_server_id=None,
@@ -68,21 +77,6 @@ class ApplicationRestoreObject(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_restore_parameters = cohesity_management_sdk.models.ad_restore_parameters.AdRestoreParameters.from_dictionary(dictionary.get('adRestoreParameters')) if dictionary.get('adRestoreParameters') else None
-        application_server_id = dictionary.get('applicationServerId')
-        sql_restore_parameters = cohesity_management_sdk.models.sql_restore_parameters.SqlRestoreParameters.from_dictionary(dictionary.get('sqlRestoreParameters')) if dictionary.get('sqlRestoreParameters') else None
-        target_host_id = dictionary.get('targetHostId')
-        target_root_node_id = dictionary.get('targetRootNodeId')
-
-        # Return an object of this model
-        return cls(ad_restore_parameters,
-                   application_server_id,
-                   sql_restore_parameters,
-                   target_host_id,
-                   target_root_node_id)
+        return decode_model(cls, dictionary)
 
 
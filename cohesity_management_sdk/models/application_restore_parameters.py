@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.application_restore_object
-import cohesity_management_sdk.models.restore_object_details
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ApplicationRestoreParameters(object):
 
@@ -67,6 +66,16 @@ class ApplicationRestoreParameters(object):
         "hosting_protection_source":'hostingProtectionSource'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "application_restore_objects":['application_restore_object.ApplicationRestoreObject'],
+        "hosting_protection_source":'restore_object_details.RestoreObjectDetails'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  application_environment=None,
                  application_restore_objects=None,
@@ -93,21 +102,6 @@ class ApplicationRestoreParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        application_environment = dictionary.get('applicationEnvironment')
-        application_restore_objects = None
-        if dictionary.get('applicationRestoreObjects') != None:
-            application_restore_objects = list()
-            for structure in dictionary.get('applicationRestoreObjects'):
-                application_restore_objects.append(cohesity_management_sdk.models.application_restore_object.ApplicationRestoreObject.from_dictionary(structure))
-        hosting_protection_source = cohesity_management_sdk.models.restore_object_details.RestoreObjectDetails.from_dictionary(dictionary.get('hostingProtectionSource')) if dictionary.get('hostingProtectionSource') else None
-
-        # Return an object of this model
-        return cls(application_environment,
-                   application_restore_objects,
-                   hosting_protection_source)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ApplicationSpecialParameters(object):
 
@@ -24,6 +25,9 @@ class ApplicationSpecialParameters(object):
         "application_entity_ids":'applicationEntityIds'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  application_entity_ids=None):
         """Constructor for the ApplicationSpecialParameters class"""
@@ -46,13 +50,6 @@ class ApplicationSpecialParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        application_entity_ids = dictionary.get('applicationEntityIds')
-
-        # Return an object of this model
-        return cls(application_entity_ids)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.application_restore_object
-import cohesity_management_sdk.models.restore_object_details
-import cohesity_management_sdk.models.vlan_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ApplicationsRestoreTaskRequest(object):
 
@@ -82,6 +80,17 @@ class ApplicationsRestoreTaskRequest(object):
         "vlan_parameters":'vlanParameters'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "hosting_protection_source":'restore_object_details.RestoreObjectDetails',
+        "application_restore_objects":['application_restore_object.ApplicationRestoreObject'],
+        "vlan_parameters":'vlan_parameters.VlanParameters'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  application_environment=None,
                  hosting_protection_source=None,
@@ -116,29 +125,6 @@ class ApplicationsRestoreTaskRequest(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        application_environment = dictionary.get('applicationEnvironment')
-        hosting_protection_source = cohesity_management_sdk.models.restore_object_details.RestoreObjectDetails.from_dictionary(dictionary.get('hostingProtectionSource')) if dictionary.get('hostingProtectionSource') else None
-        name = dictionary.get('name')
-        application_restore_objects = None
-        if dictionary.get('applicationRestoreObjects') != None:
-            application_restore_objects = list()
-            for structure in dictionary.get('applicationRestoreObjects'):
-                application_restore_objects.append(cohesity_management_sdk.models.application_restore_object.ApplicationRestoreObject.from_dictionary(structure))
-        password = dictionary.get('password')
-        username = dictionary.get('username')
-        vlan_parameters = cohesity_management_sdk.models.vlan_parameters.VlanParameters.from_dictionary(dictionary.get('vlanParameters')) if dictionary.get('vlanParameters') else None
-
-        # Return an object of this model
-        return cls(application_environment,
-                   hosting_protection_source,
-                   name,
-                   application_restore_objects,
-                   password,
-                   username,
-                   vlan_parameters)
+        return decode_model(cls, dictionary)
 
 
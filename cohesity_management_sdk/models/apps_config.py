@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.subnet
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AppsConfig(object):
 
@@ -38,6 +38,15 @@ class AppsConfig(object):
         "reserved_memory_pct":'reservedMemoryPct'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "apps_subnet":'subnet.Subnet'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  allow_external_traffic=None,
                  apps_mode=None,
@@ -70,23 +79,6 @@ class AppsConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        allow_external_traffic = dictionary.get('allowExternalTraffic')
-        apps_mode = dictionary.get('appsMode')
-        apps_subnet = cohesity_management_sdk.models.subnet.Subnet.from_dictionary(dictionary.get('appsSubnet')) if dictionary.get('appsSubnet') else None
-        overcommit_memory_pct = dictionary.get('overcommitMemoryPct')
-        reserved_cpu_millicores = dictionary.get('reservedCpuMillicores')
-        reserved_memory_pct = dictionary.get('reservedMemoryPct')
-
-        # Return an object of this model
-        return cls(allow_external_traffic,
-                   apps_mode,
-                   apps_subnet,
-                   overcommit_memory_pct,
-                   reserved_cpu_millicores,
-                   reserved_memory_pct)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ArchivalExternalTarget(object):
 
@@ -28,6 +29,9 @@ class ArchivalExternalTarget(object):
         "vault_type":'vaultType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  vault_id=None,
                  vault_name=None,
@@ -54,17 +58,6 @@ class ArchivalExternalTarget(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        vault_id = dictionary.get('vaultId')
-        vault_name = dictionary.get('vaultName')
-        vault_type = dictionary.get('vaultType')
-
-        # Return an object of this model
-        return cls(vault_id,
-                   vault_name,
-                   vault_type)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ArchivalTarget(object):
 
@@ -24,6 +25,9 @@ class ArchivalTarget(object):
         "vault_id":'vaultId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  mtype=None,
@@ -50,17 +54,6 @@ class ArchivalTarget(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-        vault_id = dictionary.get('vaultId')
-
-        # Return an object of this model
-        return cls(name,
-                   mtype,
-                   vault_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AttributeRestoreInformation(object):
 
@@ -21,6 +22,9 @@ class AttributeRestoreInformation(object):
         "name":'name'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error_message=None,
                  name=None):
@@ -45,15 +49,6 @@ class AttributeRestoreInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error_message = dictionary.get('errorMessage')
-        name = dictionary.get('name')
-
-        # Return an object of this model
-        return cls(error_message,
-                   name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AttributeValue(object):
 
@@ -27,6 +28,9 @@ class AttributeValue(object):
         "values":'values'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  flags=None,
                  values=None):
@@ -51,15 +55,6 @@ class AttributeValue(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        flags = dictionary.get('flags')
-        values = dictionary.get('values')
-
-        # Return an object of this model
-        return cls(flags,
-                   values)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AwsCredentials(object):
 
@@ -43,6 +44,9 @@ class AwsCredentials(object):
         "secret_access_key":'secretAccessKey'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_key=None,
                  amazon_resource_name=None,
@@ -71,19 +75,6 @@ class AwsCredentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_key = dictionary.get('accessKey')
-        amazon_resource_name = dictionary.get('amazonResourceName')
-        aws_type = dictionary.get('awsType')
-        secret_access_key = dictionary.get('secretAccessKey')
-
-        # Return an object of this model
-        return cls(access_key,
-                   amazon_resource_name,
-                   aws_type,
-                   secret_access_key)
+        return decode_model(cls, dictionary)
 
 
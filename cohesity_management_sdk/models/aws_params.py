@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.rds_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AwsParams(object):
 
@@ -34,6 +34,15 @@ class AwsParams(object):
         "virtual_private_cloud_id":'virtualPrivateCloudId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "rds_params":'rds_params.RdsParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  instance_id=None,
                  network_security_group_ids=None,
@@ -66,23 +75,6 @@ class AwsParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        instance_id = dictionary.get('instanceId')
-        network_security_group_ids = dictionary.get('networkSecurityGroupIds')
-        rds_params = cohesity_management_sdk.models.rds_params.RdsParams.from_dictionary(dictionary.get('rdsParams')) if dictionary.get('rdsParams') else None
-        region = dictionary.get('region')
-        subnet_id = dictionary.get('subnetId')
-        virtual_private_cloud_id = dictionary.get('virtualPrivateCloudId')
-
-        # Return an object of this model
-        return cls(instance_id,
-                   network_security_group_ids,
-                   rds_params,
-                   region,
-                   subnet_id,
-                   virtual_private_cloud_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.tag_attribute
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AwsProtectionSource(object):
 
@@ -124,6 +124,15 @@ class AwsProtectionSource(object):
         "user_resource_name":'userResourceName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "tag_attributes":['tag_attribute.TagAttribute']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_key=None,
                  amazon_resource_name=None,
@@ -178,49 +187,6 @@ class AwsProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_key = dictionary.get('accessKey')
-        amazon_resource_name = dictionary.get('amazonResourceName')
-        aws_type = dictionary.get('awsType')
-        db_engine_id = dictionary.get('dbEngineId')
-        host_type = dictionary.get('hostType')
-        ip_addresses = dictionary.get('ipAddresses')
-        name = dictionary.get('name')
-        owner_id = dictionary.get('ownerId')
-        physical_source_id = dictionary.get('physicalSourceId')
-        region_id = dictionary.get('regionId')
-        resource_id = dictionary.get('resourceId')
-        restore_task_id = dictionary.get('restoreTaskId')
-        secret_access_key = dictionary.get('secretAccessKey')
-        tag_attributes = None
-        if dictionary.get('tagAttributes') != None:
-            tag_attributes = list()
-            for structure in dictionary.get('tagAttributes'):
-                tag_attributes.append(cohesity_management_sdk.models.tag_attribute.TagAttribute.from_dictionary(structure))
-        mtype = dictionary.get('type')
-        user_account_id = dictionary.get('userAccountId')
-        user_resource_name = dictionary.get('userResourceName')
-
-        # Return an object of this model
-        return cls(access_key,
-                   amazon_resource_name,
-                   aws_type,
-                   db_engine_id,
-                   host_type,
-                   ip_addresses,
-                   name,
-                   owner_id,
-                   physical_source_id,
-                   region_id,
-                   resource_id,
-                   restore_task_id,
-                   secret_access_key,
-                   tag_attributes,
-                   mtype,
-                   user_account_id,
-                   user_resource_name)
+        return decode_model(cls, dictionary)
 
 
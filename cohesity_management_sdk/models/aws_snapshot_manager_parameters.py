@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AwsSnapshotManagerParameters(object):
 
@@ -29,6 +30,9 @@ class AwsSnapshotManagerParameters(object):
         "create_ami":'createAmi'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ami_creation_frequency=None,
                  create_ami=None):
@@ -53,15 +57,6 @@ class AwsSnapshotManagerParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ami_creation_frequency = dictionary.get('amiCreationFrequency')
-        create_ami = dictionary.get('createAmi')
-
-        # Return an object of this model
-        return cls(ami_creation_frequency,
-                   create_ami)
+        return decode_model(cls, dictionary)
 
 
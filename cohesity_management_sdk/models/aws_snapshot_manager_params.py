@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AWSSnapshotManagerParams(object):
 
@@ -28,6 +29,9 @@ class AWSSnapshotManagerParams(object):
         "should_create_ami":'shouldCreateAmi'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ami_creation_frequency=None,
                  create_ami_for_run=None,
@@ -54,17 +58,6 @@ class AWSSnapshotManagerParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ami_creation_frequency = dictionary.get('amiCreationFrequency')
-        create_ami_for_run = dictionary.get('createAmiForRun')
-        should_create_ami = dictionary.get('shouldCreateAmi')
-
-        # Return an object of this model
-        return cls(ami_creation_frequency,
-                   create_ami_for_run,
-                   should_create_ami)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AzureCloudCredentials(object):
 
@@ -32,6 +33,9 @@ class AzureCloudCredentials(object):
         "tier_type":'tierType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  storage_access_key=None,
                  storage_account_name=None,
@@ -58,17 +62,6 @@ class AzureCloudCredentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        storage_access_key = dictionary.get('storageAccessKey')
-        storage_account_name = dictionary.get('storageAccountName')
-        tier_type = dictionary.get('tierType')
-
-        # Return an object of this model
-        return cls(storage_access_key,
-                   storage_account_name,
-                   tier_type)
+        return decode_model(cls, dictionary)
 
 
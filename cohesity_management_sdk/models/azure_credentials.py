@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AzureCredentials(object):
 
@@ -55,6 +56,9 @@ class AzureCredentials(object):
         "tenant_id":'tenantId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  application_id=None,
                  application_key=None,
@@ -87,23 +91,6 @@ class AzureCredentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        application_id = dictionary.get('applicationId')
-        application_key = dictionary.get('applicationKey')
-        azure_type = dictionary.get('azureType')
-        subscription_id = dictionary.get('subscriptionId')
-        subscription_type = dictionary.get('subscriptionType')
-        tenant_id = dictionary.get('tenantId')
-
-        # Return an object of this model
-        return cls(application_id,
-                   application_key,
-                   azure_type,
-                   subscription_id,
-                   subscription_type,
-                   tenant_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AzureManagedDiskParams(object):
 
@@ -21,6 +22,9 @@ class AzureManagedDiskParams(object):
         "os_disk_sku_type":'osDiskSkuType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data_disks_sku_type=None,
                  os_disk_sku_type=None):
@@ -45,15 +49,6 @@ class AzureManagedDiskParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data_disks_sku_type = dictionary.get('dataDisksSkuType')
-        os_disk_sku_type = dictionary.get('osDiskSkuType')
-
-        # Return an object of this model
-        return cls(data_disks_sku_type,
-                   os_disk_sku_type)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AzureParams(object):
 
@@ -71,6 +72,9 @@ class AzureParams(object):
         "virtual_network_id":'virtualNetworkId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data_disk_type=None,
                  instance_id=None,
@@ -121,41 +125,6 @@ class AzureParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data_disk_type = dictionary.get('dataDiskType')
-        instance_id = dictionary.get('instanceId')
-        network_resource_group_id = dictionary.get('networkResourceGroupId')
-        os_disk_type = dictionary.get('osDiskType')
-        resource_group = dictionary.get('resourceGroup')
-        storage_account = dictionary.get('storageAccount')
-        storage_container = dictionary.get('storageContainer')
-        storage_resource_group_id = dictionary.get('storageResourceGroupId')
-        subnet_id = dictionary.get('subnetId')
-        temp_vm_resource_group_id = dictionary.get('tempVmResourceGroupId')
-        temp_vm_storage_account_id = dictionary.get('tempVmStorageAccountId')
-        temp_vm_storage_container_id = dictionary.get('tempVmStorageContainerId')
-        temp_vm_subnet_id = dictionary.get('tempVmSubnetId')
-        temp_vm_virtual_network_id = dictionary.get('tempVmVirtualNetworkId')
-        virtual_network_id = dictionary.get('virtualNetworkId')
-
-        # Return an object of this model
-        return cls(data_disk_type,
-                   instance_id,
-                   network_resource_group_id,
-                   os_disk_type,
-                   resource_group,
-                   storage_account,
-                   storage_container,
-                   storage_resource_group_id,
-                   subnet_id,
-                   temp_vm_resource_group_id,
-                   temp_vm_storage_account_id,
-                   temp_vm_storage_container_id,
-                   temp_vm_subnet_id,
-                   temp_vm_virtual_network_id,
-                   virtual_network_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class AzureProtectionSource(object):
 
@@ -124,6 +125,9 @@ class AzureProtectionSource(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  application_id=None,
                  application_key=None,
@@ -176,43 +180,6 @@ class AzureProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        application_id = dictionary.get('applicationId')
-        application_key = dictionary.get('applicationKey')
-        azure_type = dictionary.get('azureType')
-        host_type = dictionary.get('hostType')
-        ip_addresses = dictionary.get('ipAddresses')
-        location = dictionary.get('location')
-        memory_mbytes = dictionary.get('memoryMbytes')
-        name = dictionary.get('name')
-        num_cores = dictionary.get('numCores')
-        physical_source_id = dictionary.get('physicalSourceId')
-        resource_id = dictionary.get('resourceId')
-        restore_task_id = dictionary.get('restoreTaskId')
-        subscription_id = dictionary.get('subscriptionId')
-        subscription_type = dictionary.get('subscriptionType')
-        tenant_id = dictionary.get('tenantId')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(application_id,
-                   application_key,
-                   azure_type,
-                   host_type,
-                   ip_addresses,
-                   location,
-                   memory_mbytes,
-                   name,
-                   num_cores,
-                   physical_source_id,
-                   resource_id,
-                   restore_task_id,
-                   subscription_id,
-                   subscription_type,
-                   tenant_id,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
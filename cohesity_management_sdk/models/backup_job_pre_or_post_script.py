@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.script_path_and_params
-import cohesity_management_sdk.models.remote_host_connector_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupJobPreOrPostScript(object):
 
@@ -36,6 +35,18 @@ class BackupJobPreOrPostScript(object):
         "remote_host_params":'remoteHostParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "backup_script":'script_path_and_params.ScriptPathAndParams',
+        "full_backup_script":'script_path_and_params.ScriptPathAndParams',
+        "log_backup_script":'script_path_and_params.ScriptPathAndParams',
+        "remote_host_params":'remote_host_connector_params.RemoteHostConnectorParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_script=None,
                  full_backup_script=None,
@@ -64,19 +75,6 @@ class BackupJobPreOrPostScript(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_script = cohesity_management_sdk.models.script_path_and_params.ScriptPathAndParams.from_dictionary(dictionary.get('backupScript')) if dictionary.get('backupScript') else None
-        full_backup_script = cohesity_management_sdk.models.script_path_and_params.ScriptPathAndParams.from_dictionary(dictionary.get('fullBackupScript')) if dictionary.get('fullBackupScript') else None
-        log_backup_script = cohesity_management_sdk.models.script_path_and_params.ScriptPathAndParams.from_dictionary(dictionary.get('logBackupScript')) if dictionary.get('logBackupScript') else None
-        remote_host_params = cohesity_management_sdk.models.remote_host_connector_params.RemoteHostConnectorParams.from_dictionary(dictionary.get('remoteHostParams')) if dictionary.get('remoteHostParams') else None
-
-        # Return an object of this model
-        return cls(backup_script,
-                   full_backup_script,
-                   log_backup_script,
-                   remote_host_params)
+        return decode_model(cls, dictionary)
 
 
@@ -1,21 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.alerting_policy_proto
-import cohesity_management_sdk.models.backup_source_params
-import cohesity_management_sdk.models.backup_job_proto_dr_to_cloud_params
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.env_backup_params
-import cohesity_management_sdk.models.backup_job_proto_exclude_source
-import cohesity_management_sdk.models.backup_job_proto_exclusion_time_range
-import cohesity_management_sdk.models.job_policy_proto
-import cohesity_management_sdk.models.indexing_policy_proto
-import cohesity_management_sdk.models.universal_id_proto
-import cohesity_management_sdk.models.backup_job_pre_or_post_script
-import cohesity_management_sdk.models.backup_job_proto_backup_source
-import cohesity_management_sdk.models.time
-import cohesity_management_sdk.models.stubbing_policy_proto
-import cohesity_management_sdk.models.user_information
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupJobProto(object):
 
@@ -291,6 +277,36 @@ class BackupJobProto(object):
         "view_box_id":'viewBoxId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "alerting_policy":'alerting_policy_proto.AlertingPolicyProto',
+        "backup_source_params":['backup_source_params.BackupSourceParams'],
+        "dr_to_cloud_params":'backup_job_proto_dr_to_cloud_params.BackupJobProtoDRToCloudParams',
+        "eh_parent_source":'entity_proto.EntityProto',
+        "env_backup_params":'env_backup_params.EnvBackupParams',
+        "exclude_sources":['backup_job_proto_exclude_source.BackupJobProtoExcludeSource'],
+        "exclude_sources_deprecated":['entity_proto.EntityProto'],
+        "exclusion_ranges":['backup_job_proto_exclusion_time_range.BackupJobProtoExclusionTimeRange'],
+        "full_backup_job_policy":'job_policy_proto.JobPolicyProto',
+        "indexing_policy":'indexing_policy_proto.IndexingPolicyProto',
+        "job_policy":'job_policy_proto.JobPolicyProto',
+        "job_uid":'universal_id_proto.UniversalIdProto',
+        "log_backup_job_policy":'job_policy_proto.JobPolicyProto',
+        "parent_source":'entity_proto.EntityProto',
+        "post_backup_script":'backup_job_pre_or_post_script.BackupJobPreOrPostScript',
+        "pre_script":'backup_job_pre_or_post_script.BackupJobPreOrPostScript',
+        "primary_job_uid":'universal_id_proto.UniversalIdProto',
+        "remote_job_uids":['universal_id_proto.UniversalIdProto'],
+        "sources":['backup_job_proto_backup_source.BackupJobProtoBackupSource'],
+        "start_time":'time.Time',
+        "stubbing_policy":'stubbing_policy_proto.StubbingPolicyProto',
+        "user_info":'user_information.UserInformation'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  abort_in_exclusion_window=None,
                  alerting_policy=None,
@@ -429,153 +445,6 @@ class BackupJobProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        abort_in_exclusion_window = dictionary.get('abortInExclusionWindow')
-        alerting_policy = cohesity_management_sdk.models.alerting_policy_proto.AlertingPolicyProto.from_dictionary(dictionary.get('alertingPolicy')) if dictionary.get('alertingPolicy') else None
-        backup_qos_principal = dictionary.get('backupQosPrincipal')
-        backup_source_params = None
-        if dictionary.get('backupSourceParams') != None:
-            backup_source_params = list()
-            for structure in dictionary.get('backupSourceParams'):
-                backup_source_params.append(cohesity_management_sdk.models.backup_source_params.BackupSourceParams.from_dictionary(structure))
-        continue_on_quiesce_failure = dictionary.get('continueOnQuiesceFailure')
-        create_remote_view = dictionary.get('createRemoteView')
-        dedup_disabled_source_id_vec = dictionary.get('dedupDisabledSourceIdVec')
-        deletion_status = dictionary.get('deletionStatus')
-        description = dictionary.get('description')
-        dr_to_cloud_params = cohesity_management_sdk.models.backup_job_proto_dr_to_cloud_params.BackupJobProtoDRToCloudParams.from_dictionary(dictionary.get('drToCloudParams')) if dictionary.get('drToCloudParams') else None
-        eh_parent_source = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('ehParentSource')) if dictionary.get('ehParentSource') else None
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        env_backup_params = cohesity_management_sdk.models.env_backup_params.EnvBackupParams.from_dictionary(dictionary.get('envBackupParams')) if dictionary.get('envBackupParams') else None
-        exclude_sources = None
-        if dictionary.get('excludeSources') != None:
-            exclude_sources = list()
-            for structure in dictionary.get('excludeSources'):
-                exclude_sources.append(cohesity_management_sdk.models.backup_job_proto_exclude_source.BackupJobProtoExcludeSource.from_dictionary(structure))
-        exclude_sources_deprecated = None
-        if dictionary.get('excludeSources_DEPRECATED') != None:
-            exclude_sources_deprecated = list()
-            for structure in dictionary.get('excludeSources_DEPRECATED'):
-                exclude_sources_deprecated.append(cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(structure))
-        exclusion_ranges = None
-        if dictionary.get('exclusionRanges') != None:
-            exclusion_ranges = list()
-            for structure in dictionary.get('exclusionRanges'):
-                exclusion_ranges.append(cohesity_management_sdk.models.backup_job_proto_exclusion_time_range.BackupJobProtoExclusionTimeRange.from_dictionary(structure))
-        full_backup_job_policy = cohesity_management_sdk.models.job_policy_proto.JobPolicyProto.from_dictionary(dictionary.get('fullBackupJobPolicy')) if dictionary.get('fullBackupJobPolicy') else None
-        full_backup_sla_time_mins = dictionary.get('fullBackupSlaTimeMins')
-        indexing_policy = cohesity_management_sdk.models.indexing_policy_proto.IndexingPolicyProto.from_dictionary(dictionary.get('indexingPolicy')) if dictionary.get('indexingPolicy') else None
-        is_active = dictionary.get('isActive')
-        is_deleted = dictionary.get('isDeleted')
-        is_paused = dictionary.get('isPaused')
-        is_rpo_job = dictionary.get('isRpoJob')
-        job_creation_time_usecs = dictionary.get('jobCreationTimeUsecs')
-        job_id = dictionary.get('jobId')
-        job_policy = cohesity_management_sdk.models.job_policy_proto.JobPolicyProto.from_dictionary(dictionary.get('jobPolicy')) if dictionary.get('jobPolicy') else None
-        job_uid = cohesity_management_sdk.models.universal_id_proto.UniversalIdProto.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-        last_modification_time_usecs = dictionary.get('lastModificationTimeUsecs')
-        last_pause_modification_time_usecs = dictionary.get('lastPauseModificationTimeUsecs')
-        last_pause_reason = dictionary.get('lastPauseReason')
-        last_updated_username = dictionary.get('lastUpdatedUsername')
-        leverage_storage_snapshots = dictionary.get('leverageStorageSnapshots')
-        leverage_storage_snapshots_for_hyperflex = dictionary.get('leverageStorageSnapshotsForHyperflex')
-        log_backup_job_policy = cohesity_management_sdk.models.job_policy_proto.JobPolicyProto.from_dictionary(dictionary.get('logBackupJobPolicy')) if dictionary.get('logBackupJobPolicy') else None
-        name = dictionary.get('name')
-        num_snapshots_to_keep_on_primary = dictionary.get('numSnapshotsToKeepOnPrimary')
-        parent_source = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('parentSource')) if dictionary.get('parentSource') else None
-        perform_source_side_dedup = dictionary.get('performSourceSideDedup')
-        policy_applied_time_msecs = dictionary.get('policyAppliedTimeMsecs')
-        policy_id = dictionary.get('policyId')
-        policy_name = dictionary.get('policyName')
-        post_backup_script = cohesity_management_sdk.models.backup_job_pre_or_post_script.BackupJobPreOrPostScript.from_dictionary(dictionary.get('postBackupScript')) if dictionary.get('postBackupScript') else None
-        pre_script = cohesity_management_sdk.models.backup_job_pre_or_post_script.BackupJobPreOrPostScript.from_dictionary(dictionary.get('preScript')) if dictionary.get('preScript') else None
-        primary_job_uid = cohesity_management_sdk.models.universal_id_proto.UniversalIdProto.from_dictionary(dictionary.get('primaryJobUid')) if dictionary.get('primaryJobUid') else None
-        priority = dictionary.get('priority')
-        quiesce = dictionary.get('quiesce')
-        remote_job_uids = None
-        if dictionary.get('remoteJobUids') != None:
-            remote_job_uids = list()
-            for structure in dictionary.get('remoteJobUids'):
-                remote_job_uids.append(cohesity_management_sdk.models.universal_id_proto.UniversalIdProto.from_dictionary(structure))
-        remote_view_name = dictionary.get('remoteViewName')
-        required_feature_vec = dictionary.get('requiredFeatureVec')
-        sla_time_mins = dictionary.get('slaTimeMins')
-        sources = None
-        if dictionary.get('sources') != None:
-            sources = list()
-            for structure in dictionary.get('sources'):
-                sources.append(cohesity_management_sdk.models.backup_job_proto_backup_source.BackupJobProtoBackupSource.from_dictionary(structure))
-        start_time = cohesity_management_sdk.models.time.Time.from_dictionary(dictionary.get('startTime')) if dictionary.get('startTime') else None
-        stubbing_policy = cohesity_management_sdk.models.stubbing_policy_proto.StubbingPolicyProto.from_dictionary(dictionary.get('stubbingPolicy')) if dictionary.get('stubbingPolicy') else None
-        tag_vec = dictionary.get('tagVec')
-        timezone = dictionary.get('timezone')
-        truncate_logs = dictionary.get('truncateLogs')
-        mtype = dictionary.get('type')
-        user_info = cohesity_management_sdk.models.user_information.UserInformation.from_dictionary(dictionary.get('userInfo')) if dictionary.get('userInfo') else None
-        view_box_id = dictionary.get('viewBoxId')
-
-        # Return an object of this model
-        return cls(abort_in_exclusion_window,
-                   alerting_policy,
-                   backup_qos_principal,
-                   backup_source_params,
-                   continue_on_quiesce_failure,
-                   create_remote_view,
-                   dedup_disabled_source_id_vec,
-                   deletion_status,
-                   description,
-                   dr_to_cloud_params,
-                   eh_parent_source,
-                   end_time_usecs,
-                   env_backup_params,
-                   exclude_sources,
-                   exclude_sources_deprecated,
-                   exclusion_ranges,
-                   full_backup_job_policy,
-                   full_backup_sla_time_mins,
-                   indexing_policy,
-                   is_active,
-                   is_deleted,
-                   is_paused,
-                   is_rpo_job,
-                   job_creation_time_usecs,
-                   job_id,
-                   job_policy,
-                   job_uid,
-                   last_modification_time_usecs,
-                   last_pause_modification_time_usecs,
-                   last_pause_reason,
-                   last_updated_username,
-                   leverage_storage_snapshots,
-                   leverage_storage_snapshots_for_hyperflex,
-                   log_backup_job_policy,
-                   name,
-                   num_snapshots_to_keep_on_primary,
-                   parent_source,
-                   perform_source_side_dedup,
-                   policy_applied_time_msecs,
-                   policy_id,
-                   policy_name,
-                   post_backup_script,
-                   pre_script,
-                   primary_job_uid,
-                   priority,
-                   quiesce,
-                   remote_job_uids,
-                   remote_view_name,
-                   required_feature_vec,
-                   sla_time_mins,
-                   sources,
-                   start_time,
-                   stubbing_policy,
-                   tag_vec,
-                   timezone,
-                   truncate_logs,
-                   mtype,
-                   user_info,
-                   view_box_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupJobProtoDRToCloudParams(object):
 
@@ -27,6 +28,9 @@ class BackupJobProtoDRToCloudParams(object):
         "need_to_fail_over":'needToFailOver'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  need_to_fail_over=None):
         """Constructor for the BackupJobProtoDRToCloudParams class"""
@@ -49,13 +53,6 @@ class BackupJobProtoDRToCloudParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        need_to_fail_over = dictionary.get('needToFailOver')
-
-        # Return an object of this model
-        return cls(need_to_fail_over)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupJobProtoExcludeSource(object):
 
@@ -21,6 +21,15 @@ class BackupJobProtoExcludeSource(object):
         "entities":'entities'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "entities":['entity_proto.EntityProto']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  entities=None):
         """Constructor for the BackupJobProtoExcludeSource class"""
@@ -43,17 +52,6 @@ class BackupJobProtoExcludeSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        entities = None
-        if dictionary.get('entities') != None:
-            entities = list()
-            for structure in dictionary.get('entities'):
-                entities.append(cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(entities)
+        return decode_model(cls, dictionary)
 
 
@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.backup_policy_proto_continuous_schedule
-import cohesity_management_sdk.models.backup_policy_proto_daily_schedule
-import cohesity_management_sdk.models.backup_policy_proto_monthly_schedule
-import cohesity_management_sdk.models.backup_policy_proto_one_off_schedule
-import cohesity_management_sdk.models.backup_policy_proto_schedule_end
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupPolicyProto(object):
 
@@ -75,6 +71,19 @@ class BackupPolicyProto(object):
         "truncate_logs":'truncateLogs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "continuous_schedule":'backup_policy_proto_continuous_schedule.BackupPolicyProtoContinuousSchedule',
+        "daily_schedule":'backup_policy_proto_daily_schedule.BackupPolicyProtoDailySchedule',
+        "monthly_schedule":'backup_policy_proto_monthly_schedule.BackupPolicyProtoMonthlySchedule',
+        "one_off_schedule":'backup_policy_proto_one_off_schedule.BackupPolicyProtoOneOffSchedule',
+        "schedule_end":'backup_policy_proto_schedule_end.BackupPolicyProtoScheduleEnd'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  continuous_schedule=None,
                  daily_schedule=None,
@@ -119,35 +128,6 @@ class BackupPolicyProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        continuous_schedule = cohesity_management_sdk.models.backup_policy_proto_continuous_schedule.BackupPolicyProtoContinuousSchedule.from_dictionary(dictionary.get('continuousSchedule')) if dictionary.get('continuousSchedule') else None
-        daily_schedule = cohesity_management_sdk.models.backup_policy_proto_daily_schedule.BackupPolicyProtoDailySchedule.from_dictionary(dictionary.get('dailySchedule')) if dictionary.get('dailySchedule') else None
-        monthly_schedule = cohesity_management_sdk.models.backup_policy_proto_monthly_schedule.BackupPolicyProtoMonthlySchedule.from_dictionary(dictionary.get('monthlySchedule')) if dictionary.get('monthlySchedule') else None
-        name = dictionary.get('name')
-        num_days_to_keep = dictionary.get('numDaysToKeep')
-        num_retries = dictionary.get('numRetries')
-        one_off_schedule = cohesity_management_sdk.models.backup_policy_proto_one_off_schedule.BackupPolicyProtoOneOffSchedule.from_dictionary(dictionary.get('oneOffSchedule')) if dictionary.get('oneOffSchedule') else None
-        periodicity = dictionary.get('periodicity')
-        retry_delay_mins = dictionary.get('retryDelayMins')
-        schedule_end = cohesity_management_sdk.models.backup_policy_proto_schedule_end.BackupPolicyProtoScheduleEnd.from_dictionary(dictionary.get('scheduleEnd')) if dictionary.get('scheduleEnd') else None
-        start_window_interval_mins = dictionary.get('startWindowIntervalMins')
-        truncate_logs = dictionary.get('truncateLogs')
-
-        # Return an object of this model
-        return cls(continuous_schedule,
-                   daily_schedule,
-                   monthly_schedule,
-                   name,
-                   num_days_to_keep,
-                   num_retries,
-                   one_off_schedule,
-                   periodicity,
-                   retry_delay_mins,
-                   schedule_end,
-                   start_window_interval_mins,
-                   truncate_logs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.backup_policy_proto_exclusion_time_range
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupPolicyProtoContinuousSchedule(object):
 
@@ -28,6 +28,15 @@ class BackupPolicyProtoContinuousSchedule(object):
         "exclusion_ranges":'exclusionRanges'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "exclusion_ranges":['backup_policy_proto_exclusion_time_range.BackupPolicyProtoExclusionTimeRange']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_interval_mins=None,
                  exclusion_ranges=None):
@@ -52,19 +61,6 @@ class BackupPolicyProtoContinuousSchedule(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_interval_mins = dictionary.get('backupIntervalMins')
-        exclusion_ranges = None
-        if dictionary.get('exclusionRanges') != None:
-            exclusion_ranges = list()
-            for structure in dictionary.get('exclusionRanges'):
-                exclusion_ranges.append(cohesity_management_sdk.models.backup_policy_proto_exclusion_time_range.BackupPolicyProtoExclusionTimeRange.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(backup_interval_mins,
-                   exclusion_ranges)
+        return decode_model(cls, dictionary)
 
 
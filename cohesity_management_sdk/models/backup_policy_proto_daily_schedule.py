@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.time
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupPolicyProtoDailySchedule(object):
 
@@ -28,6 +28,15 @@ class BackupPolicyProtoDailySchedule(object):
         "time":'time'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "time":'time.Time'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  days=None,
                  time=None):
@@ -52,15 +61,6 @@ class BackupPolicyProtoDailySchedule(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        days = dictionary.get('days')
-        time = cohesity_management_sdk.models.time.Time.from_dictionary(dictionary.get('time')) if dictionary.get('time') else None
-
-        # Return an object of this model
-        return cls(days,
-                   time)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.time
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupPolicyProtoExclusionTimeRange(object):
 
@@ -31,6 +31,16 @@ class BackupPolicyProtoExclusionTimeRange(object):
         "start_time":'startTime'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "end_time":'time.Time',
+        "start_time":'time.Time'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  day=None,
                  end_time=None,
@@ -57,17 +67,6 @@ class BackupPolicyProtoExclusionTimeRange(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        day = dictionary.get('day')
-        end_time = cohesity_management_sdk.models.time.Time.from_dictionary(dictionary.get('endTime')) if dictionary.get('endTime') else None
-        start_time = cohesity_management_sdk.models.time.Time.from_dictionary(dictionary.get('startTime')) if dictionary.get('startTime') else None
-
-        # Return an object of this model
-        return cls(day,
-                   end_time,
-                   start_time)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.time
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupPolicyProtoMonthlySchedule(object):
 
@@ -27,6 +27,15 @@ class BackupPolicyProtoMonthlySchedule(object):
         "time":'time'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "time":'time.Time'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  count=None,
                  day=None,
@@ -53,17 +62,6 @@ class BackupPolicyProtoMonthlySchedule(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        count = dictionary.get('count')
-        day = dictionary.get('day')
-        time = cohesity_management_sdk.models.time.Time.from_dictionary(dictionary.get('time')) if dictionary.get('time') else None
-
-        # Return an object of this model
-        return cls(count,
-                   day,
-                   time)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupPolicyProtoScheduleEnd(object):
 
@@ -24,6 +25,9 @@ class BackupPolicyProtoScheduleEnd(object):
         "end_time_usecs":'endTimeUsecs'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  end_after_num_backups=None,
                  end_time_usecs=None):
@@ -48,15 +52,6 @@ class BackupPolicyProtoScheduleEnd(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        end_after_num_backups = dictionary.get('endAfterNumBackups')
-        end_time_usecs = dictionary.get('endTimeUsecs')
-
-        # Return an object of this model
-        return cls(end_after_num_backups,
-                   end_time_usecs)
+        return decode_model(cls, dictionary)
 
 
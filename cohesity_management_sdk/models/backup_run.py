@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.source_backup_status
-import cohesity_management_sdk.models.protection_job_run_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupRun(object):
 
@@ -135,6 +134,16 @@ class BackupRun(object):
         "worm_retention_type":'wormRetentionType'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "source_backup_status":['source_backup_status.SourceBackupStatus'],
+        "stats":'protection_job_run_stats.ProtectionJobRunStats'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  environment=None,
                  error=None,
@@ -185,45 +194,6 @@ class BackupRun(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        environment = dictionary.get('environment')
-        error = dictionary.get('error')
-        job_run_id = dictionary.get('jobRunId')
-        message = dictionary.get('message')
-        metadata_deleted = dictionary.get('metadataDeleted')
-        quiesced = dictionary.get('quiesced')
-        run_type = dictionary.get('runType')
-        sla_violated = dictionary.get('slaViolated')
-        snapshots_deleted = dictionary.get('snapshotsDeleted')
-        snapshots_deleted_time_usecs = dictionary.get('snapshotsDeletedTimeUsecs')
-        source_backup_status = None
-        if dictionary.get('sourceBackupStatus') != None:
-            source_backup_status = list()
-            for structure in dictionary.get('sourceBackupStatus'):
-                source_backup_status.append(cohesity_management_sdk.models.source_backup_status.SourceBackupStatus.from_dictionary(structure))
-        stats = cohesity_management_sdk.models.protection_job_run_stats.ProtectionJobRunStats.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-        status = dictionary.get('status')
-        warnings = dictionary.get('warnings')
-        worm_retention_type = dictionary.get('wormRetentionType')
-
-        # Return an object of this model
-        return cls(environment,
-                   error,
-                   job_run_id,
-                   message,
-                   metadata_deleted,
-                   quiesced,
-                   run_type,
-                   sla_violated,
-                   snapshots_deleted,
-                   snapshots_deleted_time_usecs,
-                   source_backup_status,
-                   stats,
-                   status,
-                   warnings,
-                   worm_retention_type)
+        return decode_model(cls, dictionary)
 
 
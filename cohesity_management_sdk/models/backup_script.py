@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.remote_script_path_and_params
-import cohesity_management_sdk.models.remote_host
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupScript(object):
 
@@ -48,6 +47,18 @@ class BackupScript(object):
         "username":'username'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "full_backup_script":'remote_script_path_and_params.RemoteScriptPathAndParams',
+        "incremental_backup_script":'remote_script_path_and_params.RemoteScriptPathAndParams',
+        "log_backup_script":'remote_script_path_and_params.RemoteScriptPathAndParams',
+        "remote_host":'remote_host.RemoteHost'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  full_backup_script=None,
                  incremental_backup_script=None,
@@ -78,21 +89,6 @@ class BackupScript(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        full_backup_script = cohesity_management_sdk.models.remote_script_path_and_params.RemoteScriptPathAndParams.from_dictionary(dictionary.get('fullBackupScript')) if dictionary.get('fullBackupScript') else None
-        incremental_backup_script = cohesity_management_sdk.models.remote_script_path_and_params.RemoteScriptPathAndParams.from_dictionary(dictionary.get('incrementalBackupScript')) if dictionary.get('incrementalBackupScript') else None
-        log_backup_script = cohesity_management_sdk.models.remote_script_path_and_params.RemoteScriptPathAndParams.from_dictionary(dictionary.get('logBackupScript')) if dictionary.get('logBackupScript') else None
-        remote_host = cohesity_management_sdk.models.remote_host.RemoteHost.from_dictionary(dictionary.get('remoteHost')) if dictionary.get('remoteHost') else None
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(full_backup_script,
-                   incremental_backup_script,
-                   log_backup_script,
-                   remote_host,
-                   username)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.oracle_source_params
-import cohesity_management_sdk.models.physical_backup_source_params
-import cohesity_management_sdk.models.vmware_backup_source_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupSourceParams(object):
 
@@ -40,6 +38,17 @@ class BackupSourceParams(object):
         "vmware_params":'vmwareParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "oracle_params":'oracle_source_params.OracleSourceParams',
+        "physical_params":'physical_backup_source_params.PhysicalBackupSourceParams',
+        "vmware_params":'vmware_backup_source_params.VmwareBackupSourceParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  app_entity_id_vec=None,
                  oracle_params=None,
@@ -72,23 +81,6 @@ class BackupSourceParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        app_entity_id_vec = dictionary.get('appEntityIdVec')
-        oracle_params = cohesity_management_sdk.models.oracle_source_params.OracleSourceParams.from_dictionary(dictionary.get('oracleParams')) if dictionary.get('oracleParams') else None
-        physical_params = cohesity_management_sdk.models.physical_backup_source_params.PhysicalBackupSourceParams.from_dictionary(dictionary.get('physicalParams')) if dictionary.get('physicalParams') else None
-        skip_indexing = dictionary.get('skipIndexing')
-        source_id = dictionary.get('sourceId')
-        vmware_params = cohesity_management_sdk.models.vmware_backup_source_params.VmwareBackupSourceParams.from_dictionary(dictionary.get('vmwareParams')) if dictionary.get('vmwareParams') else None
-
-        # Return an object of this model
-        return cls(app_entity_id_vec,
-                   oracle_params,
-                   physical_params,
-                   skip_indexing,
-                   source_id,
-                   vmware_params)
+        return decode_model(cls, dictionary)
 
 
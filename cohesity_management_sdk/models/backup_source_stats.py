@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupSourceStats(object):
 
@@ -67,6 +68,9 @@ class BackupSourceStats(object):
         "total_source_size_bytes":'totalSourceSizeBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  admitted_time_usecs=None,
                  end_time_usecs=None,
@@ -105,29 +109,6 @@ class BackupSourceStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        admitted_time_usecs = dictionary.get('admittedTimeUsecs')
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        time_taken_usecs = dictionary.get('timeTakenUsecs')
-        total_bytes_read_from_source = dictionary.get('totalBytesReadFromSource')
-        total_bytes_to_read_from_source = dictionary.get('totalBytesToReadFromSource')
-        total_logical_backup_size_bytes = dictionary.get('totalLogicalBackupSizeBytes')
-        total_physical_backup_size_bytes = dictionary.get('totalPhysicalBackupSizeBytes')
-        total_source_size_bytes = dictionary.get('totalSourceSizeBytes')
-
-        # Return an object of this model
-        return cls(admitted_time_usecs,
-                   end_time_usecs,
-                   start_time_usecs,
-                   time_taken_usecs,
-                   total_bytes_read_from_source,
-                   total_bytes_to_read_from_source,
-                   total_logical_backup_size_bytes,
-                   total_physical_backup_size_bytes,
-                   total_source_size_bytes)
+        return decode_model(cls, dictionary)
 
 
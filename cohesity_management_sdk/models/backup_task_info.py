@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BackupTaskInfo(object):
 
@@ -25,6 +26,9 @@ class BackupTaskInfo(object):
         "task_id":'taskId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  instance_id=None,
                  name=None,
@@ -53,19 +57,6 @@ class BackupTaskInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        instance_id = dictionary.get('instanceId')
-        name = dictionary.get('name')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        task_id = dictionary.get('taskId')
-
-        # Return an object of this model
-        return cls(instance_id,
-                   name,
-                   start_time_usecs,
-                   task_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.bandwidth_limit_override
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BandwidthLimit(object):
 
@@ -33,6 +33,15 @@ class BandwidthLimit(object):
         "timezone":'timezone'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "bandwidth_limit_overrides":['bandwidth_limit_override.BandwidthLimitOverride']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bandwidth_limit_overrides=None,
                  rate_limit_bytes_per_sec=None,
@@ -59,21 +68,6 @@ class BandwidthLimit(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bandwidth_limit_overrides = None
-        if dictionary.get('bandwidthLimitOverrides') != None:
-            bandwidth_limit_overrides = list()
-            for structure in dictionary.get('bandwidthLimitOverrides'):
-                bandwidth_limit_overrides.append(cohesity_management_sdk.models.bandwidth_limit_override.BandwidthLimitOverride.from_dictionary(structure))
-        rate_limit_bytes_per_sec = dictionary.get('rateLimitBytesPerSec')
-        timezone = dictionary.get('timezone')
-
-        # Return an object of this model
-        return cls(bandwidth_limit_overrides,
-                   rate_limit_bytes_per_sec,
-                   timezone)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.time_of_a_week
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BandwidthLimitOverride(object):
 
@@ -29,6 +29,15 @@ class BandwidthLimitOverride(object):
         "time_periods":'timePeriods'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "time_periods":'time_of_a_week.TimeOfAWeek'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bytes_per_second=None,
                  time_periods=None):
@@ -53,15 +62,6 @@ class BandwidthLimitOverride(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bytes_per_second = dictionary.get('bytesPerSecond')
-        time_periods = cohesity_management_sdk.models.time_of_a_week.TimeOfAWeek.from_dictionary(dictionary.get('timePeriods')) if dictionary.get('timePeriods') else None
-
-        # Return an object of this model
-        return cls(bytes_per_second,
-                   time_periods)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BasicClusterInfo(object):
 
@@ -64,6 +65,9 @@ class BasicClusterInfo(object):
         "name":'name'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  authentication_type=None,
                  banner_enabled=None,
@@ -108,35 +112,6 @@ class BasicClusterInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        authentication_type = dictionary.get('authenticationType')
-        banner_enabled = dictionary.get('bannerEnabled')
-        cluster_software_version = dictionary.get('clusterSoftwareVersion')
-        cluster_type = dictionary.get('clusterType')
-        domains = dictionary.get('domains')
-        idp_configured = dictionary.get('idpConfigured')
-        idp_tenant_exists = dictionary.get('idpTenantExists')
-        language_locale = dictionary.get('languageLocale')
-        mcm_mode = dictionary.get('mcmMode')
-        mcm_on_prem_mode = dictionary.get('mcmOnPremMode')
-        multi_tenancy_enabled = dictionary.get('multiTenancyEnabled')
-        name = dictionary.get('name')
-
-        # Return an object of this model
-        return cls(authentication_type,
-                   banner_enabled,
-                   cluster_software_version,
-                   cluster_type,
-                   domains,
-                   idp_configured,
-                   idp_tenant_exists,
-                   language_locale,
-                   mcm_mode,
-                   mcm_on_prem_mode,
-                   multi_tenancy_enabled,
-                   name)
+        return decode_model(cls, dictionary)
 
 
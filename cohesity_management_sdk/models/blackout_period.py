@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.time_of_day
+from cohesity_management_sdk.model_decoder import decode_model
 
 class BlackoutPeriod(object):
 
@@ -30,6 +30,16 @@ class BlackoutPeriod(object):
         "start_time":'startTime'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "end_time":'time_of_day.TimeOfDay',
+        "start_time":'time_of_day.TimeOfDay'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  day=None,
                  end_time=None,
@@ -56,17 +66,6 @@ class BlackoutPeriod(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        day = dictionary.get('day')
-        end_time = cohesity_management_sdk.models.time_of_day.TimeOfDay.from_dictionary(dictionary.get('endTime')) if dictionary.get('endTime') else None
-        start_time = cohesity_management_sdk.models.time_of_day.TimeOfDay.from_dictionary(dictionary.get('startTime')) if dictionary.get('startTime') else None
-
-        # Return an object of this model
-        return cls(day,
-                   end_time,
-                   start_time)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class C2SAccessPortal(object):
 
@@ -28,6 +29,9 @@ class C2SAccessPortal(object):
         "role":'role'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  agency=None,
                  base_url=None,
@@ -58,21 +62,6 @@ class C2SAccessPortal(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        agency = dictionary.get('agency')
-        base_url = dictionary.get('baseUrl')
-        client_certificate_password = dictionary.get('clientCertificatePassword')
-        mission = dictionary.get('mission')
-        role = dictionary.get('role')
-
-        # Return an object of this model
-        return cls(agency,
-                   base_url,
-                   client_certificate_password,
-                   mission,
-                   role)
+        return decode_model(cls, dictionary)
 
 
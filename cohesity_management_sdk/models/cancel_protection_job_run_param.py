@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CancelProtectionJobRunParam(object):
 
@@ -26,6 +26,15 @@ class CancelProtectionJobRunParam(object):
         "job_run_id":'jobRunId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "copy_task_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  copy_task_uid=None,
                  job_run_id=None):
@@ -50,15 +59,6 @@ class CancelProtectionJobRunParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        copy_task_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('copyTaskUid')) if dictionary.get('copyTaskUid') else None
-        job_run_id = dictionary.get('jobRunId')
-
-        # Return an object of this model
-        return cls(copy_task_uid,
-                   job_run_id)
+        return decode_model(cls, dictionary)
 
 
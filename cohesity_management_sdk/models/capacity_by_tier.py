@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CapacityByTier(object):
 
@@ -28,6 +29,9 @@ class CapacityByTier(object):
         "tier_max_physical_capacity_bytes":'tierMaxPhysicalCapacityBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  storage_tier=None,
                  tier_max_physical_capacity_bytes=None):
@@ -52,15 +56,6 @@ class CapacityByTier(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        storage_tier = dictionary.get('storageTier')
-        tier_max_physical_capacity_bytes = dictionary.get('tierMaxPhysicalCapacityBytes')
-
-        # Return an object of this model
-        return cls(storage_tier,
-                   tier_max_physical_capacity_bytes)
+        return decode_model(cls, dictionary)
 
 
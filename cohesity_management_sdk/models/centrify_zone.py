@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CentrifyZone(object):
 
@@ -38,6 +39,9 @@ class CentrifyZone(object):
         "distinguished_name":'distinguishedName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  centrify_schema=None,
                  description=None,
@@ -64,17 +68,6 @@ class CentrifyZone(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        centrify_schema = dictionary.get('centrifySchema')
-        description = dictionary.get('description')
-        distinguished_name = dictionary.get('distinguishedName')
-
-        # Return an object of this model
-        return cls(centrify_schema,
-                   description,
-                   distinguished_name)
+        return decode_model(cls, dictionary)
 
 
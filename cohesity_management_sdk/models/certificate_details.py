@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CertificateDetails(object):
 
@@ -25,6 +26,9 @@ class CertificateDetails(object):
         "host_ips":'hostIps'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cert_file_name=None,
                  expiry_date=None,
@@ -51,17 +55,6 @@ class CertificateDetails(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cert_file_name = dictionary.get('certFileName')
-        expiry_date = dictionary.get('expiryDate')
-        host_ips = dictionary.get('hostIps')
-
-        # Return an object of this model
-        return cls(cert_file_name,
-                   expiry_date,
-                   host_ips)
+        return decode_model(cls, dictionary)
 
 
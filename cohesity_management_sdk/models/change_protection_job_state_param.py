@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ChangeProtectionJobStateParam(object):
 
@@ -27,6 +28,9 @@ class ChangeProtectionJobStateParam(object):
         "pause_reason":'pauseReason'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  pause=None,
                  pause_reason=None):
@@ -51,15 +55,6 @@ class ChangeProtectionJobStateParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        pause = dictionary.get('pause')
-        pause_reason = dictionary.get('pauseReason')
-
-        # Return an object of this model
-        return cls(pause,
-                   pause_reason)
+        return decode_model(cls, dictionary)
 
 
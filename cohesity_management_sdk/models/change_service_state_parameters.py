@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ChangeServiceStateParameters(object):
 
@@ -66,6 +67,9 @@ class ChangeServiceStateParameters(object):
         "services":'services'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  action=None,
                  services=None):
@@ -90,15 +94,6 @@ class ChangeServiceStateParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        action = dictionary.get('action')
-        services = dictionary.get('services')
-
-        # Return an object of this model
-        return cls(action,
-                   services)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ChangeServiceStateResult(object):
 
@@ -23,6 +24,9 @@ class ChangeServiceStateResult(object):
         "status_url":'statusUrl'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  message=None,
                  status_url=None):
@@ -47,15 +51,6 @@ class ChangeServiceStateResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        message = dictionary.get('message')
-        status_url = dictionary.get('statusUrl')
-
-        # Return an object of this model
-        return cls(message,
-                   status_url)
+        return decode_model(cls, dictionary)
 
 
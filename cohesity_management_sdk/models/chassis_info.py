@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ChassisInfo(object):
 
@@ -27,6 +28,9 @@ class ChassisInfo(object):
         "rack_id":'rackId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  chassis_id=None,
                  chassis_name=None,
@@ -55,19 +59,6 @@ class ChassisInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        chassis_id = dictionary.get('chassisId')
-        chassis_name = dictionary.get('chassisName')
-        location = dictionary.get('location')
-        rack_id = dictionary.get('rackId')
-
-        # Return an object of this model
-        return cls(chassis_id,
-                   chassis_name,
-                   location,
-                   rack_id)
+        return decode_model(cls, dictionary)
 
 
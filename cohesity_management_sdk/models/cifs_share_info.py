@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CifsShareInfo(object):
 
@@ -31,6 +32,9 @@ class CifsShareInfo(object):
         "server_name":'serverName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  acls=None,
                  name=None,
@@ -59,19 +63,6 @@ class CifsShareInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        acls = dictionary.get('acls')
-        name = dictionary.get('name')
-        path = dictionary.get('path')
-        server_name = dictionary.get('serverName')
-
-        # Return an object of this model
-        return cls(acls,
-                   name,
-                   path,
-                   server_name)
+        return decode_model(cls, dictionary)
 
 
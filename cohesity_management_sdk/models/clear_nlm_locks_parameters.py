@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClearNlmLocksParameters(object):
 
@@ -27,6 +28,9 @@ class ClearNlmLocksParameters(object):
         "view_name":'viewName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  client_id=None,
                  file_path=None,
@@ -53,17 +57,6 @@ class ClearNlmLocksParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        client_id = dictionary.get('clientId')
-        file_path = dictionary.get('filePath')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(client_id,
-                   file_path,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
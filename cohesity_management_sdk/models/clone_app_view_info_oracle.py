@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloneAppViewInfoOracle(object):
 
@@ -19,6 +20,9 @@ class CloneAppViewInfoOracle(object):
         "mount_path_info_vec":'mountPathInfoVec'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  mount_path_info_vec=None):
         """Constructor for the CloneAppViewInfoOracle class"""
@@ -41,13 +45,6 @@ class CloneAppViewInfoOracle(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        mount_path_info_vec = dictionary.get('mountPathInfoVec')
-
-        # Return an object of this model
-        return cls(mount_path_info_vec)
+        return decode_model(cls, dictionary)
 
 
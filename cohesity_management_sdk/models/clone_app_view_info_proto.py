@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.clone_app_view_info_oracle
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloneAppViewInfoProto(object):
 
@@ -23,6 +23,15 @@ class CloneAppViewInfoProto(object):
         "oracle_app_view_restore_info":'oracleAppViewRestoreInfo'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "oracle_app_view_restore_info":'clone_app_view_info_oracle.CloneAppViewInfoOracle'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  oracle_app_view_restore_info=None):
         """Constructor for the CloneAppViewInfoProto class"""
@@ -45,13 +54,6 @@ class CloneAppViewInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        oracle_app_view_restore_info = cohesity_management_sdk.models.clone_app_view_info_oracle.CloneAppViewInfoOracle.from_dictionary(dictionary.get('oracleAppViewRestoreInfo')) if dictionary.get('oracleAppViewRestoreInfo') else None
-
-        # Return an object of this model
-        return cls(oracle_app_view_restore_info)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloneAppViewParams(object):
 
@@ -22,6 +23,9 @@ class CloneAppViewParams(object):
         "mount_path_identifier":'mountPathIdentifier'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  mount_path_identifier=None):
         """Constructor for the CloneAppViewParams class"""
@@ -44,13 +48,6 @@ class CloneAppViewParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        mount_path_identifier = dictionary.get('mountPathIdentifier')
-
-        # Return an object of this model
-        return cls(mount_path_identifier)
+        return decode_model(cls, dictionary)
 
 
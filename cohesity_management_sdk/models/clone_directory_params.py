@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloneDirectoryParams(object):
 
@@ -26,6 +27,9 @@ class CloneDirectoryParams(object):
         "source_directory_path":'sourceDirectoryPath'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  destination_directory_name=None,
                  destination_parent_directory_path=None,
@@ -52,17 +56,6 @@ class CloneDirectoryParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        destination_directory_name = dictionary.get('destinationDirectoryName')
-        destination_parent_directory_path = dictionary.get('destinationParentDirectoryPath')
-        source_directory_path = dictionary.get('sourceDirectoryPath')
-
-        # Return an object of this model
-        return cls(destination_directory_name,
-                   destination_parent_directory_path,
-                   source_directory_path)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_object_details
-import cohesity_management_sdk.models.vlan_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloneRefreshRequest(object):
 
@@ -55,6 +54,16 @@ class CloneRefreshRequest(object):
         "vlan_parameters":'vlanParameters'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "objects":['restore_object_details.RestoreObjectDetails'],
+        "vlan_parameters":'vlan_parameters.VlanParameters'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  clone_task_id=None,
@@ -91,31 +100,6 @@ class CloneRefreshRequest(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        clone_task_id = dictionary.get('cloneTaskId')
-        continue_on_error = dictionary.get('continueOnError')
-        new_parent_id = dictionary.get('newParentId')
-        objects = None
-        if dictionary.get('objects') != None:
-            objects = list()
-            for structure in dictionary.get('objects'):
-                objects.append(cohesity_management_sdk.models.restore_object_details.RestoreObjectDetails.from_dictionary(structure))
-        refresh_time_secs = dictionary.get('refreshTimeSecs')
-        source_database_id = dictionary.get('sourceDatabaseId')
-        vlan_parameters = cohesity_management_sdk.models.vlan_parameters.VlanParameters.from_dictionary(dictionary.get('vlanParameters')) if dictionary.get('vlanParameters') else None
-
-        # Return an object of this model
-        return cls(name,
-                   clone_task_id,
-                   continue_on_error,
-                   new_parent_id,
-                   objects,
-                   refresh_time_secs,
-                   source_database_id,
-                   vlan_parameters)
+        return decode_model(cls, dictionary)
 
 
@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.clone_view_request
-import cohesity_management_sdk.models.hyperv_clone_parameters
-import cohesity_management_sdk.models.restore_object_details
-import cohesity_management_sdk.models.vlan_parameters
-import cohesity_management_sdk.models.vmware_clone_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloneTaskRequest(object):
 
@@ -80,6 +76,19 @@ class CloneTaskRequest(object):
         "vmware_parameters":'vmwareParameters'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "clone_view_parameters":'clone_view_request.CloneViewRequest',
+        "hyperv_parameters":'hyperv_clone_parameters.HypervCloneParameters',
+        "objects":['restore_object_details.RestoreObjectDetails'],
+        "vlan_parameters":'vlan_parameters.VlanParameters',
+        "vmware_parameters":'vmware_clone_parameters.VmwareCloneParameters'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  mtype=None,
@@ -122,37 +131,6 @@ class CloneTaskRequest(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-        clone_view_parameters = cohesity_management_sdk.models.clone_view_request.CloneViewRequest.from_dictionary(dictionary.get('cloneViewParameters')) if dictionary.get('cloneViewParameters') else None
-        continue_on_error = dictionary.get('continueOnError')
-        glacier_retrieval_type = dictionary.get('glacierRetrievalType')
-        hyperv_parameters = cohesity_management_sdk.models.hyperv_clone_parameters.HypervCloneParameters.from_dictionary(dictionary.get('hypervParameters')) if dictionary.get('hypervParameters') else None
-        new_parent_id = dictionary.get('newParentId')
-        objects = None
-        if dictionary.get('objects') != None:
-            objects = list()
-            for structure in dictionary.get('objects'):
-                objects.append(cohesity_management_sdk.models.restore_object_details.RestoreObjectDetails.from_dictionary(structure))
-        target_view_name = dictionary.get('targetViewName')
-        vlan_parameters = cohesity_management_sdk.models.vlan_parameters.VlanParameters.from_dictionary(dictionary.get('vlanParameters')) if dictionary.get('vlanParameters') else None
-        vmware_parameters = cohesity_management_sdk.models.vmware_clone_parameters.VmwareCloneParameters.from_dictionary(dictionary.get('vmwareParameters')) if dictionary.get('vmwareParameters') else None
-
-        # Return an object of this model
-        return cls(name,
-                   mtype,
-                   clone_view_parameters,
-                   continue_on_error,
-                   glacier_retrieval_type,
-                   hyperv_parameters,
-                   new_parent_id,
-                   objects,
-                   target_view_name,
-                   vlan_parameters,
-                   vmware_parameters)
+        return decode_model(cls, dictionary)
 
 
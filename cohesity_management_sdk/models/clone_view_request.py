@@ -1,16 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.antivirus_scan_config
-import cohesity_management_sdk.models.file_extension_filter
-import cohesity_management_sdk.models.file_level_data_lock_config
-import cohesity_management_sdk.models.quota_policy
-import cohesity_management_sdk.models.nfs_root_permissions
-import cohesity_management_sdk.models.qo_s
-import cohesity_management_sdk.models.smb_permission
-import cohesity_management_sdk.models.smb_permissions_info
-import cohesity_management_sdk.models.storage_policy_override
-import cohesity_management_sdk.models.subnet
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloneViewRequest(object):
 
@@ -138,6 +129,24 @@ class CloneViewRequest(object):
         "tenant_id":'tenantId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "antivirus_scan_config":'antivirus_scan_config.AntivirusScanConfig',
+        "file_extension_filter":'file_extension_filter.FileExtensionFilter',
+        "file_lock_config":'file_level_data_lock_config.FileLevelDataLockConfig',
+        "logical_quota":'quota_policy.QuotaPolicy',
+        "nfs_root_permissions":'nfs_root_permissions.NfsRootPermissions',
+        "qos":'qo_s.QoS',
+        "share_permissions":['smb_permission.SmbPermission'],
+        "smb_permissions_info":'smb_permissions_info.SmbPermissionsInfo',
+        "storage_policy_override":'storage_policy_override.StoragePolicyOverride',
+        "subnet_whitelist":['subnet.Subnet']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_sids=None,
                  antivirus_scan_config=None,
@@ -212,73 +221,6 @@ class CloneViewRequest(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_sids = dictionary.get('accessSids')
-        antivirus_scan_config = cohesity_management_sdk.models.antivirus_scan_config.AntivirusScanConfig.from_dictionary(dictionary.get('antivirusScanConfig')) if dictionary.get('antivirusScanConfig') else None
-        clone_view_name = dictionary.get('cloneViewName')
-        data_lock_expiry_usecs = dictionary.get('dataLockExpiryUsecs')
-        description = dictionary.get('description')
-        enable_filer_audit_logging = dictionary.get('enableFilerAuditLogging')
-        enable_mixed_mode_permissions = dictionary.get('enableMixedModePermissions')
-        enable_nfs_view_discovery = dictionary.get('enableNfsViewDiscovery')
-        enable_offline_caching = dictionary.get('enableOfflineCaching')
-        enable_smb_access_based_enumeration = dictionary.get('enableSmbAccessBasedEnumeration')
-        enable_smb_encryption = dictionary.get('enableSmbEncryption')
-        enable_smb_view_discovery = dictionary.get('enableSmbViewDiscovery')
-        enforce_smb_encryption = dictionary.get('enforceSmbEncryption')
-        file_extension_filter = cohesity_management_sdk.models.file_extension_filter.FileExtensionFilter.from_dictionary(dictionary.get('fileExtensionFilter')) if dictionary.get('fileExtensionFilter') else None
-        file_lock_config = cohesity_management_sdk.models.file_level_data_lock_config.FileLevelDataLockConfig.from_dictionary(dictionary.get('fileLockConfig')) if dictionary.get('fileLockConfig') else None
-        logical_quota = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('logicalQuota')) if dictionary.get('logicalQuota') else None
-        nfs_root_permissions = cohesity_management_sdk.models.nfs_root_permissions.NfsRootPermissions.from_dictionary(dictionary.get('nfsRootPermissions')) if dictionary.get('nfsRootPermissions') else None
-        override_global_whitelist = dictionary.get('overrideGlobalWhitelist')
-        protocol_access = dictionary.get('protocolAccess')
-        qos = cohesity_management_sdk.models.qo_s.QoS.from_dictionary(dictionary.get('qos')) if dictionary.get('qos') else None
-        security_mode = dictionary.get('securityMode')
-        share_permissions = None
-        if dictionary.get('sharePermissions') != None:
-            share_permissions = list()
-            for structure in dictionary.get('sharePermissions'):
-                share_permissions.append(cohesity_management_sdk.models.smb_permission.SmbPermission.from_dictionary(structure))
-        smb_permissions_info = cohesity_management_sdk.models.smb_permissions_info.SmbPermissionsInfo.from_dictionary(dictionary.get('smbPermissionsInfo')) if dictionary.get('smbPermissionsInfo') else None
-        source_view_name = dictionary.get('sourceViewName')
-        storage_policy_override = cohesity_management_sdk.models.storage_policy_override.StoragePolicyOverride.from_dictionary(dictionary.get('storagePolicyOverride')) if dictionary.get('storagePolicyOverride') else None
-        subnet_whitelist = None
-        if dictionary.get('subnetWhitelist') != None:
-            subnet_whitelist = list()
-            for structure in dictionary.get('subnetWhitelist'):
-                subnet_whitelist.append(cohesity_management_sdk.models.subnet.Subnet.from_dictionary(structure))
-        tenant_id = dictionary.get('tenantId')
-
-        # Return an object of this model
-        return cls(access_sids,
-                   antivirus_scan_config,
-                   clone_view_name,
-                   data_lock_expiry_usecs,
-                   description,
-                   enable_filer_audit_logging,
-                   enable_mixed_mode_permissions,
-                   enable_nfs_view_discovery,
-                   enable_offline_caching,
-                   enable_smb_access_based_enumeration,
-                   enable_smb_encryption,
-                   enable_smb_view_discovery,
-                   enforce_smb_encryption,
-                   file_extension_filter,
-                   file_lock_config,
-                   logical_quota,
-                   nfs_root_permissions,
-                   override_global_whitelist,
-                   protocol_access,
-                   qos,
-                   security_mode,
-                   share_permissions,
-                   smb_permissions_info,
-                   source_view_name,
-                   storage_policy_override,
-                   subnet_whitelist,
-                   tenant_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloseSmbFileOpenParameters(object):
 
@@ -26,6 +27,9 @@ class CloseSmbFileOpenParameters(object):
         "view_name":'viewName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  file_path=None,
                  open_id=None,
@@ -52,17 +56,6 @@ class CloseSmbFileOpenParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        file_path = dictionary.get('filePath')
-        open_id = dictionary.get('openId')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(file_path,
-                   open_id,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.cloud_deploy_info_proto_cloud_deploy_entity
-import cohesity_management_sdk.models.restore_info_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloudDeployInfoProto(object):
 
@@ -121,6 +120,16 @@ class CloudDeployInfoProto(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cloud_deploy_entity_vec":['cloud_deploy_info_proto_cloud_deploy_entity.CloudDeployInfoProtoCloudDeployEntity'],
+        "restore_info":'restore_info_proto.RestoreInfoProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cloud_deploy_entity_vec=None,
                  is_incremental=None,
@@ -153,27 +162,6 @@ class CloudDeployInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cloud_deploy_entity_vec = None
-        if dictionary.get('cloudDeployEntityVec') != None:
-            cloud_deploy_entity_vec = list()
-            for structure in dictionary.get('cloudDeployEntityVec'):
-                cloud_deploy_entity_vec.append(cohesity_management_sdk.models.cloud_deploy_info_proto_cloud_deploy_entity.CloudDeployInfoProtoCloudDeployEntity.from_dictionary(structure))
-        is_incremental = dictionary.get('isIncremental')
-        restore_info = cohesity_management_sdk.models.restore_info_proto.RestoreInfoProto.from_dictionary(dictionary.get('restoreInfo')) if dictionary.get('restoreInfo') else None
-        target_type = dictionary.get('targetType')
-        total_bytes_transferred_to_source = dictionary.get('totalBytesTransferredToSource')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(cloud_deploy_entity_vec,
-                   is_incremental,
-                   restore_info,
-                   target_type,
-                   total_bytes_transferred_to_source,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloudDeployInfoProtoCloudDeployEntity(object):
 
@@ -47,6 +46,16 @@ class CloudDeployInfoProtoCloudDeployEntity(object):
         "status":'status'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "entity":'entity_proto.EntityProto',
+        "error":'error_proto.ErrorProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  deployed_vm_name=None,
                  entity=None,
@@ -85,29 +94,6 @@ class CloudDeployInfoProtoCloudDeployEntity(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        deployed_vm_name = dictionary.get('deployedVmName')
-        entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('entity')) if dictionary.get('entity') else None
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        previous_relative_clone_dir_path = dictionary.get('previousRelativeCloneDirPath')
-        previous_relative_clone_paths = dictionary.get('previousRelativeClonePaths')
-        progress_monitor_task_path = dictionary.get('progressMonitorTaskPath')
-        public_status = dictionary.get('publicStatus')
-        relative_clone_paths = dictionary.get('relativeClonePaths')
-        status = dictionary.get('status')
-
-        # Return an object of this model
-        return cls(deployed_vm_name,
-                   entity,
-                   error,
-                   previous_relative_clone_dir_path,
-                   previous_relative_clone_paths,
-                   progress_monitor_task_path,
-                   public_status,
-                   relative_clone_paths,
-                   status)
+        return decode_model(cls, dictionary)
 
 
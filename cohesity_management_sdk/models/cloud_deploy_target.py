@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.deploy_v_ms_to_cloud_params
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloudDeployTarget(object):
 
@@ -28,6 +27,16 @@ class CloudDeployTarget(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "deploy_vms_to_cloud_params":'deploy_v_ms_to_cloud_params.DeployVMsToCloudParams',
+        "target_entity":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  deploy_vms_to_cloud_params=None,
                  target_entity=None,
@@ -54,17 +63,6 @@ class CloudDeployTarget(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        deploy_vms_to_cloud_params = cohesity_management_sdk.models.deploy_v_ms_to_cloud_params.DeployVMsToCloudParams.from_dictionary(dictionary.get('deployVmsToCloudParams')) if dictionary.get('deployVmsToCloudParams') else None
-        target_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetEntity')) if dictionary.get('targetEntity') else None
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(deploy_vms_to_cloud_params,
-                   target_entity,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
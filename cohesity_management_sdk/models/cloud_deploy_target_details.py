@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.aws_params
-import cohesity_management_sdk.models.azure_params
-import cohesity_management_sdk.models.gcp_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloudDeployTargetDetails(object):
 
@@ -42,6 +40,17 @@ class CloudDeployTargetDetails(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "aws_params":'aws_params.AwsParams',
+        "azure_params":'azure_params.AzureParams',
+        "gcp_params":'gcp_params.GcpParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  aws_params=None,
                  azure_params=None,
@@ -74,23 +83,6 @@ class CloudDeployTargetDetails(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        aws_params = cohesity_management_sdk.models.aws_params.AwsParams.from_dictionary(dictionary.get('awsParams')) if dictionary.get('awsParams') else None
-        azure_params = cohesity_management_sdk.models.azure_params.AzureParams.from_dictionary(dictionary.get('azureParams')) if dictionary.get('azureParams') else None
-        gcp_params = cohesity_management_sdk.models.gcp_params.GcpParams.from_dictionary(dictionary.get('gcpParams')) if dictionary.get('gcpParams') else None
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(aws_params,
-                   azure_params,
-                   gcp_params,
-                   id,
-                   name,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloudNetworkConfiguration(object):
 
@@ -32,6 +33,9 @@ class CloudNetworkConfiguration(object):
         "ntp_servers":'ntpServers'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_gateway=None,
                  cluster_subnet_mask=None,
@@ -62,21 +66,6 @@ class CloudNetworkConfiguration(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_gateway = dictionary.get('clusterGateway')
-        cluster_subnet_mask = dictionary.get('clusterSubnetMask')
-        dns_servers = dictionary.get('dnsServers')
-        domain_names = dictionary.get('domainNames')
-        ntp_servers = dictionary.get('ntpServers')
-
-        # Return an object of this model
-        return cls(cluster_gateway,
-                   cluster_subnet_mask,
-                   dns_servers,
-                   domain_names,
-                   ntp_servers)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CloudParameters(object):
 
@@ -21,6 +22,9 @@ class CloudParameters(object):
         "failover_to_cloud":'failoverToCloud'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  failover_to_cloud=None):
         """Constructor for the CloudParameters class"""
@@ -43,13 +47,6 @@ class CloudParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        failover_to_cloud = dictionary.get('failoverToCloud')
-
-        # Return an object of this model
-        return cls(failover_to_cloud)
+        return decode_model(cls, dictionary)
 
 
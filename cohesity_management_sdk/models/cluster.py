@@ -1,17 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.apps_config
-import cohesity_management_sdk.models.cluster_audit_log_configuration
-import cohesity_management_sdk.models.eula_config
-import cohesity_management_sdk.models.filer_audit_log_configuration
-import cohesity_management_sdk.models.cluster_hardware_info
-import cohesity_management_sdk.models.license_state
-import cohesity_management_sdk.models.ntp_settings_config
-import cohesity_management_sdk.models.schema_info
-import cohesity_management_sdk.models.cluster_stats
-import cohesity_management_sdk.models.supported_config
-import cohesity_management_sdk.models.syslog_server
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Cluster(object):
 
@@ -218,6 +208,25 @@ class Cluster(object):
         "used_metadata_space_pct":'usedMetadataSpacePct'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "apps_settings":'apps_config.AppsConfig',
+        "cluster_audit_log_config":'cluster_audit_log_configuration.ClusterAuditLogConfiguration',
+        "eula_config":'eula_config.EulaConfig',
+        "filer_audit_log_config":'filer_audit_log_configuration.FilerAuditLogConfiguration',
+        "hardware_info":'cluster_hardware_info.ClusterHardwareInfo',
+        "license_state":'license_state.LicenseState',
+        "ntp_settings":'ntp_settings_config.NtpSettingsConfig',
+        "schema_info_list":['schema_info.SchemaInfo'],
+        "stats":'cluster_stats.ClusterStats',
+        "supported_config":'supported_config.SupportedConfig',
+        "syslog_servers":['syslog_server.SyslogServer']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  apps_settings=None,
                  available_metadata_space=None,
@@ -338,119 +347,6 @@ class Cluster(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        apps_settings = cohesity_management_sdk.models.apps_config.AppsConfig.from_dictionary(dictionary.get('appsSettings')) if dictionary.get('appsSettings') else None
-        available_metadata_space = dictionary.get('availableMetadataSpace')
-        banner_enabled = dictionary.get('bannerEnabled')
-        bonding_mode = dictionary.get('bondingMode')
-        cluster_audit_log_config = cohesity_management_sdk.models.cluster_audit_log_configuration.ClusterAuditLogConfiguration.from_dictionary(dictionary.get('clusterAuditLogConfig')) if dictionary.get('clusterAuditLogConfig') else None
-        cluster_software_version = dictionary.get('clusterSoftwareVersion')
-        cluster_type = dictionary.get('clusterType')
-        created_time_msecs = dictionary.get('createdTimeMsecs')
-        current_op_scheduled_time_secs = dictionary.get('currentOpScheduledTimeSecs')
-        current_operation = dictionary.get('currentOperation')
-        current_time_msecs = dictionary.get('currentTimeMsecs')
-        dns_server_ips = dictionary.get('dnsServerIps')
-        domain_names = dictionary.get('domainNames')
-        enable_active_monitoring = dictionary.get('enableActiveMonitoring')
-        enable_upgrade_pkg_polling = dictionary.get('enableUpgradePkgPolling')
-        encryption_enabled = dictionary.get('encryptionEnabled')
-        encryption_key_rotation_period_secs = dictionary.get('encryptionKeyRotationPeriodSecs')
-        eula_config = cohesity_management_sdk.models.eula_config.EulaConfig.from_dictionary(dictionary.get('eulaConfig')) if dictionary.get('eulaConfig') else None
-        filer_audit_log_config = cohesity_management_sdk.models.filer_audit_log_configuration.FilerAuditLogConfiguration.from_dictionary(dictionary.get('filerAuditLogConfig')) if dictionary.get('filerAuditLogConfig') else None
-        fips_mode_enabled = dictionary.get('fipsModeEnabled')
-        gateway = dictionary.get('gateway')
-        google_analytics_enabled = dictionary.get('googleAnalyticsEnabled')
-        hardware_info = cohesity_management_sdk.models.cluster_hardware_info.ClusterHardwareInfo.from_dictionary(dictionary.get('hardwareInfo')) if dictionary.get('hardwareInfo') else None
-        id = dictionary.get('id')
-        incarnation_id = dictionary.get('incarnationId')
-        is_documentation_local = dictionary.get('isDocumentationLocal')
-        language_locale = dictionary.get('languageLocale')
-        license_state = cohesity_management_sdk.models.license_state.LicenseState.from_dictionary(dictionary.get('licenseState')) if dictionary.get('licenseState') else None
-        local_auth_domain_name = dictionary.get('localAuthDomainName')
-        local_groups_enabled = dictionary.get('localGroupsEnabled')
-        metadata_fault_tolerance_factor = dictionary.get('metadataFaultToleranceFactor')
-        mtu = dictionary.get('mtu')
-        multi_tenancy_enabled = dictionary.get('multiTenancyEnabled')
-        name = dictionary.get('name')
-        node_count = dictionary.get('nodeCount')
-        ntp_settings = cohesity_management_sdk.models.ntp_settings_config.NtpSettingsConfig.from_dictionary(dictionary.get('ntpSettings')) if dictionary.get('ntpSettings') else None
-        proxy_vm_subnet = dictionary.get('proxyVMSubnet')
-        reverse_tunnel_enabled = dictionary.get('reverseTunnelEnabled')
-        reverse_tunnel_end_time_msecs = dictionary.get('reverseTunnelEndTimeMsecs')
-        schema_info_list = None
-        if dictionary.get('schemaInfoList') != None:
-            schema_info_list = list()
-            for structure in dictionary.get('schemaInfoList'):
-                schema_info_list.append(cohesity_management_sdk.models.schema_info.SchemaInfo.from_dictionary(structure))
-        smb_ad_disabled = dictionary.get('smbAdDisabled')
-        stats = cohesity_management_sdk.models.cluster_stats.ClusterStats.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-        stig_mode = dictionary.get('stigMode')
-        supported_config = cohesity_management_sdk.models.supported_config.SupportedConfig.from_dictionary(dictionary.get('supportedConfig')) if dictionary.get('supportedConfig') else None
-        syslog_servers = None
-        if dictionary.get('syslogServers') != None:
-            syslog_servers = list()
-            for structure in dictionary.get('syslogServers'):
-                syslog_servers.append(cohesity_management_sdk.models.syslog_server.SyslogServer.from_dictionary(structure))
-        target_software_version = dictionary.get('targetSoftwareVersion')
-        tenant_viewbox_sharing_enabled = dictionary.get('tenantViewboxSharingEnabled')
-        timezone = dictionary.get('timezone')
-        turbo_mode = dictionary.get('turboMode')
-        used_metadata_space_pct = dictionary.get('usedMetadataSpacePct')
-
-        # Return an object of this model
-        return cls(apps_settings,
-                   available_metadata_space,
-                   banner_enabled,
-                   bonding_mode,
-                   cluster_audit_log_config,
-                   cluster_software_version,
-                   cluster_type,
-                   created_time_msecs,
-                   current_op_scheduled_time_secs,
-                   current_operation,
-                   current_time_msecs,
-                   dns_server_ips,
-                   domain_names,
-                   enable_active_monitoring,
-                   enable_upgrade_pkg_polling,
-                   encryption_enabled,
-                   encryption_key_rotation_period_secs,
-                   eula_config,
-                   filer_audit_log_config,
-                   fips_mode_enabled,
-                   gateway,
-                   google_analytics_enabled,
-                   hardware_info,
-                   id,
-                   incarnation_id,
-                   is_documentation_local,
-                   language_locale,
-                   license_state,
-                   local_auth_domain_name,
-                   local_groups_enabled,
-                   metadata_fault_tolerance_factor,
-                   mtu,
-                   multi_tenancy_enabled,
-                   name,
-                   node_count,
-                   ntp_settings,
-                   proxy_vm_subnet,
-                   reverse_tunnel_enabled,
-                   reverse_tunnel_end_time_msecs,
-                   schema_info_list,
-                   smb_ad_disabled,
-                   stats,
-                   stig_mode,
-                   supported_config,
-                   syslog_servers,
-                   target_software_version,
-                   tenant_viewbox_sharing_enabled,
-                   timezone,
-                   turbo_mode,
-                   used_metadata_space_pct)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.tenant
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClusterAuditLog(object):
 
@@ -62,6 +62,16 @@ class ClusterAuditLog(object):
         "user_name":'userName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "original_tenant":'tenant.Tenant',
+        "tenant":'tenant.Tenant'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  action=None,
                  details=None,
@@ -110,39 +120,6 @@ class ClusterAuditLog(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        action = dictionary.get('action')
-        details = dictionary.get('details')
-        domain = dictionary.get('domain')
-        entity_id = dictionary.get('entityId')
-        entity_name = dictionary.get('entityName')
-        entity_type = dictionary.get('entityType')
-        human_timestamp = dictionary.get('humanTimestamp')
-        impersonation = dictionary.get('impersonation')
-        new_record = dictionary.get('newRecord')
-        original_tenant = cohesity_management_sdk.models.tenant.Tenant.from_dictionary(dictionary.get('originalTenant')) if dictionary.get('originalTenant') else None
-        previous_record = dictionary.get('previousRecord')
-        tenant = cohesity_management_sdk.models.tenant.Tenant.from_dictionary(dictionary.get('tenant')) if dictionary.get('tenant') else None
-        timestamp_usecs = dictionary.get('timestampUsecs')
-        user_name = dictionary.get('userName')
-
-        # Return an object of this model
-        return cls(action,
-                   details,
-                   domain,
-                   entity_id,
-                   entity_name,
-                   entity_type,
-                   human_timestamp,
-                   impersonation,
-                   new_record,
-                   original_tenant,
-                   previous_record,
-                   tenant,
-                   timestamp_usecs,
-                   user_name)
+        return decode_model(cls, dictionary)
 
 
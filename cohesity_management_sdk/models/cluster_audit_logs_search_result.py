@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.cluster_audit_log
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClusterAuditLogsSearchResult(object):
 
@@ -28,6 +28,15 @@ class ClusterAuditLogsSearchResult(object):
         "total_count":'totalCount'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cluster_audit_logs":['cluster_audit_log.ClusterAuditLog']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_audit_logs=None,
                  total_count=None):
@@ -52,19 +61,6 @@ class ClusterAuditLogsSearchResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_audit_logs = None
-        if dictionary.get('clusterAuditLogs') != None:
-            cluster_audit_logs = list()
-            for structure in dictionary.get('clusterAuditLogs'):
-                cluster_audit_logs.append(cohesity_management_sdk.models.cluster_audit_log.ClusterAuditLog.from_dictionary(structure))
-        total_count = dictionary.get('totalCount')
-
-        # Return an object of this model
-        return cls(cluster_audit_logs,
-                   total_count)
+        return decode_model(cls, dictionary)
 
 
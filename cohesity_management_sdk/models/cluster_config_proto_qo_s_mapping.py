@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.cluster_config_proto_qo_s_mapping_qo_s_context
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClusterConfigProtoQoSMapping(object):
 
@@ -31,6 +31,15 @@ class ClusterConfigProtoQoSMapping(object):
         "qos_context":'qosContext'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "qos_context":'cluster_config_proto_qo_s_mapping_qo_s_context.ClusterConfigProtoQoSMappingQoSContext'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  principal_id=None,
                  qos_context=None):
@@ -55,15 +64,6 @@ class ClusterConfigProtoQoSMapping(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        principal_id = dictionary.get('principalId')
-        qos_context = cohesity_management_sdk.models.cluster_config_proto_qo_s_mapping_qo_s_context.ClusterConfigProtoQoSMappingQoSContext.from_dictionary(dictionary.get('qosContext')) if dictionary.get('qosContext') else None
-
-        # Return an object of this model
-        return cls(principal_id,
-                   qos_context)
+        return decode_model(cls, dictionary)
 
 
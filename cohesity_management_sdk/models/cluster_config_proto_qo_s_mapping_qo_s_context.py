@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClusterConfigProtoQoSMappingQoSContext(object):
 
@@ -27,6 +28,9 @@ class ClusterConfigProtoQoSMappingQoSContext(object):
         "view_id":'viewId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  priority=None,
                  mtype=None,
@@ -55,19 +59,6 @@ class ClusterConfigProtoQoSMappingQoSContext(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        priority = dictionary.get('priority')
-        mtype = dictionary.get('type')
-        view_box_id = dictionary.get('viewBoxId')
-        view_id = dictionary.get('viewId')
-
-        # Return an object of this model
-        return cls(priority,
-                   mtype,
-                   view_box_id,
-                   view_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClusterConfigProtoSID(object):
 
@@ -28,6 +29,9 @@ class ClusterConfigProtoSID(object):
         "sub_authority":'subAuthority'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  identifier_authority=None,
                  revision_level=None,
@@ -54,17 +58,6 @@ class ClusterConfigProtoSID(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        identifier_authority = dictionary.get('identifierAuthority')
-        revision_level = dictionary.get('revisionLevel')
-        sub_authority = dictionary.get('subAuthority')
-
-        # Return an object of this model
-        return cls(identifier_authority,
-                   revision_level,
-                   sub_authority)
+        return decode_model(cls, dictionary)
 
 
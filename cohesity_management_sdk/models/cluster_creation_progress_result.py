@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClusterCreationProgressResult(object):
 
@@ -41,6 +42,9 @@ class ClusterCreationProgressResult(object):
         "warnings_found":'warningsFound'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  completion_percentage=None,
                  error_message=None,
@@ -75,25 +79,6 @@ class ClusterCreationProgressResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        completion_percentage = dictionary.get('completionPercentage')
-        error_message = dictionary.get('errorMessage')
-        events = dictionary.get('events')
-        in_progress = dictionary.get('inProgress')
-        message = dictionary.get('message')
-        seconds_remaining = dictionary.get('secondsRemaining')
-        warnings_found = dictionary.get('warningsFound')
-
-        # Return an object of this model
-        return cls(completion_percentage,
-                   error_message,
-                   events,
-                   in_progress,
-                   message,
-                   seconds_remaining,
-                   warnings_found)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClusterHardwareInfo(object):
 
@@ -22,6 +23,9 @@ class ClusterHardwareInfo(object):
         "hardware_vendors":'hardwareVendors'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  hardware_models=None,
                  hardware_vendors=None):
@@ -46,15 +50,6 @@ class ClusterHardwareInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        hardware_models = dictionary.get('hardwareModels')
-        hardware_vendors = dictionary.get('hardwareVendors')
-
-        # Return an object of this model
-        return cls(hardware_models,
-                   hardware_vendors)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClusterNetworkingEndpoint(object):
 
@@ -22,6 +23,9 @@ class ClusterNetworkingEndpoint(object):
         "ipv_6_addr":'ipv6Addr'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  fqdn=None,
                  ipv_4_addr=None,
@@ -48,17 +52,6 @@ class ClusterNetworkingEndpoint(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        fqdn = dictionary.get('fqdn')
-        ipv_4_addr = dictionary.get('ipv4Addr')
-        ipv_6_addr = dictionary.get('ipv6Addr')
-
-        # Return an object of this model
-        return cls(fqdn,
-                   ipv_4_addr,
-                   ipv_6_addr)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.cluster_networking_endpoint
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClusterNetworkingResourceInformation(object):
 
@@ -22,6 +22,15 @@ class ClusterNetworkingResourceInformation(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "endpoints":['cluster_networking_endpoint.ClusterNetworkingEndpoint']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  endpoints=None,
                  mtype=None):
@@ -46,19 +55,6 @@ class ClusterNetworkingResourceInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        endpoints = None
-        if dictionary.get('endpoints') != None:
-            endpoints = list()
-            for structure in dictionary.get('endpoints'):
-                endpoints.append(cohesity_management_sdk.models.cluster_networking_endpoint.ClusterNetworkingEndpoint.from_dictionary(structure))
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(endpoints,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
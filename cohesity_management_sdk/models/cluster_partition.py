@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.vlan
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClusterPartition(object):
 
@@ -39,6 +39,15 @@ class ClusterPartition(object):
         "vlans":'vlans'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "vlans":['vlan.Vlan']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  host_name=None,
                  id=None,
@@ -73,29 +82,6 @@ class ClusterPartition(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        host_name = dictionary.get('hostName')
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        node_ids = dictionary.get('nodeIds')
-        vips = dictionary.get('vips')
-        vlan_ips = dictionary.get('vlanIps')
-        vlans = None
-        if dictionary.get('vlans') != None:
-            vlans = list()
-            for structure in dictionary.get('vlans'):
-                vlans.append(cohesity_management_sdk.models.vlan.Vlan.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(host_name,
-                   id,
-                   name,
-                   node_ids,
-                   vips,
-                   vlan_ips,
-                   vlans)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ClusterPublicKeys(object):
 
@@ -19,6 +20,9 @@ class ClusterPublicKeys(object):
         "ssh_public_key":'sshPublicKey'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ssh_public_key=None):
         """Constructor for the ClusterPublicKeys class"""
@@ -41,13 +45,6 @@ class ClusterPublicKeys(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ssh_public_key = dictionary.get('sshPublicKey')
-
-        # Return an object of this model
-        return cls(ssh_public_key)
+        return decode_model(cls, dictionary)
 
 
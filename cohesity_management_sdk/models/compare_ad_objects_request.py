@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.guid_pair
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CompareAdObjectsRequest(object):
 
@@ -51,6 +51,15 @@ class CompareAdObjectsRequest(object):
         "quick_compare":'quickCompare'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "guid_pairs":['guid_pair.GuidPair']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  restore_task_id=None,
                  guid_pairs=None,
@@ -85,29 +94,6 @@ class CompareAdObjectsRequest(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        restore_task_id = dictionary.get('RestoreTaskId')
-        guid_pairs = None
-        if dictionary.get('guidPairs') != None:
-            guid_pairs = list()
-            for structure in dictionary.get('guidPairs'):
-                guid_pairs.append(cohesity_management_sdk.models.guid_pair.GuidPair.from_dictionary(structure))
-        allow_empty_dest_guids = dictionary.get('allowEmptyDestGuids')
-        exclude_sys_attributes = dictionary.get('excludeSysAttributes')
-        filter_null_value_attributes = dictionary.get('filterNullValueAttributes')
-        filter_same_value_attributes = dictionary.get('filterSameValueAttributes')
-        quick_compare = dictionary.get('quickCompare')
-
-        # Return an object of this model
-        return cls(restore_task_id,
-                   guid_pairs,
-                   allow_empty_dest_guids,
-                   exclude_sys_attributes,
-                   filter_null_value_attributes,
-                   filter_same_value_attributes,
-                   quick_compare)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.compare_ad_objects_result_ad_attribute_value
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CompareADObjectsResultADAttribute(object):
 
@@ -33,6 +32,18 @@ class CompareADObjectsResultADAttribute(object):
         "status":'status'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "dest_value":'compare_ad_objects_result_ad_attribute_value.CompareADObjectsResultADAttributeValue',
+        "same_value":'compare_ad_objects_result_ad_attribute_value.CompareADObjectsResultADAttributeValue',
+        "source_value":'compare_ad_objects_result_ad_attribute_value.CompareADObjectsResultADAttributeValue',
+        "status":'error_proto.ErrorProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  attr_flags=None,
                  dest_value=None,
@@ -65,23 +76,6 @@ class CompareADObjectsResultADAttribute(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        attr_flags = dictionary.get('attrFlags')
-        dest_value = cohesity_management_sdk.models.compare_ad_objects_result_ad_attribute_value.CompareADObjectsResultADAttributeValue.from_dictionary(dictionary.get('destValue')) if dictionary.get('destValue') else None
-        ldap_name = dictionary.get('ldapName')
-        same_value = cohesity_management_sdk.models.compare_ad_objects_result_ad_attribute_value.CompareADObjectsResultADAttributeValue.from_dictionary(dictionary.get('sameValue')) if dictionary.get('sameValue') else None
-        source_value = cohesity_management_sdk.models.compare_ad_objects_result_ad_attribute_value.CompareADObjectsResultADAttributeValue.from_dictionary(dictionary.get('sourceValue')) if dictionary.get('sourceValue') else None
-        status = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('status')) if dictionary.get('status') else None
-
-        # Return an object of this model
-        return cls(attr_flags,
-                   dest_value,
-                   ldap_name,
-                   same_value,
-                   source_value,
-                   status)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CompareADObjectsResultADAttributeValue(object):
 
@@ -25,6 +26,9 @@ class CompareADObjectsResultADAttributeValue(object):
         "value_vec":'valueVec'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  value_flags=None,
                  value_vec=None):
@@ -49,15 +53,6 @@ class CompareADObjectsResultADAttributeValue(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        value_flags = dictionary.get('valueFlags')
-        value_vec = dictionary.get('valueVec')
-
-        # Return an object of this model
-        return cls(value_flags,
-                   value_vec)
+        return decode_model(cls, dictionary)
 
 
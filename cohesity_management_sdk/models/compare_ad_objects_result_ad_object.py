@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.compare_ad_objects_result_ad_attribute
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CompareADObjectsResultADObject(object):
 
@@ -52,6 +51,16 @@ class CompareADObjectsResultADObject(object):
         "status":'status'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "attribute_vec":['compare_ad_objects_result_ad_attribute.CompareADObjectsResultADAttribute'],
+        "status":'error_proto.ErrorProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  attribute_vec=None,
                  dest_guid=None,
@@ -90,33 +99,6 @@ class CompareADObjectsResultADObject(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        attribute_vec = None
-        if dictionary.get('attributeVec') != None:
-            attribute_vec = list()
-            for structure in dictionary.get('attributeVec'):
-                attribute_vec.append(cohesity_management_sdk.models.compare_ad_objects_result_ad_attribute.CompareADObjectsResultADAttribute.from_dictionary(structure))
-        dest_guid = dictionary.get('destGuid')
-        dest_prop_count = dictionary.get('destPropCount')
-        excluded_prop_count = dictionary.get('excludedPropCount')
-        mismatch_prop_count = dictionary.get('mismatchPropCount')
-        object_flags = dictionary.get('objectFlags')
-        source_guid = dictionary.get('sourceGuid')
-        source_prop_count = dictionary.get('sourcePropCount')
-        status = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('status')) if dictionary.get('status') else None
-
-        # Return an object of this model
-        return cls(attribute_vec,
-                   dest_guid,
-                   dest_prop_count,
-                   excluded_prop_count,
-                   mismatch_prop_count,
-                   object_flags,
-                   source_guid,
-                   source_prop_count,
-                   status)
+        return decode_model(cls, dictionary)
 
 
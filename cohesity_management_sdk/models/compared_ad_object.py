@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_attribute
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ComparedADObject(object):
 
@@ -53,6 +53,15 @@ class ComparedADObject(object):
         "source_guid":'sourceGuid'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ad_attributes":['ad_attribute.AdAttribute']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_attributes=None,
                  ad_object_flags=None,
@@ -85,27 +94,6 @@ class ComparedADObject(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_attributes = None
-        if dictionary.get('adAttributes') != None:
-            ad_attributes = list()
-            for structure in dictionary.get('adAttributes'):
-                ad_attributes.append(cohesity_management_sdk.models.ad_attribute.AdAttribute.from_dictionary(structure))
-        ad_object_flags = dictionary.get('adObjectFlags')
-        destination_guid = dictionary.get('destinationGuid')
-        error_message = dictionary.get('errorMessage')
-        mismatch_attr_count = dictionary.get('mismatchAttrCount')
-        source_guid = dictionary.get('sourceGuid')
-
-        # Return an object of this model
-        return cls(ad_attributes,
-                   ad_object_flags,
-                   destination_guid,
-                   error_message,
-                   mismatch_attr_count,
-                   source_guid)
+        return decode_model(cls, dictionary)
 
 
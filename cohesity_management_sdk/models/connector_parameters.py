@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ConnectorParameters(object):
 
@@ -66,6 +67,9 @@ class ConnectorParameters(object):
         "version":'version'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  endpoint=None,
                  environment=None,
@@ -94,19 +98,6 @@ class ConnectorParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        endpoint = dictionary.get('endpoint')
-        environment = dictionary.get('environment')
-        id = dictionary.get('id')
-        version = dictionary.get('version')
-
-        # Return an object of this model
-        return cls(endpoint,
-                   environment,
-                   id,
-                   version)
+        return decode_model(cls, dictionary)
 
 
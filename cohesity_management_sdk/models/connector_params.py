@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.credentials
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ConnectorParams(object):
 
@@ -57,6 +56,16 @@ class ConnectorParams(object):
         "version":'version'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "credentials":'credentials.Credentials',
+        "entity":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  agent_endpoint=None,
                  agent_port=None,
@@ -99,33 +108,6 @@ class ConnectorParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        agent_endpoint = dictionary.get('agentEndpoint')
-        agent_port = dictionary.get('agentPort')
-        credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('credentials')) if dictionary.get('credentials') else None
-        endpoint = dictionary.get('endpoint')
-        entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('entity')) if dictionary.get('entity') else None
-        host_type = dictionary.get('hostType')
-        id = dictionary.get('id')
-        port = dictionary.get('port')
-        tenant_id = dictionary.get('tenantId')
-        mtype = dictionary.get('type')
-        version = dictionary.get('version')
-
-        # Return an object of this model
-        return cls(agent_endpoint,
-                   agent_port,
-                   credentials,
-                   endpoint,
-                   entity,
-                   host_type,
-                   id,
-                   port,
-                   tenant_id,
-                   mtype,
-                   version)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Consumer(object):
 
@@ -29,6 +30,9 @@ class Consumer(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  id=None,
                  name=None,
@@ -55,17 +59,6 @@ class Consumer(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(id,
-                   name,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.stats_group
-import cohesity_management_sdk.models.usage_schema_info
-import cohesity_management_sdk.models.data_usage_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ConsumerStats(object):
 
@@ -47,6 +45,17 @@ class ConsumerStats(object):
         "stats":'stats'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "group_list":['stats_group.StatsGroup'],
+        "schema_info_list":['usage_schema_info.UsageSchemaInfo'],
+        "stats":'data_usage_stats.DataUsageStats'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  consumer_type=None,
                  group_list=None,
@@ -81,33 +90,6 @@ class ConsumerStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        consumer_type = dictionary.get('consumerType')
-        group_list = None
-        if dictionary.get('groupList') != None:
-            group_list = list()
-            for structure in dictionary.get('groupList'):
-                group_list.append(cohesity_management_sdk.models.stats_group.StatsGroup.from_dictionary(structure))
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        quota_hard_limit_bytes = dictionary.get('quotaHardLimitBytes')
-        schema_info_list = None
-        if dictionary.get('schemaInfoList') != None:
-            schema_info_list = list()
-            for structure in dictionary.get('schemaInfoList'):
-                schema_info_list.append(cohesity_management_sdk.models.usage_schema_info.UsageSchemaInfo.from_dictionary(structure))
-        stats = cohesity_management_sdk.models.data_usage_stats.DataUsageStats.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-
-        # Return an object of this model
-        return cls(consumer_type,
-                   group_list,
-                   id,
-                   name,
-                   quota_hard_limit_bytes,
-                   schema_info_list,
-                   stats)
+        return decode_model(cls, dictionary)
 
 
@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.copy_snapshot_task_status
-import cohesity_management_sdk.models.legal_holdings
-import cohesity_management_sdk.models.copy_run_stats
-import cohesity_management_sdk.models.snapshot_target_settings
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CopyRun(object):
 
@@ -70,6 +66,19 @@ class CopyRun(object):
         "user_action_message":'userActionMessage'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "copy_snapshot_tasks":['copy_snapshot_task_status.CopySnapshotTaskStatus'],
+        "legal_holdings":['legal_holdings.LegalHoldings'],
+        "stats":'copy_run_stats.CopyRunStats',
+        "target":'snapshot_target_settings.SnapshotTargetSettings',
+        "task_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  copy_snapshot_tasks=None,
                  error=None,
@@ -112,41 +121,6 @@ class CopyRun(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        copy_snapshot_tasks = None
-        if dictionary.get('copySnapshotTasks') != None:
-            copy_snapshot_tasks = list()
-            for structure in dictionary.get('copySnapshotTasks'):
-                copy_snapshot_tasks.append(cohesity_management_sdk.models.copy_snapshot_task_status.CopySnapshotTaskStatus.from_dictionary(structure))
-        error = dictionary.get('error')
-        expiry_time_usecs = dictionary.get('expiryTimeUsecs')
-        hold_for_legal_purpose = dictionary.get('holdForLegalPurpose')
-        legal_holdings = None
-        if dictionary.get('legalHoldings') != None:
-            legal_holdings = list()
-            for structure in dictionary.get('legalHoldings'):
-                legal_holdings.append(cohesity_management_sdk.models.legal_holdings.LegalHoldings.from_dictionary(structure))
-        run_start_time_usecs = dictionary.get('runStartTimeUsecs')
-        stats = cohesity_management_sdk.models.copy_run_stats.CopyRunStats.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-        status = dictionary.get('status')
-        target = cohesity_management_sdk.models.snapshot_target_settings.SnapshotTargetSettings.from_dictionary(dictionary.get('target')) if dictionary.get('target') else None
-        task_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('taskUid')) if dictionary.get('taskUid') else None
-        user_action_message = dictionary.get('userActionMessage')
-
-        # Return an object of this model
-        return cls(copy_snapshot_tasks,
-                   error,
-                   expiry_time_usecs,
-                   hold_for_legal_purpose,
-                   legal_holdings,
-                   run_start_time_usecs,
-                   stats,
-                   status,
-                   target,
-                   task_uid,
-                   user_action_message)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CopyRunStats(object):
 
@@ -40,6 +41,9 @@ class CopyRunStats(object):
         "start_time_usecs":'startTimeUsecs'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  end_time_usecs=None,
                  is_incremental=None,
@@ -74,25 +78,6 @@ class CopyRunStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        is_incremental = dictionary.get('isIncremental')
-        logical_bytes_transferred = dictionary.get('logicalBytesTransferred')
-        logical_size_bytes = dictionary.get('logicalSizeBytes')
-        logical_transfer_rate_bps = dictionary.get('logicalTransferRateBps')
-        physical_bytes_transferred = dictionary.get('physicalBytesTransferred')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-
-        # Return an object of this model
-        return cls(end_time_usecs,
-                   is_incremental,
-                   logical_bytes_transferred,
-                   logical_size_bytes,
-                   logical_transfer_rate_bps,
-                   physical_bytes_transferred,
-                   start_time_usecs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_source
-import cohesity_management_sdk.models.copy_run_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CopySnapshotTaskStatus(object):
 
@@ -48,6 +47,16 @@ class CopySnapshotTaskStatus(object):
         "task_start_time_usecs":'taskStartTimeUsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "source":'protection_source.ProtectionSource',
+        "stats":'copy_run_stats.CopyRunStats'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error=None,
                  source=None,
@@ -80,23 +89,6 @@ class CopySnapshotTaskStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error = dictionary.get('error')
-        source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('source')) if dictionary.get('source') else None
-        stats = cohesity_management_sdk.models.copy_run_stats.CopyRunStats.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-        status = dictionary.get('status')
-        task_end_time_usecs = dictionary.get('taskEndTimeUsecs')
-        task_start_time_usecs = dictionary.get('taskStartTimeUsecs')
-
-        # Return an object of this model
-        return cls(error,
-                   source,
-                   stats,
-                   status,
-                   task_end_time_usecs,
-                   task_start_time_usecs)
+        return decode_model(cls, dictionary)
 
 
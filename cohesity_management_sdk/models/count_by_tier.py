@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CountByTier(object):
 
@@ -26,6 +27,9 @@ class CountByTier(object):
         "storage_tier":'storageTier'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disk_count=None,
                  storage_tier=None):
@@ -50,15 +54,6 @@ class CountByTier(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disk_count = dictionary.get('diskCount')
-        storage_tier = dictionary.get('storageTier')
-
-        # Return an object of this model
-        return cls(disk_count,
-                   storage_tier)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CreateBondParameters(object):
 
@@ -27,6 +28,9 @@ class CreateBondParameters(object):
         "bonding_mode":'bondingMode'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  slaves=None,
@@ -53,17 +57,6 @@ class CreateBondParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        slaves = dictionary.get('slaves')
-        bonding_mode = dictionary.get('bondingMode')
-
-        # Return an object of this model
-        return cls(name,
-                   slaves,
-                   bonding_mode)
+        return decode_model(cls, dictionary)
 
 
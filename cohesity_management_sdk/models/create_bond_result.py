@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CreateBondResult(object):
 
@@ -19,6 +20,9 @@ class CreateBondResult(object):
         "message":'message'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  message=None):
         """Constructor for the CreateBondResult class"""
@@ -41,13 +45,6 @@ class CreateBondResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        message = dictionary.get('message')
-
-        # Return an object of this model
-        return cls(message)
+        return decode_model(cls, dictionary)
 
 
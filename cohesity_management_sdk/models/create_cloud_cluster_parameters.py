@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.encryption_configuration
-import cohesity_management_sdk.models.cloud_network_configuration
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CreateCloudClusterParameters(object):
 
@@ -34,6 +33,16 @@ class CreateCloudClusterParameters(object):
         "metadata_fault_tolerance":'metadataFaultTolerance'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "network_config":'cloud_network_configuration.CloudNetworkConfiguration',
+        "encryption_config":'encryption_configuration.EncryptionConfiguration'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_name=None,
                  network_config=None,
@@ -64,21 +73,6 @@ class CreateCloudClusterParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_name = dictionary.get('clusterName')
-        network_config = cohesity_management_sdk.models.cloud_network_configuration.CloudNetworkConfiguration.from_dictionary(dictionary.get('networkConfig')) if dictionary.get('networkConfig') else None
-        node_ips = dictionary.get('nodeIps')
-        encryption_config = cohesity_management_sdk.models.encryption_configuration.EncryptionConfiguration.from_dictionary(dictionary.get('encryptionConfig')) if dictionary.get('encryptionConfig') else None
-        metadata_fault_tolerance = dictionary.get('metadataFaultTolerance')
-
-        # Return an object of this model
-        return cls(cluster_name,
-                   network_config,
-                   node_ips,
-                   encryption_config,
-                   metadata_fault_tolerance)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.node_status
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CreateClusterResult(object):
 
@@ -40,6 +40,16 @@ class CreateClusterResult(object):
         "unhealthy_nodes":'unhealthyNodes'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "healthy_nodes":['node_status.NodeStatus'],
+        "unhealthy_nodes":['node_status.NodeStatus']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_id=None,
                  cluster_name=None,
@@ -74,33 +84,6 @@ class CreateClusterResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_id = dictionary.get('clusterId')
-        cluster_name = dictionary.get('clusterName')
-        cluster_sw_version = dictionary.get('clusterSwVersion')
-        healthy_nodes = None
-        if dictionary.get('healthyNodes') != None:
-            healthy_nodes = list()
-            for structure in dictionary.get('healthyNodes'):
-                healthy_nodes.append(cohesity_management_sdk.models.node_status.NodeStatus.from_dictionary(structure))
-        incarnation_id = dictionary.get('incarnationId')
-        message = dictionary.get('message')
-        unhealthy_nodes = None
-        if dictionary.get('unhealthyNodes') != None:
-            unhealthy_nodes = list()
-            for structure in dictionary.get('unhealthyNodes'):
-                unhealthy_nodes.append(cohesity_management_sdk.models.node_status.NodeStatus.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(cluster_id,
-                   cluster_name,
-                   cluster_sw_version,
-                   healthy_nodes,
-                   incarnation_id,
-                   message,
-                   unhealthy_nodes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.encryption_configuration
-import cohesity_management_sdk.models.ipmi_configuration
-import cohesity_management_sdk.models.network_configuration
-import cohesity_management_sdk.models.physical_node_configuration
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CreatePhysicalClusterParameters(object):
 
@@ -38,6 +35,18 @@ class CreatePhysicalClusterParameters(object):
         "metadata_fault_tolerance":'metadataFaultTolerance'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ipmi_config":'ipmi_configuration.IpmiConfiguration',
+        "network_config":'network_configuration.NetworkConfiguration',
+        "node_configs":['physical_node_configuration.PhysicalNodeConfiguration'],
+        "encryption_config":'encryption_configuration.EncryptionConfiguration'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_name=None,
                  ipmi_config=None,
@@ -70,27 +79,6 @@ class CreatePhysicalClusterParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_name = dictionary.get('clusterName')
-        ipmi_config = cohesity_management_sdk.models.ipmi_configuration.IpmiConfiguration.from_dictionary(dictionary.get('ipmiConfig')) if dictionary.get('ipmiConfig') else None
-        network_config = cohesity_management_sdk.models.network_configuration.NetworkConfiguration.from_dictionary(dictionary.get('networkConfig')) if dictionary.get('networkConfig') else None
-        node_configs = None
-        if dictionary.get('nodeConfigs') != None:
-            node_configs = list()
-            for structure in dictionary.get('nodeConfigs'):
-                node_configs.append(cohesity_management_sdk.models.physical_node_configuration.PhysicalNodeConfiguration.from_dictionary(structure))
-        encryption_config = cohesity_management_sdk.models.encryption_configuration.EncryptionConfiguration.from_dictionary(dictionary.get('encryptionConfig')) if dictionary.get('encryptionConfig') else None
-        metadata_fault_tolerance = dictionary.get('metadataFaultTolerance')
-
-        # Return an object of this model
-        return cls(cluster_name,
-                   ipmi_config,
-                   network_config,
-                   node_configs,
-                   encryption_config,
-                   metadata_fault_tolerance)
+        return decode_model(cls, dictionary)
 
 
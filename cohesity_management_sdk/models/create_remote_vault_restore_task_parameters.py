@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.index_and_snapshots
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CreateRemoteVaultRestoreTaskParameters(object):
 
@@ -53,6 +52,16 @@ class CreateRemoteVaultRestoreTaskParameters(object):
         "restore_objects":'restoreObjects'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "search_job_uid":'universal_id.UniversalId',
+        "restore_objects":['index_and_snapshots.IndexAndSnapshots']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  search_job_uid=None,
                  task_name=None,
@@ -83,25 +92,6 @@ class CreateRemoteVaultRestoreTaskParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        search_job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('searchJobUid')) if dictionary.get('searchJobUid') else None
-        task_name = dictionary.get('taskName')
-        vault_id = dictionary.get('vaultId')
-        glacier_retrieval_type = dictionary.get('glacierRetrievalType')
-        restore_objects = None
-        if dictionary.get('restoreObjects') != None:
-            restore_objects = list()
-            for structure in dictionary.get('restoreObjects'):
-                restore_objects.append(cohesity_management_sdk.models.index_and_snapshots.IndexAndSnapshots.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(search_job_uid,
-                   task_name,
-                   vault_id,
-                   glacier_retrieval_type,
-                   restore_objects)
+        return decode_model(cls, dictionary)
 
 
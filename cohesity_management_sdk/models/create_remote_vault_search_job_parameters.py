@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.vault_encryption_key
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CreateRemoteVaultSearchJobParameters(object):
 
@@ -53,6 +53,15 @@ class CreateRemoteVaultSearchJobParameters(object):
         "start_time_usecs":'startTimeUsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "encryption_keys":['vault_encryption_key.VaultEncryptionKey']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  search_job_name=None,
                  vault_id=None,
@@ -87,29 +96,6 @@ class CreateRemoteVaultSearchJobParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        search_job_name = dictionary.get('searchJobName')
-        vault_id = dictionary.get('vaultId')
-        cluster_match_string = dictionary.get('clusterMatchString')
-        encryption_keys = None
-        if dictionary.get('encryptionKeys') != None:
-            encryption_keys = list()
-            for structure in dictionary.get('encryptionKeys'):
-                encryption_keys.append(cohesity_management_sdk.models.vault_encryption_key.VaultEncryptionKey.from_dictionary(structure))
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        job_match_string = dictionary.get('jobMatchString')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-
-        # Return an object of this model
-        return cls(search_job_name,
-                   vault_id,
-                   cluster_match_string,
-                   encryption_keys,
-                   end_time_usecs,
-                   job_match_string,
-                   start_time_usecs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.subnet
-import cohesity_management_sdk.models.quota_policy
-import cohesity_management_sdk.models.storage_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CreateViewBoxParams(object):
 
@@ -102,6 +100,19 @@ class CreateViewBoxParams(object):
         "tenant_id_vec":'tenantIdVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "client_subnet_white_list":['subnet.Subnet'],
+        "default_user_quota_policy":'quota_policy.QuotaPolicy',
+        "default_view_quota_policy":'quota_policy.QuotaPolicy',
+        "physical_quota":'quota_policy.QuotaPolicy',
+        "storage_policy":'storage_policy.StoragePolicy'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_partition_id=None,
                  name=None,
@@ -148,41 +159,6 @@ class CreateViewBoxParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_partition_id = dictionary.get('clusterPartitionId')
-        name = dictionary.get('name')
-        ad_domain_name = dictionary.get('adDomainName')
-        client_subnet_white_list = None
-        if dictionary.get('clientSubnetWhiteList') != None:
-            client_subnet_white_list = list()
-            for structure in dictionary.get('clientSubnetWhiteList'):
-                client_subnet_white_list.append(cohesity_management_sdk.models.subnet.Subnet.from_dictionary(structure))
-        cloud_down_waterfall_threshold_pct = dictionary.get('cloudDownWaterfallThresholdPct')
-        cloud_down_waterfall_threshold_secs = dictionary.get('cloudDownWaterfallThresholdSecs')
-        default_user_quota_policy = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('defaultUserQuotaPolicy')) if dictionary.get('defaultUserQuotaPolicy') else None
-        default_view_quota_policy = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('defaultViewQuotaPolicy')) if dictionary.get('defaultViewQuotaPolicy') else None
-        ldap_provider_id = dictionary.get('ldapProviderId')
-        physical_quota = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('physicalQuota')) if dictionary.get('physicalQuota') else None
-        s_3_buckets_allowed = dictionary.get('s3BucketsAllowed')
-        storage_policy = cohesity_management_sdk.models.storage_policy.StoragePolicy.from_dictionary(dictionary.get('storagePolicy')) if dictionary.get('storagePolicy') else None
-        tenant_id_vec = dictionary.get('tenantIdVec')
-
-        # Return an object of this model
-        return cls(cluster_partition_id,
-                   name,
-                   ad_domain_name,
-                   client_subnet_white_list,
-                   cloud_down_waterfall_threshold_pct,
-                   cloud_down_waterfall_threshold_secs,
-                   default_user_quota_policy,
-                   default_view_quota_policy,
-                   ldap_provider_id,
-                   physical_quota,
-                   s_3_buckets_allowed,
-                   storage_policy,
-                   tenant_id_vec)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.encryption_configuration
-import cohesity_management_sdk.models.network_configuration
-import cohesity_management_sdk.models.virtual_node_configuration
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CreateVirtualClusterParameters(object):
 
@@ -34,6 +32,17 @@ class CreateVirtualClusterParameters(object):
         "metadata_fault_tolerance":'metadataFaultTolerance'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "network_config":'network_configuration.NetworkConfiguration',
+        "node_configs":['virtual_node_configuration.VirtualNodeConfiguration'],
+        "encryption_config":'encryption_configuration.EncryptionConfiguration'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_name=None,
                  network_config=None,
@@ -64,25 +73,6 @@ class CreateVirtualClusterParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_name = dictionary.get('clusterName')
-        network_config = cohesity_management_sdk.models.network_configuration.NetworkConfiguration.from_dictionary(dictionary.get('networkConfig')) if dictionary.get('networkConfig') else None
-        node_configs = None
-        if dictionary.get('nodeConfigs') != None:
-            node_configs = list()
-            for structure in dictionary.get('nodeConfigs'):
-                node_configs.append(cohesity_management_sdk.models.virtual_node_configuration.VirtualNodeConfiguration.from_dictionary(structure))
-        encryption_config = cohesity_management_sdk.models.encryption_configuration.EncryptionConfiguration.from_dictionary(dictionary.get('encryptionConfig')) if dictionary.get('encryptionConfig') else None
-        metadata_fault_tolerance = dictionary.get('metadataFaultTolerance')
-
-        # Return an object of this model
-        return cls(cluster_name,
-                   network_config,
-                   node_configs,
-                   encryption_config,
-                   metadata_fault_tolerance)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Credentials(object):
 
@@ -21,6 +22,9 @@ class Credentials(object):
         "username":'username'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  password=None,
                  username=None):
@@ -45,15 +49,6 @@ class Credentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        password = dictionary.get('password')
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(password,
-                   username)
+        return decode_model(cls, dictionary)
 
 
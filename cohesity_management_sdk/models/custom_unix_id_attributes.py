@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class CustomUnixIdAttributes(object):
 
@@ -24,6 +25,9 @@ class CustomUnixIdAttributes(object):
         "uid_attr_name":'uidAttrName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  gid_attr_name=None,
                  uid_attr_name=None):
@@ -48,15 +52,6 @@ class CustomUnixIdAttributes(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        gid_attr_name = dictionary.get('gidAttrName')
-        uid_attr_name = dictionary.get('uidAttrName')
-
-        # Return an object of this model
-        return cls(gid_attr_name,
-                   uid_attr_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DailySchedule(object):
 
@@ -21,6 +22,9 @@ class DailySchedule(object):
         "days":'days'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  days=None):
         """Constructor for the DailySchedule class"""
@@ -43,13 +47,6 @@ class DailySchedule(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        days = dictionary.get('days')
-
-        # Return an object of this model
-        return cls(days)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.file_path_filter
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DataMigrationJobParameters(object):
 
@@ -63,6 +63,15 @@ class DataMigrationJobParameters(object):
         "target_view_name":'targetViewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "file_path_filter":'file_path_filter.FilePathFilter'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cold_file_window=None,
                  file_path_filter=None,
@@ -97,25 +106,6 @@ class DataMigrationJobParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cold_file_window = dictionary.get('coldFileWindow')
-        file_path_filter = cohesity_management_sdk.models.file_path_filter.FilePathFilter.from_dictionary(dictionary.get('filePathFilter')) if dictionary.get('filePathFilter') else None
-        file_selection_policy = dictionary.get('fileSelectionPolicy')
-        file_size_bytes = dictionary.get('fileSizeBytes')
-        file_size_policy = dictionary.get('fileSizePolicy')
-        nfs_mount_path = dictionary.get('nfsMountPath')
-        target_view_name = dictionary.get('targetViewName')
-
-        # Return an object of this model
-        return cls(cold_file_window,
-                   file_path_filter,
-                   file_selection_policy,
-                   file_size_bytes,
-                   file_size_policy,
-                   nfs_mount_path,
-                   target_view_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.scheduling_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DataMigrationPolicy(object):
 
@@ -34,6 +34,15 @@ class DataMigrationPolicy(object):
         "worm_retention_type":'wormRetentionType'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "scheduling_policy":'scheduling_policy.SchedulingPolicy'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  days_to_keep=None,
                  scheduling_policy=None,
@@ -60,17 +69,6 @@ class DataMigrationPolicy(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        days_to_keep = dictionary.get('daysToKeep')
-        scheduling_policy = cohesity_management_sdk.models.scheduling_policy.SchedulingPolicy.from_dictionary(dictionary.get('schedulingPolicy')) if dictionary.get('schedulingPolicy') else None
-        worm_retention_type = dictionary.get('wormRetentionType')
-
-        # Return an object of this model
-        return cls(days_to_keep,
-                   scheduling_policy,
-                   worm_retention_type)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DataTransferFromVaultPerTask(object):
 
@@ -31,6 +32,9 @@ class DataTransferFromVaultPerTask(object):
         "task_type":'taskType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  num_logical_bytes_transferred=None,
                  num_physical_bytes_transferred=None,
@@ -59,19 +63,6 @@ class DataTransferFromVaultPerTask(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        num_logical_bytes_transferred = dictionary.get('numLogicalBytesTransferred')
-        num_physical_bytes_transferred = dictionary.get('numPhysicalBytesTransferred')
-        task_name = dictionary.get('taskName')
-        task_type = dictionary.get('taskType')
-
-        # Return an object of this model
-        return cls(num_logical_bytes_transferred,
-                   num_physical_bytes_transferred,
-                   task_name,
-                   task_type)
+        return decode_model(cls, dictionary)
 
 
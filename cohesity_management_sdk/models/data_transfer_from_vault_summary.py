@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.data_transfer_from_vault_per_task
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DataTransferFromVaultSummary(object):
 
@@ -47,6 +47,15 @@ class DataTransferFromVaultSummary(object):
         "vault_name":'vaultName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "data_transfer_per_task":['data_transfer_from_vault_per_task.DataTransferFromVaultPerTask']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data_transfer_per_task=None,
                  num_logical_bytes_transferred=None,
@@ -79,27 +88,6 @@ class DataTransferFromVaultSummary(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data_transfer_per_task = None
-        if dictionary.get('dataTransferPerTask') != None:
-            data_transfer_per_task = list()
-            for structure in dictionary.get('dataTransferPerTask'):
-                data_transfer_per_task.append(cohesity_management_sdk.models.data_transfer_from_vault_per_task.DataTransferFromVaultPerTask.from_dictionary(structure))
-        num_logical_bytes_transferred = dictionary.get('numLogicalBytesTransferred')
-        num_physical_bytes_transferred = dictionary.get('numPhysicalBytesTransferred')
-        num_tasks = dictionary.get('numTasks')
-        physical_data_transferred_bytes_during_time_range = dictionary.get('physicalDataTransferredBytesDuringTimeRange')
-        vault_name = dictionary.get('vaultName')
-
-        # Return an object of this model
-        return cls(data_transfer_per_task,
-                   num_logical_bytes_transferred,
-                   num_physical_bytes_transferred,
-                   num_tasks,
-                   physical_data_transferred_bytes_during_time_range,
-                   vault_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DataUsageStats(object):
 
@@ -76,6 +77,9 @@ class DataUsageStats(object):
         "total_logical_usage_bytes":'totalLogicalUsageBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cloud_data_written_bytes=None,
                  cloud_total_physical_usage_bytes=None,
@@ -124,39 +128,6 @@ class DataUsageStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cloud_data_written_bytes = dictionary.get('cloudDataWrittenBytes')
-        cloud_total_physical_usage_bytes = dictionary.get('cloudTotalPhysicalUsageBytes')
-        data_in_bytes = dictionary.get('dataInBytes')
-        data_in_bytes_after_dedup = dictionary.get('dataInBytesAfterDedup')
-        data_protect_logical_usage_bytes = dictionary.get('dataProtectLogicalUsageBytes')
-        data_protect_physical_usage_bytes = dictionary.get('dataProtectPhysicalUsageBytes')
-        data_written_bytes = dictionary.get('dataWrittenBytes')
-        file_services_logical_usage_bytes = dictionary.get('fileServicesLogicalUsageBytes')
-        file_services_physical_usage_bytes = dictionary.get('fileServicesPhysicalUsageBytes')
-        local_data_written_bytes = dictionary.get('localDataWrittenBytes')
-        local_tier_resiliency_impact_bytes = dictionary.get('localTierResiliencyImpactBytes')
-        local_total_physical_usage_bytes = dictionary.get('localTotalPhysicalUsageBytes')
-        storage_consumed_bytes = dictionary.get('storageConsumedBytes')
-        total_logical_usage_bytes = dictionary.get('totalLogicalUsageBytes')
-
-        # Return an object of this model
-        return cls(cloud_data_written_bytes,
-                   cloud_total_physical_usage_bytes,
-                   data_in_bytes,
-                   data_in_bytes_after_dedup,
-                   data_protect_logical_usage_bytes,
-                   data_protect_physical_usage_bytes,
-                   data_written_bytes,
-                   file_services_logical_usage_bytes,
-                   file_services_physical_usage_bytes,
-                   local_data_written_bytes,
-                   local_tier_resiliency_impact_bytes,
-                   local_total_physical_usage_bytes,
-                   storage_consumed_bytes,
-                   total_logical_usage_bytes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DatastoreInfo(object):
 
@@ -21,6 +22,9 @@ class DatastoreInfo(object):
         "free_space":'freeSpace'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  capacity=None,
                  free_space=None):
@@ -45,15 +49,6 @@ class DatastoreInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        capacity = dictionary.get('capacity')
-        free_space = dictionary.get('freeSpace')
-
-        # Return an object of this model
-        return cls(capacity,
-                   free_space)
+        return decode_model(cls, dictionary)
 
 
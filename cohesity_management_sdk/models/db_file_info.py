@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DbFileInfo(object):
 
@@ -30,6 +31,9 @@ class DbFileInfo(object):
         "size_bytes":'sizeBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  file_type=None,
                  full_path=None,
@@ -56,17 +60,6 @@ class DbFileInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        file_type = dictionary.get('fileType')
-        full_path = dictionary.get('fullPath')
-        size_bytes = dictionary.get('sizeBytes')
-
-        # Return an object of this model
-        return cls(file_type,
-                   full_path,
-                   size_bytes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.infected_file_param
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeleteInfectedFileParams(object):
 
@@ -20,6 +20,15 @@ class DeleteInfectedFileParams(object):
         "infected_file_ids":'infectedFileIds'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "infected_file_ids":['infected_file_param.InfectedFileParam']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  infected_file_ids=None):
         """Constructor for the DeleteInfectedFileParams class"""
@@ -42,17 +51,6 @@ class DeleteInfectedFileParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        infected_file_ids = None
-        if dictionary.get('infectedFileIds') != None:
-            infected_file_ids = list()
-            for structure in dictionary.get('infectedFileIds'):
-                infected_file_ids.append(cohesity_management_sdk.models.infected_file_param.InfectedFileParam.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(infected_file_ids)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.infected_file_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeleteInfectedFileResponse(object):
 
@@ -23,6 +23,16 @@ class DeleteInfectedFileResponse(object):
         "delete_succeeded_infected_files":'deleteSucceededInfectedFiles'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "delete_failed_infected_files":['infected_file_id.InfectedFileId'],
+        "delete_succeeded_infected_files":['infected_file_id.InfectedFileId']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  delete_failed_infected_files=None,
                  delete_succeeded_infected_files=None):
@@ -47,23 +57,6 @@ class DeleteInfectedFileResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        delete_failed_infected_files = None
-        if dictionary.get('deleteFailedInfectedFiles') != None:
-            delete_failed_infected_files = list()
-            for structure in dictionary.get('deleteFailedInfectedFiles'):
-                delete_failed_infected_files.append(cohesity_management_sdk.models.infected_file_id.InfectedFileId.from_dictionary(structure))
-        delete_succeeded_infected_files = None
-        if dictionary.get('deleteSucceededInfectedFiles') != None:
-            delete_succeeded_infected_files = list()
-            for structure in dictionary.get('deleteSucceededInfectedFiles'):
-                delete_succeeded_infected_files.append(cohesity_management_sdk.models.infected_file_id.InfectedFileId.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(delete_failed_infected_files,
-                   delete_succeeded_infected_files)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeleteProtectionJobParam(object):
 
@@ -19,6 +20,9 @@ class DeleteProtectionJobParam(object):
         "delete_snapshots":'deleteSnapshots'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  delete_snapshots=None):
         """Constructor for the DeleteProtectionJobParam class"""
@@ -41,13 +45,6 @@ class DeleteProtectionJobParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        delete_snapshots = dictionary.get('deleteSnapshots')
-
-        # Return an object of this model
-        return cls(delete_snapshots)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeleteRouteParam(object):
 
@@ -26,6 +27,9 @@ class DeleteRouteParam(object):
         "iface_group_name":'ifaceGroupName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  dest_network=None,
                  if_name=None,
@@ -52,17 +56,6 @@ class DeleteRouteParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        dest_network = dictionary.get('destNetwork')
-        if_name = dictionary.get('ifName')
-        iface_group_name = dictionary.get('ifaceGroupName')
-
-        # Return an object of this model
-        return cls(dest_network,
-                   if_name,
-                   iface_group_name)
+        return decode_model(cls, dictionary)
 
 
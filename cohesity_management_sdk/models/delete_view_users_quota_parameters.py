@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.user_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeleteViewUsersQuotaParameters(object):
 
@@ -25,6 +25,15 @@ class DeleteViewUsersQuotaParameters(object):
         "view_name":'viewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "user_ids":['user_id.UserId']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  delete_all=None,
                  user_ids=None,
@@ -51,21 +60,6 @@ class DeleteViewUsersQuotaParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        delete_all = dictionary.get('deleteAll')
-        user_ids = None
-        if dictionary.get('userIds') != None:
-            user_ids = list()
-            for structure in dictionary.get('userIds'):
-                user_ids.append(cohesity_management_sdk.models.user_id.UserId.from_dictionary(structure))
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(delete_all,
-                   user_ids,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
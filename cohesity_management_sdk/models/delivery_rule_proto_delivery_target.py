@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeliveryRuleProtoDeliveryTarget(object):
 
@@ -29,6 +30,9 @@ class DeliveryRuleProtoDeliveryTarget(object):
         "locale":'locale'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  email_address=None,
                  external_api_curl_options=None,
@@ -57,19 +61,6 @@ class DeliveryRuleProtoDeliveryTarget(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        email_address = dictionary.get('emailAddress')
-        external_api_curl_options = dictionary.get('externalApiCurlOptions')
-        external_api_url = dictionary.get('externalApiUrl')
-        locale = dictionary.get('locale')
-
-        # Return an object of this model
-        return cls(email_address,
-                   external_api_curl_options,
-                   external_api_url,
-                   locale)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeployCertParameters(object):
 
@@ -36,6 +37,9 @@ class DeployCertParameters(object):
         "valid_days":'validDays'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cert_file_name=None,
                  password=None,
@@ -68,23 +72,6 @@ class DeployCertParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cert_file_name = dictionary.get('certFileName')
-        password = dictionary.get('password')
-        server_name = dictionary.get('serverName')
-        target = dictionary.get('target')
-        user_name = dictionary.get('userName')
-        valid_days = dictionary.get('validDays')
-
-        # Return an object of this model
-        return cls(cert_file_name,
-                   password,
-                   server_name,
-                   target,
-                   user_name,
-                   valid_days)
+        return decode_model(cls, dictionary)
 
 
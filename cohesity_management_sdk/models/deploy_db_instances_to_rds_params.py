@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.deploy_db_instances_to_rds_params_point_in_time_restore_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeployDBInstancesToRDSParams(object):
 
@@ -53,6 +52,18 @@ class DeployDBInstancesToRDSParams(object):
         "public_accessibility":'publicAccessibility'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "availability_zone":'entity_proto.EntityProto',
+        "db_option_group":'entity_proto.EntityProto',
+        "db_parameter_group":'entity_proto.EntityProto',
+        "point_in_time_params":'deploy_db_instances_to_rds_params_point_in_time_restore_params.DeployDBInstancesToRDSParamsPointInTimeRestoreParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  auto_minor_version_upgrade=None,
                  availability_zone=None,
@@ -95,33 +106,6 @@ class DeployDBInstancesToRDSParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        auto_minor_version_upgrade = dictionary.get('autoMinorVersionUpgrade')
-        availability_zone = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('availabilityZone')) if dictionary.get('availabilityZone') else None
-        copy_tags_to_snapshots = dictionary.get('copyTagsToSnapshots')
-        db_instance_id = dictionary.get('dbInstanceId')
-        db_option_group = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('dbOptionGroup')) if dictionary.get('dbOptionGroup') else None
-        db_parameter_group = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('dbParameterGroup')) if dictionary.get('dbParameterGroup') else None
-        db_port = dictionary.get('dbPort')
-        iam_db_authentication = dictionary.get('iamDbAuthentication')
-        multi_az_deployment = dictionary.get('multiAzDeployment')
-        point_in_time_params = cohesity_management_sdk.models.deploy_db_instances_to_rds_params_point_in_time_restore_params.DeployDBInstancesToRDSParamsPointInTimeRestoreParams.from_dictionary(dictionary.get('pointInTimeParams')) if dictionary.get('pointInTimeParams') else None
-        public_accessibility = dictionary.get('publicAccessibility')
-
-        # Return an object of this model
-        return cls(auto_minor_version_upgrade,
-                   availability_zone,
-                   copy_tags_to_snapshots,
-                   db_instance_id,
-                   db_option_group,
-                   db_parameter_group,
-                   db_port,
-                   iam_db_authentication,
-                   multi_az_deployment,
-                   point_in_time_params,
-                   public_accessibility)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeployDBInstancesToRDSParamsPointInTimeRestoreParams(object):
 
@@ -20,6 +21,9 @@ class DeployDBInstancesToRDSParamsPointInTimeRestoreParams(object):
         "timestamp_msecs":'timestampMsecs'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  timestamp_msecs=None):
         """Constructor for the DeployDBInstancesToRDSParamsPointInTimeRestoreParams class"""
@@ -42,13 +46,6 @@ class DeployDBInstancesToRDSParamsPointInTimeRestoreParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        timestamp_msecs = dictionary.get('timestampMsecs')
-
-        # Return an object of this model
-        return cls(timestamp_msecs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_object_details
-import cohesity_management_sdk.models.cloud_deploy_target_details
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeployTaskRequest(object):
 
@@ -35,6 +34,16 @@ class DeployTaskRequest(object):
         "target":'target'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "objects":['restore_object_details.RestoreObjectDetails'],
+        "target":'cloud_deploy_target_details.CloudDeployTargetDetails'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  new_parent_id=None,
@@ -63,23 +72,6 @@ class DeployTaskRequest(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        new_parent_id = dictionary.get('newParentId')
-        objects = None
-        if dictionary.get('objects') != None:
-            objects = list()
-            for structure in dictionary.get('objects'):
-                objects.append(cohesity_management_sdk.models.restore_object_details.RestoreObjectDetails.from_dictionary(structure))
-        target = cohesity_management_sdk.models.cloud_deploy_target_details.CloudDeployTargetDetails.from_dictionary(dictionary.get('target')) if dictionary.get('target') else None
-
-        # Return an object of this model
-        return cls(name,
-                   new_parent_id,
-                   objects,
-                   target)
+        return decode_model(cls, dictionary)
 
 
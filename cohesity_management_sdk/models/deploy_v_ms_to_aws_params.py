@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.deploy_db_instances_to_rds_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeployVMsToAWSParams(object):
 
@@ -41,6 +40,21 @@ class DeployVMsToAWSParams(object):
         "vpc":'vpc'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "instance_type":'entity_proto.EntityProto',
+        "key_pair_name":'entity_proto.EntityProto',
+        "network_security_groups":['entity_proto.EntityProto'],
+        "rds_params":'deploy_db_instances_to_rds_params.DeployDBInstancesToRDSParams',
+        "region":'entity_proto.EntityProto',
+        "subnet":'entity_proto.EntityProto',
+        "vpc":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  instance_type=None,
                  key_pair_name=None,
@@ -75,29 +89,6 @@ class DeployVMsToAWSParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        instance_type = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('instanceType')) if dictionary.get('instanceType') else None
-        key_pair_name = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('keyPairName')) if dictionary.get('keyPairName') else None
-        network_security_groups = None
-        if dictionary.get('networkSecurityGroups') != None:
-            network_security_groups = list()
-            for structure in dictionary.get('networkSecurityGroups'):
-                network_security_groups.append(cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(structure))
-        rds_params = cohesity_management_sdk.models.deploy_db_instances_to_rds_params.DeployDBInstancesToRDSParams.from_dictionary(dictionary.get('rdsParams')) if dictionary.get('rdsParams') else None
-        region = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('region')) if dictionary.get('region') else None
-        subnet = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('subnet')) if dictionary.get('subnet') else None
-        vpc = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('vpc')) if dictionary.get('vpc') else None
-
-        # Return an object of this model
-        return cls(instance_type,
-                   key_pair_name,
-                   network_security_groups,
-                   rds_params,
-                   region,
-                   subnet,
-                   vpc)
+        return decode_model(cls, dictionary)
 
 
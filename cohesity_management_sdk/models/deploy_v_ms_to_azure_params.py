@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.azure_managed_disk_params
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeployVMsToAzureParams(object):
 
@@ -67,6 +66,30 @@ class DeployVMsToAzureParams(object):
         "virtual_network":'virtualNetwork'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "azure_managed_disk_params":'azure_managed_disk_params.AzureManagedDiskParams',
+        "compute_options":'entity_proto.EntityProto',
+        "network_resource_group":'entity_proto.EntityProto',
+        "network_security_group":'entity_proto.EntityProto',
+        "resource_group":'entity_proto.EntityProto',
+        "storage_account":'entity_proto.EntityProto',
+        "storage_container":'entity_proto.EntityProto',
+        "storage_key":'entity_proto.EntityProto',
+        "storage_resource_group":'entity_proto.EntityProto',
+        "subnet":'entity_proto.EntityProto',
+        "temp_vm_resource_group":'entity_proto.EntityProto',
+        "temp_vm_storage_account":'entity_proto.EntityProto',
+        "temp_vm_storage_container":'entity_proto.EntityProto',
+        "temp_vm_subnet":'entity_proto.EntityProto',
+        "temp_vm_virtual_network":'entity_proto.EntityProto',
+        "virtual_network":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  azure_managed_disk_params=None,
                  compute_options=None,
@@ -119,43 +142,6 @@ class DeployVMsToAzureParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        azure_managed_disk_params = cohesity_management_sdk.models.azure_managed_disk_params.AzureManagedDiskParams.from_dictionary(dictionary.get('azureManagedDiskParams')) if dictionary.get('azureManagedDiskParams') else None
-        compute_options = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('computeOptions')) if dictionary.get('computeOptions') else None
-        network_resource_group = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('networkResourceGroup')) if dictionary.get('networkResourceGroup') else None
-        network_security_group = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('networkSecurityGroup')) if dictionary.get('networkSecurityGroup') else None
-        resource_group = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('resourceGroup')) if dictionary.get('resourceGroup') else None
-        storage_account = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('storageAccount')) if dictionary.get('storageAccount') else None
-        storage_container = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('storageContainer')) if dictionary.get('storageContainer') else None
-        storage_key = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('storageKey')) if dictionary.get('storageKey') else None
-        storage_resource_group = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('storageResourceGroup')) if dictionary.get('storageResourceGroup') else None
-        subnet = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('subnet')) if dictionary.get('subnet') else None
-        temp_vm_resource_group = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('tempVmResourceGroup')) if dictionary.get('tempVmResourceGroup') else None
-        temp_vm_storage_account = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('tempVmStorageAccount')) if dictionary.get('tempVmStorageAccount') else None
-        temp_vm_storage_container = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('tempVmStorageContainer')) if dictionary.get('tempVmStorageContainer') else None
-        temp_vm_subnet = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('tempVmSubnet')) if dictionary.get('tempVmSubnet') else None
-        temp_vm_virtual_network = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('tempVmVirtualNetwork')) if dictionary.get('tempVmVirtualNetwork') else None
-        virtual_network = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('virtualNetwork')) if dictionary.get('virtualNetwork') else None
-
-        # Return an object of this model
-        return cls(azure_managed_disk_params,
-                   compute_options,
-                   network_resource_group,
-                   network_security_group,
-                   resource_group,
-                   storage_account,
-                   storage_container,
-                   storage_key,
-                   storage_resource_group,
-                   subnet,
-                   temp_vm_resource_group,
-                   temp_vm_storage_account,
-                   temp_vm_storage_container,
-                   temp_vm_subnet,
-                   temp_vm_virtual_network,
-                   virtual_network)
+        return decode_model(cls, dictionary)
 
 
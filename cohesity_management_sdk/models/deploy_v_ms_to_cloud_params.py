@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.deploy_v_ms_to_aws_params
-import cohesity_management_sdk.models.deploy_v_ms_to_azure_params
-import cohesity_management_sdk.models.deploy_v_ms_to_gcp_params
-import cohesity_management_sdk.models.replicate_snapshots_to_aws_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeployVMsToCloudParams(object):
 
@@ -37,6 +34,18 @@ class DeployVMsToCloudParams(object):
         "replicate_snapshots_to_aws_params":'replicateSnapshotsToAwsParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "deploy_vms_to_aws_params":'deploy_v_ms_to_aws_params.DeployVMsToAWSParams',
+        "deploy_vms_to_azure_params":'deploy_v_ms_to_azure_params.DeployVMsToAzureParams',
+        "deploy_vms_to_gcp_params":'deploy_v_ms_to_gcp_params.DeployVMsToGCPParams',
+        "replicate_snapshots_to_aws_params":'replicate_snapshots_to_aws_params.ReplicateSnapshotsToAWSParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  deploy_vms_to_aws_params=None,
                  deploy_vms_to_azure_params=None,
@@ -65,19 +74,6 @@ class DeployVMsToCloudParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        deploy_vms_to_aws_params = cohesity_management_sdk.models.deploy_v_ms_to_aws_params.DeployVMsToAWSParams.from_dictionary(dictionary.get('deployVmsToAwsParams')) if dictionary.get('deployVmsToAwsParams') else None
-        deploy_vms_to_azure_params = cohesity_management_sdk.models.deploy_v_ms_to_azure_params.DeployVMsToAzureParams.from_dictionary(dictionary.get('deployVmsToAzureParams')) if dictionary.get('deployVmsToAzureParams') else None
-        deploy_vms_to_gcp_params = cohesity_management_sdk.models.deploy_v_ms_to_gcp_params.DeployVMsToGCPParams.from_dictionary(dictionary.get('deployVmsToGcpParams')) if dictionary.get('deployVmsToGcpParams') else None
-        replicate_snapshots_to_aws_params = cohesity_management_sdk.models.replicate_snapshots_to_aws_params.ReplicateSnapshotsToAWSParams.from_dictionary(dictionary.get('replicateSnapshotsToAwsParams')) if dictionary.get('replicateSnapshotsToAwsParams') else None
-
-        # Return an object of this model
-        return cls(deploy_vms_to_aws_params,
-                   deploy_vms_to_azure_params,
-                   deploy_vms_to_gcp_params,
-                   replicate_snapshots_to_aws_params)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.deploy_v_ms_to_cloud_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeployVMsToCloudTaskStateProto(object):
 
@@ -21,6 +21,15 @@ class DeployVMsToCloudTaskStateProto(object):
         "deploy_vms_to_cloud_params":'deployVmsToCloudParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "deploy_vms_to_cloud_params":'deploy_v_ms_to_cloud_params.DeployVMsToCloudParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  deploy_vms_to_cloud_params=None):
         """Constructor for the DeployVMsToCloudTaskStateProto class"""
@@ -43,13 +52,6 @@ class DeployVMsToCloudTaskStateProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        deploy_vms_to_cloud_params = cohesity_management_sdk.models.deploy_v_ms_to_cloud_params.DeployVMsToCloudParams.from_dictionary(dictionary.get('deployVmsToCloudParams')) if dictionary.get('deployVmsToCloudParams') else None
-
-        # Return an object of this model
-        return cls(deploy_vms_to_cloud_params)
+        return decode_model(cls, dictionary)
 
 
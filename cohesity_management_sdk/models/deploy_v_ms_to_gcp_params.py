@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeployVMsToGCPParams(object):
 
@@ -30,6 +30,18 @@ class DeployVMsToGCPParams(object):
         "zone":'zone'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "project_id":'entity_proto.EntityProto',
+        "region":'entity_proto.EntityProto',
+        "subnet":'entity_proto.EntityProto',
+        "zone":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  project_id=None,
                  region=None,
@@ -58,19 +70,6 @@ class DeployVMsToGCPParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        project_id = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('projectId')) if dictionary.get('projectId') else None
-        region = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('region')) if dictionary.get('region') else None
-        subnet = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('subnet')) if dictionary.get('subnet') else None
-        zone = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('zone')) if dictionary.get('zone') else None
-
-        # Return an object of this model
-        return cls(project_id,
-                   region,
-                   subnet,
-                   zone)
+        return decode_model(cls, dictionary)
 
 
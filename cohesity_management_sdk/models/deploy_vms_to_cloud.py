@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.aws_params
-import cohesity_management_sdk.models.azure_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeployVmsToCloud(object):
 
@@ -25,6 +24,16 @@ class DeployVmsToCloud(object):
         "azure_params":'azureParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "aws_params":'aws_params.AwsParams',
+        "azure_params":'azure_params.AzureParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  aws_params=None,
                  azure_params=None):
@@ -49,15 +58,6 @@ class DeployVmsToCloud(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        aws_params = cohesity_management_sdk.models.aws_params.AwsParams.from_dictionary(dictionary.get('awsParams')) if dictionary.get('awsParams') else None
-        azure_params = cohesity_management_sdk.models.azure_params.AzureParams.from_dictionary(dictionary.get('azureParams')) if dictionary.get('azureParams') else None
-
-        # Return an object of this model
-        return cls(aws_params,
-                   azure_params)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.error_proto
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.credentials
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DestroyCloneAppTaskInfoProto(object):
 
@@ -49,6 +47,17 @@ class DestroyCloneAppTaskInfoProto(object):
         "target_entity_credentials":'targetEntityCredentials'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "error":'error_proto.ErrorProto',
+        "target_entity":'entity_proto.EntityProto',
+        "target_entity_credentials":'credentials.Credentials'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  app_env=None,
                  error=None,
@@ -79,21 +88,6 @@ class DestroyCloneAppTaskInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        app_env = dictionary.get('appEnv')
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        finished = dictionary.get('finished')
-        target_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetEntity')) if dictionary.get('targetEntity') else None
-        target_entity_credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('targetEntityCredentials')) if dictionary.get('targetEntityCredentials') else None
-
-        # Return an object of this model
-        return cls(app_env,
-                   error,
-                   finished,
-                   target_entity,
-                   target_entity_credentials)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.destroy_cloned_entity_info_proto_cloned_entity
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DestroyClonedEntityInfoProto(object):
 
@@ -47,6 +46,16 @@ class DestroyClonedEntityInfoProto(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cloned_entity":'destroy_cloned_entity_info_proto_cloned_entity.DestroyClonedEntityInfoProtoClonedEntity',
+        "error":'error_proto.ErrorProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cloned_entity=None,
                  cloned_entity_status=None,
@@ -79,23 +88,6 @@ class DestroyClonedEntityInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cloned_entity = cohesity_management_sdk.models.destroy_cloned_entity_info_proto_cloned_entity.DestroyClonedEntityInfoProtoClonedEntity.from_dictionary(dictionary.get('clonedEntity')) if dictionary.get('clonedEntity') else None
-        cloned_entity_status = dictionary.get('clonedEntityStatus')
-        destroy_cloned_entity_state = dictionary.get('destroyClonedEntityState')
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        full_view_name = dictionary.get('fullViewName')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(cloned_entity,
-                   cloned_entity_status,
-                   destroy_cloned_entity_state,
-                   error,
-                   full_view_name,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DestroyClonedEntityInfoProtoClonedEntity(object):
 
@@ -23,6 +23,15 @@ class DestroyClonedEntityInfoProtoClonedEntity(object):
         "relative_restore_path_vec":'relativeRestorePathVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "entity":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  entity=None,
                  relative_restore_path_vec=None):
@@ -47,15 +56,6 @@ class DestroyClonedEntityInfoProtoClonedEntity(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('entity')) if dictionary.get('entity') else None
-        relative_restore_path_vec = dictionary.get('relativeRestorePathVec')
-
-        # Return an object of this model
-        return cls(entity,
-                   relative_restore_path_vec)
+        return decode_model(cls, dictionary)
 
 
@@ -1,14 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.deploy_v_ms_to_cloud_task_state_proto
-import cohesity_management_sdk.models.destroy_clone_app_task_info_proto
-import cohesity_management_sdk.models.destroy_cloned_vm_task_info_proto
-import cohesity_management_sdk.models.destroy_mount_volumes_task_info_proto
-import cohesity_management_sdk.models.error_proto
-import cohesity_management_sdk.models.connector_params
-import cohesity_management_sdk.models.user_information
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DestroyClonedTaskStateProto(object):
 
@@ -119,6 +112,23 @@ class DestroyClonedTaskStateProto(object):
         "view_name_deprecated":'viewName_DEPRECATED'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "datastore_entity":'entity_proto.EntityProto',
+        "deploy_vms_to_cloud_task_state":'deploy_v_ms_to_cloud_task_state_proto.DeployVMsToCloudTaskStateProto',
+        "destroy_clone_app_task_info":'destroy_clone_app_task_info_proto.DestroyCloneAppTaskInfoProto',
+        "destroy_clone_vm_task_info":'destroy_cloned_vm_task_info_proto.DestroyClonedVMTaskInfoProto',
+        "destroy_mount_volumes_task_info":'destroy_mount_volumes_task_info_proto.DestroyMountVolumesTaskInfoProto',
+        "error":'error_proto.ErrorProto',
+        "folder_entity":'entity_proto.EntityProto',
+        "parent_source_connection_params":'connector_params.ConnectorParams',
+        "user_info":'user_information.UserInformation'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  clone_task_name=None,
                  datastore_entity=None,
@@ -187,59 +197,6 @@ class DestroyClonedTaskStateProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        clone_task_name = dictionary.get('cloneTaskName')
-        datastore_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('datastoreEntity')) if dictionary.get('datastoreEntity') else None
-        deploy_vms_to_cloud_task_state = cohesity_management_sdk.models.deploy_v_ms_to_cloud_task_state_proto.DeployVMsToCloudTaskStateProto.from_dictionary(dictionary.get('deployVmsToCloudTaskState')) if dictionary.get('deployVmsToCloudTaskState') else None
-        destroy_clone_app_task_info = cohesity_management_sdk.models.destroy_clone_app_task_info_proto.DestroyCloneAppTaskInfoProto.from_dictionary(dictionary.get('destroyCloneAppTaskInfo')) if dictionary.get('destroyCloneAppTaskInfo') else None
-        destroy_clone_vm_task_info = cohesity_management_sdk.models.destroy_cloned_vm_task_info_proto.DestroyClonedVMTaskInfoProto.from_dictionary(dictionary.get('destroyCloneVmTaskInfo')) if dictionary.get('destroyCloneVmTaskInfo') else None
-        destroy_mount_volumes_task_info = cohesity_management_sdk.models.destroy_mount_volumes_task_info_proto.DestroyMountVolumesTaskInfoProto.from_dictionary(dictionary.get('destroyMountVolumesTaskInfo')) if dictionary.get('destroyMountVolumesTaskInfo') else None
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        folder_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('folderEntity')) if dictionary.get('folderEntity') else None
-        full_view_name = dictionary.get('fullViewName')
-        parent_source_connection_params = cohesity_management_sdk.models.connector_params.ConnectorParams.from_dictionary(dictionary.get('parentSourceConnectionParams')) if dictionary.get('parentSourceConnectionParams') else None
-        parent_task_id = dictionary.get('parentTaskId')
-        perform_clone_task_id = dictionary.get('performCloneTaskId')
-        restore_type = dictionary.get('restoreType')
-        scheduled_constituent_id = dictionary.get('scheduledConstituentId')
-        scheduled_gandalf_session_id = dictionary.get('scheduledGandalfSessionId')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        status = dictionary.get('status')
-        task_id = dictionary.get('taskId')
-        mtype = dictionary.get('type')
-        user = dictionary.get('user')
-        user_info = cohesity_management_sdk.models.user_information.UserInformation.from_dictionary(dictionary.get('userInfo')) if dictionary.get('userInfo') else None
-        view_box_id = dictionary.get('viewBoxId')
-        view_name_deprecated = dictionary.get('viewName_DEPRECATED')
-
-        # Return an object of this model
-        return cls(clone_task_name,
-                   datastore_entity,
-                   deploy_vms_to_cloud_task_state,
-                   destroy_clone_app_task_info,
-                   destroy_clone_vm_task_info,
-                   destroy_mount_volumes_task_info,
-                   end_time_usecs,
-                   error,
-                   folder_entity,
-                   full_view_name,
-                   parent_source_connection_params,
-                   parent_task_id,
-                   perform_clone_task_id,
-                   restore_type,
-                   scheduled_constituent_id,
-                   scheduled_gandalf_session_id,
-                   start_time_usecs,
-                   status,
-                   task_id,
-                   mtype,
-                   user,
-                   user_info,
-                   view_box_id,
-                   view_name_deprecated)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.destroy_cloned_entity_info_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DestroyClonedVMTaskInfoProto(object):
 
@@ -44,6 +44,15 @@ class DestroyClonedVMTaskInfoProto(object):
         "view_deleted":'viewDeleted'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "destroy_cloned_entity_info_vec":['destroy_cloned_entity_info_proto.DestroyClonedEntityInfoProto']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  datastore_not_unmounted_reason=None,
                  datastore_unmounted=None,
@@ -74,25 +83,6 @@ class DestroyClonedVMTaskInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        datastore_not_unmounted_reason = dictionary.get('datastoreNotUnmountedReason')
-        datastore_unmounted = dictionary.get('datastoreUnmounted')
-        destroy_cloned_entity_info_vec = None
-        if dictionary.get('destroyClonedEntityInfoVec') != None:
-            destroy_cloned_entity_info_vec = list()
-            for structure in dictionary.get('destroyClonedEntityInfoVec'):
-                destroy_cloned_entity_info_vec.append(cohesity_management_sdk.models.destroy_cloned_entity_info_proto.DestroyClonedEntityInfoProto.from_dictionary(structure))
-        mtype = dictionary.get('type')
-        view_deleted = dictionary.get('viewDeleted')
-
-        # Return an object of this model
-        return cls(datastore_not_unmounted_reason,
-                   datastore_unmounted,
-                   destroy_cloned_entity_info_vec,
-                   mtype,
-                   view_deleted)
+        return decode_model(cls, dictionary)
 
 
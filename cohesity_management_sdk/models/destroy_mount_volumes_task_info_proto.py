@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.error_proto
-import cohesity_management_sdk.models.mount_volumes_info_proto
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DestroyMountVolumesTaskInfoProto(object):
 
@@ -41,6 +39,17 @@ class DestroyMountVolumesTaskInfoProto(object):
         "target_entity":'targetEntity'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "error":'error_proto.ErrorProto',
+        "mount_volumes_info_proto":'mount_volumes_info_proto.MountVolumesInfoProto',
+        "target_entity":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error=None,
                  finished=None,
@@ -71,21 +80,6 @@ class DestroyMountVolumesTaskInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        finished = dictionary.get('finished')
-        mount_volumes_info_proto = cohesity_management_sdk.models.mount_volumes_info_proto.MountVolumesInfoProto.from_dictionary(dictionary.get('mountVolumesInfoProto')) if dictionary.get('mountVolumesInfoProto') else None
-        slave_task_start_time_usecs = dictionary.get('slaveTaskStartTimeUsecs')
-        target_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetEntity')) if dictionary.get('targetEntity') else None
-
-        # Return an object of this model
-        return cls(error,
-                   finished,
-                   mount_volumes_info_proto,
-                   slave_task_start_time_usecs,
-                   target_entity)
+        return decode_model(cls, dictionary)
 
 
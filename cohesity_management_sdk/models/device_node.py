@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.device_tree_details
-import cohesity_management_sdk.models.file_partition_block
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeviceNode(object):
 
@@ -34,6 +33,16 @@ class DeviceNode(object):
         "leaf_node":'leafNode'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "intermediate_node":'device_tree_details.DeviceTreeDetails',
+        "leaf_node":'file_partition_block.FilePartitionBlock'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  intermediate_node=None,
                  leaf_node=None):
@@ -58,15 +67,6 @@ class DeviceNode(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        intermediate_node = cohesity_management_sdk.models.device_tree_details.DeviceTreeDetails.from_dictionary(dictionary.get('intermediateNode')) if dictionary.get('intermediateNode') else None
-        leaf_node = cohesity_management_sdk.models.file_partition_block.FilePartitionBlock.from_dictionary(dictionary.get('leafNode')) if dictionary.get('leafNode') else None
-
-        # Return an object of this model
-        return cls(intermediate_node,
-                   leaf_node)
+        return decode_model(cls, dictionary)
 
 
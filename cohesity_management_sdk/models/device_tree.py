@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.device_tree_child_device
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeviceTree(object):
 
@@ -40,6 +40,15 @@ class DeviceTree(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "child_vec":['device_tree_child_device.DeviceTreeChildDevice']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  child_vec=None,
                  device_length=None,
@@ -68,23 +77,6 @@ class DeviceTree(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        child_vec = None
-        if dictionary.get('childVec') != None:
-            child_vec = list()
-            for structure in dictionary.get('childVec'):
-                child_vec.append(cohesity_management_sdk.models.device_tree_child_device.DeviceTreeChildDevice.from_dictionary(structure))
-        device_length = dictionary.get('deviceLength')
-        stripe_size = dictionary.get('stripeSize')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(child_vec,
-                   device_length,
-                   stripe_size,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.device_tree
-import cohesity_management_sdk.models.device_tree_partition_slice
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeviceTreeChildDevice(object):
 
@@ -23,6 +22,16 @@ class DeviceTreeChildDevice(object):
         "partition_slice":'partitionSlice'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "device":'device_tree.DeviceTree',
+        "partition_slice":'device_tree_partition_slice.DeviceTreePartitionSlice'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  device=None,
                  partition_slice=None):
@@ -47,15 +56,6 @@ class DeviceTreeChildDevice(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        device = cohesity_management_sdk.models.device_tree.DeviceTree.from_dictionary(dictionary.get('device')) if dictionary.get('device') else None
-        partition_slice = cohesity_management_sdk.models.device_tree_partition_slice.DeviceTreePartitionSlice.from_dictionary(dictionary.get('partitionSlice')) if dictionary.get('partitionSlice') else None
-
-        # Return an object of this model
-        return cls(device,
-                   partition_slice)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.device_node
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeviceTreeDetails(object):
 
@@ -42,6 +42,15 @@ class DeviceTreeDetails(object):
         "stripe_size":'stripeSize'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "device_nodes":['device_node.DeviceNode']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  combine_method=None,
                  device_length=None,
@@ -70,23 +79,6 @@ class DeviceTreeDetails(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        combine_method = dictionary.get('combineMethod')
-        device_length = dictionary.get('deviceLength')
-        device_nodes = None
-        if dictionary.get('deviceNodes') != None:
-            device_nodes = list()
-            for structure in dictionary.get('deviceNodes'):
-                device_nodes.append(cohesity_management_sdk.models.device_node.DeviceNode.from_dictionary(structure))
-        stripe_size = dictionary.get('stripeSize')
-
-        # Return an object of this model
-        return cls(combine_method,
-                   device_length,
-                   device_nodes,
-                   stripe_size)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DeviceTreePartitionSlice(object):
 
@@ -35,6 +36,9 @@ class DeviceTreePartitionSlice(object):
         "partition_number":'partitionNumber'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disk_file_name=None,
                  length=None,
@@ -65,21 +69,6 @@ class DeviceTreePartitionSlice(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disk_file_name = dictionary.get('diskFileName')
-        length = dictionary.get('length')
-        lvm_data_offset = dictionary.get('lvmDataOffset')
-        offset = dictionary.get('offset')
-        partition_number = dictionary.get('partitionNumber')
-
-        # Return an object of this model
-        return cls(disk_file_name,
-                   length,
-                   lvm_data_offset,
-                   offset,
-                   partition_number)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DirQuotaConfig(object):
 
@@ -21,6 +22,9 @@ class DirQuotaConfig(object):
         "view_name":'viewName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  enabled=None,
                  view_name=None):
@@ -45,15 +49,6 @@ class DirQuotaConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        enabled = dictionary.get('enabled')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(enabled,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
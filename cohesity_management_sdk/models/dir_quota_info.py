@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.dir_quota_config
-import cohesity_management_sdk.models.dir_quota_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DirQuotaInfo(object):
 
@@ -25,6 +24,16 @@ class DirQuotaInfo(object):
         "quotas":'quotas'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "config":'dir_quota_config.DirQuotaConfig',
+        "quotas":['dir_quota_policy.DirQuotaPolicy']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  config=None,
                  quotas=None):
@@ -49,19 +58,6 @@ class DirQuotaInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        config = cohesity_management_sdk.models.dir_quota_config.DirQuotaConfig.from_dictionary(dictionary.get('config')) if dictionary.get('config') else None
-        quotas = None
-        if dictionary.get('quotas') != None:
-            quotas = list()
-            for structure in dictionary.get('quotas'):
-                quotas.append(cohesity_management_sdk.models.dir_quota_policy.DirQuotaPolicy.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(config,
-                   quotas)
+        return decode_model(cls, dictionary)
 
 
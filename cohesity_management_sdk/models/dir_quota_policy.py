@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.quota_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DirQuotaPolicy(object):
 
@@ -45,6 +45,15 @@ class DirQuotaPolicy(object):
         "policy":'policy'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "policy":'quota_policy.QuotaPolicy'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  usage_bytes=None,
                  dir_path=None,
@@ -71,17 +80,6 @@ class DirQuotaPolicy(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        usage_bytes = dictionary.get('UsageBytes')
-        dir_path = dictionary.get('dirPath')
-        policy = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('policy')) if dictionary.get('policy') else None
-
-        # Return an object of this model
-        return cls(usage_bytes,
-                   dir_path,
-                   policy)
+        return decode_model(cls, dictionary)
 
 
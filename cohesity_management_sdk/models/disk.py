@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.disk_block
-import cohesity_management_sdk.models.disk_partition
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Disk(object):
 
@@ -51,6 +50,16 @@ class Disk(object):
         "vmdk_size_bytes":'vmdkSizeBytes'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "disk_blocks":['disk_block.DiskBlock'],
+        "disk_partitions":['disk_partition.DiskPartition']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disk_blocks=None,
                  disk_format=None,
@@ -87,35 +96,6 @@ class Disk(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disk_blocks = None
-        if dictionary.get('diskBlocks') != None:
-            disk_blocks = list()
-            for structure in dictionary.get('diskBlocks'):
-                disk_blocks.append(cohesity_management_sdk.models.disk_block.DiskBlock.from_dictionary(structure))
-        disk_format = dictionary.get('diskFormat')
-        disk_partitions = None
-        if dictionary.get('diskPartitions') != None:
-            disk_partitions = list()
-            for structure in dictionary.get('diskPartitions'):
-                disk_partitions.append(cohesity_management_sdk.models.disk_partition.DiskPartition.from_dictionary(structure))
-        partition_table_format = dictionary.get('partitionTableFormat')
-        sector_size_bytes = dictionary.get('sectorSizeBytes')
-        uuid = dictionary.get('uuid')
-        vmdk_file_name = dictionary.get('vmdkFileName')
-        vmdk_size_bytes = dictionary.get('vmdkSizeBytes')
-
-        # Return an object of this model
-        return cls(disk_blocks,
-                   disk_format,
-                   disk_partitions,
-                   partition_table_format,
-                   sector_size_bytes,
-                   uuid,
-                   vmdk_file_name,
-                   vmdk_size_bytes)
+        return decode_model(cls, dictionary)
 
 
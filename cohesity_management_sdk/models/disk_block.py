@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DiskBlock(object):
 
@@ -23,6 +24,9 @@ class DiskBlock(object):
         "offset_bytes":'offsetBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  length_bytes=None,
                  offset_bytes=None):
@@ -47,15 +51,6 @@ class DiskBlock(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        length_bytes = dictionary.get('lengthBytes')
-        offset_bytes = dictionary.get('offsetBytes')
-
-        # Return an object of this model
-        return cls(length_bytes,
-                   offset_bytes)
+        return decode_model(cls, dictionary)
 
 
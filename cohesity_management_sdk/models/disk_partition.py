@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DiskPartition(object):
 
@@ -35,6 +36,9 @@ class DiskPartition(object):
         "uuid":'uuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  length_bytes=None,
                  number=None,
@@ -65,21 +69,6 @@ class DiskPartition(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        length_bytes = dictionary.get('lengthBytes')
-        number = dictionary.get('number')
-        offset_bytes = dictionary.get('offsetBytes')
-        type_uuid = dictionary.get('typeUuid')
-        uuid = dictionary.get('uuid')
-
-        # Return an object of this model
-        return cls(length_bytes,
-                   number,
-                   offset_bytes,
-                   type_uuid,
-                   uuid)
+        return decode_model(cls, dictionary)
 
 
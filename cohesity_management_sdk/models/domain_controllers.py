@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DomainControllers(object):
 
@@ -19,6 +20,9 @@ class DomainControllers(object):
         "domain_controllers":'domainControllers'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain_controllers=None):
         """Constructor for the DomainControllers class"""
@@ -41,13 +45,6 @@ class DomainControllers(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain_controllers = dictionary.get('domainControllers')
-
-        # Return an object of this model
-        return cls(domain_controllers)
+        return decode_model(cls, dictionary)
 
 
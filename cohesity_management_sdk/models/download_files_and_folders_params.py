@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.files_and_folders_info
-import cohesity_management_sdk.models.restore_object_details
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DownloadFilesAndFoldersParams(object):
 
@@ -32,6 +31,16 @@ class DownloadFilesAndFoldersParams(object):
         "source_object_info":'sourceObjectInfo'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "files_and_folders_info":['files_and_folders_info.FilesAndFoldersInfo'],
+        "source_object_info":'restore_object_details.RestoreObjectDetails'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  files_and_folders_info=None,
@@ -58,21 +67,6 @@ class DownloadFilesAndFoldersParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        files_and_folders_info = None
-        if dictionary.get('filesAndFoldersInfo') != None:
-            files_and_folders_info = list()
-            for structure in dictionary.get('filesAndFoldersInfo'):
-                files_and_folders_info.append(cohesity_management_sdk.models.files_and_folders_info.FilesAndFoldersInfo.from_dictionary(structure))
-        source_object_info = cohesity_management_sdk.models.restore_object_details.RestoreObjectDetails.from_dictionary(dictionary.get('sourceObjectInfo')) if dictionary.get('sourceObjectInfo') else None
-
-        # Return an object of this model
-        return cls(name,
-                   files_and_folders_info,
-                   source_object_info)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class DownloadPackageParameters(object):
 
@@ -20,6 +21,9 @@ class DownloadPackageParameters(object):
         "url":'url'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  url=None):
         """Constructor for the DownloadPackageParameters class"""
@@ -42,13 +46,6 @@ class DownloadPackageParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        url = dictionary.get('url')
-
-        # Return an object of this model
-        return cls(url)
+        return decode_model(cls, dictionary)
 
 
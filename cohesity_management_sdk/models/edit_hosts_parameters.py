@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.host_entry
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EditHostsParameters(object):
 
@@ -22,6 +22,15 @@ class EditHostsParameters(object):
         "hosts":'hosts'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "hosts":['host_entry.HostEntry']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  hosts=None):
         """Constructor for the EditHostsParameters class"""
@@ -44,17 +53,6 @@ class EditHostsParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        hosts = None
-        if dictionary.get('hosts') != None:
-            hosts = list()
-            for structure in dictionary.get('hosts'):
-                hosts.append(cohesity_management_sdk.models.host_entry.HostEntry.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(hosts)
+        return decode_model(cls, dictionary)
 
 
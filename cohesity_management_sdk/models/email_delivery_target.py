@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EmailDeliveryTarget(object):
 
@@ -22,6 +23,9 @@ class EmailDeliveryTarget(object):
         "locale":'locale'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  email_address=None,
                  locale=None):
@@ -46,15 +50,6 @@ class EmailDeliveryTarget(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        email_address = dictionary.get('emailAddress')
-        locale = dictionary.get('locale')
-
-        # Return an object of this model
-        return cls(email_address,
-                   locale)
+        return decode_model(cls, dictionary)
 
 
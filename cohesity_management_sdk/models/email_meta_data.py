@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EmailMetaData(object):
 
@@ -71,6 +72,9 @@ class EmailMetaData(object):
         "tenant_id":'tenantId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  all_under_hierarchy=None,
                  bcc_recipient_addresses=None,
@@ -129,49 +133,6 @@ class EmailMetaData(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        all_under_hierarchy = dictionary.get('allUnderHierarchy')
-        bcc_recipient_addresses = dictionary.get('bccRecipientAddresses')
-        cc_recipient_addresses = dictionary.get('ccRecipientAddresses')
-        domain_ids = dictionary.get('domainIds')
-        email_subject = dictionary.get('emailSubject')
-        folder_key = dictionary.get('folderKey')
-        folder_name = dictionary.get('folderName')
-        has_attachments = dictionary.get('hasAttachments')
-        item_key = dictionary.get('itemKey')
-        mailbox_ids = dictionary.get('mailboxIds')
-        protection_job_ids = dictionary.get('protectionJobIds')
-        received_end_time = dictionary.get('receivedEndTime')
-        received_start_time = dictionary.get('receivedStartTime')
-        received_time_seconds = dictionary.get('receivedTimeSeconds')
-        recipient_addresses = dictionary.get('recipientAddresses')
-        sender_address = dictionary.get('senderAddress')
-        sent_time_seconds = dictionary.get('sentTimeSeconds')
-        show_only_email_folders = dictionary.get('showOnlyEmailFolders')
-        tenant_id = dictionary.get('tenantId')
-
-        # Return an object of this model
-        return cls(all_under_hierarchy,
-                   bcc_recipient_addresses,
-                   cc_recipient_addresses,
-                   domain_ids,
-                   email_subject,
-                   folder_key,
-                   folder_name,
-                   has_attachments,
-                   item_key,
-                   mailbox_ids,
-                   protection_job_ids,
-                   received_end_time,
-                   received_start_time,
-                   received_time_seconds,
-                   recipient_addresses,
-                   sender_address,
-                   sent_time_seconds,
-                   show_only_email_folders,
-                   tenant_id)
+        return decode_model(cls, dictionary)
 
 
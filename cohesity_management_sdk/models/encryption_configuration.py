@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EncryptionConfiguration(object):
 
@@ -29,6 +30,9 @@ class EncryptionConfiguration(object):
         "rotation_period":'rotationPeriod'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  enable_encryption=None,
                  enable_fips_mode=None,
@@ -55,17 +59,6 @@ class EncryptionConfiguration(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        enable_encryption = dictionary.get('enableEncryption')
-        enable_fips_mode = dictionary.get('enableFipsMode')
-        rotation_period = dictionary.get('rotationPeriod')
-
-        # Return an object of this model
-        return cls(enable_encryption,
-                   enable_fips_mode,
-                   rotation_period)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.value
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EntityIdentifier(object):
 
@@ -20,6 +20,15 @@ class EntityIdentifier(object):
         "entity_id":'entityId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "entity_id":'value.Value'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  entity_id=None):
         """Constructor for the EntityIdentifier class"""
@@ -42,13 +51,6 @@ class EntityIdentifier(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        entity_id = cohesity_management_sdk.models.value.Value.from_dictionary(dictionary.get('entityId')) if dictionary.get('entityId') else None
-
-        # Return an object of this model
-        return cls(entity_id)
+        return decode_model(cls, dictionary)
 
 
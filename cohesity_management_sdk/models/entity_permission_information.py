@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.group_info
-import cohesity_management_sdk.models.tenant_info
-import cohesity_management_sdk.models.user_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EntityPermissionInformation(object):
 
@@ -29,6 +27,17 @@ class EntityPermissionInformation(object):
         "users":'users'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "groups":['group_info.GroupInfo'],
+        "tenant":'tenant_info.TenantInfo',
+        "users":['user_info.UserInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  entity_id=None,
                  groups=None,
@@ -57,27 +66,6 @@ class EntityPermissionInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        entity_id = dictionary.get('entityId')
-        groups = None
-        if dictionary.get('groups') != None:
-            groups = list()
-            for structure in dictionary.get('groups'):
-                groups.append(cohesity_management_sdk.models.group_info.GroupInfo.from_dictionary(structure))
-        tenant = cohesity_management_sdk.models.tenant_info.TenantInfo.from_dictionary(dictionary.get('tenant')) if dictionary.get('tenant') else None
-        users = None
-        if dictionary.get('users') != None:
-            users = list()
-            for structure in dictionary.get('users'):
-                users.append(cohesity_management_sdk.models.user_info.UserInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(entity_id,
-                   groups,
-                   tenant,
-                   users)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.key_value_pair
-import cohesity_management_sdk.models.entity_identifier
-import cohesity_management_sdk.models.metric_value
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EntityProto(object):
 
@@ -30,6 +28,17 @@ class EntityProto(object):
         "latest_metric_vec":'latestMetricVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "attribute_vec":['key_value_pair.KeyValuePair'],
+        "entity_id":'entity_identifier.EntityIdentifier',
+        "latest_metric_vec":['metric_value.MetricValue']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  attribute_vec=None,
                  entity_id=None,
@@ -56,25 +65,6 @@ class EntityProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        attribute_vec = None
-        if dictionary.get('attributeVec') != None:
-            attribute_vec = list()
-            for structure in dictionary.get('attributeVec'):
-                attribute_vec.append(cohesity_management_sdk.models.key_value_pair.KeyValuePair.from_dictionary(structure))
-        entity_id = cohesity_management_sdk.models.entity_identifier.EntityIdentifier.from_dictionary(dictionary.get('entityId')) if dictionary.get('entityId') else None
-        latest_metric_vec = None
-        if dictionary.get('latestMetricVec') != None:
-            latest_metric_vec = list()
-            for structure in dictionary.get('latestMetricVec'):
-                latest_metric_vec.append(cohesity_management_sdk.models.metric_value.MetricValue.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(attribute_vec,
-                   entity_id,
-                   latest_metric_vec)
+        return decode_model(cls, dictionary)
 
 
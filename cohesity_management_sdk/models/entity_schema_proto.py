@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_schema_proto_attributes_descriptor
-import cohesity_management_sdk.models.entity_schema_proto_time_series_descriptor
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EntitySchemaProto(object):
 
@@ -55,6 +54,16 @@ class EntitySchemaProto(object):
         "version":'version'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "attributes_descriptor":'entity_schema_proto_attributes_descriptor.EntitySchemaProtoAttributesDescriptor',
+        "time_series_descriptor_vec":['entity_schema_proto_time_series_descriptor.EntitySchemaProtoTimeSeriesDescriptor']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  attributes_descriptor=None,
                  flush_interval_secs=None,
@@ -93,33 +102,6 @@ class EntitySchemaProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        attributes_descriptor = cohesity_management_sdk.models.entity_schema_proto_attributes_descriptor.EntitySchemaProtoAttributesDescriptor.from_dictionary(dictionary.get('attributesDescriptor')) if dictionary.get('attributesDescriptor') else None
-        flush_interval_secs = dictionary.get('flushIntervalSecs')
-        is_internal_schema = dictionary.get('isInternalSchema')
-        largest_flush_interval_secs = dictionary.get('largestFlushIntervalSecs')
-        name = dictionary.get('name')
-        schema_descriptive_name = dictionary.get('schemaDescriptiveName')
-        schema_help_text = dictionary.get('schemaHelpText')
-        time_series_descriptor_vec = None
-        if dictionary.get('timeSeriesDescriptorVec') != None:
-            time_series_descriptor_vec = list()
-            for structure in dictionary.get('timeSeriesDescriptorVec'):
-                time_series_descriptor_vec.append(cohesity_management_sdk.models.entity_schema_proto_time_series_descriptor.EntitySchemaProtoTimeSeriesDescriptor.from_dictionary(structure))
-        version = dictionary.get('version')
-
-        # Return an object of this model
-        return cls(attributes_descriptor,
-                   flush_interval_secs,
-                   is_internal_schema,
-                   largest_flush_interval_secs,
-                   name,
-                   schema_descriptive_name,
-                   schema_help_text,
-                   time_series_descriptor_vec,
-                   version)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_schema_proto_key_value_descriptor
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EntitySchemaProtoAttributesDescriptor(object):
 
@@ -25,6 +25,15 @@ class EntitySchemaProtoAttributesDescriptor(object):
         "key_attribute_name_index":'keyAttributeNameIndex'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "attribute_vec":['entity_schema_proto_key_value_descriptor.EntitySchemaProtoKeyValueDescriptor']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  attribute_vec=None,
                  key_attribute_name_index=None):
@@ -49,19 +58,6 @@ class EntitySchemaProtoAttributesDescriptor(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        attribute_vec = None
-        if dictionary.get('attributeVec') != None:
-            attribute_vec = list()
-            for structure in dictionary.get('attributeVec'):
-                attribute_vec.append(cohesity_management_sdk.models.entity_schema_proto_key_value_descriptor.EntitySchemaProtoKeyValueDescriptor.from_dictionary(structure))
-        key_attribute_name_index = dictionary.get('keyAttributeNameIndex')
-
-        # Return an object of this model
-        return cls(attribute_vec,
-                   key_attribute_name_index)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EntitySchemaProtoKeyValueDescriptor(object):
 
@@ -23,6 +24,9 @@ class EntitySchemaProtoKeyValueDescriptor(object):
         "value_type":'valueType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  key_name=None,
                  value_type=None):
@@ -47,15 +51,6 @@ class EntitySchemaProtoKeyValueDescriptor(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        key_name = dictionary.get('keyName')
-        value_type = dictionary.get('valueType')
-
-        # Return an object of this model
-        return cls(key_name,
-                   value_type)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_schema_proto_time_series_descriptor_metric_unit
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EntitySchemaProtoTimeSeriesDescriptor(object):
 
@@ -50,6 +50,15 @@ class EntitySchemaProtoTimeSeriesDescriptor(object):
         "value_type":'valueType'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "metric_unit":'entity_schema_proto_time_series_descriptor_metric_unit.EntitySchemaProtoTimeSeriesDescriptorMetricUnit'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  metric_descriptive_name=None,
                  metric_name=None,
@@ -82,23 +91,6 @@ class EntitySchemaProtoTimeSeriesDescriptor(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        metric_descriptive_name = dictionary.get('metricDescriptiveName')
-        metric_name = dictionary.get('metricName')
-        metric_unit = cohesity_management_sdk.models.entity_schema_proto_time_series_descriptor_metric_unit.EntitySchemaProtoTimeSeriesDescriptorMetricUnit.from_dictionary(dictionary.get('metricUnit')) if dictionary.get('metricUnit') else None
-        raw_metric_publish_interval_hint_secs = dictionary.get('rawMetricPublishIntervalHintSecs')
-        time_to_live_secs = dictionary.get('timeToLiveSecs')
-        value_type = dictionary.get('valueType')
-
-        # Return an object of this model
-        return cls(metric_descriptive_name,
-                   metric_name,
-                   metric_unit,
-                   raw_metric_publish_interval_hint_secs,
-                   time_to_live_secs,
-                   value_type)
+        return decode_model(cls, dictionary)
 
 
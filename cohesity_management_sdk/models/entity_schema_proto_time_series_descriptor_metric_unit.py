@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EntitySchemaProtoTimeSeriesDescriptorMetricUnit(object):
 
@@ -28,6 +29,9 @@ class EntitySchemaProtoTimeSeriesDescriptorMetricUnit(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  mtype=None):
         """Constructor for the EntitySchemaProtoTimeSeriesDescriptorMetricUnit class"""
@@ -50,13 +54,6 @@ class EntitySchemaProtoTimeSeriesDescriptorMetricUnit(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,15 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.file_stubbing_params
-import cohesity_management_sdk.models.hyperv_backup_env_params
-import cohesity_management_sdk.models.nas_backup_params
-import cohesity_management_sdk.models.o_365_backup_env_params
-import cohesity_management_sdk.models.outlook_backup_env_params
-import cohesity_management_sdk.models.physical_backup_env_params
-import cohesity_management_sdk.models.snapshot_manager_params
-import cohesity_management_sdk.models.sql_backup_job_params
-import cohesity_management_sdk.models.vmware_backup_env_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EnvBackupParams(object):
 
@@ -55,6 +47,23 @@ class EnvBackupParams(object):
         "vmware_backup_params":'vmwareBackupParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "file_stubbing_params":'file_stubbing_params.FileStubbingParams',
+        "hyperv_backup_params":'hyperv_backup_env_params.HypervBackupEnvParams',
+        "nas_backup_params":'nas_backup_params.NasBackupParams',
+        "o_365_backup_params":'o_365_backup_env_params.O365BackupEnvParams',
+        "outlook_backup_params":'outlook_backup_env_params.OutlookBackupEnvParams',
+        "physical_backup_params":'physical_backup_env_params.PhysicalBackupEnvParams',
+        "snapshot_manager_params":'snapshot_manager_params.SnapshotManagerParams',
+        "sql_backup_job_params":'sql_backup_job_params.SqlBackupJobParams',
+        "vmware_backup_params":'vmware_backup_env_params.VmwareBackupEnvParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  file_stubbing_params=None,
                  hyperv_backup_params=None,
@@ -93,29 +102,6 @@ class EnvBackupParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        file_stubbing_params = cohesity_management_sdk.models.file_stubbing_params.FileStubbingParams.from_dictionary(dictionary.get('fileStubbingParams')) if dictionary.get('fileStubbingParams') else None
-        hyperv_backup_params = cohesity_management_sdk.models.hyperv_backup_env_params.HypervBackupEnvParams.from_dictionary(dictionary.get('hypervBackupParams')) if dictionary.get('hypervBackupParams') else None
-        nas_backup_params = cohesity_management_sdk.models.nas_backup_params.NasBackupParams.from_dictionary(dictionary.get('nasBackupParams')) if dictionary.get('nasBackupParams') else None
-        o_365_backup_params = cohesity_management_sdk.models.o_365_backup_env_params.O365BackupEnvParams.from_dictionary(dictionary.get('o365BackupParams')) if dictionary.get('o365BackupParams') else None
-        outlook_backup_params = cohesity_management_sdk.models.outlook_backup_env_params.OutlookBackupEnvParams.from_dictionary(dictionary.get('outlookBackupParams')) if dictionary.get('outlookBackupParams') else None
-        physical_backup_params = cohesity_management_sdk.models.physical_backup_env_params.PhysicalBackupEnvParams.from_dictionary(dictionary.get('physicalBackupParams')) if dictionary.get('physicalBackupParams') else None
-        snapshot_manager_params = cohesity_management_sdk.models.snapshot_manager_params.SnapshotManagerParams.from_dictionary(dictionary.get('snapshotManagerParams')) if dictionary.get('snapshotManagerParams') else None
-        sql_backup_job_params = cohesity_management_sdk.models.sql_backup_job_params.SqlBackupJobParams.from_dictionary(dictionary.get('sqlBackupJobParams')) if dictionary.get('sqlBackupJobParams') else None
-        vmware_backup_params = cohesity_management_sdk.models.vmware_backup_env_params.VmwareBackupEnvParams.from_dictionary(dictionary.get('vmwareBackupParams')) if dictionary.get('vmwareBackupParams') else None
-
-        # Return an object of this model
-        return cls(file_stubbing_params,
-                   hyperv_backup_params,
-                   nas_backup_params,
-                   o_365_backup_params,
-                   outlook_backup_params,
-                   physical_backup_params,
-                   snapshot_manager_params,
-                   sql_backup_job_params,
-                   vmware_backup_params)
+        return decode_model(cls, dictionary)
 
 
@@ -1,14 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.aws_snapshot_manager_parameters
-import cohesity_management_sdk.models.hyperv_env_job_parameters
-import cohesity_management_sdk.models.nas_env_job_parameters
-import cohesity_management_sdk.models.outlook_env_job_parameters
-import cohesity_management_sdk.models.physical_env_job_parameters
-import cohesity_management_sdk.models.pure_env_job_parameters
-import cohesity_management_sdk.models.sql_env_job_parameters
-import cohesity_management_sdk.models.vmware_env_job_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EnvironmentTypeJobParameters(object):
 
@@ -60,6 +53,22 @@ class EnvironmentTypeJobParameters(object):
         "vmware_parameters":'vmwareParameters'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "aws_snapshot_parameters":'aws_snapshot_manager_parameters.AwsSnapshotManagerParameters',
+        "hyperv_parameters":'hyperv_env_job_parameters.HypervEnvJobParameters',
+        "nas_parameters":'nas_env_job_parameters.NasEnvJobParameters',
+        "outlook_parameters":'outlook_env_job_parameters.OutlookEnvJobParameters',
+        "physical_parameters":'physical_env_job_parameters.PhysicalEnvJobParameters',
+        "pure_parameters":'pure_env_job_parameters.PureEnvJobParameters',
+        "sql_parameters":'sql_env_job_parameters.SqlEnvJobParameters',
+        "vmware_parameters":'vmware_env_job_parameters.VmwareEnvJobParameters'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  aws_snapshot_parameters=None,
                  hyperv_parameters=None,
@@ -96,27 +105,6 @@ class EnvironmentTypeJobParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        aws_snapshot_parameters = cohesity_management_sdk.models.aws_snapshot_manager_parameters.AwsSnapshotManagerParameters.from_dictionary(dictionary.get('awsSnapshotParameters')) if dictionary.get('awsSnapshotParameters') else None
-        hyperv_parameters = cohesity_management_sdk.models.hyperv_env_job_parameters.HypervEnvJobParameters.from_dictionary(dictionary.get('hypervParameters')) if dictionary.get('hypervParameters') else None
-        nas_parameters = cohesity_management_sdk.models.nas_env_job_parameters.NasEnvJobParameters.from_dictionary(dictionary.get('nasParameters')) if dictionary.get('nasParameters') else None
-        outlook_parameters = cohesity_management_sdk.models.outlook_env_job_parameters.OutlookEnvJobParameters.from_dictionary(dictionary.get('outlookParameters')) if dictionary.get('outlookParameters') else None
-        physical_parameters = cohesity_management_sdk.models.physical_env_job_parameters.PhysicalEnvJobParameters.from_dictionary(dictionary.get('physicalParameters')) if dictionary.get('physicalParameters') else None
-        pure_parameters = cohesity_management_sdk.models.pure_env_job_parameters.PureEnvJobParameters.from_dictionary(dictionary.get('pureParameters')) if dictionary.get('pureParameters') else None
-        sql_parameters = cohesity_management_sdk.models.sql_env_job_parameters.SqlEnvJobParameters.from_dictionary(dictionary.get('sqlParameters')) if dictionary.get('sqlParameters') else None
-        vmware_parameters = cohesity_management_sdk.models.vmware_env_job_parameters.VmwareEnvJobParameters.from_dictionary(dictionary.get('vmwareParameters')) if dictionary.get('vmwareParameters') else None
-
-        # Return an object of this model
-        return cls(aws_snapshot_parameters,
-                   hyperv_parameters,
-                   nas_parameters,
-                   outlook_parameters,
-                   physical_parameters,
-                   pure_parameters,
-                   sql_parameters,
-                   vmware_parameters)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ErasureCodingInfo(object):
 
@@ -31,6 +32,9 @@ class ErasureCodingInfo(object):
         "num_data_stripes":'numDataStripes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  algorithm=None,
                  erasure_coding_enabled=None,
@@ -61,21 +65,6 @@ class ErasureCodingInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        algorithm = dictionary.get('algorithm')
-        erasure_coding_enabled = dictionary.get('erasureCodingEnabled')
-        inline_erasure_coding = dictionary.get('inlineErasureCoding')
-        num_coded_stripes = dictionary.get('numCodedStripes')
-        num_data_stripes = dictionary.get('numDataStripes')
-
-        # Return an object of this model
-        return cls(algorithm,
-                   erasure_coding_enabled,
-                   inline_erasure_coding,
-                   num_coded_stripes,
-                   num_data_stripes)
+        return decode_model(cls, dictionary)
 
 
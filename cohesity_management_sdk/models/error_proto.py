@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ErrorProto(object):
 
@@ -20,6 +21,9 @@ class ErrorProto(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error_msg=None,
                  mtype=None):
@@ -44,15 +48,6 @@ class ErrorProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error_msg = dictionary.get('errorMsg')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(error_msg,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
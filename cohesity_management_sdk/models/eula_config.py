@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class EulaConfig(object):
 
@@ -27,6 +28,9 @@ class EulaConfig(object):
         "signed_time":'signedTime'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  license_key=None,
                  signed_version=None,
@@ -55,19 +59,6 @@ class EulaConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        license_key = dictionary.get('licenseKey')
-        signed_version = dictionary.get('signedVersion')
-        signed_by_user = dictionary.get('signedByUser')
-        signed_time = dictionary.get('signedTime')
-
-        # Return an object of this model
-        return cls(license_key,
-                   signed_version,
-                   signed_by_user,
-                   signed_time)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ExpandCloudClusterParameters(object):
 
@@ -20,6 +21,9 @@ class ExpandCloudClusterParameters(object):
         "node_ips":'nodeIps'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  node_ips=None):
         """Constructor for the ExpandCloudClusterParameters class"""
@@ -42,13 +46,6 @@ class ExpandCloudClusterParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        node_ips = dictionary.get('nodeIps')
-
-        # Return an object of this model
-        return cls(node_ips)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.physical_node_configuration
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ExpandPhysicalClusterParameters(object):
 
@@ -24,6 +24,15 @@ class ExpandPhysicalClusterParameters(object):
         "vips":'vips'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "node_configs":['physical_node_configuration.PhysicalNodeConfiguration']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  node_configs=None,
                  vips=None):
@@ -48,19 +57,6 @@ class ExpandPhysicalClusterParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        node_configs = None
-        if dictionary.get('nodeConfigs') != None:
-            node_configs = list()
-            for structure in dictionary.get('nodeConfigs'):
-                node_configs.append(cohesity_management_sdk.models.physical_node_configuration.PhysicalNodeConfiguration.from_dictionary(structure))
-        vips = dictionary.get('vips')
-
-        # Return an object of this model
-        return cls(node_configs,
-                   vips)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ExtendedRetentionPolicy(object):
 
@@ -54,6 +55,9 @@ class ExtendedRetentionPolicy(object):
         "periodicity":'periodicity'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_run_type=None,
                  days_to_keep=None,
@@ -82,19 +86,6 @@ class ExtendedRetentionPolicy(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_run_type = dictionary.get('backupRunType')
-        days_to_keep = dictionary.get('daysToKeep')
-        multiplier = dictionary.get('multiplier')
-        periodicity = dictionary.get('periodicity')
-
-        # Return an object of this model
-        return cls(backup_run_type,
-                   days_to_keep,
-                   multiplier,
-                   periodicity)
+        return decode_model(cls, dictionary)
 
 
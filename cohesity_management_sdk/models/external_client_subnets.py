@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.subnet
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ExternalClientSubnets(object):
 
@@ -20,6 +20,15 @@ class ExternalClientSubnets(object):
         "client_subnets":'clientSubnets'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "client_subnets":['subnet.Subnet']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  client_subnets=None):
         """Constructor for the ExternalClientSubnets class"""
@@ -42,17 +51,6 @@ class ExternalClientSubnets(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        client_subnets = None
-        if dictionary.get('clientSubnets') != None:
-            client_subnets = list()
-            for structure in dictionary.get('clientSubnets'):
-                client_subnets.append(cohesity_management_sdk.models.subnet.Subnet.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(client_subnets)
+        return decode_model(cls, dictionary)
 
 
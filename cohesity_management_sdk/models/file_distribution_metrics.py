@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileDistributionMetrics(object):
 
@@ -20,6 +21,9 @@ class FileDistributionMetrics(object):
         "value":'value'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  metric_name=None,
                  value=None):
@@ -44,15 +48,6 @@ class FileDistributionMetrics(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        metric_name = dictionary.get('metricName')
-        value = dictionary.get('value')
-
-        # Return an object of this model
-        return cls(metric_name,
-                   value)
+        return decode_model(cls, dictionary)
 
 
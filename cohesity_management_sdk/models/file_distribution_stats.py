@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.file_distribution_metrics
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileDistributionStats(object):
 
@@ -31,6 +31,15 @@ class FileDistributionStats(object):
         "metrics_list":'metricsList'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "metrics_list":['file_distribution_metrics.FileDistributionMetrics']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_id=None,
                  cluster_incarnation_id=None,
@@ -61,25 +70,6 @@ class FileDistributionStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_id = dictionary.get('clusterId')
-        cluster_incarnation_id = dictionary.get('clusterIncarnationId')
-        entity_id = dictionary.get('entityId')
-        entity_name = dictionary.get('entityName')
-        metrics_list = None
-        if dictionary.get('metricsList') != None:
-            metrics_list = list()
-            for structure in dictionary.get('metricsList'):
-                metrics_list.append(cohesity_management_sdk.models.file_distribution_metrics.FileDistributionMetrics.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(cluster_id,
-                   cluster_incarnation_id,
-                   entity_id,
-                   entity_name,
-                   metrics_list)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileExtensionFilter(object):
 
@@ -25,6 +26,9 @@ class FileExtensionFilter(object):
         "mode":'mode'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  file_extensions_list=None,
                  is_enabled=None,
@@ -51,17 +55,6 @@ class FileExtensionFilter(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        file_extensions_list = dictionary.get('fileExtensionsList')
-        is_enabled = dictionary.get('isEnabled')
-        mode = dictionary.get('mode')
-
-        # Return an object of this model
-        return cls(file_extensions_list,
-                   is_enabled,
-                   mode)
+        return decode_model(cls, dictionary)
 
 
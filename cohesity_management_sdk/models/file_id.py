@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileId(object):
 
@@ -23,6 +24,9 @@ class FileId(object):
         "view_id":'viewId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  entity_id=None,
                  root_inode_id=None,
@@ -49,17 +53,6 @@ class FileId(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        entity_id = dictionary.get('entityId')
-        root_inode_id = dictionary.get('rootInodeId')
-        view_id = dictionary.get('viewId')
-
-        # Return an object of this model
-        return cls(entity_id,
-                   root_inode_id,
-                   view_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileLevelDataLockConfig(object):
 
@@ -72,6 +73,9 @@ class FileLevelDataLockConfig(object):
         "mode":'mode'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  auto_lock_after_duration_idle=None,
                  default_file_retention_duration_msecs=None,
@@ -106,25 +110,6 @@ class FileLevelDataLockConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        auto_lock_after_duration_idle = dictionary.get('autoLockAfterDurationIdle')
-        default_file_retention_duration_msecs = dictionary.get('defaultFileRetentionDurationMsecs')
-        expiry_timestamp_msecs = dictionary.get('expiryTimestampMsecs')
-        locking_protocol = dictionary.get('lockingProtocol')
-        max_retention_duration_msecs = dictionary.get('maxRetentionDurationMsecs')
-        min_retention_duration_msecs = dictionary.get('minRetentionDurationMsecs')
-        mode = dictionary.get('mode')
-
-        # Return an object of this model
-        return cls(auto_lock_after_duration_idle,
-                   default_file_retention_duration_msecs,
-                   expiry_timestamp_msecs,
-                   locking_protocol,
-                   max_retention_duration_msecs,
-                   min_retention_duration_msecs,
-                   mode)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileLockStatus(object):
 
@@ -37,6 +38,9 @@ class FileLockStatus(object):
         "state":'state'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  expiry_timestamp_msecs=None,
                  hold_timestamp_msecs=None,
@@ -67,21 +71,6 @@ class FileLockStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        expiry_timestamp_msecs = dictionary.get('expiryTimestampMsecs')
-        hold_timestamp_msecs = dictionary.get('holdTimestampMsecs')
-        lock_timestamp_msecs = dictionary.get('lockTimestampMsecs')
-        mode = dictionary.get('mode')
-        state = dictionary.get('state')
-
-        # Return an object of this model
-        return cls(expiry_timestamp_msecs,
-                   hold_timestamp_msecs,
-                   lock_timestamp_msecs,
-                   mode,
-                   state)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileLockStatusParams(object):
 
@@ -18,6 +19,9 @@ class FileLockStatusParams(object):
         "path":'path'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  path=None):
         """Constructor for the FileLockStatusParams class"""
@@ -40,13 +44,6 @@ class FileLockStatusParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        path = dictionary.get('path')
-
-        # Return an object of this model
-        return cls(path)
+        return decode_model(cls, dictionary)
 
 
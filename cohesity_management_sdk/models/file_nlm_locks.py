@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.file_id
-import cohesity_management_sdk.models.nlm_lock
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileNlmLocks(object):
 
@@ -23,6 +22,16 @@ class FileNlmLocks(object):
         "nlm_locks":'nlmLocks'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "file_id":'file_id.FileId',
+        "nlm_locks":['nlm_lock.NlmLock']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  file_id=None,
                  nlm_locks=None):
@@ -47,19 +56,6 @@ class FileNlmLocks(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        file_id = cohesity_management_sdk.models.file_id.FileId.from_dictionary(dictionary.get('fileId')) if dictionary.get('fileId') else None
-        nlm_locks = None
-        if dictionary.get('nlmLocks') != None:
-            nlm_locks = list()
-            for structure in dictionary.get('nlmLocks'):
-                nlm_locks.append(cohesity_management_sdk.models.nlm_lock.NlmLock.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(file_id,
-                   nlm_locks)
+        return decode_model(cls, dictionary)
 
 
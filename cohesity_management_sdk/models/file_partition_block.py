@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FilePartitionBlock(object):
 
@@ -29,6 +30,9 @@ class FilePartitionBlock(object):
         "offset_bytes":'offsetBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disk_file_name=None,
                  length_bytes=None,
@@ -57,19 +61,6 @@ class FilePartitionBlock(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disk_file_name = dictionary.get('diskFileName')
-        length_bytes = dictionary.get('lengthBytes')
-        number = dictionary.get('number')
-        offset_bytes = dictionary.get('offsetBytes')
-
-        # Return an object of this model
-        return cls(disk_file_name,
-                   length_bytes,
-                   number,
-                   offset_bytes)
+        return decode_model(cls, dictionary)
 
 
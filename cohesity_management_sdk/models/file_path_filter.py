@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FilePathFilter(object):
 
@@ -36,6 +37,9 @@ class FilePathFilter(object):
         "protect_filters":'protectFilters'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  exclude_filters=None,
                  protect_filters=None):
@@ -60,15 +64,6 @@ class FilePathFilter(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        exclude_filters = dictionary.get('excludeFilters')
-        protect_filters = dictionary.get('protectFilters')
-
-        # Return an object of this model
-        return cls(exclude_filters,
-                   protect_filters)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FilePathParameters(object):
 
@@ -30,6 +31,9 @@ class FilePathParameters(object):
         "skip_nested_volumes":'skipNestedVolumes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_file_path=None,
                  excluded_file_paths=None,
@@ -56,17 +60,6 @@ class FilePathParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_file_path = dictionary.get('backupFilePath')
-        excluded_file_paths = dictionary.get('excludedFilePaths')
-        skip_nested_volumes = dictionary.get('skipNestedVolumes')
-
-        # Return an object of this model
-        return cls(backup_file_path,
-                   excluded_file_paths,
-                   skip_nested_volumes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.request_error
-import cohesity_management_sdk.models.filesystem_volume
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileRestoreInfo(object):
 
@@ -27,6 +26,16 @@ class FileRestoreInfo(object):
         "is_folder":'isFolder'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "error":'request_error.RequestError',
+        "filesystem_volume":'filesystem_volume.FilesystemVolume'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error=None,
                  filename=None,
@@ -55,19 +64,6 @@ class FileRestoreInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error = cohesity_management_sdk.models.request_error.RequestError.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        filename = dictionary.get('filename')
-        filesystem_volume = cohesity_management_sdk.models.filesystem_volume.FilesystemVolume.from_dictionary(dictionary.get('filesystemVolume')) if dictionary.get('filesystemVolume') else None
-        is_folder = dictionary.get('isFolder')
-
-        # Return an object of this model
-        return cls(error,
-                   filename,
-                   filesystem_volume,
-                   is_folder)
+        return decode_model(cls, dictionary)
 
 
@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_object_meta_data
-import cohesity_management_sdk.models.email_meta_data
-import cohesity_management_sdk.models.file_version
-import cohesity_management_sdk.models.universal_id
-import cohesity_management_sdk.models.protection_source
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileSearchResult(object):
 
@@ -69,6 +65,19 @@ class FileSearchResult(object):
         "view_box_id":'viewBoxId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ad_object_meta_data":'ad_object_meta_data.AdObjectMetaData',
+        "email_meta_data":'email_meta_data.EmailMetaData',
+        "file_versions":['file_version.FileVersion'],
+        "job_uid":'universal_id.UniversalId',
+        "protection_source":'protection_source.ProtectionSource'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_object_meta_data=None,
                  document_type=None,
@@ -115,41 +124,6 @@ class FileSearchResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_object_meta_data = cohesity_management_sdk.models.ad_object_meta_data.AdObjectMetaData.from_dictionary(dictionary.get('adObjectMetaData')) if dictionary.get('adObjectMetaData') else None
-        document_type = dictionary.get('documentType')
-        email_meta_data = cohesity_management_sdk.models.email_meta_data.EmailMetaData.from_dictionary(dictionary.get('emailMetaData')) if dictionary.get('emailMetaData') else None
-        file_versions = None
-        if dictionary.get('fileVersions') != None:
-            file_versions = list()
-            for structure in dictionary.get('fileVersions'):
-                file_versions.append(cohesity_management_sdk.models.file_version.FileVersion.from_dictionary(structure))
-        filename = dictionary.get('filename')
-        is_folder = dictionary.get('isFolder')
-        job_id = dictionary.get('jobId')
-        job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-        protection_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('protectionSource')) if dictionary.get('protectionSource') else None
-        registered_source_id = dictionary.get('registeredSourceId')
-        source_id = dictionary.get('sourceId')
-        mtype = dictionary.get('type')
-        view_box_id = dictionary.get('viewBoxId')
-
-        # Return an object of this model
-        return cls(ad_object_meta_data,
-                   document_type,
-                   email_meta_data,
-                   file_versions,
-                   filename,
-                   is_folder,
-                   job_id,
-                   job_uid,
-                   protection_source,
-                   registered_source_id,
-                   source_id,
-                   mtype,
-                   view_box_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.file_search_result
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileSearchResults(object):
 
@@ -29,6 +29,15 @@ class FileSearchResults(object):
         "total_count":'totalCount'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "files":['file_search_result.FileSearchResult']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  files=None,
                  total_count=None):
@@ -53,19 +62,6 @@ class FileSearchResults(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        files = None
-        if dictionary.get('files') != None:
-            files = list()
-            for structure in dictionary.get('files'):
-                files.append(cohesity_management_sdk.models.file_search_result.FileSearchResult.from_dictionary(structure))
-        total_count = dictionary.get('totalCount')
-
-        # Return an object of this model
-        return cls(files,
-                   total_count)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.snapshot_attempt
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileSnapshotInformation(object):
 
@@ -38,6 +38,15 @@ class FileSnapshotInformation(object):
         "snapshot":'snapshot'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "snapshot":'snapshot_attempt.SnapshotAttempt'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  has_archival_copy=None,
                  has_local_copy=None,
@@ -70,23 +79,6 @@ class FileSnapshotInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        has_archival_copy = dictionary.get('hasArchivalCopy')
-        has_local_copy = dictionary.get('hasLocalCopy')
-        has_remote_copy = dictionary.get('hasRemoteCopy')
-        modified_time_usecs = dictionary.get('modifiedTimeUsecs')
-        size_bytes = dictionary.get('sizeBytes')
-        snapshot = cohesity_management_sdk.models.snapshot_attempt.SnapshotAttempt.from_dictionary(dictionary.get('snapshot')) if dictionary.get('snapshot') else None
-
-        # Return an object of this model
-        return cls(has_archival_copy,
-                   has_local_copy,
-                   has_remote_copy,
-                   modified_time_usecs,
-                   size_bytes,
-                   snapshot)
+        return decode_model(cls, dictionary)
 
 
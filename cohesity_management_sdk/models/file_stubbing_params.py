@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.filtering_policy_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileStubbingParams(object):
 
@@ -55,6 +55,15 @@ class FileStubbingParams(object):
         "target_view_name":'targetViewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "filtering_policy":'filtering_policy_proto.FilteringPolicyProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cold_file_window=None,
                  file_select_policy=None,
@@ -89,25 +98,6 @@ class FileStubbingParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cold_file_window = dictionary.get('coldFileWindow')
-        file_select_policy = dictionary.get('fileSelectPolicy')
-        file_size = dictionary.get('fileSize')
-        file_size_policy = dictionary.get('fileSizePolicy')
-        filtering_policy = cohesity_management_sdk.models.filtering_policy_proto.FilteringPolicyProto.from_dictionary(dictionary.get('filteringPolicy')) if dictionary.get('filteringPolicy') else None
-        nfs_mount_path = dictionary.get('nfsMountPath')
-        target_view_name = dictionary.get('targetViewName')
-
-        # Return an object of this model
-        return cls(cold_file_window,
-                   file_select_policy,
-                   file_size,
-                   file_size_policy,
-                   filtering_policy,
-                   nfs_mount_path,
-                   target_view_name)
+        return decode_model(cls, dictionary)
 
 
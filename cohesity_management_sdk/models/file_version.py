@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.snapshot_attempt
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FileVersion(object):
 
@@ -29,6 +29,15 @@ class FileVersion(object):
         "snapshots":'snapshots'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "snapshots":['snapshot_attempt.SnapshotAttempt']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  modified_time_usecs=None,
                  size_bytes=None,
@@ -55,21 +64,6 @@ class FileVersion(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        modified_time_usecs = dictionary.get('modifiedTimeUsecs')
-        size_bytes = dictionary.get('sizeBytes')
-        snapshots = None
-        if dictionary.get('snapshots') != None:
-            snapshots = list()
-            for structure in dictionary.get('snapshots'):
-                snapshots.append(cohesity_management_sdk.models.snapshot_attempt.SnapshotAttempt.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(modified_time_usecs,
-                   size_bytes,
-                   snapshots)
+        return decode_model(cls, dictionary)
 
 
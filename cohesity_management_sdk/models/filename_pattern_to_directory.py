@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FilenamePatternToDirectory(object):
 
@@ -23,6 +24,9 @@ class FilenamePatternToDirectory(object):
         "filename_pattern":'filenamePattern'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  directory=None,
                  filename_pattern=None):
@@ -47,15 +51,6 @@ class FilenamePatternToDirectory(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        directory = dictionary.get('directory')
-        filename_pattern = dictionary.get('filenamePattern')
-
-        # Return an object of this model
-        return cls(directory,
-                   filename_pattern)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FilerAuditLogConfiguration(object):
 
@@ -25,6 +26,9 @@ class FilerAuditLogConfiguration(object):
         "retention_period_days":'retentionPeriodDays'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  enabled=None,
                  retention_period_days=None):
@@ -49,15 +53,6 @@ class FilerAuditLogConfiguration(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        enabled = dictionary.get('enabled')
-        retention_period_days = dictionary.get('retentionPeriodDays')
-
-        # Return an object of this model
-        return cls(enabled,
-                   retention_period_days)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FilesAndFoldersInfo(object):
 
@@ -24,6 +25,9 @@ class FilesAndFoldersInfo(object):
         "is_directory":'isDirectory'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  absolute_path=None,
                  is_directory=None):
@@ -48,15 +52,6 @@ class FilesAndFoldersInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        absolute_path = dictionary.get('absolutePath')
-        is_directory = dictionary.get('isDirectory')
-
-        # Return an object of this model
-        return cls(absolute_path,
-                   is_directory)
+        return decode_model(cls, dictionary)
 
 
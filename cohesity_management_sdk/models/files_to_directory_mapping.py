@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FilesToDirectoryMapping(object):
 
@@ -22,6 +23,9 @@ class FilesToDirectoryMapping(object):
         "target_directory":'targetDirectory'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  file_pattern=None,
                  target_directory=None):
@@ -46,15 +50,6 @@ class FilesToDirectoryMapping(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        file_pattern = dictionary.get('filePattern')
-        target_directory = dictionary.get('targetDirectory')
-
-        # Return an object of this model
-        return cls(file_pattern,
-                   target_directory)
+        return decode_model(cls, dictionary)
 
 
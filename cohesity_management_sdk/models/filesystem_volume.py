@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.disk
-import cohesity_management_sdk.models.logical_volume
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FilesystemVolume(object):
 
@@ -51,6 +50,16 @@ class FilesystemVolume(object):
         "volume_guid":'volumeGuid'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "disks":['disk.Disk'],
+        "logical_volume":'logical_volume.LogicalVolume'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disks=None,
                  display_name=None,
@@ -89,33 +98,6 @@ class FilesystemVolume(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disks = None
-        if dictionary.get('disks') != None:
-            disks = list()
-            for structure in dictionary.get('disks'):
-                disks.append(cohesity_management_sdk.models.disk.Disk.from_dictionary(structure))
-        display_name = dictionary.get('displayName')
-        filesystem_type = dictionary.get('filesystemType')
-        filesystem_uuid = dictionary.get('filesystemUuid')
-        is_supported = dictionary.get('isSupported')
-        logical_volume = cohesity_management_sdk.models.logical_volume.LogicalVolume.from_dictionary(dictionary.get('logicalVolume')) if dictionary.get('logicalVolume') else None
-        logical_volume_type = dictionary.get('logicalVolumeType')
-        name = dictionary.get('name')
-        volume_guid = dictionary.get('volumeGuid')
-
-        # Return an object of this model
-        return cls(disks,
-                   display_name,
-                   filesystem_type,
-                   filesystem_uuid,
-                   is_supported,
-                   logical_volume,
-                   logical_volume_type,
-                   name,
-                   volume_guid)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FilteringPolicyProto(object):
 
@@ -39,6 +40,9 @@ class FilteringPolicyProto(object):
         "deny_filters":'denyFilters'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  allow_filters=None,
                  deny_filters=None):
@@ -63,15 +67,6 @@ class FilteringPolicyProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        allow_filters = dictionary.get('allowFilters')
-        deny_filters = dictionary.get('denyFilters')
-
-        # Return an object of this model
-        return cls(allow_filters,
-                   deny_filters)
+        return decode_model(cls, dictionary)
 
 
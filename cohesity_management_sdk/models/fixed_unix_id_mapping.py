@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FixedUnixIdMapping(object):
 
@@ -23,6 +24,9 @@ class FixedUnixIdMapping(object):
         "uid":'uid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  gid=None,
                  uid=None):
@@ -47,15 +51,6 @@ class FixedUnixIdMapping(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        gid = dictionary.get('gid')
-        uid = dictionary.get('uid')
-
-        # Return an object of this model
-        return cls(gid,
-                   uid)
+        return decode_model(cls, dictionary)
 
 
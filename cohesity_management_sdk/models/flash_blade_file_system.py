@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.flash_blade_nfs_info
-import cohesity_management_sdk.models.flash_blade_smb_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FlashBladeFileSystem(object):
 
@@ -52,6 +51,16 @@ class FlashBladeFileSystem(object):
         "unique_used_bytes":'uniqueUsedBytes'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "nfs_info":'flash_blade_nfs_info.FlashBladeNfsInfo',
+        "smb_info":'flash_blade_smb_info.FlashBladeSmbInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_enabled=None,
                  created_time_msecs=None,
@@ -90,29 +99,6 @@ class FlashBladeFileSystem(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_enabled = dictionary.get('backupEnabled')
-        created_time_msecs = dictionary.get('createdTimeMsecs')
-        logical_capacity_bytes = dictionary.get('logicalCapacityBytes')
-        logical_used_bytes = dictionary.get('logicalUsedBytes')
-        nfs_info = cohesity_management_sdk.models.flash_blade_nfs_info.FlashBladeNfsInfo.from_dictionary(dictionary.get('nfsInfo')) if dictionary.get('nfsInfo') else None
-        physical_used_bytes = dictionary.get('physicalUsedBytes')
-        protocols = dictionary.get('protocols')
-        smb_info = cohesity_management_sdk.models.flash_blade_smb_info.FlashBladeSmbInfo.from_dictionary(dictionary.get('smbInfo')) if dictionary.get('smbInfo') else None
-        unique_used_bytes = dictionary.get('uniqueUsedBytes')
-
-        # Return an object of this model
-        return cls(backup_enabled,
-                   created_time_msecs,
-                   logical_capacity_bytes,
-                   logical_used_bytes,
-                   nfs_info,
-                   physical_used_bytes,
-                   protocols,
-                   smb_info,
-                   unique_used_bytes)
+        return decode_model(cls, dictionary)
 
 
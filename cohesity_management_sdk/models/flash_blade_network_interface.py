@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FlashBladeNetworkInterface(object):
 
@@ -24,6 +25,9 @@ class FlashBladeNetworkInterface(object):
         "vlan":'vlan'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ip_address=None,
                  name=None,
@@ -50,17 +54,6 @@ class FlashBladeNetworkInterface(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ip_address = dictionary.get('ipAddress')
-        name = dictionary.get('name')
-        vlan = dictionary.get('vlan')
-
-        # Return an object of this model
-        return cls(ip_address,
-                   name,
-                   vlan)
+        return decode_model(cls, dictionary)
 
 
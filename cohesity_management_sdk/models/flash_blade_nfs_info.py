@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FlashBladeNfsInfo(object):
 
@@ -29,6 +30,9 @@ class FlashBladeNfsInfo(object):
         "export_rules":'exportRules'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  export_rules=None):
         """Constructor for the FlashBladeNfsInfo class"""
@@ -51,13 +55,6 @@ class FlashBladeNfsInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        export_rules = dictionary.get('exportRules')
-
-        # Return an object of this model
-        return cls(export_rules)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.flash_blade_file_system
-import cohesity_management_sdk.models.flash_blade_storage_array
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FlashBladeProtectionSource(object):
 
@@ -32,6 +31,16 @@ class FlashBladeProtectionSource(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "file_system":'flash_blade_file_system.FlashBladeFileSystem',
+        "storage_array":'flash_blade_storage_array.FlashBladeStorageArray'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  file_system=None,
                  name=None,
@@ -60,19 +69,6 @@ class FlashBladeProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        file_system = cohesity_management_sdk.models.flash_blade_file_system.FlashBladeFileSystem.from_dictionary(dictionary.get('fileSystem')) if dictionary.get('fileSystem') else None
-        name = dictionary.get('name')
-        storage_array = cohesity_management_sdk.models.flash_blade_storage_array.FlashBladeStorageArray.from_dictionary(dictionary.get('storageArray')) if dictionary.get('storageArray') else None
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(file_system,
-                   name,
-                   storage_array,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
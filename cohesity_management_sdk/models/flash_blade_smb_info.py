@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FlashBladeSmbInfo(object):
 
@@ -27,6 +28,9 @@ class FlashBladeSmbInfo(object):
         "acl_mode":'aclMode'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  acl_mode=None):
         """Constructor for the FlashBladeSmbInfo class"""
@@ -49,13 +53,6 @@ class FlashBladeSmbInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        acl_mode = dictionary.get('aclMode')
-
-        # Return an object of this model
-        return cls(acl_mode)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.flash_blade_network_interface
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FlashBladeStorageArray(object):
 
@@ -35,6 +35,15 @@ class FlashBladeStorageArray(object):
         "version":'version'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "networks":['flash_blade_network_interface.FlashBladeNetworkInterface']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  capacity_bytes=None,
                  id=None,
@@ -67,27 +76,6 @@ class FlashBladeStorageArray(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        capacity_bytes = dictionary.get('capacityBytes')
-        id = dictionary.get('id')
-        networks = None
-        if dictionary.get('networks') != None:
-            networks = list()
-            for structure in dictionary.get('networks'):
-                networks.append(cohesity_management_sdk.models.flash_blade_network_interface.FlashBladeNetworkInterface.from_dictionary(structure))
-        physical_used_bytes = dictionary.get('physicalUsedBytes')
-        revision = dictionary.get('revision')
-        version = dictionary.get('version')
-
-        # Return an object of this model
-        return cls(capacity_bytes,
-                   id,
-                   networks,
-                   physical_used_bytes,
-                   revision,
-                   version)
+        return decode_model(cls, dictionary)
 
 
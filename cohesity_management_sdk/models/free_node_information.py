@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FreeNodeInformation(object):
 
@@ -42,6 +43,9 @@ class FreeNodeInformation(object):
         "software_version":'softwareVersion'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  chassis_serial=None,
                  connected_to=None,
@@ -82,31 +86,6 @@ class FreeNodeInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        chassis_serial = dictionary.get('chassisSerial')
-        connected_to = dictionary.get('connectedTo')
-        id = dictionary.get('id')
-        ip = dictionary.get('ip')
-        ipmi_ip = dictionary.get('ipmiIp')
-        node_serial = dictionary.get('nodeSerial')
-        node_ui_slot = dictionary.get('nodeUiSlot')
-        num_slots_in_chassis = dictionary.get('numSlotsInChassis')
-        slot_number = dictionary.get('slotNumber')
-        software_version = dictionary.get('softwareVersion')
-
-        # Return an object of this model
-        return cls(chassis_serial,
-                   connected_to,
-                   id,
-                   ip,
-                   ipmi_ip,
-                   node_serial,
-                   node_ui_slot,
-                   num_slots_in_chassis,
-                   slot_number,
-                   software_version)
+        return decode_model(cls, dictionary)
 
 
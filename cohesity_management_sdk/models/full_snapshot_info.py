@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_info
-import cohesity_management_sdk.models.snapshot_target_settings
+from cohesity_management_sdk.model_decoder import decode_model
 
 class FullSnapshotInfo(object):
 
@@ -25,6 +24,16 @@ class FullSnapshotInfo(object):
         "snapshot_target":'snapshotTarget'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "restore_info":'restore_info.RestoreInfo',
+        "snapshot_target":['snapshot_target_settings.SnapshotTargetSettings']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  restore_info=None,
                  snapshot_target=None):
@@ -49,19 +58,6 @@ class FullSnapshotInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        restore_info = cohesity_management_sdk.models.restore_info.RestoreInfo.from_dictionary(dictionary.get('restoreInfo')) if dictionary.get('restoreInfo') else None
-        snapshot_target = None
-        if dictionary.get('snapshotTarget') != None:
-            snapshot_target = list()
-            for structure in dictionary.get('snapshotTarget'):
-                snapshot_target.append(cohesity_management_sdk.models.snapshot_target_settings.SnapshotTargetSettings.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(restore_info,
-                   snapshot_target)
+        return decode_model(cls, dictionary)
 
 
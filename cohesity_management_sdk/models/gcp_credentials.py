@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GcpCredentials(object):
 
@@ -46,6 +47,9 @@ class GcpCredentials(object):
         "vpc_subnetwork":'vpcSubnetwork'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  client_email_address=None,
                  client_private_key=None,
@@ -78,23 +82,6 @@ class GcpCredentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        client_email_address = dictionary.get('clientEmailAddress')
-        client_private_key = dictionary.get('clientPrivateKey')
-        gcp_type = dictionary.get('gcpType')
-        project_id = dictionary.get('projectId')
-        vpc_network = dictionary.get('vpcNetwork')
-        vpc_subnetwork = dictionary.get('vpcSubnetwork')
-
-        # Return an object of this model
-        return cls(client_email_address,
-                   client_private_key,
-                   gcp_type,
-                   project_id,
-                   vpc_network,
-                   vpc_subnetwork)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GcpParams(object):
 
@@ -27,6 +28,9 @@ class GcpParams(object):
         "virtual_private_cloud_id":'virtualPrivateCloudId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  instance_id=None,
                  region=None,
@@ -55,19 +59,6 @@ class GcpParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        instance_id = dictionary.get('instanceId')
-        region = dictionary.get('region')
-        subnet_id = dictionary.get('subnetId')
-        virtual_private_cloud_id = dictionary.get('virtualPrivateCloudId')
-
-        # Return an object of this model
-        return cls(instance_id,
-                   region,
-                   subnet_id,
-                   virtual_private_cloud_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GcpProtectionSource(object):
 
@@ -114,6 +115,9 @@ class GcpProtectionSource(object):
         "vpc_subnetwork":'vpcSubnetwork'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  client_email_address=None,
                  client_private_key=None,
@@ -164,41 +168,6 @@ class GcpProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        client_email_address = dictionary.get('clientEmailAddress')
-        client_private_key = dictionary.get('clientPrivateKey')
-        gcp_type = dictionary.get('gcpType')
-        host_type = dictionary.get('hostType')
-        ip_addresses_vm = dictionary.get('ipAddressesVM')
-        name = dictionary.get('name')
-        owner_id = dictionary.get('ownerId')
-        physical_source_id = dictionary.get('physicalSourceId')
-        project_id = dictionary.get('projectId')
-        region_id = dictionary.get('regionId')
-        resource_id = dictionary.get('resourceId')
-        restore_task_id = dictionary.get('restoreTaskId')
-        mtype = dictionary.get('type')
-        vpc_network = dictionary.get('vpcNetwork')
-        vpc_subnetwork = dictionary.get('vpcSubnetwork')
-
-        # Return an object of this model
-        return cls(client_email_address,
-                   client_private_key,
-                   gcp_type,
-                   host_type,
-                   ip_addresses_vm,
-                   name,
-                   owner_id,
-                   physical_source_id,
-                   project_id,
-                   region_id,
-                   resource_id,
-                   restore_task_id,
-                   mtype,
-                   vpc_network,
-                   vpc_subnetwork)
+        return decode_model(cls, dictionary)
 
 
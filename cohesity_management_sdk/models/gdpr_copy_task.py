@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GdprCopyTask(object):
 
@@ -36,6 +37,9 @@ class GdprCopyTask(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  job_id=None,
                  cloud_target_type=None,
@@ -70,25 +74,6 @@ class GdprCopyTask(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        job_id = dictionary.get('JobId')
-        cloud_target_type = dictionary.get('cloudTargetType')
-        expiry_time_usecs = dictionary.get('expiryTimeUsecs')
-        target_id = dictionary.get('targetId')
-        target_name = dictionary.get('targetName')
-        total_snapshots = dictionary.get('totalSnapshots')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(job_id,
-                   cloud_target_type,
-                   expiry_time_usecs,
-                   target_id,
-                   target_name,
-                   total_snapshots,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GetAlertTypesParams(object):
 
@@ -34,6 +35,9 @@ class GetAlertTypesParams(object):
         "alert_category_list":'alertCategoryList'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alert_category_list=None):
         """Constructor for the GetAlertTypesParams class"""
@@ -56,13 +60,6 @@ class GetAlertTypesParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alert_category_list = dictionary.get('alertCategoryList')
-
-        # Return an object of this model
-        return cls(alert_category_list)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_source_tree_info
-import cohesity_management_sdk.models.protection_summary
-import cohesity_management_sdk.models.protection_summary_by_env
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GetRegistrationInfoResponse(object):
 
@@ -34,6 +32,17 @@ class GetRegistrationInfoResponse(object):
         "stats_by_env":'statsByEnv'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "root_nodes":['protection_source_tree_info.ProtectionSourceTreeInfo'],
+        "stats":'protection_summary.ProtectionSummary',
+        "stats_by_env":['protection_summary_by_env.ProtectionSummaryByEnv']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  root_nodes=None,
                  stats=None,
@@ -60,25 +69,6 @@ class GetRegistrationInfoResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        root_nodes = None
-        if dictionary.get('rootNodes') != None:
-            root_nodes = list()
-            for structure in dictionary.get('rootNodes'):
-                root_nodes.append(cohesity_management_sdk.models.protection_source_tree_info.ProtectionSourceTreeInfo.from_dictionary(structure))
-        stats = cohesity_management_sdk.models.protection_summary.ProtectionSummary.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-        stats_by_env = None
-        if dictionary.get('statsByEnv') != None:
-            stats_by_env = list()
-            for structure in dictionary.get('statsByEnv'):
-                stats_by_env.append(cohesity_management_sdk.models.protection_summary_by_env.ProtectionSummaryByEnv.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(root_nodes,
-                   stats,
-                   stats_by_env)
+        return decode_model(cls, dictionary)
 
 
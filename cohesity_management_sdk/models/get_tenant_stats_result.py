@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.tenant_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GetTenantStatsResult(object):
 
@@ -23,6 +23,15 @@ class GetTenantStatsResult(object):
         "stats_list":'statsList'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "stats_list":['tenant_stats.TenantStats']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cookie=None,
                  stats_list=None):
@@ -47,19 +56,6 @@ class GetTenantStatsResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cookie = dictionary.get('cookie')
-        stats_list = None
-        if dictionary.get('statsList') != None:
-            stats_list = list()
-            for structure in dictionary.get('statsList'):
-                stats_list.append(cohesity_management_sdk.models.tenant_stats.TenantStats.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(cookie,
-                   stats_list)
+        return decode_model(cls, dictionary)
 
 
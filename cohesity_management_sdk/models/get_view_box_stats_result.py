@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.storage_domain_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GetViewBoxStatsResult(object):
 
@@ -20,6 +20,15 @@ class GetViewBoxStatsResult(object):
         "stats_list":'statsList'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "stats_list":['storage_domain_stats.StorageDomainStats']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  stats_list=None):
         """Constructor for the GetViewBoxStatsResult class"""
@@ -42,17 +51,6 @@ class GetViewBoxStatsResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        stats_list = None
-        if dictionary.get('statsList') != None:
-            stats_list = list()
-            for structure in dictionary.get('statsList'):
-                stats_list.append(cohesity_management_sdk.models.storage_domain_stats.StorageDomainStats.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(stats_list)
+        return decode_model(cls, dictionary)
 
 
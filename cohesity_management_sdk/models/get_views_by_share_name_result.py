@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.share
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GetViewsByShareNameResult(object):
 
@@ -26,6 +26,15 @@ class GetViewsByShareNameResult(object):
         "shares_list":'sharesList'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "shares_list":['share.Share']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  pagination_cookie=None,
                  shares_list=None):
@@ -50,19 +59,6 @@ class GetViewsByShareNameResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        pagination_cookie = dictionary.get('paginationCookie')
-        shares_list = None
-        if dictionary.get('sharesList') != None:
-            shares_list = list()
-            for structure in dictionary.get('sharesList'):
-                shares_list.append(cohesity_management_sdk.models.share.Share.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(pagination_cookie,
-                   shares_list)
+        return decode_model(cls, dictionary)
 
 
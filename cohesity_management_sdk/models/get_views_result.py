@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.view
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GetViewsResult(object):
 
@@ -30,6 +30,15 @@ class GetViewsResult(object):
         "views":'views'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "views":['view.View']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  last_result=None,
                  views=None):
@@ -54,19 +63,6 @@ class GetViewsResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        last_result = dictionary.get('lastResult')
-        views = None
-        if dictionary.get('views') != None:
-            views = list()
-            for structure in dictionary.get('views'):
-                views.append(cohesity_management_sdk.models.view.View.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(last_result,
-                   views)
+        return decode_model(cls, dictionary)
 
 
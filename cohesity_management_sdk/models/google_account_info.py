@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GoogleAccountInfo(object):
 
@@ -20,6 +21,9 @@ class GoogleAccountInfo(object):
         "user_id":'userId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  account_id=None,
                  user_id=None):
@@ -44,15 +48,6 @@ class GoogleAccountInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        account_id = dictionary.get('accountId')
-        user_id = dictionary.get('userId')
-
-        # Return an object of this model
-        return cls(account_id,
-                   user_id)
+        return decode_model(cls, dictionary)
 
 
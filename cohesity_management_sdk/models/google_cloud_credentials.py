@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GoogleCloudCredentials(object):
 
@@ -38,6 +39,9 @@ class GoogleCloudCredentials(object):
         "tier_type":'tierType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  client_email_address=None,
                  client_private_key=None,
@@ -66,19 +70,6 @@ class GoogleCloudCredentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        client_email_address = dictionary.get('clientEmailAddress')
-        client_private_key = dictionary.get('clientPrivateKey')
-        project_id = dictionary.get('projectId')
-        tier_type = dictionary.get('tierType')
-
-        # Return an object of this model
-        return cls(client_email_address,
-                   client_private_key,
-                   project_id,
-                   tier_type)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GpfsCluster(object):
 
@@ -24,6 +25,9 @@ class GpfsCluster(object):
         "primary_server":'primaryServer'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ces_addresses=None,
                  id=None,
@@ -50,17 +54,6 @@ class GpfsCluster(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ces_addresses = dictionary.get('cesAddresses')
-        id = dictionary.get('id')
-        primary_server = dictionary.get('primaryServer')
-
-        # Return an object of this model
-        return cls(ces_addresses,
-                   id,
-                   primary_server)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GpfsFileset(object):
 
@@ -27,6 +28,9 @@ class GpfsFileset(object):
         "protocols":'protocols'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  id=None,
                  name=None,
@@ -55,19 +59,6 @@ class GpfsFileset(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        path = dictionary.get('path')
-        protocols = dictionary.get('protocols')
-
-        # Return an object of this model
-        return cls(id,
-                   name,
-                   path,
-                   protocols)
+        return decode_model(cls, dictionary)
 
 
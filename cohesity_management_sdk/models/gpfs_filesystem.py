@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GpfsFilesystem(object):
 
@@ -20,6 +21,9 @@ class GpfsFilesystem(object):
         "path":'path'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  id=None,
                  path=None):
@@ -44,15 +48,6 @@ class GpfsFilesystem(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        id = dictionary.get('id')
-        path = dictionary.get('path')
-
-        # Return an object of this model
-        return cls(id,
-                   path)
+        return decode_model(cls, dictionary)
 
 
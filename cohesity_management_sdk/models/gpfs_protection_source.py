@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.gpfs_cluster
-import cohesity_management_sdk.models.gpfs_fileset
-import cohesity_management_sdk.models.gpfs_filesystem
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GpfsProtectionSource(object):
 
@@ -35,6 +33,17 @@ class GpfsProtectionSource(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cluster":'gpfs_cluster.GpfsCluster',
+        "fileset":'gpfs_fileset.GpfsFileset',
+        "filesystem":'gpfs_filesystem.GpfsFilesystem'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster=None,
                  fileset=None,
@@ -65,21 +74,6 @@ class GpfsProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster = cohesity_management_sdk.models.gpfs_cluster.GpfsCluster.from_dictionary(dictionary.get('cluster')) if dictionary.get('cluster') else None
-        fileset = cohesity_management_sdk.models.gpfs_fileset.GpfsFileset.from_dictionary(dictionary.get('fileset')) if dictionary.get('fileset') else None
-        filesystem = cohesity_management_sdk.models.gpfs_filesystem.GpfsFilesystem.from_dictionary(dictionary.get('filesystem')) if dictionary.get('filesystem') else None
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(cluster,
-                   fileset,
-                   filesystem,
-                   name,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GranularityBucket(object):
 
@@ -30,6 +31,9 @@ class GranularityBucket(object):
         "multiplier":'multiplier'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  granularity=None,
                  multiplier=None):
@@ -54,15 +58,6 @@ class GranularityBucket(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        granularity = dictionary.get('granularity')
-        multiplier = dictionary.get('multiplier')
-
-        # Return an object of this model
-        return cls(granularity,
-                   multiplier)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.smb_principal
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Group(object):
 
@@ -54,6 +54,15 @@ class Group(object):
         "users":'users'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "smb_principals":['smb_principal.SmbPrincipal']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  created_time_msecs=None,
                  description=None,
@@ -98,39 +107,6 @@ class Group(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        created_time_msecs = dictionary.get('createdTimeMsecs')
-        description = dictionary.get('description')
-        domain = dictionary.get('domain')
-        last_updated_time_msecs = dictionary.get('lastUpdatedTimeMsecs')
-        name = dictionary.get('name')
-        restricted = dictionary.get('restricted')
-        roles = dictionary.get('roles')
-        sid = dictionary.get('sid')
-        smb_principals = None
-        if dictionary.get('smbPrincipals') != None:
-            smb_principals = list()
-            for structure in dictionary.get('smbPrincipals'):
-                smb_principals.append(cohesity_management_sdk.models.smb_principal.SmbPrincipal.from_dictionary(structure))
-        tenant_ids = dictionary.get('tenantIds')
-        usernames = dictionary.get('usernames')
-        users = dictionary.get('users')
-
-        # Return an object of this model
-        return cls(created_time_msecs,
-                   description,
-                   domain,
-                   last_updated_time_msecs,
-                   name,
-                   restricted,
-                   roles,
-                   sid,
-                   smb_principals,
-                   tenant_ids,
-                   usernames,
-                   users)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GroupDeleteParameters(object):
 
@@ -28,6 +29,9 @@ class GroupDeleteParameters(object):
         "names":'names'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain=None,
                  names=None):
@@ -52,15 +56,6 @@ class GroupDeleteParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain = dictionary.get('domain')
-        names = dictionary.get('names')
-
-        # Return an object of this model
-        return cls(domain,
-                   names)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GroupInfo(object):
 
@@ -22,6 +23,9 @@ class GroupInfo(object):
         "sid":'sid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain=None,
                  group_name=None,
@@ -48,17 +52,6 @@ class GroupInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain = dictionary.get('domain')
-        group_name = dictionary.get('groupName')
-        sid = dictionary.get('sid')
-
-        # Return an object of this model
-        return cls(domain,
-                   group_name,
-                   sid)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.smb_principal
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GroupParameters(object):
 
@@ -45,6 +45,15 @@ class GroupParameters(object):
         "users":'users'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "smb_principals":['smb_principal.SmbPrincipal']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  description=None,
                  domain=None,
@@ -81,31 +90,6 @@ class GroupParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        description = dictionary.get('description')
-        domain = dictionary.get('domain')
-        name = dictionary.get('name')
-        restricted = dictionary.get('restricted')
-        roles = dictionary.get('roles')
-        smb_principals = None
-        if dictionary.get('smbPrincipals') != None:
-            smb_principals = list()
-            for structure in dictionary.get('smbPrincipals'):
-                smb_principals.append(cohesity_management_sdk.models.smb_principal.SmbPrincipal.from_dictionary(structure))
-        tenant_ids = dictionary.get('tenantIds')
-        users = dictionary.get('users')
-
-        # Return an object of this model
-        return cls(description,
-                   domain,
-                   name,
-                   restricted,
-                   roles,
-                   smb_principals,
-                   tenant_ids,
-                   users)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class GuidPair(object):
 
@@ -22,6 +23,9 @@ class GuidPair(object):
         "source_guid":'sourceGuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  dest_guid=None,
                  source_guid=None):
@@ -46,15 +50,6 @@ class GuidPair(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        dest_guid = dictionary.get('destGuid')
-        source_guid = dictionary.get('sourceGuid')
-
-        # Return an object of this model
-        return cls(dest_guid,
-                   source_guid)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class HardwareInfo(object):
 
@@ -42,6 +43,9 @@ class HardwareInfo(object):
         "slot_number":'slotNumber'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  chassis_model=None,
                  chassis_serial=None,
@@ -86,35 +90,6 @@ class HardwareInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        chassis_model = dictionary.get('chassisModel')
-        chassis_serial = dictionary.get('chassisSerial')
-        chassis_type = dictionary.get('chassisType')
-        cohesity_chassis_serial = dictionary.get('cohesityChassisSerial')
-        cohesity_node_serial = dictionary.get('cohesityNodeSerial')
-        hba_model = dictionary.get('hbaModel')
-        ipmi_lan_channel = dictionary.get('ipmiLanChannel')
-        max_slots = dictionary.get('maxSlots')
-        node_model = dictionary.get('nodeModel')
-        node_serial = dictionary.get('nodeSerial')
-        product_model = dictionary.get('productModel')
-        slot_number = dictionary.get('slotNumber')
-
-        # Return an object of this model
-        return cls(chassis_model,
-                   chassis_serial,
-                   chassis_type,
-                   cohesity_chassis_serial,
-                   cohesity_node_serial,
-                   hba_model,
-                   ipmi_lan_channel,
-                   max_slots,
-                   node_model,
-                   node_serial,
-                   product_model,
-                   slot_number)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.alert
+from cohesity_management_sdk.model_decoder import decode_model
 
 class HealthTile(object):
 
@@ -38,6 +38,15 @@ class HealthTile(object):
         "raw_used_bytes":'rawUsedBytes'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "last_day_alerts":['alert.Alert']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  capacity_bytes=None,
                  cluster_cloud_usage_bytes=None,
@@ -76,33 +85,6 @@ class HealthTile(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        capacity_bytes = dictionary.get('capacityBytes')
-        cluster_cloud_usage_bytes = dictionary.get('clusterCloudUsageBytes')
-        last_day_alerts = None
-        if dictionary.get('lastDayAlerts') != None:
-            last_day_alerts = list()
-            for structure in dictionary.get('lastDayAlerts'):
-                last_day_alerts.append(cohesity_management_sdk.models.alert.Alert.from_dictionary(structure))
-        last_day_num_criticals = dictionary.get('lastDayNumCriticals')
-        last_day_num_warnings = dictionary.get('lastDayNumWarnings')
-        num_nodes = dictionary.get('numNodes')
-        num_nodes_with_issues = dictionary.get('numNodesWithIssues')
-        percent_full = dictionary.get('percentFull')
-        raw_used_bytes = dictionary.get('rawUsedBytes')
-
-        # Return an object of this model
-        return cls(capacity_bytes,
-                   cluster_cloud_usage_bytes,
-                   last_day_alerts,
-                   last_day_num_criticals,
-                   last_day_num_warnings,
-                   num_nodes,
-                   num_nodes_with_issues,
-                   percent_full,
-                   raw_used_bytes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class HostEntry(object):
 
@@ -22,6 +23,9 @@ class HostEntry(object):
         "ip":'ip'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain_names=None,
                  ip=None):
@@ -46,15 +50,6 @@ class HostEntry(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain_names = dictionary.get('domainNames')
-        ip = dictionary.get('ip')
-
-        # Return an object of this model
-        return cls(domain_names,
-                   ip)
+        return decode_model(cls, dictionary)
 
 
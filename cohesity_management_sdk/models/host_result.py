@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class HostResult(object):
 
@@ -20,6 +21,9 @@ class HostResult(object):
         "message":'message'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  message=None):
         """Constructor for the HostResult class"""
@@ -42,13 +46,6 @@ class HostResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        message = dictionary.get('message')
-
-        # Return an object of this model
-        return cls(message)
+        return decode_model(cls, dictionary)
 
 
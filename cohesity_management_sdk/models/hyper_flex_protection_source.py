@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class HyperFlexProtectionSource(object):
 
@@ -28,6 +29,9 @@ class HyperFlexProtectionSource(object):
         "uuid":'uuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  product_version=None,
@@ -56,19 +60,6 @@ class HyperFlexProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        product_version = dictionary.get('productVersion')
-        mtype = dictionary.get('type')
-        uuid = dictionary.get('uuid')
-
-        # Return an object of this model
-        return cls(name,
-                   product_version,
-                   mtype,
-                   uuid)
+        return decode_model(cls, dictionary)
 
 
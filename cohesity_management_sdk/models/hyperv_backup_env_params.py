@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class HypervBackupEnvParams(object):
 
@@ -20,6 +21,9 @@ class HypervBackupEnvParams(object):
         "allow_crash_consistent_snapshot":'allowCrashConsistentSnapshot'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  allow_crash_consistent_snapshot=None):
         """Constructor for the HypervBackupEnvParams class"""
@@ -42,13 +46,6 @@ class HypervBackupEnvParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        allow_crash_consistent_snapshot = dictionary.get('allowCrashConsistentSnapshot')
-
-        # Return an object of this model
-        return cls(allow_crash_consistent_snapshot)
+        return decode_model(cls, dictionary)
 
 
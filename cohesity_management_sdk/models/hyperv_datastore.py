@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class HypervDatastore(object):
 
@@ -30,6 +31,9 @@ class HypervDatastore(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  capacity=None,
                  free_space=None,
@@ -58,19 +62,6 @@ class HypervDatastore(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        capacity = dictionary.get('capacity')
-        free_space = dictionary.get('freeSpace')
-        mount_points = dictionary.get('mountPoints')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(capacity,
-                   free_space,
-                   mount_points,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
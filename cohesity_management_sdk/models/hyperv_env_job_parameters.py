@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class HypervEnvJobParameters(object):
 
@@ -22,6 +23,9 @@ class HypervEnvJobParameters(object):
         "fallback_to_crash_consistent":'fallbackToCrashConsistent'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  fallback_to_crash_consistent=None):
         """Constructor for the HypervEnvJobParameters class"""
@@ -44,13 +48,6 @@ class HypervEnvJobParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        fallback_to_crash_consistent = dictionary.get('fallbackToCrashConsistent')
-
-        # Return an object of this model
-        return cls(fallback_to_crash_consistent)
+        return decode_model(cls, dictionary)
 
 
@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.agent_information
-import cohesity_management_sdk.models.hyperv_datastore
-import cohesity_management_sdk.models.tag_attribute
-import cohesity_management_sdk.models.hyperv_virtual_machine
+from cohesity_management_sdk.model_decoder import decode_model
 
 class HypervProtectionSource(object):
 
@@ -76,6 +73,18 @@ class HypervProtectionSource(object):
         "vm_info":'vmInfo'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "agents":['agent_information.AgentInformation'],
+        "datastore_info":'hyperv_datastore.HypervDatastore',
+        "tag_attributes":['tag_attribute.TagAttribute'],
+        "vm_info":'hyperv_virtual_machine.HypervVirtualMachine'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  agents=None,
                  backup_type=None,
@@ -120,43 +129,6 @@ class HypervProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        agents = None
-        if dictionary.get('agents') != None:
-            agents = list()
-            for structure in dictionary.get('agents'):
-                agents.append(cohesity_management_sdk.models.agent_information.AgentInformation.from_dictionary(structure))
-        backup_type = dictionary.get('backupType')
-        cluster_name = dictionary.get('clusterName')
-        datastore_info = cohesity_management_sdk.models.hyperv_datastore.HypervDatastore.from_dictionary(dictionary.get('datastoreInfo')) if dictionary.get('datastoreInfo') else None
-        description = dictionary.get('description')
-        host_type = dictionary.get('hostType')
-        hyperv_uuid = dictionary.get('hypervUuid')
-        name = dictionary.get('name')
-        tag_attributes = None
-        if dictionary.get('tagAttributes') != None:
-            tag_attributes = list()
-            for structure in dictionary.get('tagAttributes'):
-                tag_attributes.append(cohesity_management_sdk.models.tag_attribute.TagAttribute.from_dictionary(structure))
-        mtype = dictionary.get('type')
-        uuid = dictionary.get('uuid')
-        vm_info = cohesity_management_sdk.models.hyperv_virtual_machine.HypervVirtualMachine.from_dictionary(dictionary.get('vmInfo')) if dictionary.get('vmInfo') else None
-
-        # Return an object of this model
-        return cls(agents,
-                   backup_type,
-                   cluster_name,
-                   datastore_info,
-                   description,
-                   host_type,
-                   hyperv_uuid,
-                   name,
-                   tag_attributes,
-                   mtype,
-                   uuid,
-                   vm_info)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class HypervRestoreParameters(object):
 
@@ -65,6 +66,9 @@ class HypervRestoreParameters(object):
         "suffix":'suffix'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  datastore_id=None,
                  disable_network=None,
@@ -99,25 +103,6 @@ class HypervRestoreParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        datastore_id = dictionary.get('datastoreId')
-        disable_network = dictionary.get('disableNetwork')
-        network_id = dictionary.get('networkId')
-        powered_on = dictionary.get('poweredOn')
-        prefix = dictionary.get('prefix')
-        resource_id = dictionary.get('resourceId')
-        suffix = dictionary.get('suffix')
-
-        # Return an object of this model
-        return cls(datastore_id,
-                   disable_network,
-                   network_id,
-                   powered_on,
-                   prefix,
-                   resource_id,
-                   suffix)
+        return decode_model(cls, dictionary)
 
 
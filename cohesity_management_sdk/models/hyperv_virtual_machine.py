@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class HypervVirtualMachine(object):
 
@@ -36,6 +37,9 @@ class HypervVirtualMachine(object):
         "vm_backup_type":'vmBackupType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  is_highly_available=None,
                  version=None,
@@ -64,19 +68,6 @@ class HypervVirtualMachine(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        is_highly_available = dictionary.get('isHighlyAvailable')
-        version = dictionary.get('version')
-        vm_backup_status = dictionary.get('vmBackupStatus')
-        vm_backup_type = dictionary.get('vmBackupType')
-
-        # Return an object of this model
-        return cls(is_highly_available,
-                   version,
-                   vm_backup_status,
-                   vm_backup_type)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IcapConnectionStatusResponse(object):
 
@@ -22,6 +23,9 @@ class IcapConnectionStatusResponse(object):
         "succeeded_connection_status":'succeededConnectionStatus'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  failed_connection_status=None,
                  succeeded_connection_status=None):
@@ -46,15 +50,6 @@ class IcapConnectionStatusResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        failed_connection_status = dictionary.get('failedConnectionStatus')
-        succeeded_connection_status = dictionary.get('succeededConnectionStatus')
-
-        # Return an object of this model
-        return cls(failed_connection_status,
-                   succeeded_connection_status)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.user_id_mapping
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IdMappingInfo(object):
 
@@ -27,6 +27,16 @@ class IdMappingInfo(object):
         "user_id_mapping_info":'userIdMappingInfo'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "fallback_user_id_mapping_info":'user_id_mapping.UserIdMapping',
+        "user_id_mapping_info":'user_id_mapping.UserIdMapping'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  fallback_user_id_mapping_info=None,
                  unix_root_sid=None,
@@ -53,17 +63,6 @@ class IdMappingInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        fallback_user_id_mapping_info = cohesity_management_sdk.models.user_id_mapping.UserIdMapping.from_dictionary(dictionary.get('fallbackUserIdMappingInfo')) if dictionary.get('fallbackUserIdMappingInfo') else None
-        unix_root_sid = dictionary.get('unixRootSid')
-        user_id_mapping_info = cohesity_management_sdk.models.user_id_mapping.UserIdMapping.from_dictionary(dictionary.get('userIdMappingInfo')) if dictionary.get('userIdMappingInfo') else None
-
-        # Return an object of this model
-        return cls(fallback_user_id_mapping_info,
-                   unix_root_sid,
-                   user_id_mapping_info)
+        return decode_model(cls, dictionary)
 
 
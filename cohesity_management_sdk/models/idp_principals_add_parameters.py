@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IdpPrincipalsAddParameters(object):
 
@@ -49,6 +50,9 @@ class IdpPrincipalsAddParameters(object):
         "roles":'roles'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain=None,
                  object_class=None,
@@ -79,21 +83,6 @@ class IdpPrincipalsAddParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain = dictionary.get('domain')
-        object_class = dictionary.get('objectClass')
-        principal_name = dictionary.get('principalName')
-        restricted = dictionary.get('restricted')
-        roles = dictionary.get('roles')
-
-        # Return an object of this model
-        return cls(domain,
-                   object_class,
-                   principal_name,
-                   restricted,
-                   roles)
+        return decode_model(cls, dictionary)
 
 
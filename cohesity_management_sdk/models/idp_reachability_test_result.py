@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IdpReachabilityTestResult(object):
 
@@ -18,6 +19,9 @@ class IdpReachabilityTestResult(object):
         "reachable":'reachable'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  reachable=None):
         """Constructor for the IdpReachabilityTestResult class"""
@@ -40,13 +44,6 @@ class IdpReachabilityTestResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        reachable = dictionary.get('reachable')
-
-        # Return an object of this model
-        return cls(reachable)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IdpServiceConfiguration(object):
 
@@ -73,6 +74,9 @@ class IdpServiceConfiguration(object):
         "tenant_id":'tenantId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  allow_local_authentication=None,
                  certificate=None,
@@ -119,37 +123,6 @@ class IdpServiceConfiguration(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        allow_local_authentication = dictionary.get('allowLocalAuthentication')
-        certificate = dictionary.get('certificate')
-        certificate_filename = dictionary.get('certificateFilename')
-        domain = dictionary.get('domain')
-        enable = dictionary.get('enable')
-        id = dictionary.get('id')
-        issuer_id = dictionary.get('issuerId')
-        name = dictionary.get('name')
-        roles = dictionary.get('roles')
-        saml_attribute_name = dictionary.get('samlAttributeName')
-        sign_request = dictionary.get('signRequest')
-        sso_url = dictionary.get('ssoUrl')
-        tenant_id = dictionary.get('tenantId')
-
-        # Return an object of this model
-        return cls(allow_local_authentication,
-                   certificate,
-                   certificate_filename,
-                   domain,
-                   enable,
-                   id,
-                   issuer_id,
-                   name,
-                   roles,
-                   saml_attribute_name,
-                   sign_request,
-                   sso_url,
-                   tenant_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IdpUserInfo(object):
 
@@ -28,6 +29,9 @@ class IdpUserInfo(object):
         "vendor":'vendor'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  idp_id=None,
                  issuer_id=None,
@@ -56,19 +60,6 @@ class IdpUserInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        idp_id = dictionary.get('idpId')
-        issuer_id = dictionary.get('issuerId')
-        user_id = dictionary.get('userId')
-        vendor = dictionary.get('vendor')
-
-        # Return an object of this model
-        return cls(idp_id,
-                   issuer_id,
-                   user_id,
-                   vendor)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IndexAndSnapshots(object):
 
@@ -38,6 +38,16 @@ class IndexAndSnapshots(object):
         "view_box_id":'viewBoxId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "archive_task_uid":'universal_id.UniversalId',
+        "remote_protection_job_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  archive_task_uid=None,
                  end_time_usecs=None,
@@ -68,21 +78,6 @@ class IndexAndSnapshots(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        archive_task_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('archiveTaskUid')) if dictionary.get('archiveTaskUid') else None
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        remote_protection_job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('remoteProtectionJobUid')) if dictionary.get('remoteProtectionJobUid') else None
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        view_box_id = dictionary.get('viewBoxId')
-
-        # Return an object of this model
-        return cls(archive_task_uid,
-                   end_time_usecs,
-                   remote_protection_job_uid,
-                   start_time_usecs,
-                   view_box_id)
+        return decode_model(cls, dictionary)
 
 
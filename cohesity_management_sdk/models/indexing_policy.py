@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IndexingPolicy(object):
 
@@ -29,6 +30,9 @@ class IndexingPolicy(object):
         "disable_indexing":'disableIndexing'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  allow_prefixes=None,
                  deny_prefixes=None,
@@ -55,17 +59,6 @@ class IndexingPolicy(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        allow_prefixes = dictionary.get('allowPrefixes')
-        deny_prefixes = dictionary.get('denyPrefixes')
-        disable_indexing = dictionary.get('disableIndexing')
-
-        # Return an object of this model
-        return cls(allow_prefixes,
-                   deny_prefixes,
-                   disable_indexing)
+        return decode_model(cls, dictionary)
 
 
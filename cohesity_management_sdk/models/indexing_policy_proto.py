@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IndexingPolicyProto(object):
 
@@ -25,6 +26,9 @@ class IndexingPolicyProto(object):
         "disable_indexing":'disableIndexing'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  allow_prefixes=None,
                  deny_prefixes=None,
@@ -51,17 +55,6 @@ class IndexingPolicyProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        allow_prefixes = dictionary.get('allowPrefixes')
-        deny_prefixes = dictionary.get('denyPrefixes')
-        disable_indexing = dictionary.get('disableIndexing')
-
-        # Return an object of this model
-        return cls(allow_prefixes,
-                   deny_prefixes,
-                   disable_indexing)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class InfectedFile(object):
 
@@ -54,6 +55,9 @@ class InfectedFile(object):
         "view_name":'viewName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  entity_id=None,
                  file_path=None,
@@ -96,33 +100,6 @@ class InfectedFile(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        entity_id = dictionary.get('entityId')
-        file_path = dictionary.get('filePath')
-        infection_detection_timestamp = dictionary.get('infectionDetectionTimestamp')
-        modified_timestamp_usecs = dictionary.get('modifiedTimestampUsecs')
-        remediation_state = dictionary.get('remediationState')
-        root_inode_id = dictionary.get('rootInodeId')
-        scan_timestamp_usecs = dictionary.get('scanTimestampUsecs')
-        service_icap_uri = dictionary.get('serviceIcapUri')
-        threat_descriptions = dictionary.get('threatDescriptions')
-        view_id = dictionary.get('viewId')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(entity_id,
-                   file_path,
-                   infection_detection_timestamp,
-                   modified_timestamp_usecs,
-                   remediation_state,
-                   root_inode_id,
-                   scan_timestamp_usecs,
-                   service_icap_uri,
-                   threat_descriptions,
-                   view_id,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
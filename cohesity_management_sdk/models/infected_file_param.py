@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class InfectedFileParam(object):
 
@@ -34,6 +35,9 @@ class InfectedFileParam(object):
         "view_id":'viewId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  entity_id=None,
                  remediation_state=None,
@@ -62,19 +66,6 @@ class InfectedFileParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        entity_id = dictionary.get('entityId')
-        remediation_state = dictionary.get('remediationState')
-        root_inode_id = dictionary.get('rootInodeId')
-        view_id = dictionary.get('viewId')
-
-        # Return an object of this model
-        return cls(entity_id,
-                   remediation_state,
-                   root_inode_id,
-                   view_id)
+        return decode_model(cls, dictionary)
 
 
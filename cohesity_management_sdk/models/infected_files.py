@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.infected_file
+from cohesity_management_sdk.model_decoder import decode_model
 
 class InfectedFiles(object):
 
@@ -24,6 +24,15 @@ class InfectedFiles(object):
         "pagination_cookie":'paginationCookie'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "infected_files":['infected_file.InfectedFile']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  infected_files=None,
                  pagination_cookie=None):
@@ -48,19 +57,6 @@ class InfectedFiles(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        infected_files = None
-        if dictionary.get('infectedFiles') != None:
-            infected_files = list()
-            for structure in dictionary.get('infectedFiles'):
-                infected_files.append(cohesity_management_sdk.models.infected_file.InfectedFile.from_dictionary(structure))
-        pagination_cookie = dictionary.get('paginationCookie')
-
-        # Return an object of this model
-        return cls(infected_files,
-                   pagination_cookie)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.product_model_interface_tuple
+from cohesity_management_sdk.model_decoder import decode_model
 
 class InterfaceGroup(object):
 
@@ -25,6 +25,15 @@ class InterfaceGroup(object):
         "name":'name'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "model_interface_lists":['product_model_interface_tuple.ProductModelInterfaceTuple']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  id=None,
                  model_interface_lists=None,
@@ -51,21 +60,6 @@ class InterfaceGroup(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        id = dictionary.get('id')
-        model_interface_lists = None
-        if dictionary.get('modelInterfaceLists') != None:
-            model_interface_lists = list()
-            for structure in dictionary.get('modelInterfaceLists'):
-                model_interface_lists.append(cohesity_management_sdk.models.product_model_interface_tuple.ProductModelInterfaceTuple.from_dictionary(structure))
-        name = dictionary.get('name')
-
-        # Return an object of this model
-        return cls(id,
-                   model_interface_lists,
-                   name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IoPreferentialTier(object):
 
@@ -63,6 +64,9 @@ class IoPreferentialTier(object):
         "yoda_io_preferential_tier":'yodaIOPreferentialTier'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  apollo_io_preferential_tier=None,
                  apollo_wal_io_preferential_tier=None,
@@ -109,37 +113,6 @@ class IoPreferentialTier(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        apollo_io_preferential_tier = dictionary.get('apolloIOPreferentialTier')
-        apollo_wal_io_preferential_tier = dictionary.get('apolloWalIOPreferentialTier')
-        athena_io_preferential_tier = dictionary.get('athenaIOPreferentialTier')
-        athena_slower_io_preferential_tier = dictionary.get('athenaSlowerIOPreferentialTier')
-        down_tier_usage_percent_thresholds = dictionary.get('downTierUsagePercentThresholds')
-        groot_io_preferential_tier = dictionary.get('grootIOPreferentialTier')
-        hydra_downtier_io_preferential_tier = dictionary.get('hydraDowntierIOPreferentialTier')
-        hydra_io_preferential_tier = dictionary.get('hydraIOPreferentialTier')
-        librarian_io_preferential_tier = dictionary.get('librarianIOPreferentialTier')
-        random_io_preferential_tier = dictionary.get('randomIOPreferentialTier')
-        scribe_io_preferential_tier = dictionary.get('scribeIOPreferentialTier')
-        sequential_io_preferential_tier = dictionary.get('sequentialIOPreferentialTier')
-        yoda_io_preferential_tier = dictionary.get('yodaIOPreferentialTier')
-
-        # Return an object of this model
-        return cls(apollo_io_preferential_tier,
-                   apollo_wal_io_preferential_tier,
-                   athena_io_preferential_tier,
-                   athena_slower_io_preferential_tier,
-                   down_tier_usage_percent_thresholds,
-                   groot_io_preferential_tier,
-                   hydra_downtier_io_preferential_tier,
-                   hydra_io_preferential_tier,
-                   librarian_io_preferential_tier,
-                   random_io_preferential_tier,
-                   scribe_io_preferential_tier,
-                   sequential_io_preferential_tier,
-                   yoda_io_preferential_tier)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.sample
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IopsTile(object):
 
@@ -31,6 +31,16 @@ class IopsTile(object):
         "write_iops_samples":'writeIopsSamples'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "read_iops_samples":['sample.Sample'],
+        "write_iops_samples":['sample.Sample']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  max_read_iops=None,
                  max_write_iops=None,
@@ -59,27 +69,6 @@ class IopsTile(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        max_read_iops = dictionary.get('maxReadIops')
-        max_write_iops = dictionary.get('maxWriteIops')
-        read_iops_samples = None
-        if dictionary.get('readIopsSamples') != None:
-            read_iops_samples = list()
-            for structure in dictionary.get('readIopsSamples'):
-                read_iops_samples.append(cohesity_management_sdk.models.sample.Sample.from_dictionary(structure))
-        write_iops_samples = None
-        if dictionary.get('writeIopsSamples') != None:
-            write_iops_samples = list()
-            for structure in dictionary.get('writeIopsSamples'):
-                write_iops_samples.append(cohesity_management_sdk.models.sample.Sample.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(max_read_iops,
-                   max_write_iops,
-                   read_iops_samples,
-                   write_iops_samples)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IpmiConfiguration(object):
 
@@ -27,6 +28,9 @@ class IpmiConfiguration(object):
         "ipmi_username":'ipmiUsername'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ipmi_gateway=None,
                  ipmi_password=None,
@@ -55,19 +59,6 @@ class IpmiConfiguration(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ipmi_gateway = dictionary.get('ipmiGateway')
-        ipmi_password = dictionary.get('ipmiPassword')
-        ipmi_subnet_mask = dictionary.get('ipmiSubnetMask')
-        ipmi_username = dictionary.get('ipmiUsername')
-
-        # Return an object of this model
-        return cls(ipmi_gateway,
-                   ipmi_password,
-                   ipmi_subnet_mask,
-                   ipmi_username)
+        return decode_model(cls, dictionary)
 
 
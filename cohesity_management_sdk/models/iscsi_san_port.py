@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IscsiSanPort(object):
 
@@ -22,6 +23,9 @@ class IscsiSanPort(object):
         "tcp_port":'tcpPort'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ip_address=None,
                  iqn=None,
@@ -48,17 +52,6 @@ class IscsiSanPort(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ip_address = dictionary.get('ipAddress')
-        iqn = dictionary.get('iqn')
-        tcp_port = dictionary.get('tcpPort')
-
-        # Return an object of this model
-        return cls(ip_address,
-                   iqn,
-                   tcp_port)
+        return decode_model(cls, dictionary)
 
 
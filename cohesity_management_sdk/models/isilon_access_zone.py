@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IsilonAccessZone(object):
 
@@ -23,6 +24,9 @@ class IsilonAccessZone(object):
         "path":'path'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  id=None,
                  name=None,
@@ -49,17 +53,6 @@ class IsilonAccessZone(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        path = dictionary.get('path')
-
-        # Return an object of this model
-        return cls(id,
-                   name,
-                   path)
+        return decode_model(cls, dictionary)
 
 
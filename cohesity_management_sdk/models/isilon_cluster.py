@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IsilonCluster(object):
 
@@ -20,6 +21,9 @@ class IsilonCluster(object):
         "guid":'guid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  description=None,
                  guid=None):
@@ -44,15 +48,6 @@ class IsilonCluster(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        description = dictionary.get('description')
-        guid = dictionary.get('guid')
-
-        # Return an object of this model
-        return cls(description,
-                   guid)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.isilon_nfs_mount_point
-import cohesity_management_sdk.models.isilon_smb_mount_point
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IsilonMountPoint(object):
 
@@ -35,6 +34,16 @@ class IsilonMountPoint(object):
         "smb_mount_points":'smbMountPoints'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "nfs_mount_point":'isilon_nfs_mount_point.IsilonNfsMountPoint',
+        "smb_mount_points":['isilon_smb_mount_point.IsilonSmbMountPoint']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_zone_name=None,
                  nfs_mount_point=None,
@@ -65,25 +74,6 @@ class IsilonMountPoint(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_zone_name = dictionary.get('accessZoneName')
-        nfs_mount_point = cohesity_management_sdk.models.isilon_nfs_mount_point.IsilonNfsMountPoint.from_dictionary(dictionary.get('nfsMountPoint')) if dictionary.get('nfsMountPoint') else None
-        path = dictionary.get('path')
-        protocols = dictionary.get('protocols')
-        smb_mount_points = None
-        if dictionary.get('smbMountPoints') != None:
-            smb_mount_points = list()
-            for structure in dictionary.get('smbMountPoints'):
-                smb_mount_points.append(cohesity_management_sdk.models.isilon_smb_mount_point.IsilonSmbMountPoint.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(access_zone_name,
-                   nfs_mount_point,
-                   path,
-                   protocols,
-                   smb_mount_points)
+        return decode_model(cls, dictionary)
 
 
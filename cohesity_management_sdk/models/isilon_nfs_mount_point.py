@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IsilonNfsMountPoint(object):
 
@@ -23,6 +24,9 @@ class IsilonNfsMountPoint(object):
         "id":'id'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_zone_name=None,
                  description=None,
@@ -49,17 +53,6 @@ class IsilonNfsMountPoint(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_zone_name = dictionary.get('accessZoneName')
-        description = dictionary.get('description')
-        id = dictionary.get('id')
-
-        # Return an object of this model
-        return cls(access_zone_name,
-                   description,
-                   id)
+        return decode_model(cls, dictionary)
 
 
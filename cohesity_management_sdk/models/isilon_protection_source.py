@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.isilon_access_zone
-import cohesity_management_sdk.models.isilon_cluster
-import cohesity_management_sdk.models.isilon_mount_point
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IsilonProtectionSource(object):
 
@@ -37,6 +35,17 @@ class IsilonProtectionSource(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "access_zone":'isilon_access_zone.IsilonAccessZone',
+        "cluster":'isilon_cluster.IsilonCluster',
+        "mount_point":'isilon_mount_point.IsilonMountPoint'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_zone=None,
                  cluster=None,
@@ -67,21 +76,6 @@ class IsilonProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_zone = cohesity_management_sdk.models.isilon_access_zone.IsilonAccessZone.from_dictionary(dictionary.get('accessZone')) if dictionary.get('accessZone') else None
-        cluster = cohesity_management_sdk.models.isilon_cluster.IsilonCluster.from_dictionary(dictionary.get('cluster')) if dictionary.get('cluster') else None
-        mount_point = cohesity_management_sdk.models.isilon_mount_point.IsilonMountPoint.from_dictionary(dictionary.get('mountPoint')) if dictionary.get('mountPoint') else None
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(access_zone,
-                   cluster,
-                   mount_point,
-                   name,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class IsilonSmbMountPoint(object):
 
@@ -24,6 +25,9 @@ class IsilonSmbMountPoint(object):
         "share_name":'shareName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_zone_id=None,
                  description=None,
@@ -50,17 +54,6 @@ class IsilonSmbMountPoint(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_zone_id = dictionary.get('accessZoneId')
-        description = dictionary.get('description')
-        share_name = dictionary.get('shareName')
-
-        # Return an object of this model
-        return cls(access_zone_id,
-                   description,
-                   share_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.backup_policy_proto
-import cohesity_management_sdk.models.snapshot_target_policy_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class JobPolicyProto(object):
 
@@ -32,6 +31,16 @@ class JobPolicyProto(object):
         "snapshot_target_policy_vec":'snapshotTargetPolicyVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "backup_policy":'backup_policy_proto.BackupPolicyProto',
+        "snapshot_target_policy_vec":['snapshot_target_policy_proto.SnapshotTargetPolicyProto']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_policy=None,
                  snapshot_target_policy_vec=None):
@@ -56,19 +65,6 @@ class JobPolicyProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_policy = cohesity_management_sdk.models.backup_policy_proto.BackupPolicyProto.from_dictionary(dictionary.get('backupPolicy')) if dictionary.get('backupPolicy') else None
-        snapshot_target_policy_vec = None
-        if dictionary.get('snapshotTargetPolicyVec') != None:
-            snapshot_target_policy_vec = list()
-            for structure in dictionary.get('snapshotTargetPolicyVec'):
-                snapshot_target_policy_vec.append(cohesity_management_sdk.models.snapshot_target_policy_proto.SnapshotTargetPolicyProto.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(backup_policy,
-                   snapshot_target_policy_vec)
+        return decode_model(cls, dictionary)
 
 
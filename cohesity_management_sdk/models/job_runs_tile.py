@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.objects_protected_by_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class JobRunsTile(object):
 
@@ -30,6 +30,15 @@ class JobRunsTile(object):
         "objects_protected_by_policy":'objectsProtectedByPolicy'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "objects_protected_by_policy":['objects_protected_by_policy.ObjectsProtectedByPolicy']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  last_day_num_job_errors=None,
                  last_day_num_job_runs=None,
@@ -60,25 +69,6 @@ class JobRunsTile(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        last_day_num_job_errors = dictionary.get('lastDayNumJobErrors')
-        last_day_num_job_runs = dictionary.get('lastDayNumJobRuns')
-        last_day_num_job_sla_violations = dictionary.get('lastDayNumJobSlaViolations')
-        num_job_running = dictionary.get('numJobRunning')
-        objects_protected_by_policy = None
-        if dictionary.get('objectsProtectedByPolicy') != None:
-            objects_protected_by_policy = list()
-            for structure in dictionary.get('objectsProtectedByPolicy'):
-                objects_protected_by_policy.append(cohesity_management_sdk.models.objects_protected_by_policy.ObjectsProtectedByPolicy.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(last_day_num_job_errors,
-                   last_day_num_job_runs,
-                   last_day_num_job_sla_violations,
-                   num_job_running,
-                   objects_protected_by_policy)
+        return decode_model(cls, dictionary)
 
 
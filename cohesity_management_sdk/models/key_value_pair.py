@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.value
+from cohesity_management_sdk.model_decoder import decode_model
 
 class KeyValuePair(object):
 
@@ -22,6 +22,15 @@ class KeyValuePair(object):
         "value":'value'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "value":'value.Value'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  key=None,
                  value=None):
@@ -46,15 +55,6 @@ class KeyValuePair(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        key = dictionary.get('key')
-        value = cohesity_management_sdk.models.value.Value.from_dictionary(dictionary.get('value')) if dictionary.get('value') else None
-
-        # Return an object of this model
-        return cls(key,
-                   value)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class KmsConfiguration(object):
 
@@ -38,6 +39,9 @@ class KmsConfiguration(object):
         "server_type":'serverType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ca_certificate=None,
                  client_certificate=None,
@@ -74,27 +78,6 @@ class KmsConfiguration(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ca_certificate = dictionary.get('caCertificate')
-        client_certificate = dictionary.get('clientCertificate')
-        client_key = dictionary.get('clientKey')
-        kmip_protocol_version = dictionary.get('kmipProtocolVersion')
-        server_ip = dictionary.get('serverIp')
-        server_name = dictionary.get('serverName')
-        server_port = dictionary.get('serverPort')
-        server_type = dictionary.get('serverType')
-
-        # Return an object of this model
-        return cls(ca_certificate,
-                   client_certificate,
-                   client_key,
-                   kmip_protocol_version,
-                   server_ip,
-                   server_name,
-                   server_port,
-                   server_type)
+        return decode_model(cls, dictionary)
 
 
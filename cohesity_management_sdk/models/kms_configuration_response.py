@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class KmsConfigurationResponse(object):
 
@@ -31,6 +32,9 @@ class KmsConfigurationResponse(object):
         "server_port":'serverPort'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  client_certificate_expiry_date=None,
                  connection_status=None,
@@ -63,23 +67,6 @@ class KmsConfigurationResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        client_certificate_expiry_date = dictionary.get('clientCertificateExpiryDate')
-        connection_status = dictionary.get('connectionStatus')
-        kmip_protocol_version = dictionary.get('kmipProtocolVersion')
-        server_ip = dictionary.get('serverIp')
-        server_name = dictionary.get('serverName')
-        server_port = dictionary.get('serverPort')
-
-        # Return an object of this model
-        return cls(client_certificate_expiry_date,
-                   connection_status,
-                   kmip_protocol_version,
-                   server_ip,
-                   server_name,
-                   server_port)
+        return decode_model(cls, dictionary)
 
 
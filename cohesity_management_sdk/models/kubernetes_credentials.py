@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class KubernetesCredentials(object):
 
@@ -19,6 +20,9 @@ class KubernetesCredentials(object):
         "client_private_key":'clientPrivateKey'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  client_private_key=None):
         """Constructor for the KubernetesCredentials class"""
@@ -41,13 +45,6 @@ class KubernetesCredentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        client_private_key = dictionary.get('clientPrivateKey')
-
-        # Return an object of this model
-        return cls(client_private_key)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class KubernetesProtectionSource(object):
 
@@ -30,6 +31,9 @@ class KubernetesProtectionSource(object):
         "uuid":'uuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  description=None,
                  name=None,
@@ -58,19 +62,6 @@ class KubernetesProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        description = dictionary.get('description')
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-        uuid = dictionary.get('uuid')
-
-        # Return an object of this model
-        return cls(description,
-                   name,
-                   mtype,
-                   uuid)
+        return decode_model(cls, dictionary)
 
 
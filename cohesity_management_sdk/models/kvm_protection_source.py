@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class KvmProtectionSource(object):
 
@@ -53,6 +54,9 @@ class KvmProtectionSource(object):
         "uuid":'uuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  agent_error=None,
                  agent_id=None,
@@ -91,29 +95,6 @@ class KvmProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        agent_error = dictionary.get('agentError')
-        agent_id = dictionary.get('agentId')
-        cluster_id = dictionary.get('clusterId')
-        datacenter_id = dictionary.get('datacenterId')
-        description = dictionary.get('description')
-        name = dictionary.get('name')
-        network_id = dictionary.get('networkId')
-        mtype = dictionary.get('type')
-        uuid = dictionary.get('uuid')
-
-        # Return an object of this model
-        return cls(agent_error,
-                   agent_id,
-                   cluster_id,
-                   datacenter_id,
-                   description,
-                   name,
-                   network_id,
-                   mtype,
-                   uuid)
+        return decode_model(cls, dictionary)
 
 
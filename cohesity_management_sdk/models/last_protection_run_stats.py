@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.last_protection_run_stats_by_env
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LastProtectionRunStats(object):
 
@@ -29,6 +29,15 @@ class LastProtectionRunStats(object):
         "stats_by_env":'statsByEnv'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "stats_by_env":['last_protection_run_stats_by_env.LastProtectionRunStatsByEnv']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  num_runs_failed=None,
                  num_runs_failed_sla=None,
@@ -57,23 +66,6 @@ class LastProtectionRunStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        num_runs_failed = dictionary.get('numRunsFailed')
-        num_runs_failed_sla = dictionary.get('numRunsFailedSla')
-        num_runs_met_sla = dictionary.get('numRunsMetSla')
-        stats_by_env = None
-        if dictionary.get('statsByEnv') != None:
-            stats_by_env = list()
-            for structure in dictionary.get('statsByEnv'):
-                stats_by_env.append(cohesity_management_sdk.models.last_protection_run_stats_by_env.LastProtectionRunStatsByEnv.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(num_runs_failed,
-                   num_runs_failed_sla,
-                   num_runs_met_sla,
-                   stats_by_env)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LastProtectionRunStatsByEnv(object):
 
@@ -28,6 +29,9 @@ class LastProtectionRunStatsByEnv(object):
         "num_objects_met_sla":'numObjectsMetSla'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  environment=None,
                  num_objects_failed=None,
@@ -56,19 +60,6 @@ class LastProtectionRunStatsByEnv(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        environment = dictionary.get('environment')
-        num_objects_failed = dictionary.get('numObjectsFailed')
-        num_objects_failed_sla = dictionary.get('numObjectsFailedSla')
-        num_objects_met_sla = dictionary.get('numObjectsMetSla')
-
-        # Return an object of this model
-        return cls(environment,
-                   num_objects_failed,
-                   num_objects_failed_sla,
-                   num_objects_met_sla)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LastProtectionRunSummary(object):
 
@@ -44,6 +45,9 @@ class LastProtectionRunSummary(object):
         "total_logical_backup_size_in_bytes":'totalLogicalBackupSizeInBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  number_of_cancelled_protection_runs=None,
                  number_of_failed_protection_runs=None,
@@ -78,25 +82,6 @@ class LastProtectionRunSummary(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        number_of_cancelled_protection_runs = dictionary.get('numberOfCancelledProtectionRuns')
-        number_of_failed_protection_runs = dictionary.get('numberOfFailedProtectionRuns')
-        number_of_protected_sources = dictionary.get('numberOfProtectedSources')
-        number_of_running_protection_runs = dictionary.get('numberOfRunningProtectionRuns')
-        number_of_sla_violations = dictionary.get('numberOfSlaViolations')
-        number_of_successful_protection_runs = dictionary.get('numberOfSuccessfulProtectionRuns')
-        total_logical_backup_size_in_bytes = dictionary.get('totalLogicalBackupSizeInBytes')
-
-        # Return an object of this model
-        return cls(number_of_cancelled_protection_runs,
-                   number_of_failed_protection_runs,
-                   number_of_protected_sources,
-                   number_of_running_protection_runs,
-                   number_of_sla_violations,
-                   number_of_successful_protection_runs,
-                   total_logical_backup_size_in_bytes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LatencyThresholds(object):
 
@@ -25,6 +26,9 @@ class LatencyThresholds(object):
         "new_task_msecs":'newTaskMsecs'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  active_task_msecs=None,
                  new_task_msecs=None):
@@ -49,15 +53,6 @@ class LatencyThresholds(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        active_task_msecs = dictionary.get('activeTaskMsecs')
-        new_task_msecs = dictionary.get('newTaskMsecs')
-
-        # Return an object of this model
-        return cls(active_task_msecs,
-                   new_task_msecs)
+        return decode_model(cls, dictionary)
 
 
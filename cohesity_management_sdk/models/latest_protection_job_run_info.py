@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.latest_protection_run
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LatestProtectionJobRunInfo(object):
 
@@ -26,6 +26,15 @@ class LatestProtectionJobRunInfo(object):
         "num_snapshots":'numSnapshots'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "latest_snapshot_info":'latest_protection_run.LatestProtectionRun'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  latest_snapshot_info=None,
                  location_name=None,
@@ -52,17 +61,6 @@ class LatestProtectionJobRunInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        latest_snapshot_info = cohesity_management_sdk.models.latest_protection_run.LatestProtectionRun.from_dictionary(dictionary.get('latestSnapshotInfo')) if dictionary.get('latestSnapshotInfo') else None
-        location_name = dictionary.get('locationName')
-        num_snapshots = dictionary.get('numSnapshots')
-
-        # Return an object of this model
-        return cls(latest_snapshot_info,
-                   location_name,
-                   num_snapshots)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.source_backup_status
-import cohesity_management_sdk.models.copy_run
-import cohesity_management_sdk.models.run_uid
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LatestProtectionRun(object):
 
@@ -49,6 +47,17 @@ class LatestProtectionRun(object):
         "uuid":'uuid'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "backup_run":'source_backup_status.SourceBackupStatus',
+        "copy_run":'copy_run.CopyRun',
+        "protection_job_run_uid":'run_uid.RunUid'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_run=None,
                  change_event_id=None,
@@ -87,29 +96,6 @@ class LatestProtectionRun(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_run = cohesity_management_sdk.models.source_backup_status.SourceBackupStatus.from_dictionary(dictionary.get('backupRun')) if dictionary.get('backupRun') else None
-        change_event_id = dictionary.get('changeEventId')
-        copy_run = cohesity_management_sdk.models.copy_run.CopyRun.from_dictionary(dictionary.get('copyRun')) if dictionary.get('copyRun') else None
-        job_run_id = dictionary.get('jobRunId')
-        protection_job_run_uid = cohesity_management_sdk.models.run_uid.RunUid.from_dictionary(dictionary.get('protectionJobRunUid')) if dictionary.get('protectionJobRunUid') else None
-        snapshot_target = dictionary.get('snapshotTarget')
-        snapshot_target_type = dictionary.get('snapshotTargetType')
-        task_status = dictionary.get('taskStatus')
-        uuid = dictionary.get('uuid')
-
-        # Return an object of this model
-        return cls(backup_run,
-                   change_event_id,
-                   copy_run,
-                   job_run_id,
-                   protection_job_run_uid,
-                   snapshot_target,
-                   snapshot_target_type,
-                   task_status,
-                   uuid)
+        return decode_model(cls, dictionary)
 
 
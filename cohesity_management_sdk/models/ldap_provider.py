@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LdapProvider(object):
 
@@ -50,6 +51,9 @@ class LdapProvider(object):
         "user_password":'userPassword'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_domain_name=None,
                  auth_type=None,
@@ -92,33 +96,6 @@ class LdapProvider(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_domain_name = dictionary.get('adDomainName')
-        auth_type = dictionary.get('authType')
-        base_distinguished_name = dictionary.get('baseDistinguishedName')
-        domain_name = dictionary.get('domainName')
-        name = dictionary.get('name')
-        port = dictionary.get('port')
-        preferred_ldap_server_list = dictionary.get('preferredLdapServerList')
-        tenant_id = dictionary.get('tenantId')
-        use_ssl = dictionary.get('useSsl')
-        user_distinguished_name = dictionary.get('userDistinguishedName')
-        user_password = dictionary.get('userPassword')
-
-        # Return an object of this model
-        return cls(ad_domain_name,
-                   auth_type,
-                   base_distinguished_name,
-                   domain_name,
-                   name,
-                   port,
-                   preferred_ldap_server_list,
-                   tenant_id,
-                   use_ssl,
-                   user_distinguished_name,
-                   user_password)
+        return decode_model(cls, dictionary)
 
 
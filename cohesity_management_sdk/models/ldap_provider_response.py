@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LdapProviderResponse(object):
 
@@ -52,6 +53,9 @@ class LdapProviderResponse(object):
         "user_password":'userPassword'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_domain_name=None,
                  auth_type=None,
@@ -96,35 +100,6 @@ class LdapProviderResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_domain_name = dictionary.get('adDomainName')
-        auth_type = dictionary.get('authType')
-        base_distinguished_name = dictionary.get('baseDistinguishedName')
-        domain_name = dictionary.get('domainName')
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        port = dictionary.get('port')
-        preferred_ldap_server_list = dictionary.get('preferredLdapServerList')
-        tenant_id = dictionary.get('tenantId')
-        use_ssl = dictionary.get('useSsl')
-        user_distinguished_name = dictionary.get('userDistinguishedName')
-        user_password = dictionary.get('userPassword')
-
-        # Return an object of this model
-        return cls(ad_domain_name,
-                   auth_type,
-                   base_distinguished_name,
-                   domain_name,
-                   id,
-                   name,
-                   port,
-                   preferred_ldap_server_list,
-                   tenant_id,
-                   use_ssl,
-                   user_distinguished_name,
-                   user_password)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LegalHoldings(object):
 
@@ -22,6 +23,9 @@ class LegalHoldings(object):
         "protection_source_id":'protectionSourceId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  hold_for_legal_purpose=None,
                  protection_source_id=None):
@@ -46,15 +50,6 @@ class LegalHoldings(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        hold_for_legal_purpose = dictionary.get('holdForLegalPurpose')
-        protection_source_id = dictionary.get('protectionSourceId')
-
-        # Return an object of this model
-        return cls(hold_for_legal_purpose,
-                   protection_source_id)
+        return decode_model(cls, dictionary)
 
 
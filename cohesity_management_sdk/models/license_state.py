@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LicenseState(object):
 
@@ -28,6 +29,9 @@ class LicenseState(object):
         "state":'state'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  failed_attempts=None,
                  state=None):
@@ -52,15 +56,6 @@ class LicenseState(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        failed_attempts = dictionary.get('failedAttempts')
-        state = dictionary.get('state')
-
-        # Return an object of this model
-        return cls(failed_attempts,
-                   state)
+        return decode_model(cls, dictionary)
 
 
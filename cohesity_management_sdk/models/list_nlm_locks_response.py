@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.file_nlm_locks
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ListNlmLocksResponse(object):
 
@@ -24,6 +24,15 @@ class ListNlmLocksResponse(object):
         "files_nlm_locks":'filesNlmLocks'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "files_nlm_locks":['file_nlm_locks.FileNlmLocks']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cookie=None,
                  files_nlm_locks=None):
@@ -48,19 +57,6 @@ class ListNlmLocksResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cookie = dictionary.get('cookie')
-        files_nlm_locks = None
-        if dictionary.get('filesNlmLocks') != None:
-            files_nlm_locks = list()
-            for structure in dictionary.get('filesNlmLocks'):
-                files_nlm_locks.append(cohesity_management_sdk.models.file_nlm_locks.FileNlmLocks.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(cookie,
-                   files_nlm_locks)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LockFileParams(object):
 
@@ -22,6 +23,9 @@ class LockFileParams(object):
         "path":'path'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  expiry_timestamp_msecs=None,
                  path=None):
@@ -46,15 +50,6 @@ class LockFileParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        expiry_timestamp_msecs = dictionary.get('expiryTimestampMsecs')
-        path = dictionary.get('path')
-
-        # Return an object of this model
-        return cls(expiry_timestamp_msecs,
-                   path)
+        return decode_model(cls, dictionary)
 
 
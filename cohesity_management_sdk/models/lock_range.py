@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LockRange(object):
 
@@ -22,6 +23,9 @@ class LockRange(object):
         "offset":'offset'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  is_exclusive=None,
                  length=None,
@@ -48,17 +52,6 @@ class LockRange(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        is_exclusive = dictionary.get('isExclusive')
-        length = dictionary.get('length')
-        offset = dictionary.get('offset')
-
-        # Return an object of this model
-        return cls(is_exclusive,
-                   length,
-                   offset)
+        return decode_model(cls, dictionary)
 
 
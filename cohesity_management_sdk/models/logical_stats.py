@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LogicalStats(object):
 
@@ -26,6 +27,9 @@ class LogicalStats(object):
         "total_logical_usage_bytes":'totalLogicalUsageBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  total_logical_usage_bytes=None):
         """Constructor for the LogicalStats class"""
@@ -48,13 +52,6 @@ class LogicalStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        total_logical_usage_bytes = dictionary.get('totalLogicalUsageBytes')
-
-        # Return an object of this model
-        return cls(total_logical_usage_bytes)
+        return decode_model(cls, dictionary)
 
 
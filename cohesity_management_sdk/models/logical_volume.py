@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.device_tree_details
+from cohesity_management_sdk.model_decoder import decode_model
 
 class LogicalVolume(object):
 
@@ -32,6 +32,15 @@ class LogicalVolume(object):
         "uuid":'uuid'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "device_root_node":'device_tree_details.DeviceTreeDetails'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  device_root_node=None,
                  group_name=None,
@@ -62,21 +71,6 @@ class LogicalVolume(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        device_root_node = cohesity_management_sdk.models.device_tree_details.DeviceTreeDetails.from_dictionary(dictionary.get('deviceRootNode')) if dictionary.get('deviceRootNode') else None
-        group_name = dictionary.get('groupName')
-        group_uuid = dictionary.get('groupUuid')
-        name = dictionary.get('name')
-        uuid = dictionary.get('uuid')
-
-        # Return an object of this model
-        return cls(device_root_node,
-                   group_name,
-                   group_uuid,
-                   name,
-                   uuid)
+        return decode_model(cls, dictionary)
 
 
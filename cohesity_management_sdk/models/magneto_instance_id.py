@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MagnetoInstanceId(object):
 
@@ -24,6 +25,9 @@ class MagnetoInstanceId(object):
         "job_start_time_usecs":'jobStartTimeUsecs'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  attempt_num=None,
                  job_instance_id=None,
@@ -50,17 +54,6 @@ class MagnetoInstanceId(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        attempt_num = dictionary.get('attemptNum')
-        job_instance_id = dictionary.get('jobInstanceId')
-        job_start_time_usecs = dictionary.get('jobStartTimeUsecs')
-
-        # Return an object of this model
-        return cls(attempt_num,
-                   job_instance_id,
-                   job_start_time_usecs)
+        return decode_model(cls, dictionary)
 
 
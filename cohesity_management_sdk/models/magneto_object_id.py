@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.universal_id_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MagnetoObjectId(object):
 
@@ -28,6 +27,16 @@ class MagnetoObjectId(object):
         "job_uid":'jobUid'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "entity":'entity_proto.EntityProto',
+        "job_uid":'universal_id_proto.UniversalIdProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  entity=None,
                  job_id=None,
@@ -54,17 +63,6 @@ class MagnetoObjectId(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('entity')) if dictionary.get('entity') else None
-        job_id = dictionary.get('jobId')
-        job_uid = cohesity_management_sdk.models.universal_id_proto.UniversalIdProto.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-
-        # Return an object of this model
-        return cls(entity,
-                   job_id,
-                   job_uid)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.pattern
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MapReduceAuxData(object):
 
@@ -21,6 +21,15 @@ class MapReduceAuxData(object):
         "pattern_vec":'patternVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "pattern_vec":['pattern.Pattern']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  pattern_vec=None):
         """Constructor for the MapReduceAuxData class"""
@@ -43,17 +52,6 @@ class MapReduceAuxData(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        pattern_vec = None
-        if dictionary.get('patternVec') != None:
-            pattern_vec = list()
-            for structure in dictionary.get('patternVec'):
-                pattern_vec.append(cohesity_management_sdk.models.pattern.Pattern.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(pattern_vec)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.metric_data_point
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MetricDataBlock(object):
 
@@ -28,6 +28,15 @@ class MetricDataBlock(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "data_point_vec":['metric_data_point.MetricDataPoint']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data_point_vec=None,
                  metric_name=None,
@@ -54,21 +63,6 @@ class MetricDataBlock(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data_point_vec = None
-        if dictionary.get('dataPointVec') != None:
-            data_point_vec = list()
-            for structure in dictionary.get('dataPointVec'):
-                data_point_vec.append(cohesity_management_sdk.models.metric_data_point.MetricDataPoint.from_dictionary(structure))
-        metric_name = dictionary.get('metricName')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(data_point_vec,
-                   metric_name,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
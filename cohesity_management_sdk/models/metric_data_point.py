@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.value_data
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MetricDataPoint(object):
 
@@ -23,6 +23,15 @@ class MetricDataPoint(object):
         "timestamp_msecs":'timestampMsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "data":'value_data.ValueData'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data=None,
                  timestamp_msecs=None):
@@ -47,15 +56,6 @@ class MetricDataPoint(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data = cohesity_management_sdk.models.value_data.ValueData.from_dictionary(dictionary.get('data')) if dictionary.get('data') else None
-        timestamp_msecs = dictionary.get('timestampMsecs')
-
-        # Return an object of this model
-        return cls(data,
-                   timestamp_msecs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MORef(object):
 
@@ -20,6 +21,9 @@ class MORef(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  item=None,
                  mtype=None):
@@ -44,15 +48,6 @@ class MORef(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        item = dictionary.get('item')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(item,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
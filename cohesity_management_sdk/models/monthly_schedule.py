@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MonthlySchedule(object):
 
@@ -38,6 +39,9 @@ class MonthlySchedule(object):
         "day_count":'dayCount'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  day=None,
                  day_count=None):
@@ -62,15 +66,6 @@ class MonthlySchedule(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        day = dictionary.get('day')
-        day_count = dictionary.get('dayCount')
-
-        # Return an object of this model
-        return cls(day,
-                   day_count)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MountVolumeResult(object):
 
@@ -30,6 +30,15 @@ class MountVolumeResult(object):
         "original_volume_name":'originalVolumeName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "error":'error_proto.ErrorProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error=None,
                  filesystem_type=None,
@@ -58,19 +67,6 @@ class MountVolumeResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        filesystem_type = dictionary.get('filesystemType')
-        mount_point = dictionary.get('mountPoint')
-        original_volume_name = dictionary.get('originalVolumeName')
-
-        # Return an object of this model
-        return cls(error,
-                   filesystem_type,
-                   mount_point,
-                   original_volume_name)
+        return decode_model(cls, dictionary)
 
 
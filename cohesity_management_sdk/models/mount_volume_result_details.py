@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.request_error
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MountVolumeResultDetails(object):
 
@@ -28,6 +28,15 @@ class MountVolumeResultDetails(object):
         "volume_name":'volumeName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "mount_error":'request_error.RequestError'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  mount_error=None,
                  mount_point=None,
@@ -54,17 +63,6 @@ class MountVolumeResultDetails(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        mount_error = cohesity_management_sdk.models.request_error.RequestError.from_dictionary(dictionary.get('mountError')) if dictionary.get('mountError') else None
-        mount_point = dictionary.get('mountPoint')
-        volume_name = dictionary.get('volumeName')
-
-        # Return an object of this model
-        return cls(mount_error,
-                   mount_point,
-                   volume_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.credentials
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MountVolumesHypervParams(object):
 
@@ -26,6 +26,15 @@ class MountVolumesHypervParams(object):
         "target_entity_credentials":'targetEntityCredentials'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "target_entity_credentials":'credentials.Credentials'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bring_disks_online=None,
                  target_entity_credentials=None):
@@ -50,15 +59,6 @@ class MountVolumesHypervParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bring_disks_online = dictionary.get('bringDisksOnline')
-        target_entity_credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('targetEntityCredentials')) if dictionary.get('targetEntityCredentials') else None
-
-        # Return an object of this model
-        return cls(bring_disks_online,
-                   target_entity_credentials)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.error_proto
-import cohesity_management_sdk.models.mount_volume_result
-import cohesity_management_sdk.models.setup_restore_disk_task_info_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MountVolumesInfoProto(object):
 
@@ -63,6 +61,19 @@ class MountVolumesInfoProto(object):
         "vm_online_disks_error":'vmOnlineDisksError'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cleanup_error":'error_proto.ErrorProto',
+        "error":'error_proto.ErrorProto',
+        "mount_volume_result_vec":['mount_volume_result.MountVolumeResult'],
+        "restore_disks_task_info_proto":'setup_restore_disk_task_info_proto.SetupRestoreDiskTaskInfoProto',
+        "vm_online_disks_error":'error_proto.ErrorProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cleanup_error=None,
                  error=None,
@@ -99,31 +110,6 @@ class MountVolumesInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cleanup_error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('cleanupError')) if dictionary.get('cleanupError') else None
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        finished = dictionary.get('finished')
-        mount_volume_result_vec = None
-        if dictionary.get('mountVolumeResultVec') != None:
-            mount_volume_result_vec = list()
-            for structure in dictionary.get('mountVolumeResultVec'):
-                mount_volume_result_vec.append(cohesity_management_sdk.models.mount_volume_result.MountVolumeResult.from_dictionary(structure))
-        restore_disks_task_info_proto = cohesity_management_sdk.models.setup_restore_disk_task_info_proto.SetupRestoreDiskTaskInfoProto.from_dictionary(dictionary.get('restoreDisksTaskInfoProto')) if dictionary.get('restoreDisksTaskInfoProto') else None
-        slave_task_start_time_usecs = dictionary.get('slaveTaskStartTimeUsecs')
-        mtype = dictionary.get('type')
-        vm_online_disks_error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('vmOnlineDisksError')) if dictionary.get('vmOnlineDisksError') else None
-
-        # Return an object of this model
-        return cls(cleanup_error,
-                   error,
-                   finished,
-                   mount_volume_result_vec,
-                   restore_disks_task_info_proto,
-                   slave_task_start_time_usecs,
-                   mtype,
-                   vm_online_disks_error)
+        return decode_model(cls, dictionary)
 
 
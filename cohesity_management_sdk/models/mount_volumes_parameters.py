@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MountVolumesParameters(object):
 
@@ -54,6 +55,9 @@ class MountVolumesParameters(object):
         "volume_names":'volumeNames'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bring_disks_online=None,
                  password=None,
@@ -84,21 +88,6 @@ class MountVolumesParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bring_disks_online = dictionary.get('bringDisksOnline')
-        password = dictionary.get('password')
-        target_source_id = dictionary.get('targetSourceId')
-        username = dictionary.get('username')
-        volume_names = dictionary.get('volumeNames')
-
-        # Return an object of this model
-        return cls(bring_disks_online,
-                   password,
-                   target_source_id,
-                   username,
-                   volume_names)
+        return decode_model(cls, dictionary)
 
 
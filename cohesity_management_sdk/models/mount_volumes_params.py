@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.mount_volumes_hyperv_params
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.mount_volumes_vmware_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MountVolumesParams(object):
 
@@ -39,6 +37,17 @@ class MountVolumesParams(object):
         "volume_name_vec":'volumeNameVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "hyperv_params":'mount_volumes_hyperv_params.MountVolumesHypervParams',
+        "target_entity":'entity_proto.EntityProto',
+        "vmware_params":'mount_volumes_vmware_params.MountVolumesVmwareParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  hyperv_params=None,
                  readonly_mount=None,
@@ -69,21 +78,6 @@ class MountVolumesParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        hyperv_params = cohesity_management_sdk.models.mount_volumes_hyperv_params.MountVolumesHypervParams.from_dictionary(dictionary.get('hypervParams')) if dictionary.get('hypervParams') else None
-        readonly_mount = dictionary.get('readonlyMount')
-        target_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetEntity')) if dictionary.get('targetEntity') else None
-        vmware_params = cohesity_management_sdk.models.mount_volumes_vmware_params.MountVolumesVmwareParams.from_dictionary(dictionary.get('vmwareParams')) if dictionary.get('vmwareParams') else None
-        volume_name_vec = dictionary.get('volumeNameVec')
-
-        # Return an object of this model
-        return cls(hyperv_params,
-                   readonly_mount,
-                   target_entity,
-                   vmware_params,
-                   volume_name_vec)
+        return decode_model(cls, dictionary)
 
 
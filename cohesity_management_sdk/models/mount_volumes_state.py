@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.mount_volume_result_details
-import cohesity_management_sdk.models.request_error
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MountVolumesState(object):
 
@@ -39,6 +38,16 @@ class MountVolumesState(object):
         "username":'username'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "mount_volume_results":['mount_volume_result_details.MountVolumeResultDetails'],
+        "other_error":'request_error.RequestError'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bring_disks_online=None,
                  mount_volume_results=None,
@@ -69,25 +78,6 @@ class MountVolumesState(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bring_disks_online = dictionary.get('bringDisksOnline')
-        mount_volume_results = None
-        if dictionary.get('mountVolumeResults') != None:
-            mount_volume_results = list()
-            for structure in dictionary.get('mountVolumeResults'):
-                mount_volume_results.append(cohesity_management_sdk.models.mount_volume_result_details.MountVolumeResultDetails.from_dictionary(structure))
-        other_error = cohesity_management_sdk.models.request_error.RequestError.from_dictionary(dictionary.get('otherError')) if dictionary.get('otherError') else None
-        target_source_id = dictionary.get('targetSourceId')
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(bring_disks_online,
-                   mount_volume_results,
-                   other_error,
-                   target_source_id,
-                   username)
+        return decode_model(cls, dictionary)
 
 
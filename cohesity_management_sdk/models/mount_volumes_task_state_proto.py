@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.mount_volumes_info_proto
-import cohesity_management_sdk.models.mount_volumes_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MountVolumesTaskStateProto(object):
 
@@ -39,6 +37,17 @@ class MountVolumesTaskStateProto(object):
         "mount_params":'mountParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "host_entity":'entity_proto.EntityProto',
+        "mount_info":'mount_volumes_info_proto.MountVolumesInfoProto',
+        "mount_params":'mount_volumes_params.MountVolumesParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  full_nas_path=None,
                  host_entity=None,
@@ -67,19 +76,6 @@ class MountVolumesTaskStateProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        full_nas_path = dictionary.get('fullNasPath')
-        host_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('hostEntity')) if dictionary.get('hostEntity') else None
-        mount_info = cohesity_management_sdk.models.mount_volumes_info_proto.MountVolumesInfoProto.from_dictionary(dictionary.get('mountInfo')) if dictionary.get('mountInfo') else None
-        mount_params = cohesity_management_sdk.models.mount_volumes_params.MountVolumesParams.from_dictionary(dictionary.get('mountParams')) if dictionary.get('mountParams') else None
-
-        # Return an object of this model
-        return cls(full_nas_path,
-                   host_entity,
-                   mount_info,
-                   mount_params)
+        return decode_model(cls, dictionary)
 
 
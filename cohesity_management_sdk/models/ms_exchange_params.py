@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class MSExchangeParams(object):
 
@@ -19,6 +20,9 @@ class MSExchangeParams(object):
         "perform_log_truncation":'performLogTruncation'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  perform_log_truncation=None):
         """Constructor for the MSExchangeParams class"""
@@ -41,13 +45,6 @@ class MSExchangeParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        perform_log_truncation = dictionary.get('performLogTruncation')
-
-        # Return an object of this model
-        return cls(perform_log_truncation)
+        return decode_model(cls, dictionary)
 
 
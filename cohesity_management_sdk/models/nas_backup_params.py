@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.filtering_policy_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NasBackupParams(object):
 
@@ -43,6 +43,15 @@ class NasBackupParams(object):
         "snapshot_change_enabled":'snapshotChangeEnabled'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "filtering_policy":'filtering_policy_proto.FilteringPolicyProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  continue_on_error=None,
                  filtering_policy=None,
@@ -71,19 +80,6 @@ class NasBackupParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        continue_on_error = dictionary.get('continueOnError')
-        filtering_policy = cohesity_management_sdk.models.filtering_policy_proto.FilteringPolicyProto.from_dictionary(dictionary.get('filteringPolicy')) if dictionary.get('filteringPolicy') else None
-        mixed_mode_preference = dictionary.get('mixedModePreference')
-        snapshot_change_enabled = dictionary.get('snapshotChangeEnabled')
-
-        # Return an object of this model
-        return cls(continue_on_error,
-                   filtering_policy,
-                   mixed_mode_preference,
-                   snapshot_change_enabled)
+        return decode_model(cls, dictionary)
 
 
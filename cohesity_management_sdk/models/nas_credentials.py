@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NasCredentials(object):
 
@@ -32,6 +33,9 @@ class NasCredentials(object):
         "username":'username'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  host=None,
                  mount_path=None,
@@ -62,21 +66,6 @@ class NasCredentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        host = dictionary.get('host')
-        mount_path = dictionary.get('mountPath')
-        password = dictionary.get('password')
-        share_type = dictionary.get('shareType')
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(host,
-                   mount_path,
-                   password,
-                   share_type,
-                   username)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.data_migration_job_parameters
-import cohesity_management_sdk.models.file_path_filter
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NasEnvJobParameters(object):
 
@@ -52,6 +51,16 @@ class NasEnvJobParameters(object):
         "nas_protocol":'nasProtocol'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "data_migration_job_parameters":'data_migration_job_parameters.DataMigrationJobParameters',
+        "file_path_filters":'file_path_filter.FilePathFilter'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  continue_on_error=None,
                  data_migration_job_parameters=None,
@@ -82,21 +91,6 @@ class NasEnvJobParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        continue_on_error = dictionary.get('continueOnError')
-        data_migration_job_parameters = cohesity_management_sdk.models.data_migration_job_parameters.DataMigrationJobParameters.from_dictionary(dictionary.get('dataMigrationJobParameters')) if dictionary.get('dataMigrationJobParameters') else None
-        enable_faster_incremental_backups = dictionary.get('enableFasterIncrementalBackups')
-        file_path_filters = cohesity_management_sdk.models.file_path_filter.FilePathFilter.from_dictionary(dictionary.get('filePathFilters')) if dictionary.get('filePathFilters') else None
-        nas_protocol = dictionary.get('nasProtocol')
-
-        # Return an object of this model
-        return cls(continue_on_error,
-                   data_migration_job_parameters,
-                   enable_faster_incremental_backups,
-                   file_path_filters,
-                   nas_protocol)
+        return decode_model(cls, dictionary)
 
 
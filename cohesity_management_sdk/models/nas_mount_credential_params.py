@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NasMountCredentialParams(object):
 
@@ -39,6 +40,9 @@ class NasMountCredentialParams(object):
         "username":'username'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain=None,
                  nas_protocol=None,
@@ -71,23 +75,6 @@ class NasMountCredentialParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain = dictionary.get('domain')
-        nas_protocol = dictionary.get('nasProtocol')
-        nas_type = dictionary.get('nasType')
-        password = dictionary.get('password')
-        skip_validation = dictionary.get('skipValidation')
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(domain,
-                   nas_protocol,
-                   nas_type,
-                   password,
-                   skip_validation,
-                   username)
+        return decode_model(cls, dictionary)
 
 
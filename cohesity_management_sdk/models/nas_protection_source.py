@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NasProtectionSource(object):
 
@@ -42,6 +43,9 @@ class NasProtectionSource(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  description=None,
                  mount_path=None,
@@ -74,23 +78,6 @@ class NasProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        description = dictionary.get('description')
-        mount_path = dictionary.get('mountPath')
-        name = dictionary.get('name')
-        protocol = dictionary.get('protocol')
-        skip_validation = dictionary.get('skipValidation')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(description,
-                   mount_path,
-                   name,
-                   protocol,
-                   skip_validation,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NetappClusterInfo(object):
 
@@ -27,6 +28,9 @@ class NetappClusterInfo(object):
         "serial_number":'serialNumber'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  contact_info=None,
                  location=None,
@@ -53,17 +57,6 @@ class NetappClusterInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        contact_info = dictionary.get('contactInfo')
-        location = dictionary.get('location')
-        serial_number = dictionary.get('serialNumber')
-
-        # Return an object of this model
-        return cls(contact_info,
-                   location,
-                   serial_number)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.netapp_cluster_info
-import cohesity_management_sdk.models.netapp_volume_info
-import cohesity_management_sdk.models.netapp_vserver_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NetappProtectionSource(object):
 
@@ -44,6 +42,17 @@ class NetappProtectionSource(object):
         "vserver_info":'vserverInfo'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cluster_info":'netapp_cluster_info.NetappClusterInfo',
+        "volume_info":'netapp_volume_info.NetappVolumeInfo',
+        "vserver_info":'netapp_vserver_info.NetappVserverInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_info=None,
                  is_top_level=None,
@@ -78,25 +87,6 @@ class NetappProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_info = cohesity_management_sdk.models.netapp_cluster_info.NetappClusterInfo.from_dictionary(dictionary.get('clusterInfo')) if dictionary.get('clusterInfo') else None
-        is_top_level = dictionary.get('isTopLevel')
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-        uuid = dictionary.get('uuid')
-        volume_info = cohesity_management_sdk.models.netapp_volume_info.NetappVolumeInfo.from_dictionary(dictionary.get('volumeInfo')) if dictionary.get('volumeInfo') else None
-        vserver_info = cohesity_management_sdk.models.netapp_vserver_info.NetappVserverInfo.from_dictionary(dictionary.get('vserverInfo')) if dictionary.get('vserverInfo') else None
-
-        # Return an object of this model
-        return cls(cluster_info,
-                   is_top_level,
-                   name,
-                   mtype,
-                   uuid,
-                   volume_info,
-                   vserver_info)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.cifs_share_info
-import cohesity_management_sdk.models.volume_security_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NetappVolumeInfo(object):
 
@@ -72,6 +71,16 @@ class NetappVolumeInfo(object):
         "used_bytes":'usedBytes'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cifs_shares":['cifs_share_info.CifsShareInfo'],
+        "security_info":'volume_security_info.VolumeSecurityInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  aggregate_name=None,
                  capacity_bytes=None,
@@ -116,39 +125,6 @@ class NetappVolumeInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        aggregate_name = dictionary.get('aggregateName')
-        capacity_bytes = dictionary.get('capacityBytes')
-        cifs_shares = None
-        if dictionary.get('cifsShares') != None:
-            cifs_shares = list()
-            for structure in dictionary.get('cifsShares'):
-                cifs_shares.append(cohesity_management_sdk.models.cifs_share_info.CifsShareInfo.from_dictionary(structure))
-        creation_time_usecs = dictionary.get('creationTimeUsecs')
-        data_protocols = dictionary.get('dataProtocols')
-        export_policy_name = dictionary.get('exportPolicyName')
-        junction_path = dictionary.get('junctionPath')
-        name = dictionary.get('name')
-        security_info = cohesity_management_sdk.models.volume_security_info.VolumeSecurityInfo.from_dictionary(dictionary.get('securityInfo')) if dictionary.get('securityInfo') else None
-        state = dictionary.get('state')
-        mtype = dictionary.get('type')
-        used_bytes = dictionary.get('usedBytes')
-
-        # Return an object of this model
-        return cls(aggregate_name,
-                   capacity_bytes,
-                   cifs_shares,
-                   creation_time_usecs,
-                   data_protocols,
-                   export_policy_name,
-                   junction_path,
-                   name,
-                   security_info,
-                   state,
-                   mtype,
-                   used_bytes)
+        return decode_model(cls, dictionary)
 
 
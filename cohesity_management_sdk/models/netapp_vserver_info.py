@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.vserver_network_interface
-import cohesity_management_sdk.models.cifs_share_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NetappVserverInfo(object):
 
@@ -44,6 +43,16 @@ class NetappVserverInfo(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "interfaces":['vserver_network_interface.VserverNetworkInterface'],
+        "root_cifs_share":'cifs_share_info.CifsShareInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data_protocols=None,
                  interfaces=None,
@@ -72,23 +81,6 @@ class NetappVserverInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data_protocols = dictionary.get('dataProtocols')
-        interfaces = None
-        if dictionary.get('interfaces') != None:
-            interfaces = list()
-            for structure in dictionary.get('interfaces'):
-                interfaces.append(cohesity_management_sdk.models.vserver_network_interface.VserverNetworkInterface.from_dictionary(structure))
-        root_cifs_share = cohesity_management_sdk.models.cifs_share_info.CifsShareInfo.from_dictionary(dictionary.get('rootCifsShare')) if dictionary.get('rootCifsShare') else None
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(data_protocols,
-                   interfaces,
-                   root_cifs_share,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
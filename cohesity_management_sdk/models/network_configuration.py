@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NetworkConfiguration(object):
 
@@ -37,6 +38,9 @@ class NetworkConfiguration(object):
         "vips":'vips'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_gateway=None,
                  cluster_subnet_mask=None,
@@ -71,25 +75,6 @@ class NetworkConfiguration(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_gateway = dictionary.get('clusterGateway')
-        cluster_subnet_mask = dictionary.get('clusterSubnetMask')
-        dns_servers = dictionary.get('dnsServers')
-        domain_names = dictionary.get('domainNames')
-        ntp_servers = dictionary.get('ntpServers')
-        vip_hostname = dictionary.get('vipHostname')
-        vips = dictionary.get('vips')
-
-        # Return an object of this model
-        return cls(cluster_gateway,
-                   cluster_subnet_mask,
-                   dns_servers,
-                   domain_names,
-                   ntp_servers,
-                   vip_hostname,
-                   vips)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NetworkInterface(object):
 
@@ -74,6 +75,9 @@ class NetworkInterface(object):
         "virtual_ip":'virtualIp'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bond_slave_slot_types=None,
                  bond_slaves=None,
@@ -132,49 +136,6 @@ class NetworkInterface(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bond_slave_slot_types = dictionary.get('bondSlaveSlotTypes')
-        bond_slaves = dictionary.get('bondSlaves')
-        bonding_mode = dictionary.get('bondingMode')
-        gateway = dictionary.get('gateway')
-        group = dictionary.get('group')
-        id = dictionary.get('id')
-        is_connected = dictionary.get('isConnected')
-        is_default_route = dictionary.get('isDefaultRoute')
-        is_up = dictionary.get('isUp')
-        mac_address = dictionary.get('macAddress')
-        mtu = dictionary.get('mtu')
-        name = dictionary.get('name')
-        role = dictionary.get('role')
-        services = dictionary.get('services')
-        speed = dictionary.get('speed')
-        static_ip = dictionary.get('staticIp')
-        subnet = dictionary.get('subnet')
-        mtype = dictionary.get('type')
-        virtual_ip = dictionary.get('virtualIp')
-
-        # Return an object of this model
-        return cls(bond_slave_slot_types,
-                   bond_slaves,
-                   bonding_mode,
-                   gateway,
-                   group,
-                   id,
-                   is_connected,
-                   is_default_route,
-                   is_up,
-                   mac_address,
-                   mtu,
-                   name,
-                   role,
-                   services,
-                   speed,
-                   static_ip,
-                   subnet,
-                   mtype,
-                   virtual_ip)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NetworkMapping(object):
 
@@ -31,6 +32,9 @@ class NetworkMapping(object):
         "target_network_id":'targetNetworkId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disable_network=None,
                  preserve_mac_address=None,
@@ -59,19 +63,6 @@ class NetworkMapping(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disable_network = dictionary.get('disableNetwork')
-        preserve_mac_address = dictionary.get('preserveMacAddress')
-        source_network_id = dictionary.get('sourceNetworkId')
-        target_network_id = dictionary.get('targetNetworkId')
-
-        # Return an object of this model
-        return cls(disable_network,
-                   preserve_mac_address,
-                   source_network_id,
-                   target_network_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NetworkMappingProto(object):
 
@@ -32,6 +32,16 @@ class NetworkMappingProto(object):
         "target_network_entity":'targetNetworkEntity'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "source_network_entity":'entity_proto.EntityProto',
+        "target_network_entity":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disable_network=None,
                  preserve_mac_address_on_new_network=None,
@@ -60,19 +70,6 @@ class NetworkMappingProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disable_network = dictionary.get('disableNetwork')
-        preserve_mac_address_on_new_network = dictionary.get('preserveMacAddressOnNewNetwork')
-        source_network_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('sourceNetworkEntity')) if dictionary.get('sourceNetworkEntity') else None
-        target_network_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetNetworkEntity')) if dictionary.get('targetNetworkEntity') else None
-
-        # Return an object of this model
-        return cls(disable_network,
-                   preserve_mac_address_on_new_network,
-                   source_network_entity,
-                   target_network_entity)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.cluster_networking_resource_information
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NetworkingInformation(object):
 
@@ -24,6 +24,15 @@ class NetworkingInformation(object):
         "resource_vec":'resourceVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "resource_vec":['cluster_networking_resource_information.ClusterNetworkingResourceInformation']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  resource_vec=None):
         """Constructor for the NetworkingInformation class"""
@@ -46,17 +55,6 @@ class NetworkingInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        resource_vec = None
-        if dictionary.get('resourceVec') != None:
-            resource_vec = list()
-            for structure in dictionary.get('resourceVec'):
-                resource_vec.append(cohesity_management_sdk.models.cluster_networking_resource_information.ClusterNetworkingResourceInformation.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(resource_vec)
+        return decode_model(cls, dictionary)
 
 
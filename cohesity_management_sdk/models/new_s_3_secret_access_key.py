@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NewS3SecretAccessKey(object):
 
@@ -18,6 +19,9 @@ class NewS3SecretAccessKey(object):
         "new_key":'newKey'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  new_key=None):
         """Constructor for the NewS3SecretAccessKey class"""
@@ -40,13 +44,6 @@ class NewS3SecretAccessKey(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        new_key = dictionary.get('newKey')
-
-        # Return an object of this model
-        return cls(new_key)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NfsRootPermissions(object):
 
@@ -22,6 +23,9 @@ class NfsRootPermissions(object):
         "uid":'uid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  gid=None,
                  mode=None,
@@ -48,17 +52,6 @@ class NfsRootPermissions(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        gid = dictionary.get('gid')
-        mode = dictionary.get('mode')
-        uid = dictionary.get('uid')
-
-        # Return an object of this model
-        return cls(gid,
-                   mode,
-                   uid)
+        return decode_model(cls, dictionary)
 
 
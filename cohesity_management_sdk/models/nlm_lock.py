@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.lock_range
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NlmLock(object):
 
@@ -23,6 +23,15 @@ class NlmLock(object):
         "lock_ranges":'lockRanges'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "lock_ranges":['lock_range.LockRange']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  client_id=None,
                  lock_ranges=None):
@@ -47,19 +56,6 @@ class NlmLock(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        client_id = dictionary.get('clientId')
-        lock_ranges = None
-        if dictionary.get('lockRanges') != None:
-            lock_ranges = list()
-            for structure in dictionary.get('lockRanges'):
-                lock_ranges.append(cohesity_management_sdk.models.lock_range.LockRange.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(client_id,
-                   lock_ranges)
+        return decode_model(cls, dictionary)
 
 
@@ -1,12 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.capacity_by_tier
-import cohesity_management_sdk.models.chassis_info
-import cohesity_management_sdk.models.count_by_tier
-import cohesity_management_sdk.models.node_hardware_info
-import cohesity_management_sdk.models.node_stats
-import cohesity_management_sdk.models.node_system_disk_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Node(object):
 
@@ -95,6 +90,20 @@ class Node(object):
         "system_disks":'systemDisks'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "capacity_by_tier":['capacity_by_tier.CapacityByTier'],
+        "chassis_info":'chassis_info.ChassisInfo',
+        "disk_count_by_tier":['count_by_tier.CountByTier'],
+        "node_hardware_info":'node_hardware_info.NodeHardwareInfo',
+        "stats":'node_stats.NodeStats',
+        "system_disks":['node_system_disk_info.NodeSystemDiskInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  capacity_by_tier=None,
                  chassis_info=None,
@@ -153,61 +162,6 @@ class Node(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        capacity_by_tier = None
-        if dictionary.get('capacityByTier') != None:
-            capacity_by_tier = list()
-            for structure in dictionary.get('capacityByTier'):
-                capacity_by_tier.append(cohesity_management_sdk.models.capacity_by_tier.CapacityByTier.from_dictionary(structure))
-        chassis_info = cohesity_management_sdk.models.chassis_info.ChassisInfo.from_dictionary(dictionary.get('chassisInfo')) if dictionary.get('chassisInfo') else None
-        cluster_partition_id = dictionary.get('clusterPartitionId')
-        cluster_partition_name = dictionary.get('clusterPartitionName')
-        disk_count = dictionary.get('diskCount')
-        disk_count_by_tier = None
-        if dictionary.get('diskCountByTier') != None:
-            disk_count_by_tier = list()
-            for structure in dictionary.get('diskCountByTier'):
-                disk_count_by_tier.append(cohesity_management_sdk.models.count_by_tier.CountByTier.from_dictionary(structure))
-        id = dictionary.get('id')
-        ip = dictionary.get('ip')
-        is_marked_for_removal = dictionary.get('isMarkedForRemoval')
-        max_physical_capacity_bytes = dictionary.get('maxPhysicalCapacityBytes')
-        node_hardware_info = cohesity_management_sdk.models.node_hardware_info.NodeHardwareInfo.from_dictionary(dictionary.get('nodeHardwareInfo')) if dictionary.get('nodeHardwareInfo') else None
-        node_incarnation_id = dictionary.get('nodeIncarnationId')
-        node_software_version = dictionary.get('nodeSoftwareVersion')
-        offline_mount_paths_of_disks = dictionary.get('offlineMountPathsOfDisks')
-        removal_reason = dictionary.get('removalReason')
-        removal_state = dictionary.get('removalState')
-        slot_number = dictionary.get('slotNumber')
-        stats = cohesity_management_sdk.models.node_stats.NodeStats.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-        system_disks = None
-        if dictionary.get('systemDisks') != None:
-            system_disks = list()
-            for structure in dictionary.get('systemDisks'):
-                system_disks.append(cohesity_management_sdk.models.node_system_disk_info.NodeSystemDiskInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(capacity_by_tier,
-                   chassis_info,
-                   cluster_partition_id,
-                   cluster_partition_name,
-                   disk_count,
-                   disk_count_by_tier,
-                   id,
-                   ip,
-                   is_marked_for_removal,
-                   max_physical_capacity_bytes,
-                   node_hardware_info,
-                   node_incarnation_id,
-                   node_software_version,
-                   offline_mount_paths_of_disks,
-                   removal_reason,
-                   removal_state,
-                   slot_number,
-                   stats,
-                   system_disks)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NodeHardwareInfo(object):
 
@@ -24,6 +25,9 @@ class NodeHardwareInfo(object):
         "network":'network'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cpu=None,
                  memory_size_bytes=None,
@@ -50,17 +54,6 @@ class NodeHardwareInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cpu = dictionary.get('cpu')
-        memory_size_bytes = dictionary.get('memorySizeBytes')
-        network = dictionary.get('network')
-
-        # Return an object of this model
-        return cls(cpu,
-                   memory_size_bytes,
-                   network)
+        return decode_model(cls, dictionary)
 
 
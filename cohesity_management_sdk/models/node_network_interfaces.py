@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.network_interface
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NodeNetworkInterfaces(object):
 
@@ -29,6 +29,15 @@ class NodeNetworkInterfaces(object):
         "slot":'slot'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "interfaces":['network_interface.NetworkInterface']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  chassis_serial=None,
                  id=None,
@@ -59,25 +68,6 @@ class NodeNetworkInterfaces(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        chassis_serial = dictionary.get('chassisSerial')
-        id = dictionary.get('id')
-        interfaces = None
-        if dictionary.get('interfaces') != None:
-            interfaces = list()
-            for structure in dictionary.get('interfaces'):
-                interfaces.append(cohesity_management_sdk.models.network_interface.NetworkInterface.from_dictionary(structure))
-        message = dictionary.get('message')
-        slot = dictionary.get('slot')
-
-        # Return an object of this model
-        return cls(chassis_serial,
-                   id,
-                   interfaces,
-                   message,
-                   slot)
+        return decode_model(cls, dictionary)
 
 
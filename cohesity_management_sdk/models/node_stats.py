@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.usage_and_performance_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NodeStats(object):
 
@@ -23,6 +23,15 @@ class NodeStats(object):
         "usage_perf_stats":'usagePerfStats'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "usage_perf_stats":'usage_and_performance_stats.UsageAndPerformanceStats'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  id=None,
                  usage_perf_stats=None):
@@ -47,15 +56,6 @@ class NodeStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        id = dictionary.get('id')
-        usage_perf_stats = cohesity_management_sdk.models.usage_and_performance_stats.UsageAndPerformanceStats.from_dictionary(dictionary.get('usagePerfStats')) if dictionary.get('usagePerfStats') else None
-
-        # Return an object of this model
-        return cls(id,
-                   usage_perf_stats)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NodeStatus(object):
 
@@ -27,6 +28,9 @@ class NodeStatus(object):
         "node_ip":'nodeIp'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error_message=None,
                  ipmi_ip=None,
@@ -55,19 +59,6 @@ class NodeStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error_message = dictionary.get('errorMessage')
-        ipmi_ip = dictionary.get('ipmiIp')
-        node_id = dictionary.get('nodeId')
-        node_ip = dictionary.get('nodeIp')
-
-        # Return an object of this model
-        return cls(error_message,
-                   ipmi_ip,
-                   node_id,
-                   node_ip)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NodeSystemDiskInfo(object):
 
@@ -22,6 +23,9 @@ class NodeSystemDiskInfo(object):
         "offline":'offline'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  device_path=None,
                  id=None,
@@ -48,17 +52,6 @@ class NodeSystemDiskInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        device_path = dictionary.get('devicePath')
-        id = dictionary.get('id')
-        offline = dictionary.get('offline')
-
-        # Return an object of this model
-        return cls(device_path,
-                   id,
-                   offline)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.email_delivery_target
-import cohesity_management_sdk.models.web_hook_delivery_target
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NotificationRule(object):
 
@@ -60,6 +59,16 @@ class NotificationRule(object):
         "web_hook_delivery_targets":'webHookDeliveryTargets'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "email_delivery_targets":['email_delivery_target.EmailDeliveryTarget'],
+        "web_hook_delivery_targets":['web_hook_delivery_target.WebHookDeliveryTarget']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alert_type_list=None,
                  categories=None,
@@ -96,35 +105,6 @@ class NotificationRule(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alert_type_list = dictionary.get('alertTypeList')
-        categories = dictionary.get('categories')
-        email_delivery_targets = None
-        if dictionary.get('emailDeliveryTargets') != None:
-            email_delivery_targets = list()
-            for structure in dictionary.get('emailDeliveryTargets'):
-                email_delivery_targets.append(cohesity_management_sdk.models.email_delivery_target.EmailDeliveryTarget.from_dictionary(structure))
-        rule_id = dictionary.get('ruleId')
-        rule_name = dictionary.get('ruleName')
-        severities = dictionary.get('severities')
-        tenant_id = dictionary.get('tenantId')
-        web_hook_delivery_targets = None
-        if dictionary.get('webHookDeliveryTargets') != None:
-            web_hook_delivery_targets = list()
-            for structure in dictionary.get('webHookDeliveryTargets'):
-                web_hook_delivery_targets.append(cohesity_management_sdk.models.web_hook_delivery_target.WebHookDeliveryTarget.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(alert_type_list,
-                   categories,
-                   email_delivery_targets,
-                   rule_id,
-                   rule_name,
-                   severities,
-                   tenant_id,
-                   web_hook_delivery_targets)
+        return decode_model(cls, dictionary)
 
 
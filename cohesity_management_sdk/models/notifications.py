@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.task_notification
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Notifications(object):
 
@@ -24,6 +24,15 @@ class Notifications(object):
         "unread_count":'unreadCount'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "notification_list":['task_notification.TaskNotification']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  count=None,
                  notification_list=None,
@@ -50,21 +59,6 @@ class Notifications(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        count = dictionary.get('count')
-        notification_list = None
-        if dictionary.get('notificationList') != None:
-            notification_list = list()
-            for structure in dictionary.get('notificationList'):
-                notification_list.append(cohesity_management_sdk.models.task_notification.TaskNotification.from_dictionary(structure))
-        unread_count = dictionary.get('unreadCount')
-
-        # Return an object of this model
-        return cls(count,
-                   notification_list,
-                   unread_count)
+        return decode_model(cls, dictionary)
 
 
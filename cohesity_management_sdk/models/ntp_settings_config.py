@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class NtpSettingsConfig(object):
 
@@ -19,6 +20,9 @@ class NtpSettingsConfig(object):
         "ntp_servers_internal":'ntpServersInternal'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ntp_servers_internal=None):
         """Constructor for the NtpSettingsConfig class"""
@@ -41,13 +45,6 @@ class NtpSettingsConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ntp_servers_internal = dictionary.get('ntpServersInternal')
-
-        # Return an object of this model
-        return cls(ntp_servers_internal)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.object_snapshot_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ObjectSearchResults(object):
 
@@ -28,6 +28,15 @@ class ObjectSearchResults(object):
         "total_count":'totalCount'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "object_snapshot_info":['object_snapshot_info.ObjectSnapshotInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  object_snapshot_info=None,
                  total_count=None):
@@ -52,19 +61,6 @@ class ObjectSearchResults(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        object_snapshot_info = None
-        if dictionary.get('objectSnapshotInfo') != None:
-            object_snapshot_info = list()
-            for structure in dictionary.get('objectSnapshotInfo'):
-                object_snapshot_info.append(cohesity_management_sdk.models.object_snapshot_info.ObjectSnapshotInfo.from_dictionary(structure))
-        total_count = dictionary.get('totalCount')
-
-        # Return an object of this model
-        return cls(object_snapshot_info,
-                   total_count)
+        return decode_model(cls, dictionary)
 
 
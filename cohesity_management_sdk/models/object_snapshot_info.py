@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
-import cohesity_management_sdk.models.protection_source
-import cohesity_management_sdk.models.snapshot_version
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ObjectSnapshotInfo(object):
 
@@ -63,6 +61,18 @@ class ObjectSnapshotInfo(object):
         "view_name":'viewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "job_uid":'universal_id.UniversalId',
+        "registered_source":'protection_source.ProtectionSource',
+        "snapshotted_source":'protection_source.ProtectionSource',
+        "versions":['snapshot_version.SnapshotVersion']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_partition_id=None,
                  job_id=None,
@@ -105,37 +115,6 @@ class ObjectSnapshotInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_partition_id = dictionary.get('clusterPartitionId')
-        job_id = dictionary.get('jobId')
-        job_name = dictionary.get('jobName')
-        job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-        object_name = dictionary.get('objectName')
-        os_type = dictionary.get('osType')
-        registered_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('registeredSource')) if dictionary.get('registeredSource') else None
-        snapshotted_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('snapshottedSource')) if dictionary.get('snapshottedSource') else None
-        versions = None
-        if dictionary.get('versions') != None:
-            versions = list()
-            for structure in dictionary.get('versions'):
-                versions.append(cohesity_management_sdk.models.snapshot_version.SnapshotVersion.from_dictionary(structure))
-        view_box_id = dictionary.get('viewBoxId')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(cluster_partition_id,
-                   job_id,
-                   job_name,
-                   job_uid,
-                   object_name,
-                   os_type,
-                   registered_source,
-                   snapshotted_source,
-                   versions,
-                   view_box_id,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ObjectSnapshotType(object):
 
@@ -22,6 +23,9 @@ class ObjectSnapshotType(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  msg=None,
                  mtype=None):
@@ -46,15 +50,6 @@ class ObjectSnapshotType(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        msg = dictionary.get('msg')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(msg,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ObjectsByEnv(object):
 
@@ -20,6 +21,9 @@ class ObjectsByEnv(object):
         "num_objects":'numObjects'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  env_type=None,
                  num_objects=None):
@@ -44,15 +48,6 @@ class ObjectsByEnv(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        env_type = dictionary.get('envType')
-        num_objects = dictionary.get('numObjects')
-
-        # Return an object of this model
-        return cls(env_type,
-                   num_objects)
+        return decode_model(cls, dictionary)
 
 
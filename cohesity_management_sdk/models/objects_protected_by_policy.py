@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.objects_by_env
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ObjectsProtectedByPolicy(object):
 
@@ -23,6 +23,15 @@ class ObjectsProtectedByPolicy(object):
         "policy_name":'policyName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "objects_protected":['objects_by_env.ObjectsByEnv']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  objects_protected=None,
                  policy_id=None,
@@ -49,21 +58,6 @@ class ObjectsProtectedByPolicy(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        objects_protected = None
-        if dictionary.get('objectsProtected') != None:
-            objects_protected = list()
-            for structure in dictionary.get('objectsProtected'):
-                objects_protected.append(cohesity_management_sdk.models.objects_by_env.ObjectsByEnv.from_dictionary(structure))
-        policy_id = dictionary.get('policyId')
-        policy_name = dictionary.get('policyName')
-
-        # Return an object of this model
-        return cls(objects_protected,
-                   policy_id,
-                   policy_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Office365Credentials(object):
 
@@ -30,6 +31,9 @@ class Office365Credentials(object):
         "scope":'scope'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  client_id=None,
                  client_secret=None,
@@ -58,19 +62,6 @@ class Office365Credentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        client_id = dictionary.get('clientId')
-        client_secret = dictionary.get('clientSecret')
-        grant_type = dictionary.get('grantType')
-        scope = dictionary.get('scope')
-
-        # Return an object of this model
-        return cls(client_id,
-                   client_secret,
-                   grant_type,
-                   scope)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Office365ProtectionSource(object):
 
@@ -32,6 +33,9 @@ class Office365ProtectionSource(object):
         "uuid":'uuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  description=None,
                  name=None,
@@ -62,21 +66,6 @@ class Office365ProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        description = dictionary.get('description')
-        name = dictionary.get('name')
-        primary_smtp_address = dictionary.get('primarySMTPAddress')
-        mtype = dictionary.get('type')
-        uuid = dictionary.get('uuid')
-
-        # Return an object of this model
-        return cls(description,
-                   name,
-                   primary_smtp_address,
-                   mtype,
-                   uuid)
+        return decode_model(cls, dictionary)
 
 
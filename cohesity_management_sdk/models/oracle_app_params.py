@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.oracle_database_node_channel
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleAppParams(object):
 
@@ -26,6 +26,15 @@ class OracleAppParams(object):
         "node_channel_list":'nodeChannelList'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "node_channel_list":['oracle_database_node_channel.OracleDatabaseNodeChannel']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  database_app_id=None,
                  node_channel_list=None):
@@ -50,19 +59,6 @@ class OracleAppParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        database_app_id = dictionary.get('databaseAppId')
-        node_channel_list = None
-        if dictionary.get('nodeChannelList') != None:
-            node_channel_list = list()
-            for structure in dictionary.get('nodeChannelList'):
-                node_channel_list.append(cohesity_management_sdk.models.oracle_database_node_channel.OracleDatabaseNodeChannel.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(database_app_id,
-                   node_channel_list)
+        return decode_model(cls, dictionary)
 
 
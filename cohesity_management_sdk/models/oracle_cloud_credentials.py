@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleCloudCredentials(object):
 
@@ -39,6 +40,9 @@ class OracleCloudCredentials(object):
         "tier_type":'tierType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_key_id=None,
                  region=None,
@@ -69,21 +73,6 @@ class OracleCloudCredentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_key_id = dictionary.get('accessKeyId')
-        region = dictionary.get('region')
-        secret_access_key = dictionary.get('secretAccessKey')
-        tenant = dictionary.get('tenant')
-        tier_type = dictionary.get('tierType')
-
-        # Return an object of this model
-        return cls(access_key_id,
-                   region,
-                   secret_access_key,
-                   tenant,
-                   tier_type)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleDatabaseNode(object):
 
@@ -25,6 +26,9 @@ class OracleDatabaseNode(object):
         "port":'port'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  channel_count=None,
                  node=None,
@@ -51,17 +55,6 @@ class OracleDatabaseNode(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        channel_count = dictionary.get('channelCount')
-        node = dictionary.get('node')
-        port = dictionary.get('port')
-
-        # Return an object of this model
-        return cls(channel_count,
-                   node,
-                   port)
+        return decode_model(cls, dictionary)
 
 
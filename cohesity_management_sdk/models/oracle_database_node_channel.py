@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.oracle_database_node
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleDatabaseNodeChannel(object):
 
@@ -38,6 +38,15 @@ class OracleDatabaseNodeChannel(object):
         "max_node_count":'maxNodeCount'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "database_node_list":['oracle_database_node.OracleDatabaseNode']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  database_node_list=None,
                  database_unique_name=None,
@@ -68,25 +77,6 @@ class OracleDatabaseNodeChannel(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        database_node_list = None
-        if dictionary.get('databaseNodeList') != None:
-            database_node_list = list()
-            for structure in dictionary.get('databaseNodeList'):
-                database_node_list.append(cohesity_management_sdk.models.oracle_database_node.OracleDatabaseNode.from_dictionary(structure))
-        database_unique_name = dictionary.get('databaseUniqueName')
-        database_uuid = dictionary.get('databaseUuid')
-        default_channel_count = dictionary.get('defaultChannelCount')
-        max_node_count = dictionary.get('maxNodeCount')
-
-        # Return an object of this model
-        return cls(database_node_list,
-                   database_unique_name,
-                   database_uuid,
-                   default_channel_count,
-                   max_node_count)
+        return decode_model(cls, dictionary)
 
 
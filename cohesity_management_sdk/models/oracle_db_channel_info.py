@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.oracle_db_channel_info_host_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleDBChannelInfo(object):
 
@@ -47,6 +47,15 @@ class OracleDBChannelInfo(object):
         "num_channels":'numChannels'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "host_info_vec":['oracle_db_channel_info_host_info.OracleDBChannelInfoHostInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  db_unique_name=None,
                  db_uuid=None,
@@ -77,25 +86,6 @@ class OracleDBChannelInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        db_unique_name = dictionary.get('dbUniqueName')
-        db_uuid = dictionary.get('dbUuid')
-        host_info_vec = None
-        if dictionary.get('hostInfoVec') != None:
-            host_info_vec = list()
-            for structure in dictionary.get('hostInfoVec'):
-                host_info_vec.append(cohesity_management_sdk.models.oracle_db_channel_info_host_info.OracleDBChannelInfoHostInfo.from_dictionary(structure))
-        max_num_host = dictionary.get('maxNumHost')
-        num_channels = dictionary.get('numChannels')
-
-        # Return an object of this model
-        return cls(db_unique_name,
-                   db_uuid,
-                   host_info_vec,
-                   max_num_host,
-                   num_channels)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleDBChannelInfoHostInfo(object):
 
@@ -26,6 +27,9 @@ class OracleDBChannelInfoHostInfo(object):
         "portnum":'portnum'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  host=None,
                  num_channels=None,
@@ -52,17 +56,6 @@ class OracleDBChannelInfoHostInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        host = dictionary.get('host')
-        num_channels = dictionary.get('numChannels')
-        portnum = dictionary.get('portnum')
-
-        # Return an object of this model
-        return cls(host,
-                   num_channels,
-                   portnum)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.oracle_db_config_redo_log_group_conf
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleDBConfig(object):
 
@@ -50,6 +50,15 @@ class OracleDBConfig(object):
         "shared_pool_size":'sharedPoolSize'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "redo_log_conf":'oracle_db_config_redo_log_group_conf.OracleDBConfigRedoLogGroupConf'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  audit_log_dest=None,
                  bct_file_path=None,
@@ -94,35 +103,6 @@ class OracleDBConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        audit_log_dest = dictionary.get('auditLogDest')
-        bct_file_path = dictionary.get('bctFilePath')
-        control_file_path_vec = dictionary.get('controlFilePathVec')
-        db_config_file_path = dictionary.get('dbConfigFilePath')
-        diag_dest = dictionary.get('diagDest')
-        enable_archive_log_mode = dictionary.get('enableArchiveLogMode')
-        fra_dest = dictionary.get('fraDest')
-        fra_size_mb = dictionary.get('fraSizeMb')
-        num_tempfiles = dictionary.get('numTempfiles')
-        redo_log_conf = cohesity_management_sdk.models.oracle_db_config_redo_log_group_conf.OracleDBConfigRedoLogGroupConf.from_dictionary(dictionary.get('redoLogConf')) if dictionary.get('redoLogConf') else None
-        sga_target_size = dictionary.get('sgaTargetSize')
-        shared_pool_size = dictionary.get('sharedPoolSize')
-
-        # Return an object of this model
-        return cls(audit_log_dest,
-                   bct_file_path,
-                   control_file_path_vec,
-                   db_config_file_path,
-                   diag_dest,
-                   enable_archive_log_mode,
-                   fra_dest,
-                   fra_size_mb,
-                   num_tempfiles,
-                   redo_log_conf,
-                   sga_target_size,
-                   shared_pool_size)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleDBConfigRedoLogGroupConf(object):
 
@@ -27,6 +28,9 @@ class OracleDBConfigRedoLogGroupConf(object):
         "size_mb":'sizeMb'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  group_member_vec=None,
                  member_prefix=None,
@@ -55,19 +59,6 @@ class OracleDBConfigRedoLogGroupConf(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        group_member_vec = dictionary.get('groupMemberVec')
-        member_prefix = dictionary.get('memberPrefix')
-        num_groups = dictionary.get('numGroups')
-        size_mb = dictionary.get('sizeMb')
-
-        # Return an object of this model
-        return cls(group_member_vec,
-                   member_prefix,
-                   num_groups,
-                   size_mb)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.oracle_session
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleHost(object):
 
@@ -26,6 +26,15 @@ class OracleHost(object):
         "sessions":'sessions'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "sessions":['oracle_session.OracleSession']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cpu_count=None,
                  ip_addresses=None,
@@ -54,23 +63,6 @@ class OracleHost(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cpu_count = dictionary.get('cpuCount')
-        ip_addresses = dictionary.get('ipAddresses')
-        ports = dictionary.get('ports')
-        sessions = None
-        if dictionary.get('sessions') != None:
-            sessions = list()
-            for structure in dictionary.get('sessions'):
-                sessions.append(cohesity_management_sdk.models.oracle_session.OracleSession.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(cpu_count,
-                   ip_addresses,
-                   ports,
-                   sessions)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.oracle_host
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleProtectionSource(object):
 
@@ -69,6 +69,15 @@ class OracleProtectionSource(object):
         "version":'version'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "hosts":['oracle_host.OracleHost']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  archive_log_enabled=None,
                  bct_enabled=None,
@@ -117,43 +126,6 @@ class OracleProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        archive_log_enabled = dictionary.get('archiveLogEnabled')
-        bct_enabled = dictionary.get('bctEnabled')
-        db_type = dictionary.get('dbType')
-        fra_size = dictionary.get('fraSize')
-        hosts = None
-        if dictionary.get('hosts') != None:
-            hosts = list()
-            for structure in dictionary.get('hosts'):
-                hosts.append(cohesity_management_sdk.models.oracle_host.OracleHost.from_dictionary(structure))
-        name = dictionary.get('name')
-        owner_id = dictionary.get('ownerId')
-        sga_target_size = dictionary.get('sgaTargetSize')
-        shared_pool_size = dictionary.get('sharedPoolSize')
-        size = dictionary.get('size')
-        temp_files_count = dictionary.get('tempFilesCount')
-        mtype = dictionary.get('type')
-        uuid = dictionary.get('uuid')
-        version = dictionary.get('version')
-
-        # Return an object of this model
-        return cls(archive_log_enabled,
-                   bct_enabled,
-                   db_type,
-                   fra_size,
-                   hosts,
-                   name,
-                   owner_id,
-                   sga_target_size,
-                   shared_pool_size,
-                   size,
-                   temp_files_count,
-                   mtype,
-                   uuid,
-                   version)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleSession(object):
 
@@ -21,6 +22,9 @@ class OracleSession(object):
         "system_identifier":'systemIdentifier'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  location=None,
                  system_identifier=None):
@@ -45,15 +49,6 @@ class OracleSession(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        location = dictionary.get('location')
-        system_identifier = dictionary.get('systemIdentifier')
-
-        # Return an object of this model
-        return cls(location,
-                   system_identifier)
+        return decode_model(cls, dictionary)
 
 
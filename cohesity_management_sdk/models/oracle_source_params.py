@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.additional_oracle_db_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleSourceParams(object):
 
@@ -21,6 +21,15 @@ class OracleSourceParams(object):
         "additional_oracle_db_params_vec":'additionalOracleDbParamsVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "additional_oracle_db_params_vec":['additional_oracle_db_params.AdditionalOracleDBParams']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  additional_oracle_db_params_vec=None):
         """Constructor for the OracleSourceParams class"""
@@ -43,17 +52,6 @@ class OracleSourceParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        additional_oracle_db_params_vec = None
-        if dictionary.get('additionalOracleDbParamsVec') != None:
-            additional_oracle_db_params_vec = list()
-            for structure in dictionary.get('additionalOracleDbParamsVec'):
-                additional_oracle_db_params_vec.append(cohesity_management_sdk.models.additional_oracle_db_params.AdditionalOracleDBParams.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(additional_oracle_db_params_vec)
+        return decode_model(cls, dictionary)
 
 
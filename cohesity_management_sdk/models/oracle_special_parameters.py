@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.oracle_app_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OracleSpecialParameters(object):
 
@@ -29,6 +29,15 @@ class OracleSpecialParameters(object):
         "application_entity_ids":'applicationEntityIds'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "app_params_list":['oracle_app_params.OracleAppParams']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  app_params_list=None,
                  application_entity_ids=None):
@@ -53,19 +62,6 @@ class OracleSpecialParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        app_params_list = None
-        if dictionary.get('appParamsList') != None:
-            app_params_list = list()
-            for structure in dictionary.get('appParamsList'):
-                app_params_list.append(cohesity_management_sdk.models.oracle_app_params.OracleAppParams.from_dictionary(structure))
-        application_entity_ids = dictionary.get('applicationEntityIds')
-
-        # Return an object of this model
-        return cls(app_params_list,
-                   application_entity_ids)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.filtering_policy_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OutlookBackupEnvParams(object):
 
@@ -32,6 +32,15 @@ class OutlookBackupEnvParams(object):
         "filtering_policy":'filteringPolicy'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "filtering_policy":'filtering_policy_proto.FilteringPolicyProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  filtering_policy=None):
         """Constructor for the OutlookBackupEnvParams class"""
@@ -54,13 +63,6 @@ class OutlookBackupEnvParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        filtering_policy = cohesity_management_sdk.models.filtering_policy_proto.FilteringPolicyProto.from_dictionary(dictionary.get('filteringPolicy')) if dictionary.get('filteringPolicy') else None
-
-        # Return an object of this model
-        return cls(filtering_policy)
+        return decode_model(cls, dictionary)
 
 
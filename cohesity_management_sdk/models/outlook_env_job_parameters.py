@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.file_path_filter
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OutlookEnvJobParameters(object):
 
@@ -30,6 +30,15 @@ class OutlookEnvJobParameters(object):
         "file_path_filter":'filePathFilter'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "file_path_filter":'file_path_filter.FilePathFilter'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  file_path_filter=None):
         """Constructor for the OutlookEnvJobParameters class"""
@@ -52,13 +61,6 @@ class OutlookEnvJobParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        file_path_filter = cohesity_management_sdk.models.file_path_filter.FilePathFilter.from_dictionary(dictionary.get('filePathFilter')) if dictionary.get('filePathFilter') else None
-
-        # Return an object of this model
-        return cls(file_path_filter)
+        return decode_model(cls, dictionary)
 
 
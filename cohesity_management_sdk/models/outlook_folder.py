@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OutlookFolder(object):
 
@@ -28,6 +29,9 @@ class OutlookFolder(object):
         "restore_entire_folder":'restoreEntireFolder'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  folder_id=None,
                  folder_key=None,
@@ -56,19 +60,6 @@ class OutlookFolder(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        folder_id = dictionary.get('folderId')
-        folder_key = dictionary.get('folderKey')
-        outlook_item_id_list = dictionary.get('outlookItemIdList')
-        restore_entire_folder = dictionary.get('restoreEntireFolder')
-
-        # Return an object of this model
-        return cls(folder_id,
-                   folder_key,
-                   outlook_item_id_list,
-                   restore_entire_folder)
+        return decode_model(cls, dictionary)
 
 
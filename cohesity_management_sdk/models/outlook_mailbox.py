@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_object_details
-import cohesity_management_sdk.models.outlook_folder
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OutlookMailbox(object):
 
@@ -33,6 +32,16 @@ class OutlookMailbox(object):
         "restore_entire_mailbox":'restoreEntireMailbox'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "mailbox_object":'restore_object_details.RestoreObjectDetails',
+        "outlook_folder_list":['outlook_folder.OutlookFolder']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  mailbox_object=None,
                  outlook_folder_list=None,
@@ -59,21 +68,6 @@ class OutlookMailbox(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        mailbox_object = cohesity_management_sdk.models.restore_object_details.RestoreObjectDetails.from_dictionary(dictionary.get('mailboxObject')) if dictionary.get('mailboxObject') else None
-        outlook_folder_list = None
-        if dictionary.get('outlookFolderList') != None:
-            outlook_folder_list = list()
-            for structure in dictionary.get('outlookFolderList'):
-                outlook_folder_list.append(cohesity_management_sdk.models.outlook_folder.OutlookFolder.from_dictionary(structure))
-        restore_entire_mailbox = dictionary.get('restoreEntireMailbox')
-
-        # Return an object of this model
-        return cls(mailbox_object,
-                   outlook_folder_list,
-                   restore_entire_mailbox)
+        return decode_model(cls, dictionary)
 
 
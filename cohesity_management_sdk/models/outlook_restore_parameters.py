@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.outlook_mailbox
-import cohesity_management_sdk.models.protection_source
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OutlookRestoreParameters(object):
 
@@ -30,6 +29,16 @@ class OutlookRestoreParameters(object):
         "target_mailbox":'targetMailbox'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "outlook_mailbox_list":['outlook_mailbox.OutlookMailbox'],
+        "target_mailbox":'protection_source.ProtectionSource'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  outlook_mailbox_list=None,
                  target_folder_path=None,
@@ -56,21 +65,6 @@ class OutlookRestoreParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        outlook_mailbox_list = None
-        if dictionary.get('outlookMailboxList') != None:
-            outlook_mailbox_list = list()
-            for structure in dictionary.get('outlookMailboxList'):
-                outlook_mailbox_list.append(cohesity_management_sdk.models.outlook_mailbox.OutlookMailbox.from_dictionary(structure))
-        target_folder_path = dictionary.get('targetFolderPath')
-        target_mailbox = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('targetMailbox')) if dictionary.get('targetMailbox') else None
-
-        # Return an object of this model
-        return cls(outlook_mailbox_list,
-                   target_folder_path,
-                   target_mailbox)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OutputSpec(object):
 
@@ -33,6 +34,9 @@ class OutputSpec(object):
         "view_name":'viewName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  num_reduce_shards=None,
                  output_dir=None,
@@ -65,23 +69,6 @@ class OutputSpec(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        num_reduce_shards = dictionary.get('numReduceShards')
-        output_dir = dictionary.get('outputDir')
-        partition_id = dictionary.get('partitionId')
-        reduce_output_prefix = dictionary.get('reduceOutputPrefix')
-        view_box_id = dictionary.get('viewBoxId')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(num_reduce_shards,
-                   output_dir,
-                   partition_id,
-                   reduce_output_prefix,
-                   view_box_id,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class OverwriteViewParam(object):
 
@@ -20,6 +21,9 @@ class OverwriteViewParam(object):
         "target_view_name":'targetViewName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  source_view_name=None,
                  target_view_name=None):
@@ -44,15 +48,6 @@ class OverwriteViewParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        source_view_name = dictionary.get('sourceViewName')
-        target_view_name = dictionary.get('targetViewName')
-
-        # Return an object of this model
-        return cls(source_view_name,
-                   target_view_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PackageDetails(object):
 
@@ -27,6 +28,9 @@ class PackageDetails(object):
         "release_date":'releaseDate'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  downtime_required=None,
                  installed_on_nodes=None,
@@ -55,19 +59,6 @@ class PackageDetails(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        downtime_required = dictionary.get('downtimeRequired')
-        installed_on_nodes = dictionary.get('installedOnNodes')
-        package_name = dictionary.get('packageName')
-        release_date = dictionary.get('releaseDate')
-
-        # Return an object of this model
-        return cls(downtime_required,
-                   installed_on_nodes,
-                   package_name,
-                   release_date)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Pattern(object):
 
@@ -26,6 +27,9 @@ class Pattern(object):
         "value":'value'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  is_system_defined=None,
                  name=None,
@@ -54,19 +58,6 @@ class Pattern(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        is_system_defined = dictionary.get('isSystemDefined')
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-        value = dictionary.get('value')
-
-        # Return an object of this model
-        return cls(is_system_defined,
-                   name,
-                   mtype,
-                   value)
+        return decode_model(cls, dictionary)
 
 
@@ -1,19 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.deploy_v_ms_to_cloud_task_state_proto
-import cohesity_management_sdk.models.error_proto
-import cohesity_management_sdk.models.connector_params
-import cohesity_management_sdk.models.power_state_config_proto
-import cohesity_management_sdk.models.rename_object_param_proto
-import cohesity_management_sdk.models.restore_acropolis_v_ms_params
-import cohesity_management_sdk.models.restore_kubernetes_namespaces_params
-import cohesity_management_sdk.models.restore_kvmv_ms_params
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.perform_restore_job_state_proto_restore_task
-import cohesity_management_sdk.models.restore_vmware_vm_params
-import cohesity_management_sdk.models.restored_object_network_config_proto
-import cohesity_management_sdk.models.user_information
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PerformRestoreJobStateProto(object):
 
@@ -114,6 +102,27 @@ class PerformRestoreJobStateProto(object):
         "view_box_id":'viewBoxId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "deploy_vms_to_cloud_task_state":'deploy_v_ms_to_cloud_task_state_proto.DeployVMsToCloudTaskStateProto',
+        "error":'error_proto.ErrorProto',
+        "parent_source_connection_params":'connector_params.ConnectorParams',
+        "power_state_config":'power_state_config_proto.PowerStateConfigProto',
+        "rename_restored_object_param":'rename_object_param_proto.RenameObjectParamProto',
+        "restore_acropolis_vms_params":'restore_acropolis_v_ms_params.RestoreAcropolisVMsParams',
+        "restore_kubernetes_namespaces_params":'restore_kubernetes_namespaces_params.RestoreKubernetesNamespacesParams',
+        "restore_kvm_vms_params":'restore_kvmv_ms_params.RestoreKVMVMsParams',
+        "restore_parent_source":'entity_proto.EntityProto',
+        "restore_task_vec":['perform_restore_job_state_proto_restore_task.PerformRestoreJobStateProtoRestoreTask'],
+        "restore_vmware_vm_params":'restore_vmware_vm_params.RestoreVmwareVMParams',
+        "restored_objects_network_config":'restored_object_network_config_proto.RestoredObjectNetworkConfigProto',
+        "user_info":'user_information.UserInformation'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  admitted_time_usecs=None,
                  cancellation_requested=None,
@@ -186,67 +195,6 @@ class PerformRestoreJobStateProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        admitted_time_usecs = dictionary.get('admittedTimeUsecs')
-        cancellation_requested = dictionary.get('cancellationRequested')
-        continue_restore_on_error = dictionary.get('continueRestoreOnError')
-        deploy_vms_to_cloud_task_state = cohesity_management_sdk.models.deploy_v_ms_to_cloud_task_state_proto.DeployVMsToCloudTaskStateProto.from_dictionary(dictionary.get('deployVmsToCloudTaskState')) if dictionary.get('deployVmsToCloudTaskState') else None
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        name = dictionary.get('name')
-        parent_source_connection_params = cohesity_management_sdk.models.connector_params.ConnectorParams.from_dictionary(dictionary.get('parentSourceConnectionParams')) if dictionary.get('parentSourceConnectionParams') else None
-        power_state_config = cohesity_management_sdk.models.power_state_config_proto.PowerStateConfigProto.from_dictionary(dictionary.get('powerStateConfig')) if dictionary.get('powerStateConfig') else None
-        progress_monitor_task_path = dictionary.get('progressMonitorTaskPath')
-        rename_restored_object_param = cohesity_management_sdk.models.rename_object_param_proto.RenameObjectParamProto.from_dictionary(dictionary.get('renameRestoredObjectParam')) if dictionary.get('renameRestoredObjectParam') else None
-        restore_acropolis_vms_params = cohesity_management_sdk.models.restore_acropolis_v_ms_params.RestoreAcropolisVMsParams.from_dictionary(dictionary.get('restoreAcropolisVmsParams')) if dictionary.get('restoreAcropolisVmsParams') else None
-        restore_job_id = dictionary.get('restoreJobId')
-        restore_kubernetes_namespaces_params = cohesity_management_sdk.models.restore_kubernetes_namespaces_params.RestoreKubernetesNamespacesParams.from_dictionary(dictionary.get('restoreKubernetesNamespacesParams')) if dictionary.get('restoreKubernetesNamespacesParams') else None
-        restore_kvm_vms_params = cohesity_management_sdk.models.restore_kvmv_ms_params.RestoreKVMVMsParams.from_dictionary(dictionary.get('restoreKvmVmsParams')) if dictionary.get('restoreKvmVmsParams') else None
-        restore_parent_source = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('restoreParentSource')) if dictionary.get('restoreParentSource') else None
-        restore_task_vec = None
-        if dictionary.get('restoreTaskVec') != None:
-            restore_task_vec = list()
-            for structure in dictionary.get('restoreTaskVec'):
-                restore_task_vec.append(cohesity_management_sdk.models.perform_restore_job_state_proto_restore_task.PerformRestoreJobStateProtoRestoreTask.from_dictionary(structure))
-        restore_vmware_vm_params = cohesity_management_sdk.models.restore_vmware_vm_params.RestoreVmwareVMParams.from_dictionary(dictionary.get('restoreVmwareVmParams')) if dictionary.get('restoreVmwareVmParams') else None
-        restored_objects_network_config = cohesity_management_sdk.models.restored_object_network_config_proto.RestoredObjectNetworkConfigProto.from_dictionary(dictionary.get('restoredObjectsNetworkConfig')) if dictionary.get('restoredObjectsNetworkConfig') else None
-        restored_to_different_source = dictionary.get('restoredToDifferentSource')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        status = dictionary.get('status')
-        mtype = dictionary.get('type')
-        user = dictionary.get('user')
-        user_info = cohesity_management_sdk.models.user_information.UserInformation.from_dictionary(dictionary.get('userInfo')) if dictionary.get('userInfo') else None
-        view_box_id = dictionary.get('viewBoxId')
-
-        # Return an object of this model
-        return cls(admitted_time_usecs,
-                   cancellation_requested,
-                   continue_restore_on_error,
-                   deploy_vms_to_cloud_task_state,
-                   end_time_usecs,
-                   error,
-                   name,
-                   parent_source_connection_params,
-                   power_state_config,
-                   progress_monitor_task_path,
-                   rename_restored_object_param,
-                   restore_acropolis_vms_params,
-                   restore_job_id,
-                   restore_kubernetes_namespaces_params,
-                   restore_kvm_vms_params,
-                   restore_parent_source,
-                   restore_task_vec,
-                   restore_vmware_vm_params,
-                   restored_objects_network_config,
-                   restored_to_different_source,
-                   start_time_usecs,
-                   status,
-                   mtype,
-                   user,
-                   user_info,
-                   view_box_id)
+        return decode_model(cls, dictionary)
 
 
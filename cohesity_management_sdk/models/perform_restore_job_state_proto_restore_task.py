@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_object
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PerformRestoreJobStateProtoRestoreTask(object):
 
@@ -28,6 +28,15 @@ class PerformRestoreJobStateProtoRestoreTask(object):
         "task_id":'taskId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "object":'restore_object.RestoreObject'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  object=None,
                  object_progress_monitor_task_path=None,
@@ -54,17 +63,6 @@ class PerformRestoreJobStateProtoRestoreTask(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        object = cohesity_management_sdk.models.restore_object.RestoreObject.from_dictionary(dictionary.get('object')) if dictionary.get('object') else None
-        object_progress_monitor_task_path = dictionary.get('objectProgressMonitorTaskPath')
-        task_id = dictionary.get('taskId')
-
-        # Return an object of this model
-        return cls(object,
-                   object_progress_monitor_task_path,
-                   task_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,34 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_task_state_base_proto
-import cohesity_management_sdk.models.clone_app_view_info_proto
-import cohesity_management_sdk.models.cloud_deploy_info_proto
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.deploy_v_ms_to_cloud_task_state_proto
-import cohesity_management_sdk.models.mount_volumes_task_state_proto
-import cohesity_management_sdk.models.restore_object
-import cohesity_management_sdk.models.power_state_config_proto
-import cohesity_management_sdk.models.recover_disks_task_state_proto
-import cohesity_management_sdk.models.recover_volumes_task_state_proto
-import cohesity_management_sdk.models.rename_object_param_proto
-import cohesity_management_sdk.models.restore_acropolis_v_ms_params
-import cohesity_management_sdk.models.restore_app_task_state_proto
-import cohesity_management_sdk.models.restore_files_task_state_proto
-import cohesity_management_sdk.models.restore_hyperv_vm_params
-import cohesity_management_sdk.models.restore_info_proto
-import cohesity_management_sdk.models.restore_kubernetes_namespaces_params
-import cohesity_management_sdk.models.restore_kvmv_ms_params
-import cohesity_management_sdk.models.restore_one_drive_params
-import cohesity_management_sdk.models.restore_outlook_params
-import cohesity_management_sdk.models.restore_vmware_vm_params
-import cohesity_management_sdk.models.restored_object_network_config_proto
-import cohesity_management_sdk.models.retrieve_archive_task_state_proto
-import cohesity_management_sdk.models.universal_id_proto
-import cohesity_management_sdk.models.vault_params_restore_params
-import cohesity_management_sdk.models.restored_object_vcd_config_proto
-import cohesity_management_sdk.models.view_params
-import cohesity_management_sdk.models.volume_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PerformRestoreTaskStateProto(object):
 
@@ -327,6 +300,47 @@ class PerformRestoreTaskStateProto(object):
         "volume_info_vec":'volumeInfoVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "base":'restore_task_state_base_proto.RestoreTaskStateBaseProto',
+        "clone_app_view_info":'clone_app_view_info_proto.CloneAppViewInfoProto',
+        "cloud_deploy_info":'cloud_deploy_info_proto.CloudDeployInfoProto',
+        "datastore_entity":'entity_proto.EntityProto',
+        "deploy_vms_to_cloud_task_state":'deploy_v_ms_to_cloud_task_state_proto.DeployVMsToCloudTaskStateProto',
+        "folder_entity":'entity_proto.EntityProto',
+        "mount_volumes_task_state":'mount_volumes_task_state_proto.MountVolumesTaskStateProto',
+        "objects":['restore_object.RestoreObject'],
+        "power_state_config":'power_state_config_proto.PowerStateConfigProto',
+        "recover_disks_task_state":'recover_disks_task_state_proto.RecoverDisksTaskStateProto',
+        "recover_volumes_task_state":'recover_volumes_task_state_proto.RecoverVolumesTaskStateProto',
+        "rename_restored_object_param":'rename_object_param_proto.RenameObjectParamProto',
+        "rename_restored_vapp_param":'rename_object_param_proto.RenameObjectParamProto',
+        "resource_pool_entity":'entity_proto.EntityProto',
+        "restore_acropolis_vms_params":'restore_acropolis_v_ms_params.RestoreAcropolisVMsParams',
+        "restore_app_task_state":'restore_app_task_state_proto.RestoreAppTaskStateProto',
+        "restore_files_task_state":'restore_files_task_state_proto.RestoreFilesTaskStateProto',
+        "restore_hyperv_vm_params":'restore_hyperv_vm_params.RestoreHypervVMParams',
+        "restore_info":'restore_info_proto.RestoreInfoProto',
+        "restore_kubernetes_namespaces_params":'restore_kubernetes_namespaces_params.RestoreKubernetesNamespacesParams',
+        "restore_kvm_vms_params":'restore_kvmv_ms_params.RestoreKVMVMsParams',
+        "restore_one_drive_params":'restore_one_drive_params.RestoreOneDriveParams',
+        "restore_outlook_params":'restore_outlook_params.RestoreOutlookParams',
+        "restore_parent_source":'entity_proto.EntityProto',
+        "restore_view_datastore_entity":'entity_proto.EntityProto',
+        "restore_vmware_vm_params":'restore_vmware_vm_params.RestoreVmwareVMParams',
+        "restored_objects_network_config":'restored_object_network_config_proto.RestoredObjectNetworkConfigProto',
+        "retrieve_archive_task":'retrieve_archive_task_state_proto.RetrieveArchiveTaskStateProto',
+        "retrieve_archive_task_uid":'universal_id_proto.UniversalIdProto',
+        "vault_restore_params":'vault_params_restore_params.VaultParamsRestoreParams',
+        "vcd_config":'restored_object_vcd_config_proto.RestoredObjectVCDConfigProto',
+        "view_params":'view_params.ViewParams',
+        "volume_info_vec":['volume_info.VolumeInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  base=None,
                  can_teardown=None,
@@ -457,129 +471,6 @@ class PerformRestoreTaskStateProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        base = cohesity_management_sdk.models.restore_task_state_base_proto.RestoreTaskStateBaseProto.from_dictionary(dictionary.get('base')) if dictionary.get('base') else None
-        can_teardown = dictionary.get('canTeardown')
-        child_clone_task_id = dictionary.get('childCloneTaskId')
-        child_destroy_task_id = dictionary.get('childDestroyTaskId')
-        clone_app_view_info = cohesity_management_sdk.models.clone_app_view_info_proto.CloneAppViewInfoProto.from_dictionary(dictionary.get('cloneAppViewInfo')) if dictionary.get('cloneAppViewInfo') else None
-        cloud_deploy_info = cohesity_management_sdk.models.cloud_deploy_info_proto.CloudDeployInfoProto.from_dictionary(dictionary.get('cloudDeployInfo')) if dictionary.get('cloudDeployInfo') else None
-        continue_restore_on_error = dictionary.get('continueRestoreOnError')
-        create_view = dictionary.get('createView')
-        datastore_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('datastoreEntity')) if dictionary.get('datastoreEntity') else None
-        deploy_vms_to_cloud_task_state = cohesity_management_sdk.models.deploy_v_ms_to_cloud_task_state_proto.DeployVMsToCloudTaskStateProto.from_dictionary(dictionary.get('deployVmsToCloudTaskState')) if dictionary.get('deployVmsToCloudTaskState') else None
-        folder_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('folderEntity')) if dictionary.get('folderEntity') else None
-        full_view_name = dictionary.get('fullViewName')
-        mount_volumes_task_state = cohesity_management_sdk.models.mount_volumes_task_state_proto.MountVolumesTaskStateProto.from_dictionary(dictionary.get('mountVolumesTaskState')) if dictionary.get('mountVolumesTaskState') else None
-        object_name_deprecated = dictionary.get('objectName_DEPRECATED')
-        objects = None
-        if dictionary.get('objects') != None:
-            objects = list()
-            for structure in dictionary.get('objects'):
-                objects.append(cohesity_management_sdk.models.restore_object.RestoreObject.from_dictionary(structure))
-        objects_progress_monitor_task_paths = dictionary.get('objectsProgressMonitorTaskPaths')
-        parent_restore_job_id = dictionary.get('parentRestoreJobId')
-        parent_restore_task_id = dictionary.get('parentRestoreTaskId')
-        path_prefix_deprecated = dictionary.get('pathPrefix_DEPRECATED')
-        power_state_config = cohesity_management_sdk.models.power_state_config_proto.PowerStateConfigProto.from_dictionary(dictionary.get('powerStateConfig')) if dictionary.get('powerStateConfig') else None
-        progress_monitor_task_path = dictionary.get('progressMonitorTaskPath')
-        recover_disks_task_state = cohesity_management_sdk.models.recover_disks_task_state_proto.RecoverDisksTaskStateProto.from_dictionary(dictionary.get('recoverDisksTaskState')) if dictionary.get('recoverDisksTaskState') else None
-        recover_volumes_task_state = cohesity_management_sdk.models.recover_volumes_task_state_proto.RecoverVolumesTaskStateProto.from_dictionary(dictionary.get('recoverVolumesTaskState')) if dictionary.get('recoverVolumesTaskState') else None
-        related_restore_task_id = dictionary.get('relatedRestoreTaskId')
-        rename_restored_object_param = cohesity_management_sdk.models.rename_object_param_proto.RenameObjectParamProto.from_dictionary(dictionary.get('renameRestoredObjectParam')) if dictionary.get('renameRestoredObjectParam') else None
-        rename_restored_vapp_param = cohesity_management_sdk.models.rename_object_param_proto.RenameObjectParamProto.from_dictionary(dictionary.get('renameRestoredVappParam')) if dictionary.get('renameRestoredVappParam') else None
-        resource_pool_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('resourcePoolEntity')) if dictionary.get('resourcePoolEntity') else None
-        restore_acropolis_vms_params = cohesity_management_sdk.models.restore_acropolis_v_ms_params.RestoreAcropolisVMsParams.from_dictionary(dictionary.get('restoreAcropolisVmsParams')) if dictionary.get('restoreAcropolisVmsParams') else None
-        restore_app_task_state = cohesity_management_sdk.models.restore_app_task_state_proto.RestoreAppTaskStateProto.from_dictionary(dictionary.get('restoreAppTaskState')) if dictionary.get('restoreAppTaskState') else None
-        restore_files_task_state = cohesity_management_sdk.models.restore_files_task_state_proto.RestoreFilesTaskStateProto.from_dictionary(dictionary.get('restoreFilesTaskState')) if dictionary.get('restoreFilesTaskState') else None
-        restore_hyperv_vm_params = cohesity_management_sdk.models.restore_hyperv_vm_params.RestoreHypervVMParams.from_dictionary(dictionary.get('restoreHypervVmParams')) if dictionary.get('restoreHypervVmParams') else None
-        restore_info = cohesity_management_sdk.models.restore_info_proto.RestoreInfoProto.from_dictionary(dictionary.get('restoreInfo')) if dictionary.get('restoreInfo') else None
-        restore_kubernetes_namespaces_params = cohesity_management_sdk.models.restore_kubernetes_namespaces_params.RestoreKubernetesNamespacesParams.from_dictionary(dictionary.get('restoreKubernetesNamespacesParams')) if dictionary.get('restoreKubernetesNamespacesParams') else None
-        restore_kvm_vms_params = cohesity_management_sdk.models.restore_kvmv_ms_params.RestoreKVMVMsParams.from_dictionary(dictionary.get('restoreKvmVmsParams')) if dictionary.get('restoreKvmVmsParams') else None
-        restore_one_drive_params = cohesity_management_sdk.models.restore_one_drive_params.RestoreOneDriveParams.from_dictionary(dictionary.get('restoreOneDriveParams')) if dictionary.get('restoreOneDriveParams') else None
-        restore_outlook_params = cohesity_management_sdk.models.restore_outlook_params.RestoreOutlookParams.from_dictionary(dictionary.get('restoreOutlookParams')) if dictionary.get('restoreOutlookParams') else None
-        restore_parent_source = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('restoreParentSource')) if dictionary.get('restoreParentSource') else None
-        restore_sub_task_vec = dictionary.get('restoreSubTaskVec')
-        restore_task_purged = dictionary.get('restoreTaskPurged')
-        restore_view_datastore_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('restoreViewDatastoreEntity')) if dictionary.get('restoreViewDatastoreEntity') else None
-        restore_vmware_vm_params = cohesity_management_sdk.models.restore_vmware_vm_params.RestoreVmwareVMParams.from_dictionary(dictionary.get('restoreVmwareVmParams')) if dictionary.get('restoreVmwareVmParams') else None
-        restored_objects_network_config = cohesity_management_sdk.models.restored_object_network_config_proto.RestoredObjectNetworkConfigProto.from_dictionary(dictionary.get('restoredObjectsNetworkConfig')) if dictionary.get('restoredObjectsNetworkConfig') else None
-        restored_to_different_source = dictionary.get('restoredToDifferentSource')
-        retrieve_archive_progress_monitor_task_path = dictionary.get('retrieveArchiveProgressMonitorTaskPath')
-        retrieve_archive_stub_view_name = dictionary.get('retrieveArchiveStubViewName')
-        retrieve_archive_task = cohesity_management_sdk.models.retrieve_archive_task_state_proto.RetrieveArchiveTaskStateProto.from_dictionary(dictionary.get('retrieveArchiveTask')) if dictionary.get('retrieveArchiveTask') else None
-        retrieve_archive_task_uid = cohesity_management_sdk.models.universal_id_proto.UniversalIdProto.from_dictionary(dictionary.get('retrieveArchiveTaskUid')) if dictionary.get('retrieveArchiveTaskUid') else None
-        retrieve_archive_view_name = dictionary.get('retrieveArchiveViewName')
-        stub_view_relative_dir_name = dictionary.get('stubViewRelativeDirName')
-        vault_restore_params = cohesity_management_sdk.models.vault_params_restore_params.VaultParamsRestoreParams.from_dictionary(dictionary.get('vaultRestoreParams')) if dictionary.get('vaultRestoreParams') else None
-        vcd_config = cohesity_management_sdk.models.restored_object_vcd_config_proto.RestoredObjectVCDConfigProto.from_dictionary(dictionary.get('vcdConfig')) if dictionary.get('vcdConfig') else None
-        view_box_id = dictionary.get('viewBoxId')
-        view_name_deprecated = dictionary.get('viewName_DEPRECATED')
-        view_params = cohesity_management_sdk.models.view_params.ViewParams.from_dictionary(dictionary.get('viewParams')) if dictionary.get('viewParams') else None
-        volume_info_vec = None
-        if dictionary.get('volumeInfoVec') != None:
-            volume_info_vec = list()
-            for structure in dictionary.get('volumeInfoVec'):
-                volume_info_vec.append(cohesity_management_sdk.models.volume_info.VolumeInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(base,
-                   can_teardown,
-                   child_clone_task_id,
-                   child_destroy_task_id,
-                   clone_app_view_info,
-                   cloud_deploy_info,
-                   continue_restore_on_error,
-                   create_view,
-                   datastore_entity,
-                   deploy_vms_to_cloud_task_state,
-                   folder_entity,
-                   full_view_name,
-                   mount_volumes_task_state,
-                   object_name_deprecated,
-                   objects,
-                   objects_progress_monitor_task_paths,
-                   parent_restore_job_id,
-                   parent_restore_task_id,
-                   path_prefix_deprecated,
-                   power_state_config,
-                   progress_monitor_task_path,
-                   recover_disks_task_state,
-                   recover_volumes_task_state,
-                   related_restore_task_id,
-                   rename_restored_object_param,
-                   rename_restored_vapp_param,
-                   resource_pool_entity,
-                   restore_acropolis_vms_params,
-                   restore_app_task_state,
-                   restore_files_task_state,
-                   restore_hyperv_vm_params,
-                   restore_info,
-                   restore_kubernetes_namespaces_params,
-                   restore_kvm_vms_params,
-                   restore_one_drive_params,
-                   restore_outlook_params,
-                   restore_parent_source,
-                   restore_sub_task_vec,
-                   restore_task_purged,
-                   restore_view_datastore_entity,
-                   restore_vmware_vm_params,
-                   restored_objects_network_config,
-                   restored_to_different_source,
-                   retrieve_archive_progress_monitor_task_path,
-                   retrieve_archive_stub_view_name,
-                   retrieve_archive_task,
-                   retrieve_archive_task_uid,
-                   retrieve_archive_view_name,
-                   stub_view_relative_dir_name,
-                   vault_restore_params,
-                   vcd_config,
-                   view_box_id,
-                   view_name_deprecated,
-                   view_params,
-                   volume_info_vec)
+        return decode_model(cls, dictionary)
 
 
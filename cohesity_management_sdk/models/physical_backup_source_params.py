@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.physical_file_backup_params
-import cohesity_management_sdk.models.physical_snapshot_params
-import cohesity_management_sdk.models.source_app_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PhysicalBackupSourceParams(object):
 
@@ -36,6 +34,17 @@ class PhysicalBackupSourceParams(object):
         "volume_guid_vec":'volumeGuidVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "file_backup_params":'physical_file_backup_params.PhysicalFileBackupParams',
+        "snapshot_params":'physical_snapshot_params.PhysicalSnapshotParams',
+        "source_app_params":'source_app_params.SourceAppParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  enable_system_backup=None,
                  file_backup_params=None,
@@ -66,21 +75,6 @@ class PhysicalBackupSourceParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        enable_system_backup = dictionary.get('enableSystemBackup')
-        file_backup_params = cohesity_management_sdk.models.physical_file_backup_params.PhysicalFileBackupParams.from_dictionary(dictionary.get('fileBackupParams')) if dictionary.get('fileBackupParams') else None
-        snapshot_params = cohesity_management_sdk.models.physical_snapshot_params.PhysicalSnapshotParams.from_dictionary(dictionary.get('snapshotParams')) if dictionary.get('snapshotParams') else None
-        source_app_params = cohesity_management_sdk.models.source_app_params.SourceAppParams.from_dictionary(dictionary.get('sourceAppParams')) if dictionary.get('sourceAppParams') else None
-        volume_guid_vec = dictionary.get('volumeGuidVec')
-
-        # Return an object of this model
-        return cls(enable_system_backup,
-                   file_backup_params,
-                   snapshot_params,
-                   source_app_params,
-                   volume_guid_vec)
+        return decode_model(cls, dictionary)
 
 
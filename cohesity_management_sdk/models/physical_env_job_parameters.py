@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.file_path_filter
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PhysicalEnvJobParameters(object):
 
@@ -35,6 +35,15 @@ class PhysicalEnvJobParameters(object):
         "incremental_snapshot_upon_restart":'incrementalSnapshotUponRestart'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "file_path_filters":'file_path_filter.FilePathFilter'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  file_path_filters=None,
                  incremental_snapshot_upon_restart=None):
@@ -59,15 +68,6 @@ class PhysicalEnvJobParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        file_path_filters = cohesity_management_sdk.models.file_path_filter.FilePathFilter.from_dictionary(dictionary.get('filePathFilters')) if dictionary.get('filePathFilters') else None
-        incremental_snapshot_upon_restart = dictionary.get('incrementalSnapshotUponRestart')
-
-        # Return an object of this model
-        return cls(file_path_filters,
-                   incremental_snapshot_upon_restart)
+        return decode_model(cls, dictionary)
 
 
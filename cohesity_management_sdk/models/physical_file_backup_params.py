@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.physical_file_backup_params_backup_path_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PhysicalFileBackupParams(object):
 
@@ -28,6 +28,15 @@ class PhysicalFileBackupParams(object):
         "uses_skip_nested_volumes_vec":'usesSkipNestedVolumesVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "backup_path_info_vec":['physical_file_backup_params_backup_path_info.PhysicalFileBackupParamsBackupPathInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_path_info_vec=None,
                  skip_nested_volumes_vec=None,
@@ -54,21 +63,6 @@ class PhysicalFileBackupParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_path_info_vec = None
-        if dictionary.get('backupPathInfoVec') != None:
-            backup_path_info_vec = list()
-            for structure in dictionary.get('backupPathInfoVec'):
-                backup_path_info_vec.append(cohesity_management_sdk.models.physical_file_backup_params_backup_path_info.PhysicalFileBackupParamsBackupPathInfo.from_dictionary(structure))
-        skip_nested_volumes_vec = dictionary.get('skipNestedVolumesVec')
-        uses_skip_nested_volumes_vec = dictionary.get('usesSkipNestedVolumesVec')
-
-        # Return an object of this model
-        return cls(backup_path_info_vec,
-                   skip_nested_volumes_vec,
-                   uses_skip_nested_volumes_vec)
+        return decode_model(cls, dictionary)
 
 
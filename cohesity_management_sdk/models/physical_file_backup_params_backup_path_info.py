@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PhysicalFileBackupParamsBackupPathInfo(object):
 
@@ -33,6 +34,9 @@ class PhysicalFileBackupParamsBackupPathInfo(object):
         "skip_nested_volumes":'skipNestedVolumes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  exclude_paths=None,
                  include_path=None,
@@ -59,17 +63,6 @@ class PhysicalFileBackupParamsBackupPathInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        exclude_paths = dictionary.get('excludePaths')
-        include_path = dictionary.get('includePath')
-        skip_nested_volumes = dictionary.get('skipNestedVolumes')
-
-        # Return an object of this model
-        return cls(exclude_paths,
-                   include_path,
-                   skip_nested_volumes)
+        return decode_model(cls, dictionary)
 
 
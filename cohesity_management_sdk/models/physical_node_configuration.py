@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PhysicalNodeConfiguration(object):
 
@@ -22,6 +23,9 @@ class PhysicalNodeConfiguration(object):
         "node_ipmi_ip":'nodeIpmiIp'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  node_id=None,
                  node_ip=None,
@@ -48,17 +52,6 @@ class PhysicalNodeConfiguration(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        node_id = dictionary.get('nodeId')
-        node_ip = dictionary.get('nodeIp')
-        node_ipmi_ip = dictionary.get('nodeIpmiIp')
-
-        # Return an object of this model
-        return cls(node_id,
-                   node_ip,
-                   node_ipmi_ip)
+        return decode_model(cls, dictionary)
 
 
@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.agent_information
-import cohesity_management_sdk.models.universal_id
-import cohesity_management_sdk.models.networking_information
-import cohesity_management_sdk.models.physical_volume
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PhysicalProtectionSource(object):
 
@@ -66,6 +63,18 @@ class PhysicalProtectionSource(object):
         "volumes":'volumes'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "agents":['agent_information.AgentInformation'],
+        "id":'universal_id.UniversalId',
+        "networking_info":'networking_information.NetworkingInformation',
+        "volumes":['physical_volume.PhysicalVolume']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  agents=None,
                  host_name=None,
@@ -108,41 +117,6 @@ class PhysicalProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        agents = None
-        if dictionary.get('agents') != None:
-            agents = list()
-            for structure in dictionary.get('agents'):
-                agents.append(cohesity_management_sdk.models.agent_information.AgentInformation.from_dictionary(structure))
-        host_name = dictionary.get('hostName')
-        host_type = dictionary.get('hostType')
-        id = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('id')) if dictionary.get('id') else None
-        memory_size_bytes = dictionary.get('memorySizeBytes')
-        name = dictionary.get('name')
-        networking_info = cohesity_management_sdk.models.networking_information.NetworkingInformation.from_dictionary(dictionary.get('networkingInfo')) if dictionary.get('networkingInfo') else None
-        num_processors = dictionary.get('numProcessors')
-        os_name = dictionary.get('osName')
-        mtype = dictionary.get('type')
-        volumes = None
-        if dictionary.get('volumes') != None:
-            volumes = list()
-            for structure in dictionary.get('volumes'):
-                volumes.append(cohesity_management_sdk.models.physical_volume.PhysicalVolume.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(agents,
-                   host_name,
-                   host_type,
-                   id,
-                   memory_size_bytes,
-                   name,
-                   networking_info,
-                   num_processors,
-                   os_name,
-                   mtype,
-                   volumes)
+        return decode_model(cls, dictionary)
 
 
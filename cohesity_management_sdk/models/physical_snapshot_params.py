@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PhysicalSnapshotParams(object):
 
@@ -29,6 +30,9 @@ class PhysicalSnapshotParams(object):
         "vss_excluded_writers":'vssExcludedWriters'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  fetch_snapshot_metadata_disabled=None,
                  notify_backup_complete_disabled=None,
@@ -57,19 +61,6 @@ class PhysicalSnapshotParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        fetch_snapshot_metadata_disabled = dictionary.get('fetchSnapshotMetadataDisabled')
-        notify_backup_complete_disabled = dictionary.get('notifyBackupCompleteDisabled')
-        vss_copy_only_backup = dictionary.get('vssCopyOnlyBackup')
-        vss_excluded_writers = dictionary.get('vssExcludedWriters')
-
-        # Return an object of this model
-        return cls(fetch_snapshot_metadata_disabled,
-                   notify_backup_complete_disabled,
-                   vss_copy_only_backup,
-                   vss_excluded_writers)
+        return decode_model(cls, dictionary)
 
 
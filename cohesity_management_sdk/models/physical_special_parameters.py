@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.application_parameters
-import cohesity_management_sdk.models.file_path_parameters
-import cohesity_management_sdk.models.windows_host_snapshot_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PhysicalSpecialParameters(object):
 
@@ -46,6 +44,17 @@ class PhysicalSpecialParameters(object):
         "windows_parameters":'windowsParameters'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "application_parameters":'application_parameters.ApplicationParameters',
+        "file_paths":['file_path_parameters.FilePathParameters'],
+        "windows_parameters":'windows_host_snapshot_parameters.WindowsHostSnapshotParameters'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  application_parameters=None,
                  enable_system_backup=None,
@@ -80,29 +89,6 @@ class PhysicalSpecialParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        application_parameters = cohesity_management_sdk.models.application_parameters.ApplicationParameters.from_dictionary(dictionary.get('applicationParameters')) if dictionary.get('applicationParameters') else None
-        enable_system_backup = dictionary.get('enableSystemBackup')
-        file_paths = None
-        if dictionary.get('filePaths') != None:
-            file_paths = list()
-            for structure in dictionary.get('filePaths'):
-                file_paths.append(cohesity_management_sdk.models.file_path_parameters.FilePathParameters.from_dictionary(structure))
-        skip_nested_volumes_vec = dictionary.get('skipNestedVolumesVec')
-        uses_skip_nested_volumes_vec = dictionary.get('usesSkipNestedVolumesVec')
-        volume_guid = dictionary.get('volumeGuid')
-        windows_parameters = cohesity_management_sdk.models.windows_host_snapshot_parameters.WindowsHostSnapshotParameters.from_dictionary(dictionary.get('windowsParameters')) if dictionary.get('windowsParameters') else None
-
-        # Return an object of this model
-        return cls(application_parameters,
-                   enable_system_backup,
-                   file_paths,
-                   skip_nested_volumes_vec,
-                   uses_skip_nested_volumes_vec,
-                   volume_guid,
-                   windows_parameters)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PhysicalVolume(object):
 
@@ -50,6 +51,9 @@ class PhysicalVolume(object):
         "used_size_bytes":'usedSizeBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  device_path=None,
                  guid=None,
@@ -92,33 +96,6 @@ class PhysicalVolume(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        device_path = dictionary.get('devicePath')
-        guid = dictionary.get('guid')
-        is_boot_volume = dictionary.get('isBootVolume')
-        is_extended_attributes_supported = dictionary.get('isExtendedAttributesSupported')
-        is_protected = dictionary.get('isProtected')
-        label = dictionary.get('label')
-        logical_size_bytes = dictionary.get('logicalSizeBytes')
-        mount_points = dictionary.get('mountPoints')
-        mount_type = dictionary.get('mountType')
-        network_path = dictionary.get('networkPath')
-        used_size_bytes = dictionary.get('usedSizeBytes')
-
-        # Return an object of this model
-        return cls(device_path,
-                   guid,
-                   is_boot_volume,
-                   is_extended_attributes_supported,
-                   is_protected,
-                   label,
-                   logical_size_bytes,
-                   mount_points,
-                   mount_type,
-                   network_path,
-                   used_size_bytes)
+        return decode_model(cls, dictionary)
 
 
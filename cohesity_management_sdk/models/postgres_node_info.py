@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PostgresNodeInfo(object):
 
@@ -32,6 +33,9 @@ class PostgresNodeInfo(object):
         "port":'port'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  default_password=None,
                  default_username=None,
@@ -62,21 +66,6 @@ class PostgresNodeInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        default_password = dictionary.get('defaultPassword')
-        default_username = dictionary.get('defaultUsername')
-        node_id = dictionary.get('nodeId')
-        node_ip = dictionary.get('nodeIp')
-        port = dictionary.get('port')
-
-        # Return an object of this model
-        return cls(default_password,
-                   default_username,
-                   node_id,
-                   node_ip,
-                   port)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PowerStateConfigProto(object):
 
@@ -18,6 +19,9 @@ class PowerStateConfigProto(object):
         "power_on":'powerOn'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  power_on=None):
         """Constructor for the PowerStateConfigProto class"""
@@ -40,13 +44,6 @@ class PowerStateConfigProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        power_on = dictionary.get('powerOn')
-
-        # Return an object of this model
-        return cls(power_on)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Preferences(object):
 
@@ -20,6 +21,9 @@ class Preferences(object):
         "locale":'locale'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  locale=None):
         """Constructor for the Preferences class"""
@@ -42,13 +46,6 @@ class Preferences(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        locale = dictionary.get('locale')
-
-        # Return an object of this model
-        return cls(locale)
+        return decode_model(cls, dictionary)
 
 
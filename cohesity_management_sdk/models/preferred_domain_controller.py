@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PreferredDomainController(object):
 
@@ -23,6 +24,9 @@ class PreferredDomainController(object):
         "domain_name":'domainName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain_controllers=None,
                  domain_name=None):
@@ -47,15 +51,6 @@ class PreferredDomainController(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain_controllers = dictionary.get('domainControllers')
-        domain_name = dictionary.get('domainName')
-
-        # Return an object of this model
-        return cls(domain_controllers,
-                   domain_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Principal(object):
 
@@ -33,6 +34,9 @@ class Principal(object):
         "sid":'sid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain=None,
                  full_name=None,
@@ -63,21 +67,6 @@ class Principal(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain = dictionary.get('domain')
-        full_name = dictionary.get('fullName')
-        object_class = dictionary.get('objectClass')
-        principal_name = dictionary.get('principalName')
-        sid = dictionary.get('sid')
-
-        # Return an object of this model
-        return cls(domain,
-                   full_name,
-                   object_class,
-                   principal_name,
-                   sid)
+        return decode_model(cls, dictionary)
 
 
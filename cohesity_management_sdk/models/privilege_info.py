@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PrivilegeInfo(object):
 
@@ -49,6 +50,9 @@ class PrivilegeInfo(object):
         "name":'name'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  privilege_id=None,
                  category=None,
@@ -87,29 +91,6 @@ class PrivilegeInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        privilege_id = dictionary.get('PrivilegeId')
-        category = dictionary.get('category')
-        description = dictionary.get('description')
-        is_available_on_helios = dictionary.get('isAvailableOnHelios')
-        is_custom_role_default = dictionary.get('isCustomRoleDefault')
-        is_special = dictionary.get('isSpecial')
-        is_view_only = dictionary.get('isViewOnly')
-        label = dictionary.get('label')
-        name = dictionary.get('name')
-
-        # Return an object of this model
-        return cls(privilege_id,
-                   category,
-                   description,
-                   is_available_on_helios,
-                   is_custom_role_default,
-                   is_special,
-                   is_view_only,
-                   label,
-                   name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProductModelInterfaceTuple(object):
 
@@ -20,6 +21,9 @@ class ProductModelInterfaceTuple(object):
         "product_model_name":'productModelName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  iface_name=None,
                  product_model_name=None):
@@ -44,15 +48,6 @@ class ProductModelInterfaceTuple(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        iface_name = dictionary.get('ifaceName')
-        product_model_name = dictionary.get('productModelName')
-
-        # Return an object of this model
-        return cls(iface_name,
-                   product_model_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectObjectParameters(object):
 
@@ -58,6 +59,9 @@ class ProtectObjectParameters(object):
         "protection_source_environment":'protectionSourceEnvironment'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  protection_source_ids=None,
                  rpo_policy_id=None,
@@ -84,17 +88,6 @@ class ProtectObjectParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        protection_source_ids = dictionary.get('protectionSourceIds')
-        rpo_policy_id = dictionary.get('rpoPolicyId')
-        protection_source_environment = dictionary.get('protectionSourceEnvironment')
-
-        # Return an object of this model
-        return cls(protection_source_ids,
-                   rpo_policy_id,
-                   protection_source_environment)
+        return decode_model(cls, dictionary)
 
 
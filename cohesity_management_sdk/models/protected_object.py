@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectedObject(object):
 
@@ -27,6 +27,15 @@ class ProtectedObject(object):
         "protection_source_id":'protectionSourceId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "job_id":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  job_id=None,
                  protection_fauilure_reason=None,
@@ -53,17 +62,6 @@ class ProtectedObject(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        job_id = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('jobId')) if dictionary.get('jobId') else None
-        protection_fauilure_reason = dictionary.get('protectionFauilureReason')
-        protection_source_id = dictionary.get('protectionSourceId')
-
-        # Return an object of this model
-        return cls(job_id,
-                   protection_fauilure_reason,
-                   protection_source_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectedObjectsByEnv(object):
 
@@ -26,6 +27,9 @@ class ProtectedObjectsByEnv(object):
         "unprotected_size_bytes":'unprotectedSizeBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  env_type=None,
                  protected_count=None,
@@ -56,21 +60,6 @@ class ProtectedObjectsByEnv(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        env_type = dictionary.get('envType')
-        protected_count = dictionary.get('protectedCount')
-        protected_size_bytes = dictionary.get('protectedSizeBytes')
-        unprotected_count = dictionary.get('unprotectedCount')
-        unprotected_size_bytes = dictionary.get('unprotectedSizeBytes')
-
-        # Return an object of this model
-        return cls(env_type,
-                   protected_count,
-                   protected_size_bytes,
-                   unprotected_count,
-                   unprotected_size_bytes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protected_objects_summary_by_env
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectedObjectsSummary(object):
 
@@ -32,6 +32,15 @@ class ProtectedObjectsSummary(object):
         "unprotected_size_bytes":'unprotectedSizeBytes'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "stats_by_env":['protected_objects_summary_by_env.ProtectedObjectsSummaryByEnv']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  num_objects_protected=None,
                  num_objects_unprotected=None,
@@ -62,25 +71,6 @@ class ProtectedObjectsSummary(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        num_objects_protected = dictionary.get('numObjectsProtected')
-        num_objects_unprotected = dictionary.get('numObjectsUnprotected')
-        protected_size_bytes = dictionary.get('protectedSizeBytes')
-        stats_by_env = None
-        if dictionary.get('statsByEnv') != None:
-            stats_by_env = list()
-            for structure in dictionary.get('statsByEnv'):
-                stats_by_env.append(cohesity_management_sdk.models.protected_objects_summary_by_env.ProtectedObjectsSummaryByEnv.from_dictionary(structure))
-        unprotected_size_bytes = dictionary.get('unprotectedSizeBytes')
-
-        # Return an object of this model
-        return cls(num_objects_protected,
-                   num_objects_unprotected,
-                   protected_size_bytes,
-                   stats_by_env,
-                   unprotected_size_bytes)
+        return decode_model(cls, dictionary)
 
 
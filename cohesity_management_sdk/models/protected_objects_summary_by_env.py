@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectedObjectsSummaryByEnv(object):
 
@@ -31,6 +32,9 @@ class ProtectedObjectsSummaryByEnv(object):
         "unprotected_size_bytes":'unprotectedSizeBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  environment=None,
                  num_objects_protected=None,
@@ -61,21 +65,6 @@ class ProtectedObjectsSummaryByEnv(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        environment = dictionary.get('environment')
-        num_objects_protected = dictionary.get('numObjectsProtected')
-        num_objects_unprotected = dictionary.get('numObjectsUnprotected')
-        protected_size_bytes = dictionary.get('protectedSizeBytes')
-        unprotected_size_bytes = dictionary.get('unprotectedSizeBytes')
-
-        # Return an object of this model
-        return cls(environment,
-                   num_objects_protected,
-                   num_objects_unprotected,
-                   protected_size_bytes,
-                   unprotected_size_bytes)
+        return decode_model(cls, dictionary)
 
 
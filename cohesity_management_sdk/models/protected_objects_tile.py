@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protected_objects_by_env
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectedObjectsTile(object):
 
@@ -28,6 +28,15 @@ class ProtectedObjectsTile(object):
         "unprotected_size_bytes":'unprotectedSizeBytes'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "objects_protected":['protected_objects_by_env.ProtectedObjectsByEnv']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  objects_protected=None,
                  protected_count=None,
@@ -58,25 +67,6 @@ class ProtectedObjectsTile(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        objects_protected = None
-        if dictionary.get('objectsProtected') != None:
-            objects_protected = list()
-            for structure in dictionary.get('objectsProtected'):
-                objects_protected.append(cohesity_management_sdk.models.protected_objects_by_env.ProtectedObjectsByEnv.from_dictionary(structure))
-        protected_count = dictionary.get('protectedCount')
-        protected_size_bytes = dictionary.get('protectedSizeBytes')
-        unprotected_count = dictionary.get('unprotectedCount')
-        unprotected_size_bytes = dictionary.get('unprotectedSizeBytes')
-
-        # Return an object of this model
-        return cls(objects_protected,
-                   protected_count,
-                   protected_size_bytes,
-                   unprotected_count,
-                   unprotected_size_bytes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.backup_run
-import cohesity_management_sdk.models.copy_run
-import cohesity_management_sdk.models.universal_id
-import cohesity_management_sdk.models.protection_source
-import cohesity_management_sdk.models.source_special_parameter
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectedSourceSummary(object):
 
@@ -48,6 +44,19 @@ class ProtectedSourceSummary(object):
         "source_parameters":'sourceParameters'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "backup_run":'backup_run.BackupRun',
+        "copy_runs":['copy_run.CopyRun'],
+        "protected_source_uid":'universal_id.UniversalId',
+        "protection_source":'protection_source.ProtectionSource',
+        "source_parameters":['source_special_parameter.SourceSpecialParameter']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_run=None,
                  copy_runs=None,
@@ -82,33 +91,6 @@ class ProtectedSourceSummary(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_run = cohesity_management_sdk.models.backup_run.BackupRun.from_dictionary(dictionary.get('backupRun')) if dictionary.get('backupRun') else None
-        copy_runs = None
-        if dictionary.get('copyRuns') != None:
-            copy_runs = list()
-            for structure in dictionary.get('copyRuns'):
-                copy_runs.append(cohesity_management_sdk.models.copy_run.CopyRun.from_dictionary(structure))
-        is_paused = dictionary.get('isPaused')
-        next_protection_run_time_usecs = dictionary.get('nextProtectionRunTimeUsecs')
-        protected_source_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('protectedSourceUid')) if dictionary.get('protectedSourceUid') else None
-        protection_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('protectionSource')) if dictionary.get('protectionSource') else None
-        source_parameters = None
-        if dictionary.get('sourceParameters') != None:
-            source_parameters = list()
-            for structure in dictionary.get('sourceParameters'):
-                source_parameters.append(cohesity_management_sdk.models.source_special_parameter.SourceSpecialParameter.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(backup_run,
-                   copy_runs,
-                   is_paused,
-                   next_protection_run_time_usecs,
-                   protected_source_uid,
-                   protection_source,
-                   source_parameters)
+        return decode_model(cls, dictionary)
 
 
@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_job
-import cohesity_management_sdk.models.protection_policy
-import cohesity_management_sdk.models.protection_source
-import cohesity_management_sdk.models.protection_summary
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectedVmInfo(object):
 
@@ -32,6 +29,18 @@ class ProtectedVmInfo(object):
         "stats":'stats'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "protection_jobs":['protection_job.ProtectionJob'],
+        "protection_policies":['protection_policy.ProtectionPolicy'],
+        "protection_source":'protection_source.ProtectionSource',
+        "stats":'protection_summary.ProtectionSummary'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  protection_jobs=None,
                  protection_policies=None,
@@ -60,27 +69,6 @@ class ProtectedVmInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        protection_jobs = None
-        if dictionary.get('protectionJobs') != None:
-            protection_jobs = list()
-            for structure in dictionary.get('protectionJobs'):
-                protection_jobs.append(cohesity_management_sdk.models.protection_job.ProtectionJob.from_dictionary(structure))
-        protection_policies = None
-        if dictionary.get('protectionPolicies') != None:
-            protection_policies = list()
-            for structure in dictionary.get('protectionPolicies'):
-                protection_policies.append(cohesity_management_sdk.models.protection_policy.ProtectionPolicy.from_dictionary(structure))
-        protection_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('protectionSource')) if dictionary.get('protectionSource') else None
-        stats = cohesity_management_sdk.models.protection_summary.ProtectionSummary.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-
-        # Return an object of this model
-        return cls(protection_jobs,
-                   protection_policies,
-                   protection_source,
-                   stats)
+        return decode_model(cls, dictionary)
 
 
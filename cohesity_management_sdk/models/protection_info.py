@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionInfo(object):
 
@@ -37,6 +38,9 @@ class ProtectionInfo(object):
         "total_snapshots":'totalSnapshots'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  end_time_usecs=None,
                  location=None,
@@ -75,29 +79,6 @@ class ProtectionInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        location = dictionary.get('location')
-        policy_id = dictionary.get('policyId')
-        protection_job_id = dictionary.get('protectionJobId')
-        protection_job_name = dictionary.get('protectionJobName')
-        retention_period = dictionary.get('retentionPeriod')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        storage_domain = dictionary.get('storageDomain')
-        total_snapshots = dictionary.get('totalSnapshots')
-
-        # Return an object of this model
-        return cls(end_time_usecs,
-                   location,
-                   policy_id,
-                   protection_job_id,
-                   protection_job_name,
-                   retention_period,
-                   start_time_usecs,
-                   storage_domain,
-                   total_snapshots)
+        return decode_model(cls, dictionary)
 
 
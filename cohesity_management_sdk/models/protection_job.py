@@ -1,18 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.alerting_config
-import cohesity_management_sdk.models.cloud_parameters
-import cohesity_management_sdk.models.data_migration_policy
-import cohesity_management_sdk.models.environment_type_job_parameters
-import cohesity_management_sdk.models.time_of_day
-import cohesity_management_sdk.models.indexing_policy
-import cohesity_management_sdk.models.protection_run_instance
-import cohesity_management_sdk.models.backup_script
-import cohesity_management_sdk.models.remote_job_script
-import cohesity_management_sdk.models.source_special_parameter
-import cohesity_management_sdk.models.protection_job_summary_stats
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionJob(object):
 
@@ -337,6 +326,29 @@ class ProtectionJob(object):
         "vm_tag_ids":'vmTagIds'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "alerting_config":'alerting_config.AlertingConfig',
+        "cloud_parameters":'cloud_parameters.CloudParameters',
+        "data_migration_policy":'data_migration_policy.DataMigrationPolicy',
+        "environment_parameters":'environment_type_job_parameters.EnvironmentTypeJobParameters',
+        "full_protection_start_time":'time_of_day.TimeOfDay',
+        "incremental_protection_start_time":'time_of_day.TimeOfDay',
+        "indexing_policy":'indexing_policy.IndexingPolicy',
+        "last_run":'protection_run_instance.ProtectionRunInstance',
+        "post_backup_script":'backup_script.BackupScript',
+        "pre_backup_script":'backup_script.BackupScript',
+        "remote_script":'remote_job_script.RemoteJobScript',
+        "source_special_parameters":['source_special_parameter.SourceSpecialParameter'],
+        "start_time":'time_of_day.TimeOfDay',
+        "summary_stats":'protection_job_summary_stats.ProtectionJobSummaryStats',
+        "uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  policy_id=None,
@@ -461,119 +473,6 @@ class ProtectionJob(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        policy_id = dictionary.get('policyId')
-        view_box_id = dictionary.get('viewBoxId')
-        abort_in_blackout_period = dictionary.get('abortInBlackoutPeriod')
-        alerting_config = cohesity_management_sdk.models.alerting_config.AlertingConfig.from_dictionary(dictionary.get('alertingConfig')) if dictionary.get('alertingConfig') else None
-        alerting_policy = dictionary.get('alertingPolicy')
-        cloud_parameters = cohesity_management_sdk.models.cloud_parameters.CloudParameters.from_dictionary(dictionary.get('cloudParameters')) if dictionary.get('cloudParameters') else None
-        continue_on_quiesce_failure = dictionary.get('continueOnQuiesceFailure')
-        create_remote_view = dictionary.get('createRemoteView')
-        creation_time_usecs = dictionary.get('creationTimeUsecs')
-        data_migration_policy = cohesity_management_sdk.models.data_migration_policy.DataMigrationPolicy.from_dictionary(dictionary.get('dataMigrationPolicy')) if dictionary.get('dataMigrationPolicy') else None
-        dedup_disabled_source_ids = dictionary.get('dedupDisabledSourceIds')
-        description = dictionary.get('description')
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        environment = dictionary.get('environment')
-        environment_parameters = cohesity_management_sdk.models.environment_type_job_parameters.EnvironmentTypeJobParameters.from_dictionary(dictionary.get('environmentParameters')) if dictionary.get('environmentParameters') else None
-        exclude_source_ids = dictionary.get('excludeSourceIds')
-        exclude_vm_tag_ids = dictionary.get('excludeVmTagIds')
-        full_protection_sla_time_mins = dictionary.get('fullProtectionSlaTimeMins')
-        full_protection_start_time = cohesity_management_sdk.models.time_of_day.TimeOfDay.from_dictionary(dictionary.get('fullProtectionStartTime')) if dictionary.get('fullProtectionStartTime') else None
-        id = dictionary.get('id')
-        incremental_protection_sla_time_mins = dictionary.get('incrementalProtectionSlaTimeMins')
-        incremental_protection_start_time = cohesity_management_sdk.models.time_of_day.TimeOfDay.from_dictionary(dictionary.get('incrementalProtectionStartTime')) if dictionary.get('incrementalProtectionStartTime') else None
-        indexing_policy = cohesity_management_sdk.models.indexing_policy.IndexingPolicy.from_dictionary(dictionary.get('indexingPolicy')) if dictionary.get('indexingPolicy') else None
-        is_active = dictionary.get('isActive')
-        is_deleted = dictionary.get('isDeleted')
-        is_paused = dictionary.get('isPaused')
-        last_run = cohesity_management_sdk.models.protection_run_instance.ProtectionRunInstance.from_dictionary(dictionary.get('lastRun')) if dictionary.get('lastRun') else None
-        leverage_storage_snapshots = dictionary.get('leverageStorageSnapshots')
-        leverage_storage_snapshots_for_hyperflex = dictionary.get('leverageStorageSnapshotsForHyperflex')
-        modification_time_usecs = dictionary.get('modificationTimeUsecs')
-        modified_by_user = dictionary.get('modifiedByUser')
-        parent_source_id = dictionary.get('parentSourceId')
-        perform_source_side_dedup = dictionary.get('performSourceSideDedup')
-        policy_applied_time_msecs = dictionary.get('policyAppliedTimeMsecs')
-        post_backup_script = cohesity_management_sdk.models.backup_script.BackupScript.from_dictionary(dictionary.get('postBackupScript')) if dictionary.get('postBackupScript') else None
-        pre_backup_script = cohesity_management_sdk.models.backup_script.BackupScript.from_dictionary(dictionary.get('preBackupScript')) if dictionary.get('preBackupScript') else None
-        priority = dictionary.get('priority')
-        qos_type = dictionary.get('qosType')
-        quiesce = dictionary.get('quiesce')
-        remote_script = cohesity_management_sdk.models.remote_job_script.RemoteJobScript.from_dictionary(dictionary.get('remoteScript')) if dictionary.get('remoteScript') else None
-        remote_view_name = dictionary.get('remoteViewName')
-        source_ids = dictionary.get('sourceIds')
-        source_special_parameters = None
-        if dictionary.get('sourceSpecialParameters') != None:
-            source_special_parameters = list()
-            for structure in dictionary.get('sourceSpecialParameters'):
-                source_special_parameters.append(cohesity_management_sdk.models.source_special_parameter.SourceSpecialParameter.from_dictionary(structure))
-        start_time = cohesity_management_sdk.models.time_of_day.TimeOfDay.from_dictionary(dictionary.get('startTime')) if dictionary.get('startTime') else None
-        summary_stats = cohesity_management_sdk.models.protection_job_summary_stats.ProtectionJobSummaryStats.from_dictionary(dictionary.get('summaryStats')) if dictionary.get('summaryStats') else None
-        tenant_id = dictionary.get('tenantId')
-        timezone = dictionary.get('timezone')
-        uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('uid')) if dictionary.get('uid') else None
-        user_specified_tags = dictionary.get('userSpecifiedTags')
-        view_name = dictionary.get('viewName')
-        vm_tag_ids = dictionary.get('vmTagIds')
-
-        # Return an object of this model
-        return cls(name,
-                   policy_id,
-                   view_box_id,
-                   abort_in_blackout_period,
-                   alerting_config,
-                   alerting_policy,
-                   cloud_parameters,
-                   continue_on_quiesce_failure,
-                   create_remote_view,
-                   creation_time_usecs,
-                   data_migration_policy,
-                   dedup_disabled_source_ids,
-                   description,
-                   end_time_usecs,
-                   environment,
-                   environment_parameters,
-                   exclude_source_ids,
-                   exclude_vm_tag_ids,
-                   full_protection_sla_time_mins,
-                   full_protection_start_time,
-                   id,
-                   incremental_protection_sla_time_mins,
-                   incremental_protection_start_time,
-                   indexing_policy,
-                   is_active,
-                   is_deleted,
-                   is_paused,
-                   last_run,
-                   leverage_storage_snapshots,
-                   leverage_storage_snapshots_for_hyperflex,
-                   modification_time_usecs,
-                   modified_by_user,
-                   parent_source_id,
-                   perform_source_side_dedup,
-                   policy_applied_time_msecs,
-                   post_backup_script,
-                   pre_backup_script,
-                   priority,
-                   qos_type,
-                   quiesce,
-                   remote_script,
-                   remote_view_name,
-                   source_ids,
-                   source_special_parameters,
-                   start_time,
-                   summary_stats,
-                   tenant_id,
-                   timezone,
-                   uid,
-                   user_specified_tags,
-                   view_name,
-                   vm_tag_ids)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_job
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionJobAuditTrail(object):
 
@@ -51,6 +51,16 @@ class ProtectionJobAuditTrail(object):
         "changes":'changes'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "after":'protection_job.ProtectionJob',
+        "before":'protection_job.ProtectionJob'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  after=None,
                  before=None,
@@ -77,17 +87,6 @@ class ProtectionJobAuditTrail(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        after = cohesity_management_sdk.models.protection_job.ProtectionJob.from_dictionary(dictionary.get('after')) if dictionary.get('after') else None
-        before = cohesity_management_sdk.models.protection_job.ProtectionJob.from_dictionary(dictionary.get('before')) if dictionary.get('before') else None
-        changes = dictionary.get('changes')
-
-        # Return an object of this model
-        return cls(after,
-                   before,
-                   changes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionJobInfo(object):
 
@@ -58,6 +59,9 @@ class ProtectionJobInfo(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  job_id=None,
                  job_name=None,
@@ -84,17 +88,6 @@ class ProtectionJobInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        job_id = dictionary.get('jobId')
-        job_name = dictionary.get('jobName')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(job_id,
-                   job_name,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,15 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.alerting_config
-import cohesity_management_sdk.models.cloud_parameters
-import cohesity_management_sdk.models.data_migration_policy
-import cohesity_management_sdk.models.environment_type_job_parameters
-import cohesity_management_sdk.models.time_of_day
-import cohesity_management_sdk.models.indexing_policy
-import cohesity_management_sdk.models.backup_script
-import cohesity_management_sdk.models.remote_job_script
-import cohesity_management_sdk.models.source_special_parameter
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionJobRequestBody(object):
 
@@ -292,6 +284,26 @@ class ProtectionJobRequestBody(object):
         "vm_tag_ids":'vmTagIds'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "alerting_config":'alerting_config.AlertingConfig',
+        "cloud_parameters":'cloud_parameters.CloudParameters',
+        "data_migration_policy":'data_migration_policy.DataMigrationPolicy',
+        "environment_parameters":'environment_type_job_parameters.EnvironmentTypeJobParameters',
+        "full_protection_start_time":'time_of_day.TimeOfDay',
+        "incremental_protection_start_time":'time_of_day.TimeOfDay',
+        "indexing_policy":'indexing_policy.IndexingPolicy',
+        "post_backup_script":'backup_script.BackupScript',
+        "pre_backup_script":'backup_script.BackupScript',
+        "remote_script":'remote_job_script.RemoteJobScript',
+        "source_special_parameters":['source_special_parameter.SourceSpecialParameter'],
+        "start_time":'time_of_day.TimeOfDay'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  policy_id=None,
@@ -392,95 +404,6 @@ class ProtectionJobRequestBody(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        policy_id = dictionary.get('policyId')
-        view_box_id = dictionary.get('viewBoxId')
-        abort_in_blackout_period = dictionary.get('abortInBlackoutPeriod')
-        alerting_config = cohesity_management_sdk.models.alerting_config.AlertingConfig.from_dictionary(dictionary.get('alertingConfig')) if dictionary.get('alertingConfig') else None
-        alerting_policy = dictionary.get('alertingPolicy')
-        cloud_parameters = cohesity_management_sdk.models.cloud_parameters.CloudParameters.from_dictionary(dictionary.get('cloudParameters')) if dictionary.get('cloudParameters') else None
-        continue_on_quiesce_failure = dictionary.get('continueOnQuiesceFailure')
-        create_remote_view = dictionary.get('createRemoteView')
-        data_migration_policy = cohesity_management_sdk.models.data_migration_policy.DataMigrationPolicy.from_dictionary(dictionary.get('dataMigrationPolicy')) if dictionary.get('dataMigrationPolicy') else None
-        dedup_disabled_source_ids = dictionary.get('dedupDisabledSourceIds')
-        description = dictionary.get('description')
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        environment = dictionary.get('environment')
-        environment_parameters = cohesity_management_sdk.models.environment_type_job_parameters.EnvironmentTypeJobParameters.from_dictionary(dictionary.get('environmentParameters')) if dictionary.get('environmentParameters') else None
-        exclude_source_ids = dictionary.get('excludeSourceIds')
-        exclude_vm_tag_ids = dictionary.get('excludeVmTagIds')
-        full_protection_sla_time_mins = dictionary.get('fullProtectionSlaTimeMins')
-        full_protection_start_time = cohesity_management_sdk.models.time_of_day.TimeOfDay.from_dictionary(dictionary.get('fullProtectionStartTime')) if dictionary.get('fullProtectionStartTime') else None
-        incremental_protection_sla_time_mins = dictionary.get('incrementalProtectionSlaTimeMins')
-        incremental_protection_start_time = cohesity_management_sdk.models.time_of_day.TimeOfDay.from_dictionary(dictionary.get('incrementalProtectionStartTime')) if dictionary.get('incrementalProtectionStartTime') else None
-        indexing_policy = cohesity_management_sdk.models.indexing_policy.IndexingPolicy.from_dictionary(dictionary.get('indexingPolicy')) if dictionary.get('indexingPolicy') else None
-        leverage_storage_snapshots = dictionary.get('leverageStorageSnapshots')
-        leverage_storage_snapshots_for_hyperflex = dictionary.get('leverageStorageSnapshotsForHyperflex')
-        parent_source_id = dictionary.get('parentSourceId')
-        perform_source_side_dedup = dictionary.get('performSourceSideDedup')
-        post_backup_script = cohesity_management_sdk.models.backup_script.BackupScript.from_dictionary(dictionary.get('postBackupScript')) if dictionary.get('postBackupScript') else None
-        pre_backup_script = cohesity_management_sdk.models.backup_script.BackupScript.from_dictionary(dictionary.get('preBackupScript')) if dictionary.get('preBackupScript') else None
-        priority = dictionary.get('priority')
-        qos_type = dictionary.get('qosType')
-        quiesce = dictionary.get('quiesce')
-        remote_script = cohesity_management_sdk.models.remote_job_script.RemoteJobScript.from_dictionary(dictionary.get('remoteScript')) if dictionary.get('remoteScript') else None
-        remote_view_name = dictionary.get('remoteViewName')
-        source_ids = dictionary.get('sourceIds')
-        source_special_parameters = None
-        if dictionary.get('sourceSpecialParameters') != None:
-            source_special_parameters = list()
-            for structure in dictionary.get('sourceSpecialParameters'):
-                source_special_parameters.append(cohesity_management_sdk.models.source_special_parameter.SourceSpecialParameter.from_dictionary(structure))
-        start_time = cohesity_management_sdk.models.time_of_day.TimeOfDay.from_dictionary(dictionary.get('startTime')) if dictionary.get('startTime') else None
-        timezone = dictionary.get('timezone')
-        user_specified_tags = dictionary.get('userSpecifiedTags')
-        view_name = dictionary.get('viewName')
-        vm_tag_ids = dictionary.get('vmTagIds')
-
-        # Return an object of this model
-        return cls(name,
-                   policy_id,
-                   view_box_id,
-                   abort_in_blackout_period,
-                   alerting_config,
-                   alerting_policy,
-                   cloud_parameters,
-                   continue_on_quiesce_failure,
-                   create_remote_view,
-                   data_migration_policy,
-                   dedup_disabled_source_ids,
-                   description,
-                   end_time_usecs,
-                   environment,
-                   environment_parameters,
-                   exclude_source_ids,
-                   exclude_vm_tag_ids,
-                   full_protection_sla_time_mins,
-                   full_protection_start_time,
-                   incremental_protection_sla_time_mins,
-                   incremental_protection_start_time,
-                   indexing_policy,
-                   leverage_storage_snapshots,
-                   leverage_storage_snapshots_for_hyperflex,
-                   parent_source_id,
-                   perform_source_side_dedup,
-                   post_backup_script,
-                   pre_backup_script,
-                   priority,
-                   qos_type,
-                   quiesce,
-                   remote_script,
-                   remote_view_name,
-                   source_ids,
-                   source_special_parameters,
-                   start_time,
-                   timezone,
-                   user_specified_tags,
-                   view_name,
-                   vm_tag_ids)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionJobSummary(object):
 
@@ -39,6 +40,9 @@ class ProtectionJobSummary(object):
         "policy_name":'policyName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_id=None,
                  cluster_incarnation_id=None,
@@ -75,27 +79,6 @@ class ProtectionJobSummary(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_id = dictionary.get('clusterId')
-        cluster_incarnation_id = dictionary.get('clusterIncarnationId')
-        is_rpo_job = dictionary.get('isRpoJob')
-        job_id = dictionary.get('jobId')
-        job_name = dictionary.get('jobName')
-        last_protection_job_run_status = dictionary.get('lastProtectionJobRunStatus')
-        policy_id = dictionary.get('policyId')
-        policy_name = dictionary.get('policyName')
-
-        # Return an object of this model
-        return cls(cluster_id,
-                   cluster_incarnation_id,
-                   is_rpo_job,
-                   job_id,
-                   job_name,
-                   last_protection_job_run_status,
-                   policy_id,
-                   policy_name)
+        return decode_model(cls, dictionary)
 
 
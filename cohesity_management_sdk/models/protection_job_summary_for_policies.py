@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.backup_run
-import cohesity_management_sdk.models.copy_run
-import cohesity_management_sdk.models.protection_job
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionJobSummaryForPolicies(object):
 
@@ -32,6 +30,17 @@ class ProtectionJobSummaryForPolicies(object):
         "protection_job":'protectionJob'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "backup_run":'backup_run.BackupRun',
+        "copy_runs":['copy_run.CopyRun'],
+        "protection_job":'protection_job.ProtectionJob'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_run=None,
                  copy_runs=None,
@@ -58,21 +67,6 @@ class ProtectionJobSummaryForPolicies(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_run = cohesity_management_sdk.models.backup_run.BackupRun.from_dictionary(dictionary.get('backupRun')) if dictionary.get('backupRun') else None
-        copy_runs = None
-        if dictionary.get('copyRuns') != None:
-            copy_runs = list()
-            for structure in dictionary.get('copyRuns'):
-                copy_runs.append(cohesity_management_sdk.models.copy_run.CopyRun.from_dictionary(structure))
-        protection_job = cohesity_management_sdk.models.protection_job.ProtectionJob.from_dictionary(dictionary.get('protectionJob')) if dictionary.get('protectionJob') else None
-
-        # Return an object of this model
-        return cls(backup_run,
-                   copy_runs,
-                   protection_job)
+        return decode_model(cls, dictionary)
 
 
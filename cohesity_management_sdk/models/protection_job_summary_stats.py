@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionJobSummaryStats(object):
 
@@ -56,6 +57,9 @@ class ProtectionJobSummaryStats(object):
         "total_physical_backup_size_bytes":'totalPhysicalBackupSizeBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  average_run_time_usecs=None,
                  fastest_run_time_usecs=None,
@@ -96,31 +100,6 @@ class ProtectionJobSummaryStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        average_run_time_usecs = dictionary.get('averageRunTimeUsecs')
-        fastest_run_time_usecs = dictionary.get('fastestRunTimeUsecs')
-        num_canceled_runs = dictionary.get('numCanceledRuns')
-        num_failed_runs = dictionary.get('numFailedRuns')
-        num_sla_violations = dictionary.get('numSlaViolations')
-        num_successful_runs = dictionary.get('numSuccessfulRuns')
-        slowest_run_time_usecs = dictionary.get('slowestRunTimeUsecs')
-        total_bytes_read_from_source = dictionary.get('totalBytesReadFromSource')
-        total_logical_backup_size_bytes = dictionary.get('totalLogicalBackupSizeBytes')
-        total_physical_backup_size_bytes = dictionary.get('totalPhysicalBackupSizeBytes')
-
-        # Return an object of this model
-        return cls(average_run_time_usecs,
-                   fastest_run_time_usecs,
-                   num_canceled_runs,
-                   num_failed_runs,
-                   num_sla_violations,
-                   num_successful_runs,
-                   slowest_run_time_usecs,
-                   total_bytes_read_from_source,
-                   total_logical_backup_size_bytes,
-                   total_physical_backup_size_bytes)
+        return decode_model(cls, dictionary)
 
 
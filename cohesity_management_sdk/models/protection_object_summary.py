@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_source
-import cohesity_management_sdk.models.protection_run_instance
-import cohesity_management_sdk.models.protection_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionObjectSummary(object):
 
@@ -53,6 +51,18 @@ class ProtectionObjectSummary(object):
         "total_replication_snapshots":'totalReplicationSnapshots'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "parent_protection_source":'protection_source.ProtectionSource',
+        "protection_jobs":['protection_run_instance.ProtectionRunInstance'],
+        "protection_source":'protection_source.ProtectionSource',
+        "rpo_policies":['protection_policy.ProtectionPolicy']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  latest_archival_snapshot_time_usecs=None,
                  latest_local_snapshot_time_usecs=None,
@@ -93,39 +103,6 @@ class ProtectionObjectSummary(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        latest_archival_snapshot_time_usecs = dictionary.get('latestArchivalSnapshotTimeUsecs')
-        latest_local_snapshot_time_usecs = dictionary.get('latestLocalSnapshotTimeUsecs')
-        latest_replication_snapshot_time_usecs = dictionary.get('latestReplicationSnapshotTimeUsecs')
-        parent_protection_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('parentProtectionSource')) if dictionary.get('parentProtectionSource') else None
-        protection_jobs = None
-        if dictionary.get('protectionJobs') != None:
-            protection_jobs = list()
-            for structure in dictionary.get('protectionJobs'):
-                protection_jobs.append(cohesity_management_sdk.models.protection_run_instance.ProtectionRunInstance.from_dictionary(structure))
-        protection_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('protectionSource')) if dictionary.get('protectionSource') else None
-        rpo_policies = None
-        if dictionary.get('rpoPolicies') != None:
-            rpo_policies = list()
-            for structure in dictionary.get('rpoPolicies'):
-                rpo_policies.append(cohesity_management_sdk.models.protection_policy.ProtectionPolicy.from_dictionary(structure))
-        total_archival_snapshots = dictionary.get('totalArchivalSnapshots')
-        total_local_snapshots = dictionary.get('totalLocalSnapshots')
-        total_replication_snapshots = dictionary.get('totalReplicationSnapshots')
-
-        # Return an object of this model
-        return cls(latest_archival_snapshot_time_usecs,
-                   latest_local_snapshot_time_usecs,
-                   latest_replication_snapshot_time_usecs,
-                   parent_protection_source,
-                   protection_jobs,
-                   protection_source,
-                   rpo_policies,
-                   total_archival_snapshots,
-                   total_local_snapshots,
-                   total_replication_snapshots)
+        return decode_model(cls, dictionary)
 
 
@@ -1,13 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.blackout_period
-import cohesity_management_sdk.models.snapshot_cloud_copy_policy
-import cohesity_management_sdk.models.extended_retention_policy
-import cohesity_management_sdk.models.scheduling_policy
-import cohesity_management_sdk.models.rpo_policy_settings
-import cohesity_management_sdk.models.snapshot_archival_copy_policy
-import cohesity_management_sdk.models.snapshot_replication_copy_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionPolicyRequest(object):
 
@@ -119,6 +113,24 @@ class ProtectionPolicyRequest(object):
         "worm_retention_type":'wormRetentionType'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "blackout_periods":['blackout_period.BlackoutPeriod'],
+        "cloud_deploy_policies":['snapshot_cloud_copy_policy.SnapshotCloudCopyPolicy'],
+        "extended_retention_policies":['extended_retention_policy.ExtendedRetentionPolicy'],
+        "full_scheduling_policy":'scheduling_policy.SchedulingPolicy',
+        "incremental_scheduling_policy":'scheduling_policy.SchedulingPolicy',
+        "log_scheduling_policy":'scheduling_policy.SchedulingPolicy',
+        "rpo_policy_settings":'rpo_policy_settings.RpoPolicySettings',
+        "snapshot_archival_copy_policies":['snapshot_archival_copy_policy.SnapshotArchivalCopyPolicy'],
+        "snapshot_replication_copy_policies":['snapshot_replication_copy_policy.SnapshotReplicationCopyPolicy'],
+        "system_scheduling_policy":'scheduling_policy.SchedulingPolicy'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  blackout_periods=None,
                  cloud_deploy_policies=None,
@@ -181,73 +193,6 @@ class ProtectionPolicyRequest(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        blackout_periods = None
-        if dictionary.get('blackoutPeriods') != None:
-            blackout_periods = list()
-            for structure in dictionary.get('blackoutPeriods'):
-                blackout_periods.append(cohesity_management_sdk.models.blackout_period.BlackoutPeriod.from_dictionary(structure))
-        cloud_deploy_policies = None
-        if dictionary.get('cloudDeployPolicies') != None:
-            cloud_deploy_policies = list()
-            for structure in dictionary.get('cloudDeployPolicies'):
-                cloud_deploy_policies.append(cohesity_management_sdk.models.snapshot_cloud_copy_policy.SnapshotCloudCopyPolicy.from_dictionary(structure))
-        days_to_keep = dictionary.get('daysToKeep')
-        days_to_keep_log = dictionary.get('daysToKeepLog')
-        days_to_keep_system = dictionary.get('daysToKeepSystem')
-        description = dictionary.get('description')
-        extended_retention_policies = None
-        if dictionary.get('extendedRetentionPolicies') != None:
-            extended_retention_policies = list()
-            for structure in dictionary.get('extendedRetentionPolicies'):
-                extended_retention_policies.append(cohesity_management_sdk.models.extended_retention_policy.ExtendedRetentionPolicy.from_dictionary(structure))
-        full_scheduling_policy = cohesity_management_sdk.models.scheduling_policy.SchedulingPolicy.from_dictionary(dictionary.get('fullSchedulingPolicy')) if dictionary.get('fullSchedulingPolicy') else None
-        incremental_scheduling_policy = cohesity_management_sdk.models.scheduling_policy.SchedulingPolicy.from_dictionary(dictionary.get('incrementalSchedulingPolicy')) if dictionary.get('incrementalSchedulingPolicy') else None
-        log_scheduling_policy = cohesity_management_sdk.models.scheduling_policy.SchedulingPolicy.from_dictionary(dictionary.get('logSchedulingPolicy')) if dictionary.get('logSchedulingPolicy') else None
-        name = dictionary.get('name')
-        num_linked_policies = dictionary.get('numLinkedPolicies')
-        retries = dictionary.get('retries')
-        retry_interval_mins = dictionary.get('retryIntervalMins')
-        rpo_policy_settings = cohesity_management_sdk.models.rpo_policy_settings.RpoPolicySettings.from_dictionary(dictionary.get('rpoPolicySettings')) if dictionary.get('rpoPolicySettings') else None
-        skip_interval_mins = dictionary.get('skipIntervalMins')
-        snapshot_archival_copy_policies = None
-        if dictionary.get('snapshotArchivalCopyPolicies') != None:
-            snapshot_archival_copy_policies = list()
-            for structure in dictionary.get('snapshotArchivalCopyPolicies'):
-                snapshot_archival_copy_policies.append(cohesity_management_sdk.models.snapshot_archival_copy_policy.SnapshotArchivalCopyPolicy.from_dictionary(structure))
-        snapshot_replication_copy_policies = None
-        if dictionary.get('snapshotReplicationCopyPolicies') != None:
-            snapshot_replication_copy_policies = list()
-            for structure in dictionary.get('snapshotReplicationCopyPolicies'):
-                snapshot_replication_copy_policies.append(cohesity_management_sdk.models.snapshot_replication_copy_policy.SnapshotReplicationCopyPolicy.from_dictionary(structure))
-        system_scheduling_policy = cohesity_management_sdk.models.scheduling_policy.SchedulingPolicy.from_dictionary(dictionary.get('systemSchedulingPolicy')) if dictionary.get('systemSchedulingPolicy') else None
-        mtype = dictionary.get('type')
-        worm_retention_type = dictionary.get('wormRetentionType')
-
-        # Return an object of this model
-        return cls(blackout_periods,
-                   cloud_deploy_policies,
-                   days_to_keep,
-                   days_to_keep_log,
-                   days_to_keep_system,
-                   description,
-                   extended_retention_policies,
-                   full_scheduling_policy,
-                   incremental_scheduling_policy,
-                   log_scheduling_policy,
-                   name,
-                   num_linked_policies,
-                   retries,
-                   retry_interval_mins,
-                   rpo_policy_settings,
-                   skip_interval_mins,
-                   snapshot_archival_copy_policies,
-                   snapshot_replication_copy_policies,
-                   system_scheduling_policy,
-                   mtype,
-                   worm_retention_type)
+        return decode_model(cls, dictionary)
 
 
@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.last_protection_run_summary
-import cohesity_management_sdk.models.protected_source_summary
-import cohesity_management_sdk.models.protection_job_summary_for_policies
-import cohesity_management_sdk.models.protection_policy
-import cohesity_management_sdk.models.protection_runs_summary
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionPolicySummary(object):
 
@@ -47,6 +43,19 @@ class ProtectionPolicySummary(object):
         "protection_runs_summary":'protectionRunsSummary'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "last_protection_run_summary":'last_protection_run_summary.LastProtectionRunSummary',
+        "protected_sources_summary":['protected_source_summary.ProtectedSourceSummary'],
+        "protection_jobs_summary":['protection_job_summary_for_policies.ProtectionJobSummaryForPolicies'],
+        "protection_policy":'protection_policy.ProtectionPolicy',
+        "protection_runs_summary":'protection_runs_summary.ProtectionRunsSummary'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  last_protection_run_summary=None,
                  pagination_cookie=None,
@@ -79,31 +88,6 @@ class ProtectionPolicySummary(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        last_protection_run_summary = cohesity_management_sdk.models.last_protection_run_summary.LastProtectionRunSummary.from_dictionary(dictionary.get('lastProtectionRunSummary')) if dictionary.get('lastProtectionRunSummary') else None
-        pagination_cookie = dictionary.get('paginationCookie')
-        protected_sources_summary = None
-        if dictionary.get('protectedSourcesSummary') != None:
-            protected_sources_summary = list()
-            for structure in dictionary.get('protectedSourcesSummary'):
-                protected_sources_summary.append(cohesity_management_sdk.models.protected_source_summary.ProtectedSourceSummary.from_dictionary(structure))
-        protection_jobs_summary = None
-        if dictionary.get('protectionJobsSummary') != None:
-            protection_jobs_summary = list()
-            for structure in dictionary.get('protectionJobsSummary'):
-                protection_jobs_summary.append(cohesity_management_sdk.models.protection_job_summary_for_policies.ProtectionJobSummaryForPolicies.from_dictionary(structure))
-        protection_policy = cohesity_management_sdk.models.protection_policy.ProtectionPolicy.from_dictionary(dictionary.get('protectionPolicy')) if dictionary.get('protectionPolicy') else None
-        protection_runs_summary = cohesity_management_sdk.models.protection_runs_summary.ProtectionRunsSummary.from_dictionary(dictionary.get('protectionRunsSummary')) if dictionary.get('protectionRunsSummary') else None
-
-        # Return an object of this model
-        return cls(last_protection_run_summary,
-                   pagination_cookie,
-                   protected_sources_summary,
-                   protection_jobs_summary,
-                   protection_policy,
-                   protection_runs_summary)
+        return decode_model(cls, dictionary)
 
 
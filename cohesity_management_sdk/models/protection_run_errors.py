@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.request_error
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionRunErrors(object):
 
@@ -26,6 +26,15 @@ class ProtectionRunErrors(object):
         "pagination_cookie":'paginationCookie'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "errors":['request_error.RequestError']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  errors=None,
                  file_names=None,
@@ -52,21 +61,6 @@ class ProtectionRunErrors(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        errors = None
-        if dictionary.get('errors') != None:
-            errors = list()
-            for structure in dictionary.get('errors'):
-                errors.append(cohesity_management_sdk.models.request_error.RequestError.from_dictionary(structure))
-        file_names = dictionary.get('fileNames')
-        pagination_cookie = dictionary.get('paginationCookie')
-
-        # Return an object of this model
-        return cls(errors,
-                   file_names,
-                   pagination_cookie)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.backup_run
-import cohesity_management_sdk.models.copy_run
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionRunInstance(object):
 
@@ -42,6 +40,17 @@ class ProtectionRunInstance(object):
         "view_box_id":'viewBoxId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "backup_run":'backup_run.BackupRun',
+        "copy_run":['copy_run.CopyRun'],
+        "job_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_run=None,
                  copy_run=None,
@@ -74,27 +83,6 @@ class ProtectionRunInstance(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_run = cohesity_management_sdk.models.backup_run.BackupRun.from_dictionary(dictionary.get('backupRun')) if dictionary.get('backupRun') else None
-        copy_run = None
-        if dictionary.get('copyRun') != None:
-            copy_run = list()
-            for structure in dictionary.get('copyRun'):
-                copy_run.append(cohesity_management_sdk.models.copy_run.CopyRun.from_dictionary(structure))
-        job_id = dictionary.get('jobId')
-        job_name = dictionary.get('jobName')
-        job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-        view_box_id = dictionary.get('viewBoxId')
-
-        # Return an object of this model
-        return cls(backup_run,
-                   copy_run,
-                   job_id,
-                   job_name,
-                   job_uid,
-                   view_box_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.latest_protection_job_run_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionRunResponse(object):
 
@@ -27,6 +27,17 @@ class ProtectionRunResponse(object):
         "replication_runs":'replicationRuns'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "archival_runs":['latest_protection_job_run_info.LatestProtectionJobRunInfo'],
+        "backup_runs":['latest_protection_job_run_info.LatestProtectionJobRunInfo'],
+        "replication_runs":['latest_protection_job_run_info.LatestProtectionJobRunInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  archival_runs=None,
                  backup_runs=None,
@@ -53,29 +64,6 @@ class ProtectionRunResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        archival_runs = None
-        if dictionary.get('archivalRuns') != None:
-            archival_runs = list()
-            for structure in dictionary.get('archivalRuns'):
-                archival_runs.append(cohesity_management_sdk.models.latest_protection_job_run_info.LatestProtectionJobRunInfo.from_dictionary(structure))
-        backup_runs = None
-        if dictionary.get('backupRuns') != None:
-            backup_runs = list()
-            for structure in dictionary.get('backupRuns'):
-                backup_runs.append(cohesity_management_sdk.models.latest_protection_job_run_info.LatestProtectionJobRunInfo.from_dictionary(structure))
-        replication_runs = None
-        if dictionary.get('replicationRuns') != None:
-            replication_runs = list()
-            for structure in dictionary.get('replicationRuns'):
-                replication_runs.append(cohesity_management_sdk.models.latest_protection_job_run_info.LatestProtectionJobRunInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(archival_runs,
-                   backup_runs,
-                   replication_runs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionRunsStats(object):
 
@@ -23,6 +24,9 @@ class ProtectionRunsStats(object):
         "num_replication_runs":'numReplicationRuns'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  num_archival_runs=None,
                  num_backup_runs=None,
@@ -49,17 +53,6 @@ class ProtectionRunsStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        num_archival_runs = dictionary.get('numArchivalRuns')
-        num_backup_runs = dictionary.get('numBackupRuns')
-        num_replication_runs = dictionary.get('numReplicationRuns')
-
-        # Return an object of this model
-        return cls(num_archival_runs,
-                   num_backup_runs,
-                   num_replication_runs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionRunsSummary(object):
 
@@ -39,6 +40,9 @@ class ProtectionRunsSummary(object):
         "number_of_successful_replication_runs":'numberOfSuccessfulReplicationRuns'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  number_of_archival_runs=None,
                  number_of_protection_runs=None,
@@ -71,23 +75,6 @@ class ProtectionRunsSummary(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        number_of_archival_runs = dictionary.get('numberOfArchivalRuns')
-        number_of_protection_runs = dictionary.get('numberOfProtectionRuns')
-        number_of_replication_runs = dictionary.get('numberOfReplicationRuns')
-        number_of_successful_archival_runs = dictionary.get('numberOfSuccessfulArchivalRuns')
-        number_of_successful_protection_runs = dictionary.get('numberOfSuccessfulProtectionRuns')
-        number_of_successful_replication_runs = dictionary.get('numberOfSuccessfulReplicationRuns')
-
-        # Return an object of this model
-        return cls(number_of_archival_runs,
-                   number_of_protection_runs,
-                   number_of_replication_runs,
-                   number_of_successful_archival_runs,
-                   number_of_successful_protection_runs,
-                   number_of_successful_replication_runs)
+        return decode_model(cls, dictionary)
 
 
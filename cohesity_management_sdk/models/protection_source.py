@@ -1,27 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.acropolis_protection_source
-import cohesity_management_sdk.models.ad_protection_source
-import cohesity_management_sdk.models.aws_protection_source
-import cohesity_management_sdk.models.azure_protection_source
-import cohesity_management_sdk.models.flash_blade_protection_source
-import cohesity_management_sdk.models.gcp_protection_source
-import cohesity_management_sdk.models.gpfs_protection_source
-import cohesity_management_sdk.models.hyper_flex_protection_source
-import cohesity_management_sdk.models.hyperv_protection_source
-import cohesity_management_sdk.models.isilon_protection_source
-import cohesity_management_sdk.models.kubernetes_protection_source
-import cohesity_management_sdk.models.kvm_protection_source
-import cohesity_management_sdk.models.nas_protection_source
-import cohesity_management_sdk.models.netapp_protection_source
-import cohesity_management_sdk.models.office_365_protection_source
-import cohesity_management_sdk.models.oracle_protection_source
-import cohesity_management_sdk.models.physical_protection_source
-import cohesity_management_sdk.models.pure_protection_source
-import cohesity_management_sdk.models.sql_protection_source
-import cohesity_management_sdk.models.view_protection_source
-import cohesity_management_sdk.models.vmware_protection_source
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionSource(object):
 
@@ -162,6 +142,35 @@ class ProtectionSource(object):
         "vmware_protection_source":'vmWareProtectionSource'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "acropolis_protection_source":'acropolis_protection_source.AcropolisProtectionSource',
+        "ad_protection_source":'ad_protection_source.AdProtectionSource',
+        "aws_protection_source":'aws_protection_source.AwsProtectionSource',
+        "azure_protection_source":'azure_protection_source.AzureProtectionSource',
+        "flash_blade_protection_source":'flash_blade_protection_source.FlashBladeProtectionSource',
+        "gcp_protection_source":'gcp_protection_source.GcpProtectionSource',
+        "gpfs_protection_source":'gpfs_protection_source.GpfsProtectionSource',
+        "hyper_flex_protection_source":'hyper_flex_protection_source.HyperFlexProtectionSource',
+        "hyperv_protection_source":'hyperv_protection_source.HypervProtectionSource',
+        "isilon_protection_source":'isilon_protection_source.IsilonProtectionSource',
+        "kubernetes_protection_source":'kubernetes_protection_source.KubernetesProtectionSource',
+        "kvm_protection_source":'kvm_protection_source.KvmProtectionSource',
+        "nas_protection_source":'nas_protection_source.NasProtectionSource',
+        "netapp_protection_source":'netapp_protection_source.NetappProtectionSource',
+        "office_365_protection_source":'office_365_protection_source.Office365ProtectionSource',
+        "oracle_protection_source":'oracle_protection_source.OracleProtectionSource',
+        "physical_protection_source":'physical_protection_source.PhysicalProtectionSource',
+        "pure_protection_source":'pure_protection_source.PureProtectionSource',
+        "sql_protection_source":'sql_protection_source.SqlProtectionSource',
+        "view_protection_source":'view_protection_source.ViewProtectionSource',
+        "vmware_protection_source":'vmware_protection_source.VmwareProtectionSource'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  acropolis_protection_source=None,
                  ad_protection_source=None,
@@ -232,61 +241,6 @@ class ProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        acropolis_protection_source = cohesity_management_sdk.models.acropolis_protection_source.AcropolisProtectionSource.from_dictionary(dictionary.get('acropolisProtectionSource')) if dictionary.get('acropolisProtectionSource') else None
-        ad_protection_source = cohesity_management_sdk.models.ad_protection_source.AdProtectionSource.from_dictionary(dictionary.get('adProtectionSource')) if dictionary.get('adProtectionSource') else None
-        aws_protection_source = cohesity_management_sdk.models.aws_protection_source.AwsProtectionSource.from_dictionary(dictionary.get('awsProtectionSource')) if dictionary.get('awsProtectionSource') else None
-        azure_protection_source = cohesity_management_sdk.models.azure_protection_source.AzureProtectionSource.from_dictionary(dictionary.get('azureProtectionSource')) if dictionary.get('azureProtectionSource') else None
-        environment = dictionary.get('environment')
-        flash_blade_protection_source = cohesity_management_sdk.models.flash_blade_protection_source.FlashBladeProtectionSource.from_dictionary(dictionary.get('flashBladeProtectionSource')) if dictionary.get('flashBladeProtectionSource') else None
-        gcp_protection_source = cohesity_management_sdk.models.gcp_protection_source.GcpProtectionSource.from_dictionary(dictionary.get('gcpProtectionSource')) if dictionary.get('gcpProtectionSource') else None
-        gpfs_protection_source = cohesity_management_sdk.models.gpfs_protection_source.GpfsProtectionSource.from_dictionary(dictionary.get('gpfsProtectionSource')) if dictionary.get('gpfsProtectionSource') else None
-        hyper_flex_protection_source = cohesity_management_sdk.models.hyper_flex_protection_source.HyperFlexProtectionSource.from_dictionary(dictionary.get('hyperFlexProtectionSource')) if dictionary.get('hyperFlexProtectionSource') else None
-        hyperv_protection_source = cohesity_management_sdk.models.hyperv_protection_source.HypervProtectionSource.from_dictionary(dictionary.get('hypervProtectionSource')) if dictionary.get('hypervProtectionSource') else None
-        id = dictionary.get('id')
-        isilon_protection_source = cohesity_management_sdk.models.isilon_protection_source.IsilonProtectionSource.from_dictionary(dictionary.get('isilonProtectionSource')) if dictionary.get('isilonProtectionSource') else None
-        kubernetes_protection_source = cohesity_management_sdk.models.kubernetes_protection_source.KubernetesProtectionSource.from_dictionary(dictionary.get('kubernetesProtectionSource')) if dictionary.get('kubernetesProtectionSource') else None
-        kvm_protection_source = cohesity_management_sdk.models.kvm_protection_source.KvmProtectionSource.from_dictionary(dictionary.get('kvmProtectionSource')) if dictionary.get('kvmProtectionSource') else None
-        name = dictionary.get('name')
-        nas_protection_source = cohesity_management_sdk.models.nas_protection_source.NasProtectionSource.from_dictionary(dictionary.get('nasProtectionSource')) if dictionary.get('nasProtectionSource') else None
-        netapp_protection_source = cohesity_management_sdk.models.netapp_protection_source.NetappProtectionSource.from_dictionary(dictionary.get('netappProtectionSource')) if dictionary.get('netappProtectionSource') else None
-        office_365_protection_source = cohesity_management_sdk.models.office_365_protection_source.Office365ProtectionSource.from_dictionary(dictionary.get('office365ProtectionSource')) if dictionary.get('office365ProtectionSource') else None
-        oracle_protection_source = cohesity_management_sdk.models.oracle_protection_source.OracleProtectionSource.from_dictionary(dictionary.get('oracleProtectionSource')) if dictionary.get('oracleProtectionSource') else None
-        parent_id = dictionary.get('parentId')
-        physical_protection_source = cohesity_management_sdk.models.physical_protection_source.PhysicalProtectionSource.from_dictionary(dictionary.get('physicalProtectionSource')) if dictionary.get('physicalProtectionSource') else None
-        pure_protection_source = cohesity_management_sdk.models.pure_protection_source.PureProtectionSource.from_dictionary(dictionary.get('pureProtectionSource')) if dictionary.get('pureProtectionSource') else None
-        sql_protection_source = cohesity_management_sdk.models.sql_protection_source.SqlProtectionSource.from_dictionary(dictionary.get('sqlProtectionSource')) if dictionary.get('sqlProtectionSource') else None
-        view_protection_source = cohesity_management_sdk.models.view_protection_source.ViewProtectionSource.from_dictionary(dictionary.get('viewProtectionSource')) if dictionary.get('viewProtectionSource') else None
-        vmware_protection_source = cohesity_management_sdk.models.vmware_protection_source.VmwareProtectionSource.from_dictionary(dictionary.get('vmWareProtectionSource')) if dictionary.get('vmWareProtectionSource') else None
-
-        # Return an object of this model
-        return cls(acropolis_protection_source,
-                   ad_protection_source,
-                   aws_protection_source,
-                   azure_protection_source,
-                   environment,
-                   flash_blade_protection_source,
-                   gcp_protection_source,
-                   gpfs_protection_source,
-                   hyper_flex_protection_source,
-                   hyperv_protection_source,
-                   id,
-                   isilon_protection_source,
-                   kubernetes_protection_source,
-                   kvm_protection_source,
-                   name,
-                   nas_protection_source,
-                   netapp_protection_source,
-                   office_365_protection_source,
-                   oracle_protection_source,
-                   parent_id,
-                   physical_protection_source,
-                   pure_protection_source,
-                   sql_protection_source,
-                   view_protection_source,
-                   vmware_protection_source)
+        return decode_model(cls, dictionary)
 
 
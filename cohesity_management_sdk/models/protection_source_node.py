@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_permission_information
-import cohesity_management_sdk.models.aggregated_subtree_info
-import cohesity_management_sdk.models.protection_source
-import cohesity_management_sdk.models.registered_source_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionSourceNode(object):
 
@@ -67,6 +64,19 @@ class ProtectionSourceNode(object):
         "unprotected_sources_summary":'unprotectedSourcesSummary'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "entity_permission_info":'entity_permission_information.EntityPermissionInformation',
+        "protected_sources_summary":['aggregated_subtree_info.AggregatedSubtreeInfo'],
+        "protection_source":'protection_source.ProtectionSource',
+        "registration_info":'registered_source_info.RegisteredSourceInfo',
+        "unprotected_sources_summary":['aggregated_subtree_info.AggregatedSubtreeInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  application_nodes=None,
                  entity_permission_info=None,
@@ -103,35 +113,6 @@ class ProtectionSourceNode(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        application_nodes = dictionary.get('applicationNodes')
-        entity_permission_info = cohesity_management_sdk.models.entity_permission_information.EntityPermissionInformation.from_dictionary(dictionary.get('entityPermissionInfo')) if dictionary.get('entityPermissionInfo') else None
-        logical_size = dictionary.get('logicalSize')
-        nodes = dictionary.get('nodes')
-        protected_sources_summary = None
-        if dictionary.get('protectedSourcesSummary') != None:
-            protected_sources_summary = list()
-            for structure in dictionary.get('protectedSourcesSummary'):
-                protected_sources_summary.append(cohesity_management_sdk.models.aggregated_subtree_info.AggregatedSubtreeInfo.from_dictionary(structure))
-        protection_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('protectionSource')) if dictionary.get('protectionSource') else None
-        registration_info = cohesity_management_sdk.models.registered_source_info.RegisteredSourceInfo.from_dictionary(dictionary.get('registrationInfo')) if dictionary.get('registrationInfo') else None
-        unprotected_sources_summary = None
-        if dictionary.get('unprotectedSourcesSummary') != None:
-            unprotected_sources_summary = list()
-            for structure in dictionary.get('unprotectedSourcesSummary'):
-                unprotected_sources_summary.append(cohesity_management_sdk.models.aggregated_subtree_info.AggregatedSubtreeInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(application_nodes,
-                   entity_permission_info,
-                   logical_size,
-                   nodes,
-                   protected_sources_summary,
-                   protection_source,
-                   registration_info,
-                   unprotected_sources_summary)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_job_summary
-import cohesity_management_sdk.models.protection_source
-import cohesity_management_sdk.models.protection_source_uid
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionSourceResponse(object):
 
@@ -39,6 +37,18 @@ class ProtectionSourceResponse(object):
         "uuid":'uuid'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "jobs":['protection_job_summary.ProtectionJobSummary'],
+        "parent_source":'protection_source.ProtectionSource',
+        "protection_source_uid_list":['protection_source_uid.ProtectionSourceUid'],
+        "source":'protection_source.ProtectionSource'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  jobs=None,
                  logical_size_in_bytes=None,
@@ -71,31 +81,6 @@ class ProtectionSourceResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        jobs = None
-        if dictionary.get('jobs') != None:
-            jobs = list()
-            for structure in dictionary.get('jobs'):
-                jobs.append(cohesity_management_sdk.models.protection_job_summary.ProtectionJobSummary.from_dictionary(structure))
-        logical_size_in_bytes = dictionary.get('logicalSizeInBytes')
-        parent_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('parentSource')) if dictionary.get('parentSource') else None
-        protection_source_uid_list = None
-        if dictionary.get('protectionSourceUidList') != None:
-            protection_source_uid_list = list()
-            for structure in dictionary.get('protectionSourceUidList'):
-                protection_source_uid_list.append(cohesity_management_sdk.models.protection_source_uid.ProtectionSourceUid.from_dictionary(structure))
-        source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('source')) if dictionary.get('source') else None
-        uuid = dictionary.get('uuid')
-
-        # Return an object of this model
-        return cls(jobs,
-                   logical_size_in_bytes,
-                   parent_source,
-                   protection_source_uid_list,
-                   source,
-                   uuid)
+        return decode_model(cls, dictionary)
 
 
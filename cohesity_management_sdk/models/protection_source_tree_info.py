@@ -1,12 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.application_info
-import cohesity_management_sdk.models.entity_permission_information
-import cohesity_management_sdk.models.registered_source_info
-import cohesity_management_sdk.models.protection_source
-import cohesity_management_sdk.models.protection_summary
-import cohesity_management_sdk.models.protection_summary_by_env
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionSourceTreeInfo(object):
 
@@ -52,6 +47,20 @@ class ProtectionSourceTreeInfo(object):
         "stats_by_env":'statsByEnv'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "applications":['application_info.ApplicationInfo'],
+        "entity_permission_info":'entity_permission_information.EntityPermissionInformation',
+        "registration_info":'registered_source_info.RegisteredSourceInfo',
+        "root_node":'protection_source.ProtectionSource',
+        "stats":'protection_summary.ProtectionSummary',
+        "stats_by_env":['protection_summary_by_env.ProtectionSummaryByEnv']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  applications=None,
                  entity_permission_info=None,
@@ -86,33 +95,6 @@ class ProtectionSourceTreeInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        applications = None
-        if dictionary.get('applications') != None:
-            applications = list()
-            for structure in dictionary.get('applications'):
-                applications.append(cohesity_management_sdk.models.application_info.ApplicationInfo.from_dictionary(structure))
-        entity_permission_info = cohesity_management_sdk.models.entity_permission_information.EntityPermissionInformation.from_dictionary(dictionary.get('entityPermissionInfo')) if dictionary.get('entityPermissionInfo') else None
-        logical_size_bytes = dictionary.get('logicalSizeBytes')
-        registration_info = cohesity_management_sdk.models.registered_source_info.RegisteredSourceInfo.from_dictionary(dictionary.get('registrationInfo')) if dictionary.get('registrationInfo') else None
-        root_node = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('rootNode')) if dictionary.get('rootNode') else None
-        stats = cohesity_management_sdk.models.protection_summary.ProtectionSummary.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-        stats_by_env = None
-        if dictionary.get('statsByEnv') != None:
-            stats_by_env = list()
-            for structure in dictionary.get('statsByEnv'):
-                stats_by_env.append(cohesity_management_sdk.models.protection_summary_by_env.ProtectionSummaryByEnv.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(applications,
-                   entity_permission_info,
-                   logical_size_bytes,
-                   registration_info,
-                   root_node,
-                   stats,
-                   stats_by_env)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionSourceUid(object):
 
@@ -26,6 +27,9 @@ class ProtectionSourceUid(object):
         "source_id":'sourceId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_id=None,
                  cluster_incarnation_id=None,
@@ -54,19 +58,6 @@ class ProtectionSourceUid(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_id = dictionary.get('clusterId')
-        cluster_incarnation_id = dictionary.get('clusterIncarnationId')
-        parent_source_id = dictionary.get('parentSourceId')
-        source_id = dictionary.get('sourceId')
-
-        # Return an object of this model
-        return cls(cluster_id,
-                   cluster_incarnation_id,
-                   parent_source_id,
-                   source_id)
+        return decode_model(cls, dictionary)
 
 
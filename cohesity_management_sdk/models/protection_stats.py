@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionStats(object):
 
@@ -22,6 +23,9 @@ class ProtectionStats(object):
         "size_bytes":'sizeBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  num_failed=None,
                  num_objects=None,
@@ -48,17 +52,6 @@ class ProtectionStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        num_failed = dictionary.get('numFailed')
-        num_objects = dictionary.get('numObjects')
-        size_bytes = dictionary.get('sizeBytes')
-
-        # Return an object of this model
-        return cls(num_failed,
-                   num_objects,
-                   size_bytes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionSummary(object):
 
@@ -29,6 +30,9 @@ class ProtectionSummary(object):
         "unprotected_size":'unprotectedSize'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  protected_count=None,
                  protected_size=None,
@@ -57,19 +61,6 @@ class ProtectionSummary(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        protected_count = dictionary.get('protectedCount')
-        protected_size = dictionary.get('protectedSize')
-        unprotected_count = dictionary.get('unprotectedCount')
-        unprotected_size = dictionary.get('unprotectedSize')
-
-        # Return an object of this model
-        return cls(protected_count,
-                   protected_size,
-                   unprotected_count,
-                   unprotected_size)
+        return decode_model(cls, dictionary)
 
 
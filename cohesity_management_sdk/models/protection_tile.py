@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ProtectionTile(object):
 
@@ -25,6 +25,18 @@ class ProtectionTile(object):
         "last_day_replication_out":'lastDayReplicationOut'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "last_day_archival":'protection_stats.ProtectionStats',
+        "last_day_backup":'protection_stats.ProtectionStats',
+        "last_day_replication_in":'protection_stats.ProtectionStats',
+        "last_day_replication_out":'protection_stats.ProtectionStats'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  last_day_archival=None,
                  last_day_backup=None,
@@ -53,19 +65,6 @@ class ProtectionTile(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        last_day_archival = cohesity_management_sdk.models.protection_stats.ProtectionStats.from_dictionary(dictionary.get('lastDayArchival')) if dictionary.get('lastDayArchival') else None
-        last_day_backup = cohesity_management_sdk.models.protection_stats.ProtectionStats.from_dictionary(dictionary.get('lastDayBackup')) if dictionary.get('lastDayBackup') else None
-        last_day_replication_in = cohesity_management_sdk.models.protection_stats.ProtectionStats.from_dictionary(dictionary.get('lastDayReplicationIn')) if dictionary.get('lastDayReplicationIn') else None
-        last_day_replication_out = cohesity_management_sdk.models.protection_stats.ProtectionStats.from_dictionary(dictionary.get('lastDayReplicationOut')) if dictionary.get('lastDayReplicationOut') else None
-
-        # Return an object of this model
-        return cls(last_day_archival,
-                   last_day_backup,
-                   last_day_replication_in,
-                   last_day_replication_out)
+        return decode_model(cls, dictionary)
 
 
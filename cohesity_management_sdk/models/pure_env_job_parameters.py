@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PureEnvJobParameters(object):
 
@@ -22,6 +23,9 @@ class PureEnvJobParameters(object):
         "max_snapshots_on_primary":'maxSnapshotsOnPrimary'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  max_snapshots_on_primary=None):
         """Constructor for the PureEnvJobParameters class"""
@@ -44,13 +48,6 @@ class PureEnvJobParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        max_snapshots_on_primary = dictionary.get('maxSnapshotsOnPrimary')
-
-        # Return an object of this model
-        return cls(max_snapshots_on_primary)
+        return decode_model(cls, dictionary)
 
 
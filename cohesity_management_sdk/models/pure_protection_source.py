@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.pure_storage_array
-import cohesity_management_sdk.models.pure_volume
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PureProtectionSource(object):
 
@@ -31,6 +30,16 @@ class PureProtectionSource(object):
         "volume":'volume'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "storage_array":'pure_storage_array.PureStorageArray',
+        "volume":'pure_volume.PureVolume'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  storage_array=None,
@@ -59,19 +68,6 @@ class PureProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        storage_array = cohesity_management_sdk.models.pure_storage_array.PureStorageArray.from_dictionary(dictionary.get('storageArray')) if dictionary.get('storageArray') else None
-        mtype = dictionary.get('type')
-        volume = cohesity_management_sdk.models.pure_volume.PureVolume.from_dictionary(dictionary.get('volume')) if dictionary.get('volume') else None
-
-        # Return an object of this model
-        return cls(name,
-                   storage_array,
-                   mtype,
-                   volume)
+        return decode_model(cls, dictionary)
 
 
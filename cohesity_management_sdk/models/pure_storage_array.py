@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.iscsi_san_port
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PureStorageArray(object):
 
@@ -27,6 +27,15 @@ class PureStorageArray(object):
         "version":'version'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ports":['iscsi_san_port.IscsiSanPort']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  id=None,
                  ports=None,
@@ -55,23 +64,6 @@ class PureStorageArray(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        id = dictionary.get('id')
-        ports = None
-        if dictionary.get('ports') != None:
-            ports = list()
-            for structure in dictionary.get('ports'):
-                ports.append(cohesity_management_sdk.models.iscsi_san_port.IscsiSanPort.from_dictionary(structure))
-        revision = dictionary.get('revision')
-        version = dictionary.get('version')
-
-        # Return an object of this model
-        return cls(id,
-                   ports,
-                   revision,
-                   version)
+        return decode_model(cls, dictionary)
 
 
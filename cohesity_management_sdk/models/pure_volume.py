@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class PureVolume(object):
 
@@ -30,6 +31,9 @@ class PureVolume(object):
         "used_bytes":'usedBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  created_time=None,
                  parent_volume=None,
@@ -60,21 +64,6 @@ class PureVolume(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        created_time = dictionary.get('createdTime')
-        parent_volume = dictionary.get('parentVolume')
-        serial_number = dictionary.get('serialNumber')
-        size_bytes = dictionary.get('sizeBytes')
-        used_bytes = dictionary.get('usedBytes')
-
-        # Return an object of this model
-        return cls(created_time,
-                   parent_volume,
-                   serial_number,
-                   size_bytes,
-                   used_bytes)
+        return decode_model(cls, dictionary)
 
 
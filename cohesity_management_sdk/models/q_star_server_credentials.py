@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class QStarServerCredentials(object):
 
@@ -40,6 +41,9 @@ class QStarServerCredentials(object):
         "username":'username'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  host=None,
                  integral_volume_names=None,
@@ -74,25 +78,6 @@ class QStarServerCredentials(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        host = dictionary.get('host')
-        integral_volume_names = dictionary.get('integralVolumeNames')
-        password = dictionary.get('password')
-        port = dictionary.get('port')
-        share_type = dictionary.get('shareType')
-        use_https = dictionary.get('useHttps')
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(host,
-                   integral_volume_names,
-                   password,
-                   port,
-                   share_type,
-                   use_https,
-                   username)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class QoS(object):
 
@@ -23,6 +24,9 @@ class QoS(object):
         "principal_name":'principalName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  principal_name=None):
         """Constructor for the QoS class"""
@@ -45,13 +49,6 @@ class QoS(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        principal_name = dictionary.get('principalName')
-
-        # Return an object of this model
-        return cls(principal_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class QoSPolicy(object):
 
@@ -47,6 +48,9 @@ class QoSPolicy(object):
         "work_load_type":'workLoadType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  always_use_ssd=None,
                  id=None,
@@ -89,33 +93,6 @@ class QoSPolicy(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        always_use_ssd = dictionary.get('alwaysUseSsd')
-        id = dictionary.get('id')
-        min_requests = dictionary.get('minRequests')
-        name = dictionary.get('name')
-        priority = dictionary.get('priority')
-        random_write_hydra_pct = dictionary.get('randomWriteHydraPct')
-        random_write_ssd_pct = dictionary.get('randomWriteSsdPct')
-        seq_write_hydra_pct = dictionary.get('seqWriteHydraPct')
-        seq_write_ssd_pct = dictionary.get('seqWriteSsdPct')
-        weight = dictionary.get('weight')
-        work_load_type = dictionary.get('workLoadType')
-
-        # Return an object of this model
-        return cls(always_use_ssd,
-                   id,
-                   min_requests,
-                   name,
-                   priority,
-                   random_write_hydra_pct,
-                   random_write_ssd_pct,
-                   seq_write_hydra_pct,
-                   seq_write_ssd_pct,
-                   weight,
-                   work_load_type)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.quota_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class QuotaAndUsageInView(object):
 
@@ -41,6 +41,15 @@ class QuotaAndUsageInView(object):
         "view_name":'viewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "quota":'quota_policy.QuotaPolicy'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  quota=None,
                  usage_bytes=None,
@@ -69,19 +78,6 @@ class QuotaAndUsageInView(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        quota = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('quota')) if dictionary.get('quota') else None
-        usage_bytes = dictionary.get('usageBytes')
-        view_id = dictionary.get('viewId')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(quota,
-                   usage_bytes,
-                   view_id,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
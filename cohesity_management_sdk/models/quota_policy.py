@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class QuotaPolicy(object):
 
@@ -50,6 +51,9 @@ class QuotaPolicy(object):
         "hard_limit_bytes":'hardLimitBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alert_limit_bytes=None,
                  alert_threshold_percentage=None,
@@ -76,17 +80,6 @@ class QuotaPolicy(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alert_limit_bytes = dictionary.get('alertLimitBytes')
-        alert_threshold_percentage = dictionary.get('alertThresholdPercentage')
-        hard_limit_bytes = dictionary.get('hardLimitBytes')
-
-        # Return an object of this model
-        return cls(alert_limit_bytes,
-                   alert_threshold_percentage,
-                   hard_limit_bytes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RdsParams(object):
 
@@ -45,6 +46,9 @@ class RdsParams(object):
         "is_multi_az_deployment":'isMultiAzDeployment'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  db_instance_id=None,
                  availability_zone_id=None,
@@ -85,31 +89,6 @@ class RdsParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        db_instance_id = dictionary.get('dbInstanceId')
-        availability_zone_id = dictionary.get('availabilityZoneId')
-        db_option_group_id = dictionary.get('dbOptionGroupId')
-        db_parameter_group_id = dictionary.get('dbParameterGroupId')
-        db_port = dictionary.get('dbPort')
-        enable_auto_minor_version_upgrade = dictionary.get('enableAutoMinorVersionUpgrade')
-        enable_copy_tags_to_snapshots = dictionary.get('enableCopyTagsToSnapshots')
-        enable_db_authentication = dictionary.get('enableDbAuthentication')
-        enable_public_accessibility = dictionary.get('enablePublicAccessibility')
-        is_multi_az_deployment = dictionary.get('isMultiAzDeployment')
-
-        # Return an object of this model
-        return cls(db_instance_id,
-                   availability_zone_id,
-                   db_option_group_id,
-                   db_parameter_group_id,
-                   db_port,
-                   enable_auto_minor_version_upgrade,
-                   enable_copy_tags_to_snapshots,
-                   enable_db_authentication,
-                   enable_public_accessibility,
-                   is_multi_az_deployment)
+        return decode_model(cls, dictionary)
 
 
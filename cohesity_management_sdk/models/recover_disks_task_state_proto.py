@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.recover_virtual_disk_info_proto
-import cohesity_management_sdk.models.recover_virtual_disk_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RecoverDisksTaskStateProto(object):
 
@@ -30,6 +29,16 @@ class RecoverDisksTaskStateProto(object):
         "recover_virtual_disk_params":'recoverVirtualDiskParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "recover_virtual_disk_info":'recover_virtual_disk_info_proto.RecoverVirtualDiskInfoProto',
+        "recover_virtual_disk_params":'recover_virtual_disk_params.RecoverVirtualDiskParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  recover_virtual_disk_info=None,
                  recover_virtual_disk_params=None):
@@ -54,15 +63,6 @@ class RecoverDisksTaskStateProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        recover_virtual_disk_info = cohesity_management_sdk.models.recover_virtual_disk_info_proto.RecoverVirtualDiskInfoProto.from_dictionary(dictionary.get('recoverVirtualDiskInfo')) if dictionary.get('recoverVirtualDiskInfo') else None
-        recover_virtual_disk_params = cohesity_management_sdk.models.recover_virtual_disk_params.RecoverVirtualDiskParams.from_dictionary(dictionary.get('recoverVirtualDiskParams')) if dictionary.get('recoverVirtualDiskParams') else None
-
-        # Return an object of this model
-        return cls(recover_virtual_disk_info,
-                   recover_virtual_disk_params)
+        return decode_model(cls, dictionary)
 
 
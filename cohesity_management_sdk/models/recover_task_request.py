@@ -1,16 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.acropolis_restore_parameters
-import cohesity_management_sdk.models.deploy_vms_to_cloud
-import cohesity_management_sdk.models.hyperv_restore_parameters
-import cohesity_management_sdk.models.mount_volumes_parameters
-import cohesity_management_sdk.models.restore_object_details
-import cohesity_management_sdk.models.outlook_restore_parameters
-import cohesity_management_sdk.models.update_view_param
-import cohesity_management_sdk.models.virtual_disk_restore_parameters
-import cohesity_management_sdk.models.vlan_parameters
-import cohesity_management_sdk.models.vmware_restore_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RecoverTaskRequest(object):
 
@@ -110,6 +101,24 @@ class RecoverTaskRequest(object):
         "vmware_parameters":'vmwareParameters'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "acropolis_parameters":'acropolis_restore_parameters.AcropolisRestoreParameters',
+        "deploy_vms_to_cloud":'deploy_vms_to_cloud.DeployVmsToCloud',
+        "hyperv_parameters":'hyperv_restore_parameters.HypervRestoreParameters',
+        "mount_parameters":'mount_volumes_parameters.MountVolumesParameters',
+        "objects":['restore_object_details.RestoreObjectDetails'],
+        "outlook_parameters":'outlook_restore_parameters.OutlookRestoreParameters',
+        "restore_view_parameters":'update_view_param.UpdateViewParam',
+        "virtual_disk_restore_parameters":'virtual_disk_restore_parameters.VirtualDiskRestoreParameters',
+        "vlan_parameters":'vlan_parameters.VlanParameters',
+        "vmware_parameters":'vmware_restore_parameters.VmwareRestoreParameters'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  mtype=None,
@@ -162,47 +171,6 @@ class RecoverTaskRequest(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-        acropolis_parameters = cohesity_management_sdk.models.acropolis_restore_parameters.AcropolisRestoreParameters.from_dictionary(dictionary.get('acropolisParameters')) if dictionary.get('acropolisParameters') else None
-        continue_on_error = dictionary.get('continueOnError')
-        deploy_vms_to_cloud = cohesity_management_sdk.models.deploy_vms_to_cloud.DeployVmsToCloud.from_dictionary(dictionary.get('deployVmsToCloud')) if dictionary.get('deployVmsToCloud') else None
-        glacier_retrieval_type = dictionary.get('glacierRetrievalType')
-        hyperv_parameters = cohesity_management_sdk.models.hyperv_restore_parameters.HypervRestoreParameters.from_dictionary(dictionary.get('hypervParameters')) if dictionary.get('hypervParameters') else None
-        mount_parameters = cohesity_management_sdk.models.mount_volumes_parameters.MountVolumesParameters.from_dictionary(dictionary.get('mountParameters')) if dictionary.get('mountParameters') else None
-        new_parent_id = dictionary.get('newParentId')
-        objects = None
-        if dictionary.get('objects') != None:
-            objects = list()
-            for structure in dictionary.get('objects'):
-                objects.append(cohesity_management_sdk.models.restore_object_details.RestoreObjectDetails.from_dictionary(structure))
-        outlook_parameters = cohesity_management_sdk.models.outlook_restore_parameters.OutlookRestoreParameters.from_dictionary(dictionary.get('outlookParameters')) if dictionary.get('outlookParameters') else None
-        restore_view_parameters = cohesity_management_sdk.models.update_view_param.UpdateViewParam.from_dictionary(dictionary.get('restoreViewParameters')) if dictionary.get('restoreViewParameters') else None
-        view_name = dictionary.get('viewName')
-        virtual_disk_restore_parameters = cohesity_management_sdk.models.virtual_disk_restore_parameters.VirtualDiskRestoreParameters.from_dictionary(dictionary.get('virtualDiskRestoreParameters')) if dictionary.get('virtualDiskRestoreParameters') else None
-        vlan_parameters = cohesity_management_sdk.models.vlan_parameters.VlanParameters.from_dictionary(dictionary.get('vlanParameters')) if dictionary.get('vlanParameters') else None
-        vmware_parameters = cohesity_management_sdk.models.vmware_restore_parameters.VmwareRestoreParameters.from_dictionary(dictionary.get('vmwareParameters')) if dictionary.get('vmwareParameters') else None
-
-        # Return an object of this model
-        return cls(name,
-                   mtype,
-                   acropolis_parameters,
-                   continue_on_error,
-                   deploy_vms_to_cloud,
-                   glacier_retrieval_type,
-                   hyperv_parameters,
-                   mount_parameters,
-                   new_parent_id,
-                   objects,
-                   outlook_parameters,
-                   restore_view_parameters,
-                   view_name,
-                   virtual_disk_restore_parameters,
-                   vlan_parameters,
-                   vmware_parameters)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.error_proto
-import cohesity_management_sdk.models.mo_ref
-import cohesity_management_sdk.models.setup_restore_disk_task_info_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RecoverVirtualDiskInfoProto(object):
 
@@ -65,6 +63,19 @@ class RecoverVirtualDiskInfoProto(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cleanup_error":'error_proto.ErrorProto',
+        "data_migration_error":'error_proto.ErrorProto',
+        "error":'error_proto.ErrorProto',
+        "migrate_task_moref":'mo_ref.MORef',
+        "restore_disks_task_info_proto":'setup_restore_disk_task_info_proto.SetupRestoreDiskTaskInfoProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cleanup_error=None,
                  data_migration_error=None,
@@ -105,31 +116,6 @@ class RecoverVirtualDiskInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cleanup_error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('cleanupError')) if dictionary.get('cleanupError') else None
-        data_migration_error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('dataMigrationError')) if dictionary.get('dataMigrationError') else None
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        finished = dictionary.get('finished')
-        instant_recovery_finished = dictionary.get('instantRecoveryFinished')
-        migrate_task_moref = cohesity_management_sdk.models.mo_ref.MORef.from_dictionary(dictionary.get('migrateTaskMoref')) if dictionary.get('migrateTaskMoref') else None
-        restore_disks_task_info_proto = cohesity_management_sdk.models.setup_restore_disk_task_info_proto.SetupRestoreDiskTaskInfoProto.from_dictionary(dictionary.get('restoreDisksTaskInfoProto')) if dictionary.get('restoreDisksTaskInfoProto') else None
-        slave_task_start_time_usecs = dictionary.get('slaveTaskStartTimeUsecs')
-        task_state = dictionary.get('taskState')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(cleanup_error,
-                   data_migration_error,
-                   error,
-                   finished,
-                   instant_recovery_finished,
-                   migrate_task_moref,
-                   restore_disks_task_info_proto,
-                   slave_task_start_time_usecs,
-                   task_state,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
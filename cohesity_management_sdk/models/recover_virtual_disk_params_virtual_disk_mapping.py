@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.virtual_disk_id
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RecoverVirtualDiskParamsVirtualDiskMapping(object):
 
@@ -27,6 +26,17 @@ class RecoverVirtualDiskParamsVirtualDiskMapping(object):
         "target_location":'targetLocation'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "disk_to_overwrite":'virtual_disk_id.VirtualDiskId',
+        "src_disk":'virtual_disk_id.VirtualDiskId',
+        "target_location":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disk_to_overwrite=None,
                  src_disk=None,
@@ -53,17 +63,6 @@ class RecoverVirtualDiskParamsVirtualDiskMapping(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disk_to_overwrite = cohesity_management_sdk.models.virtual_disk_id.VirtualDiskId.from_dictionary(dictionary.get('diskToOverwrite')) if dictionary.get('diskToOverwrite') else None
-        src_disk = cohesity_management_sdk.models.virtual_disk_id.VirtualDiskId.from_dictionary(dictionary.get('srcDisk')) if dictionary.get('srcDisk') else None
-        target_location = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetLocation')) if dictionary.get('targetLocation') else None
-
-        # Return an object of this model
-        return cls(disk_to_overwrite,
-                   src_disk,
-                   target_location)
+        return decode_model(cls, dictionary)
 
 
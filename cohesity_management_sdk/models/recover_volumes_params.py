@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.recover_volumes_params_mapping
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RecoverVolumesParams(object):
 
@@ -27,6 +26,16 @@ class RecoverVolumesParams(object):
         "target_entity":'targetEntity'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "mapping_vec":['recover_volumes_params_mapping.RecoverVolumesParamsMapping'],
+        "target_entity":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  force_unmount_volume=None,
                  mapping_vec=None,
@@ -53,21 +62,6 @@ class RecoverVolumesParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        force_unmount_volume = dictionary.get('forceUnmountVolume')
-        mapping_vec = None
-        if dictionary.get('mappingVec') != None:
-            mapping_vec = list()
-            for structure in dictionary.get('mappingVec'):
-                mapping_vec.append(cohesity_management_sdk.models.recover_volumes_params_mapping.RecoverVolumesParamsMapping.from_dictionary(structure))
-        target_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetEntity')) if dictionary.get('targetEntity') else None
-
-        # Return an object of this model
-        return cls(force_unmount_volume,
-                   mapping_vec,
-                   target_entity)
+        return decode_model(cls, dictionary)
 
 
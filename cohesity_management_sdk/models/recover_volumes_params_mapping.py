@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RecoverVolumesParamsMapping(object):
 
@@ -21,6 +22,9 @@ class RecoverVolumesParamsMapping(object):
         "src_guid":'srcGuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  dst_guid=None,
                  src_guid=None):
@@ -45,15 +49,6 @@ class RecoverVolumesParamsMapping(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        dst_guid = dictionary.get('dstGuid')
-        src_guid = dictionary.get('srcGuid')
-
-        # Return an object of this model
-        return cls(dst_guid,
-                   src_guid)
+        return decode_model(cls, dictionary)
 
 
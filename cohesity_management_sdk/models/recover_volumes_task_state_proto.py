@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.recover_volumes_params
-import cohesity_management_sdk.models.recover_volumes_task_state_proto_task_result
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RecoverVolumesTaskStateProto(object):
 
@@ -26,6 +25,16 @@ class RecoverVolumesTaskStateProto(object):
         "task_result_vec":'taskResultVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "params":'recover_volumes_params.RecoverVolumesParams',
+        "task_result_vec":['recover_volumes_task_state_proto_task_result.RecoverVolumesTaskStateProtoTaskResult']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  params=None,
                  task_result_vec=None):
@@ -50,19 +59,6 @@ class RecoverVolumesTaskStateProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        params = cohesity_management_sdk.models.recover_volumes_params.RecoverVolumesParams.from_dictionary(dictionary.get('params')) if dictionary.get('params') else None
-        task_result_vec = None
-        if dictionary.get('taskResultVec') != None:
-            task_result_vec = list()
-            for structure in dictionary.get('taskResultVec'):
-                task_result_vec.append(cohesity_management_sdk.models.recover_volumes_task_state_proto_task_result.RecoverVolumesTaskStateProtoTaskResult.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(params,
-                   task_result_vec)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RecoverVolumesTaskStateProtoTaskResult(object):
 
@@ -24,6 +24,15 @@ class RecoverVolumesTaskStateProtoTaskResult(object):
         "progress_monitor_task_path":'progressMonitorTaskPath'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "error":'error_proto.ErrorProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  dst_guid=None,
                  error=None,
@@ -50,17 +59,6 @@ class RecoverVolumesTaskStateProtoTaskResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        dst_guid = dictionary.get('dstGuid')
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        progress_monitor_task_path = dictionary.get('progressMonitorTaskPath')
-
-        # Return an object of this model
-        return cls(dst_guid,
-                   error,
-                   progress_monitor_task_path)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_count_by_object_type
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RecoveriesTile(object):
 
@@ -29,6 +29,15 @@ class RecoveriesTile(object):
         "recovery_num_running":'recoveryNumRunning'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "last_month_recoveries_by_type":['restore_count_by_object_type.RestoreCountByObjectType']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  last_month_num_recoveries=None,
                  last_month_recoveries_by_type=None,
@@ -57,23 +66,6 @@ class RecoveriesTile(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        last_month_num_recoveries = dictionary.get('lastMonthNumRecoveries')
-        last_month_recoveries_by_type = None
-        if dictionary.get('lastMonthRecoveriesByType') != None:
-            last_month_recoveries_by_type = list()
-            for structure in dictionary.get('lastMonthRecoveriesByType'):
-                last_month_recoveries_by_type.append(cohesity_management_sdk.models.restore_count_by_object_type.RestoreCountByObjectType.from_dictionary(structure))
-        last_month_recovery_size_bytes = dictionary.get('lastMonthRecoverySizeBytes')
-        recovery_num_running = dictionary.get('recoveryNumRunning')
-
-        # Return an object of this model
-        return cls(last_month_num_recoveries,
-                   last_month_recoveries_by_type,
-                   last_month_recovery_size_bytes,
-                   recovery_num_running)
+        return decode_model(cls, dictionary)
 
 
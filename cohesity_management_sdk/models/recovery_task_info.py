@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RecoveryTaskInfo(object):
 
@@ -26,6 +27,9 @@ class RecoveryTaskInfo(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  task_id=None,
@@ -52,17 +56,6 @@ class RecoveryTaskInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        task_id = dictionary.get('taskId')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(name,
-                   task_id,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.bandwidth_limit
-import cohesity_management_sdk.models.access_token_credential
-import cohesity_management_sdk.models.view_box_pair_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RegisterRemoteCluster(object):
 
@@ -94,6 +92,17 @@ class RegisterRemoteCluster(object):
         "vlan_id":'vlanId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "bandwidth_limit":'bandwidth_limit.BandwidthLimit',
+        "remote_access_credentials":'access_token_credential.AccessTokenCredential',
+        "view_box_pair_info":['view_box_pair_info.ViewBoxPairInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  all_endpoints_reachable=None,
                  bandwidth_limit=None,
@@ -154,55 +163,6 @@ class RegisterRemoteCluster(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        all_endpoints_reachable = dictionary.get('allEndpointsReachable')
-        bandwidth_limit = cohesity_management_sdk.models.bandwidth_limit.BandwidthLimit.from_dictionary(dictionary.get('bandwidthLimit')) if dictionary.get('bandwidthLimit') else None
-        clear_interfaces = dictionary.get('clearInterfaces')
-        clear_vlan_id = dictionary.get('clearVlanId')
-        cluster_id = dictionary.get('clusterId')
-        compression_enabled = dictionary.get('compressionEnabled')
-        encryption_key = dictionary.get('encryptionKey')
-        iface_name = dictionary.get('ifaceName')
-        network_interface_group = dictionary.get('networkInterfaceGroup')
-        network_interface_ids = dictionary.get('networkInterfaceIds')
-        password = dictionary.get('password')
-        purpose_remote_access = dictionary.get('purposeRemoteAccess')
-        purpose_replication = dictionary.get('purposeReplication')
-        remote_access_credentials = cohesity_management_sdk.models.access_token_credential.AccessTokenCredential.from_dictionary(dictionary.get('remoteAccessCredentials')) if dictionary.get('remoteAccessCredentials') else None
-        remote_ips = dictionary.get('remoteIps')
-        remote_iris_ports = dictionary.get('remoteIrisPorts')
-        user_name = dictionary.get('userName')
-        validate_only = dictionary.get('validateOnly')
-        view_box_pair_info = None
-        if dictionary.get('viewBoxPairInfo') != None:
-            view_box_pair_info = list()
-            for structure in dictionary.get('viewBoxPairInfo'):
-                view_box_pair_info.append(cohesity_management_sdk.models.view_box_pair_info.ViewBoxPairInfo.from_dictionary(structure))
-        vlan_id = dictionary.get('vlanId')
-
-        # Return an object of this model
-        return cls(all_endpoints_reachable,
-                   bandwidth_limit,
-                   clear_interfaces,
-                   clear_vlan_id,
-                   cluster_id,
-                   compression_enabled,
-                   encryption_key,
-                   iface_name,
-                   network_interface_group,
-                   network_interface_ids,
-                   password,
-                   purpose_remote_access,
-                   purpose_replication,
-                   remote_access_credentials,
-                   remote_ips,
-                   remote_iris_ports,
-                   user_name,
-                   validate_only,
-                   view_box_pair_info,
-                   vlan_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_source_node
-import cohesity_management_sdk.models.protection_source
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RegisteredApplicationServer(object):
 
@@ -29,6 +28,16 @@ class RegisteredApplicationServer(object):
         "registered_protection_source":'registeredProtectionSource'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "application_server":'protection_source_node.ProtectionSourceNode',
+        "registered_protection_source":'protection_source.ProtectionSource'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  application_server=None,
                  registered_protection_source=None):
@@ -53,15 +62,6 @@ class RegisteredApplicationServer(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        application_server = cohesity_management_sdk.models.protection_source_node.ProtectionSourceNode.from_dictionary(dictionary.get('applicationServer')) if dictionary.get('applicationServer') else None
-        registered_protection_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('registeredProtectionSource')) if dictionary.get('registeredProtectionSource') else None
-
-        # Return an object of this model
-        return cls(application_server,
-                   registered_protection_source)
+        return decode_model(cls, dictionary)
 
 
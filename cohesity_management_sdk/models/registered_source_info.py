@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.connector_parameters
-import cohesity_management_sdk.models.nas_mount_credential_params
-import cohesity_management_sdk.models.throttling_policy_parameters
-import cohesity_management_sdk.models.throttling_policy_override
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RegisteredSourceInfo(object):
 
@@ -123,6 +120,18 @@ class RegisteredSourceInfo(object):
         "warning_messages":'warningMessages'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "access_info":'connector_parameters.ConnectorParameters',
+        "nas_mount_credentials":'nas_mount_credential_params.NasMountCredentialParams',
+        "throttling_policy":'throttling_policy_parameters.ThrottlingPolicyParameters',
+        "throttling_policy_overrides":['throttling_policy_override.ThrottlingPolicyOverride']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_info=None,
                  authentication_error_message=None,
@@ -175,47 +184,6 @@ class RegisteredSourceInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_info = cohesity_management_sdk.models.connector_parameters.ConnectorParameters.from_dictionary(dictionary.get('accessInfo')) if dictionary.get('accessInfo') else None
-        authentication_error_message = dictionary.get('authenticationErrorMessage')
-        authentication_status = dictionary.get('authenticationStatus')
-        environments = dictionary.get('environments')
-        is_db_authenticated = dictionary.get('isDbAuthenticated')
-        minimum_free_space_gb = dictionary.get('minimumFreeSpaceGB')
-        nas_mount_credentials = cohesity_management_sdk.models.nas_mount_credential_params.NasMountCredentialParams.from_dictionary(dictionary.get('nasMountCredentials')) if dictionary.get('nasMountCredentials') else None
-        password = dictionary.get('password')
-        refresh_error_message = dictionary.get('refreshErrorMessage')
-        refresh_time_usecs = dictionary.get('refreshTimeUsecs')
-        registration_time_usecs = dictionary.get('registrationTimeUsecs')
-        throttling_policy = cohesity_management_sdk.models.throttling_policy_parameters.ThrottlingPolicyParameters.from_dictionary(dictionary.get('throttlingPolicy')) if dictionary.get('throttlingPolicy') else None
-        throttling_policy_overrides = None
-        if dictionary.get('throttlingPolicyOverrides') != None:
-            throttling_policy_overrides = list()
-            for structure in dictionary.get('throttlingPolicyOverrides'):
-                throttling_policy_overrides.append(cohesity_management_sdk.models.throttling_policy_override.ThrottlingPolicyOverride.from_dictionary(structure))
-        use_vm_bios_uuid = dictionary.get('useVmBiosUuid')
-        username = dictionary.get('username')
-        warning_messages = dictionary.get('warningMessages')
-
-        # Return an object of this model
-        return cls(access_info,
-                   authentication_error_message,
-                   authentication_status,
-                   environments,
-                   is_db_authenticated,
-                   minimum_free_space_gb,
-                   nas_mount_credentials,
-                   password,
-                   refresh_error_message,
-                   refresh_time_usecs,
-                   registration_time_usecs,
-                   throttling_policy,
-                   throttling_policy_overrides,
-                   use_vm_bios_uuid,
-                   username,
-                   warning_messages)
+        return decode_model(cls, dictionary)
 
 
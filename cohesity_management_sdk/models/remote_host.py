@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RemoteHost(object):
 
@@ -28,6 +29,9 @@ class RemoteHost(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  address=None,
                  mtype=None):
@@ -52,15 +56,6 @@ class RemoteHost(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        address = dictionary.get('address')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(address,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.credentials
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RemoteHostConnectorParams(object):
 
@@ -26,6 +26,15 @@ class RemoteHostConnectorParams(object):
         "host_type":'hostType'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "credentials":'credentials.Credentials'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  credentials=None,
                  host_address=None,
@@ -52,17 +61,6 @@ class RemoteHostConnectorParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('credentials')) if dictionary.get('credentials') else None
-        host_address = dictionary.get('hostAddress')
-        host_type = dictionary.get('hostType')
-
-        # Return an object of this model
-        return cls(credentials,
-                   host_address,
-                   host_type)
+        return decode_model(cls, dictionary)
 
 
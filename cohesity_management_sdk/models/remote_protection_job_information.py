@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RemoteProtectionJobInformation(object):
 
@@ -66,6 +66,15 @@ class RemoteProtectionJobInformation(object):
         "job_uid":'jobUid'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "job_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_name=None,
                  environment=None,
@@ -94,19 +103,6 @@ class RemoteProtectionJobInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_name = dictionary.get('clusterName')
-        environment = dictionary.get('environment')
-        job_name = dictionary.get('jobName')
-        job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-
-        # Return an object of this model
-        return cls(cluster_name,
-                   environment,
-                   job_name,
-                   job_uid)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
-import cohesity_management_sdk.models.remote_protection_job_run_instance
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RemoteProtectionJobRunInformation(object):
 
@@ -70,6 +69,16 @@ class RemoteProtectionJobRunInformation(object):
         "protection_job_runs":'protectionJobRuns'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "job_uid":'universal_id.UniversalId',
+        "protection_job_runs":['remote_protection_job_run_instance.RemoteProtectionJobRunInstance']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_name=None,
                  environment=None,
@@ -100,25 +109,6 @@ class RemoteProtectionJobRunInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_name = dictionary.get('clusterName')
-        environment = dictionary.get('environment')
-        job_name = dictionary.get('jobName')
-        job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-        protection_job_runs = None
-        if dictionary.get('protectionJobRuns') != None:
-            protection_job_runs = list()
-            for structure in dictionary.get('protectionJobRuns'):
-                protection_job_runs.append(cohesity_management_sdk.models.remote_protection_job_run_instance.RemoteProtectionJobRunInstance.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(cluster_name,
-                   environment,
-                   job_name,
-                   job_uid,
-                   protection_job_runs)
+        return decode_model(cls, dictionary)
 
 
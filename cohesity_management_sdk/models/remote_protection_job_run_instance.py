@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RemoteProtectionJobRunInstance(object):
 
@@ -39,6 +39,15 @@ class RemoteProtectionJobRunInstance(object):
         "snapshot_time_usecs":'snapshotTimeUsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "archive_task_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  archive_task_uid=None,
                  archive_version=None,
@@ -73,25 +82,6 @@ class RemoteProtectionJobRunInstance(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        archive_task_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('archiveTaskUid')) if dictionary.get('archiveTaskUid') else None
-        archive_version = dictionary.get('archiveVersion')
-        expiry_time_usecs = dictionary.get('expiryTimeUsecs')
-        index_size_bytes = dictionary.get('indexSizeBytes')
-        job_run_id = dictionary.get('jobRunId')
-        metadata_complete = dictionary.get('metadataComplete')
-        snapshot_time_usecs = dictionary.get('snapshotTimeUsecs')
-
-        # Return an object of this model
-        return cls(archive_task_uid,
-                   archive_version,
-                   expiry_time_usecs,
-                   index_size_bytes,
-                   job_run_id,
-                   metadata_complete,
-                   snapshot_time_usecs)
+        return decode_model(cls, dictionary)
 
 
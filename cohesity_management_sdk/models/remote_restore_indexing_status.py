@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RemoteRestoreIndexingStatus(object):
 
@@ -58,6 +58,15 @@ class RemoteRestoreIndexingStatus(object):
         "start_time_usecs":'startTimeUsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "indexing_task_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  end_time_usecs=None,
                  error=None,
@@ -96,29 +105,6 @@ class RemoteRestoreIndexingStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        error = dictionary.get('error')
-        indexing_task_end_time_usecs = dictionary.get('indexingTaskEndTimeUsecs')
-        indexing_task_start_time_usecs = dictionary.get('indexingTaskStartTimeUsecs')
-        indexing_task_status = dictionary.get('indexingTaskStatus')
-        indexing_task_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('indexingTaskUid')) if dictionary.get('indexingTaskUid') else None
-        latest_expiry_time_usecs = dictionary.get('latestExpiryTimeUsecs')
-        progress_monitor_task = dictionary.get('progressMonitorTask')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-
-        # Return an object of this model
-        return cls(end_time_usecs,
-                   error,
-                   indexing_task_end_time_usecs,
-                   indexing_task_start_time_usecs,
-                   indexing_task_status,
-                   indexing_task_uid,
-                   latest_expiry_time_usecs,
-                   progress_monitor_task,
-                   start_time_usecs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RemoteRestoreSnapshotStatus(object):
 
@@ -49,6 +49,16 @@ class RemoteRestoreSnapshotStatus(object):
         "snapshot_time_usecs":'snapshotTimeUsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "archive_task_uid":'universal_id.UniversalId',
+        "snapshot_task_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  archive_task_uid=None,
                  error=None,
@@ -85,27 +95,6 @@ class RemoteRestoreSnapshotStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        archive_task_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('archiveTaskUid')) if dictionary.get('archiveTaskUid') else None
-        error = dictionary.get('error')
-        expiry_time_usecs = dictionary.get('expiryTimeUsecs')
-        job_run_id = dictionary.get('jobRunId')
-        progress_monitor_task = dictionary.get('progressMonitorTask')
-        snapshot_task_status = dictionary.get('snapshotTaskStatus')
-        snapshot_task_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('snapshotTaskUid')) if dictionary.get('snapshotTaskUid') else None
-        snapshot_time_usecs = dictionary.get('snapshotTimeUsecs')
-
-        # Return an object of this model
-        return cls(archive_task_uid,
-                   error,
-                   expiry_time_usecs,
-                   job_run_id,
-                   progress_monitor_task,
-                   snapshot_task_status,
-                   snapshot_task_uid,
-                   snapshot_time_usecs)
+        return decode_model(cls, dictionary)
 
 
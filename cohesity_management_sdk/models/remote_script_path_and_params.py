@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RemoteScriptPathAndParams(object):
 
@@ -39,6 +40,9 @@ class RemoteScriptPathAndParams(object):
         "timeout_secs":'timeoutSecs'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  continue_on_error=None,
                  is_active=None,
@@ -69,21 +73,6 @@ class RemoteScriptPathAndParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        continue_on_error = dictionary.get('continueOnError')
-        is_active = dictionary.get('isActive')
-        script_params = dictionary.get('scriptParams')
-        script_path = dictionary.get('scriptPath')
-        timeout_secs = dictionary.get('timeoutSecs')
-
-        # Return an object of this model
-        return cls(continue_on_error,
-                   is_active,
-                   script_params,
-                   script_path,
-                   timeout_secs)
+        return decode_model(cls, dictionary)
 
 
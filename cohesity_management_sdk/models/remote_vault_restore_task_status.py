@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.remote_restore_indexing_status
-import cohesity_management_sdk.models.remote_restore_snapshot_status
-import cohesity_management_sdk.models.universal_id
-import cohesity_management_sdk.models.remote_protection_job_information
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RemoteVaultRestoreTaskStatus(object):
 
@@ -45,6 +42,20 @@ class RemoteVaultRestoreTaskStatus(object):
         "search_job_uid":'searchJobUid'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "current_indexing_status":'remote_restore_indexing_status.RemoteRestoreIndexingStatus',
+        "current_snapshot_status":'remote_restore_snapshot_status.RemoteRestoreSnapshotStatus',
+        "local_protection_job_uid":'universal_id.UniversalId',
+        "parent_job_uid":'universal_id.UniversalId',
+        "remote_protection_job_information":'remote_protection_job_information.RemoteProtectionJobInformation',
+        "search_job_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  current_indexing_status=None,
                  current_snapshot_status=None,
@@ -77,23 +88,6 @@ class RemoteVaultRestoreTaskStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        current_indexing_status = cohesity_management_sdk.models.remote_restore_indexing_status.RemoteRestoreIndexingStatus.from_dictionary(dictionary.get('currentIndexingStatus')) if dictionary.get('currentIndexingStatus') else None
-        current_snapshot_status = cohesity_management_sdk.models.remote_restore_snapshot_status.RemoteRestoreSnapshotStatus.from_dictionary(dictionary.get('currentSnapshotStatus')) if dictionary.get('currentSnapshotStatus') else None
-        local_protection_job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('localProtectionJobUid')) if dictionary.get('localProtectionJobUid') else None
-        parent_job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('parentJobUid')) if dictionary.get('parentJobUid') else None
-        remote_protection_job_information = cohesity_management_sdk.models.remote_protection_job_information.RemoteProtectionJobInformation.from_dictionary(dictionary.get('remoteProtectionJobInformation')) if dictionary.get('remoteProtectionJobInformation') else None
-        search_job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('searchJobUid')) if dictionary.get('searchJobUid') else None
-
-        # Return an object of this model
-        return cls(current_indexing_status,
-                   current_snapshot_status,
-                   local_protection_job_uid,
-                   parent_job_uid,
-                   remote_protection_job_information,
-                   search_job_uid)
+        return decode_model(cls, dictionary)
 
 
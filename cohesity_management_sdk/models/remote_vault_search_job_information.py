@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RemoteVaultSearchJobInformation(object):
 
@@ -60,6 +60,15 @@ class RemoteVaultSearchJobInformation(object):
         "vault_name":'vaultName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "search_job_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_count=None,
                  end_time_usecs=None,
@@ -100,31 +109,6 @@ class RemoteVaultSearchJobInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_count = dictionary.get('clusterCount')
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        error = dictionary.get('error')
-        job_count = dictionary.get('jobCount')
-        name = dictionary.get('name')
-        search_job_status = dictionary.get('searchJobStatus')
-        search_job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('searchJobUid')) if dictionary.get('searchJobUid') else None
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        vault_id = dictionary.get('vaultId')
-        vault_name = dictionary.get('vaultName')
-
-        # Return an object of this model
-        return cls(cluster_count,
-                   end_time_usecs,
-                   error,
-                   job_count,
-                   name,
-                   search_job_status,
-                   search_job_uid,
-                   start_time_usecs,
-                   vault_id,
-                   vault_name)
+        return decode_model(cls, dictionary)
 
 
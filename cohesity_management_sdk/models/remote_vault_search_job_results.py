@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.remote_protection_job_run_information
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RemoteVaultSearchJobResults(object):
 
@@ -77,6 +76,16 @@ class RemoteVaultSearchJobResults(object):
         "vault_name":'vaultName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "protection_jobs":['remote_protection_job_run_information.RemoteProtectionJobRunInformation'],
+        "search_job_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_count=None,
                  cluster_match_string=None,
@@ -123,41 +132,6 @@ class RemoteVaultSearchJobResults(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_count = dictionary.get('clusterCount')
-        cluster_match_string = dictionary.get('clusterMatchString')
-        cookie = dictionary.get('cookie')
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        error = dictionary.get('error')
-        job_count = dictionary.get('jobCount')
-        job_match_string = dictionary.get('jobMatchString')
-        protection_jobs = None
-        if dictionary.get('protectionJobs') != None:
-            protection_jobs = list()
-            for structure in dictionary.get('protectionJobs'):
-                protection_jobs.append(cohesity_management_sdk.models.remote_protection_job_run_information.RemoteProtectionJobRunInformation.from_dictionary(structure))
-        search_job_status = dictionary.get('searchJobStatus')
-        search_job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('searchJobUid')) if dictionary.get('searchJobUid') else None
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        vault_id = dictionary.get('vaultId')
-        vault_name = dictionary.get('vaultName')
-
-        # Return an object of this model
-        return cls(cluster_count,
-                   cluster_match_string,
-                   cookie,
-                   end_time_usecs,
-                   error,
-                   job_count,
-                   job_match_string,
-                   protection_jobs,
-                   search_job_status,
-                   search_job_uid,
-                   start_time_usecs,
-                   vault_id,
-                   vault_name)
+        return decode_model(cls, dictionary)
 
 
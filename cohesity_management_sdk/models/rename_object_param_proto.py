@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RenameObjectParamProto(object):
 
@@ -23,6 +24,9 @@ class RenameObjectParamProto(object):
         "suffix":'suffix'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  prefix=None,
                  suffix=None):
@@ -47,15 +51,6 @@ class RenameObjectParamProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        prefix = dictionary.get('prefix')
-        suffix = dictionary.get('suffix')
-
-        # Return an object of this model
-        return cls(prefix,
-                   suffix)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RenameViewParam(object):
 
@@ -18,6 +19,9 @@ class RenameViewParam(object):
         "new_view_name":'newViewName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  new_view_name=None):
         """Constructor for the RenameViewParam class"""
@@ -40,13 +44,6 @@ class RenameViewParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        new_view_name = dictionary.get('newViewName')
-
-        # Return an object of this model
-        return cls(new_view_name)
+        return decode_model(cls, dictionary)
 
 
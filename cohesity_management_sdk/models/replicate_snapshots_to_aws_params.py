@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ReplicateSnapshotsToAWSParams(object):
 
@@ -21,6 +21,15 @@ class ReplicateSnapshotsToAWSParams(object):
         "region":'region'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "region":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  region=None):
         """Constructor for the ReplicateSnapshotsToAWSParams class"""
@@ -43,13 +52,6 @@ class ReplicateSnapshotsToAWSParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        region = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('region')) if dictionary.get('region') else None
-
-        # Return an object of this model
-        return cls(region)
+        return decode_model(cls, dictionary)
 
 
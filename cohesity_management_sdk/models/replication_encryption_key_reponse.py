@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ReplicationEncryptionKeyReponse(object):
 
@@ -19,6 +20,9 @@ class ReplicationEncryptionKeyReponse(object):
         "encryption_key":'encryptionKey'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  encryption_key=None):
         """Constructor for the ReplicationEncryptionKeyReponse class"""
@@ -41,13 +45,6 @@ class ReplicationEncryptionKeyReponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        encryption_key = dictionary.get('encryptionKey')
-
-        # Return an object of this model
-        return cls(encryption_key)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ReplicationTarget(object):
 
@@ -21,6 +22,9 @@ class ReplicationTarget(object):
         "cluster_name":'clusterName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_id=None,
                  cluster_name=None):
@@ -45,15 +49,6 @@ class ReplicationTarget(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_id = dictionary.get('clusterId')
-        cluster_name = dictionary.get('clusterName')
-
-        # Return an object of this model
-        return cls(cluster_id,
-                   cluster_name)
+        return decode_model(cls, dictionary)
 
 
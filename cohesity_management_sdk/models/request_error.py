@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RequestError(object):
 
@@ -20,6 +21,9 @@ class RequestError(object):
         "message":'message'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error_code=None,
                  message=None):
@@ -44,15 +48,6 @@ class RequestError(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error_code = dictionary.get('errorCode')
-        message = dictionary.get('message')
-
-        # Return an object of this model
-        return cls(error_code,
-                   message)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ResetS3SecretKeyParameters(object):
 
@@ -26,6 +27,9 @@ class ResetS3SecretKeyParameters(object):
         "username":'username'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain=None,
                  tenant_id=None,
@@ -52,17 +56,6 @@ class ResetS3SecretKeyParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain = dictionary.get('domain')
-        tenant_id = dictionary.get('tenantId')
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(domain,
-                   tenant_id,
-                   username)
+        return decode_model(cls, dictionary)
 
 
@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.power_state_config_proto
-import cohesity_management_sdk.models.rename_object_param_proto
-import cohesity_management_sdk.models.restored_object_network_config_proto
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.uuid_config_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreAcropolisVMsParams(object):
 
@@ -37,6 +33,19 @@ class RestoreAcropolisVMsParams(object):
         "uuid_config":'uuidConfig'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "power_state_config":'power_state_config_proto.PowerStateConfigProto',
+        "rename_restored_object_param":'rename_object_param_proto.RenameObjectParamProto',
+        "restored_objects_network_config":'restored_object_network_config_proto.RestoredObjectNetworkConfigProto',
+        "storage_container":'entity_proto.EntityProto',
+        "uuid_config":'uuid_config_proto.UuidConfigProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  power_state_config=None,
                  rename_restored_object_param=None,
@@ -67,21 +76,6 @@ class RestoreAcropolisVMsParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        power_state_config = cohesity_management_sdk.models.power_state_config_proto.PowerStateConfigProto.from_dictionary(dictionary.get('powerStateConfig')) if dictionary.get('powerStateConfig') else None
-        rename_restored_object_param = cohesity_management_sdk.models.rename_object_param_proto.RenameObjectParamProto.from_dictionary(dictionary.get('renameRestoredObjectParam')) if dictionary.get('renameRestoredObjectParam') else None
-        restored_objects_network_config = cohesity_management_sdk.models.restored_object_network_config_proto.RestoredObjectNetworkConfigProto.from_dictionary(dictionary.get('restoredObjectsNetworkConfig')) if dictionary.get('restoredObjectsNetworkConfig') else None
-        storage_container = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('storageContainer')) if dictionary.get('storageContainer') else None
-        uuid_config = cohesity_management_sdk.models.uuid_config_proto.UuidConfigProto.from_dictionary(dictionary.get('uuidConfig')) if dictionary.get('uuidConfig') else None
-
-        # Return an object of this model
-        return cls(power_state_config,
-                   rename_restored_object_param,
-                   restored_objects_network_config,
-                   storage_container,
-                   uuid_config)
+        return decode_model(cls, dictionary)
 
 
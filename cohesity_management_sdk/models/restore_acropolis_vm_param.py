@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.snapshot_info_proto
-import cohesity_management_sdk.models.restore_acropolis_vm_param_network_config_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreAcropolisVMParam(object):
 
@@ -62,6 +61,16 @@ class RestoreAcropolisVMParam(object):
         "network_config":'networkConfig'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "base_cbt_snapshot_info_proto":'snapshot_info_proto.SnapshotInfoProto',
+        "network_config":'restore_acropolis_vm_param_network_config_info.RestoreAcropolisVMParamNetworkConfigInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  base_cbt_snapshot_info_proto=None,
                  network_config=None):
@@ -86,15 +95,6 @@ class RestoreAcropolisVMParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        base_cbt_snapshot_info_proto = cohesity_management_sdk.models.snapshot_info_proto.SnapshotInfoProto.from_dictionary(dictionary.get('baseCbtSnapshotInfoProto')) if dictionary.get('baseCbtSnapshotInfoProto') else None
-        network_config = cohesity_management_sdk.models.restore_acropolis_vm_param_network_config_info.RestoreAcropolisVMParamNetworkConfigInfo.from_dictionary(dictionary.get('networkConfig')) if dictionary.get('networkConfig') else None
-
-        # Return an object of this model
-        return cls(base_cbt_snapshot_info_proto,
-                   network_config)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_acropolis_vm_param_network_config_info_nic_spec
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreAcropolisVMParamNetworkConfigInfo(object):
 
@@ -25,6 +25,15 @@ class RestoreAcropolisVMParamNetworkConfigInfo(object):
         "nic_vec":'nicVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "nic_vec":['restore_acropolis_vm_param_network_config_info_nic_spec.RestoreAcropolisVMParamNetworkConfigInfoNICSpec']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  network_state_change=None,
                  nic_vec=None):
@@ -49,19 +58,6 @@ class RestoreAcropolisVMParamNetworkConfigInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        network_state_change = dictionary.get('networkStateChange')
-        nic_vec = None
-        if dictionary.get('nicVec') != None:
-            nic_vec = list()
-            for structure in dictionary.get('nicVec'):
-                nic_vec.append(cohesity_management_sdk.models.restore_acropolis_vm_param_network_config_info_nic_spec.RestoreAcropolisVMParamNetworkConfigInfoNICSpec.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(network_state_change,
-                   nic_vec)
+        return decode_model(cls, dictionary)
 
 
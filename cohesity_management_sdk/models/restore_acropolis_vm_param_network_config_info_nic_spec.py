@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreAcropolisVMParamNetworkConfigInfoNICSpec(object):
 
@@ -21,6 +22,9 @@ class RestoreAcropolisVMParamNetworkConfigInfoNICSpec(object):
         "network_uuid":'networkUuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ip_address=None,
                  network_uuid=None):
@@ -45,15 +49,6 @@ class RestoreAcropolisVMParamNetworkConfigInfoNICSpec(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ip_address = dictionary.get('ipAddress')
-        network_uuid = dictionary.get('networkUuid')
-
-        # Return an object of this model
-        return cls(ip_address,
-                   network_uuid)
+        return decode_model(cls, dictionary)
 
 
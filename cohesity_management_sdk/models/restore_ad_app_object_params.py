@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_restore_status
-import cohesity_management_sdk.models.ad_update_restore_task_options
-import cohesity_management_sdk.models.credentials
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreADAppObjectParams(object):
 
@@ -40,6 +38,17 @@ class RestoreADAppObjectParams(object):
         "num_successfull":'numSuccessfull'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ad_restore_status_vec":['ad_restore_status.ADRestoreStatus'],
+        "ad_update_options":'ad_update_restore_task_options.ADUpdateRestoreTaskOptions',
+        "credentials":'credentials.Credentials'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_restore_status_vec=None,
                  ad_update_options=None,
@@ -74,29 +83,6 @@ class RestoreADAppObjectParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_restore_status_vec = None
-        if dictionary.get('adRestoreStatusVec') != None:
-            ad_restore_status_vec = list()
-            for structure in dictionary.get('adRestoreStatusVec'):
-                ad_restore_status_vec.append(cohesity_management_sdk.models.ad_restore_status.ADRestoreStatus.from_dictionary(structure))
-        ad_update_options = cohesity_management_sdk.models.ad_update_restore_task_options.ADUpdateRestoreTaskOptions.from_dictionary(dictionary.get('adUpdateOptions')) if dictionary.get('adUpdateOptions') else None
-        credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('credentials')) if dictionary.get('credentials') else None
-        ldap_port = dictionary.get('ldapPort')
-        num_failed = dictionary.get('numFailed')
-        num_running = dictionary.get('numRunning')
-        num_successfull = dictionary.get('numSuccessfull')
-
-        # Return an object of this model
-        return cls(ad_restore_status_vec,
-                   ad_update_options,
-                   credentials,
-                   ldap_port,
-                   num_failed,
-                   num_running,
-                   num_successfull)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.restore_app_object_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreAppObject(object):
 
@@ -28,6 +27,16 @@ class RestoreAppObject(object):
         "restore_params":'restoreParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "app_entity":'entity_proto.EntityProto',
+        "restore_params":'restore_app_object_params.RestoreAppObjectParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  app_entity=None,
                  display_name=None,
@@ -54,17 +63,6 @@ class RestoreAppObject(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        app_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('appEntity')) if dictionary.get('appEntity') else None
-        display_name = dictionary.get('displayName')
-        restore_params = cohesity_management_sdk.models.restore_app_object_params.RestoreAppObjectParams.from_dictionary(dictionary.get('restoreParams')) if dictionary.get('restoreParams') else None
-
-        # Return an object of this model
-        return cls(app_entity,
-                   display_name,
-                   restore_params)
+        return decode_model(cls, dictionary)
 
 
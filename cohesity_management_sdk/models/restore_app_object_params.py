@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_ad_app_object_params
-import cohesity_management_sdk.models.restore_oracle_app_object_params
-import cohesity_management_sdk.models.restore_sql_app_object_params
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreAppObjectParams(object):
 
@@ -38,6 +35,19 @@ class RestoreAppObjectParams(object):
         "target_host_parent_source":'targetHostParentSource'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ad_restore_params":'restore_ad_app_object_params.RestoreADAppObjectParams',
+        "oracle_restore_params":'restore_oracle_app_object_params.RestoreOracleAppObjectParams',
+        "sql_restore_params":'restore_sql_app_object_params.RestoreSqlAppObjectParams',
+        "target_host":'entity_proto.EntityProto',
+        "target_host_parent_source":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_restore_params=None,
                  clone_task_id=None,
@@ -70,23 +80,6 @@ class RestoreAppObjectParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_restore_params = cohesity_management_sdk.models.restore_ad_app_object_params.RestoreADAppObjectParams.from_dictionary(dictionary.get('adRestoreParams')) if dictionary.get('adRestoreParams') else None
-        clone_task_id = dictionary.get('cloneTaskId')
-        oracle_restore_params = cohesity_management_sdk.models.restore_oracle_app_object_params.RestoreOracleAppObjectParams.from_dictionary(dictionary.get('oracleRestoreParams')) if dictionary.get('oracleRestoreParams') else None
-        sql_restore_params = cohesity_management_sdk.models.restore_sql_app_object_params.RestoreSqlAppObjectParams.from_dictionary(dictionary.get('sqlRestoreParams')) if dictionary.get('sqlRestoreParams') else None
-        target_host = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetHost')) if dictionary.get('targetHost') else None
-        target_host_parent_source = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetHostParentSource')) if dictionary.get('targetHostParentSource') else None
-
-        # Return an object of this model
-        return cls(ad_restore_params,
-                   clone_task_id,
-                   oracle_restore_params,
-                   sql_restore_params,
-                   target_host,
-                   target_host_parent_source)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.credentials
-import cohesity_management_sdk.models.app_owner_restore_info
-import cohesity_management_sdk.models.restore_app_object
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreAppParams(object):
 
@@ -36,6 +34,17 @@ class RestoreAppParams(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "credentials":'credentials.Credentials',
+        "owner_restore_info":'app_owner_restore_info.AppOwnerRestoreInfo',
+        "restore_app_object_vec":['restore_app_object.RestoreAppObject']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  credentials=None,
                  owner_restore_info=None,
@@ -64,23 +73,6 @@ class RestoreAppParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('credentials')) if dictionary.get('credentials') else None
-        owner_restore_info = cohesity_management_sdk.models.app_owner_restore_info.AppOwnerRestoreInfo.from_dictionary(dictionary.get('ownerRestoreInfo')) if dictionary.get('ownerRestoreInfo') else None
-        restore_app_object_vec = None
-        if dictionary.get('restoreAppObjectVec') != None:
-            restore_app_object_vec = list()
-            for structure in dictionary.get('restoreAppObjectVec'):
-                restore_app_object_vec.append(cohesity_management_sdk.models.restore_app_object.RestoreAppObject.from_dictionary(structure))
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(credentials,
-                   owner_restore_info,
-                   restore_app_object_vec,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_app_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreAppTaskStateProto(object):
 
@@ -32,6 +32,15 @@ class RestoreAppTaskStateProto(object):
         "restore_app_params":'restoreAppParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "restore_app_params":'restore_app_params.RestoreAppParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  app_restore_progress_monitor_subtask_path=None,
                  last_finished_log_backup_start_time_usecs=None,
@@ -58,17 +67,6 @@ class RestoreAppTaskStateProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        app_restore_progress_monitor_subtask_path = dictionary.get('appRestoreProgressMonitorSubtaskPath')
-        last_finished_log_backup_start_time_usecs = dictionary.get('lastFinishedLogBackupStartTimeUsecs')
-        restore_app_params = cohesity_management_sdk.models.restore_app_params.RestoreAppParams.from_dictionary(dictionary.get('restoreAppParams')) if dictionary.get('restoreAppParams') else None
-
-        # Return an object of this model
-        return cls(app_restore_progress_monitor_subtask_path,
-                   last_finished_log_backup_start_time_usecs,
-                   restore_app_params)
+        return decode_model(cls, dictionary)
 
 
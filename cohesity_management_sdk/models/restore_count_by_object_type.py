@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreCountByObjectType(object):
 
@@ -21,6 +22,9 @@ class RestoreCountByObjectType(object):
         "object_type":'objectType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  object_count=None,
                  object_type=None):
@@ -45,15 +49,6 @@ class RestoreCountByObjectType(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        object_count = dictionary.get('objectCount')
-        object_type = dictionary.get('objectType')
-
-        # Return an object of this model
-        return cls(object_count,
-                   object_type)
+        return decode_model(cls, dictionary)
 
 
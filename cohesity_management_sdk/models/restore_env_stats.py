@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreEnvStats(object):
 
@@ -24,6 +25,9 @@ class RestoreEnvStats(object):
         "total_bytes":'totalBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  environment=None,
                  object_count=None,
@@ -50,17 +54,6 @@ class RestoreEnvStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        environment = dictionary.get('environment')
-        object_count = dictionary.get('objectCount')
-        total_bytes = dictionary.get('totalBytes')
-
-        # Return an object of this model
-        return cls(environment,
-                   object_count,
-                   total_bytes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreFileCopyStats(object):
 
@@ -37,6 +38,9 @@ class RestoreFileCopyStats(object):
         "total_files_to_copy":'totalFilesToCopy'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  estimation_skipped=None,
                  num_bytes_copied=None,
@@ -71,25 +75,6 @@ class RestoreFileCopyStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        estimation_skipped = dictionary.get('estimationSkipped')
-        num_bytes_copied = dictionary.get('numBytesCopied')
-        num_directories_copied = dictionary.get('numDirectoriesCopied')
-        num_files_copied = dictionary.get('numFilesCopied')
-        total_bytes_to_copy = dictionary.get('totalBytesToCopy')
-        total_directories_to_copy = dictionary.get('totalDirectoriesToCopy')
-        total_files_to_copy = dictionary.get('totalFilesToCopy')
-
-        # Return an object of this model
-        return cls(estimation_skipped,
-                   num_bytes_copied,
-                   num_directories_copied,
-                   num_files_copied,
-                   total_bytes_to_copy,
-                   total_directories_to_copy,
-                   total_files_to_copy)
+        return decode_model(cls, dictionary)
 
 
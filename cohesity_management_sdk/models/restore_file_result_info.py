@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_file_copy_stats
-import cohesity_management_sdk.models.error_proto
-import cohesity_management_sdk.models.restored_file_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreFileResultInfo(object):
 
@@ -35,6 +33,17 @@ class RestoreFileResultInfo(object):
         "status":'status'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "copy_stats":'restore_file_copy_stats.RestoreFileCopyStats',
+        "error":'error_proto.ErrorProto',
+        "restored_file_info":'restored_file_info.RestoredFileInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  copy_stats=None,
                  destination_dir=None,
@@ -65,21 +74,6 @@ class RestoreFileResultInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        copy_stats = cohesity_management_sdk.models.restore_file_copy_stats.RestoreFileCopyStats.from_dictionary(dictionary.get('copyStats')) if dictionary.get('copyStats') else None
-        destination_dir = dictionary.get('destinationDir')
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        restored_file_info = cohesity_management_sdk.models.restored_file_info.RestoredFileInfo.from_dictionary(dictionary.get('restoredFileInfo')) if dictionary.get('restoredFileInfo') else None
-        status = dictionary.get('status')
-
-        # Return an object of this model
-        return cls(copy_stats,
-                   destination_dir,
-                   error,
-                   restored_file_info,
-                   status)
+        return decode_model(cls, dictionary)
 
 
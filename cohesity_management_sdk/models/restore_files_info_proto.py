@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.error_proto
-import cohesity_management_sdk.models.connector_params
-import cohesity_management_sdk.models.restore_file_result_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreFilesInfoProto(object):
 
@@ -61,6 +59,18 @@ class RestoreFilesInfoProto(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "error":'error_proto.ErrorProto',
+        "proxy_entity_connector_params":'connector_params.ConnectorParams',
+        "restore_files_result_vec":['restore_file_result_info.RestoreFileResultInfo'],
+        "teardown_error":'error_proto.ErrorProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  download_files_path=None,
                  error=None,
@@ -97,31 +107,6 @@ class RestoreFilesInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        download_files_path = dictionary.get('downloadFilesPath')
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        proxy_entity_connector_params = cohesity_management_sdk.models.connector_params.ConnectorParams.from_dictionary(dictionary.get('proxyEntityConnectorParams')) if dictionary.get('proxyEntityConnectorParams') else None
-        restore_files_result_vec = None
-        if dictionary.get('restoreFilesResultVec') != None:
-            restore_files_result_vec = list()
-            for structure in dictionary.get('restoreFilesResultVec'):
-                restore_files_result_vec.append(cohesity_management_sdk.models.restore_file_result_info.RestoreFileResultInfo.from_dictionary(structure))
-        slave_task_start_time_usecs = dictionary.get('slaveTaskStartTimeUsecs')
-        target_type = dictionary.get('targetType')
-        teardown_error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('teardownError')) if dictionary.get('teardownError') else None
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(download_files_path,
-                   error,
-                   proxy_entity_connector_params,
-                   restore_files_result_vec,
-                   slave_task_start_time_usecs,
-                   target_type,
-                   teardown_error,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.restore_files_preferences
-import cohesity_management_sdk.models.restored_file_info
-import cohesity_management_sdk.models.credentials
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreFilesParams(object):
 
@@ -62,6 +59,22 @@ class RestoreFilesParams(object):
         "target_host_type":'targetHostType'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "proxy_entity":'entity_proto.EntityProto',
+        "proxy_entity_parent_source":'entity_proto.EntityProto',
+        "restore_files_preferences":'restore_files_preferences.RestoreFilesPreferences',
+        "restored_file_info_vec":['restored_file_info.RestoredFileInfo'],
+        "target_entity":'entity_proto.EntityProto',
+        "target_entity_credentials":'credentials.Credentials',
+        "target_entity_parent_source":'entity_proto.EntityProto',
+        "target_host_entity":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  is_file_volume_restore=None,
                  is_mount_based_flr=None,
@@ -106,39 +119,6 @@ class RestoreFilesParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        is_file_volume_restore = dictionary.get('isFileVolumeRestore')
-        is_mount_based_flr = dictionary.get('isMountBasedFlr')
-        nas_protocol_type_vec = dictionary.get('nasProtocolTypeVec')
-        proxy_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('proxyEntity')) if dictionary.get('proxyEntity') else None
-        proxy_entity_parent_source = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('proxyEntityParentSource')) if dictionary.get('proxyEntityParentSource') else None
-        restore_files_preferences = cohesity_management_sdk.models.restore_files_preferences.RestoreFilesPreferences.from_dictionary(dictionary.get('restoreFilesPreferences')) if dictionary.get('restoreFilesPreferences') else None
-        restored_file_info_vec = None
-        if dictionary.get('restoredFileInfoVec') != None:
-            restored_file_info_vec = list()
-            for structure in dictionary.get('restoredFileInfoVec'):
-                restored_file_info_vec.append(cohesity_management_sdk.models.restored_file_info.RestoredFileInfo.from_dictionary(structure))
-        target_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetEntity')) if dictionary.get('targetEntity') else None
-        target_entity_credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('targetEntityCredentials')) if dictionary.get('targetEntityCredentials') else None
-        target_entity_parent_source = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetEntityParentSource')) if dictionary.get('targetEntityParentSource') else None
-        target_host_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetHostEntity')) if dictionary.get('targetHostEntity') else None
-        target_host_type = dictionary.get('targetHostType')
-
-        # Return an object of this model
-        return cls(is_file_volume_restore,
-                   is_mount_based_flr,
-                   nas_protocol_type_vec,
-                   proxy_entity,
-                   proxy_entity_parent_source,
-                   restore_files_preferences,
-                   restored_file_info_vec,
-                   target_entity,
-                   target_entity_credentials,
-                   target_entity_parent_source,
-                   target_host_entity,
-                   target_host_type)
+        return decode_model(cls, dictionary)
 
 
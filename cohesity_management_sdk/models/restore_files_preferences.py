@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreFilesPreferences(object):
 
@@ -48,6 +49,9 @@ class RestoreFilesPreferences(object):
         "skip_estimation":'skipEstimation'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alternate_restore_base_directory=None,
                  continue_on_error=None,
@@ -86,29 +90,6 @@ class RestoreFilesPreferences(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alternate_restore_base_directory = dictionary.get('alternateRestoreBaseDirectory')
-        continue_on_error = dictionary.get('continueOnError')
-        generate_ssh_keys = dictionary.get('generateSshKeys')
-        override_originals = dictionary.get('overrideOriginals')
-        preserve_acls = dictionary.get('preserveAcls')
-        preserve_attributes = dictionary.get('preserveAttributes')
-        preserve_timestamps = dictionary.get('preserveTimestamps')
-        restore_to_original_paths = dictionary.get('restoreToOriginalPaths')
-        skip_estimation = dictionary.get('skipEstimation')
-
-        # Return an object of this model
-        return cls(alternate_restore_base_directory,
-                   continue_on_error,
-                   generate_ssh_keys,
-                   override_originals,
-                   preserve_acls,
-                   preserve_attributes,
-                   preserve_timestamps,
-                   restore_to_original_paths,
-                   skip_estimation)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_object_details
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreFilesTaskRequest(object):
 
@@ -75,6 +75,15 @@ class RestoreFilesTaskRequest(object):
         "username":'username'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "source_object_info":'restore_object_details.RestoreObjectDetails'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  continue_on_error=None,
                  filenames=None,
@@ -121,37 +130,6 @@ class RestoreFilesTaskRequest(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        continue_on_error = dictionary.get('continueOnError')
-        filenames = dictionary.get('filenames')
-        is_file_based_volume_restore = dictionary.get('isFileBasedVolumeRestore')
-        name = dictionary.get('name')
-        new_base_directory = dictionary.get('newBaseDirectory')
-        overwrite = dictionary.get('overwrite')
-        password = dictionary.get('password')
-        preserve_attributes = dictionary.get('preserveAttributes')
-        source_object_info = cohesity_management_sdk.models.restore_object_details.RestoreObjectDetails.from_dictionary(dictionary.get('sourceObjectInfo')) if dictionary.get('sourceObjectInfo') else None
-        target_host_type = dictionary.get('targetHostType')
-        target_parent_source_id = dictionary.get('targetParentSourceId')
-        target_source_id = dictionary.get('targetSourceId')
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(continue_on_error,
-                   filenames,
-                   is_file_based_volume_restore,
-                   name,
-                   new_base_directory,
-                   overwrite,
-                   password,
-                   preserve_attributes,
-                   source_object_info,
-                   target_host_type,
-                   target_parent_source_id,
-                   target_source_id,
-                   username)
+        return decode_model(cls, dictionary)
 
 
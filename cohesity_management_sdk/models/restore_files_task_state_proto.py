@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_files_info_proto
-import cohesity_management_sdk.models.restore_files_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreFilesTaskStateProto(object):
 
@@ -37,6 +36,16 @@ class RestoreFilesTaskStateProto(object):
         "restore_params":'restoreParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "restore_files_info":'restore_files_info_proto.RestoreFilesInfoProto',
+        "restore_params":'restore_files_params.RestoreFilesParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  restore_files_info=None,
                  restore_params=None):
@@ -61,15 +70,6 @@ class RestoreFilesTaskStateProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        restore_files_info = cohesity_management_sdk.models.restore_files_info_proto.RestoreFilesInfoProto.from_dictionary(dictionary.get('restoreFilesInfo')) if dictionary.get('restoreFilesInfo') else None
-        restore_params = cohesity_management_sdk.models.restore_files_params.RestoreFilesParams.from_dictionary(dictionary.get('restoreParams')) if dictionary.get('restoreParams') else None
-
-        # Return an object of this model
-        return cls(restore_files_info,
-                   restore_params)
+        return decode_model(cls, dictionary)
 
 
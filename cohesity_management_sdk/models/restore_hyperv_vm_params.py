@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.power_state_config_proto
-import cohesity_management_sdk.models.rename_object_param_proto
-import cohesity_management_sdk.models.restored_object_network_config_proto
-import cohesity_management_sdk.models.uuid_config_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreHypervVMParams(object):
 
@@ -43,6 +39,20 @@ class RestoreHypervVMParams(object):
         "uuid_config":'uuidConfig'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "datastore_entity":'entity_proto.EntityProto',
+        "power_state_config":'power_state_config_proto.PowerStateConfigProto',
+        "rename_restored_object_param":'rename_object_param_proto.RenameObjectParamProto',
+        "resource_entity":'entity_proto.EntityProto',
+        "restored_objects_network_config":'restored_object_network_config_proto.RestoredObjectNetworkConfigProto',
+        "uuid_config":'uuid_config_proto.UuidConfigProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  copy_recovery=None,
                  datastore_entity=None,
@@ -77,25 +87,6 @@ class RestoreHypervVMParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        copy_recovery = dictionary.get('copyRecovery')
-        datastore_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('datastoreEntity')) if dictionary.get('datastoreEntity') else None
-        power_state_config = cohesity_management_sdk.models.power_state_config_proto.PowerStateConfigProto.from_dictionary(dictionary.get('powerStateConfig')) if dictionary.get('powerStateConfig') else None
-        rename_restored_object_param = cohesity_management_sdk.models.rename_object_param_proto.RenameObjectParamProto.from_dictionary(dictionary.get('renameRestoredObjectParam')) if dictionary.get('renameRestoredObjectParam') else None
-        resource_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('resourceEntity')) if dictionary.get('resourceEntity') else None
-        restored_objects_network_config = cohesity_management_sdk.models.restored_object_network_config_proto.RestoredObjectNetworkConfigProto.from_dictionary(dictionary.get('restoredObjectsNetworkConfig')) if dictionary.get('restoredObjectsNetworkConfig') else None
-        uuid_config = cohesity_management_sdk.models.uuid_config_proto.UuidConfigProto.from_dictionary(dictionary.get('uuidConfig')) if dictionary.get('uuidConfig') else None
-
-        # Return an object of this model
-        return cls(copy_recovery,
-                   datastore_entity,
-                   power_state_config,
-                   rename_restored_object_param,
-                   resource_entity,
-                   restored_objects_network_config,
-                   uuid_config)
+        return decode_model(cls, dictionary)
 
 
@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.archival_external_target
-import cohesity_management_sdk.models.cloud_deploy_target_details
-import cohesity_management_sdk.models.universal_id
-import cohesity_management_sdk.models.protection_source
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreInfo(object):
 
@@ -54,6 +51,19 @@ class RestoreInfo(object):
         "vm_had_independent_disks":'vmHadIndependentDisks'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "archival_target":'archival_external_target.ArchivalExternalTarget',
+        "cloud_deploy_target":'cloud_deploy_target_details.CloudDeployTargetDetails',
+        "job_uid":'universal_id.UniversalId',
+        "parent_source":'protection_source.ProtectionSource',
+        "source":'protection_source.ProtectionSource'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  archival_target=None,
                  attempt_number=None,
@@ -96,33 +106,6 @@ class RestoreInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        archival_target = cohesity_management_sdk.models.archival_external_target.ArchivalExternalTarget.from_dictionary(dictionary.get('archivalTarget')) if dictionary.get('archivalTarget') else None
-        attempt_number = dictionary.get('attemptNumber')
-        cloud_deploy_target = cohesity_management_sdk.models.cloud_deploy_target_details.CloudDeployTargetDetails.from_dictionary(dictionary.get('cloudDeployTarget')) if dictionary.get('cloudDeployTarget') else None
-        job_run_id = dictionary.get('jobRunId')
-        job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-        parent_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('parentSource')) if dictionary.get('parentSource') else None
-        snapshot_relative_dir_path = dictionary.get('snapshotRelativeDirPath')
-        source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('source')) if dictionary.get('source') else None
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        view_name = dictionary.get('viewName')
-        vm_had_independent_disks = dictionary.get('vmHadIndependentDisks')
-
-        # Return an object of this model
-        return cls(archival_target,
-                   attempt_number,
-                   cloud_deploy_target,
-                   job_run_id,
-                   job_uid,
-                   parent_source,
-                   snapshot_relative_dir_path,
-                   source,
-                   start_time_usecs,
-                   view_name,
-                   vm_had_independent_disks)
+        return decode_model(cls, dictionary)
 
 
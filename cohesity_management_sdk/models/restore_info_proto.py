@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_info_proto_restore_entity
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreInfoProto(object):
 
@@ -93,6 +93,15 @@ class RestoreInfoProto(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "restore_entity_vec":['restore_info_proto_restore_entity.RestoreInfoProtoRestoreEntity']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  restore_entity_vec=None,
                  target_type=None,
@@ -119,21 +128,6 @@ class RestoreInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        restore_entity_vec = None
-        if dictionary.get('restoreEntityVec') != None:
-            restore_entity_vec = list()
-            for structure in dictionary.get('restoreEntityVec'):
-                restore_entity_vec.append(cohesity_management_sdk.models.restore_info_proto_restore_entity.RestoreInfoProtoRestoreEntity.from_dictionary(structure))
-        target_type = dictionary.get('targetType')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(restore_entity_vec,
-                   target_type,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreInfoProtoRestoreEntity(object):
 
@@ -44,6 +43,19 @@ class RestoreInfoProtoRestoreEntity(object):
         "warnings":'warnings'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "entity":'entity_proto.EntityProto',
+        "error":'error_proto.ErrorProto',
+        "resource_pool_entity":'entity_proto.EntityProto',
+        "restored_entity":'entity_proto.EntityProto',
+        "warnings":['error_proto.ErrorProto']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  entity=None,
                  error=None,
@@ -82,33 +94,6 @@ class RestoreInfoProtoRestoreEntity(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('entity')) if dictionary.get('entity') else None
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        progress_monitor_task_path = dictionary.get('progressMonitorTaskPath')
-        public_status = dictionary.get('publicStatus')
-        relative_restore_paths = dictionary.get('relativeRestorePaths')
-        resource_pool_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('resourcePoolEntity')) if dictionary.get('resourcePoolEntity') else None
-        restored_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('restoredEntity')) if dictionary.get('restoredEntity') else None
-        status = dictionary.get('status')
-        warnings = None
-        if dictionary.get('warnings') != None:
-            warnings = list()
-            for structure in dictionary.get('warnings'):
-                warnings.append(cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(entity,
-                   error,
-                   progress_monitor_task_path,
-                   public_status,
-                   relative_restore_paths,
-                   resource_pool_entity,
-                   restored_entity,
-                   status,
-                   warnings)
+        return decode_model(cls, dictionary)
 
 
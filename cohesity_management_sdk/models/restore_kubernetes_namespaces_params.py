@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.rename_object_param_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreKubernetesNamespacesParams(object):
 
@@ -32,6 +31,16 @@ class RestoreKubernetesNamespacesParams(object):
         "rename_restored_object_param":'renameRestoredObjectParam'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cluster_entity":'entity_proto.EntityProto',
+        "rename_restored_object_param":'rename_object_param_proto.RenameObjectParamProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_job_name=None,
                  cluster_entity=None,
@@ -60,19 +69,6 @@ class RestoreKubernetesNamespacesParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_job_name = dictionary.get('backupJobName')
-        cluster_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('clusterEntity')) if dictionary.get('clusterEntity') else None
-        management_namespace = dictionary.get('managementNamespace')
-        rename_restored_object_param = cohesity_management_sdk.models.rename_object_param_proto.RenameObjectParamProto.from_dictionary(dictionary.get('renameRestoredObjectParam')) if dictionary.get('renameRestoredObjectParam') else None
-
-        # Return an object of this model
-        return cls(backup_job_name,
-                   cluster_entity,
-                   management_namespace,
-                   rename_restored_object_param)
+        return decode_model(cls, dictionary)
 
 
@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.power_state_config_proto
-import cohesity_management_sdk.models.rename_object_param_proto
-import cohesity_management_sdk.models.restored_object_network_config_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreKVMVMsParams(object):
 
@@ -40,6 +37,20 @@ class RestoreKVMVMsParams(object):
         "storagedomain_entity":'storagedomainEntity'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cluster_entity":'entity_proto.EntityProto',
+        "datacenter_entity":'entity_proto.EntityProto',
+        "power_state_config":'power_state_config_proto.PowerStateConfigProto',
+        "rename_restored_object_param":'rename_object_param_proto.RenameObjectParamProto',
+        "restored_objects_network_config":'restored_object_network_config_proto.RestoredObjectNetworkConfigProto',
+        "storagedomain_entity":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_entity=None,
                  datacenter_entity=None,
@@ -72,23 +83,6 @@ class RestoreKVMVMsParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('clusterEntity')) if dictionary.get('clusterEntity') else None
-        datacenter_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('datacenterEntity')) if dictionary.get('datacenterEntity') else None
-        power_state_config = cohesity_management_sdk.models.power_state_config_proto.PowerStateConfigProto.from_dictionary(dictionary.get('powerStateConfig')) if dictionary.get('powerStateConfig') else None
-        rename_restored_object_param = cohesity_management_sdk.models.rename_object_param_proto.RenameObjectParamProto.from_dictionary(dictionary.get('renameRestoredObjectParam')) if dictionary.get('renameRestoredObjectParam') else None
-        restored_objects_network_config = cohesity_management_sdk.models.restored_object_network_config_proto.RestoredObjectNetworkConfigProto.from_dictionary(dictionary.get('restoredObjectsNetworkConfig')) if dictionary.get('restoredObjectsNetworkConfig') else None
-        storagedomain_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('storagedomainEntity')) if dictionary.get('storagedomainEntity') else None
-
-        # Return an object of this model
-        return cls(cluster_entity,
-                   datacenter_entity,
-                   power_state_config,
-                   rename_restored_object_param,
-                   restored_objects_network_config,
-                   storagedomain_entity)
+        return decode_model(cls, dictionary)
 
 
@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.archival_target
-import cohesity_management_sdk.models.cloud_deploy_target
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.universal_id_proto
-import cohesity_management_sdk.models.restore_acropolis_vm_param
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreObject(object):
 
@@ -71,6 +67,21 @@ class RestoreObject(object):
         "vm_had_independent_disks":'vmHadIndependentDisks'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "archival_target":'archival_target.ArchivalTarget',
+        "cloud_deploy_target":'cloud_deploy_target.CloudDeployTarget',
+        "cloud_replication_target":'cloud_deploy_target.CloudDeployTarget',
+        "entity":'entity_proto.EntityProto',
+        "job_uid":'universal_id_proto.UniversalIdProto',
+        "parent_source":'entity_proto.EntityProto',
+        "restore_acropolis_vm_param":'restore_acropolis_vm_param.RestoreAcropolisVMParam'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  archival_target=None,
                  attempt_num=None,
@@ -119,39 +130,6 @@ class RestoreObject(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        archival_target = cohesity_management_sdk.models.archival_target.ArchivalTarget.from_dictionary(dictionary.get('archivalTarget')) if dictionary.get('archivalTarget') else None
-        attempt_num = dictionary.get('attemptNum')
-        cloud_deploy_target = cohesity_management_sdk.models.cloud_deploy_target.CloudDeployTarget.from_dictionary(dictionary.get('cloudDeployTarget')) if dictionary.get('cloudDeployTarget') else None
-        cloud_replication_target = cohesity_management_sdk.models.cloud_deploy_target.CloudDeployTarget.from_dictionary(dictionary.get('cloudReplicationTarget')) if dictionary.get('cloudReplicationTarget') else None
-        entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('entity')) if dictionary.get('entity') else None
-        job_id = dictionary.get('jobId')
-        job_instance_id = dictionary.get('jobInstanceId')
-        job_uid = cohesity_management_sdk.models.universal_id_proto.UniversalIdProto.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-        parent_source = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('parentSource')) if dictionary.get('parentSource') else None
-        restore_acropolis_vm_param = cohesity_management_sdk.models.restore_acropolis_vm_param.RestoreAcropolisVMParam.from_dictionary(dictionary.get('restoreAcropolisVmParam')) if dictionary.get('restoreAcropolisVmParam') else None
-        snapshot_relative_dir_path = dictionary.get('snapshotRelativeDirPath')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        view_name = dictionary.get('viewName')
-        vm_had_independent_disks = dictionary.get('vmHadIndependentDisks')
-
-        # Return an object of this model
-        return cls(archival_target,
-                   attempt_num,
-                   cloud_deploy_target,
-                   cloud_replication_target,
-                   entity,
-                   job_id,
-                   job_instance_id,
-                   job_uid,
-                   parent_source,
-                   restore_acropolis_vm_param,
-                   snapshot_relative_dir_path,
-                   start_time_usecs,
-                   view_name,
-                   vm_had_independent_disks)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.archival_external_target
-import cohesity_management_sdk.models.cloud_deploy_target_details
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreObjectDetails(object):
 
@@ -91,6 +89,17 @@ class RestoreObjectDetails(object):
         "started_time_usecs":'startedTimeUsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "archival_target":'archival_external_target.ArchivalExternalTarget',
+        "cloud_deploy_target":'cloud_deploy_target_details.CloudDeployTargetDetails',
+        "job_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  archival_target=None,
                  cloud_deploy_target=None,
@@ -129,29 +138,6 @@ class RestoreObjectDetails(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        archival_target = cohesity_management_sdk.models.archival_external_target.ArchivalExternalTarget.from_dictionary(dictionary.get('archivalTarget')) if dictionary.get('archivalTarget') else None
-        cloud_deploy_target = cohesity_management_sdk.models.cloud_deploy_target_details.CloudDeployTargetDetails.from_dictionary(dictionary.get('cloudDeployTarget')) if dictionary.get('cloudDeployTarget') else None
-        environment = dictionary.get('environment')
-        job_id = dictionary.get('jobId')
-        job_run_id = dictionary.get('jobRunId')
-        job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-        protection_source_id = dictionary.get('protectionSourceId')
-        source_name = dictionary.get('sourceName')
-        started_time_usecs = dictionary.get('startedTimeUsecs')
-
-        # Return an object of this model
-        return cls(archival_target,
-                   cloud_deploy_target,
-                   environment,
-                   job_id,
-                   job_run_id,
-                   job_uid,
-                   protection_source_id,
-                   source_name,
-                   started_time_usecs)
+        return decode_model(cls, dictionary)
 
 
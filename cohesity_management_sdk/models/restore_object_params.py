@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.power_state_config_proto
-import cohesity_management_sdk.models.rename_object_param_proto
-import cohesity_management_sdk.models.restored_object_network_config_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreObjectParams(object):
 
@@ -45,6 +42,20 @@ class RestoreObjectParams(object):
         "view_name":'viewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "datastore_entity":'entity_proto.EntityProto',
+        "power_state_config":'power_state_config_proto.PowerStateConfigProto',
+        "rename_restored_object_param":'rename_object_param_proto.RenameObjectParamProto',
+        "resource_pool_entity":'entity_proto.EntityProto',
+        "restore_parent_source":'entity_proto.EntityProto',
+        "restored_objects_network_config":'restored_object_network_config_proto.RestoredObjectNetworkConfigProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  action=None,
                  datastore_entity=None,
@@ -81,27 +92,6 @@ class RestoreObjectParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        action = dictionary.get('action')
-        datastore_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('datastoreEntity')) if dictionary.get('datastoreEntity') else None
-        power_state_config = cohesity_management_sdk.models.power_state_config_proto.PowerStateConfigProto.from_dictionary(dictionary.get('powerStateConfig')) if dictionary.get('powerStateConfig') else None
-        rename_restored_object_param = cohesity_management_sdk.models.rename_object_param_proto.RenameObjectParamProto.from_dictionary(dictionary.get('renameRestoredObjectParam')) if dictionary.get('renameRestoredObjectParam') else None
-        resource_pool_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('resourcePoolEntity')) if dictionary.get('resourcePoolEntity') else None
-        restore_parent_source = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('restoreParentSource')) if dictionary.get('restoreParentSource') else None
-        restored_objects_network_config = cohesity_management_sdk.models.restored_object_network_config_proto.RestoredObjectNetworkConfigProto.from_dictionary(dictionary.get('restoredObjectsNetworkConfig')) if dictionary.get('restoredObjectsNetworkConfig') else None
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(action,
-                   datastore_entity,
-                   power_state_config,
-                   rename_restored_object_param,
-                   resource_pool_entity,
-                   restore_parent_source,
-                   restored_objects_network_config,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.request_error
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreObjectState(object):
 
@@ -58,6 +58,15 @@ class RestoreObjectState(object):
         "source_object_id":'sourceObjectId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "error":'request_error.RequestError'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error=None,
                  object_status=None,
@@ -88,21 +97,6 @@ class RestoreObjectState(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error = cohesity_management_sdk.models.request_error.RequestError.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        object_status = dictionary.get('objectStatus')
-        resource_pool_id = dictionary.get('resourcePoolId')
-        restored_object_id = dictionary.get('restoredObjectId')
-        source_object_id = dictionary.get('sourceObjectId')
-
-        # Return an object of this model
-        return cls(error,
-                   object_status,
-                   resource_pool_id,
-                   restored_object_id,
-                   source_object_id)
+        return decode_model(cls, dictionary)
 
 
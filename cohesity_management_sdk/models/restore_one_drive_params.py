@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_one_drive_params_drive_owner
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreOneDriveParams(object):
 
@@ -40,6 +39,16 @@ class RestoreOneDriveParams(object):
         "target_user":'targetUser'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "drive_owner_vec":['restore_one_drive_params_drive_owner.RestoreOneDriveParamsDriveOwner'],
+        "target_user":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  drive_owner_vec=None,
                  restore_to_original=None,
@@ -70,25 +79,6 @@ class RestoreOneDriveParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        drive_owner_vec = None
-        if dictionary.get('driveOwnerVec') != None:
-            drive_owner_vec = list()
-            for structure in dictionary.get('driveOwnerVec'):
-                drive_owner_vec.append(cohesity_management_sdk.models.restore_one_drive_params_drive_owner.RestoreOneDriveParamsDriveOwner.from_dictionary(structure))
-        restore_to_original = dictionary.get('restoreToOriginal')
-        target_drive_id = dictionary.get('targetDriveId')
-        target_folder_path = dictionary.get('targetFolderPath')
-        target_user = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetUser')) if dictionary.get('targetUser') else None
-
-        # Return an object of this model
-        return cls(drive_owner_vec,
-                   restore_to_original,
-                   target_drive_id,
-                   target_folder_path,
-                   target_user)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreOneDriveParamsDriveItem(object):
 
@@ -23,6 +24,9 @@ class RestoreOneDriveParamsDriveItem(object):
         "is_file_item":'isFileItem'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  drive_item_path=None,
                  id=None,
@@ -49,17 +53,6 @@ class RestoreOneDriveParamsDriveItem(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        drive_item_path = dictionary.get('driveItemPath')
-        id = dictionary.get('id')
-        is_file_item = dictionary.get('isFileItem')
-
-        # Return an object of this model
-        return cls(drive_item_path,
-                   id,
-                   is_file_item)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_one_drive_params_drive_owner_drive
-import cohesity_management_sdk.models.restore_object
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreOneDriveParamsDriveOwner(object):
 
@@ -23,6 +22,16 @@ class RestoreOneDriveParamsDriveOwner(object):
         "object":'object'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "drive_vec":['restore_one_drive_params_drive_owner_drive.RestoreOneDriveParamsDriveOwnerDrive'],
+        "object":'restore_object.RestoreObject'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  drive_vec=None,
                  object=None):
@@ -47,19 +56,6 @@ class RestoreOneDriveParamsDriveOwner(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        drive_vec = None
-        if dictionary.get('driveVec') != None:
-            drive_vec = list()
-            for structure in dictionary.get('driveVec'):
-                drive_vec.append(cohesity_management_sdk.models.restore_one_drive_params_drive_owner_drive.RestoreOneDriveParamsDriveOwnerDrive.from_dictionary(structure))
-        object = cohesity_management_sdk.models.restore_object.RestoreObject.from_dictionary(dictionary.get('object')) if dictionary.get('object') else None
-
-        # Return an object of this model
-        return cls(drive_vec,
-                   object)
+        return decode_model(cls, dictionary)
 
 
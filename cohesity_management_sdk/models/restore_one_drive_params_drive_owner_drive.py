@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_one_drive_params_drive_item
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreOneDriveParamsDriveOwnerDrive(object):
 
@@ -27,6 +27,15 @@ class RestoreOneDriveParamsDriveOwnerDrive(object):
         "restore_item_vec":'restoreItemVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "restore_item_vec":['restore_one_drive_params_drive_item.RestoreOneDriveParamsDriveItem']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  is_entire_drive_required=None,
                  restore_drive_id=None,
@@ -53,21 +62,6 @@ class RestoreOneDriveParamsDriveOwnerDrive(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        is_entire_drive_required = dictionary.get('isEntireDriveRequired')
-        restore_drive_id = dictionary.get('restoreDriveId')
-        restore_item_vec = None
-        if dictionary.get('restoreItemVec') != None:
-            restore_item_vec = list()
-            for structure in dictionary.get('restoreItemVec'):
-                restore_item_vec.append(cohesity_management_sdk.models.restore_one_drive_params_drive_item.RestoreOneDriveParamsDriveItem.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(is_entire_drive_required,
-                   restore_drive_id,
-                   restore_item_vec)
+        return decode_model(cls, dictionary)
 
 
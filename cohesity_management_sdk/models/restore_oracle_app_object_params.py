@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_oracle_app_object_params_alternate_location_params
-import cohesity_management_sdk.models.clone_app_view_params
-import cohesity_management_sdk.models.oracle_source_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreOracleAppObjectParams(object):
 
@@ -41,6 +39,17 @@ class RestoreOracleAppObjectParams(object):
         "restore_time_secs":'restoreTimeSecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "alternate_location_params":'restore_oracle_app_object_params_alternate_location_params.RestoreOracleAppObjectParamsAlternateLocationParams',
+        "oracle_clone_app_view_params_vec":['clone_app_view_params.CloneAppViewParams'],
+        "oracle_target_params":'oracle_source_params.OracleSourceParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alternate_location_params=None,
                  no_open_mode=None,
@@ -71,25 +80,6 @@ class RestoreOracleAppObjectParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alternate_location_params = cohesity_management_sdk.models.restore_oracle_app_object_params_alternate_location_params.RestoreOracleAppObjectParamsAlternateLocationParams.from_dictionary(dictionary.get('alternateLocationParams')) if dictionary.get('alternateLocationParams') else None
-        no_open_mode = dictionary.get('noOpenMode')
-        oracle_clone_app_view_params_vec = None
-        if dictionary.get('oracleCloneAppViewParamsVec') != None:
-            oracle_clone_app_view_params_vec = list()
-            for structure in dictionary.get('oracleCloneAppViewParamsVec'):
-                oracle_clone_app_view_params_vec.append(cohesity_management_sdk.models.clone_app_view_params.CloneAppViewParams.from_dictionary(structure))
-        oracle_target_params = cohesity_management_sdk.models.oracle_source_params.OracleSourceParams.from_dictionary(dictionary.get('oracleTargetParams')) if dictionary.get('oracleTargetParams') else None
-        restore_time_secs = dictionary.get('restoreTimeSecs')
-
-        # Return an object of this model
-        return cls(alternate_location_params,
-                   no_open_mode,
-                   oracle_clone_app_view_params_vec,
-                   oracle_target_params,
-                   restore_time_secs)
+        return decode_model(cls, dictionary)
 
 
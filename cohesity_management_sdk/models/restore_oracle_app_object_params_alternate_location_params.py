@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.oracle_db_config
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreOracleAppObjectParamsAlternateLocationParams(object):
 
@@ -36,6 +36,15 @@ class RestoreOracleAppObjectParamsAlternateLocationParams(object):
         "oracle_db_config":'oracleDbConfig'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "oracle_db_config":'oracle_db_config.OracleDBConfig'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  base_dir=None,
                  database_file_destination=None,
@@ -68,23 +77,6 @@ class RestoreOracleAppObjectParamsAlternateLocationParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        base_dir = dictionary.get('baseDir')
-        database_file_destination = dictionary.get('databaseFileDestination')
-        home_dir = dictionary.get('homeDir')
-        new_database_name = dictionary.get('newDatabaseName')
-        new_sid_deprecated = dictionary.get('newSidDeprecated')
-        oracle_db_config = cohesity_management_sdk.models.oracle_db_config.OracleDBConfig.from_dictionary(dictionary.get('oracleDbConfig')) if dictionary.get('oracleDbConfig') else None
-
-        # Return an object of this model
-        return cls(base_dir,
-                   database_file_destination,
-                   home_dir,
-                   new_database_name,
-                   new_sid_deprecated,
-                   oracle_db_config)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_outlook_params_mailbox
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreOutlookParams(object):
 
@@ -27,6 +26,16 @@ class RestoreOutlookParams(object):
         "target_mailbox":'targetMailbox'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "mailbox_vec":['restore_outlook_params_mailbox.RestoreOutlookParamsMailbox'],
+        "target_mailbox":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  mailbox_vec=None,
                  target_folder_path=None,
@@ -53,21 +62,6 @@ class RestoreOutlookParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        mailbox_vec = None
-        if dictionary.get('mailboxVec') != None:
-            mailbox_vec = list()
-            for structure in dictionary.get('mailboxVec'):
-                mailbox_vec.append(cohesity_management_sdk.models.restore_outlook_params_mailbox.RestoreOutlookParamsMailbox.from_dictionary(structure))
-        target_folder_path = dictionary.get('targetFolderPath')
-        target_mailbox = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetMailbox')) if dictionary.get('targetMailbox') else None
-
-        # Return an object of this model
-        return cls(mailbox_vec,
-                   target_folder_path,
-                   target_mailbox)
+        return decode_model(cls, dictionary)
 
 
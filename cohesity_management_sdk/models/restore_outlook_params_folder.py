@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreOutlookParamsFolder(object):
 
@@ -27,6 +28,9 @@ class RestoreOutlookParamsFolder(object):
         "item_id_vec":'itemIdVec'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  folder_id=None,
                  folder_key=None,
@@ -55,19 +59,6 @@ class RestoreOutlookParamsFolder(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        folder_id = dictionary.get('folderId')
-        folder_key = dictionary.get('folderKey')
-        is_entire_folder_required = dictionary.get('isEntireFolderRequired')
-        item_id_vec = dictionary.get('itemIdVec')
-
-        # Return an object of this model
-        return cls(folder_id,
-                   folder_key,
-                   is_entire_folder_required,
-                   item_id_vec)
+        return decode_model(cls, dictionary)
 
 
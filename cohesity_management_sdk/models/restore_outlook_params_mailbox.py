@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_outlook_params_folder
-import cohesity_management_sdk.models.restore_object
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreOutlookParamsMailbox(object):
 
@@ -27,6 +26,16 @@ class RestoreOutlookParamsMailbox(object):
         "object":'object'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "folder_vec":['restore_outlook_params_folder.RestoreOutlookParamsFolder'],
+        "object":'restore_object.RestoreObject'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  folder_vec=None,
                  is_entire_mailbox_required=None,
@@ -53,21 +62,6 @@ class RestoreOutlookParamsMailbox(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        folder_vec = None
-        if dictionary.get('folderVec') != None:
-            folder_vec = list()
-            for structure in dictionary.get('folderVec'):
-                folder_vec.append(cohesity_management_sdk.models.restore_outlook_params_folder.RestoreOutlookParamsFolder.from_dictionary(structure))
-        is_entire_mailbox_required = dictionary.get('isEntireMailboxRequired')
-        object = cohesity_management_sdk.models.restore_object.RestoreObject.from_dictionary(dictionary.get('object')) if dictionary.get('object') else None
-
-        # Return an object of this model
-        return cls(folder_vec,
-                   is_entire_mailbox_required,
-                   object)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.full_snapshot_info
-import cohesity_management_sdk.models.time_range_settings
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestorePointsForTimeRange(object):
 
@@ -24,6 +23,16 @@ class RestorePointsForTimeRange(object):
         "time_ranges":'timeRanges'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "full_snapshot_info":['full_snapshot_info.FullSnapshotInfo'],
+        "time_ranges":['time_range_settings.TimeRangeSettings']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  full_snapshot_info=None,
                  time_ranges=None):
@@ -48,23 +57,6 @@ class RestorePointsForTimeRange(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        full_snapshot_info = None
-        if dictionary.get('fullSnapshotInfo') != None:
-            full_snapshot_info = list()
-            for structure in dictionary.get('fullSnapshotInfo'):
-                full_snapshot_info.append(cohesity_management_sdk.models.full_snapshot_info.FullSnapshotInfo.from_dictionary(structure))
-        time_ranges = None
-        if dictionary.get('timeRanges') != None:
-            time_ranges = list()
-            for structure in dictionary.get('timeRanges'):
-                time_ranges.append(cohesity_management_sdk.models.time_range_settings.TimeRangeSettings.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(full_snapshot_info,
-                   time_ranges)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestorePointsForTimeRangeParam(object):
 
@@ -66,6 +66,15 @@ class RestorePointsForTimeRangeParam(object):
         "start_time_usecs":'startTimeUsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "job_uids":['universal_id.UniversalId']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  job_uids=None,
                  end_time_usecs=None,
@@ -96,25 +105,6 @@ class RestorePointsForTimeRangeParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        job_uids = None
-        if dictionary.get('jobUids') != None:
-            job_uids = list()
-            for structure in dictionary.get('jobUids'):
-                job_uids.append(cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(structure))
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        environment = dictionary.get('environment')
-        protection_source_id = dictionary.get('protectionSourceId')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-
-        # Return an object of this model
-        return cls(job_uids,
-                   end_time_usecs,
-                   environment,
-                   protection_source_id,
-                   start_time_usecs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.sql_update_restore_task_options
-import cohesity_management_sdk.models.files_to_directory_mapping
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreSqlAppObjectParams(object):
 
@@ -75,6 +74,16 @@ class RestoreSqlAppObjectParams(object):
         "with_no_recovery":'withNoRecovery'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "multi_stage_restore_options":'sql_update_restore_task_options.SqlUpdateRestoreTaskOptions',
+        "secondary_data_file_destination_vec":['files_to_directory_mapping.FilesToDirectoryMapping']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  capture_tail_logs=None,
                  data_file_destination=None,
@@ -119,39 +128,6 @@ class RestoreSqlAppObjectParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        capture_tail_logs = dictionary.get('captureTailLogs')
-        data_file_destination = dictionary.get('dataFileDestination')
-        db_restore_overwrite_policy = dictionary.get('dbRestoreOverwritePolicy')
-        instance_name = dictionary.get('instanceName')
-        is_multi_stage_restore = dictionary.get('isMultiStageRestore')
-        log_file_destination = dictionary.get('logFileDestination')
-        multi_stage_restore_options = cohesity_management_sdk.models.sql_update_restore_task_options.SqlUpdateRestoreTaskOptions.from_dictionary(dictionary.get('multiStageRestoreOptions')) if dictionary.get('multiStageRestoreOptions') else None
-        new_database_name = dictionary.get('newDatabaseName')
-        restore_time_secs = dictionary.get('restoreTimeSecs')
-        secondary_data_file_destination = dictionary.get('secondaryDataFileDestination')
-        secondary_data_file_destination_vec = None
-        if dictionary.get('secondaryDataFileDestinationVec') != None:
-            secondary_data_file_destination_vec = list()
-            for structure in dictionary.get('secondaryDataFileDestinationVec'):
-                secondary_data_file_destination_vec.append(cohesity_management_sdk.models.files_to_directory_mapping.FilesToDirectoryMapping.from_dictionary(structure))
-        with_no_recovery = dictionary.get('withNoRecovery')
-
-        # Return an object of this model
-        return cls(capture_tail_logs,
-                   data_file_destination,
-                   db_restore_overwrite_policy,
-                   instance_name,
-                   is_multi_stage_restore,
-                   log_file_destination,
-                   multi_stage_restore_options,
-                   new_database_name,
-                   restore_time_secs,
-                   secondary_data_file_destination,
-                   secondary_data_file_destination_vec,
-                   with_no_recovery)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_env_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreStats(object):
 
@@ -26,6 +26,15 @@ class RestoreStats(object):
         "stats_by_environment":'statsByEnvironment'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "stats_by_environment":['restore_env_stats.RestoreEnvStats']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  num_cloned_objects=None,
                  num_recovered_objects=None,
@@ -52,21 +61,6 @@ class RestoreStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        num_cloned_objects = dictionary.get('numClonedObjects')
-        num_recovered_objects = dictionary.get('numRecoveredObjects')
-        stats_by_environment = None
-        if dictionary.get('statsByEnvironment') != None:
-            stats_by_environment = list()
-            for structure in dictionary.get('statsByEnvironment'):
-                stats_by_environment.append(cohesity_management_sdk.models.restore_env_stats.RestoreEnvStats.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(num_cloned_objects,
-                   num_recovered_objects,
-                   stats_by_environment)
+        return decode_model(cls, dictionary)
 
 
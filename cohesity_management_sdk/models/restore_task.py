@@ -1,20 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.acropolis_restore_parameters
-import cohesity_management_sdk.models.application_restore_parameters
-import cohesity_management_sdk.models.universal_id
-import cohesity_management_sdk.models.update_view_param
-import cohesity_management_sdk.models.deploy_vms_to_cloud
-import cohesity_management_sdk.models.request_error
-import cohesity_management_sdk.models.hyperv_restore_parameters
-import cohesity_management_sdk.models.mount_volumes_state
-import cohesity_management_sdk.models.restore_object_details
-import cohesity_management_sdk.models.outlook_restore_parameters
-import cohesity_management_sdk.models.restore_object_state
-import cohesity_management_sdk.models.virtual_disk_recover_task_state
-import cohesity_management_sdk.models.vlan_parameters
-import cohesity_management_sdk.models.vmware_restore_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreTask(object):
 
@@ -164,6 +151,28 @@ class RestoreTask(object):
         "vmware_parameters":'vmwareParameters'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "acropolis_parameters":'acropolis_restore_parameters.AcropolisRestoreParameters',
+        "application_parameters":'application_restore_parameters.ApplicationRestoreParameters',
+        "archive_task_uid":'universal_id.UniversalId',
+        "clone_view_parameters":'update_view_param.UpdateViewParam',
+        "deploy_vms_to_cloud":'deploy_vms_to_cloud.DeployVmsToCloud',
+        "error":'request_error.RequestError',
+        "hyperv_parameters":'hyperv_restore_parameters.HypervRestoreParameters',
+        "mount_volumes_state":'mount_volumes_state.MountVolumesState',
+        "objects":['restore_object_details.RestoreObjectDetails'],
+        "outlook_parameters":'outlook_restore_parameters.OutlookRestoreParameters',
+        "restore_object_state":['restore_object_state.RestoreObjectState'],
+        "virtual_disk_restore_state":'virtual_disk_recover_task_state.VirtualDiskRecoverTaskState',
+        "vlan_parameters":'vlan_parameters.VlanParameters',
+        "vmware_parameters":'vmware_restore_parameters.VmwareRestoreParameters'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  acropolis_parameters=None,
@@ -238,73 +247,6 @@ class RestoreTask(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        acropolis_parameters = cohesity_management_sdk.models.acropolis_restore_parameters.AcropolisRestoreParameters.from_dictionary(dictionary.get('acropolisParameters')) if dictionary.get('acropolisParameters') else None
-        application_parameters = cohesity_management_sdk.models.application_restore_parameters.ApplicationRestoreParameters.from_dictionary(dictionary.get('applicationParameters')) if dictionary.get('applicationParameters') else None
-        archive_task_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('archiveTaskUid')) if dictionary.get('archiveTaskUid') else None
-        clone_view_parameters = cohesity_management_sdk.models.update_view_param.UpdateViewParam.from_dictionary(dictionary.get('cloneViewParameters')) if dictionary.get('cloneViewParameters') else None
-        continue_on_error = dictionary.get('continueOnError')
-        datastore_id = dictionary.get('datastoreId')
-        deploy_vms_to_cloud = cohesity_management_sdk.models.deploy_vms_to_cloud.DeployVmsToCloud.from_dictionary(dictionary.get('deployVmsToCloud')) if dictionary.get('deployVmsToCloud') else None
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        error = cohesity_management_sdk.models.request_error.RequestError.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        full_view_name = dictionary.get('fullViewName')
-        hyperv_parameters = cohesity_management_sdk.models.hyperv_restore_parameters.HypervRestoreParameters.from_dictionary(dictionary.get('hypervParameters')) if dictionary.get('hypervParameters') else None
-        id = dictionary.get('id')
-        mount_volumes_state = cohesity_management_sdk.models.mount_volumes_state.MountVolumesState.from_dictionary(dictionary.get('mountVolumesState')) if dictionary.get('mountVolumesState') else None
-        new_parent_id = dictionary.get('newParentId')
-        objects = None
-        if dictionary.get('objects') != None:
-            objects = list()
-            for structure in dictionary.get('objects'):
-                objects.append(cohesity_management_sdk.models.restore_object_details.RestoreObjectDetails.from_dictionary(structure))
-        outlook_parameters = cohesity_management_sdk.models.outlook_restore_parameters.OutlookRestoreParameters.from_dictionary(dictionary.get('outlookParameters')) if dictionary.get('outlookParameters') else None
-        restore_object_state = None
-        if dictionary.get('restoreObjectState') != None:
-            restore_object_state = list()
-            for structure in dictionary.get('restoreObjectState'):
-                restore_object_state.append(cohesity_management_sdk.models.restore_object_state.RestoreObjectState.from_dictionary(structure))
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        status = dictionary.get('status')
-        target_view_created = dictionary.get('targetViewCreated')
-        mtype = dictionary.get('type')
-        username = dictionary.get('username')
-        view_box_id = dictionary.get('viewBoxId')
-        virtual_disk_restore_state = cohesity_management_sdk.models.virtual_disk_recover_task_state.VirtualDiskRecoverTaskState.from_dictionary(dictionary.get('virtualDiskRestoreState')) if dictionary.get('virtualDiskRestoreState') else None
-        vlan_parameters = cohesity_management_sdk.models.vlan_parameters.VlanParameters.from_dictionary(dictionary.get('vlanParameters')) if dictionary.get('vlanParameters') else None
-        vmware_parameters = cohesity_management_sdk.models.vmware_restore_parameters.VmwareRestoreParameters.from_dictionary(dictionary.get('vmwareParameters')) if dictionary.get('vmwareParameters') else None
-
-        # Return an object of this model
-        return cls(name,
-                   acropolis_parameters,
-                   application_parameters,
-                   archive_task_uid,
-                   clone_view_parameters,
-                   continue_on_error,
-                   datastore_id,
-                   deploy_vms_to_cloud,
-                   end_time_usecs,
-                   error,
-                   full_view_name,
-                   hyperv_parameters,
-                   id,
-                   mount_volumes_state,
-                   new_parent_id,
-                   objects,
-                   outlook_parameters,
-                   restore_object_state,
-                   start_time_usecs,
-                   status,
-                   target_view_created,
-                   mtype,
-                   username,
-                   view_box_id,
-                   virtual_disk_restore_state,
-                   vlan_parameters,
-                   vmware_parameters)
+        return decode_model(cls, dictionary)
 
 
@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.error_proto
-import cohesity_management_sdk.models.connector_params
-import cohesity_management_sdk.models.restore_vlan_params
-import cohesity_management_sdk.models.user_information
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreTaskStateBaseProto(object):
 
@@ -81,6 +78,19 @@ class RestoreTaskStateBaseProto(object):
         "warnings":'warnings'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "error":'error_proto.ErrorProto',
+        "parent_source_connection_params":'connector_params.ConnectorParams',
+        "restore_vlan_params":'restore_vlan_params.RestoreVlanParams',
+        "user_info":'user_information.UserInformation',
+        "warnings":['error_proto.ErrorProto']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cancellation_requested=None,
                  end_time_usecs=None,
@@ -141,55 +151,6 @@ class RestoreTaskStateBaseProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cancellation_requested = dictionary.get('cancellationRequested')
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        name = dictionary.get('name')
-        parent_source_connection_params = cohesity_management_sdk.models.connector_params.ConnectorParams.from_dictionary(dictionary.get('parentSourceConnectionParams')) if dictionary.get('parentSourceConnectionParams') else None
-        public_status = dictionary.get('publicStatus')
-        refresh_status = dictionary.get('refreshStatus')
-        restore_vlan_params = cohesity_management_sdk.models.restore_vlan_params.RestoreVlanParams.from_dictionary(dictionary.get('restoreVlanParams')) if dictionary.get('restoreVlanParams') else None
-        scheduled_constituent_id = dictionary.get('scheduledConstituentId')
-        scheduled_gandalf_session_id = dictionary.get('scheduledGandalfSessionId')
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        status = dictionary.get('status')
-        task_id = dictionary.get('taskId')
-        total_logical_size_bytes = dictionary.get('totalLogicalSizeBytes')
-        total_physical_size_bytes = dictionary.get('totalPhysicalSizeBytes')
-        mtype = dictionary.get('type')
-        user = dictionary.get('user')
-        user_info = cohesity_management_sdk.models.user_information.UserInformation.from_dictionary(dictionary.get('userInfo')) if dictionary.get('userInfo') else None
-        user_messages = dictionary.get('userMessages')
-        warnings = None
-        if dictionary.get('warnings') != None:
-            warnings = list()
-            for structure in dictionary.get('warnings'):
-                warnings.append(cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(cancellation_requested,
-                   end_time_usecs,
-                   error,
-                   name,
-                   parent_source_connection_params,
-                   public_status,
-                   refresh_status,
-                   restore_vlan_params,
-                   scheduled_constituent_id,
-                   scheduled_gandalf_session_id,
-                   start_time_usecs,
-                   status,
-                   task_id,
-                   total_logical_size_bytes,
-                   total_physical_size_bytes,
-                   mtype,
-                   user,
-                   user_info,
-                   user_messages,
-                   warnings)
+        return decode_model(cls, dictionary)
 
 
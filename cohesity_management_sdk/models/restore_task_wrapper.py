@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.restore_wrapper_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreTaskWrapper(object):
 
@@ -26,6 +26,15 @@ class RestoreTaskWrapper(object):
         "restore_task":'restoreTask'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "restore_task":'restore_wrapper_proto.RestoreWrapperProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  restore_task=None):
         """Constructor for the RestoreTaskWrapper class"""
@@ -48,13 +57,6 @@ class RestoreTaskWrapper(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        restore_task = cohesity_management_sdk.models.restore_wrapper_proto.RestoreWrapperProto.from_dictionary(dictionary.get('restoreTask')) if dictionary.get('restoreTask') else None
-
-        # Return an object of this model
-        return cls(restore_task)
+        return decode_model(cls, dictionary)
 
 
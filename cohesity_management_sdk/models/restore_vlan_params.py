@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreVlanParams(object):
 
@@ -28,6 +29,9 @@ class RestoreVlanParams(object):
         "vlan_id":'vlanId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disable_vlan=None,
                  interface_name=None,
@@ -54,17 +58,6 @@ class RestoreVlanParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disable_vlan = dictionary.get('disableVlan')
-        interface_name = dictionary.get('interfaceName')
-        vlan_id = dictionary.get('vlanId')
-
-        # Return an object of this model
-        return cls(disable_vlan,
-                   interface_name,
-                   vlan_id)
+        return decode_model(cls, dictionary)
 
 
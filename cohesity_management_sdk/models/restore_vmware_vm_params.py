@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreVmwareVMParams(object):
 
@@ -35,6 +35,18 @@ class RestoreVmwareVMParams(object):
         "target_vm_folder":'targetVmFolder'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "datastore_entity":'entity_proto.EntityProto',
+        "resource_pool_entity":'entity_proto.EntityProto',
+        "target_datastore_folder":'entity_proto.EntityProto',
+        "target_vm_folder":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  copy_recovery=None,
                  datastore_entity=None,
@@ -67,23 +79,6 @@ class RestoreVmwareVMParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        copy_recovery = dictionary.get('copyRecovery')
-        datastore_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('datastoreEntity')) if dictionary.get('datastoreEntity') else None
-        preserve_tags_during_clone = dictionary.get('preserveTagsDuringClone')
-        resource_pool_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('resourcePoolEntity')) if dictionary.get('resourcePoolEntity') else None
-        target_datastore_folder = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetDatastoreFolder')) if dictionary.get('targetDatastoreFolder') else None
-        target_vm_folder = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('targetVmFolder')) if dictionary.get('targetVmFolder') else None
-
-        # Return an object of this model
-        return cls(copy_recovery,
-                   datastore_entity,
-                   preserve_tags_during_clone,
-                   resource_pool_entity,
-                   target_datastore_folder,
-                   target_vm_folder)
+        return decode_model(cls, dictionary)
 
 
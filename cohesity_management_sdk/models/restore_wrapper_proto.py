@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.destroy_cloned_task_state_proto
-import cohesity_management_sdk.models.restore_wrapper_proto
-import cohesity_management_sdk.models.perform_restore_task_state_proto
-import cohesity_management_sdk.models.perform_restore_job_state_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoreWrapperProto(object):
 
@@ -54,6 +51,19 @@ class RestoreWrapperProto(object):
         "restore_sub_task_wrapper_proto_vec":'restoreSubTaskWrapperProtoVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "destroy_cloned_task_state_vec":['destroy_cloned_task_state_proto.DestroyClonedTaskStateProto'],
+        "owner_restore_wrapper_proto":'restore_wrapper_proto.RestoreWrapperProto',
+        "perform_refresh_task_state_vec":['perform_restore_task_state_proto.PerformRestoreTaskStateProto'],
+        "perform_restore_job_state":'perform_restore_job_state_proto.PerformRestoreJobStateProto',
+        "perform_restore_task_state":'perform_restore_task_state_proto.PerformRestoreTaskStateProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  destroy_cloned_task_state_vec=None,
                  owner_restore_wrapper_proto=None,
@@ -86,31 +96,6 @@ class RestoreWrapperProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        destroy_cloned_task_state_vec = None
-        if dictionary.get('destroyClonedTaskStateVec') != None:
-            destroy_cloned_task_state_vec = list()
-            for structure in dictionary.get('destroyClonedTaskStateVec'):
-                destroy_cloned_task_state_vec.append(cohesity_management_sdk.models.destroy_cloned_task_state_proto.DestroyClonedTaskStateProto.from_dictionary(structure))
-        owner_restore_wrapper_proto = cohesity_management_sdk.models.restore_wrapper_proto.RestoreWrapperProto.from_dictionary(dictionary.get('ownerRestoreWrapperProto')) if dictionary.get('ownerRestoreWrapperProto') else None
-        perform_refresh_task_state_vec = None
-        if dictionary.get('performRefreshTaskStateVec') != None:
-            perform_refresh_task_state_vec = list()
-            for structure in dictionary.get('performRefreshTaskStateVec'):
-                perform_refresh_task_state_vec.append(cohesity_management_sdk.models.perform_restore_task_state_proto.PerformRestoreTaskStateProto.from_dictionary(structure))
-        perform_restore_job_state = cohesity_management_sdk.models.perform_restore_job_state_proto.PerformRestoreJobStateProto.from_dictionary(dictionary.get('performRestoreJobState')) if dictionary.get('performRestoreJobState') else None
-        perform_restore_task_state = cohesity_management_sdk.models.perform_restore_task_state_proto.PerformRestoreTaskStateProto.from_dictionary(dictionary.get('performRestoreTaskState')) if dictionary.get('performRestoreTaskState') else None
-        restore_sub_task_wrapper_proto_vec = dictionary.get('restoreSubTaskWrapperProtoVec')
-
-        # Return an object of this model
-        return cls(destroy_cloned_task_state_vec,
-                   owner_restore_wrapper_proto,
-                   perform_refresh_task_state_vec,
-                   perform_restore_job_state,
-                   perform_restore_task_state,
-                   restore_sub_task_wrapper_proto_vec)
+        return decode_model(cls, dictionary)
 
 
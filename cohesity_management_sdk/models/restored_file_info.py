@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoredFileInfo(object):
 
@@ -47,6 +48,9 @@ class RestoredFileInfo(object):
         "volume_path":'volumePath'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  absolute_path=None,
                  attached_disk_id=None,
@@ -87,31 +91,6 @@ class RestoredFileInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        absolute_path = dictionary.get('absolutePath')
-        attached_disk_id = dictionary.get('attachedDiskId')
-        disk_partition_id = dictionary.get('diskPartitionId')
-        is_directory = dictionary.get('isDirectory')
-        is_non_simple_ldm_vol = dictionary.get('isNonSimpleLdmVol')
-        restore_mount_point = dictionary.get('restoreMountPoint')
-        size_bytes = dictionary.get('sizeBytes')
-        virtual_disk_file = dictionary.get('virtualDiskFile')
-        volume_id = dictionary.get('volumeId')
-        volume_path = dictionary.get('volumePath')
-
-        # Return an object of this model
-        return cls(absolute_path,
-                   attached_disk_id,
-                   disk_partition_id,
-                   is_directory,
-                   is_non_simple_ldm_vol,
-                   restore_mount_point,
-                   size_bytes,
-                   virtual_disk_file,
-                   volume_id,
-                   volume_path)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.network_mapping_proto
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoredObjectNetworkConfigProto(object):
 
@@ -38,6 +37,17 @@ class RestoredObjectNetworkConfigProto(object):
         "vnic_entity":'vnicEntity'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "mappings":['network_mapping_proto.NetworkMappingProto'],
+        "network_entity":'entity_proto.EntityProto',
+        "vnic_entity":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  detach_network=None,
                  disable_network=None,
@@ -70,27 +80,6 @@ class RestoredObjectNetworkConfigProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        detach_network = dictionary.get('detachNetwork')
-        disable_network = dictionary.get('disableNetwork')
-        mappings = None
-        if dictionary.get('mappings') != None:
-            mappings = list()
-            for structure in dictionary.get('mappings'):
-                mappings.append(cohesity_management_sdk.models.network_mapping_proto.NetworkMappingProto.from_dictionary(structure))
-        network_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('networkEntity')) if dictionary.get('networkEntity') else None
-        preserve_mac_address_on_new_network = dictionary.get('preserveMacAddressOnNewNetwork')
-        vnic_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('vnicEntity')) if dictionary.get('vnicEntity') else None
-
-        # Return an object of this model
-        return cls(detach_network,
-                   disable_network,
-                   mappings,
-                   network_entity,
-                   preserve_mac_address_on_new_network,
-                   vnic_entity)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.connector_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RestoredObjectVCDConfigProto(object):
 
@@ -30,6 +29,17 @@ class RestoredObjectVCDConfigProto(object):
         "vdc_entity":'vdcEntity'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "vapp_entity":'entity_proto.EntityProto',
+        "vcenter_connector_params":'connector_params.ConnectorParams',
+        "vdc_entity":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  is_vapp=None,
                  vapp_entity=None,
@@ -58,19 +68,6 @@ class RestoredObjectVCDConfigProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        is_vapp = dictionary.get('isVapp')
-        vapp_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('vappEntity')) if dictionary.get('vappEntity') else None
-        vcenter_connector_params = cohesity_management_sdk.models.connector_params.ConnectorParams.from_dictionary(dictionary.get('vcenterConnectorParams')) if dictionary.get('vcenterConnectorParams') else None
-        vdc_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('vdcEntity')) if dictionary.get('vdcEntity') else None
-
-        # Return an object of this model
-        return cls(is_vapp,
-                   vapp_entity,
-                   vcenter_connector_params,
-                   vdc_entity)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.worm_retention_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RetentionPolicyProto(object):
 
@@ -29,6 +29,15 @@ class RetentionPolicyProto(object):
         "worm_retention":'wormRetention'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "worm_retention":'worm_retention_proto.WormRetentionProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  num_days_to_keep=None,
                  worm_retention=None):
@@ -53,15 +62,6 @@ class RetentionPolicyProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        num_days_to_keep = dictionary.get('numDaysToKeep')
-        worm_retention = cohesity_management_sdk.models.worm_retention_proto.WormRetentionProto.from_dictionary(dictionary.get('wormRetention')) if dictionary.get('wormRetention') else None
-
-        # Return an object of this model
-        return cls(num_days_to_keep,
-                   worm_retention)
+        return decode_model(cls, dictionary)
 
 
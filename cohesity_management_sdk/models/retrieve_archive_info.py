@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.error_proto
-import cohesity_management_sdk.models.retrieve_archive_info_retrieved_entity
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RetrieveArchiveInfo(object):
 
@@ -63,6 +62,16 @@ class RetrieveArchiveInfo(object):
         "user_action_required_msg":'userActionRequiredMsg'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "error":'error_proto.ErrorProto',
+        "retrieved_entity_vec":['retrieve_archive_info_retrieved_entity.RetrieveArchiveInfoRetrievedEntity']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  avg_logical_transfer_rate_bps=None,
                  bytes_transferred=None,
@@ -109,41 +118,6 @@ class RetrieveArchiveInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        avg_logical_transfer_rate_bps = dictionary.get('avgLogicalTransferRateBps')
-        bytes_transferred = dictionary.get('bytesTransferred')
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        logical_bytes_transferred = dictionary.get('logicalBytesTransferred')
-        logical_size_bytes = dictionary.get('logicalSizeBytes')
-        progress_monitor_task_path = dictionary.get('progressMonitorTaskPath')
-        retrieved_entity_vec = None
-        if dictionary.get('retrievedEntityVec') != None:
-            retrieved_entity_vec = list()
-            for structure in dictionary.get('retrievedEntityVec'):
-                retrieved_entity_vec.append(cohesity_management_sdk.models.retrieve_archive_info_retrieved_entity.RetrieveArchiveInfoRetrievedEntity.from_dictionary(structure))
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        stub_view_name = dictionary.get('stubViewName')
-        stub_view_relative_dir_name = dictionary.get('stubViewRelativeDirName')
-        target_view_name = dictionary.get('targetViewName')
-        user_action_required_msg = dictionary.get('userActionRequiredMsg')
-
-        # Return an object of this model
-        return cls(avg_logical_transfer_rate_bps,
-                   bytes_transferred,
-                   end_time_usecs,
-                   error,
-                   logical_bytes_transferred,
-                   logical_size_bytes,
-                   progress_monitor_task_path,
-                   retrieved_entity_vec,
-                   start_time_usecs,
-                   stub_view_name,
-                   stub_view_relative_dir_name,
-                   target_view_name,
-                   user_action_required_msg)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RetrieveArchiveInfoRetrievedEntity(object):
 
@@ -48,6 +47,16 @@ class RetrieveArchiveInfoRetrievedEntity(object):
         "status":'status'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "entity":'entity_proto.EntityProto',
+        "error":'error_proto.ErrorProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bytes_transferred=None,
                  end_timestamp_usecs=None,
@@ -88,31 +97,6 @@ class RetrieveArchiveInfoRetrievedEntity(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bytes_transferred = dictionary.get('bytesTransferred')
-        end_timestamp_usecs = dictionary.get('endTimestampUsecs')
-        entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('entity')) if dictionary.get('entity') else None
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        logical_bytes_transferred = dictionary.get('logicalBytesTransferred')
-        logical_size_bytes = dictionary.get('logicalSizeBytes')
-        progress_monitor_task_path = dictionary.get('progressMonitorTaskPath')
-        relative_snapshot_dir = dictionary.get('relativeSnapshotDir')
-        start_timestamp_usecs = dictionary.get('startTimestampUsecs')
-        status = dictionary.get('status')
-
-        # Return an object of this model
-        return cls(bytes_transferred,
-                   end_timestamp_usecs,
-                   entity,
-                   error,
-                   logical_bytes_transferred,
-                   logical_size_bytes,
-                   progress_monitor_task_path,
-                   relative_snapshot_dir,
-                   start_timestamp_usecs,
-                   status)
+        return decode_model(cls, dictionary)
 
 
@@ -1,13 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.archival_target
-import cohesity_management_sdk.models.universal_id_proto
-import cohesity_management_sdk.models.retrieve_archive_task_state_proto_download_files_info
-import cohesity_management_sdk.models.entity_proto
-import cohesity_management_sdk.models.error_proto
-import cohesity_management_sdk.models.retrieve_archive_info
-import cohesity_management_sdk.models.vault_params_restore_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RetrieveArchiveTaskStateProto(object):
 
@@ -95,6 +89,23 @@ class RetrieveArchiveTaskStateProto(object):
         "view_name_deprecated":'viewName_DEPRECATED'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "archival_target":'archival_target.ArchivalTarget',
+        "archive_task_uid":'universal_id_proto.UniversalIdProto',
+        "download_files_info":'retrieve_archive_task_state_proto_download_files_info.RetrieveArchiveTaskStateProtoDownloadFilesInfo',
+        "entity_vec":['entity_proto.EntityProto'],
+        "error":'error_proto.ErrorProto',
+        "job_uid":'universal_id_proto.UniversalIdProto',
+        "retrieval_info":'retrieve_archive_info.RetrieveArchiveInfo',
+        "task_uid":'universal_id_proto.UniversalIdProto',
+        "vault_restore_params":'vault_params_restore_params.VaultParamsRestoreParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  archival_target=None,
                  archive_task_uid=None,
@@ -157,57 +168,6 @@ class RetrieveArchiveTaskStateProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        archival_target = cohesity_management_sdk.models.archival_target.ArchivalTarget.from_dictionary(dictionary.get('archivalTarget')) if dictionary.get('archivalTarget') else None
-        archive_task_uid = cohesity_management_sdk.models.universal_id_proto.UniversalIdProto.from_dictionary(dictionary.get('archiveTaskUid')) if dictionary.get('archiveTaskUid') else None
-        backup_run_start_time_usecs = dictionary.get('backupRunStartTimeUsecs')
-        cancellation_requested = dictionary.get('cancellationRequested')
-        download_files_info = cohesity_management_sdk.models.retrieve_archive_task_state_proto_download_files_info.RetrieveArchiveTaskStateProtoDownloadFilesInfo.from_dictionary(dictionary.get('downloadFilesInfo')) if dictionary.get('downloadFilesInfo') else None
-        end_time_usecs = dictionary.get('endTimeUsecs')
-        entity_vec = None
-        if dictionary.get('entityVec') != None:
-            entity_vec = list()
-            for structure in dictionary.get('entityVec'):
-                entity_vec.append(cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(structure))
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        full_view_name_deprecated = dictionary.get('fullViewName_DEPRECATED')
-        job_uid = cohesity_management_sdk.models.universal_id_proto.UniversalIdProto.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-        name = dictionary.get('name')
-        progress_monitor_task_path = dictionary.get('progressMonitorTaskPath')
-        restore_task_id = dictionary.get('restoreTaskId')
-        retrieval_info = cohesity_management_sdk.models.retrieve_archive_info.RetrieveArchiveInfo.from_dictionary(dictionary.get('retrievalInfo')) if dictionary.get('retrievalInfo') else None
-        start_time_usecs = dictionary.get('startTimeUsecs')
-        status = dictionary.get('status')
-        task_uid = cohesity_management_sdk.models.universal_id_proto.UniversalIdProto.from_dictionary(dictionary.get('taskUid')) if dictionary.get('taskUid') else None
-        user = dictionary.get('user')
-        vault_restore_params = cohesity_management_sdk.models.vault_params_restore_params.VaultParamsRestoreParams.from_dictionary(dictionary.get('vaultRestoreParams')) if dictionary.get('vaultRestoreParams') else None
-        view_box_id = dictionary.get('viewBoxId')
-        view_name_deprecated = dictionary.get('viewName_DEPRECATED')
-
-        # Return an object of this model
-        return cls(archival_target,
-                   archive_task_uid,
-                   backup_run_start_time_usecs,
-                   cancellation_requested,
-                   download_files_info,
-                   end_time_usecs,
-                   entity_vec,
-                   error,
-                   full_view_name_deprecated,
-                   job_uid,
-                   name,
-                   progress_monitor_task_path,
-                   restore_task_id,
-                   retrieval_info,
-                   start_time_usecs,
-                   status,
-                   task_uid,
-                   user,
-                   vault_restore_params,
-                   view_box_id,
-                   view_name_deprecated)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.magneto_instance_id
-import cohesity_management_sdk.models.magneto_object_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RetrieveArchiveTaskStateProtoDownloadFilesInfo(object):
 
@@ -44,6 +43,16 @@ class RetrieveArchiveTaskStateProtoDownloadFilesInfo(object):
         "target_view_name":'targetViewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "magneto_instance_id":'magneto_instance_id.MagnetoInstanceId',
+        "object_id":'magneto_object_id.MagnetoObjectId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  file_path=None,
                  magneto_instance_id=None,
@@ -76,23 +85,6 @@ class RetrieveArchiveTaskStateProtoDownloadFilesInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        file_path = dictionary.get('filePath')
-        magneto_instance_id = cohesity_management_sdk.models.magneto_instance_id.MagnetoInstanceId.from_dictionary(dictionary.get('magnetoInstanceId')) if dictionary.get('magnetoInstanceId') else None
-        object_id = cohesity_management_sdk.models.magneto_object_id.MagnetoObjectId.from_dictionary(dictionary.get('objectId')) if dictionary.get('objectId') else None
-        skip_restore_in_stub_view = dictionary.get('skipRestoreInStubView')
-        target_dir_path = dictionary.get('targetDirPath')
-        target_view_name = dictionary.get('targetViewName')
-
-        # Return an object of this model
-        return cls(file_path,
-                   magneto_instance_id,
-                   object_id,
-                   skip_restore_in_stub_view,
-                   target_dir_path,
-                   target_view_name)
+        return decode_model(cls, dictionary)
 
 
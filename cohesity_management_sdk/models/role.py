@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Role(object):
 
@@ -52,6 +53,9 @@ class Role(object):
         "tenant_ids":'tenantIds'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  created_time_msecs=None,
                  description=None,
@@ -90,29 +94,6 @@ class Role(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        created_time_msecs = dictionary.get('createdTimeMsecs')
-        description = dictionary.get('description')
-        is_custom_role = dictionary.get('isCustomRole')
-        label = dictionary.get('label')
-        last_updated_time_msecs = dictionary.get('lastUpdatedTimeMsecs')
-        name = dictionary.get('name')
-        privileges = dictionary.get('privileges')
-        tenant_id = dictionary.get('tenantId')
-        tenant_ids = dictionary.get('tenantIds')
-
-        # Return an object of this model
-        return cls(created_time_msecs,
-                   description,
-                   is_custom_role,
-                   label,
-                   last_updated_time_msecs,
-                   name,
-                   privileges,
-                   tenant_id,
-                   tenant_ids)
+        return decode_model(cls, dictionary)
 
 
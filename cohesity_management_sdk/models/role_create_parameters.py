@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RoleCreateParameters(object):
 
@@ -24,6 +25,9 @@ class RoleCreateParameters(object):
         "privileges":'privileges'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  description=None,
                  name=None,
@@ -50,17 +54,6 @@ class RoleCreateParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        description = dictionary.get('description')
-        name = dictionary.get('name')
-        privileges = dictionary.get('privileges')
-
-        # Return an object of this model
-        return cls(description,
-                   name,
-                   privileges)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RoleDeleteParameters(object):
 
@@ -19,6 +20,9 @@ class RoleDeleteParameters(object):
         "names":'names'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  names=None):
         """Constructor for the RoleDeleteParameters class"""
@@ -41,13 +45,6 @@ class RoleDeleteParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        names = dictionary.get('names')
-
-        # Return an object of this model
-        return cls(names)
+        return decode_model(cls, dictionary)
 
 
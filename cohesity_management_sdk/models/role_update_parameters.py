@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RoleUpdateParameters(object):
 
@@ -21,6 +22,9 @@ class RoleUpdateParameters(object):
         "privileges":'privileges'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  description=None,
                  privileges=None):
@@ -45,15 +49,6 @@ class RoleUpdateParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        description = dictionary.get('description')
-        privileges = dictionary.get('privileges')
-
-        # Return an object of this model
-        return cls(description,
-                   privileges)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Route(object):
 
@@ -30,6 +31,9 @@ class Route(object):
         "next_hop":'nextHop'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  description=None,
                  dest_network=None,
@@ -60,21 +64,6 @@ class Route(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        description = dictionary.get('description')
-        dest_network = dictionary.get('destNetwork')
-        if_name = dictionary.get('ifName')
-        iface_group_name = dictionary.get('ifaceGroupName')
-        next_hop = dictionary.get('nextHop')
-
-        # Return an object of this model
-        return cls(description,
-                   dest_network,
-                   if_name,
-                   iface_group_name,
-                   next_hop)
+        return decode_model(cls, dictionary)
 
 
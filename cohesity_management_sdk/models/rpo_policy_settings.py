@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.alerting_config
-import cohesity_management_sdk.models.environment_type_job_parameters
-import cohesity_management_sdk.models.indexing_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RpoPolicySettings(object):
 
@@ -52,6 +50,17 @@ class RpoPolicySettings(object):
         "storage_domain_id":'storageDomainId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "alerting_config":'alerting_config.AlertingConfig',
+        "environment_type_job_params":'environment_type_job_parameters.EnvironmentTypeJobParameters',
+        "indexing_policy":'indexing_policy.IndexingPolicy'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alerting_config=None,
                  alerting_policy=None,
@@ -84,23 +93,6 @@ class RpoPolicySettings(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alerting_config = cohesity_management_sdk.models.alerting_config.AlertingConfig.from_dictionary(dictionary.get('alertingConfig')) if dictionary.get('alertingConfig') else None
-        alerting_policy = dictionary.get('alertingPolicy')
-        environment_type_job_params = cohesity_management_sdk.models.environment_type_job_parameters.EnvironmentTypeJobParameters.from_dictionary(dictionary.get('environmentTypeJobParams')) if dictionary.get('environmentTypeJobParams') else None
-        indexing_policy = cohesity_management_sdk.models.indexing_policy.IndexingPolicy.from_dictionary(dictionary.get('indexingPolicy')) if dictionary.get('indexingPolicy') else None
-        qos_type = dictionary.get('qosType')
-        storage_domain_id = dictionary.get('storageDomainId')
-
-        # Return an object of this model
-        return cls(alerting_config,
-                   alerting_policy,
-                   environment_type_job_params,
-                   indexing_policy,
-                   qos_type,
-                   storage_domain_id)
+        return decode_model(cls, dictionary)
 
 
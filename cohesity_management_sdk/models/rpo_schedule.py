@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RpoSchedule(object):
 
@@ -29,6 +30,9 @@ class RpoSchedule(object):
         "multiplier":'multiplier'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  interval_unit=None,
                  multiplier=None):
@@ -53,15 +57,6 @@ class RpoSchedule(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        interval_unit = dictionary.get('intervalUnit')
-        multiplier = dictionary.get('multiplier')
-
-        # Return an object of this model
-        return cls(interval_unit,
-                   multiplier)
+        return decode_model(cls, dictionary)
 
 
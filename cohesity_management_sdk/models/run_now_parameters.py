@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RunNowParameters(object):
 
@@ -23,6 +24,9 @@ class RunNowParameters(object):
         "source_id":'sourceId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  database_ids=None,
                  source_id=None):
@@ -47,15 +51,6 @@ class RunNowParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        database_ids = dictionary.get('databaseIds')
-        source_id = dictionary.get('sourceId')
-
-        # Return an object of this model
-        return cls(database_ids,
-                   source_id)
+        return decode_model(cls, dictionary)
 
 
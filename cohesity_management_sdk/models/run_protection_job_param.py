@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.run_job_snapshot_target
-import cohesity_management_sdk.models.run_now_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RunProtectionJobParam(object):
 
@@ -44,6 +43,16 @@ class RunProtectionJobParam(object):
         "source_ids":'sourceIds'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "copy_run_targets":['run_job_snapshot_target.RunJobSnapshotTarget'],
+        "run_now_parameters":['run_now_parameters.RunNowParameters']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  copy_run_targets=None,
                  run_now_parameters=None,
@@ -72,27 +81,6 @@ class RunProtectionJobParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        copy_run_targets = None
-        if dictionary.get('copyRunTargets') != None:
-            copy_run_targets = list()
-            for structure in dictionary.get('copyRunTargets'):
-                copy_run_targets.append(cohesity_management_sdk.models.run_job_snapshot_target.RunJobSnapshotTarget.from_dictionary(structure))
-        run_now_parameters = None
-        if dictionary.get('runNowParameters') != None:
-            run_now_parameters = list()
-            for structure in dictionary.get('runNowParameters'):
-                run_now_parameters.append(cohesity_management_sdk.models.run_now_parameters.RunNowParameters.from_dictionary(structure))
-        run_type = dictionary.get('runType')
-        source_ids = dictionary.get('sourceIds')
-
-        # Return an object of this model
-        return cls(copy_run_targets,
-                   run_now_parameters,
-                   run_type,
-                   source_ids)
+        return decode_model(cls, dictionary)
 
 
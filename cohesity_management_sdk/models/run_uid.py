@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class RunUid(object):
 
@@ -24,6 +24,15 @@ class RunUid(object):
         "start_time_usecs":'startTimeUsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "job_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  job_uid=None,
                  start_time_usecs=None):
@@ -48,15 +57,6 @@ class RunUid(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-        start_time_usecs = dictionary.get('startTimeUsecs')
-
-        # Return an object of this model
-        return cls(job_uid,
-                   start_time_usecs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Sample(object):
 
@@ -27,6 +28,9 @@ class Sample(object):
         "value":'value'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  float_value=None,
                  timestamp_msecs=None,
@@ -53,17 +57,6 @@ class Sample(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        float_value = dictionary.get('floatValue')
-        timestamp_msecs = dictionary.get('timestampMsecs')
-        value = dictionary.get('value')
-
-        # Return an object of this model
-        return cls(float_value,
-                   timestamp_msecs,
-                   value)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SchedulerProtoSchedulerJobSchedule(object):
 
@@ -24,6 +25,9 @@ class SchedulerProtoSchedulerJobSchedule(object):
         "timezone":'timezone'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  day=None,
                  hour=None,
@@ -50,17 +54,6 @@ class SchedulerProtoSchedulerJobSchedule(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        day = dictionary.get('day')
-        hour = dictionary.get('hour')
-        timezone = dictionary.get('timezone')
-
-        # Return an object of this model
-        return cls(day,
-                   hour,
-                   timezone)
+        return decode_model(cls, dictionary)
 
 
@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.scheduling_policy_proto_continuous_schedule
-import cohesity_management_sdk.models.scheduling_policy_proto_daily_schedule
-import cohesity_management_sdk.models.scheduling_policy_proto_monthly_schedule
-import cohesity_management_sdk.models.scheduling_policy_proto_rpo_schedule
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SchedulingPolicyProto(object):
 
@@ -37,6 +34,18 @@ class SchedulingPolicyProto(object):
         "rpo_schedule":'rpoSchedule'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "continuous_schedule":'scheduling_policy_proto_continuous_schedule.SchedulingPolicyProtoContinuousSchedule',
+        "daily_schedule":'scheduling_policy_proto_daily_schedule.SchedulingPolicyProtoDailySchedule',
+        "monthly_schedule":'scheduling_policy_proto_monthly_schedule.SchedulingPolicyProtoMonthlySchedule',
+        "rpo_schedule":'scheduling_policy_proto_rpo_schedule.SchedulingPolicyProtoRPOSchedule'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  continuous_schedule=None,
                  daily_schedule=None,
@@ -67,21 +76,6 @@ class SchedulingPolicyProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        continuous_schedule = cohesity_management_sdk.models.scheduling_policy_proto_continuous_schedule.SchedulingPolicyProtoContinuousSchedule.from_dictionary(dictionary.get('continuousSchedule')) if dictionary.get('continuousSchedule') else None
-        daily_schedule = cohesity_management_sdk.models.scheduling_policy_proto_daily_schedule.SchedulingPolicyProtoDailySchedule.from_dictionary(dictionary.get('dailySchedule')) if dictionary.get('dailySchedule') else None
-        monthly_schedule = cohesity_management_sdk.models.scheduling_policy_proto_monthly_schedule.SchedulingPolicyProtoMonthlySchedule.from_dictionary(dictionary.get('monthlySchedule')) if dictionary.get('monthlySchedule') else None
-        periodicity = dictionary.get('periodicity')
-        rpo_schedule = cohesity_management_sdk.models.scheduling_policy_proto_rpo_schedule.SchedulingPolicyProtoRPOSchedule.from_dictionary(dictionary.get('rpoSchedule')) if dictionary.get('rpoSchedule') else None
-
-        # Return an object of this model
-        return cls(continuous_schedule,
-                   daily_schedule,
-                   monthly_schedule,
-                   periodicity,
-                   rpo_schedule)
+        return decode_model(cls, dictionary)
 
 
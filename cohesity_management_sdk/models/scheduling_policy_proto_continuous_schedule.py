@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SchedulingPolicyProtoContinuousSchedule(object):
 
@@ -21,6 +22,9 @@ class SchedulingPolicyProtoContinuousSchedule(object):
         "backup_interval_mins":'backupIntervalMins'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_interval_mins=None):
         """Constructor for the SchedulingPolicyProtoContinuousSchedule class"""
@@ -43,13 +47,6 @@ class SchedulingPolicyProtoContinuousSchedule(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_interval_mins = dictionary.get('backupIntervalMins')
-
-        # Return an object of this model
-        return cls(backup_interval_mins)
+        return decode_model(cls, dictionary)
 
 
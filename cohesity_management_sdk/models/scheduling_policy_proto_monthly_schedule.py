@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SchedulingPolicyProtoMonthlySchedule(object):
 
@@ -21,6 +22,9 @@ class SchedulingPolicyProtoMonthlySchedule(object):
         "day":'day'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  count=None,
                  day=None):
@@ -45,15 +49,6 @@ class SchedulingPolicyProtoMonthlySchedule(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        count = dictionary.get('count')
-        day = dictionary.get('day')
-
-        # Return an object of this model
-        return cls(count,
-                   day)
+        return decode_model(cls, dictionary)
 
 
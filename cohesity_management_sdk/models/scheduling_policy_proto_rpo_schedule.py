@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SchedulingPolicyProtoRPOSchedule(object):
 
@@ -20,6 +21,9 @@ class SchedulingPolicyProtoRPOSchedule(object):
         "rpo_interval_mins":'rpoIntervalMins'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  rpo_interval_mins=None):
         """Constructor for the SchedulingPolicyProtoRPOSchedule class"""
@@ -42,13 +46,6 @@ class SchedulingPolicyProtoRPOSchedule(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        rpo_interval_mins = dictionary.get('rpoIntervalMins')
-
-        # Return an object of this model
-        return cls(rpo_interval_mins)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SchemaInfo(object):
 
@@ -29,6 +30,9 @@ class SchemaInfo(object):
         "schema_name":'schemaName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  entity_id=None,
                  key=None,
@@ -57,19 +61,6 @@ class SchemaInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        entity_id = dictionary.get('entityId')
-        key = dictionary.get('key')
-        metric_name = dictionary.get('metricName')
-        schema_name = dictionary.get('schemaName')
-
-        # Return an object of this model
-        return cls(entity_id,
-                   key,
-                   metric_name,
-                   schema_name)
+        return decode_model(cls, dictionary)
 
 
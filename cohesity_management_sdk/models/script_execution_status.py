@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ScriptExecutionStatus(object):
 
@@ -28,6 +28,15 @@ class ScriptExecutionStatus(object):
         "state":'state'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "error":'error_proto.ErrorProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error=None,
                  executing=None,
@@ -56,19 +65,6 @@ class ScriptExecutionStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error = cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        executing = dictionary.get('executing')
-        exit_code = dictionary.get('exitCode')
-        state = dictionary.get('state')
-
-        # Return an object of this model
-        return cls(error,
-                   executing,
-                   exit_code,
-                   state)
+        return decode_model(cls, dictionary)
 
 
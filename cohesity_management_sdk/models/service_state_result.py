@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ServiceStateResult(object):
 
@@ -63,6 +64,9 @@ class ServiceStateResult(object):
         "state":'state'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  service=None,
                  state=None):
@@ -87,15 +91,6 @@ class ServiceStateResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        service = dictionary.get('service')
-        state = dictionary.get('state')
-
-        # Return an object of this model
-        return cls(service,
-                   state)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.entity_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SetupRestoreDiskTaskInfoProto(object):
 
@@ -57,6 +57,16 @@ class SetupRestoreDiskTaskInfoProto(object):
         "view_name":'viewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "entity":'entity_proto.EntityProto',
+        "root_entity":'entity_proto.EntityProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  entity=None,
                  progress_monitor_root_task_path=None,
@@ -91,25 +101,6 @@ class SetupRestoreDiskTaskInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('entity')) if dictionary.get('entity') else None
-        progress_monitor_root_task_path = dictionary.get('progressMonitorRootTaskPath')
-        root_entity = cohesity_management_sdk.models.entity_proto.EntityProto.from_dictionary(dictionary.get('rootEntity')) if dictionary.get('rootEntity') else None
-        source_view_name = dictionary.get('sourceViewName')
-        task_id = dictionary.get('taskId')
-        view_box_id = dictionary.get('viewBoxId')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(entity,
-                   progress_monitor_root_task_path,
-                   root_entity,
-                   source_view_name,
-                   task_id,
-                   view_box_id,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
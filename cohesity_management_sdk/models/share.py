@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.smb_permission
-import cohesity_management_sdk.models.subnet
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Share(object):
 
@@ -63,6 +62,16 @@ class Share(object):
         "view_name":'viewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "share_permissions":['smb_permission.SmbPermission'],
+        "subnet_whitelist":['subnet.Subnet']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  all_smb_mount_paths=None,
                  enable_smb_encryption=None,
@@ -109,45 +118,6 @@ class Share(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        all_smb_mount_paths = dictionary.get('allSmbMountPaths')
-        enable_smb_encryption = dictionary.get('enableSmbEncryption')
-        enable_smb_view_discovery = dictionary.get('enableSmbViewDiscovery')
-        enforce_smb_encryption = dictionary.get('enforceSmbEncryption')
-        nfs_mount_path = dictionary.get('nfsMountPath')
-        path = dictionary.get('path')
-        s_3_access_path = dictionary.get('s3AccessPath')
-        share_name = dictionary.get('shareName')
-        share_permissions = None
-        if dictionary.get('sharePermissions') != None:
-            share_permissions = list()
-            for structure in dictionary.get('sharePermissions'):
-                share_permissions.append(cohesity_management_sdk.models.smb_permission.SmbPermission.from_dictionary(structure))
-        smb_mount_path = dictionary.get('smbMountPath')
-        subnet_whitelist = None
-        if dictionary.get('subnetWhitelist') != None:
-            subnet_whitelist = list()
-            for structure in dictionary.get('subnetWhitelist'):
-                subnet_whitelist.append(cohesity_management_sdk.models.subnet.Subnet.from_dictionary(structure))
-        tenant_id = dictionary.get('tenantId')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(all_smb_mount_paths,
-                   enable_smb_encryption,
-                   enable_smb_view_discovery,
-                   enforce_smb_encryption,
-                   nfs_mount_path,
-                   path,
-                   s_3_access_path,
-                   share_name,
-                   share_permissions,
-                   smb_mount_path,
-                   subnet_whitelist,
-                   tenant_id,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
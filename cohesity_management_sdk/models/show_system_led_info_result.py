@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ShowSystemLedInfoResult(object):
 
@@ -19,6 +20,9 @@ class ShowSystemLedInfoResult(object):
         "led_info":'ledInfo'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  led_info=None):
         """Constructor for the ShowSystemLedInfoResult class"""
@@ -41,13 +45,6 @@ class ShowSystemLedInfoResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        led_info = dictionary.get('ledInfo')
-
-        # Return an object of this model
-        return cls(led_info)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.smb_active_file_path
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SmbActiveFileOpensResponse(object):
 
@@ -24,6 +24,15 @@ class SmbActiveFileOpensResponse(object):
         "cookie":'cookie'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "active_file_paths":['smb_active_file_path.SmbActiveFilePath']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  active_file_paths=None,
                  cookie=None):
@@ -48,19 +57,6 @@ class SmbActiveFileOpensResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        active_file_paths = None
-        if dictionary.get('activeFilePaths') != None:
-            active_file_paths = list()
-            for structure in dictionary.get('activeFilePaths'):
-                active_file_paths.append(cohesity_management_sdk.models.smb_active_file_path.SmbActiveFilePath.from_dictionary(structure))
-        cookie = dictionary.get('cookie')
-
-        # Return an object of this model
-        return cls(active_file_paths,
-                   cookie)
+        return decode_model(cls, dictionary)
 
 
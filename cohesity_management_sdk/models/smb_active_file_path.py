@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.smb_active_session
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SmbActiveFilePath(object):
 
@@ -27,6 +27,15 @@ class SmbActiveFilePath(object):
         "view_name":'viewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "active_sessions":['smb_active_session.SmbActiveSession']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  active_sessions=None,
                  file_path=None,
@@ -55,23 +64,6 @@ class SmbActiveFilePath(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        active_sessions = None
-        if dictionary.get('activeSessions') != None:
-            active_sessions = list()
-            for structure in dictionary.get('activeSessions'):
-                active_sessions.append(cohesity_management_sdk.models.smb_active_session.SmbActiveSession.from_dictionary(structure))
-        file_path = dictionary.get('filePath')
-        view_id = dictionary.get('viewId')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(active_sessions,
-                   file_path,
-                   view_id,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SmbActiveOpen(object):
 
@@ -67,6 +68,9 @@ class SmbActiveOpen(object):
         "others_can_write":'othersCanWrite'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access_info_list=None,
                  open_id=None,
@@ -97,21 +101,6 @@ class SmbActiveOpen(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access_info_list = dictionary.get('accessInfoList')
-        open_id = dictionary.get('openId')
-        others_can_delete = dictionary.get('othersCanDelete')
-        others_can_read = dictionary.get('othersCanRead')
-        others_can_write = dictionary.get('othersCanWrite')
-
-        # Return an object of this model
-        return cls(access_info_list,
-                   open_id,
-                   others_can_delete,
-                   others_can_read,
-                   others_can_write)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.smb_active_open
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SmbActiveSession(object):
 
@@ -32,6 +32,15 @@ class SmbActiveSession(object):
         "username":'username'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "active_opens":['smb_active_open.SmbActiveOpen']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  active_opens=None,
                  client_ip=None,
@@ -64,27 +73,6 @@ class SmbActiveSession(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        active_opens = None
-        if dictionary.get('activeOpens') != None:
-            active_opens = list()
-            for structure in dictionary.get('activeOpens'):
-                active_opens.append(cohesity_management_sdk.models.smb_active_open.SmbActiveOpen.from_dictionary(structure))
-        client_ip = dictionary.get('clientIp')
-        domain = dictionary.get('domain')
-        server_ip = dictionary.get('serverIp')
-        session_id = dictionary.get('sessionId')
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(active_opens,
-                   client_ip,
-                   domain,
-                   server_ip,
-                   session_id,
-                   username)
+        return decode_model(cls, dictionary)
 
 
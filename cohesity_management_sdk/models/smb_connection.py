@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SmbConnection(object):
 
@@ -39,6 +40,9 @@ class SmbConnection(object):
         "view_name":'viewName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  client_ip=None,
                  domain_name=None,
@@ -79,31 +83,6 @@ class SmbConnection(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        client_ip = dictionary.get('clientIp')
-        domain_name = dictionary.get('domainName')
-        node_ip = dictionary.get('nodeIp')
-        path = dictionary.get('path')
-        server_ip = dictionary.get('serverIp')
-        session_id = dictionary.get('sessionId')
-        sids = dictionary.get('sids')
-        user_name = dictionary.get('userName')
-        view_id = dictionary.get('viewId')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(client_ip,
-                   domain_name,
-                   node_ip,
-                   path,
-                   server_ip,
-                   session_id,
-                   sids,
-                   user_name,
-                   view_id,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SmbPermission(object):
 
@@ -59,6 +60,9 @@ class SmbPermission(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  access=None,
                  mode=None,
@@ -91,23 +95,6 @@ class SmbPermission(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        access = dictionary.get('access')
-        mode = dictionary.get('mode')
-        sid = dictionary.get('sid')
-        special_access_mask = dictionary.get('specialAccessMask')
-        special_type = dictionary.get('specialType')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(access,
-                   mode,
-                   sid,
-                   special_access_mask,
-                   special_type,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.smb_permission
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SmbPermissionsInfo(object):
 
@@ -23,6 +23,15 @@ class SmbPermissionsInfo(object):
         "permissions":'permissions'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "permissions":['smb_permission.SmbPermission']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  owner_sid=None,
                  permissions=None):
@@ -47,19 +56,6 @@ class SmbPermissionsInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        owner_sid = dictionary.get('ownerSid')
-        permissions = None
-        if dictionary.get('permissions') != None:
-            permissions = list()
-            for structure in dictionary.get('permissions'):
-                permissions.append(cohesity_management_sdk.models.smb_permission.SmbPermission.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(owner_sid,
-                   permissions)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SmbPrincipal(object):
 
@@ -26,6 +27,9 @@ class SmbPrincipal(object):
         "mtype":'type'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain=None,
                  name=None,
@@ -54,19 +58,6 @@ class SmbPrincipal(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain = dictionary.get('domain')
-        name = dictionary.get('name')
-        sid = dictionary.get('sid')
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(domain,
-                   name,
-                   sid,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
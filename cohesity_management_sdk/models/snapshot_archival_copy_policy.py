@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.archival_external_target
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SnapshotArchivalCopyPolicy(object):
 
@@ -55,6 +55,15 @@ class SnapshotArchivalCopyPolicy(object):
         "target":'target'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "target":'archival_external_target.ArchivalExternalTarget'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  copy_partial=None,
                  days_to_keep=None,
@@ -85,21 +94,6 @@ class SnapshotArchivalCopyPolicy(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        copy_partial = dictionary.get('copyPartial')
-        days_to_keep = dictionary.get('daysToKeep')
-        multiplier = dictionary.get('multiplier')
-        periodicity = dictionary.get('periodicity')
-        target = cohesity_management_sdk.models.archival_external_target.ArchivalExternalTarget.from_dictionary(dictionary.get('target')) if dictionary.get('target') else None
-
-        # Return an object of this model
-        return cls(copy_partial,
-                   days_to_keep,
-                   multiplier,
-                   periodicity,
-                   target)
+        return decode_model(cls, dictionary)
 
 
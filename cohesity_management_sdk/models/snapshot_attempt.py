@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SnapshotAttempt(object):
 
@@ -28,6 +29,9 @@ class SnapshotAttempt(object):
         "started_time_usecs":'startedTimeUsecs'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  attempt_number=None,
                  job_run_id=None,
@@ -54,17 +58,6 @@ class SnapshotAttempt(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        attempt_number = dictionary.get('attemptNumber')
-        job_run_id = dictionary.get('jobRunId')
-        started_time_usecs = dictionary.get('startedTimeUsecs')
-
-        # Return an object of this model
-        return cls(attempt_number,
-                   job_run_id,
-                   started_time_usecs)
+        return decode_model(cls, dictionary)
 
 
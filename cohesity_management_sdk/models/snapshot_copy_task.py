@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.snapshot_target_settings
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SnapshotCopyTask(object):
 
@@ -30,6 +30,15 @@ class SnapshotCopyTask(object):
         "snapshot_target":'snapshotTarget'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "snapshot_target":'snapshot_target_settings.SnapshotTargetSettings'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  copy_status=None,
                  expiry_time_usecs=None,
@@ -58,19 +67,6 @@ class SnapshotCopyTask(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        copy_status = dictionary.get('copyStatus')
-        expiry_time_usecs = dictionary.get('expiryTimeUsecs')
-        message = dictionary.get('message')
-        snapshot_target = cohesity_management_sdk.models.snapshot_target_settings.SnapshotTargetSettings.from_dictionary(dictionary.get('snapshotTarget')) if dictionary.get('snapshotTarget') else None
-
-        # Return an object of this model
-        return cls(copy_status,
-                   expiry_time_usecs,
-                   message,
-                   snapshot_target)
+        return decode_model(cls, dictionary)
 
 
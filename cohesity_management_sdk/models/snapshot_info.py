@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SnapshotInfo(object):
 
@@ -63,6 +64,9 @@ class SnapshotInfo(object):
         "view_name":'viewName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  environment=None,
                  relative_snapshot_directory=None,
@@ -91,19 +95,6 @@ class SnapshotInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        environment = dictionary.get('environment')
-        relative_snapshot_directory = dictionary.get('relativeSnapshotDirectory')
-        root_path = dictionary.get('rootPath')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(environment,
-                   relative_snapshot_directory,
-                   root_path,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
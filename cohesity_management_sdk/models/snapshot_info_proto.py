@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.script_execution_status
-import cohesity_management_sdk.models.object_snapshot_type
-import cohesity_management_sdk.models.storage_snapshot_provider_params
-import cohesity_management_sdk.models.error_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SnapshotInfoProto(object):
 
@@ -162,6 +159,19 @@ class SnapshotInfoProto(object):
         "warnings":'warnings'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "post_backup_script_status":'script_execution_status.ScriptExecutionStatus',
+        "pre_backup_script_status":'script_execution_status.ScriptExecutionStatus',
+        "snapshot_type":'object_snapshot_type.ObjectSnapshotType',
+        "storage_snapshot_provider":'storage_snapshot_provider_params.StorageSnapshotProviderParams',
+        "warnings":['error_proto.ErrorProto']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error_rocksdb_name=None,
                  file_walk_done=None,
@@ -232,65 +242,6 @@ class SnapshotInfoProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error_rocksdb_name = dictionary.get('errorRocksdbName')
-        file_walk_done = dictionary.get('fileWalkDone')
-        num_app_instances = dictionary.get('numAppInstances')
-        num_app_objects = dictionary.get('numAppObjects')
-        post_backup_script_status = cohesity_management_sdk.models.script_execution_status.ScriptExecutionStatus.from_dictionary(dictionary.get('postBackupScriptStatus')) if dictionary.get('postBackupScriptStatus') else None
-        pre_backup_script_status = cohesity_management_sdk.models.script_execution_status.ScriptExecutionStatus.from_dictionary(dictionary.get('preBackupScriptStatus')) if dictionary.get('preBackupScriptStatus') else None
-        relative_snapshot_dir = dictionary.get('relativeSnapshotDir')
-        root_path = dictionary.get('rootPath')
-        scribe_table_column = dictionary.get('scribeTableColumn')
-        scribe_table_row = dictionary.get('scribeTableRow')
-        slave_task_start_time_usecs = dictionary.get('slaveTaskStartTimeUsecs')
-        snapshot_type = cohesity_management_sdk.models.object_snapshot_type.ObjectSnapshotType.from_dictionary(dictionary.get('snapshotType')) if dictionary.get('snapshotType') else None
-        storage_snapshot_provider = cohesity_management_sdk.models.storage_snapshot_provider_params.StorageSnapshotProviderParams.from_dictionary(dictionary.get('storageSnapshotProvider')) if dictionary.get('storageSnapshotProvider') else None
-        target_type = dictionary.get('targetType')
-        total_bytes_read_from_source = dictionary.get('totalBytesReadFromSource')
-        total_bytes_to_read_from_source = dictionary.get('totalBytesToReadFromSource')
-        total_changed_entity_count = dictionary.get('totalChangedEntityCount')
-        total_entity_count = dictionary.get('totalEntityCount')
-        total_logical_backup_size_bytes = dictionary.get('totalLogicalBackupSizeBytes')
-        total_primary_physical_size_bytes = dictionary.get('totalPrimaryPhysicalSizeBytes')
-        mtype = dictionary.get('type')
-        view_case_insensitivity_altered = dictionary.get('viewCaseInsensitivityAltered')
-        view_name = dictionary.get('viewName')
-        view_name_to_gc = dictionary.get('viewNameToGc')
-        warnings = None
-        if dictionary.get('warnings') != None:
-            warnings = list()
-            for structure in dictionary.get('warnings'):
-                warnings.append(cohesity_management_sdk.models.error_proto.ErrorProto.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(error_rocksdb_name,
-                   file_walk_done,
-                   num_app_instances,
-                   num_app_objects,
-                   post_backup_script_status,
-                   pre_backup_script_status,
-                   relative_snapshot_dir,
-                   root_path,
-                   scribe_table_column,
-                   scribe_table_row,
-                   slave_task_start_time_usecs,
-                   snapshot_type,
-                   storage_snapshot_provider,
-                   target_type,
-                   total_bytes_read_from_source,
-                   total_bytes_to_read_from_source,
-                   total_changed_entity_count,
-                   total_entity_count,
-                   total_logical_backup_size_bytes,
-                   total_primary_physical_size_bytes,
-                   mtype,
-                   view_case_insensitivity_altered,
-                   view_name,
-                   view_name_to_gc,
-                   warnings)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.aws_snapshot_manager_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SnapshotManagerParams(object):
 
@@ -20,6 +20,15 @@ class SnapshotManagerParams(object):
         "aws_snapshot_manager_params":'awsSnapshotManagerParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "aws_snapshot_manager_params":'aws_snapshot_manager_params.AWSSnapshotManagerParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  aws_snapshot_manager_params=None):
         """Constructor for the SnapshotManagerParams class"""
@@ -42,13 +51,6 @@ class SnapshotManagerParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        aws_snapshot_manager_params = cohesity_management_sdk.models.aws_snapshot_manager_params.AWSSnapshotManagerParams.from_dictionary(dictionary.get('awsSnapshotManagerParams')) if dictionary.get('awsSnapshotManagerParams') else None
-
-        # Return an object of this model
-        return cls(aws_snapshot_manager_params)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.cloud_deploy_target_details
-import cohesity_management_sdk.models.replication_target_settings
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SnapshotReplicationCopyPolicy(object):
 
@@ -60,6 +59,16 @@ class SnapshotReplicationCopyPolicy(object):
         "target":'target'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cloud_target":'cloud_deploy_target_details.CloudDeployTargetDetails',
+        "target":'replication_target_settings.ReplicationTargetSettings'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cloud_target=None,
                  copy_partial=None,
@@ -92,23 +101,6 @@ class SnapshotReplicationCopyPolicy(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cloud_target = cohesity_management_sdk.models.cloud_deploy_target_details.CloudDeployTargetDetails.from_dictionary(dictionary.get('cloudTarget')) if dictionary.get('cloudTarget') else None
-        copy_partial = dictionary.get('copyPartial')
-        days_to_keep = dictionary.get('daysToKeep')
-        multiplier = dictionary.get('multiplier')
-        periodicity = dictionary.get('periodicity')
-        target = cohesity_management_sdk.models.replication_target_settings.ReplicationTargetSettings.from_dictionary(dictionary.get('target')) if dictionary.get('target') else None
-
-        # Return an object of this model
-        return cls(cloud_target,
-                   copy_partial,
-                   days_to_keep,
-                   multiplier,
-                   periodicity,
-                   target)
+        return decode_model(cls, dictionary)
 
 
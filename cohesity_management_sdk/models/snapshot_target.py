@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.archival_target
-import cohesity_management_sdk.models.cloud_deploy_target
-import cohesity_management_sdk.models.replication_target
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SnapshotTarget(object):
 
@@ -34,6 +32,17 @@ class SnapshotTarget(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "archival_target":'archival_target.ArchivalTarget',
+        "cloud_deploy_target":'cloud_deploy_target.CloudDeployTarget',
+        "replication_target":'replication_target.ReplicationTarget'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  archival_target=None,
                  cloud_deploy_target=None,
@@ -62,19 +71,6 @@ class SnapshotTarget(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        archival_target = cohesity_management_sdk.models.archival_target.ArchivalTarget.from_dictionary(dictionary.get('archivalTarget')) if dictionary.get('archivalTarget') else None
-        cloud_deploy_target = cohesity_management_sdk.models.cloud_deploy_target.CloudDeployTarget.from_dictionary(dictionary.get('cloudDeployTarget')) if dictionary.get('cloudDeployTarget') else None
-        replication_target = cohesity_management_sdk.models.replication_target.ReplicationTarget.from_dictionary(dictionary.get('replicationTarget')) if dictionary.get('replicationTarget') else None
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(archival_target,
-                   cloud_deploy_target,
-                   replication_target,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
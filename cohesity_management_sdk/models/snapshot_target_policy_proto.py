@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.granularity_bucket
-import cohesity_management_sdk.models.retention_policy_proto
-import cohesity_management_sdk.models.snapshot_target
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SnapshotTargetPolicyProto(object):
 
@@ -45,6 +43,17 @@ class SnapshotTargetPolicyProto(object):
         "snapshot_target":'snapshotTarget'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "granularity_bucket":'granularity_bucket.GranularityBucket',
+        "retention_policy":'retention_policy_proto.RetentionPolicyProto',
+        "snapshot_target":'snapshot_target.SnapshotTarget'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  copy_partially_successful_run=None,
                  granularity_bucket=None,
@@ -75,21 +84,6 @@ class SnapshotTargetPolicyProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        copy_partially_successful_run = dictionary.get('copyPartiallySuccessfulRun')
-        granularity_bucket = cohesity_management_sdk.models.granularity_bucket.GranularityBucket.from_dictionary(dictionary.get('granularityBucket')) if dictionary.get('granularityBucket') else None
-        num_days_to_keep = dictionary.get('numDaysToKeep')
-        retention_policy = cohesity_management_sdk.models.retention_policy_proto.RetentionPolicyProto.from_dictionary(dictionary.get('retentionPolicy')) if dictionary.get('retentionPolicy') else None
-        snapshot_target = cohesity_management_sdk.models.snapshot_target.SnapshotTarget.from_dictionary(dictionary.get('snapshotTarget')) if dictionary.get('snapshotTarget') else None
-
-        # Return an object of this model
-        return cls(copy_partially_successful_run,
-                   granularity_bucket,
-                   num_days_to_keep,
-                   retention_policy,
-                   snapshot_target)
+        return decode_model(cls, dictionary)
 
 
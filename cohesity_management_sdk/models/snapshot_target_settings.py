@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.archival_external_target
-import cohesity_management_sdk.models.replication_target_settings
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SnapshotTargetSettings(object):
 
@@ -35,6 +34,16 @@ class SnapshotTargetSettings(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "archival_target":'archival_external_target.ArchivalExternalTarget',
+        "replication_target":'replication_target_settings.ReplicationTargetSettings'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  archival_target=None,
                  replication_target=None,
@@ -61,17 +70,6 @@ class SnapshotTargetSettings(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        archival_target = cohesity_management_sdk.models.archival_external_target.ArchivalExternalTarget.from_dictionary(dictionary.get('archivalTarget')) if dictionary.get('archivalTarget') else None
-        replication_target = cohesity_management_sdk.models.replication_target_settings.ReplicationTargetSettings.from_dictionary(dictionary.get('replicationTarget')) if dictionary.get('replicationTarget') else None
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(archival_target,
-                   replication_target,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SnapshotVersion(object):
 
@@ -62,6 +63,9 @@ class SnapshotVersion(object):
         "started_time_usecs":'startedTimeUsecs'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  attempt_number=None,
                  delta_size_bytes=None,
@@ -102,31 +106,6 @@ class SnapshotVersion(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        attempt_number = dictionary.get('attemptNumber')
-        delta_size_bytes = dictionary.get('deltaSizeBytes')
-        is_app_consistent = dictionary.get('isAppConsistent')
-        is_full_backup = dictionary.get('isFullBackup')
-        job_run_id = dictionary.get('jobRunId')
-        local_mount_path = dictionary.get('localMountPath')
-        logical_size_bytes = dictionary.get('logicalSizeBytes')
-        physical_size_bytes = dictionary.get('physicalSizeBytes')
-        primary_physical_size_bytes = dictionary.get('primaryPhysicalSizeBytes')
-        started_time_usecs = dictionary.get('startedTimeUsecs')
-
-        # Return an object of this model
-        return cls(attempt_number,
-                   delta_size_bytes,
-                   is_app_consistent,
-                   is_full_backup,
-                   job_run_id,
-                   local_mount_path,
-                   logical_size_bytes,
-                   physical_size_bytes,
-                   primary_physical_size_bytes,
-                   started_time_usecs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ms_exchange_params
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SourceAppParams(object):
 
@@ -25,6 +25,15 @@ class SourceAppParams(object):
         "ms_exchange_params":'msExchangeParams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ms_exchange_params":'ms_exchange_params.MSExchangeParams'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  is_vss_copy_only=None,
                  ms_exchange_params=None):
@@ -49,15 +58,6 @@ class SourceAppParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        is_vss_copy_only = dictionary.get('isVssCopyOnly')
-        ms_exchange_params = cohesity_management_sdk.models.ms_exchange_params.MSExchangeParams.from_dictionary(dictionary.get('msExchangeParams')) if dictionary.get('msExchangeParams') else None
-
-        # Return an object of this model
-        return cls(is_vss_copy_only,
-                   ms_exchange_params)
+        return decode_model(cls, dictionary)
 
 
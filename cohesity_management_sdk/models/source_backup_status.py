@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.snapshot_info
-import cohesity_management_sdk.models.protection_source
-import cohesity_management_sdk.models.backup_source_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SourceBackupStatus(object):
 
@@ -75,6 +73,17 @@ class SourceBackupStatus(object):
         "warnings":'warnings'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "current_snapshot_info":'snapshot_info.SnapshotInfo',
+        "source":'protection_source.ProtectionSource',
+        "stats":'backup_source_stats.BackupSourceStats'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  current_snapshot_info=None,
                  error=None,
@@ -119,35 +128,6 @@ class SourceBackupStatus(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        current_snapshot_info = cohesity_management_sdk.models.snapshot_info.SnapshotInfo.from_dictionary(dictionary.get('currentSnapshotInfo')) if dictionary.get('currentSnapshotInfo') else None
-        error = dictionary.get('error')
-        is_full_backup = dictionary.get('isFullBackup')
-        num_restarts = dictionary.get('numRestarts')
-        parent_source_id = dictionary.get('parentSourceId')
-        progress_monitor_task_path = dictionary.get('progressMonitorTaskPath')
-        quiesced = dictionary.get('quiesced')
-        sla_violated = dictionary.get('slaViolated')
-        source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('source')) if dictionary.get('source') else None
-        stats = cohesity_management_sdk.models.backup_source_stats.BackupSourceStats.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-        status = dictionary.get('status')
-        warnings = dictionary.get('warnings')
-
-        # Return an object of this model
-        return cls(current_snapshot_info,
-                   error,
-                   is_full_backup,
-                   num_restarts,
-                   parent_source_id,
-                   progress_monitor_task_path,
-                   quiesced,
-                   sla_violated,
-                   source,
-                   stats,
-                   status,
-                   warnings)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SourceForPrincipalParam(object):
 
@@ -29,6 +30,9 @@ class SourceForPrincipalParam(object):
         "view_names":'viewNames'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  protection_source_ids=None,
                  sid=None,
@@ -55,17 +59,6 @@ class SourceForPrincipalParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        protection_source_ids = dictionary.get('protectionSourceIds')
-        sid = dictionary.get('sid')
-        view_names = dictionary.get('viewNames')
-
-        # Return an object of this model
-        return cls(protection_source_ids,
-                   sid,
-                   view_names)
+        return decode_model(cls, dictionary)
 
 
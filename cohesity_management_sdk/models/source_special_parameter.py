@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.application_special_parameters
-import cohesity_management_sdk.models.oracle_special_parameters
-import cohesity_management_sdk.models.physical_special_parameters
-import cohesity_management_sdk.models.credentials
-import cohesity_management_sdk.models.vmware_special_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SourceSpecialParameter(object):
 
@@ -64,6 +60,20 @@ class SourceSpecialParameter(object):
         "vmware_special_parameters":'vmwareSpecialParameters'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ad_special_parameters":'application_special_parameters.ApplicationSpecialParameters',
+        "oracle_special_parameters":'oracle_special_parameters.OracleSpecialParameters',
+        "physical_special_parameters":'physical_special_parameters.PhysicalSpecialParameters',
+        "sql_special_parameters":'application_special_parameters.ApplicationSpecialParameters',
+        "vm_credentials":'credentials.Credentials',
+        "vmware_special_parameters":'vmware_special_parameters.VmwareSpecialParameters'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_special_parameters=None,
                  oracle_special_parameters=None,
@@ -102,29 +112,6 @@ class SourceSpecialParameter(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_special_parameters = cohesity_management_sdk.models.application_special_parameters.ApplicationSpecialParameters.from_dictionary(dictionary.get('adSpecialParameters')) if dictionary.get('adSpecialParameters') else None
-        oracle_special_parameters = cohesity_management_sdk.models.oracle_special_parameters.OracleSpecialParameters.from_dictionary(dictionary.get('oracleSpecialParameters')) if dictionary.get('oracleSpecialParameters') else None
-        physical_special_parameters = cohesity_management_sdk.models.physical_special_parameters.PhysicalSpecialParameters.from_dictionary(dictionary.get('physicalSpecialParameters')) if dictionary.get('physicalSpecialParameters') else None
-        skip_indexing = dictionary.get('skipIndexing')
-        source_id = dictionary.get('sourceId')
-        sql_special_parameters = cohesity_management_sdk.models.application_special_parameters.ApplicationSpecialParameters.from_dictionary(dictionary.get('sqlSpecialParameters')) if dictionary.get('sqlSpecialParameters') else None
-        truncate_exchange_log = dictionary.get('truncateExchangeLog')
-        vm_credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('vmCredentials')) if dictionary.get('vmCredentials') else None
-        vmware_special_parameters = cohesity_management_sdk.models.vmware_special_parameters.VmwareSpecialParameters.from_dictionary(dictionary.get('vmwareSpecialParameters')) if dictionary.get('vmwareSpecialParameters') else None
-
-        # Return an object of this model
-        return cls(ad_special_parameters,
-                   oracle_special_parameters,
-                   physical_special_parameters,
-                   skip_indexing,
-                   source_id,
-                   sql_special_parameters,
-                   truncate_exchange_log,
-                   vm_credentials,
-                   vmware_special_parameters)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_source
-import cohesity_management_sdk.models.view
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SourcesForSid(object):
 
@@ -31,6 +30,16 @@ class SourcesForSid(object):
         "views":'views'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "protection_sources":['protection_source.ProtectionSource'],
+        "views":['view.View']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  protection_sources=None,
                  sid=None,
@@ -57,25 +66,6 @@ class SourcesForSid(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        protection_sources = None
-        if dictionary.get('protectionSources') != None:
-            protection_sources = list()
-            for structure in dictionary.get('protectionSources'):
-                protection_sources.append(cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(structure))
-        sid = dictionary.get('sid')
-        views = None
-        if dictionary.get('views') != None:
-            views = list()
-            for structure in dictionary.get('views'):
-                views.append(cohesity_management_sdk.models.view.View.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(protection_sources,
-                   sid,
-                   views)
+        return decode_model(cls, dictionary)
 
 
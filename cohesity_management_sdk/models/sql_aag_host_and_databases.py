@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.aag_and_databases
-import cohesity_management_sdk.models.protection_source_node
-import cohesity_management_sdk.models.protection_source
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SqlAagHostAndDatabases(object):
 
@@ -36,6 +34,17 @@ class SqlAagHostAndDatabases(object):
         "unknown_host_name":'unknownHostName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "aag_databases":['aag_and_databases.AagAndDatabases'],
+        "application_node":'protection_source_node.ProtectionSourceNode',
+        "databases":['protection_source.ProtectionSource']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  aag_databases=None,
                  application_node=None,
@@ -66,29 +75,6 @@ class SqlAagHostAndDatabases(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        aag_databases = None
-        if dictionary.get('aagDatabases') != None:
-            aag_databases = list()
-            for structure in dictionary.get('aagDatabases'):
-                aag_databases.append(cohesity_management_sdk.models.aag_and_databases.AagAndDatabases.from_dictionary(structure))
-        application_node = cohesity_management_sdk.models.protection_source_node.ProtectionSourceNode.from_dictionary(dictionary.get('applicationNode')) if dictionary.get('applicationNode') else None
-        databases = None
-        if dictionary.get('databases') != None:
-            databases = list()
-            for structure in dictionary.get('databases'):
-                databases.append(cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(structure))
-        error_message = dictionary.get('errorMessage')
-        unknown_host_name = dictionary.get('unknownHostName')
-
-        # Return an object of this model
-        return cls(aag_databases,
-                   application_node,
-                   databases,
-                   error_message,
-                   unknown_host_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SqlBackupJobParams(object):
 
@@ -42,6 +43,9 @@ class SqlBackupJobParams(object):
         "user_db_preference_type":'userDbPreferenceType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  aag_backup_preference_type=None,
                  backup_database_volumes_only=None,
@@ -76,25 +80,6 @@ class SqlBackupJobParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        aag_backup_preference_type = dictionary.get('aagBackupPreferenceType')
-        backup_database_volumes_only = dictionary.get('backupDatabaseVolumesOnly')
-        backup_system_dbs = dictionary.get('backupSystemDbs')
-        full_backup_type = dictionary.get('fullBackupType')
-        is_copy_only_full = dictionary.get('isCopyOnlyFull')
-        use_aag_preferences_from_sql_server = dictionary.get('useAagPreferencesFromSqlServer')
-        user_db_preference_type = dictionary.get('userDbPreferenceType')
-
-        # Return an object of this model
-        return cls(aag_backup_preference_type,
-                   backup_database_volumes_only,
-                   backup_system_dbs,
-                   full_backup_type,
-                   is_copy_only_full,
-                   use_aag_preferences_from_sql_server,
-                   user_db_preference_type)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SqlEnvJobParameters(object):
 
@@ -60,6 +61,9 @@ class SqlEnvJobParameters(object):
         "user_database_preference":'userDatabasePreference'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  aag_preference=None,
                  aag_preference_from_sql_server=None,
@@ -94,25 +98,6 @@ class SqlEnvJobParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        aag_preference = dictionary.get('aagPreference')
-        aag_preference_from_sql_server = dictionary.get('aagPreferenceFromSqlServer')
-        backup_system_databases = dictionary.get('backupSystemDatabases')
-        backup_type = dictionary.get('backupType')
-        backup_volumes_only = dictionary.get('backupVolumesOnly')
-        is_copy_only_full = dictionary.get('isCopyOnlyFull')
-        user_database_preference = dictionary.get('userDatabasePreference')
-
-        # Return an object of this model
-        return cls(aag_preference,
-                   aag_preference_from_sql_server,
-                   backup_system_databases,
-                   backup_type,
-                   backup_volumes_only,
-                   is_copy_only_full,
-                   user_database_preference)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.db_file_info
-import cohesity_management_sdk.models.sql_source_id
-import cohesity_management_sdk.models.sql_server_instance_version
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SqlProtectionSource(object):
 
@@ -98,6 +96,17 @@ class SqlProtectionSource(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "db_files":['db_file_info.DbFileInfo'],
+        "id":'sql_source_id.SqlSourceId',
+        "sql_server_instance_version":'sql_server_instance_version.SQLServerInstanceVersion'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  is_available_for_vss_backup=None,
                  created_timestamp=None,
@@ -150,47 +159,6 @@ class SqlProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        is_available_for_vss_backup = dictionary.get('IsAvailableForVssBackup')
-        created_timestamp = dictionary.get('createdTimestamp')
-        database_name = dictionary.get('databaseName')
-        db_aag_entity_id = dictionary.get('dbAagEntityId')
-        db_aag_name = dictionary.get('dbAagName')
-        db_compatibility_level = dictionary.get('dbCompatibilityLevel')
-        db_file_groups = dictionary.get('dbFileGroups')
-        db_files = None
-        if dictionary.get('dbFiles') != None:
-            db_files = list()
-            for structure in dictionary.get('dbFiles'):
-                db_files.append(cohesity_management_sdk.models.db_file_info.DbFileInfo.from_dictionary(structure))
-        db_owner_username = dictionary.get('dbOwnerUsername')
-        id = cohesity_management_sdk.models.sql_source_id.SqlSourceId.from_dictionary(dictionary.get('id')) if dictionary.get('id') else None
-        name = dictionary.get('name')
-        owner_id = dictionary.get('ownerId')
-        recovery_model = dictionary.get('recoveryModel')
-        sql_server_db_state = dictionary.get('sqlServerDbState')
-        sql_server_instance_version = cohesity_management_sdk.models.sql_server_instance_version.SQLServerInstanceVersion.from_dictionary(dictionary.get('sqlServerInstanceVersion')) if dictionary.get('sqlServerInstanceVersion') else None
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(is_available_for_vss_backup,
-                   created_timestamp,
-                   database_name,
-                   db_aag_entity_id,
-                   db_aag_name,
-                   db_compatibility_level,
-                   db_file_groups,
-                   db_files,
-                   db_owner_username,
-                   id,
-                   name,
-                   owner_id,
-                   recovery_model,
-                   sql_server_db_state,
-                   sql_server_instance_version,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.filename_pattern_to_directory
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SqlRestoreParameters(object):
 
@@ -58,6 +58,15 @@ class SqlRestoreParameters(object):
         "target_secondary_data_files_directory_list":'targetSecondaryDataFilesDirectoryList'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "target_secondary_data_files_directory_list":['filename_pattern_to_directory.FilenamePatternToDirectory']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  capture_tail_logs=None,
                  keep_offline=None,
@@ -94,31 +103,6 @@ class SqlRestoreParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        capture_tail_logs = dictionary.get('captureTailLogs')
-        keep_offline = dictionary.get('keepOffline')
-        new_database_name = dictionary.get('newDatabaseName')
-        new_instance_name = dictionary.get('newInstanceName')
-        restore_time_secs = dictionary.get('restoreTimeSecs')
-        target_data_files_directory = dictionary.get('targetDataFilesDirectory')
-        target_log_files_directory = dictionary.get('targetLogFilesDirectory')
-        target_secondary_data_files_directory_list = None
-        if dictionary.get('targetSecondaryDataFilesDirectoryList') != None:
-            target_secondary_data_files_directory_list = list()
-            for structure in dictionary.get('targetSecondaryDataFilesDirectoryList'):
-                target_secondary_data_files_directory_list.append(cohesity_management_sdk.models.filename_pattern_to_directory.FilenamePatternToDirectory.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(capture_tail_logs,
-                   keep_offline,
-                   new_database_name,
-                   new_instance_name,
-                   restore_time_secs,
-                   target_data_files_directory,
-                   target_log_files_directory,
-                   target_secondary_data_files_directory_list)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SQLServerInstanceVersion(object):
 
@@ -26,6 +27,9 @@ class SQLServerInstanceVersion(object):
         "version_string":'versionString'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  build=None,
                  major_version=None,
@@ -56,21 +60,6 @@ class SQLServerInstanceVersion(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        build = dictionary.get('build')
-        major_version = dictionary.get('majorVersion')
-        minor_version = dictionary.get('minorVersion')
-        revision = dictionary.get('revision')
-        version_string = dictionary.get('versionString')
-
-        # Return an object of this model
-        return cls(build,
-                   major_version,
-                   minor_version,
-                   revision,
-                   version_string)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SqlSourceId(object):
 
@@ -30,6 +31,9 @@ class SqlSourceId(object):
         "instance_id":'instanceId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  created_date_msecs=None,
                  database_id=None,
@@ -56,17 +60,6 @@ class SqlSourceId(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        created_date_msecs = dictionary.get('createdDateMsecs')
-        database_id = dictionary.get('databaseId')
-        instance_id = dictionary.get('instanceId')
-
-        # Return an object of this model
-        return cls(created_date_msecs,
-                   database_id,
-                   instance_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SqlUpdateRestoreTaskOptions(object):
 
@@ -19,6 +20,9 @@ class SqlUpdateRestoreTaskOptions(object):
         "multi_stage_restore_action":'multiStageRestoreAction'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  multi_stage_restore_action=None):
         """Constructor for the SqlUpdateRestoreTaskOptions class"""
@@ -41,13 +45,6 @@ class SqlUpdateRestoreTaskOptions(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        multi_stage_restore_action = dictionary.get('multiStageRestoreAction')
-
-        # Return an object of this model
-        return cls(multi_stage_restore_action)
+        return decode_model(cls, dictionary)
 
 
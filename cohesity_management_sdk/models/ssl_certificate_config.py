@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SslCertificateConfig(object):
 
@@ -27,6 +28,9 @@ class SslCertificateConfig(object):
         "private_key":'privateKey'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  certificate=None,
                  last_update_time_msecs=None,
@@ -53,17 +57,6 @@ class SslCertificateConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        certificate = dictionary.get('certificate')
-        last_update_time_msecs = dictionary.get('lastUpdateTimeMsecs')
-        private_key = dictionary.get('privateKey')
-
-        # Return an object of this model
-        return cls(certificate,
-                   last_update_time_msecs,
-                   private_key)
+        return decode_model(cls, dictionary)
 
 
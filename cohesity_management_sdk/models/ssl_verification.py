@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SslVerification(object):
 
@@ -21,6 +22,9 @@ class SslVerification(object):
         "is_enabled":'isEnabled'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ca_certificate=None,
                  is_enabled=None):
@@ -45,15 +49,6 @@ class SslVerification(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ca_certificate = dictionary.get('caCertificate')
-        is_enabled = dictionary.get('isEnabled')
-
-        # Return an object of this model
-        return cls(ca_certificate,
-                   is_enabled)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.subnet
+from cohesity_management_sdk.model_decoder import decode_model
 
 class StaticRoute(object):
 
@@ -38,6 +38,15 @@ class StaticRoute(object):
         "vlan_id":'vlanId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "subnet":'subnet.Subnet'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  description=None,
                  is_update=None,
@@ -70,23 +79,6 @@ class StaticRoute(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        description = dictionary.get('description')
-        is_update = dictionary.get('isUpdate')
-        network_interface_group = dictionary.get('networkInterfaceGroup')
-        network_interface_ids = dictionary.get('networkInterfaceIds')
-        subnet = cohesity_management_sdk.models.subnet.Subnet.from_dictionary(dictionary.get('subnet')) if dictionary.get('subnet') else None
-        vlan_id = dictionary.get('vlanId')
-
-        # Return an object of this model
-        return cls(description,
-                   is_update,
-                   network_interface_group,
-                   network_interface_ids,
-                   subnet,
-                   vlan_id)
+        return decode_model(cls, dictionary)
 
 
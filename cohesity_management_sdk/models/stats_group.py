@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.consumer
+from cohesity_management_sdk.model_decoder import decode_model
 
 class StatsGroup(object):
 
@@ -40,6 +40,15 @@ class StatsGroup(object):
         "view_box_name":'viewBoxName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "consumer":'consumer.Consumer'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  consumer=None,
                  entity_id=None,
@@ -76,27 +85,6 @@ class StatsGroup(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        consumer = cohesity_management_sdk.models.consumer.Consumer.from_dictionary(dictionary.get('consumer')) if dictionary.get('consumer') else None
-        entity_id = dictionary.get('entityId')
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        tenant_id = dictionary.get('tenantId')
-        tenant_name = dictionary.get('tenantName')
-        view_box_id = dictionary.get('viewBoxId')
-        view_box_name = dictionary.get('viewBoxName')
-
-        # Return an object of this model
-        return cls(consumer,
-                   entity_id,
-                   id,
-                   name,
-                   tenant_id,
-                   tenant_name,
-                   view_box_id,
-                   view_box_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class StopRemoteVaultSearchJobParameters(object):
 
@@ -20,6 +20,15 @@ class StopRemoteVaultSearchJobParameters(object):
         "search_job_uid":'searchJobUid'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "search_job_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  search_job_uid=None):
         """Constructor for the StopRemoteVaultSearchJobParameters class"""
@@ -42,13 +51,6 @@ class StopRemoteVaultSearchJobParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        search_job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('searchJobUid')) if dictionary.get('searchJobUid') else None
-
-        # Return an object of this model
-        return cls(search_job_uid)
+        return decode_model(cls, dictionary)
 
 
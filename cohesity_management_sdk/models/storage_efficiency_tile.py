@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.sample
+from cohesity_management_sdk.model_decoder import decode_model
 
 class StorageEfficiencyTile(object):
 
@@ -66,6 +66,20 @@ class StorageEfficiencyTile(object):
         "storage_reduction_samples":'storageReductionSamples'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "data_in_bytes_samples":['sample.Sample'],
+        "data_in_deduped_bytes_samples":['sample.Sample'],
+        "dedupe_ratio_samples":['sample.Sample'],
+        "logical_used_bytes_samples":['sample.Sample'],
+        "physical_used_bytes_samples":['sample.Sample'],
+        "storage_reduction_samples":['sample.Sample']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data_in_bytes=None,
                  data_in_bytes_samples=None,
@@ -114,63 +128,6 @@ class StorageEfficiencyTile(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data_in_bytes = dictionary.get('dataInBytes')
-        data_in_bytes_samples = None
-        if dictionary.get('dataInBytesSamples') != None:
-            data_in_bytes_samples = list()
-            for structure in dictionary.get('dataInBytesSamples'):
-                data_in_bytes_samples.append(cohesity_management_sdk.models.sample.Sample.from_dictionary(structure))
-        data_in_deduped_bytes = dictionary.get('dataInDedupedBytes')
-        data_in_deduped_bytes_samples = None
-        if dictionary.get('dataInDedupedBytesSamples') != None:
-            data_in_deduped_bytes_samples = list()
-            for structure in dictionary.get('dataInDedupedBytesSamples'):
-                data_in_deduped_bytes_samples.append(cohesity_management_sdk.models.sample.Sample.from_dictionary(structure))
-        dedupe_ratio = dictionary.get('dedupeRatio')
-        dedupe_ratio_samples = None
-        if dictionary.get('dedupeRatioSamples') != None:
-            dedupe_ratio_samples = list()
-            for structure in dictionary.get('dedupeRatioSamples'):
-                dedupe_ratio_samples.append(cohesity_management_sdk.models.sample.Sample.from_dictionary(structure))
-        duration_days = dictionary.get('durationDays')
-        interval_seconds = dictionary.get('intervalSeconds')
-        logical_used_bytes = dictionary.get('logicalUsedBytes')
-        logical_used_bytes_samples = None
-        if dictionary.get('logicalUsedBytesSamples') != None:
-            logical_used_bytes_samples = list()
-            for structure in dictionary.get('logicalUsedBytesSamples'):
-                logical_used_bytes_samples.append(cohesity_management_sdk.models.sample.Sample.from_dictionary(structure))
-        physical_used_bytes = dictionary.get('physicalUsedBytes')
-        physical_used_bytes_samples = None
-        if dictionary.get('physicalUsedBytesSamples') != None:
-            physical_used_bytes_samples = list()
-            for structure in dictionary.get('physicalUsedBytesSamples'):
-                physical_used_bytes_samples.append(cohesity_management_sdk.models.sample.Sample.from_dictionary(structure))
-        storage_reduction_ratio = dictionary.get('storageReductionRatio')
-        storage_reduction_samples = None
-        if dictionary.get('storageReductionSamples') != None:
-            storage_reduction_samples = list()
-            for structure in dictionary.get('storageReductionSamples'):
-                storage_reduction_samples.append(cohesity_management_sdk.models.sample.Sample.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(data_in_bytes,
-                   data_in_bytes_samples,
-                   data_in_deduped_bytes,
-                   data_in_deduped_bytes_samples,
-                   dedupe_ratio,
-                   dedupe_ratio_samples,
-                   duration_days,
-                   interval_seconds,
-                   logical_used_bytes,
-                   logical_used_bytes_samples,
-                   physical_used_bytes,
-                   physical_used_bytes_samples,
-                   storage_reduction_ratio,
-                   storage_reduction_samples)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.erasure_coding_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class StoragePolicy(object):
 
@@ -78,6 +78,15 @@ class StoragePolicy(object):
         "num_node_failures_tolerated":'numNodeFailuresTolerated'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "erasure_coding_info":'erasure_coding_info.ErasureCodingInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  app_marker_detection=None,
                  cloud_spill_vault_id=None,
@@ -120,33 +129,6 @@ class StoragePolicy(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        app_marker_detection = dictionary.get('appMarkerDetection')
-        cloud_spill_vault_id = dictionary.get('cloudSpillVaultId')
-        compression_policy = dictionary.get('compressionPolicy')
-        deduplicate_compress_delay_secs = dictionary.get('deduplicateCompressDelaySecs')
-        deduplication_enabled = dictionary.get('deduplicationEnabled')
-        encryption_policy = dictionary.get('encryptionPolicy')
-        erasure_coding_info = cohesity_management_sdk.models.erasure_coding_info.ErasureCodingInfo.from_dictionary(dictionary.get('erasureCodingInfo')) if dictionary.get('erasureCodingInfo') else None
-        inline_compress = dictionary.get('inlineCompress')
-        inline_deduplicate = dictionary.get('inlineDeduplicate')
-        num_failures_tolerated = dictionary.get('numFailuresTolerated')
-        num_node_failures_tolerated = dictionary.get('numNodeFailuresTolerated')
-
-        # Return an object of this model
-        return cls(app_marker_detection,
-                   cloud_spill_vault_id,
-                   compression_policy,
-                   deduplicate_compress_delay_secs,
-                   deduplication_enabled,
-                   encryption_policy,
-                   erasure_coding_info,
-                   inline_compress,
-                   inline_deduplicate,
-                   num_failures_tolerated,
-                   num_node_failures_tolerated)
+        return decode_model(cls, dictionary)
 
 
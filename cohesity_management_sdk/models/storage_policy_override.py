@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class StoragePolicyOverride(object):
 
@@ -24,6 +25,9 @@ class StoragePolicyOverride(object):
         "disable_inline_dedup_and_compression":'disableInlineDedupAndCompression'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disable_inline_dedup_and_compression=None):
         """Constructor for the StoragePolicyOverride class"""
@@ -46,13 +50,6 @@ class StoragePolicyOverride(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disable_inline_dedup_and_compression = dictionary.get('disableInlineDedupAndCompression')
-
-        # Return an object of this model
-        return cls(disable_inline_dedup_and_compression)
+        return decode_model(cls, dictionary)
 
 
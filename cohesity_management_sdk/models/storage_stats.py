@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class StorageStats(object):
 
@@ -37,6 +38,9 @@ class StorageStats(object):
         "total_capacity_bytes":'totalCapacityBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data_protection_logical_usage_bytes=None,
                  data_protection_physical_usage_bytes=None,
@@ -71,25 +75,6 @@ class StorageStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data_protection_logical_usage_bytes = dictionary.get('dataProtectionLogicalUsageBytes')
-        data_protection_physical_usage_bytes = dictionary.get('dataProtectionPhysicalUsageBytes')
-        file_services_logical_usage_bytes = dictionary.get('fileServicesLogicalUsageBytes')
-        file_services_physical_usage_bytes = dictionary.get('fileServicesPhysicalUsageBytes')
-        local_available_bytes = dictionary.get('localAvailableBytes')
-        local_usage_bytes = dictionary.get('localUsageBytes')
-        total_capacity_bytes = dictionary.get('totalCapacityBytes')
-
-        # Return an object of this model
-        return cls(data_protection_logical_usage_bytes,
-                   data_protection_physical_usage_bytes,
-                   file_services_logical_usage_bytes,
-                   file_services_physical_usage_bytes,
-                   local_available_bytes,
-                   local_usage_bytes,
-                   total_capacity_bytes)
+        return decode_model(cls, dictionary)
 
 
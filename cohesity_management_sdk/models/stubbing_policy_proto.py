@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.retention_policy_proto
-import cohesity_management_sdk.models.scheduling_policy_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class StubbingPolicyProto(object):
 
@@ -25,6 +24,16 @@ class StubbingPolicyProto(object):
         "scheduling_policy":'schedulingPolicy'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "retention_policy":'retention_policy_proto.RetentionPolicyProto',
+        "scheduling_policy":'scheduling_policy_proto.SchedulingPolicyProto'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  retention_policy=None,
                  scheduling_policy=None):
@@ -49,15 +58,6 @@ class StubbingPolicyProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        retention_policy = cohesity_management_sdk.models.retention_policy_proto.RetentionPolicyProto.from_dictionary(dictionary.get('retentionPolicy')) if dictionary.get('retentionPolicy') else None
-        scheduling_policy = cohesity_management_sdk.models.scheduling_policy_proto.SchedulingPolicyProto.from_dictionary(dictionary.get('schedulingPolicy')) if dictionary.get('schedulingPolicy') else None
-
-        # Return an object of this model
-        return cls(retention_policy,
-                   scheduling_policy)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Subnet(object):
 
@@ -48,6 +49,9 @@ class Subnet(object):
         "smb_access":'smbAccess'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  component=None,
                  description=None,
@@ -86,29 +90,6 @@ class Subnet(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        component = dictionary.get('component')
-        description = dictionary.get('description')
-        id = dictionary.get('id')
-        ip = dictionary.get('ip')
-        netmask_bits = dictionary.get('netmaskBits')
-        netmask_ip_4 = dictionary.get('netmaskIp4')
-        nfs_access = dictionary.get('nfsAccess')
-        nfs_root_squash = dictionary.get('nfsRootSquash')
-        smb_access = dictionary.get('smbAccess')
-
-        # Return an object of this model
-        return cls(component,
-                   description,
-                   id,
-                   ip,
-                   netmask_bits,
-                   netmask_ip_4,
-                   nfs_access,
-                   nfs_root_squash,
-                   smb_access)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SupportedConfig(object):
 
@@ -30,6 +31,9 @@ class SupportedConfig(object):
         "supported_erasure_coding":'supportedErasureCoding'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  min_nodes_allowed=None,
                  supported_erasure_coding=None):
@@ -54,15 +58,6 @@ class SupportedConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        min_nodes_allowed = dictionary.get('minNodesAllowed')
-        supported_erasure_coding = dictionary.get('supportedErasureCoding')
-
-        # Return an object of this model
-        return cls(min_nodes_allowed,
-                   supported_erasure_coding)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class SyslogServer(object):
 
@@ -42,6 +43,9 @@ class SyslogServer(object):
         "name":'name'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  address=None,
                  port=None,
@@ -74,23 +78,6 @@ class SyslogServer(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        address = dictionary.get('address')
-        port = dictionary.get('port')
-        protocol = dictionary.get('protocol')
-        is_cluster_auditing_enabled = dictionary.get('isClusterAuditingEnabled')
-        is_filer_auditing_enabled = dictionary.get('isFilerAuditingEnabled')
-        name = dictionary.get('name')
-
-        # Return an object of this model
-        return cls(address,
-                   port,
-                   protocol,
-                   is_cluster_auditing_enabled,
-                   is_filer_auditing_enabled,
-                   name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TapeMediaInformation(object):
 
@@ -26,6 +27,9 @@ class TapeMediaInformation(object):
         "online":'online'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  barcode=None,
                  location=None,
@@ -52,17 +56,6 @@ class TapeMediaInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        barcode = dictionary.get('barcode')
-        location = dictionary.get('location')
-        online = dictionary.get('online')
-
-        # Return an object of this model
-        return cls(barcode,
-                   location,
-                   online)
+        return decode_model(cls, dictionary)
 
 
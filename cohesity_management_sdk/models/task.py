@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.task_attribute
-import cohesity_management_sdk.models.task_event
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Task(object):
 
@@ -63,6 +62,16 @@ class Task(object):
         "task_path":'taskPath'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "attributes":['task_attribute.TaskAttribute'],
+        "events":['task_event.TaskEvent']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  attributes=None,
                  end_time_seconds=None,
@@ -109,45 +118,6 @@ class Task(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        attributes = None
-        if dictionary.get('attributes') != None:
-            attributes = list()
-            for structure in dictionary.get('attributes'):
-                attributes.append(cohesity_management_sdk.models.task_attribute.TaskAttribute.from_dictionary(structure))
-        end_time_seconds = dictionary.get('endTimeSeconds')
-        error_message = dictionary.get('errorMessage')
-        events = None
-        if dictionary.get('events') != None:
-            events = list()
-            for structure in dictionary.get('events'):
-                events.append(cohesity_management_sdk.models.task_event.TaskEvent.from_dictionary(structure))
-        expected_end_time_seconds = dictionary.get('expectedEndTimeSeconds')
-        expected_seconds_remaining = dictionary.get('expectedSecondsRemaining')
-        expected_total_work_count = dictionary.get('expectedTotalWorkCount')
-        last_update_time_seconds = dictionary.get('lastUpdateTimeSeconds')
-        percent_finished = dictionary.get('percentFinished')
-        start_time_seconds = dictionary.get('startTimeSeconds')
-        status = dictionary.get('status')
-        sub_tasks = dictionary.get('subTasks')
-        task_path = dictionary.get('taskPath')
-
-        # Return an object of this model
-        return cls(attributes,
-                   end_time_seconds,
-                   error_message,
-                   events,
-                   expected_end_time_seconds,
-                   expected_seconds_remaining,
-                   expected_total_work_count,
-                   last_update_time_seconds,
-                   percent_finished,
-                   start_time_seconds,
-                   status,
-                   sub_tasks,
-                   task_path)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TaskAttribute(object):
 
@@ -29,6 +30,9 @@ class TaskAttribute(object):
         "value_type":'valueType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  name=None,
                  value=None,
@@ -55,17 +59,6 @@ class TaskAttribute(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        name = dictionary.get('name')
-        value = dictionary.get('value')
-        value_type = dictionary.get('valueType')
-
-        # Return an object of this model
-        return cls(name,
-                   value,
-                   value_type)
+        return decode_model(cls, dictionary)
 
 
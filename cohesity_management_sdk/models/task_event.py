@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TaskEvent(object):
 
@@ -28,6 +29,9 @@ class TaskEvent(object):
         "timestamp_seconds":'timestampSeconds'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  event_message=None,
                  percent_finished=None,
@@ -56,19 +60,6 @@ class TaskEvent(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        event_message = dictionary.get('eventMessage')
-        percent_finished = dictionary.get('percentFinished')
-        remaining_work_count = dictionary.get('remainingWorkCount')
-        timestamp_seconds = dictionary.get('timestampSeconds')
-
-        # Return an object of this model
-        return cls(event_message,
-                   percent_finished,
-                   remaining_work_count,
-                   timestamp_seconds)
+        return decode_model(cls, dictionary)
 
 
@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.backup_task_info
-import cohesity_management_sdk.models.clone_task_info
-import cohesity_management_sdk.models.basic_task_info
-import cohesity_management_sdk.models.recovery_task_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TaskNotification(object):
 
@@ -63,6 +60,18 @@ class TaskNotification(object):
         "visited_time_secs":'visitedTimeSecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "backup_task":'backup_task_info.BackupTaskInfo',
+        "clone_task":'clone_task_info.CloneTaskInfo',
+        "field_message_task":'basic_task_info.BasicTaskInfo',
+        "recovery_task":'recovery_task_info.RecoveryTaskInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  backup_task=None,
                  clone_task=None,
@@ -109,37 +118,6 @@ class TaskNotification(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        backup_task = cohesity_management_sdk.models.backup_task_info.BackupTaskInfo.from_dictionary(dictionary.get('backupTask')) if dictionary.get('backupTask') else None
-        clone_task = cohesity_management_sdk.models.clone_task_info.CloneTaskInfo.from_dictionary(dictionary.get('cloneTask')) if dictionary.get('cloneTask') else None
-        created_time_secs = dictionary.get('createdTimeSecs')
-        description = dictionary.get('description')
-        dismissed = dictionary.get('dismissed')
-        dismissed_time_secs = dictionary.get('dismissedTimeSecs')
-        field_message_task = cohesity_management_sdk.models.basic_task_info.BasicTaskInfo.from_dictionary(dictionary.get('fieldMessageTask')) if dictionary.get('fieldMessageTask') else None
-        id = dictionary.get('id')
-        recovery_task = cohesity_management_sdk.models.recovery_task_info.RecoveryTaskInfo.from_dictionary(dictionary.get('recoveryTask')) if dictionary.get('recoveryTask') else None
-        status = dictionary.get('status')
-        task_type = dictionary.get('taskType')
-        visited = dictionary.get('visited')
-        visited_time_secs = dictionary.get('visitedTimeSecs')
-
-        # Return an object of this model
-        return cls(backup_task,
-                   clone_task,
-                   created_time_secs,
-                   description,
-                   dismissed,
-                   dismissed_time_secs,
-                   field_message_task,
-                   id,
-                   recovery_task,
-                   status,
-                   task_type,
-                   visited,
-                   visited_time_secs)
+        return decode_model(cls, dictionary)
 
 
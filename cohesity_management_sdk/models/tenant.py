@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.active_directory_entry
-import cohesity_management_sdk.models.tenant_deletion_info
-import cohesity_management_sdk.models.ldap_provider_response
-import cohesity_management_sdk.models.backup_job_proto
-import cohesity_management_sdk.models.view
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Tenant(object):
 
@@ -84,6 +80,19 @@ class Tenant(object):
         "vlan_iface_names":'vlanIfaceNames'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "active_directories":['active_directory_entry.ActiveDirectoryEntry'],
+        "deletion_info_vec":['tenant_deletion_info.TenantDeletionInfo'],
+        "ldap_providers":['ldap_provider_response.LdapProviderResponse'],
+        "protection_jobs":['backup_job_proto.BackupJobProto'],
+        "views":['view.View']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  active_directories=None,
                  bifrost_enabled=None,
@@ -146,73 +155,6 @@ class Tenant(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        active_directories = None
-        if dictionary.get('activeDirectories') != None:
-            active_directories = list()
-            for structure in dictionary.get('activeDirectories'):
-                active_directories.append(cohesity_management_sdk.models.active_directory_entry.ActiveDirectoryEntry.from_dictionary(structure))
-        bifrost_enabled = dictionary.get('bifrostEnabled')
-        created_time_msecs = dictionary.get('createdTimeMsecs')
-        deleted = dictionary.get('deleted')
-        deleted_time_msecs = dictionary.get('deletedTimeMsecs')
-        deletion_finished = dictionary.get('deletionFinished')
-        deletion_info_vec = None
-        if dictionary.get('deletionInfoVec') != None:
-            deletion_info_vec = list()
-            for structure in dictionary.get('deletionInfoVec'):
-                deletion_info_vec.append(cohesity_management_sdk.models.tenant_deletion_info.TenantDeletionInfo.from_dictionary(structure))
-        description = dictionary.get('description')
-        entity_ids = dictionary.get('entityIds')
-        last_updated_time_msecs = dictionary.get('lastUpdatedTimeMsecs')
-        ldap_providers = None
-        if dictionary.get('ldapProviders') != None:
-            ldap_providers = list()
-            for structure in dictionary.get('ldapProviders'):
-                ldap_providers.append(cohesity_management_sdk.models.ldap_provider_response.LdapProviderResponse.from_dictionary(structure))
-        name = dictionary.get('name')
-        org_suffix = dictionary.get('orgSuffix')
-        parent_tenant_id = dictionary.get('parentTenantId')
-        policy_ids = dictionary.get('policyIds')
-        protection_jobs = None
-        if dictionary.get('protectionJobs') != None:
-            protection_jobs = list()
-            for structure in dictionary.get('protectionJobs'):
-                protection_jobs.append(cohesity_management_sdk.models.backup_job_proto.BackupJobProto.from_dictionary(structure))
-        subscribe_to_alert_emails = dictionary.get('subscribeToAlertEmails')
-        tenant_id = dictionary.get('tenantId')
-        view_box_ids = dictionary.get('viewBoxIds')
-        views = None
-        if dictionary.get('views') != None:
-            views = list()
-            for structure in dictionary.get('views'):
-                views.append(cohesity_management_sdk.models.view.View.from_dictionary(structure))
-        vlan_iface_names = dictionary.get('vlanIfaceNames')
-
-        # Return an object of this model
-        return cls(active_directories,
-                   bifrost_enabled,
-                   created_time_msecs,
-                   deleted,
-                   deleted_time_msecs,
-                   deletion_finished,
-                   deletion_info_vec,
-                   description,
-                   entity_ids,
-                   last_updated_time_msecs,
-                   ldap_providers,
-                   name,
-                   org_suffix,
-                   parent_tenant_id,
-                   policy_ids,
-                   protection_jobs,
-                   subscribe_to_alert_emails,
-                   tenant_id,
-                   view_box_ids,
-                   views,
-                   vlan_iface_names)
+        return decode_model(cls, dictionary)
 
 
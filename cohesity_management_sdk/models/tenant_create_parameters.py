@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TenantCreateParameters(object):
 
@@ -34,6 +35,9 @@ class TenantCreateParameters(object):
         "subscribe_to_alert_emails":'subscribeToAlertEmails'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bifrost_enabled=None,
                  description=None,
@@ -66,23 +70,6 @@ class TenantCreateParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bifrost_enabled = dictionary.get('bifrostEnabled')
-        description = dictionary.get('description')
-        name = dictionary.get('name')
-        org_suffix = dictionary.get('orgSuffix')
-        parent_tenant_id = dictionary.get('parentTenantId')
-        subscribe_to_alert_emails = dictionary.get('subscribeToAlertEmails')
-
-        # Return an object of this model
-        return cls(bifrost_enabled,
-                   description,
-                   name,
-                   org_suffix,
-                   parent_tenant_id,
-                   subscribe_to_alert_emails)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TenantDeletionInfo(object):
 
@@ -37,6 +38,9 @@ class TenantDeletionInfo(object):
         "state":'state'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  category=None,
                  finished_at_time_msecs=None,
@@ -69,23 +73,6 @@ class TenantDeletionInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        category = dictionary.get('category')
-        finished_at_time_msecs = dictionary.get('finishedAtTimeMsecs')
-        processed_at_node = dictionary.get('processedAtNode')
-        retry_count = dictionary.get('retryCount')
-        started_at_time_msecs = dictionary.get('startedAtTimeMsecs')
-        state = dictionary.get('state')
-
-        # Return an object of this model
-        return cls(category,
-                   finished_at_time_msecs,
-                   processed_at_node,
-                   retry_count,
-                   started_at_time_msecs,
-                   state)
+        return decode_model(cls, dictionary)
 
 
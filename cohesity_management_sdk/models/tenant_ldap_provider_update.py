@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TenantLdapProviderUpdate(object):
 
@@ -21,6 +22,9 @@ class TenantLdapProviderUpdate(object):
         "tenant_id":'tenantId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ldap_provider_ids=None,
                  tenant_id=None):
@@ -45,15 +49,6 @@ class TenantLdapProviderUpdate(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ldap_provider_ids = dictionary.get('ldapProviderIds')
-        tenant_id = dictionary.get('tenantId')
-
-        # Return an object of this model
-        return cls(ldap_provider_ids,
-                   tenant_id)
+        return decode_model(cls, dictionary)
 
 
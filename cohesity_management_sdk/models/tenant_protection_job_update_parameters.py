@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TenantProtectionJobUpdateParameters(object):
 
@@ -21,6 +22,9 @@ class TenantProtectionJobUpdateParameters(object):
         "tenant_id":'tenantId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  protection_job_ids=None,
                  tenant_id=None):
@@ -45,15 +49,6 @@ class TenantProtectionJobUpdateParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        protection_job_ids = dictionary.get('protectionJobIds')
-        tenant_id = dictionary.get('tenantId')
-
-        # Return an object of this model
-        return cls(protection_job_ids,
-                   tenant_id)
+        return decode_model(cls, dictionary)
 
 
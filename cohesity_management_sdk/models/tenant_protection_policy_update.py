@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TenantProtectionPolicyUpdate(object):
 
@@ -21,6 +22,9 @@ class TenantProtectionPolicyUpdate(object):
         "tenant_id":'tenantId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  policy_ids=None,
                  tenant_id=None):
@@ -45,15 +49,6 @@ class TenantProtectionPolicyUpdate(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        policy_ids = dictionary.get('policyIds')
-        tenant_id = dictionary.get('tenantId')
-
-        # Return an object of this model
-        return cls(policy_ids,
-                   tenant_id)
+        return decode_model(cls, dictionary)
 
 
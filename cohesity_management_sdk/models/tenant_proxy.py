@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TenantProxy(object):
 
@@ -21,6 +22,9 @@ class TenantProxy(object):
         "tenant_id":'tenantId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ip_address=None,
                  tenant_id=None):
@@ -45,15 +49,6 @@ class TenantProxy(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ip_address = dictionary.get('ipAddress')
-        tenant_id = dictionary.get('tenantId')
-
-        # Return an object of this model
-        return cls(ip_address,
-                   tenant_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.stats_group
-import cohesity_management_sdk.models.usage_schema_info
-import cohesity_management_sdk.models.data_usage_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TenantStats(object):
 
@@ -32,6 +30,17 @@ class TenantStats(object):
         "stats":'stats'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "group_list":['stats_group.StatsGroup'],
+        "schema_info_list":['usage_schema_info.UsageSchemaInfo'],
+        "stats":'data_usage_stats.DataUsageStats'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  group_list=None,
                  id=None,
@@ -62,29 +71,6 @@ class TenantStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        group_list = None
-        if dictionary.get('groupList') != None:
-            group_list = list()
-            for structure in dictionary.get('groupList'):
-                group_list.append(cohesity_management_sdk.models.stats_group.StatsGroup.from_dictionary(structure))
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        schema_info_list = None
-        if dictionary.get('schemaInfoList') != None:
-            schema_info_list = list()
-            for structure in dictionary.get('schemaInfoList'):
-                schema_info_list.append(cohesity_management_sdk.models.usage_schema_info.UsageSchemaInfo.from_dictionary(structure))
-        stats = cohesity_management_sdk.models.data_usage_stats.DataUsageStats.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-
-        # Return an object of this model
-        return cls(group_list,
-                   id,
-                   name,
-                   schema_info_list,
-                   stats)
+        return decode_model(cls, dictionary)
 
 
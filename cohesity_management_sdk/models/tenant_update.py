@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TenantUpdate(object):
 
@@ -28,6 +29,9 @@ class TenantUpdate(object):
         "tenant_id":'tenantId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bifrost_enabled=None,
                  description=None,
@@ -58,21 +62,6 @@ class TenantUpdate(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bifrost_enabled = dictionary.get('bifrostEnabled')
-        description = dictionary.get('description')
-        name = dictionary.get('name')
-        subscribe_to_alert_emails = dictionary.get('subscribeToAlertEmails')
-        tenant_id = dictionary.get('tenantId')
-
-        # Return an object of this model
-        return cls(bifrost_enabled,
-                   description,
-                   name,
-                   subscribe_to_alert_emails,
-                   tenant_id)
+        return decode_model(cls, dictionary)
 
 
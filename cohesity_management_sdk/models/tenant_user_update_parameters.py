@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TenantUserUpdateParameters(object):
 
@@ -20,6 +21,9 @@ class TenantUserUpdateParameters(object):
         "tenant_id":'tenantId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  sids=None,
                  tenant_id=None):
@@ -44,15 +48,6 @@ class TenantUserUpdateParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        sids = dictionary.get('sids')
-        tenant_id = dictionary.get('tenantId')
-
-        # Return an object of this model
-        return cls(sids,
-                   tenant_id)
+        return decode_model(cls, dictionary)
 
 
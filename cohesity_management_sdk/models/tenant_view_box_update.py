@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TenantViewBoxUpdate(object):
 
@@ -21,6 +22,9 @@ class TenantViewBoxUpdate(object):
         "view_box_ids":'viewBoxIds'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  tenant_id=None,
                  view_box_ids=None):
@@ -45,15 +49,6 @@ class TenantViewBoxUpdate(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        tenant_id = dictionary.get('tenantId')
-        view_box_ids = dictionary.get('viewBoxIds')
-
-        # Return an object of this model
-        return cls(tenant_id,
-                   view_box_ids)
+        return decode_model(cls, dictionary)
 
 
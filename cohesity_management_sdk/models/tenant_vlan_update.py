@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TenantVlanUpdate(object):
 
@@ -21,6 +22,9 @@ class TenantVlanUpdate(object):
         "vlan_iface_names":'vlanIfaceNames'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  tenant_id=None,
                  vlan_iface_names=None):
@@ -45,15 +49,6 @@ class TenantVlanUpdate(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        tenant_id = dictionary.get('tenantId')
-        vlan_iface_names = dictionary.get('vlanIfaceNames')
-
-        # Return an object of this model
-        return cls(tenant_id,
-                   vlan_iface_names)
+        return decode_model(cls, dictionary)
 
 
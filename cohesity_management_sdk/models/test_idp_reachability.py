@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TestIdpReachability(object):
 
@@ -23,6 +24,9 @@ class TestIdpReachability(object):
         "sso_url":'ssoUrl'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  issuer_id=None,
                  sso_url=None):
@@ -47,15 +51,6 @@ class TestIdpReachability(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        issuer_id = dictionary.get('issuerId')
-        sso_url = dictionary.get('ssoUrl')
-
-        # Return an object of this model
-        return cls(issuer_id,
-                   sso_url)
+        return decode_model(cls, dictionary)
 
 
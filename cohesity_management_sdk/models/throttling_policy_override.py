@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.throttling_policy_parameters
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ThrottlingPolicyOverride(object):
 
@@ -26,6 +26,15 @@ class ThrottlingPolicyOverride(object):
         "throttling_policy":'throttlingPolicy'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "throttling_policy":'throttling_policy_parameters.ThrottlingPolicyParameters'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  datastore_id=None,
                  datastore_name=None,
@@ -52,17 +61,6 @@ class ThrottlingPolicyOverride(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        datastore_id = dictionary.get('datastoreId')
-        datastore_name = dictionary.get('datastoreName')
-        throttling_policy = cohesity_management_sdk.models.throttling_policy_parameters.ThrottlingPolicyParameters.from_dictionary(dictionary.get('throttlingPolicy')) if dictionary.get('throttlingPolicy') else None
-
-        # Return an object of this model
-        return cls(datastore_id,
-                   datastore_name,
-                   throttling_policy)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.latency_thresholds
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ThrottlingPolicyParameters(object):
 
@@ -37,6 +37,15 @@ class ThrottlingPolicyParameters(object):
         "max_concurrent_streams":'maxConcurrentStreams'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "latency_thresholds":'latency_thresholds.LatencyThresholds'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  enforce_max_streams=None,
                  is_enabled=None,
@@ -65,19 +74,6 @@ class ThrottlingPolicyParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        enforce_max_streams = dictionary.get('enforceMaxStreams')
-        is_enabled = dictionary.get('isEnabled')
-        latency_thresholds = cohesity_management_sdk.models.latency_thresholds.LatencyThresholds.from_dictionary(dictionary.get('latencyThresholds')) if dictionary.get('latencyThresholds') else None
-        max_concurrent_streams = dictionary.get('maxConcurrentStreams')
-
-        # Return an object of this model
-        return cls(enforce_max_streams,
-                   is_enabled,
-                   latency_thresholds,
-                   max_concurrent_streams)
+        return decode_model(cls, dictionary)
 
 
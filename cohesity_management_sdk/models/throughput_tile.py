@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.sample
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ThroughputTile(object):
 
@@ -31,6 +31,16 @@ class ThroughputTile(object):
         "write_throughput_samples":'writeThroughputSamples'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "read_throughput_samples":['sample.Sample'],
+        "write_throughput_samples":['sample.Sample']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  max_read_throughput=None,
                  max_write_throughput=None,
@@ -59,27 +69,6 @@ class ThroughputTile(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        max_read_throughput = dictionary.get('maxReadThroughput')
-        max_write_throughput = dictionary.get('maxWriteThroughput')
-        read_throughput_samples = None
-        if dictionary.get('readThroughputSamples') != None:
-            read_throughput_samples = list()
-            for structure in dictionary.get('readThroughputSamples'):
-                read_throughput_samples.append(cohesity_management_sdk.models.sample.Sample.from_dictionary(structure))
-        write_throughput_samples = None
-        if dictionary.get('writeThroughputSamples') != None:
-            write_throughput_samples = list()
-            for structure in dictionary.get('writeThroughputSamples'):
-                write_throughput_samples.append(cohesity_management_sdk.models.sample.Sample.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(max_read_throughput,
-                   max_write_throughput,
-                   read_throughput_samples,
-                   write_throughput_samples)
+        return decode_model(cls, dictionary)
 
 
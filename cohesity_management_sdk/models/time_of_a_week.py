@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.time_of_day
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TimeOfAWeek(object):
 
@@ -33,6 +33,16 @@ class TimeOfAWeek(object):
         "start_time":'startTime'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "end_time":'time_of_day.TimeOfDay',
+        "start_time":'time_of_day.TimeOfDay'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  days=None,
                  end_time=None,
@@ -59,17 +69,6 @@ class TimeOfAWeek(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        days = dictionary.get('days')
-        end_time = cohesity_management_sdk.models.time_of_day.TimeOfDay.from_dictionary(dictionary.get('endTime')) if dictionary.get('endTime') else None
-        start_time = cohesity_management_sdk.models.time_of_day.TimeOfDay.from_dictionary(dictionary.get('startTime')) if dictionary.get('startTime') else None
-
-        # Return an object of this model
-        return cls(days,
-                   end_time,
-                   start_time)
+        return decode_model(cls, dictionary)
 
 
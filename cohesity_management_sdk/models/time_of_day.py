@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TimeOfDay(object):
 
@@ -20,6 +21,9 @@ class TimeOfDay(object):
         "minute":'minute'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  hour=None,
                  minute=None):
@@ -44,15 +48,6 @@ class TimeOfDay(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        hour = dictionary.get('hour')
-        minute = dictionary.get('minute')
-
-        # Return an object of this model
-        return cls(hour,
-                   minute)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.schema_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TimeSeriesSchemaResponse(object):
 
@@ -20,6 +20,15 @@ class TimeSeriesSchemaResponse(object):
         "schema_info_list":'schemaInfoList'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "schema_info_list":['schema_info.SchemaInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  schema_info_list=None):
         """Constructor for the TimeSeriesSchemaResponse class"""
@@ -42,17 +51,6 @@ class TimeSeriesSchemaResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        schema_info_list = None
-        if dictionary.get('schemaInfoList') != None:
-            schema_info_list = list()
-            for structure in dictionary.get('schemaInfoList'):
-                schema_info_list.append(cohesity_management_sdk.models.schema_info.SchemaInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(schema_info_list)
+        return decode_model(cls, dictionary)
 
 
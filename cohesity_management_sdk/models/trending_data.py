@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class TrendingData(object):
 
@@ -34,6 +35,9 @@ class TrendingData(object):
         "trend_start_time_usecs":'trendStartTimeUsecs'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cancelled=None,
                  failed=None,
@@ -68,25 +72,6 @@ class TrendingData(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cancelled = dictionary.get('cancelled')
-        failed = dictionary.get('failed')
-        running = dictionary.get('running')
-        successful = dictionary.get('successful')
-        total = dictionary.get('total')
-        trend_name = dictionary.get('trendName')
-        trend_start_time_usecs = dictionary.get('trendStartTimeUsecs')
-
-        # Return an object of this model
-        return cls(cancelled,
-                   failed,
-                   running,
-                   successful,
-                   total,
-                   trend_name,
-                   trend_start_time_usecs)
+        return decode_model(cls, dictionary)
 
 
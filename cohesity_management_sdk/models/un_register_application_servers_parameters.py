@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UnRegisterApplicationServersParameters(object):
 
@@ -55,6 +56,9 @@ class UnRegisterApplicationServersParameters(object):
         "applications":'applications'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  applications=None):
         """Constructor for the UnRegisterApplicationServersParameters class"""
@@ -77,13 +81,6 @@ class UnRegisterApplicationServersParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        applications = dictionary.get('applications')
-
-        # Return an object of this model
-        return cls(applications)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UniversalId(object):
 
@@ -27,6 +28,9 @@ class UniversalId(object):
         "id":'id'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_id=None,
                  cluster_incarnation_id=None,
@@ -53,17 +57,6 @@ class UniversalId(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_id = dictionary.get('clusterId')
-        cluster_incarnation_id = dictionary.get('clusterIncarnationId')
-        id = dictionary.get('id')
-
-        # Return an object of this model
-        return cls(cluster_id,
-                   cluster_incarnation_id,
-                   id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UniversalIdProto(object):
 
@@ -25,6 +26,9 @@ class UniversalIdProto(object):
         "object_id":'objectId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_id=None,
                  cluster_incarnation_id=None,
@@ -51,17 +55,6 @@ class UniversalIdProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_id = dictionary.get('clusterId')
-        cluster_incarnation_id = dictionary.get('clusterIncarnationId')
-        object_id = dictionary.get('objectId')
-
-        # Return an object of this model
-        return cls(cluster_id,
-                   cluster_incarnation_id,
-                   object_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UnprotectObjectParams(object):
 
@@ -25,6 +26,9 @@ class UnprotectObjectParams(object):
         "delete_snapshots":'deleteSnapshots'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  protection_source_id=None,
                  rpo_policy_id=None,
@@ -51,17 +55,6 @@ class UnprotectObjectParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        protection_source_id = dictionary.get('protectionSourceId')
-        rpo_policy_id = dictionary.get('rpoPolicyId')
-        delete_snapshots = dictionary.get('deleteSnapshots')
-
-        # Return an object of this model
-        return cls(protection_source_id,
-                   rpo_policy_id,
-                   delete_snapshots)
+        return decode_model(cls, dictionary)
 
 
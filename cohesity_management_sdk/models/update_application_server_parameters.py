@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateApplicationServerParameters(object):
 
@@ -72,6 +73,9 @@ class UpdateApplicationServerParameters(object):
         "username":'username'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  applications=None,
                  has_persistent_agent=None,
@@ -102,21 +106,6 @@ class UpdateApplicationServerParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        applications = dictionary.get('applications')
-        has_persistent_agent = dictionary.get('hasPersistentAgent')
-        password = dictionary.get('password')
-        protection_source_id = dictionary.get('protectionSourceId')
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(applications,
-                   has_persistent_agent,
-                   password,
-                   protection_source_id,
-                   username)
+        return decode_model(cls, dictionary)
 
 
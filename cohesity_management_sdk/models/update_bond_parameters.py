@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateBondParameters(object):
 
@@ -28,6 +29,9 @@ class UpdateBondParameters(object):
         "xmit_hash_policy":'xmitHashPolicy'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bonding_mode=None,
                  name=None,
@@ -56,19 +60,6 @@ class UpdateBondParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bonding_mode = dictionary.get('bondingMode')
-        name = dictionary.get('name')
-        lacp_rate = dictionary.get('lacpRate')
-        xmit_hash_policy = dictionary.get('xmitHashPolicy')
-
-        # Return an object of this model
-        return cls(bonding_mode,
-                   name,
-                   lacp_rate,
-                   xmit_hash_policy)
+        return decode_model(cls, dictionary)
 
 
@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.apps_config
-import cohesity_management_sdk.models.cluster_audit_log_configuration
-import cohesity_management_sdk.models.filer_audit_log_configuration
-import cohesity_management_sdk.models.ntp_settings_config
-import cohesity_management_sdk.models.syslog_server
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateClusterParams(object):
 
@@ -127,6 +123,19 @@ class UpdateClusterParams(object):
         "turbo_mode":'turboMode'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "apps_settings":'apps_config.AppsConfig',
+        "cluster_audit_log_config":'cluster_audit_log_configuration.ClusterAuditLogConfiguration',
+        "filer_audit_log_config":'filer_audit_log_configuration.FilerAuditLogConfiguration',
+        "ntp_settings":'ntp_settings_config.NtpSettingsConfig',
+        "syslog_servers":['syslog_server.SyslogServer']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  apps_settings=None,
                  banner_enabled=None,
@@ -205,73 +214,6 @@ class UpdateClusterParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        apps_settings = cohesity_management_sdk.models.apps_config.AppsConfig.from_dictionary(dictionary.get('appsSettings')) if dictionary.get('appsSettings') else None
-        banner_enabled = dictionary.get('bannerEnabled')
-        bonding_mode = dictionary.get('bondingMode')
-        cluster_audit_log_config = cohesity_management_sdk.models.cluster_audit_log_configuration.ClusterAuditLogConfiguration.from_dictionary(dictionary.get('clusterAuditLogConfig')) if dictionary.get('clusterAuditLogConfig') else None
-        dns_server_ips = dictionary.get('dnsServerIps')
-        domain_names = dictionary.get('domainNames')
-        enable_active_monitoring = dictionary.get('enableActiveMonitoring')
-        enable_upgrade_pkg_polling = dictionary.get('enableUpgradePkgPolling')
-        encryption_key_rotation_period_secs = dictionary.get('encryptionKeyRotationPeriodSecs')
-        filer_audit_log_config = cohesity_management_sdk.models.filer_audit_log_configuration.FilerAuditLogConfiguration.from_dictionary(dictionary.get('filerAuditLogConfig')) if dictionary.get('filerAuditLogConfig') else None
-        gateway = dictionary.get('gateway')
-        google_analytics_enabled = dictionary.get('googleAnalyticsEnabled')
-        is_documentation_local = dictionary.get('isDocumentationLocal')
-        language_locale = dictionary.get('languageLocale')
-        local_auth_domain_name = dictionary.get('localAuthDomainName')
-        local_groups_enabled = dictionary.get('localGroupsEnabled')
-        metadata_fault_tolerance_factor = dictionary.get('metadataFaultToleranceFactor')
-        mtu = dictionary.get('mtu')
-        multi_tenancy_enabled = dictionary.get('multiTenancyEnabled')
-        name = dictionary.get('name')
-        ntp_settings = cohesity_management_sdk.models.ntp_settings_config.NtpSettingsConfig.from_dictionary(dictionary.get('ntpSettings')) if dictionary.get('ntpSettings') else None
-        reverse_tunnel_enabled = dictionary.get('reverseTunnelEnabled')
-        reverse_tunnel_end_time_msecs = dictionary.get('reverseTunnelEndTimeMsecs')
-        smb_ad_disabled = dictionary.get('smbAdDisabled')
-        stig_mode = dictionary.get('stigMode')
-        syslog_servers = None
-        if dictionary.get('syslogServers') != None:
-            syslog_servers = list()
-            for structure in dictionary.get('syslogServers'):
-                syslog_servers.append(cohesity_management_sdk.models.syslog_server.SyslogServer.from_dictionary(structure))
-        tenant_viewbox_sharing_enabled = dictionary.get('tenantViewboxSharingEnabled')
-        timezone = dictionary.get('timezone')
-        turbo_mode = dictionary.get('turboMode')
-
-        # Return an object of this model
-        return cls(apps_settings,
-                   banner_enabled,
-                   bonding_mode,
-                   cluster_audit_log_config,
-                   dns_server_ips,
-                   domain_names,
-                   enable_active_monitoring,
-                   enable_upgrade_pkg_polling,
-                   encryption_key_rotation_period_secs,
-                   filer_audit_log_config,
-                   gateway,
-                   google_analytics_enabled,
-                   is_documentation_local,
-                   language_locale,
-                   local_auth_domain_name,
-                   local_groups_enabled,
-                   metadata_fault_tolerance_factor,
-                   mtu,
-                   multi_tenancy_enabled,
-                   name,
-                   ntp_settings,
-                   reverse_tunnel_enabled,
-                   reverse_tunnel_end_time_msecs,
-                   smb_ad_disabled,
-                   stig_mode,
-                   syslog_servers,
-                   tenant_viewbox_sharing_enabled,
-                   timezone,
-                   turbo_mode)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.dir_quota_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateDirQuotaArgs(object):
 
@@ -27,6 +27,15 @@ class UpdateDirQuotaArgs(object):
         "view_name":'viewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "quota":'dir_quota_policy.DirQuotaPolicy'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  quota=None,
                  view_name=None):
@@ -51,15 +60,6 @@ class UpdateDirQuotaArgs(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        quota = cohesity_management_sdk.models.dir_quota_policy.DirQuotaPolicy.from_dictionary(dictionary.get('quota')) if dictionary.get('quota') else None
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(quota,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateEulaConfig(object):
 
@@ -19,6 +20,9 @@ class UpdateEulaConfig(object):
         "signed_version":'signedVersion'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  signed_version=None):
         """Constructor for the UpdateEulaConfig class"""
@@ -41,13 +45,6 @@ class UpdateEulaConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        signed_version = dictionary.get('signedVersion')
-
-        # Return an object of this model
-        return cls(signed_version)
+        return decode_model(cls, dictionary)
 
 
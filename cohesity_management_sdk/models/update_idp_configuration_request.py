@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateIdpConfigurationRequest(object):
 
@@ -60,6 +61,9 @@ class UpdateIdpConfigurationRequest(object):
         "sso_url":'ssoUrl'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  allow_local_authentication=None,
                  certificate=None,
@@ -98,29 +102,6 @@ class UpdateIdpConfigurationRequest(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        allow_local_authentication = dictionary.get('allowLocalAuthentication')
-        certificate = dictionary.get('certificate')
-        certificate_filename = dictionary.get('certificateFilename')
-        enable = dictionary.get('enable')
-        issuer_id = dictionary.get('issuerId')
-        roles = dictionary.get('roles')
-        saml_attribute_name = dictionary.get('samlAttributeName')
-        sign_request = dictionary.get('signRequest')
-        sso_url = dictionary.get('ssoUrl')
-
-        # Return an object of this model
-        return cls(allow_local_authentication,
-                   certificate,
-                   certificate_filename,
-                   enable,
-                   issuer_id,
-                   roles,
-                   saml_attribute_name,
-                   sign_request,
-                   sso_url)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateIgnoredTrustedDomainsParams(object):
 
@@ -20,6 +21,9 @@ class UpdateIgnoredTrustedDomainsParams(object):
         "ignored_trusted_domains":'ignoredTrustedDomains'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ignored_trusted_domains=None):
         """Constructor for the UpdateIgnoredTrustedDomainsParams class"""
@@ -42,13 +46,6 @@ class UpdateIgnoredTrustedDomainsParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ignored_trusted_domains = dictionary.get('ignoredTrustedDomains')
-
-        # Return an object of this model
-        return cls(ignored_trusted_domains)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.infected_file_param
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateInfectedFileParams(object):
 
@@ -31,6 +31,15 @@ class UpdateInfectedFileParams(object):
         "remediation_state":'remediationState'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "infected_file_ids":['infected_file_param.InfectedFileParam']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  infected_file_ids=None,
                  remediation_state=None):
@@ -55,19 +64,6 @@ class UpdateInfectedFileParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        infected_file_ids = None
-        if dictionary.get('infectedFileIds') != None:
-            infected_file_ids = list()
-            for structure in dictionary.get('infectedFileIds'):
-                infected_file_ids.append(cohesity_management_sdk.models.infected_file_param.InfectedFileParam.from_dictionary(structure))
-        remediation_state = dictionary.get('remediationState')
-
-        # Return an object of this model
-        return cls(infected_file_ids,
-                   remediation_state)
+        return decode_model(cls, dictionary)
 
 
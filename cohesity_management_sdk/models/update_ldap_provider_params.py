@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateLdapProviderParams(object):
 
@@ -19,6 +20,9 @@ class UpdateLdapProviderParams(object):
         "ldap_provider_id":'ldapProviderId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ldap_provider_id=None):
         """Constructor for the UpdateLdapProviderParams class"""
@@ -41,13 +45,6 @@ class UpdateLdapProviderParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ldap_provider_id = dictionary.get('ldapProviderId')
-
-        # Return an object of this model
-        return cls(ldap_provider_id)
+        return decode_model(cls, dictionary)
 
 
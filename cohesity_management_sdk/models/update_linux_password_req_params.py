@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateLinuxPasswordReqParams(object):
 
@@ -27,6 +28,9 @@ class UpdateLinuxPasswordReqParams(object):
         "node_ips":'nodeIps'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  linux_password=None,
                  linux_username=None,
@@ -55,19 +59,6 @@ class UpdateLinuxPasswordReqParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        linux_password = dictionary.get('linuxPassword')
-        linux_username = dictionary.get('linuxUsername')
-        cluster_id = dictionary.get('clusterId')
-        node_ips = dictionary.get('nodeIps')
-
-        # Return an object of this model
-        return cls(linux_password,
-                   linux_username,
-                   cluster_id,
-                   node_ips)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateMachineAccountsParams(object):
 
@@ -30,6 +31,9 @@ class UpdateMachineAccountsParams(object):
         "user_name":'userName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  machine_accounts=None,
                  overwrite_existing_accounts=None,
@@ -58,19 +62,6 @@ class UpdateMachineAccountsParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        machine_accounts = dictionary.get('machineAccounts')
-        overwrite_existing_accounts = dictionary.get('overwriteExistingAccounts')
-        password = dictionary.get('password')
-        user_name = dictionary.get('userName')
-
-        # Return an object of this model
-        return cls(machine_accounts,
-                   overwrite_existing_accounts,
-                   password,
-                   user_name)
+        return decode_model(cls, dictionary)
 
 
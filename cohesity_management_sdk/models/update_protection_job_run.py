@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.run_job_snapshot_target
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateProtectionJobRun(object):
 
@@ -40,6 +39,16 @@ class UpdateProtectionJobRun(object):
         "source_ids":'sourceIds'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "copy_run_targets":['run_job_snapshot_target.RunJobSnapshotTarget'],
+        "job_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  copy_run_targets=None,
                  expiry_time_usecs=None,
@@ -70,25 +79,6 @@ class UpdateProtectionJobRun(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        copy_run_targets = None
-        if dictionary.get('copyRunTargets') != None:
-            copy_run_targets = list()
-            for structure in dictionary.get('copyRunTargets'):
-                copy_run_targets.append(cohesity_management_sdk.models.run_job_snapshot_target.RunJobSnapshotTarget.from_dictionary(structure))
-        expiry_time_usecs = dictionary.get('expiryTimeUsecs')
-        job_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('jobUid')) if dictionary.get('jobUid') else None
-        run_start_time_usecs = dictionary.get('runStartTimeUsecs')
-        source_ids = dictionary.get('sourceIds')
-
-        # Return an object of this model
-        return cls(copy_run_targets,
-                   expiry_time_usecs,
-                   job_uid,
-                   run_start_time_usecs,
-                   source_ids)
+        return decode_model(cls, dictionary)
 
 
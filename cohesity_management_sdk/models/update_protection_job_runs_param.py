@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.update_protection_job_run
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateProtectionJobRunsParam(object):
 
@@ -20,6 +20,15 @@ class UpdateProtectionJobRunsParam(object):
         "job_runs":'jobRuns'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "job_runs":['update_protection_job_run.UpdateProtectionJobRun']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  job_runs=None):
         """Constructor for the UpdateProtectionJobRunsParam class"""
@@ -42,17 +51,6 @@ class UpdateProtectionJobRunsParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        job_runs = None
-        if dictionary.get('jobRuns') != None:
-            job_runs = list()
-            for structure in dictionary.get('jobRuns'):
-                job_runs.append(cohesity_management_sdk.models.update_protection_job_run.UpdateProtectionJobRun.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(job_runs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateProtectionJobsState(object):
 
@@ -22,6 +23,9 @@ class UpdateProtectionJobsState(object):
         "successful_job_ids":'successfulJobIds'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  failed_job_ids=None,
                  successful_job_ids=None):
@@ -46,15 +50,6 @@ class UpdateProtectionJobsState(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        failed_job_ids = dictionary.get('failedJobIds')
-        successful_job_ids = dictionary.get('successfulJobIds')
-
-        # Return an object of this model
-        return cls(failed_job_ids,
-                   successful_job_ids)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateProtectionJobsStateParams(object):
 
@@ -27,6 +28,9 @@ class UpdateProtectionJobsStateParams(object):
         "job_ids":'jobIds'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  action=None,
                  job_ids=None):
@@ -51,15 +55,6 @@ class UpdateProtectionJobsStateParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        action = dictionary.get('action')
-        job_ids = dictionary.get('jobIds')
-
-        # Return an object of this model
-        return cls(action,
-                   job_ids)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
-import cohesity_management_sdk.models.source_special_parameter
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateProtectionObjectParameters(object):
 
@@ -31,6 +30,16 @@ class UpdateProtectionObjectParameters(object):
         "source_parameters":'sourceParameters'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "protected_source_uid":'universal_id.UniversalId',
+        "source_parameters":['source_special_parameter.SourceSpecialParameter']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  protected_source_uid=None,
                  pause_backup=None,
@@ -59,23 +68,6 @@ class UpdateProtectionObjectParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        protected_source_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('protectedSourceUid')) if dictionary.get('protectedSourceUid') else None
-        pause_backup = dictionary.get('pauseBackup')
-        rpo_policy_id = dictionary.get('rpoPolicyId')
-        source_parameters = None
-        if dictionary.get('sourceParameters') != None:
-            source_parameters = list()
-            for structure in dictionary.get('sourceParameters'):
-                source_parameters.append(cohesity_management_sdk.models.source_special_parameter.SourceSpecialParameter.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(protected_source_uid,
-                   pause_backup,
-                   rpo_policy_id,
-                   source_parameters)
+        return decode_model(cls, dictionary)
 
 
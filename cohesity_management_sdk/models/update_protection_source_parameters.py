@@ -1,15 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.aws_credentials
-import cohesity_management_sdk.models.azure_credentials
-import cohesity_management_sdk.models.gcp_credentials
-import cohesity_management_sdk.models.kubernetes_credentials
-import cohesity_management_sdk.models.nas_mount_credential_params
-import cohesity_management_sdk.models.office_365_credentials
-import cohesity_management_sdk.models.ssl_verification
-import cohesity_management_sdk.models.throttling_policy_parameters
-import cohesity_management_sdk.models.throttling_policy_override
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateProtectionSourceParameters(object):
 
@@ -93,6 +85,23 @@ class UpdateProtectionSourceParameters(object):
         "username":'username'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "aws_credentials":'aws_credentials.AwsCredentials',
+        "azure_credentials":'azure_credentials.AzureCredentials',
+        "gcp_credentials":'gcp_credentials.GcpCredentials',
+        "kubernetes_credentials":'kubernetes_credentials.KubernetesCredentials',
+        "nas_mount_credentials":'nas_mount_credential_params.NasMountCredentialParams',
+        "office_365_credentials":'office_365_credentials.Office365Credentials',
+        "ssl_verification":'ssl_verification.SslVerification',
+        "throttling_policy":'throttling_policy_parameters.ThrottlingPolicyParameters',
+        "throttling_policy_overrides":['throttling_policy_override.ThrottlingPolicyOverride']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  agent_endpoint=None,
                  aws_credentials=None,
@@ -147,49 +156,6 @@ class UpdateProtectionSourceParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        agent_endpoint = dictionary.get('agentEndpoint')
-        aws_credentials = cohesity_management_sdk.models.aws_credentials.AwsCredentials.from_dictionary(dictionary.get('awsCredentials')) if dictionary.get('awsCredentials') else None
-        azure_credentials = cohesity_management_sdk.models.azure_credentials.AzureCredentials.from_dictionary(dictionary.get('azureCredentials')) if dictionary.get('azureCredentials') else None
-        endpoint = dictionary.get('endpoint')
-        force_register = dictionary.get('forceRegister')
-        gcp_credentials = cohesity_management_sdk.models.gcp_credentials.GcpCredentials.from_dictionary(dictionary.get('gcpCredentials')) if dictionary.get('gcpCredentials') else None
-        host_type = dictionary.get('hostType')
-        kubernetes_credentials = cohesity_management_sdk.models.kubernetes_credentials.KubernetesCredentials.from_dictionary(dictionary.get('kubernetesCredentials')) if dictionary.get('kubernetesCredentials') else None
-        minimum_free_space_gb = dictionary.get('minimumFreeSpaceGB')
-        nas_mount_credentials = cohesity_management_sdk.models.nas_mount_credential_params.NasMountCredentialParams.from_dictionary(dictionary.get('nasMountCredentials')) if dictionary.get('nasMountCredentials') else None
-        office_365_credentials = cohesity_management_sdk.models.office_365_credentials.Office365Credentials.from_dictionary(dictionary.get('office365Credentials')) if dictionary.get('office365Credentials') else None
-        password = dictionary.get('password')
-        source_side_dedup_enabled = dictionary.get('sourceSideDedupEnabled')
-        ssl_verification = cohesity_management_sdk.models.ssl_verification.SslVerification.from_dictionary(dictionary.get('sslVerification')) if dictionary.get('sslVerification') else None
-        throttling_policy = cohesity_management_sdk.models.throttling_policy_parameters.ThrottlingPolicyParameters.from_dictionary(dictionary.get('throttlingPolicy')) if dictionary.get('throttlingPolicy') else None
-        throttling_policy_overrides = None
-        if dictionary.get('throttlingPolicyOverrides') != None:
-            throttling_policy_overrides = list()
-            for structure in dictionary.get('throttlingPolicyOverrides'):
-                throttling_policy_overrides.append(cohesity_management_sdk.models.throttling_policy_override.ThrottlingPolicyOverride.from_dictionary(structure))
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(agent_endpoint,
-                   aws_credentials,
-                   azure_credentials,
-                   endpoint,
-                   force_register,
-                   gcp_credentials,
-                   host_type,
-                   kubernetes_credentials,
-                   minimum_free_space_gb,
-                   nas_mount_credentials,
-                   office_365_credentials,
-                   password,
-                   source_side_dedup_enabled,
-                   ssl_verification,
-                   throttling_policy,
-                   throttling_policy_overrides,
-                   username)
+        return decode_model(cls, dictionary)
 
 
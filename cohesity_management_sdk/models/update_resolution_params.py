@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateResolutionParams(object):
 
@@ -21,6 +22,9 @@ class UpdateResolutionParams(object):
         "alert_id_list":'alertIdList'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alert_id_list=None):
         """Constructor for the UpdateResolutionParams class"""
@@ -43,13 +47,6 @@ class UpdateResolutionParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alert_id_list = dictionary.get('alertIdList')
-
-        # Return an object of this model
-        return cls(alert_id_list)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.ad_restore_options
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateRestoreTaskParams(object):
 
@@ -30,6 +30,15 @@ class UpdateRestoreTaskParams(object):
         "sql_options":'sqlOptions'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "ad_options":'ad_restore_options.AdRestoreOptions'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ad_options=None,
                  restore_task_id=None,
@@ -56,17 +65,6 @@ class UpdateRestoreTaskParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ad_options = cohesity_management_sdk.models.ad_restore_options.AdRestoreOptions.from_dictionary(dictionary.get('adOptions')) if dictionary.get('adOptions') else None
-        restore_task_id = dictionary.get('restoreTaskId')
-        sql_options = dictionary.get('sqlOptions')
-
-        # Return an object of this model
-        return cls(ad_options,
-                   restore_task_id,
-                   sql_options)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.source_for_principal_param
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateSourcesForPrincipalsParams(object):
 
@@ -25,6 +25,15 @@ class UpdateSourcesForPrincipalsParams(object):
         "sources_for_principals":'sourcesForPrincipals'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "sources_for_principals":['source_for_principal_param.SourceForPrincipalParam']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  sources_for_principals=None):
         """Constructor for the UpdateSourcesForPrincipalsParams class"""
@@ -47,17 +56,6 @@ class UpdateSourcesForPrincipalsParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        sources_for_principals = None
-        if dictionary.get('sourcesForPrincipals') != None:
-            sources_for_principals = list()
-            for structure in dictionary.get('sourcesForPrincipals'):
-                sources_for_principals.append(cohesity_management_sdk.models.source_for_principal_param.SourceForPrincipalParam.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(sources_for_principals)
+        return decode_model(cls, dictionary)
 
 
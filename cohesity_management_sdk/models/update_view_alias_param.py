@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.smb_permission
-import cohesity_management_sdk.models.subnet
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpdateViewAliasParam(object):
 
@@ -42,6 +41,16 @@ class UpdateViewAliasParam(object):
         "subnet_whitelist":'subnetWhitelist'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "share_permissions":['smb_permission.SmbPermission'],
+        "subnet_whitelist":['subnet.Subnet']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alias_name=None,
                  enable_smb_encryption=None,
@@ -74,31 +83,6 @@ class UpdateViewAliasParam(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alias_name = dictionary.get('aliasName')
-        enable_smb_encryption = dictionary.get('enableSmbEncryption')
-        enable_smb_view_discovery = dictionary.get('enableSmbViewDiscovery')
-        enforce_smb_encryption = dictionary.get('enforceSmbEncryption')
-        share_permissions = None
-        if dictionary.get('sharePermissions') != None:
-            share_permissions = list()
-            for structure in dictionary.get('sharePermissions'):
-                share_permissions.append(cohesity_management_sdk.models.smb_permission.SmbPermission.from_dictionary(structure))
-        subnet_whitelist = None
-        if dictionary.get('subnetWhitelist') != None:
-            subnet_whitelist = list()
-            for structure in dictionary.get('subnetWhitelist'):
-                subnet_whitelist.append(cohesity_management_sdk.models.subnet.Subnet.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(alias_name,
-                   enable_smb_encryption,
-                   enable_smb_view_discovery,
-                   enforce_smb_encryption,
-                   share_permissions,
-                   subnet_whitelist)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpgradeClusterParameters(object):
 
@@ -22,6 +23,9 @@ class UpgradeClusterParameters(object):
         "target_sw_version":'targetSwVersion'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  target_sw_version=None):
         """Constructor for the UpgradeClusterParameters class"""
@@ -44,13 +48,6 @@ class UpgradeClusterParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        target_sw_version = dictionary.get('targetSwVersion')
-
-        # Return an object of this model
-        return cls(target_sw_version)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpgradeNodeParameters(object):
 
@@ -36,6 +37,9 @@ class UpgradeNodeParameters(object):
         "upgrade_self":'upgradeSelf'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  node_ids=None,
                  target_sw_version=None,
@@ -64,19 +68,6 @@ class UpgradeNodeParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        node_ids = dictionary.get('nodeIds')
-        target_sw_version = dictionary.get('targetSwVersion')
-        upgrade_all_free_nodes = dictionary.get('upgradeAllFreeNodes')
-        upgrade_self = dictionary.get('upgradeSelf')
-
-        # Return an object of this model
-        return cls(node_ids,
-                   target_sw_version,
-                   upgrade_all_free_nodes,
-                   upgrade_self)
+        return decode_model(cls, dictionary)
 
 
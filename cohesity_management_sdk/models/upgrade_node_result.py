@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpgradeNodeResult(object):
 
@@ -22,6 +23,9 @@ class UpgradeNodeResult(object):
         "status_url":'statusUrl'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  message=None,
                  status_url=None):
@@ -46,15 +50,6 @@ class UpgradeNodeResult(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        message = dictionary.get('message')
-        status_url = dictionary.get('statusUrl')
-
-        # Return an object of this model
-        return cls(message,
-                   status_url)
+        return decode_model(cls, dictionary)
 
 
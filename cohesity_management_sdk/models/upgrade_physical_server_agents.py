@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UpgradePhysicalServerAgents(object):
 
@@ -21,6 +22,9 @@ class UpgradePhysicalServerAgents(object):
         "agent_ids":'agentIds'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  agent_ids=None):
         """Constructor for the UpgradePhysicalServerAgents class"""
@@ -43,13 +47,6 @@ class UpgradePhysicalServerAgents(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        agent_ids = dictionary.get('agentIds')
-
-        # Return an object of this model
-        return cls(agent_ids)
+        return decode_model(cls, dictionary)
 
 
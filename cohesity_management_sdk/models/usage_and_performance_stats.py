@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UsageAndPerformanceStats(object):
 
@@ -70,6 +71,9 @@ class UsageAndPerformanceStats(object):
         "write_latency_msecs":'writeLatencyMsecs'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data_in_bytes=None,
                  data_in_bytes_after_reduction=None,
@@ -118,39 +122,6 @@ class UsageAndPerformanceStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data_in_bytes = dictionary.get('dataInBytes')
-        data_in_bytes_after_reduction = dictionary.get('dataInBytesAfterReduction')
-        min_usable_physical_capacity_bytes = dictionary.get('minUsablePhysicalCapacityBytes')
-        num_bytes_read = dictionary.get('numBytesRead')
-        num_bytes_written = dictionary.get('numBytesWritten')
-        physical_capacity_bytes = dictionary.get('physicalCapacityBytes')
-        read_ios = dictionary.get('readIos')
-        read_latency_msecs = dictionary.get('readLatencyMsecs')
-        system_capacity_bytes = dictionary.get('systemCapacityBytes')
-        system_usage_bytes = dictionary.get('systemUsageBytes')
-        total_physical_raw_usage_bytes = dictionary.get('totalPhysicalRawUsageBytes')
-        total_physical_usage_bytes = dictionary.get('totalPhysicalUsageBytes')
-        write_ios = dictionary.get('writeIos')
-        write_latency_msecs = dictionary.get('writeLatencyMsecs')
-
-        # Return an object of this model
-        return cls(data_in_bytes,
-                   data_in_bytes_after_reduction,
-                   min_usable_physical_capacity_bytes,
-                   num_bytes_read,
-                   num_bytes_written,
-                   physical_capacity_bytes,
-                   read_ios,
-                   read_latency_msecs,
-                   system_capacity_bytes,
-                   system_usage_bytes,
-                   total_physical_raw_usage_bytes,
-                   total_physical_usage_bytes,
-                   write_ios,
-                   write_latency_msecs)
+        return decode_model(cls, dictionary)
 
 
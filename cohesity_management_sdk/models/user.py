@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.cluster_identifier
-import cohesity_management_sdk.models.google_account_info
-import cohesity_management_sdk.models.idp_user_info
-import cohesity_management_sdk.models.preferences
-import cohesity_management_sdk.models.salesforce_account_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class User(object):
 
@@ -104,6 +100,19 @@ class User(object):
         "username":'username'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cluster_identifiers":['cluster_identifier.ClusterIdentifier'],
+        "google_account":'google_account_info.GoogleAccountInfo',
+        "idp_user_info":'idp_user_info.IdpUserInfo',
+        "preferences":'preferences.Preferences',
+        "salesforce_account":'salesforce_account_info.SalesforceAccountInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  additional_group_names=None,
                  authentication_type=None,
@@ -174,65 +183,6 @@ class User(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        additional_group_names = dictionary.get('additionalGroupNames')
-        authentication_type = dictionary.get('authenticationType')
-        cluster_identifiers = None
-        if dictionary.get('clusterIdentifiers') != None:
-            cluster_identifiers = list()
-            for structure in dictionary.get('clusterIdentifiers'):
-                cluster_identifiers.append(cohesity_management_sdk.models.cluster_identifier.ClusterIdentifier.from_dictionary(structure))
-        created_time_msecs = dictionary.get('createdTimeMsecs')
-        description = dictionary.get('description')
-        domain = dictionary.get('domain')
-        effective_time_msecs = dictionary.get('effectiveTimeMsecs')
-        email_address = dictionary.get('emailAddress')
-        expired_time_msecs = dictionary.get('expiredTimeMsecs')
-        google_account = cohesity_management_sdk.models.google_account_info.GoogleAccountInfo.from_dictionary(dictionary.get('googleAccount')) if dictionary.get('googleAccount') else None
-        idp_user_info = cohesity_management_sdk.models.idp_user_info.IdpUserInfo.from_dictionary(dictionary.get('idpUserInfo')) if dictionary.get('idpUserInfo') else None
-        last_updated_time_msecs = dictionary.get('lastUpdatedTimeMsecs')
-        password = dictionary.get('password')
-        preferences = cohesity_management_sdk.models.preferences.Preferences.from_dictionary(dictionary.get('preferences')) if dictionary.get('preferences') else None
-        primary_group_name = dictionary.get('primaryGroupName')
-        privilege_ids = dictionary.get('privilegeIds')
-        restricted = dictionary.get('restricted')
-        roles = dictionary.get('roles')
-        s_3_access_key_id = dictionary.get('s3AccessKeyId')
-        s_3_account_id = dictionary.get('s3AccountId')
-        s_3_secret_key = dictionary.get('s3SecretKey')
-        salesforce_account = cohesity_management_sdk.models.salesforce_account_info.SalesforceAccountInfo.from_dictionary(dictionary.get('salesforceAccount')) if dictionary.get('salesforceAccount') else None
-        sid = dictionary.get('sid')
-        tenant_id = dictionary.get('tenantId')
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(additional_group_names,
-                   authentication_type,
-                   cluster_identifiers,
-                   created_time_msecs,
-                   description,
-                   domain,
-                   effective_time_msecs,
-                   email_address,
-                   expired_time_msecs,
-                   google_account,
-                   idp_user_info,
-                   last_updated_time_msecs,
-                   password,
-                   preferences,
-                   primary_group_name,
-                   privilege_ids,
-                   restricted,
-                   roles,
-                   s_3_access_key_id,
-                   s_3_account_id,
-                   s_3_secret_key,
-                   salesforce_account,
-                   sid,
-                   tenant_id,
-                   username)
+        return decode_model(cls, dictionary)
 
 
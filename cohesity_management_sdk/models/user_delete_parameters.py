@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UserDeleteParameters(object):
 
@@ -31,6 +32,9 @@ class UserDeleteParameters(object):
         "users":'users'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain=None,
                  tenant_id=None,
@@ -57,17 +61,6 @@ class UserDeleteParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain = dictionary.get('domain')
-        tenant_id = dictionary.get('tenantId')
-        users = dictionary.get('users')
-
-        # Return an object of this model
-        return cls(domain,
-                   tenant_id,
-                   users)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UserId(object):
 
@@ -30,6 +31,9 @@ class UserId(object):
         "unix_uid":'unixUid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  sid=None,
                  unix_uid=None):
@@ -54,15 +58,6 @@ class UserId(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        sid = dictionary.get('sid')
-        unix_uid = dictionary.get('unixUid')
-
-        # Return an object of this model
-        return cls(sid,
-                   unix_uid)
+        return decode_model(cls, dictionary)
 
 
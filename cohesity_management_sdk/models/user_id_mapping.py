@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.centrify_zone
-import cohesity_management_sdk.models.custom_unix_id_attributes
-import cohesity_management_sdk.models.fixed_unix_id_mapping
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UserIdMapping(object):
 
@@ -42,6 +40,17 @@ class UserIdMapping(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "centrify_zone_mapping":'centrify_zone.CentrifyZone',
+        "custom_attributes_mapping":'custom_unix_id_attributes.CustomUnixIdAttributes',
+        "fixed_mapping":'fixed_unix_id_mapping.FixedUnixIdMapping'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  centrify_zone_mapping=None,
                  custom_attributes_mapping=None,
@@ -70,19 +79,6 @@ class UserIdMapping(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        centrify_zone_mapping = cohesity_management_sdk.models.centrify_zone.CentrifyZone.from_dictionary(dictionary.get('centrifyZoneMapping')) if dictionary.get('centrifyZoneMapping') else None
-        custom_attributes_mapping = cohesity_management_sdk.models.custom_unix_id_attributes.CustomUnixIdAttributes.from_dictionary(dictionary.get('customAttributesMapping')) if dictionary.get('customAttributesMapping') else None
-        fixed_mapping = cohesity_management_sdk.models.fixed_unix_id_mapping.FixedUnixIdMapping.from_dictionary(dictionary.get('fixedMapping')) if dictionary.get('fixedMapping') else None
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(centrify_zone_mapping,
-                   custom_attributes_mapping,
-                   fixed_mapping,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
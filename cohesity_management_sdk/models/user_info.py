@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UserInfo(object):
 
@@ -22,6 +23,9 @@ class UserInfo(object):
         "user_name":'userName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  domain=None,
                  sid=None,
@@ -48,17 +52,6 @@ class UserInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        domain = dictionary.get('domain')
-        sid = dictionary.get('sid')
-        user_name = dictionary.get('userName')
-
-        # Return an object of this model
-        return cls(domain,
-                   sid,
-                   user_name)
+        return decode_model(cls, dictionary)
 
 
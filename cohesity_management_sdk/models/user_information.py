@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.key_value_pair
-import cohesity_management_sdk.models.cluster_config_proto_sid
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UserInformation(object):
 
@@ -46,6 +45,16 @@ class UserInformation(object):
         "tenant_id_vec":'tenantIdVec'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "pulse_attribute_vec":['key_value_pair.KeyValuePair'],
+        "sid_vec":['cluster_config_proto_sid.ClusterConfigProtoSID']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  include_subtenant_objects=None,
                  pulse_attribute_vec=None,
@@ -74,27 +83,6 @@ class UserInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        include_subtenant_objects = dictionary.get('includeSubtenantObjects')
-        pulse_attribute_vec = None
-        if dictionary.get('pulseAttributeVec') != None:
-            pulse_attribute_vec = list()
-            for structure in dictionary.get('pulseAttributeVec'):
-                pulse_attribute_vec.append(cohesity_management_sdk.models.key_value_pair.KeyValuePair.from_dictionary(structure))
-        sid_vec = None
-        if dictionary.get('sidVec') != None:
-            sid_vec = list()
-            for structure in dictionary.get('sidVec'):
-                sid_vec.append(cohesity_management_sdk.models.cluster_config_proto_sid.ClusterConfigProtoSID.from_dictionary(structure))
-        tenant_id_vec = dictionary.get('tenantIdVec')
-
-        # Return an object of this model
-        return cls(include_subtenant_objects,
-                   pulse_attribute_vec,
-                   sid_vec,
-                   tenant_id_vec)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.cluster_identifier
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UserParameters(object):
 
@@ -63,6 +63,15 @@ class UserParameters(object):
         "username":'username'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cluster_identifiers":['cluster_identifier.ClusterIdentifier']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  additional_group_names=None,
                  cluster_identifiers=None,
@@ -109,41 +118,6 @@ class UserParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        additional_group_names = dictionary.get('additionalGroupNames')
-        cluster_identifiers = None
-        if dictionary.get('clusterIdentifiers') != None:
-            cluster_identifiers = list()
-            for structure in dictionary.get('clusterIdentifiers'):
-                cluster_identifiers.append(cohesity_management_sdk.models.cluster_identifier.ClusterIdentifier.from_dictionary(structure))
-        description = dictionary.get('description')
-        domain = dictionary.get('domain')
-        effective_time_msecs = dictionary.get('effectiveTimeMsecs')
-        email_address = dictionary.get('emailAddress')
-        expired_time_msecs = dictionary.get('expiredTimeMsecs')
-        password = dictionary.get('password')
-        primary_group_name = dictionary.get('primaryGroupName')
-        privilege_ids = dictionary.get('privilegeIds')
-        restricted = dictionary.get('restricted')
-        roles = dictionary.get('roles')
-        username = dictionary.get('username')
-
-        # Return an object of this model
-        return cls(additional_group_names,
-                   cluster_identifiers,
-                   description,
-                   domain,
-                   effective_time_msecs,
-                   email_address,
-                   expired_time_msecs,
-                   password,
-                   primary_group_name,
-                   privilege_ids,
-                   restricted,
-                   roles,
-                   username)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.quota_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UserQuotaAndUsage(object):
 
@@ -52,6 +52,15 @@ class UserQuotaAndUsage(object):
         "usage_bytes":'usageBytes'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "quota_policy":'quota_policy.QuotaPolicy'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  quota_policy=None,
                  sid=None,
@@ -80,19 +89,6 @@ class UserQuotaAndUsage(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        quota_policy = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('quotaPolicy')) if dictionary.get('quotaPolicy') else None
-        sid = dictionary.get('sid')
-        unix_uid = dictionary.get('unixUid')
-        usage_bytes = dictionary.get('usageBytes')
-
-        # Return an object of this model
-        return cls(quota_policy,
-                   sid,
-                   unix_uid,
-                   usage_bytes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.quota_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UserQuotaSettings(object):
 
@@ -38,6 +38,15 @@ class UserQuotaSettings(object):
         "enable_user_quota":'enableUserQuota'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "default_user_quota_policy":'quota_policy.QuotaPolicy'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  default_user_quota_policy=None,
                  enable_user_quota=None):
@@ -62,15 +71,6 @@ class UserQuotaSettings(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        default_user_quota_policy = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('defaultUserQuotaPolicy')) if dictionary.get('defaultUserQuotaPolicy') else None
-        enable_user_quota = dictionary.get('enableUserQuota')
-
-        # Return an object of this model
-        return cls(default_user_quota_policy,
-                   enable_user_quota)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UserQuotaSummaryForUser(object):
 
@@ -25,6 +26,9 @@ class UserQuotaSummaryForUser(object):
         "total_num_views":'totalNumViews'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  num_views_above_alert_threshold=None,
                  num_views_above_hard_limit=None,
@@ -51,17 +55,6 @@ class UserQuotaSummaryForUser(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        num_views_above_alert_threshold = dictionary.get('numViewsAboveAlertThreshold')
-        num_views_above_hard_limit = dictionary.get('numViewsAboveHardLimit')
-        total_num_views = dictionary.get('totalNumViews')
-
-        # Return an object of this model
-        return cls(num_views_above_alert_threshold,
-                   num_views_above_hard_limit,
-                   total_num_views)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.quota_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UserQuotaSummaryForView(object):
 
@@ -44,6 +44,15 @@ class UserQuotaSummaryForView(object):
         "total_num_users":'totalNumUsers'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "default_user_quota_policy":'quota_policy.QuotaPolicy'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  default_user_quota_policy=None,
                  num_users_above_alert_threshold=None,
@@ -72,19 +81,6 @@ class UserQuotaSummaryForView(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        default_user_quota_policy = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('defaultUserQuotaPolicy')) if dictionary.get('defaultUserQuotaPolicy') else None
-        num_users_above_alert_threshold = dictionary.get('numUsersAboveAlertThreshold')
-        num_users_above_hard_limit = dictionary.get('numUsersAboveHardLimit')
-        total_num_users = dictionary.get('totalNumUsers')
-
-        # Return an object of this model
-        return cls(default_user_quota_policy,
-                   num_users_above_alert_threshold,
-                   num_users_above_hard_limit,
-                   total_num_users)
+        return decode_model(cls, dictionary)
 
 
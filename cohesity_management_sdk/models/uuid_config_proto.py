@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class UuidConfigProto(object):
 
@@ -18,6 +19,9 @@ class UuidConfigProto(object):
         "preserve_uuid":'preserveUuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  preserve_uuid=None):
         """Constructor for the UuidConfigProto class"""
@@ -40,13 +44,6 @@ class UuidConfigProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        preserve_uuid = dictionary.get('preserveUuid')
-
-        # Return an object of this model
-        return cls(preserve_uuid)
+        return decode_model(cls, dictionary)
 
 
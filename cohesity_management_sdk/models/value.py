@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.value_data
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Value(object):
 
@@ -25,6 +25,15 @@ class Value(object):
         "mtype":'type'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "data":'value_data.ValueData'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data=None,
                  mtype=None):
@@ -49,15 +58,6 @@ class Value(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data = cohesity_management_sdk.models.value_data.ValueData.from_dictionary(dictionary.get('data')) if dictionary.get('data') else None
-        mtype = dictionary.get('type')
-
-        # Return an object of this model
-        return cls(data,
-                   mtype)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ValueData(object):
 
@@ -33,6 +34,9 @@ class ValueData(object):
         "string_value":'stringValue'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bytes_value=None,
                  double_value=None,
@@ -61,19 +65,6 @@ class ValueData(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bytes_value = dictionary.get('bytesValue')
-        double_value = dictionary.get('doubleValue')
-        int_64_value = dictionary.get('int64Value')
-        string_value = dictionary.get('stringValue')
-
-        # Return an object of this model
-        return cls(bytes_value,
-                   double_value,
-                   int_64_value,
-                   string_value)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.vault_config
-import cohesity_management_sdk.models.vault_bandwidth_limits
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Vault(object):
 
@@ -148,6 +147,16 @@ class Vault(object):
         "vault_bandwidth_limits":'vaultBandwidthLimits'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "config":'vault_config.VaultConfig',
+        "vault_bandwidth_limits":'vault_bandwidth_limits.VaultBandwidthLimits'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  ca_trusted_certificate=None,
                  client_certificate=None,
@@ -210,53 +219,6 @@ class Vault(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        ca_trusted_certificate = dictionary.get('caTrustedCertificate')
-        client_certificate = dictionary.get('clientCertificate')
-        client_private_key = dictionary.get('clientPrivateKey')
-        compression_policy = dictionary.get('compressionPolicy')
-        config = cohesity_management_sdk.models.vault_config.VaultConfig.from_dictionary(dictionary.get('config')) if dictionary.get('config') else None
-        customer_managing_encryption_keys = dictionary.get('customerManagingEncryptionKeys')
-        dedup_enabled = dictionary.get('dedupEnabled')
-        description = dictionary.get('description')
-        desired_wal_location = dictionary.get('desiredWalLocation')
-        encryption_key_file_downloaded = dictionary.get('encryptionKeyFileDownloaded')
-        encryption_policy = dictionary.get('encryptionPolicy')
-        external_target_type = dictionary.get('externalTargetType')
-        full_archive_interval_days = dictionary.get('fullArchiveIntervalDays')
-        id = dictionary.get('id')
-        incremental_archives_enabled = dictionary.get('incrementalArchivesEnabled')
-        key_file_download_time_usecs = dictionary.get('keyFileDownloadTimeUsecs')
-        key_file_download_user = dictionary.get('keyFileDownloadUser')
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-        usage_type = dictionary.get('usageType')
-        vault_bandwidth_limits = cohesity_management_sdk.models.vault_bandwidth_limits.VaultBandwidthLimits.from_dictionary(dictionary.get('vaultBandwidthLimits')) if dictionary.get('vaultBandwidthLimits') else None
-
-        # Return an object of this model
-        return cls(ca_trusted_certificate,
-                   client_certificate,
-                   client_private_key,
-                   compression_policy,
-                   config,
-                   customer_managing_encryption_keys,
-                   dedup_enabled,
-                   description,
-                   desired_wal_location,
-                   encryption_key_file_downloaded,
-                   encryption_policy,
-                   external_target_type,
-                   full_archive_interval_days,
-                   id,
-                   incremental_archives_enabled,
-                   key_file_download_time_usecs,
-                   key_file_download_user,
-                   name,
-                   mtype,
-                   usage_type,
-                   vault_bandwidth_limits)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.bandwidth_limit
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VaultBandwidthLimits(object):
 
@@ -24,6 +24,16 @@ class VaultBandwidthLimits(object):
         "upload":'upload'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "download":'bandwidth_limit.BandwidthLimit',
+        "upload":'bandwidth_limit.BandwidthLimit'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  download=None,
                  upload=None):
@@ -48,15 +58,6 @@ class VaultBandwidthLimits(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        download = cohesity_management_sdk.models.bandwidth_limit.BandwidthLimit.from_dictionary(dictionary.get('download')) if dictionary.get('download') else None
-        upload = cohesity_management_sdk.models.bandwidth_limit.BandwidthLimit.from_dictionary(dictionary.get('upload')) if dictionary.get('upload') else None
-
-        # Return an object of this model
-        return cls(download,
-                   upload)
+        return decode_model(cls, dictionary)
 
 
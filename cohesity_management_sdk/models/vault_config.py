@@ -1,12 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.amazon_cloud_credentials
-import cohesity_management_sdk.models.azure_cloud_credentials
-import cohesity_management_sdk.models.google_cloud_credentials
-import cohesity_management_sdk.models.nas_credentials
-import cohesity_management_sdk.models.oracle_cloud_credentials
-import cohesity_management_sdk.models.q_star_server_credentials
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VaultConfig(object):
 
@@ -50,6 +45,20 @@ class VaultConfig(object):
         "qstar":'qstar'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "amazon":'amazon_cloud_credentials.AmazonCloudCredentials',
+        "azure":'azure_cloud_credentials.AzureCloudCredentials',
+        "google":'google_cloud_credentials.GoogleCloudCredentials',
+        "nas":'nas_credentials.NasCredentials',
+        "oracle":'oracle_cloud_credentials.OracleCloudCredentials',
+        "qstar":'q_star_server_credentials.QStarServerCredentials'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  amazon=None,
                  azure=None,
@@ -84,25 +93,6 @@ class VaultConfig(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        amazon = cohesity_management_sdk.models.amazon_cloud_credentials.AmazonCloudCredentials.from_dictionary(dictionary.get('amazon')) if dictionary.get('amazon') else None
-        azure = cohesity_management_sdk.models.azure_cloud_credentials.AzureCloudCredentials.from_dictionary(dictionary.get('azure')) if dictionary.get('azure') else None
-        bucket_name = dictionary.get('bucketName')
-        google = cohesity_management_sdk.models.google_cloud_credentials.GoogleCloudCredentials.from_dictionary(dictionary.get('google')) if dictionary.get('google') else None
-        nas = cohesity_management_sdk.models.nas_credentials.NasCredentials.from_dictionary(dictionary.get('nas')) if dictionary.get('nas') else None
-        oracle = cohesity_management_sdk.models.oracle_cloud_credentials.OracleCloudCredentials.from_dictionary(dictionary.get('oracle')) if dictionary.get('oracle') else None
-        qstar = cohesity_management_sdk.models.q_star_server_credentials.QStarServerCredentials.from_dictionary(dictionary.get('qstar')) if dictionary.get('qstar') else None
-
-        # Return an object of this model
-        return cls(amazon,
-                   azure,
-                   bucket_name,
-                   google,
-                   nas,
-                   oracle,
-                   qstar)
+        return decode_model(cls, dictionary)
 
 
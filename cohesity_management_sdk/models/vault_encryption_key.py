@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.universal_id
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VaultEncryptionKey(object):
 
@@ -33,6 +33,15 @@ class VaultEncryptionKey(object):
         "vault_name":'vaultName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "key_uid":'universal_id.UniversalId'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_name=None,
                  encryption_key_data=None,
@@ -63,21 +72,6 @@ class VaultEncryptionKey(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_name = dictionary.get('clusterName')
-        encryption_key_data = dictionary.get('encryptionKeyData')
-        key_uid = cohesity_management_sdk.models.universal_id.UniversalId.from_dictionary(dictionary.get('keyUid')) if dictionary.get('keyUid') else None
-        vault_id = dictionary.get('vaultId')
-        vault_name = dictionary.get('vaultName')
-
-        # Return an object of this model
-        return cls(cluster_name,
-                   encryption_key_data,
-                   key_uid,
-                   vault_id,
-                   vault_name)
+        return decode_model(cls, dictionary)
 
 
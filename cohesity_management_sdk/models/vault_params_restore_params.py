@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.vault_params_restore_params_glacier
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VaultParamsRestoreParams(object):
 
@@ -20,6 +20,15 @@ class VaultParamsRestoreParams(object):
         "glacier":'glacier'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "glacier":'vault_params_restore_params_glacier.VaultParamsRestoreParamsGlacier'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  glacier=None):
         """Constructor for the VaultParamsRestoreParams class"""
@@ -42,13 +51,6 @@ class VaultParamsRestoreParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        glacier = cohesity_management_sdk.models.vault_params_restore_params_glacier.VaultParamsRestoreParamsGlacier.from_dictionary(dictionary.get('glacier')) if dictionary.get('glacier') else None
-
-        # Return an object of this model
-        return cls(glacier)
+        return decode_model(cls, dictionary)
 
 
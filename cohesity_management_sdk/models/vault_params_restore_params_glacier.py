@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VaultParamsRestoreParamsGlacier(object):
 
@@ -18,6 +19,9 @@ class VaultParamsRestoreParamsGlacier(object):
         "retrieval_type":'retrievalType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  retrieval_type=None):
         """Constructor for the VaultParamsRestoreParamsGlacier class"""
@@ -40,13 +44,6 @@ class VaultParamsRestoreParamsGlacier(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        retrieval_type = dictionary.get('retrievalType')
-
-        # Return an object of this model
-        return cls(retrieval_type)
+        return decode_model(cls, dictionary)
 
 
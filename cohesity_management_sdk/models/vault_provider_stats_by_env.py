@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VaultProviderStatsByEnv(object):
 
@@ -25,6 +26,9 @@ class VaultProviderStatsByEnv(object):
         "size":'size'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  count=None,
                  environment=None,
@@ -51,17 +55,6 @@ class VaultProviderStatsByEnv(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        count = dictionary.get('count')
-        environment = dictionary.get('environment')
-        size = dictionary.get('size')
-
-        # Return an object of this model
-        return cls(count,
-                   environment,
-                   size)
+        return decode_model(cls, dictionary)
 
 
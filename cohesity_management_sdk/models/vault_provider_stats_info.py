@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.vault_provider_stats_by_env
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VaultProviderStatsInfo(object):
 
@@ -45,6 +45,15 @@ class VaultProviderStatsInfo(object):
         "write_bandwidth":'writeBandwidth'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "stats_by_env":['vault_provider_stats_by_env.VaultProviderStatsByEnv']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  change_rate=None,
                  cluster_id=None,
@@ -87,37 +96,6 @@ class VaultProviderStatsInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        change_rate = dictionary.get('changeRate')
-        cluster_id = dictionary.get('clusterId')
-        cluster_incarnation_id = dictionary.get('clusterIncarnationId')
-        cluster_name = dictionary.get('clusterName')
-        read_bandwidth = dictionary.get('readBandwidth')
-        stats_by_env = None
-        if dictionary.get('statsByEnv') != None:
-            stats_by_env = list()
-            for structure in dictionary.get('statsByEnv'):
-                stats_by_env.append(cohesity_management_sdk.models.vault_provider_stats_by_env.VaultProviderStatsByEnv.from_dictionary(structure))
-        vault_group = dictionary.get('vaultGroup')
-        vault_id = dictionary.get('vaultId')
-        vault_type = dictionary.get('vaultType')
-        vaultname = dictionary.get('vaultname')
-        write_bandwidth = dictionary.get('writeBandwidth')
-
-        # Return an object of this model
-        return cls(change_rate,
-                   cluster_id,
-                   cluster_incarnation_id,
-                   cluster_name,
-                   read_bandwidth,
-                   stats_by_env,
-                   vault_group,
-                   vault_id,
-                   vault_type,
-                   vaultname,
-                   write_bandwidth)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VaultRunInfo(object):
 
@@ -23,6 +24,9 @@ class VaultRunInfo(object):
         "timestamp":'timestamp'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  count=None,
                  timestamp=None):
@@ -47,15 +51,6 @@ class VaultRunInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        count = dictionary.get('count')
-        timestamp = dictionary.get('timestamp')
-
-        # Return an object of this model
-        return cls(count,
-                   timestamp)
+        return decode_model(cls, dictionary)
 
 
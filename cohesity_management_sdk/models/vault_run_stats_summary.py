@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.vault_run_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VaultRunStatsSummary(object):
 
@@ -36,6 +36,16 @@ class VaultRunStatsSummary(object):
         "success_time_series":'successTimeSeries'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "failure_time_series":['vault_run_info.VaultRunInfo'],
+        "success_time_series":['vault_run_info.VaultRunInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  failure_time_series=None,
                  num_failed_runs=None,
@@ -68,31 +78,6 @@ class VaultRunStatsSummary(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        failure_time_series = None
-        if dictionary.get('failureTimeSeries') != None:
-            failure_time_series = list()
-            for structure in dictionary.get('failureTimeSeries'):
-                failure_time_series.append(cohesity_management_sdk.models.vault_run_info.VaultRunInfo.from_dictionary(structure))
-        num_failed_runs = dictionary.get('numFailedRuns')
-        num_in_progress_runs = dictionary.get('numInProgressRuns')
-        num_queued_runs = dictionary.get('numQueuedRuns')
-        num_successful_runs = dictionary.get('numSuccessfulRuns')
-        success_time_series = None
-        if dictionary.get('successTimeSeries') != None:
-            success_time_series = list()
-            for structure in dictionary.get('successTimeSeries'):
-                success_time_series.append(cohesity_management_sdk.models.vault_run_info.VaultRunInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(failure_time_series,
-                   num_failed_runs,
-                   num_in_progress_runs,
-                   num_queued_runs,
-                   num_successful_runs,
-                   success_time_series)
+        return decode_model(cls, dictionary)
 
 
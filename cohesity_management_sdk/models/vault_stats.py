@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.vault_stats_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VaultStats(object):
 
@@ -36,6 +36,15 @@ class VaultStats(object):
         "vault_stats_list":'vaultStatsList'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "vault_stats_list":['vault_stats_info.VaultStatsInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  aws_usage_bytes=None,
                  azure_usage_bytes=None,
@@ -72,31 +81,6 @@ class VaultStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        aws_usage_bytes = dictionary.get('awsUsageBytes')
-        azure_usage_bytes = dictionary.get('azureUsageBytes')
-        gcp_usage_bytes = dictionary.get('gcpUsageBytes')
-        nas_usage_bytes = dictionary.get('nasUsageBytes')
-        oracle_usage_bytes = dictionary.get('oracleUsageBytes')
-        qstar_usage_bytes = dictionary.get('qstarUsageBytes')
-        s_3_c_usage_bytes = dictionary.get('s3cUsageBytes')
-        vault_stats_list = None
-        if dictionary.get('vaultStatsList') != None:
-            vault_stats_list = list()
-            for structure in dictionary.get('vaultStatsList'):
-                vault_stats_list.append(cohesity_management_sdk.models.vault_stats_info.VaultStatsInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(aws_usage_bytes,
-                   azure_usage_bytes,
-                   gcp_usage_bytes,
-                   nas_usage_bytes,
-                   oracle_usage_bytes,
-                   qstar_usage_bytes,
-                   s_3_c_usage_bytes,
-                   vault_stats_list)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VaultStatsInfo(object):
 
@@ -24,6 +25,9 @@ class VaultStatsInfo(object):
         "usage_bytes":'usageBytes'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  id=None,
                  name=None,
@@ -52,19 +56,6 @@ class VaultStatsInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        id = dictionary.get('id')
-        name = dictionary.get('name')
-        mtype = dictionary.get('type')
-        usage_bytes = dictionary.get('usageBytes')
-
-        # Return an object of this model
-        return cls(id,
-                   name,
-                   mtype,
-                   usage_bytes)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VcloudDirectorInfo(object):
 
@@ -20,6 +21,9 @@ class VcloudDirectorInfo(object):
         "name":'name'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  endpoint=None,
                  name=None):
@@ -44,15 +48,6 @@ class VcloudDirectorInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        endpoint = dictionary.get('endpoint')
-        name = dictionary.get('name')
-
-        # Return an object of this model
-        return cls(endpoint,
-                   name)
+        return decode_model(cls, dictionary)
 
 
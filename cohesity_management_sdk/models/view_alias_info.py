@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.cluster_config_proto_subnet
-import cohesity_management_sdk.models.alias_smb_config
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewAliasInfo(object):
 
@@ -29,6 +28,16 @@ class ViewAliasInfo(object):
         "view_path":'viewPath'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "client_subnet_whitelist":['cluster_config_proto_subnet.ClusterConfigProtoSubnet'],
+        "smb_config":'alias_smb_config.AliasSmbConfig'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  alias_name=None,
                  client_subnet_whitelist=None,
@@ -57,23 +66,6 @@ class ViewAliasInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        alias_name = dictionary.get('aliasName')
-        client_subnet_whitelist = None
-        if dictionary.get('clientSubnetWhitelist') != None:
-            client_subnet_whitelist = list()
-            for structure in dictionary.get('clientSubnetWhitelist'):
-                client_subnet_whitelist.append(cohesity_management_sdk.models.cluster_config_proto_subnet.ClusterConfigProtoSubnet.from_dictionary(structure))
-        smb_config = cohesity_management_sdk.models.alias_smb_config.AliasSmbConfig.from_dictionary(dictionary.get('smbConfig')) if dictionary.get('smbConfig') else None
-        view_path = dictionary.get('viewPath')
-
-        # Return an object of this model
-        return cls(alias_name,
-                   client_subnet_whitelist,
-                   smb_config,
-                   view_path)
+        return decode_model(cls, dictionary)
 
 
@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.subnet
-import cohesity_management_sdk.models.quota_policy
-import cohesity_management_sdk.models.schema_info
-import cohesity_management_sdk.models.view_box_stats
-import cohesity_management_sdk.models.storage_policy
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewBox(object):
 
@@ -132,6 +128,21 @@ class ViewBox(object):
         "treat_file_sync_as_data_sync":'treatFileSyncAsDataSync'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "client_subnet_white_list":['subnet.Subnet'],
+        "default_user_quota_policy":'quota_policy.QuotaPolicy',
+        "default_view_quota_policy":'quota_policy.QuotaPolicy',
+        "physical_quota":'quota_policy.QuotaPolicy',
+        "schema_info_list":['schema_info.SchemaInfo'],
+        "stats":'view_box_stats.ViewBoxStats',
+        "storage_policy":'storage_policy.StoragePolicy'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_partition_id=None,
                  name=None,
@@ -190,57 +201,6 @@ class ViewBox(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_partition_id = dictionary.get('clusterPartitionId')
-        name = dictionary.get('name')
-        ad_domain_name = dictionary.get('adDomainName')
-        client_subnet_white_list = None
-        if dictionary.get('clientSubnetWhiteList') != None:
-            client_subnet_white_list = list()
-            for structure in dictionary.get('clientSubnetWhiteList'):
-                client_subnet_white_list.append(cohesity_management_sdk.models.subnet.Subnet.from_dictionary(structure))
-        cloud_down_waterfall_threshold_pct = dictionary.get('cloudDownWaterfallThresholdPct')
-        cloud_down_waterfall_threshold_secs = dictionary.get('cloudDownWaterfallThresholdSecs')
-        cluster_partition_name = dictionary.get('clusterPartitionName')
-        default_user_quota_policy = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('defaultUserQuotaPolicy')) if dictionary.get('defaultUserQuotaPolicy') else None
-        default_view_quota_policy = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('defaultViewQuotaPolicy')) if dictionary.get('defaultViewQuotaPolicy') else None
-        id = dictionary.get('id')
-        ldap_provider_id = dictionary.get('ldapProviderId')
-        physical_quota = cohesity_management_sdk.models.quota_policy.QuotaPolicy.from_dictionary(dictionary.get('physicalQuota')) if dictionary.get('physicalQuota') else None
-        removal_state = dictionary.get('removalState')
-        s_3_buckets_allowed = dictionary.get('s3BucketsAllowed')
-        schema_info_list = None
-        if dictionary.get('schemaInfoList') != None:
-            schema_info_list = list()
-            for structure in dictionary.get('schemaInfoList'):
-                schema_info_list.append(cohesity_management_sdk.models.schema_info.SchemaInfo.from_dictionary(structure))
-        stats = cohesity_management_sdk.models.view_box_stats.ViewBoxStats.from_dictionary(dictionary.get('stats')) if dictionary.get('stats') else None
-        storage_policy = cohesity_management_sdk.models.storage_policy.StoragePolicy.from_dictionary(dictionary.get('storagePolicy')) if dictionary.get('storagePolicy') else None
-        tenant_id_vec = dictionary.get('tenantIdVec')
-        treat_file_sync_as_data_sync = dictionary.get('treatFileSyncAsDataSync')
-
-        # Return an object of this model
-        return cls(cluster_partition_id,
-                   name,
-                   ad_domain_name,
-                   client_subnet_white_list,
-                   cloud_down_waterfall_threshold_pct,
-                   cloud_down_waterfall_threshold_secs,
-                   cluster_partition_name,
-                   default_user_quota_policy,
-                   default_view_quota_policy,
-                   id,
-                   ldap_provider_id,
-                   physical_quota,
-                   removal_state,
-                   s_3_buckets_allowed,
-                   schema_info_list,
-                   stats,
-                   storage_policy,
-                   tenant_id_vec,
-                   treat_file_sync_as_data_sync)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewBoxPairInfo(object):
 
@@ -35,6 +36,9 @@ class ViewBoxPairInfo(object):
         "remote_view_box_name":'remoteViewBoxName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  local_view_box_id=None,
                  local_view_box_name=None,
@@ -63,19 +67,6 @@ class ViewBoxPairInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        local_view_box_id = dictionary.get('localViewBoxId')
-        local_view_box_name = dictionary.get('localViewBoxName')
-        remote_view_box_id = dictionary.get('remoteViewBoxId')
-        remote_view_box_name = dictionary.get('remoteViewBoxName')
-
-        # Return an object of this model
-        return cls(local_view_box_id,
-                   local_view_box_name,
-                   remote_view_box_id,
-                   remote_view_box_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.usage_and_performance_stats
-import cohesity_management_sdk.models.data_usage_stats
-import cohesity_management_sdk.models.logical_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewBoxStats(object):
 
@@ -44,6 +42,19 @@ class ViewBoxStats(object):
         "usage_perf_stats":'usagePerfStats'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "cloud_usage_perf_stats":'usage_and_performance_stats.UsageAndPerformanceStats',
+        "data_usage_stats":'data_usage_stats.DataUsageStats',
+        "local_usage_perf_stats":'usage_and_performance_stats.UsageAndPerformanceStats',
+        "logical_stats":'logical_stats.LogicalStats',
+        "usage_perf_stats":'usage_and_performance_stats.UsageAndPerformanceStats'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cloud_usage_perf_stats=None,
                  data_usage_stats=None,
@@ -76,23 +87,6 @@ class ViewBoxStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cloud_usage_perf_stats = cohesity_management_sdk.models.usage_and_performance_stats.UsageAndPerformanceStats.from_dictionary(dictionary.get('cloudUsagePerfStats')) if dictionary.get('cloudUsagePerfStats') else None
-        data_usage_stats = cohesity_management_sdk.models.data_usage_stats.DataUsageStats.from_dictionary(dictionary.get('dataUsageStats')) if dictionary.get('dataUsageStats') else None
-        id = dictionary.get('id')
-        local_usage_perf_stats = cohesity_management_sdk.models.usage_and_performance_stats.UsageAndPerformanceStats.from_dictionary(dictionary.get('localUsagePerfStats')) if dictionary.get('localUsagePerfStats') else None
-        logical_stats = cohesity_management_sdk.models.logical_stats.LogicalStats.from_dictionary(dictionary.get('logicalStats')) if dictionary.get('logicalStats') else None
-        usage_perf_stats = cohesity_management_sdk.models.usage_and_performance_stats.UsageAndPerformanceStats.from_dictionary(dictionary.get('usagePerfStats')) if dictionary.get('usagePerfStats') else None
-
-        # Return an object of this model
-        return cls(cloud_usage_perf_stats,
-                   data_usage_stats,
-                   id,
-                   local_usage_perf_stats,
-                   logical_stats,
-                   usage_perf_stats)
+        return decode_model(cls, dictionary)
 
 
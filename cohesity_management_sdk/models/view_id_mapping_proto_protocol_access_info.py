@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewIdMappingProtoProtocolAccessInfo(object):
 
@@ -24,6 +25,9 @@ class ViewIdMappingProtoProtocolAccessInfo(object):
         "smb_access":'smbAccess'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  iscsi_access=None,
                  nfs_access=None,
@@ -52,19 +56,6 @@ class ViewIdMappingProtoProtocolAccessInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        iscsi_access = dictionary.get('iscsiAccess')
-        nfs_access = dictionary.get('nfsAccess')
-        s_3_access = dictionary.get('s3Access')
-        smb_access = dictionary.get('smbAccess')
-
-        # Return an object of this model
-        return cls(iscsi_access,
-                   nfs_access,
-                   s_3_access,
-                   smb_access)
+        return decode_model(cls, dictionary)
 
 
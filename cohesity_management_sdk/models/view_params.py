@@ -1,10 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.cluster_config_proto_subnet
-import cohesity_management_sdk.models.view_id_mapping_proto_protocol_access_info
-import cohesity_management_sdk.models.cluster_config_proto_qo_s_mapping
-import cohesity_management_sdk.models.cluster_config_proto_storage_policy_override
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewParams(object):
 
@@ -45,6 +42,18 @@ class ViewParams(object):
         "worm_lock_expiry_usecs":'wormLockExpiryUsecs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "client_subnet_whitelist_vec":['cluster_config_proto_subnet.ClusterConfigProtoSubnet'],
+        "protocol_access_info":'view_id_mapping_proto_protocol_access_info.ViewIdMappingProtoProtocolAccessInfo',
+        "qos_mapping_vec":['cluster_config_proto_qo_s_mapping.ClusterConfigProtoQoSMapping'],
+        "storage_policy_override":'cluster_config_proto_storage_policy_override.ClusterConfigProtoStoragePolicyOverride'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  client_subnet_whitelist_vec=None,
                  disable_nfs_access=None,
@@ -79,33 +88,6 @@ class ViewParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        client_subnet_whitelist_vec = None
-        if dictionary.get('clientSubnetWhitelistVec') != None:
-            client_subnet_whitelist_vec = list()
-            for structure in dictionary.get('clientSubnetWhitelistVec'):
-                client_subnet_whitelist_vec.append(cohesity_management_sdk.models.cluster_config_proto_subnet.ClusterConfigProtoSubnet.from_dictionary(structure))
-        disable_nfs_access = dictionary.get('disableNfsAccess')
-        protocol_access_info = cohesity_management_sdk.models.view_id_mapping_proto_protocol_access_info.ViewIdMappingProtoProtocolAccessInfo.from_dictionary(dictionary.get('protocolAccessInfo')) if dictionary.get('protocolAccessInfo') else None
-        qos_mapping_vec = None
-        if dictionary.get('qosMappingVec') != None:
-            qos_mapping_vec = list()
-            for structure in dictionary.get('qosMappingVec'):
-                qos_mapping_vec.append(cohesity_management_sdk.models.cluster_config_proto_qo_s_mapping.ClusterConfigProtoQoSMapping.from_dictionary(structure))
-        storage_policy_override = cohesity_management_sdk.models.cluster_config_proto_storage_policy_override.ClusterConfigProtoStoragePolicyOverride.from_dictionary(dictionary.get('storagePolicyOverride')) if dictionary.get('storagePolicyOverride') else None
-        view_description = dictionary.get('viewDescription')
-        worm_lock_expiry_usecs = dictionary.get('wormLockExpiryUsecs')
-
-        # Return an object of this model
-        return cls(client_subnet_whitelist_vec,
-                   disable_nfs_access,
-                   protocol_access_info,
-                   qos_mapping_vec,
-                   storage_policy_override,
-                   view_description,
-                   worm_lock_expiry_usecs)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_job_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewProtection(object):
 
@@ -28,6 +28,15 @@ class ViewProtection(object):
         "protection_jobs":'protectionJobs'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "protection_jobs":['protection_job_info.ProtectionJobInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  inactive=None,
                  magneto_entity_id=None,
@@ -54,21 +63,6 @@ class ViewProtection(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        inactive = dictionary.get('inactive')
-        magneto_entity_id = dictionary.get('magnetoEntityId')
-        protection_jobs = None
-        if dictionary.get('protectionJobs') != None:
-            protection_jobs = list()
-            for structure in dictionary.get('protectionJobs'):
-                protection_jobs.append(cohesity_management_sdk.models.protection_job_info.ProtectionJobInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(inactive,
-                   magneto_entity_id,
-                   protection_jobs)
+        return decode_model(cls, dictionary)
 
 
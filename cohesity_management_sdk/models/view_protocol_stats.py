@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewProtocolStats(object):
 
@@ -25,6 +26,9 @@ class ViewProtocolStats(object):
         "view_count":'viewCount'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  protocols=None,
                  size_bytes=None,
@@ -51,17 +55,6 @@ class ViewProtocolStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        protocols = dictionary.get('protocols')
-        size_bytes = dictionary.get('sizeBytes')
-        view_count = dictionary.get('viewCount')
-
-        # Return an object of this model
-        return cls(protocols,
-                   size_bytes,
-                   view_count)
+        return decode_model(cls, dictionary)
 
 
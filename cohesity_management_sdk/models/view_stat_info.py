@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewStatInfo(object):
 
@@ -47,6 +48,9 @@ class ViewStatInfo(object):
         "view_name":'viewName'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cluster_id=None,
                  cluster_incarnation_id=None,
@@ -91,35 +95,6 @@ class ViewStatInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cluster_id = dictionary.get('clusterId')
-        cluster_incarnation_id = dictionary.get('clusterIncarnationId')
-        data_read_bytes = dictionary.get('dataReadBytes')
-        data_written_bytes = dictionary.get('dataWrittenBytes')
-        logical_used_bytes = dictionary.get('logicalUsedBytes')
-        peak_read_throughput = dictionary.get('peakReadThroughput')
-        peak_write_throughput = dictionary.get('peakWriteThroughput')
-        physical_used_bytes = dictionary.get('physicalUsedBytes')
-        protocols = dictionary.get('protocols')
-        storage_reduction_ratio = dictionary.get('storageReductionRatio')
-        view_id = dictionary.get('viewId')
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(cluster_id,
-                   cluster_incarnation_id,
-                   data_read_bytes,
-                   data_written_bytes,
-                   logical_used_bytes,
-                   peak_read_throughput,
-                   peak_write_throughput,
-                   physical_used_bytes,
-                   protocols,
-                   storage_reduction_ratio,
-                   view_id,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.data_usage_stats
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewStats(object):
 
@@ -23,6 +23,15 @@ class ViewStats(object):
         "id":'id'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "data_usage_stats":'data_usage_stats.DataUsageStats'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data_usage_stats=None,
                  id=None):
@@ -47,15 +56,6 @@ class ViewStats(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data_usage_stats = cohesity_management_sdk.models.data_usage_stats.DataUsageStats.from_dictionary(dictionary.get('dataUsageStats')) if dictionary.get('dataUsageStats') else None
-        id = dictionary.get('id')
-
-        # Return an object of this model
-        return cls(data_usage_stats,
-                   id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.view_stat_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewStatsSnapshot(object):
 
@@ -23,6 +23,15 @@ class ViewStatsSnapshot(object):
         "view_stats_list":'viewStatsList'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "view_stats_list":['view_stat_info.ViewStatInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  timestamp=None,
                  view_stats_list=None):
@@ -47,19 +56,6 @@ class ViewStatsSnapshot(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        timestamp = dictionary.get('timestamp')
-        view_stats_list = None
-        if dictionary.get('viewStatsList') != None:
-            view_stats_list = list()
-            for structure in dictionary.get('viewStatsList'):
-                view_stats_list.append(cohesity_management_sdk.models.view_stat_info.ViewStatInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(timestamp,
-                   view_stats_list)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.user_quota
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewUserQuotaParameters(object):
 
@@ -22,6 +22,15 @@ class ViewUserQuotaParameters(object):
         "view_name":'viewName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "user_quota_policy":'user_quota.UserQuota'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  user_quota_policy=None,
                  view_name=None):
@@ -46,15 +55,6 @@ class ViewUserQuotaParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        user_quota_policy = cohesity_management_sdk.models.user_quota.UserQuota.from_dictionary(dictionary.get('userQuotaPolicy')) if dictionary.get('userQuotaPolicy') else None
-        view_name = dictionary.get('viewName')
-
-        # Return an object of this model
-        return cls(user_quota_policy,
-                   view_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,11 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.quota_and_usage_in_view
-import cohesity_management_sdk.models.user_quota_summary_for_user
-import cohesity_management_sdk.models.user_quota_summary_for_view
-import cohesity_management_sdk.models.user_quota_settings
-import cohesity_management_sdk.models.user_quota_and_usage
+from cohesity_management_sdk.model_decoder import decode_model
 
 class ViewUserQuotas(object):
 
@@ -42,6 +38,19 @@ class ViewUserQuotas(object):
         "users_quota_and_usage":'usersQuotaAndUsage'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "quota_and_usage_in_all_views":['quota_and_usage_in_view.QuotaAndUsageInView'],
+        "summary_for_user":'user_quota_summary_for_user.UserQuotaSummaryForUser',
+        "summary_for_view":'user_quota_summary_for_view.UserQuotaSummaryForView',
+        "user_quota_settings":'user_quota_settings.UserQuotaSettings',
+        "users_quota_and_usage":['user_quota_and_usage.UserQuotaAndUsage']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  cookie=None,
                  quota_and_usage_in_all_views=None,
@@ -74,31 +83,6 @@ class ViewUserQuotas(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        cookie = dictionary.get('cookie')
-        quota_and_usage_in_all_views = None
-        if dictionary.get('quotaAndUsageInAllViews') != None:
-            quota_and_usage_in_all_views = list()
-            for structure in dictionary.get('quotaAndUsageInAllViews'):
-                quota_and_usage_in_all_views.append(cohesity_management_sdk.models.quota_and_usage_in_view.QuotaAndUsageInView.from_dictionary(structure))
-        summary_for_user = cohesity_management_sdk.models.user_quota_summary_for_user.UserQuotaSummaryForUser.from_dictionary(dictionary.get('summaryForUser')) if dictionary.get('summaryForUser') else None
-        summary_for_view = cohesity_management_sdk.models.user_quota_summary_for_view.UserQuotaSummaryForView.from_dictionary(dictionary.get('summaryForView')) if dictionary.get('summaryForView') else None
-        user_quota_settings = cohesity_management_sdk.models.user_quota_settings.UserQuotaSettings.from_dictionary(dictionary.get('userQuotaSettings')) if dictionary.get('userQuotaSettings') else None
-        users_quota_and_usage = None
-        if dictionary.get('usersQuotaAndUsage') != None:
-            users_quota_and_usage = list()
-            for structure in dictionary.get('usersQuotaAndUsage'):
-                users_quota_and_usage.append(cohesity_management_sdk.models.user_quota_and_usage.UserQuotaAndUsage.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(cookie,
-                   quota_and_usage_in_all_views,
-                   summary_for_user,
-                   summary_for_view,
-                   user_quota_settings,
-                   users_quota_and_usage)
+        return decode_model(cls, dictionary)
 
 
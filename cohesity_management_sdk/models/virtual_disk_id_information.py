@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VirtualDiskIdInformation(object):
 
@@ -28,6 +29,9 @@ class VirtualDiskIdInformation(object):
         "unit_number":'unitNumber'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bus_number=None,
                  controller_type=None,
@@ -56,19 +60,6 @@ class VirtualDiskIdInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bus_number = dictionary.get('busNumber')
-        controller_type = dictionary.get('controllerType')
-        disk_id = dictionary.get('diskId')
-        unit_number = dictionary.get('unitNumber')
-
-        # Return an object of this model
-        return cls(bus_number,
-                   controller_type,
-                   disk_id,
-                   unit_number)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_source
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VirtualDiskInformation(object):
 
@@ -41,6 +41,15 @@ class VirtualDiskInformation(object):
         "unit_number":'unitNumber'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "disk_location":'protection_source.ProtectionSource'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  bus_number=None,
                  controller_type=None,
@@ -77,27 +86,6 @@ class VirtualDiskInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        bus_number = dictionary.get('busNumber')
-        controller_type = dictionary.get('controllerType')
-        disk_id = dictionary.get('diskId')
-        disk_location = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('diskLocation')) if dictionary.get('diskLocation') else None
-        disk_size_in_bytes = dictionary.get('diskSizeInBytes')
-        file_path = dictionary.get('filePath')
-        mount_points = dictionary.get('mountPoints')
-        unit_number = dictionary.get('unitNumber')
-
-        # Return an object of this model
-        return cls(bus_number,
-                   controller_type,
-                   disk_id,
-                   disk_location,
-                   disk_size_in_bytes,
-                   file_path,
-                   mount_points,
-                   unit_number)
+        return decode_model(cls, dictionary)
 
 
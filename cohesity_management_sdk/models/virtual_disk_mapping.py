@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.virtual_disk_id_information
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VirtualDiskMapping(object):
 
@@ -31,6 +31,16 @@ class VirtualDiskMapping(object):
         "target_location_id":'targetLocationId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "disk_to_overwrite":'virtual_disk_id_information.VirtualDiskIdInformation',
+        "source_disk":'virtual_disk_id_information.VirtualDiskIdInformation'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disk_to_overwrite=None,
                  source_disk=None,
@@ -57,17 +67,6 @@ class VirtualDiskMapping(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disk_to_overwrite = cohesity_management_sdk.models.virtual_disk_id_information.VirtualDiskIdInformation.from_dictionary(dictionary.get('diskToOverwrite')) if dictionary.get('diskToOverwrite') else None
-        source_disk = cohesity_management_sdk.models.virtual_disk_id_information.VirtualDiskIdInformation.from_dictionary(dictionary.get('sourceDisk')) if dictionary.get('sourceDisk') else None
-        target_location_id = dictionary.get('targetLocationId')
-
-        # Return an object of this model
-        return cls(disk_to_overwrite,
-                   source_disk,
-                   target_location_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.request_error
-import cohesity_management_sdk.models.virtual_disk_restore_response
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VirtualDiskRecoverTaskState(object):
 
@@ -37,6 +36,16 @@ class VirtualDiskRecoverTaskState(object):
         "virtual_disk_restore_response":'virtualDiskRestoreResponse'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "error":'request_error.RequestError',
+        "virtual_disk_restore_response":'virtual_disk_restore_response.VirtualDiskRestoreResponse'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  error=None,
                  is_instant_recovery_finished=None,
@@ -65,19 +74,6 @@ class VirtualDiskRecoverTaskState(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        error = cohesity_management_sdk.models.request_error.RequestError.from_dictionary(dictionary.get('error')) if dictionary.get('error') else None
-        is_instant_recovery_finished = dictionary.get('isInstantRecoveryFinished')
-        task_state = dictionary.get('taskState')
-        virtual_disk_restore_response = cohesity_management_sdk.models.virtual_disk_restore_response.VirtualDiskRestoreResponse.from_dictionary(dictionary.get('virtualDiskRestoreResponse')) if dictionary.get('virtualDiskRestoreResponse') else None
-
-        # Return an object of this model
-        return cls(error,
-                   is_instant_recovery_finished,
-                   task_state,
-                   virtual_disk_restore_response)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.virtual_disk_mapping
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VirtualDiskRestoreParameters(object):
 
@@ -29,6 +29,15 @@ class VirtualDiskRestoreParameters(object):
         "virtual_disk_mappings":'virtualDiskMappings'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "virtual_disk_mappings":['virtual_disk_mapping.VirtualDiskMapping']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  power_off_vm_before_recovery=None,
                  power_on_vm_after_recovery=None,
@@ -57,23 +66,6 @@ class VirtualDiskRestoreParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        power_off_vm_before_recovery = dictionary.get('powerOffVmBeforeRecovery')
-        power_on_vm_after_recovery = dictionary.get('powerOnVmAfterRecovery')
-        target_source_id = dictionary.get('targetSourceId')
-        virtual_disk_mappings = None
-        if dictionary.get('virtualDiskMappings') != None:
-            virtual_disk_mappings = list()
-            for structure in dictionary.get('virtualDiskMappings'):
-                virtual_disk_mappings.append(cohesity_management_sdk.models.virtual_disk_mapping.VirtualDiskMapping.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(power_off_vm_before_recovery,
-                   power_on_vm_after_recovery,
-                   target_source_id,
-                   virtual_disk_mappings)
+        return decode_model(cls, dictionary)
 
 
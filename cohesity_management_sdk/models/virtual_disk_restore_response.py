@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.protection_source
-import cohesity_management_sdk.models.virtual_disk_mapping_response
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VirtualDiskRestoreResponse(object):
 
@@ -32,6 +31,16 @@ class VirtualDiskRestoreResponse(object):
         "virtual_disk_mappings":'virtualDiskMappings'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "target_source":'protection_source.ProtectionSource',
+        "virtual_disk_mappings":['virtual_disk_mapping_response.VirtualDiskMappingResponse']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  power_off_vm_before_recovery=None,
                  power_on_vm_after_recovery=None,
@@ -60,23 +69,6 @@ class VirtualDiskRestoreResponse(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        power_off_vm_before_recovery = dictionary.get('powerOffVmBeforeRecovery')
-        power_on_vm_after_recovery = dictionary.get('powerOnVmAfterRecovery')
-        target_source = cohesity_management_sdk.models.protection_source.ProtectionSource.from_dictionary(dictionary.get('targetSource')) if dictionary.get('targetSource') else None
-        virtual_disk_mappings = None
-        if dictionary.get('virtualDiskMappings') != None:
-            virtual_disk_mappings = list()
-            for structure in dictionary.get('virtualDiskMappings'):
-                virtual_disk_mappings.append(cohesity_management_sdk.models.virtual_disk_mapping_response.VirtualDiskMappingResponse.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(power_off_vm_before_recovery,
-                   power_on_vm_after_recovery,
-                   target_source,
-                   virtual_disk_mappings)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VirtualNodeConfiguration(object):
 
@@ -20,6 +21,9 @@ class VirtualNodeConfiguration(object):
         "node_ip":'nodeIp'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  node_id=None,
                  node_ip=None):
@@ -44,15 +48,6 @@ class VirtualNodeConfiguration(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        node_id = dictionary.get('nodeId')
-        node_ip = dictionary.get('nodeIp')
-
-        # Return an object of this model
-        return cls(node_id,
-                   node_ip)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.subnet
+from cohesity_management_sdk.model_decoder import decode_model
 
 class Vlan(object):
 
@@ -51,6 +51,15 @@ class Vlan(object):
         "vlan_name":'vlanName'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "subnet":'subnet.Subnet'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  add_to_cluster_partition=None,
                  all_tenant_access=None,
@@ -95,35 +104,6 @@ class Vlan(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        add_to_cluster_partition = dictionary.get('addToClusterPartition')
-        all_tenant_access = dictionary.get('allTenantAccess')
-        description = dictionary.get('description')
-        gateway = dictionary.get('gateway')
-        hostname = dictionary.get('hostname')
-        id = dictionary.get('id')
-        iface_group_name = dictionary.get('ifaceGroupName')
-        interface_name = dictionary.get('interfaceName')
-        ips = dictionary.get('ips')
-        subnet = cohesity_management_sdk.models.subnet.Subnet.from_dictionary(dictionary.get('subnet')) if dictionary.get('subnet') else None
-        tenant_id = dictionary.get('tenantId')
-        vlan_name = dictionary.get('vlanName')
-
-        # Return an object of this model
-        return cls(add_to_cluster_partition,
-                   all_tenant_access,
-                   description,
-                   gateway,
-                   hostname,
-                   id,
-                   iface_group_name,
-                   interface_name,
-                   ips,
-                   subnet,
-                   tenant_id,
-                   vlan_name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VlanParameters(object):
 
@@ -31,6 +32,9 @@ class VlanParameters(object):
         "vlan":'vlan'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disable_vlan=None,
                  interface_name=None,
@@ -57,17 +61,6 @@ class VlanParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disable_vlan = dictionary.get('disableVlan')
-        interface_name = dictionary.get('interfaceName')
-        vlan = dictionary.get('vlan')
-
-        # Return an object of this model
-        return cls(disable_vlan,
-                   interface_name,
-                   vlan)
+        return decode_model(cls, dictionary)
 
 
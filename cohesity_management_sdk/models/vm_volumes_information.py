@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.filesystem_volume
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VmVolumesInformation(object):
 
@@ -21,6 +21,15 @@ class VmVolumesInformation(object):
         "filesystem_volumes":'filesystemVolumes'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "filesystem_volumes":['filesystem_volume.FilesystemVolume']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  filesystem_volumes=None):
         """Constructor for the VmVolumesInformation class"""
@@ -43,17 +52,6 @@ class VmVolumesInformation(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        filesystem_volumes = None
-        if dictionary.get('filesystemVolumes') != None:
-            filesystem_volumes = list()
-            for structure in dictionary.get('filesystemVolumes'):
-                filesystem_volumes.append(cohesity_management_sdk.models.filesystem_volume.FilesystemVolume.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(filesystem_volumes)
+        return decode_model(cls, dictionary)
 
 
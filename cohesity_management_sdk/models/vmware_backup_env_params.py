@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.vmware_disk_exclusion_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VmwareBackupEnvParams(object):
 
@@ -32,6 +32,15 @@ class VmwareBackupEnvParams(object):
         "vmware_disk_exclusion_info":'vmwareDiskExclusionInfo'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "vmware_disk_exclusion_info":['vmware_disk_exclusion_proto.VmwareDiskExclusionProto']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  allow_crash_consistent_snapshot=None,
                  allow_vms_with_physical_rdm_disks=None,
@@ -58,21 +67,6 @@ class VmwareBackupEnvParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        allow_crash_consistent_snapshot = dictionary.get('allowCrashConsistentSnapshot')
-        allow_vms_with_physical_rdm_disks = dictionary.get('allowVmsWithPhysicalRdmDisks')
-        vmware_disk_exclusion_info = None
-        if dictionary.get('vmwareDiskExclusionInfo') != None:
-            vmware_disk_exclusion_info = list()
-            for structure in dictionary.get('vmwareDiskExclusionInfo'):
-                vmware_disk_exclusion_info.append(cohesity_management_sdk.models.vmware_disk_exclusion_proto.VmwareDiskExclusionProto.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(allow_crash_consistent_snapshot,
-                   allow_vms_with_physical_rdm_disks,
-                   vmware_disk_exclusion_info)
+        return decode_model(cls, dictionary)
 
 
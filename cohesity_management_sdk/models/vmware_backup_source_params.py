@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.source_app_params
-import cohesity_management_sdk.models.credentials
-import cohesity_management_sdk.models.vmware_disk_exclusion_proto
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VmwareBackupSourceParams(object):
 
@@ -31,6 +29,17 @@ class VmwareBackupSourceParams(object):
         "vmware_disk_exclusion_info":'vmwareDiskExclusionInfo'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "source_app_params":'source_app_params.SourceAppParams',
+        "vm_credentials":'credentials.Credentials',
+        "vmware_disk_exclusion_info":['vmware_disk_exclusion_proto.VmwareDiskExclusionProto']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  source_app_params=None,
                  vm_credentials=None,
@@ -57,21 +66,6 @@ class VmwareBackupSourceParams(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        source_app_params = cohesity_management_sdk.models.source_app_params.SourceAppParams.from_dictionary(dictionary.get('sourceAppParams')) if dictionary.get('sourceAppParams') else None
-        vm_credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('vmCredentials')) if dictionary.get('vmCredentials') else None
-        vmware_disk_exclusion_info = None
-        if dictionary.get('vmwareDiskExclusionInfo') != None:
-            vmware_disk_exclusion_info = list()
-            for structure in dictionary.get('vmwareDiskExclusionInfo'):
-                vmware_disk_exclusion_info.append(cohesity_management_sdk.models.vmware_disk_exclusion_proto.VmwareDiskExclusionProto.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(source_app_params,
-                   vm_credentials,
-                   vmware_disk_exclusion_info)
+        return decode_model(cls, dictionary)
 
 
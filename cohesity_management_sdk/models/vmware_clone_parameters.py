@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.network_mapping
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VmwareCloneParameters(object):
 
@@ -76,6 +76,15 @@ class VmwareCloneParameters(object):
         "vm_folder_id":'vmFolderId'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "network_mappings":['network_mapping.NetworkMapping']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  datastore_folder_id=None,
                  detach_network=None,
@@ -116,35 +125,6 @@ class VmwareCloneParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        datastore_folder_id = dictionary.get('datastoreFolderId')
-        detach_network = dictionary.get('detachNetwork')
-        disable_network = dictionary.get('disableNetwork')
-        network_id = dictionary.get('networkId')
-        network_mappings = None
-        if dictionary.get('networkMappings') != None:
-            network_mappings = list()
-            for structure in dictionary.get('networkMappings'):
-                network_mappings.append(cohesity_management_sdk.models.network_mapping.NetworkMapping.from_dictionary(structure))
-        powered_on = dictionary.get('poweredOn')
-        prefix = dictionary.get('prefix')
-        resource_pool_id = dictionary.get('resourcePoolId')
-        suffix = dictionary.get('suffix')
-        vm_folder_id = dictionary.get('vmFolderId')
-
-        # Return an object of this model
-        return cls(datastore_folder_id,
-                   detach_network,
-                   disable_network,
-                   network_id,
-                   network_mappings,
-                   powered_on,
-                   prefix,
-                   resource_pool_id,
-                   suffix,
-                   vm_folder_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VmwareDiskExclusionProto(object):
 
@@ -29,6 +30,9 @@ class VmwareDiskExclusionProto(object):
         "unit_number":'unitNumber'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  controller_bus_number=None,
                  controller_type=None,
@@ -55,17 +59,6 @@ class VmwareDiskExclusionProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        controller_bus_number = dictionary.get('controllerBusNumber')
-        controller_type = dictionary.get('controllerType')
-        unit_number = dictionary.get('unitNumber')
-
-        # Return an object of this model
-        return cls(controller_bus_number,
-                   controller_type,
-                   unit_number)
+        return decode_model(cls, dictionary)
 
 
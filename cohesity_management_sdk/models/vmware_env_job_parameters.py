@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.disk_unit
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VmwareEnvJobParameters(object):
 
@@ -30,6 +30,15 @@ class VmwareEnvJobParameters(object):
         "skip_physical_rdm_disks":'skipPhysicalRdmDisks'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "excluded_disks":['disk_unit.DiskUnit']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  excluded_disks=None,
                  fallback_to_crash_consistent=None,
@@ -56,21 +65,6 @@ class VmwareEnvJobParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        excluded_disks = None
-        if dictionary.get('excludedDisks') != None:
-            excluded_disks = list()
-            for structure in dictionary.get('excludedDisks'):
-                excluded_disks.append(cohesity_management_sdk.models.disk_unit.DiskUnit.from_dictionary(structure))
-        fallback_to_crash_consistent = dictionary.get('fallbackToCrashConsistent')
-        skip_physical_rdm_disks = dictionary.get('skipPhysicalRdmDisks')
-
-        # Return an object of this model
-        return cls(excluded_disks,
-                   fallback_to_crash_consistent,
-                   skip_physical_rdm_disks)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VmwareObjectId(object):
 
@@ -24,6 +25,9 @@ class VmwareObjectId(object):
         "uuid":'uuid'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  mor_item=None,
                  mor_type=None,
@@ -50,17 +54,6 @@ class VmwareObjectId(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        mor_item = dictionary.get('morItem')
-        mor_type = dictionary.get('morType')
-        uuid = dictionary.get('uuid')
-
-        # Return an object of this model
-        return cls(mor_item,
-                   mor_type,
-                   uuid)
+        return decode_model(cls, dictionary)
 
 
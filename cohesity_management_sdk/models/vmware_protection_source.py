@@ -1,12 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.agent_information
-import cohesity_management_sdk.models.datastore_info
-import cohesity_management_sdk.models.vmware_object_id
-import cohesity_management_sdk.models.tag_attribute
-import cohesity_management_sdk.models.vcloud_director_info
-import cohesity_management_sdk.models.virtual_disk_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VmwareProtectionSource(object):
 
@@ -131,6 +126,20 @@ class VmwareProtectionSource(object):
         "virtual_disks":'virtualDisks'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "agents":['agent_information.AgentInformation'],
+        "datastore_info":'datastore_info.DatastoreInfo',
+        "id":'vmware_object_id.VmwareObjectId',
+        "tag_attributes":['tag_attribute.TagAttribute'],
+        "vcloud_director_info":['vcloud_director_info.VcloudDirectorInfo'],
+        "virtual_disks":['virtual_disk_info.VirtualDiskInfo']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  agent_id=None,
                  agents=None,
@@ -181,57 +190,6 @@ class VmwareProtectionSource(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        agent_id = dictionary.get('agentId')
-        agents = None
-        if dictionary.get('agents') != None:
-            agents = list()
-            for structure in dictionary.get('agents'):
-                agents.append(cohesity_management_sdk.models.agent_information.AgentInformation.from_dictionary(structure))
-        connection_state = dictionary.get('connectionState')
-        datastore_info = cohesity_management_sdk.models.datastore_info.DatastoreInfo.from_dictionary(dictionary.get('datastoreInfo')) if dictionary.get('datastoreInfo') else None
-        folder_type = dictionary.get('folderType')
-        has_persistent_agent = dictionary.get('hasPersistentAgent')
-        host_type = dictionary.get('hostType')
-        id = cohesity_management_sdk.models.vmware_object_id.VmwareObjectId.from_dictionary(dictionary.get('id')) if dictionary.get('id') else None
-        is_vm_template = dictionary.get('isVmTemplate')
-        name = dictionary.get('name')
-        tag_attributes = None
-        if dictionary.get('tagAttributes') != None:
-            tag_attributes = list()
-            for structure in dictionary.get('tagAttributes'):
-                tag_attributes.append(cohesity_management_sdk.models.tag_attribute.TagAttribute.from_dictionary(structure))
-        tools_running_status = dictionary.get('toolsRunningStatus')
-        mtype = dictionary.get('type')
-        vcloud_director_info = None
-        if dictionary.get('vCloudDirectorInfo') != None:
-            vcloud_director_info = list()
-            for structure in dictionary.get('vCloudDirectorInfo'):
-                vcloud_director_info.append(cohesity_management_sdk.models.vcloud_director_info.VcloudDirectorInfo.from_dictionary(structure))
-        virtual_disks = None
-        if dictionary.get('virtualDisks') != None:
-            virtual_disks = list()
-            for structure in dictionary.get('virtualDisks'):
-                virtual_disks.append(cohesity_management_sdk.models.virtual_disk_info.VirtualDiskInfo.from_dictionary(structure))
-
-        # Return an object of this model
-        return cls(agent_id,
-                   agents,
-                   connection_state,
-                   datastore_info,
-                   folder_type,
-                   has_persistent_agent,
-                   host_type,
-                   id,
-                   is_vm_template,
-                   name,
-                   tag_attributes,
-                   tools_running_status,
-                   mtype,
-                   vcloud_director_info,
-                   virtual_disks)
+        return decode_model(cls, dictionary)
 
 
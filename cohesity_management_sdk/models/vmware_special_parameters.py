@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.application_parameters
-import cohesity_management_sdk.models.disk_unit
-import cohesity_management_sdk.models.credentials
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VmwareSpecialParameters(object):
 
@@ -35,6 +33,17 @@ class VmwareSpecialParameters(object):
         "vm_credentials":'vmCredentials'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "application_parameters":'application_parameters.ApplicationParameters',
+        "excluded_disks":['disk_unit.DiskUnit'],
+        "vm_credentials":'credentials.Credentials'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  application_parameters=None,
                  excluded_disks=None,
@@ -61,21 +70,6 @@ class VmwareSpecialParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        application_parameters = cohesity_management_sdk.models.application_parameters.ApplicationParameters.from_dictionary(dictionary.get('applicationParameters')) if dictionary.get('applicationParameters') else None
-        excluded_disks = None
-        if dictionary.get('excludedDisks') != None:
-            excluded_disks = list()
-            for structure in dictionary.get('excludedDisks'):
-                excluded_disks.append(cohesity_management_sdk.models.disk_unit.DiskUnit.from_dictionary(structure))
-        vm_credentials = cohesity_management_sdk.models.credentials.Credentials.from_dictionary(dictionary.get('vmCredentials')) if dictionary.get('vmCredentials') else None
-
-        # Return an object of this model
-        return cls(application_parameters,
-                   excluded_disks,
-                   vm_credentials)
+        return decode_model(cls, dictionary)
 
 
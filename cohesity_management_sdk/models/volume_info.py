@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.volume_info_disk_info
-import cohesity_management_sdk.models.volume_info_logical_volume_info
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VolumeInfo(object):
 
@@ -43,6 +42,16 @@ class VolumeInfo(object):
         "volume_type":'volumeType'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "disk_vec":['volume_info_disk_info.VolumeInfoDiskInfo'],
+        "lv_info":'volume_info_logical_volume_info.VolumeInfoLogicalVolumeInfo'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disk_vec=None,
                  display_name=None,
@@ -83,35 +92,6 @@ class VolumeInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disk_vec = None
-        if dictionary.get('diskVec') != None:
-            disk_vec = list()
-            for structure in dictionary.get('diskVec'):
-                disk_vec.append(cohesity_management_sdk.models.volume_info_disk_info.VolumeInfoDiskInfo.from_dictionary(structure))
-        display_name = dictionary.get('displayName')
-        filesystem_type = dictionary.get('filesystemType')
-        fs_uuid = dictionary.get('fsUuid')
-        is_bootable = dictionary.get('isBootable')
-        is_dedup = dictionary.get('isDedup')
-        is_supported = dictionary.get('isSupported')
-        lv_info = cohesity_management_sdk.models.volume_info_logical_volume_info.VolumeInfoLogicalVolumeInfo.from_dictionary(dictionary.get('lvInfo')) if dictionary.get('lvInfo') else None
-        volume_guid = dictionary.get('volumeGuid')
-        volume_type = dictionary.get('volumeType')
-
-        # Return an object of this model
-        return cls(disk_vec,
-                   display_name,
-                   filesystem_type,
-                   fs_uuid,
-                   is_bootable,
-                   is_dedup,
-                   is_supported,
-                   lv_info,
-                   volume_guid,
-                   volume_type)
+        return decode_model(cls, dictionary)
 
 
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.volume_info_disk_info_partition_info
-import cohesity_management_sdk.models.volume_info_disk_info_physical_range
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VolumeInfoDiskInfo(object):
 
@@ -41,6 +40,16 @@ class VolumeInfoDiskInfo(object):
         "vmdk_size":'vmdkSize'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "partition_vec":['volume_info_disk_info_partition_info.VolumeInfoDiskInfoPartitionInfo'],
+        "physical_range_vec":['volume_info_disk_info_physical_range.VolumeInfoDiskInfoPhysicalRange']
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  disk_file_name=None,
                  disk_format=None,
@@ -77,35 +86,6 @@ class VolumeInfoDiskInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        disk_file_name = dictionary.get('diskFileName')
-        disk_format = dictionary.get('diskFormat')
-        disk_uuid = dictionary.get('diskUuid')
-        partition_type = dictionary.get('partitionType')
-        partition_vec = None
-        if dictionary.get('partitionVec') != None:
-            partition_vec = list()
-            for structure in dictionary.get('partitionVec'):
-                partition_vec.append(cohesity_management_sdk.models.volume_info_disk_info_partition_info.VolumeInfoDiskInfoPartitionInfo.from_dictionary(structure))
-        physical_range_vec = None
-        if dictionary.get('physicalRangeVec') != None:
-            physical_range_vec = list()
-            for structure in dictionary.get('physicalRangeVec'):
-                physical_range_vec.append(cohesity_management_sdk.models.volume_info_disk_info_physical_range.VolumeInfoDiskInfoPhysicalRange.from_dictionary(structure))
-        sector_size = dictionary.get('sectorSize')
-        vmdk_size = dictionary.get('vmdkSize')
-
-        # Return an object of this model
-        return cls(disk_file_name,
-                   disk_format,
-                   disk_uuid,
-                   partition_type,
-                   partition_vec,
-                   physical_range_vec,
-                   sector_size,
-                   vmdk_size)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VolumeInfoDiskInfoPartitionInfo(object):
 
@@ -38,6 +39,9 @@ class VolumeInfoDiskInfoPartitionInfo(object):
         "start_offset":'startOffset'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  length=None,
                  partition_number=None,
@@ -68,21 +72,6 @@ class VolumeInfoDiskInfoPartitionInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        length = dictionary.get('length')
-        partition_number = dictionary.get('partitionNumber')
-        partition_type_uuid = dictionary.get('partitionTypeUuid')
-        partition_uuid = dictionary.get('partitionUuid')
-        start_offset = dictionary.get('startOffset')
-
-        # Return an object of this model
-        return cls(length,
-                   partition_number,
-                   partition_type_uuid,
-                   partition_uuid,
-                   start_offset)
+        return decode_model(cls, dictionary)
 
 
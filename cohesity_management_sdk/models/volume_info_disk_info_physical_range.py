@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VolumeInfoDiskInfoPhysicalRange(object):
 
@@ -21,6 +22,9 @@ class VolumeInfoDiskInfoPhysicalRange(object):
         "offset":'offset'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  length=None,
                  offset=None):
@@ -45,15 +49,6 @@ class VolumeInfoDiskInfoPhysicalRange(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        length = dictionary.get('length')
-        offset = dictionary.get('offset')
-
-        # Return an object of this model
-        return cls(length,
-                   offset)
+        return decode_model(cls, dictionary)
 
 
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
-import cohesity_management_sdk.models.device_tree
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VolumeInfoLogicalVolumeInfo(object):
 
@@ -28,6 +28,15 @@ class VolumeInfoLogicalVolumeInfo(object):
         "volume_group_uuid":'volumeGroupUuid'
     }
 
+    # Create a mapping from Model property names to the models of nested
+    # structures, in a list for the arrays of structures
+    _types = {
+        "device_tree":'device_tree.DeviceTree'
+    }
+
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  device_tree=None,
                  logical_volume_name=None,
@@ -58,21 +67,6 @@ class VolumeInfoLogicalVolumeInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        device_tree = cohesity_management_sdk.models.device_tree.DeviceTree.from_dictionary(dictionary.get('deviceTree')) if dictionary.get('deviceTree') else None
-        logical_volume_name = dictionary.get('logicalVolumeName')
-        logical_volume_uuid = dictionary.get('logicalVolumeUuid')
-        volume_group_name = dictionary.get('volumeGroupName')
-        volume_group_uuid = dictionary.get('volumeGroupUuid')
-
-        # Return an object of this model
-        return cls(device_tree,
-                   logical_volume_name,
-                   logical_volume_uuid,
-                   volume_group_name,
-                   volume_group_uuid)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VolumeSecurityInfo(object):
 
@@ -31,6 +32,9 @@ class VolumeSecurityInfo(object):
         "user_id":'userId'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  group_id=None,
                  permissions=None,
@@ -59,19 +63,6 @@ class VolumeSecurityInfo(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        group_id = dictionary.get('groupId')
-        permissions = dictionary.get('permissions')
-        style = dictionary.get('style')
-        user_id = dictionary.get('userId')
-
-        # Return an object of this model
-        return cls(group_id,
-                   permissions,
-                   style,
-                   user_id)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class VserverNetworkInterface(object):
 
@@ -31,6 +32,9 @@ class VserverNetworkInterface(object):
         "name":'name'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  data_protocols=None,
                  ip_address=None,
@@ -57,17 +61,6 @@ class VserverNetworkInterface(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        data_protocols = dictionary.get('dataProtocols')
-        ip_address = dictionary.get('ipAddress')
-        name = dictionary.get('name')
-
-        # Return an object of this model
-        return cls(data_protocols,
-                   ip_address,
-                   name)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class WebHookDeliveryTarget(object):
 
@@ -23,6 +24,9 @@ class WebHookDeliveryTarget(object):
         "external_api_url":'externalApiUrl'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  curl_options=None,
                  external_api_url=None):
@@ -47,15 +51,6 @@ class WebHookDeliveryTarget(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        curl_options = dictionary.get('curlOptions')
-        external_api_url = dictionary.get('externalApiUrl')
-
-        # Return an object of this model
-        return cls(curl_options,
-                   external_api_url)
+        return decode_model(cls, dictionary)
 
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class WindowsHostSnapshotParameters(object):
 
@@ -33,6 +34,9 @@ class WindowsHostSnapshotParameters(object):
         "excluded_vss_writers":'excludedVssWriters'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  copy_only_backup=None,
                  disable_metadata=None,
@@ -61,19 +65,6 @@ class WindowsHostSnapshotParameters(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        copy_only_backup = dictionary.get('copyOnlyBackup')
-        disable_metadata = dictionary.get('disableMetadata')
-        disable_notification = dictionary.get('disableNotification')
-        excluded_vss_writers = dictionary.get('excludedVssWriters')
-
-        # Return an object of this model
-        return cls(copy_only_backup,
-                   disable_metadata,
-                   disable_notification,
-                   excluded_vss_writers)
+        return decode_model(cls, dictionary)
 
 
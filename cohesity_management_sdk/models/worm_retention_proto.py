@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # Copyright 2019 Cohesity Inc.
 
+from cohesity_management_sdk.model_decoder import decode_model
 
 class WormRetentionProto(object):
 
@@ -30,6 +31,9 @@ class WormRetentionProto(object):
         "policy_type":'policyType'
     }
 
+    # Keep the properties in slots instead of a per instance __dict__
+    __slots__ = tuple(_names)
+
     def __init__(self,
                  policy_type=None):
         """Constructor for the WormRetentionProto class"""
@@ -52,13 +56,6 @@ class WormRetentionProto(object):
             object: An instance of this structure class.
 
         """
-        if dictionary is None:
-            return None
-
-        # Extract variables from the dictionary
-        policy_type = dictionary.get('policyType')
-
-        # Return an object of this model
-        return cls(policy_type)
+        return decode_model(cls, dictionary)
 
 
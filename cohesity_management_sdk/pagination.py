@@ -0,0 +1,581 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import time
+import itertools
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+
+from cohesity_management_sdk.exceptions.api_exception import APIException
+
+
+def get_field(obj, key):
+    """Reads a property of a model or of a raw response by its API name.
+
+    Args:
+        obj (object): A model, or a dictionary for a raw response.
+        key (string): The API name of the property, e.g. 'paginationCookie'.
+
+    Returns:
+        object: The value of the property, None if it is not set.
+
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(key)
+    for name, api_name in obj._names.items():
+        if api_name == key:
+            return getattr(obj, name)
+    raise KeyError(key)
+
+
+def get_path(obj, path):
+    """Reads a nested property of a model or of a raw response.
+
+    Args:
+        obj (object): A model, or a dictionary for a raw response.
+        path (string): The API names of the properties leading to the value,
+            separated by dots, e.g. 'backupRun.stats.startTimeUsecs'.
+
+    Returns:
+        object: The value, None if it or one of its parents is not set.
+
+    """
+    for key in path.split('.'):
+        obj = get_field(obj, key)
+    return obj
+
+
+class CookiePaginator(object):
+
+    """Iterates over the items of an endpoint which returns its results in
+    pages linked by a cookie.
+
+    Each page gives the cookie to request the next one with, until a page
+    has no cookie. The next page is requested in the background while the
+    items of the current one are consumed, so the latency of the requests
+    overlaps with the processing of the items. Pages are only requested as
+    the iteration goes, an iteration stopped early requests at most one page
+    more than it used.
+
+    Iterating over the paginator yields the items of all the pages, the
+    pages themselves are yielded by pages(). Every iteration starts over from
+    the first page.
+
+    Attributes:
+        fetch_page (callable): The function requesting a page, called with
+            the cookie, None for the first page, and the page size.
+        items (string|callable): The API name of the array holding the items
+            of a page, or a function returning them from a page.
+        cookie (string|callable): The API name of the cookie in a page, or a
+            function returning it from a page.
+        page_size (int): The number of items requested per page, the default
+            of the endpoint when None.
+        prefetch (bool): True to request the next page while the current one
+            is consumed.
+
+    """
+
+    def __init__(self, fetch_page, items, cookie, page_size=None, prefetch=True):
+        """Constructor for the CookiePaginator class
+
+        Args:
+            fetch_page (callable): The function requesting a page.
+            items (string|callable): The items of a page.
+            cookie (string|callable): The cookie of the next page.
+            page_size (int, optional): The number of items per page.
+            prefetch (bool, optional): False to request the pages only once
+                the previous one has been consumed.
+
+        """
+        self.fetch_page = fetch_page
+        self.items = items
+        self.cookie = cookie
+        self.page_size = page_size
+        self.prefetch = prefetch
+
+    def get_items(self, page):
+        items = self.items(page) if callable(self.items) else get_field(page, self.items)
+        return items or []
+
+    def get_cookie(self, page):
+        return self.cookie(page) if callable(self.cookie) else get_field(page, self.cookie)
+
+    def __iter__(self):
+        pages = self.pages()
+        try:
+            for page in pages:
+                for item in self.get_items(page):
+                    yield item
+        finally:
+            pages.close()
+
+    def pages(self):
+        """Requests the pages one after the other.
+
+        Returns:
+            generator: The pages, as returned by the endpoint.
+
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        try:
+            page = self.fetch_page(None, self.page_size)
+            previous = None
+            while True:
+                cookie = self.get_cookie(page)
+                # A cookie coming back unchanged would request the same page forever.
+                if not cookie or cookie == previous:
+                    yield page
+                    return
+                previous = cookie
+                if executor is not None:
+                    next_page = executor.submit(self.fetch_page, cookie, self.page_size)
+                    yield page
+                    page = next_page.result()
+                else:
+                    yield page
+                    page = self.fetch_page(cookie, self.page_size)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+
+class OffsetPaginator(object):
+
+    """Iterates over the items of an endpoint which returns its results in
+    pages selected by the index of their first item, along with the total
+    number of items.
+
+    The first page gives the total count, from which the start index of
+    every other page is known. The other pages are then requested in
+    parallel by a bounded pool of worker threads, and yielded in order. At
+    most max_workers pages are requested ahead of the one being consumed.
+    The pages are as large as the first one, which the cluster may have
+    returned shorter than page_size. Without a total count in the first
+    page, the pages are requested one after the other until one comes back
+    short.
+
+    Iterating over the paginator yields the items of all the pages, the
+    pages themselves are yielded by pages(). Every iteration starts over from
+    the first page.
+
+    Attributes:
+        fetch_page (callable): The function requesting a page, called with
+            the index of its first item and the page size.
+        items (string|callable): The API name of the array holding the items
+            of a page, or a function returning them from a page.
+        total (string|callable): The API name of the total number of items
+            in a page, or a function returning it from a page.
+        page_size (int): The number of items requested per page. The size of
+            the first page is used when None.
+        max_workers (int): The maximum number of pages requested at once.
+
+    """
+
+    def __init__(self, fetch_page, items, total, page_size=None, max_workers=4):
+        """Constructor for the OffsetPaginator class
+
+        Args:
+            fetch_page (callable): The function requesting a page.
+            items (string|callable): The items of a page.
+            total (string|callable): The total number of items.
+            page_size (int, optional): The number of items per page.
+            max_workers (int, optional): The size of the worker pool.
+
+        """
+        self.fetch_page = fetch_page
+        self.items = items
+        self.total = total
+        self.page_size = page_size
+        self.max_workers = max_workers
+
+    def get_items(self, page):
+        items = self.items(page) if callable(self.items) else get_field(page, self.items)
+        return items or []
+
+    def get_total(self, page):
+        return self.total(page) if callable(self.total) else get_field(page, self.total)
+
+    def plan_page_size(self, page, total):
+        """Returns the size of the pages following the first one, None when
+        the first page holds all the items or none.
+
+        Args:
+            page (object): The first page.
+            total (int): The total number of items.
+
+        Returns:
+            int: The number of items per page.
+
+        """
+        served = len(self.get_items(page))
+        if not served or served >= total:
+            return None
+        return served
+
+    def __iter__(self):
+        pages = self.pages()
+        try:
+            for page in pages:
+                for item in self.get_items(page):
+                    yield item
+        finally:
+            pages.close()
+
+    def pages(self):
+        """Requests the first page, then the others in parallel.
+
+        Returns:
+            generator: The pages in order, as returned by the endpoint.
+
+        """
+        page = self.fetch_page(0, self.page_size)
+        yield page
+        total = self.get_total(page)
+        if total is None:
+            page_size = self.page_size or len(self.get_items(page))
+            if not page_size or len(self.get_items(page)) < page_size:
+                return
+            start_index = page_size
+            while True:
+                page = self.fetch_page(start_index, page_size)
+                yield page
+                if len(self.get_items(page)) < page_size:
+                    return
+                start_index += page_size
+
+        # The cluster may return fewer items than requested per page, the
+        # pages are planned from the size of the first one.
+        page_size = self.plan_page_size(page, total)
+        if not page_size:
+            return
+        start_indexes = iter(range(page_size, total, page_size))
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        pending = deque()
+        try:
+            for start_index in itertools.islice(start_indexes, self.max_workers):
+                pending.append(executor.submit(self.fetch_page, start_index, page_size))
+            while pending:
+                page = pending.popleft().result()
+                start_index = next(start_indexes, None)
+                if start_index is not None:
+                    pending.append(executor.submit(self.fetch_page, start_index, page_size))
+                yield page
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+class WindowPaginator(object):
+
+    """Iterates over the items of an endpoint filtered by a time range,
+    splitting the range into windows requested in parallel.
+
+    The windows are requested by a bounded pool of worker threads and
+    yielded from the newest to the oldest. A window whose request times out,
+    or which returns max_items items and so may have been truncated, is
+    split in two halves which are requested instead, down to min_window.
+
+    Each window is requested up to overlap after its end, for the endpoints
+    filtering their end time on another time than the start time of the
+    items, and its items are then filtered on their start time. Items seen
+    in several windows are only yielded once. A window returning max_items
+    items, none of which started within it, is requested again with half the
+    overlap instead of being split: the items of the overlap would hide
+    those of the window however narrow it gets.
+
+    Attributes:
+        fetch_window (callable): The function requesting a window, called
+            with its start time, its end time, None for the latest window of
+            an open range, the maximum number of items and a partition.
+        start (int): The start of the range.
+        end (int): The end of the range, the current time when None.
+        window (int): The initial width of the windows, the whole range when
+            None.
+        time_field (string|callable): The path of the start time of an item,
+            or a function returning it.
+        key_fields (list of string|callable): The paths of the fields
+            identifying an item, or a function returning its identity. Items
+            with no identity are never deduplicated.
+        partitions (list): The values the windows are further split by, e.g.
+            job ids, passed to fetch_window.
+        max_workers (int): The maximum number of windows requested at once.
+        max_items (int): The maximum number of items requested per window,
+            no limit when None.
+        min_window (int): The width under which windows are not split.
+        overlap (int): The time requested after the end of every window.
+        timeout_errors (tuple): The exceptions of a request which timed out.
+
+    """
+
+    timeout_errors = (requests.exceptions.Timeout,)
+
+    def __init__(self, fetch_window, start, end, window, time_field,
+                 key_fields=None, partitions=None, max_workers=4,
+                 max_items=None, min_window=1, overlap=0):
+        """Constructor for the WindowPaginator class
+
+        Args:
+            fetch_window (callable): The function requesting a window.
+            start (int): The start of the range.
+            end (int): The end of the range.
+            window (int): The initial width of the windows.
+            time_field (string|callable): The start time of an item.
+            key_fields (list of string|callable, optional): The identity of
+                an item.
+            partitions (list, optional): The values splitting each window.
+            max_workers (int, optional): The size of the worker pool.
+            max_items (int, optional): The maximum number of items per window.
+            min_window (int, optional): The width of the smallest windows.
+            overlap (int, optional): The time requested after each window.
+
+        """
+        self.fetch_window = fetch_window
+        self.start = start
+        self.end = end
+        self.window = window
+        self.time_field = time_field
+        self.key_fields = key_fields
+        self.partitions = partitions or [None]
+        self.max_workers = max_workers
+        self.max_items = max_items
+        self.min_window = min_window
+        self.overlap = overlap
+
+    def get_time(self, item):
+        if callable(self.time_field):
+            return self.time_field(item)
+        return get_path(item, self.time_field)
+
+    def get_key(self, item):
+        if self.key_fields is None:
+            return None
+        if callable(self.key_fields):
+            return self.key_fields(item)
+        key = tuple(get_path(item, path) for path in self.key_fields)
+        return None if None in key else key
+
+    def plan(self):
+        """Splits the range into its initial windows.
+
+        Returns:
+            list of tuple: The (start, end, partition) of every window, from
+                the newest to the oldest.
+
+        """
+        end = self.end if self.end is not None else int(time.time() * 1000000)
+        windows = []
+        window = self.window or end - self.start
+        while end > self.start:
+            start = max(end - window, self.start)
+            windows.extend((start, end, partition) for partition in self.partitions)
+            end = start
+        return windows
+
+    def request(self, window, latest, overlap=None):
+        """Builds the arguments of fetch_window for a window.
+
+        Args:
+            window (tuple): The (start, end, partition) of the window.
+            latest (int): The end of the newest window.
+            overlap (int, optional): The time requested after the end of the
+                window, self.overlap when None.
+
+        Returns:
+            tuple: The arguments of fetch_window.
+
+        """
+        start, end, partition = window
+        if overlap is None:
+            overlap = self.overlap
+        if end >= latest:
+            request_end = self.end
+        elif self.end is not None:
+            request_end = min(end + overlap, self.end)
+        else:
+            request_end = end + overlap
+        return start, request_end, self.max_items, partition
+
+    def narrow(self, window, latest, items, overlap):
+        """Decides whether a window is requested again with a narrower
+        overlap, when it returned max_items items which all started after
+        its end. Items are expected newest first, so that the window would
+        keep returning them when split.
+
+        Args:
+            window (tuple): The (start, end, partition) of the window.
+            latest (int): The end of the newest window.
+            items (list): The items returned for the window.
+            overlap (int): The overlap the window was requested with.
+
+        Returns:
+            int: The overlap to request the window with again, None to keep
+                the window.
+
+        """
+        if self.max_items is None or len(items or []) < self.max_items or not overlap or \
+                any(self.is_within(window, latest, item) for item in items):
+            return None
+        return overlap // 2 if overlap > self.min_window else 0
+
+    def is_within(self, window, latest, item):
+        start, end, partition = window
+        started = self.get_time(item)
+        return started is None or (started >= start and (started < end or end >= latest))
+
+    def split(self, window, items=None, error=None):
+        """Decides whether a window is split, from its items or the error
+        of its request.
+
+        Args:
+            window (tuple): The (start, end, partition) of the window.
+            items (list, optional): The items of the window.
+            error (Exception, optional): The error of the request.
+
+        Returns:
+            list of tuple: The two halves of the window, newest first, None
+                to keep the window.
+
+        Raises:
+            Exception: The error of the request when the window is not split.
+
+        """
+        start, end, partition = window
+        if error is not None:
+            timed_out = isinstance(error, self.timeout_errors) or \
+                (isinstance(error, APIException) and error.response_code == 504)
+            if not timed_out or end - start <= self.min_window:
+                raise error
+        elif self.max_items is None or len(items or []) < self.max_items or \
+                end - start <= self.min_window:
+            return None
+        middle = start + (end - start) // 2
+        return [(middle, end, partition), (start, middle, partition)]
+
+    def select(self, window, latest, items, seen):
+        """Keeps the items of a window which started within it and were not
+        yielded yet. The newest window keeps the items started after its
+        end as well.
+
+        Args:
+            window (tuple): The (start, end, partition) of the window.
+            latest (int): The end of the newest window.
+            items (list): The items returned for the window.
+            seen (set): The identities of the items yielded so far.
+
+        Returns:
+            list: The items to yield.
+
+        """
+        selected = []
+        for item in items or []:
+            if not self.is_within(window, latest, item):
+                continue
+            key = self.get_key(item)
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            selected.append(item)
+        return selected
+
+    def __iter__(self):
+        windows = deque([window, None, self.overlap] for window in self.plan())
+        latest = windows[0][0][1] if windows else None
+        seen = set()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while windows:
+                for slot in itertools.islice(windows, self.max_workers):
+                    if slot[1] is None:
+                        slot[1] = executor.submit(self.fetch_window,
+                                                  *self.request(slot[0], latest, slot[2]))
+                window, future, overlap = windows.popleft()
+                try:
+                    items = future.result()
+                    narrower = self.narrow(window, latest, items, overlap)
+                    if narrower is not None:
+                        windows.appendleft([window, None, narrower])
+                        continue
+                    halves = self.split(window, items)
+                except Exception as e:
+                    halves = self.split(window, error=e)
+                if halves is not None:
+                    windows.extendleft([half, None, overlap] for half in reversed(halves))
+                    continue
+                for item in self.select(window, latest, items, seen):
+                    yield item
+        finally:
+            for window, future, overlap in windows:
+                if future is not None:
+                    future.cancel()
+            executor.shutdown(wait=False)
+
+
+class ShardPaginator(object):
+
+    """Iterates over the results of an endpoint called once per shard of a
+    listing, e.g. once per root Protection Source.
+
+    The shards are listed first, then requested in parallel by a bounded
+    pool of worker threads, at most max_workers at once. The results are
+    yielded as their requests complete rather than in the order of the
+    shards, so a slow shard does not hold back the others, and every request
+    only returns the data of its own shard.
+
+    Attributes:
+        list_shards (callable): The function returning the shards.
+        fetch_shard (callable): The function requesting a shard, called with
+            the shard.
+        merge (callable): The function called with a shard and its result as
+            they complete, returning the items to yield. When None, the
+            results are yielded as returned by fetch_shard.
+        max_workers (int): The maximum number of shards requested at once.
+
+    """
+
+    def __init__(self, list_shards, fetch_shard, merge=None, max_workers=4):
+        """Constructor for the ShardPaginator class
+
+        Args:
+            list_shards (callable): The function returning the shards.
+            fetch_shard (callable): The function requesting a shard.
+            merge (callable, optional): The function returning the items of
+                a shard.
+            max_workers (int, optional): The size of the worker pool.
+
+        """
+        self.list_shards = list_shards
+        self.fetch_shard = fetch_shard
+        self.merge = merge
+        self.max_workers = max_workers
+
+    def get_items(self, shard, result):
+        if self.merge is None:
+            return [result]
+        return self.merge(shard, result) or []
+
+    def __iter__(self):
+        shards = iter(self.list_shards() or [])
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        pending = {}
+        try:
+            for shard in itertools.islice(shards, self.max_workers):
+                pending[executor.submit(self.fetch_shard, shard)] = shard
+            while pending:
+                done = wait(pending, return_when=FIRST_COMPLETED).done
+                for future in done:
+                    shard = pending.pop(future)
+                    result = future.result()
+                    for next_shard in itertools.islice(shards, 1):
+                        pending[executor.submit(self.fetch_shard, next_shard)] = next_shard
+                    for item in self.get_items(shard, result):
+                        yield item
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+from collections import defaultdict
+
+from cohesity_management_sdk.model_decoder import decode_model
+from cohesity_management_sdk.api_helper import APIHelper
+
+
+class SourceTreeNode(object):
+
+    """A node of a ProtectionSourceTree.
+
+    The identity of the Protection Source of the node is read once when the
+    tree is built. The node itself is decoded into a ProtectionSourceNode
+    only when it is first read, from the JSON it was built from.
+
+    Attributes:
+        id (long|int): The id of the Protection Source.
+        name (string): The name of the Protection Source.
+        environment (string): The environment of the Protection Source, e.g.
+            'kVMware'.
+        parent_id (long|int): The id of the parent Protection Source, as
+            given by the Protection Source or else by the tree.
+        parent (SourceTreeNode): The parent node, None for a root.
+        children (list of SourceTreeNode): The child nodes, the application
+            nodes included.
+        application (bool): True if the node is one of the applicationNodes
+            of its parent, such as a SQL Server instance of a VM.
+        raw (dict|ProtectionSourceNode): The node as returned by the API.
+
+    """
+
+    __slots__ = ('id', 'name', 'environment', 'parent_id', 'parent',
+                 'children', 'application', 'raw', '_node')
+
+    def __init__(self, raw, parent=None, application=False):
+        """Constructor for the SourceTreeNode class
+
+        Args:
+            raw (dict|ProtectionSourceNode): The node as returned by the API.
+            parent (SourceTreeNode, optional): The parent node.
+            application (bool, optional): True for an application node.
+
+        """
+        if isinstance(raw, dict):
+            source = raw.get('protectionSource') or {}
+            self.id = source.get('id')
+            self.name = source.get('name')
+            self.environment = source.get('environment')
+            self.parent_id = source.get('parentId')
+        else:
+            source = raw.protection_source
+            self.id = source.id if source else None
+            self.name = source.name if source else None
+            self.environment = source.environment if source else None
+            self.parent_id = source.parent_id if source else None
+        if self.parent_id is None and parent is not None:
+            self.parent_id = parent.id
+        self.parent = parent
+        self.children = []
+        self.application = application
+        self.raw = raw
+        self._node = None
+
+    @property
+    def node(self):
+        """ProtectionSourceNode: The node decoded into a model. The nodes and
+        applicationNodes it holds are left as returned by the API, the
+        children of the tree should be used instead."""
+        if self._node is None:
+            if isinstance(self.raw, dict):
+                from cohesity_management_sdk.models.protection_source_node import ProtectionSourceNode
+                self._node = decode_model(ProtectionSourceNode, self.raw, lazy=True)
+            else:
+                self._node = self.raw
+        return self._node
+
+    @property
+    def protection_source(self):
+        """ProtectionSource: The Protection Source of the node."""
+        return self.node.protection_source
+
+    def ancestors(self):
+        """Returns the ancestors of the node, from its parent up to its root.
+
+        Returns:
+            list of SourceTreeNode: The ancestors.
+
+        """
+        ancestors = []
+        node = self.parent
+        while node is not None:
+            ancestors.append(node)
+            node = node.parent
+        return ancestors
+
+    def path(self):
+        """Returns the nodes from the root of the node down to the node.
+
+        Returns:
+            list of SourceTreeNode: The path of the node.
+
+        """
+        path = self.ancestors()
+        path.reverse()
+        path.append(self)
+        return path
+
+    def walk(self):
+        """Iterates over the subtree of the node, depth first, the node
+        included.
+
+        Returns:
+            generator of SourceTreeNode: The nodes of the subtree.
+
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def __repr__(self):
+        return '<SourceTreeNode {} {!r} {}>'.format(self.id, self.name, self.environment)
+
+
+class ProtectionSourceTree(object):
+
+    """The Protection Sources hierarchy returned by list_protection_sources,
+    indexed for lookups.
+
+    Every node of the hierarchy, application nodes included, becomes a
+    SourceTreeNode with a pointer to its parent. The nodes are indexed by
+    id, name, parent id and environment, so looking a node up does not walk
+    the tree.
+
+    Example:
+        tree = client.protection_sources.get_protection_source_tree(
+            environments=['kVMware'])
+        vm = tree.get(1234)
+        print('/'.join(node.name for node in vm.path()))
+        for node in tree.find_by_environment('kSQL'):
+            print(node.name, node.parent.name)
+
+    Attributes:
+        roots (list of SourceTreeNode): The root nodes, one per registered
+            Source.
+
+    """
+
+    def __init__(self, nodes=None):
+        """Constructor for the ProtectionSourceTree class
+
+        Args:
+            nodes (list of ProtectionSourceNode|dict, optional): The root
+                nodes returned by list_protection_sources, as models or raw
+                dictionaries.
+
+        """
+        self.roots = []
+        self._count = 0
+        self._by_id = {}
+        self._by_name = defaultdict(list)
+        self._by_parent_id = defaultdict(list)
+        self._by_environment = defaultdict(list)
+        for node in nodes or []:
+            self.add(node)
+
+    def add(self, root):
+        """Adds the hierarchy of a root node to the tree.
+
+        Args:
+            root (ProtectionSourceNode|dict): A root node returned by
+                list_protection_sources.
+
+        Returns:
+            SourceTreeNode: The root node of the tree.
+
+        """
+        root = SourceTreeNode(root)
+        self.roots.append(root)
+        self._index(root)
+        stack = [root]
+        while stack:
+            parent = stack.pop()
+            raw = parent.raw
+            if isinstance(raw, dict):
+                children = raw.get('nodes') or []
+                applications = raw.get('applicationNodes') or []
+            else:
+                children = raw.nodes or []
+                applications = raw.application_nodes or []
+            for child, application in [(child, False) for child in children] + \
+                    [(child, True) for child in applications]:
+                if not isinstance(child, dict) and hasattr(child, '_names'):
+                    child = APIHelper.to_dictionary(child)
+                node = SourceTreeNode(child, parent, application)
+                parent.children.append(node)
+                self._index(node)
+                stack.append(node)
+        return root
+
+    def _index(self, node):
+        # The first node seen keeps the id, an object may be listed twice.
+        self._count += 1
+        self._by_id.setdefault(node.id, node)
+        self._by_name[node.name].append(node)
+        self._by_parent_id[node.parent_id].append(node)
+        self._by_environment[node.environment].append(node)
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, id):
+        return id in self._by_id
+
+    def __getitem__(self, id):
+        return self._by_id[id]
+
+    def __iter__(self):
+        for root in self.roots:
+            for node in root.walk():
+                yield node
+
+    def get(self, id, default=None):
+        """Looks a node up by the id of its Protection Source.
+
+        Args:
+            id (long|int): The id of the Protection Source.
+            default (object, optional): The value returned when there is no
+                such node.
+
+        Returns:
+            SourceTreeNode: The node.
+
+        """
+        return self._by_id.get(id, default)
+
+    def find_by_name(self, name):
+        """Looks nodes up by the name of their Protection Source.
+
+        Args:
+            name (string): The name of the Protection Source.
+
+        Returns:
+            list of SourceTreeNode: The nodes with this name.
+
+        """
+        return list(self._by_name.get(name, ()))
+
+    def find_by_environment(self, environment):
+        """Looks nodes up by the environment of their Protection Source.
+
+        Args:
+            environment (string): The environment, e.g. 'kVMware'.
+
+        Returns:
+            list of SourceTreeNode: The nodes of this environment.
+
+        """
+        return list(self._by_environment.get(environment, ()))
+
+    def children_of(self, parent_id):
+        """Looks the children of a Protection Source up.
+
+        Args:
+            parent_id (long|int): The id of the parent Protection Source.
+
+        Returns:
+            list of SourceTreeNode: The child nodes.
+
+        """
+        return list(self._by_parent_id.get(parent_id, ()))
+
+    def subtree(self, id):
+        """Iterates over the subtree of a Protection Source, depth first.
+
+        Args:
+            id (long|int): The id of the Protection Source at the top of the
+                subtree.
+
+        Returns:
+            generator of SourceTreeNode: The nodes of the subtree, the node of
+                the id first.
+
+        Raises:
+            KeyError: When there is no such node.
+
+        """
+        return self._by_id[id].walk()
+
+    def path(self, id):
+        """Returns the nodes from the root down to a Protection Source.
+
+        Args:
+            id (long|int): The id of the Protection Source.
+
+        Returns:
+            list of SourceTreeNode: The path of the node.
+
+        Raises:
+            KeyError: When there is no such node.
+
+        """
+        return self._by_id[id].path()
+
+    def find_path(self, names):
+        """Looks a node up by the names of the nodes leading to it from its
+        root, e.g. 'vcenter-1/Datacenter/vm-42'.
+
+        Args:
+            names (string|list of string): The names, or a string of them
+                separated by slashes.
+
+        Returns:
+            list of SourceTreeNode: The nodes matching the path. Several
+                nodes may have the same name under the same parent.
+
+        """
+        if not isinstance(names, (list, tuple)):
+            names = [name for name in names.split('/') if name]
+        if not names:
+            return []
+        names = list(names)
+        return [node for node in self._by_name.get(names[-1], ())
+                if [ancestor.name for ancestor in node.path()] == names]
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import copy
+import email.utils
+import random
+import threading
+import time
+
+from cohesity_management_sdk.http.http_method_enum import HttpMethodEnum
+
+
+class RetryMetrics(object):
+
+    """Counts the calls made under a RetryPolicy, their retries and their
+    latency, retries included. It is safe to share between threads.
+
+    Attributes:
+        calls (int): The number of calls.
+        retries (int): The number of retries.
+        retries_by_reason (dict): The number of retries per HTTP status code
+            or exception class name.
+        exhausted (int): The number of calls which failed after retrying,
+            because of max_attempts or of the deadline.
+        total_latency (float): The time in seconds spent in calls.
+        max_latency (float): The time in seconds of the longest call.
+        total_backoff (float): The time in seconds spent waiting to retry.
+
+    """
+
+    def __init__(self):
+        """Constructor for the RetryMetrics class"""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Sets all the counters back to zero."""
+        with self._lock:
+            self.calls = 0
+            self.retries = 0
+            self.retries_by_reason = {}
+            self.exhausted = 0
+            self.total_latency = 0.0
+            self.max_latency = 0.0
+            self.total_backoff = 0.0
+
+    def record_retry(self, reason, delay):
+        with self._lock:
+            self.retries += 1
+            self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + 1
+            self.total_backoff += delay
+
+    def record_call(self, latency, exhausted):
+        with self._lock:
+            self.calls += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            if exhausted:
+                self.exhausted += 1
+
+    def snapshot(self):
+        """Returns the counters.
+
+        Returns:
+            dict: The counters by name, along with the average latency of the
+                calls.
+
+        """
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'retries': self.retries,
+                'retries_by_reason': dict(self.retries_by_reason),
+                'exhausted': self.exhausted,
+                'total_latency': self.total_latency,
+                'average_latency': self.total_latency / self.calls if self.calls else 0.0,
+                'max_latency': self.max_latency,
+                'total_backoff': self.total_backoff
+            }
+
+
+class RetryPolicy(object):
+
+    """Decides which failed requests are sent again, and when.
+
+    Requests are retried on connection errors, timeouts and the
+    retry_statuses, with a full jitter exponential backoff: the n-th retry
+    waits a random time between 0 and min(max_delay, base_delay * 2 ** n).
+    A Retry-After header sets the wait instead. No retry is made past the
+    deadline of the call.
+
+    Only idempotent requests are retried after they may have reached the
+    cluster: GET, HEAD, PUT and DELETE requests, and the endpoints declared
+    safe to retry. Other requests, such as the POST creating a Job Run, are
+    only retried when they could not be sent, on connection failures, and
+    when the cluster answers 429 Too Many Requests.
+
+    Example:
+        client.config.retry_policy = RetryPolicy(max_attempts=5, deadline=300)
+        ...
+        print(client.config.retry_policy.metrics.snapshot())
+
+    Attributes:
+        max_attempts (int): The maximum number of times a request is sent.
+        base_delay (float): The backoff of the first retry in seconds.
+        max_delay (float): The maximum backoff in seconds.
+        deadline (float): The time in seconds after the start of a call past
+            which it is not retried, None for no limit.
+        retry_statuses (set of int): The status codes retried.
+        retry_timeouts (bool): False not to retry the requests whose
+            response timed out.
+        idempotent_methods (set of string): The HTTP methods safe to retry.
+        idempotent_endpoints (set of string): The names of the other
+            endpoints safe to retry, in addition to the idempotent_endpoints
+            declared by the controllers.
+        metrics (RetryMetrics): The counters of the calls made under the
+            policy.
+
+    """
+
+    def __init__(self, max_attempts=4, base_delay=0.5, max_delay=20.0,
+                 deadline=120.0, retry_statuses=(429, 502, 503, 504),
+                 retry_timeouts=True, idempotent_endpoints=(), metrics=None):
+        """Constructor for the RetryPolicy class
+
+        Args:
+            max_attempts (int, optional): The maximum number of attempts.
+            base_delay (float, optional): The backoff of the first retry.
+            max_delay (float, optional): The maximum backoff.
+            deadline (float, optional): The time after which a call is not
+                retried.
+            retry_statuses (list of int, optional): The status codes
+                retried.
+            retry_timeouts (bool, optional): False not to retry timeouts.
+            idempotent_endpoints (list of string, optional): The names of
+                endpoints safe to retry.
+            metrics (RetryMetrics, optional): The counters, new ones when
+                None.
+
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = set(retry_statuses)
+        self.retry_timeouts = retry_timeouts
+        self.idempotent_methods = set([HttpMethodEnum.GET, HttpMethodEnum.HEAD,
+                                       HttpMethodEnum.PUT, HttpMethodEnum.DELETE])
+        self.idempotent_endpoints = set(idempotent_endpoints)
+        self.metrics = metrics if metrics is not None else RetryMetrics()
+
+    def evolve(self, **changes):
+        """Returns a copy of the policy with some attributes changed. The
+        copy shares the metrics of the policy.
+
+        Args:
+            changes: The attributes to change, e.g. retry_timeouts=False.
+
+        Returns:
+            RetryPolicy: The copy.
+
+        """
+        policy = copy.copy(self)
+        for name, value in changes.items():
+            if not hasattr(policy, name):
+                raise TypeError("Unknown retry policy property: {}".format(name))
+            setattr(policy, name, value)
+        return policy
+
+    def is_idempotent(self, request, name=None, idempotent_endpoints=()):
+        """Tells whether a request may be sent more than once.
+
+        Args:
+            request (HttpRequest): The request.
+            name (string, optional): The name of its endpoint.
+            idempotent_endpoints (set of string, optional): The endpoints
+                declared safe to retry by the controller.
+
+        Returns:
+            bool: True when the request is safe to retry.
+
+        """
+        return request.http_method in self.idempotent_methods or \
+            name in self.idempotent_endpoints or name in idempotent_endpoints
+
+    def backoff(self, retry):
+        """Returns the full jitter backoff of a retry.
+
+        Args:
+            retry (int): The number of the retry, from 0.
+
+        Returns:
+            float: The time to wait in seconds.
+
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+    @staticmethod
+    def get_retry_after(response):
+        """Reads the Retry-After header of a response.
+
+        Args:
+            response (HttpResponse): The response.
+
+        Returns:
+            float: The number of seconds to wait, None without a valid header.
+
+        """
+        headers = response.headers or {}
+        value = headers.get('Retry-After') or headers.get('retry-after')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            date = email.utils.parsedate_tz(value)
+            if date is None:
+                return None
+            return max(0.0, email.utils.mktime_tz(date) - time.time())
+
+    def begin(self, idempotent):
+        """Starts a call.
+
+        Args:
+            idempotent (bool): True when the request is safe to retry.
+
+        Returns:
+            RetryCall: The state of the call.
+
+        """
+        return RetryCall(self, idempotent)
+
+
+class RetryCall(object):
+
+    """The attempts of one call under a RetryPolicy.
+
+    Attributes:
+        policy (RetryPolicy): The policy.
+        idempotent (bool): True when the request is safe to retry.
+        attempts (int): The number of attempts made.
+        start (float): The time the call started at.
+        exhausted (bool): True when a retry was denied by max_attempts or
+            by the deadline.
+
+    """
+
+    def __init__(self, policy, idempotent):
+        """Constructor for the RetryCall class
+
+        Args:
+            policy (RetryPolicy): The policy.
+            idempotent (bool): True when the request is safe to retry.
+
+        """
+        self.policy = policy
+        self.idempotent = idempotent
+        self.attempts = 0
+        self.start = time.time()
+        self.exhausted = False
+
+    def next_delay(self, response=None, error=None, sent=True, timeout=False):
+        """Records the outcome of an attempt and decides on a retry.
+
+        Args:
+            response (HttpResponse, optional): The response received.
+            error (Exception, optional): The transient error raised instead.
+            sent (bool, optional): False when the error happened before the
+                request was sent, e.g. the connection was refused.
+            timeout (bool, optional): True when the error is the response
+                timing out.
+
+        Returns:
+            float: The time to wait in seconds before retrying, None not to
+                retry.
+
+        """
+        self.attempts += 1
+        if error is not None:
+            reason = type(error).__name__
+            retryable = (self.idempotent or not sent) and \
+                (self.policy.retry_timeouts or not timeout)
+        else:
+            reason = response.status_code
+            retryable = reason in self.policy.retry_statuses and \
+                (self.idempotent or reason == 429)
+        if not retryable:
+            return None
+        if self.attempts >= self.policy.max_attempts:
+            self.exhausted = True
+            return None
+        delay = None
+        if response is not None:
+            delay = self.policy.get_retry_after(response)
+        if delay is None:
+            delay = self.policy.backoff(self.attempts - 1)
+        if self.policy.deadline is not None and \
+                time.time() + delay - self.start > self.policy.deadline:
+            self.exhausted = True
+            return None
+        self.policy.metrics.record_retry(reason, delay)
+        return delay
+
+    def finish(self):
+        """Records the end of the call."""
+        self.policy.metrics.record_call(time.time() - self.start, self.exhausted)
+
+
+# The retry policy of the controllers whose requests are never retried, even
+# when the configuration has one, e.g. to check the health of a node.
+NO_RETRY = RetryPolicy(max_attempts=1)
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import json
+import logging
+import time
+import sqlite3
+import threading
+
+from cohesity_management_sdk.pagination import get_path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS protection_runs (
+    cluster TEXT NOT NULL,
+    job_id INTEGER NOT NULL,
+    job_run_id INTEGER NOT NULL,
+    job_name TEXT,
+    status TEXT,
+    run_type TEXT,
+    start_time_usecs INTEGER,
+    end_time_usecs INTEGER,
+    document TEXT NOT NULL,
+    PRIMARY KEY (cluster, job_id, job_run_id)
+);
+CREATE INDEX IF NOT EXISTS protection_runs_by_time
+    ON protection_runs (cluster, start_time_usecs);
+CREATE INDEX IF NOT EXISTS protection_runs_by_job
+    ON protection_runs (cluster, job_id, start_time_usecs);
+CREATE INDEX IF NOT EXISTS protection_runs_by_status
+    ON protection_runs (cluster, status, start_time_usecs);
+CREATE TABLE IF NOT EXISTS alerts (
+    cluster TEXT NOT NULL,
+    id TEXT NOT NULL,
+    alert_type INTEGER,
+    alert_category TEXT,
+    severity TEXT,
+    alert_state TEXT,
+    first_timestamp_usecs INTEGER,
+    latest_timestamp_usecs INTEGER,
+    document TEXT NOT NULL,
+    PRIMARY KEY (cluster, id)
+);
+CREATE INDEX IF NOT EXISTS alerts_by_time
+    ON alerts (cluster, latest_timestamp_usecs);
+CREATE INDEX IF NOT EXISTS alerts_by_severity
+    ON alerts (cluster, severity, latest_timestamp_usecs);
+CREATE INDEX IF NOT EXISTS alerts_by_state
+    ON alerts (cluster, alert_state, latest_timestamp_usecs);
+CREATE TABLE IF NOT EXISTS sync_state (
+    cluster TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    high_water_mark INTEGER,
+    synced_at_usecs INTEGER,
+    PRIMARY KEY (cluster, kind)
+);
+"""
+
+
+class SyncStore(object):
+
+    """A local SQLite mirror of the Job Runs and Alerts of clusters, kept up
+    to date incrementally.
+
+    Every sync only requests the data newer than the high-water mark
+    recorded for the cluster by the previous one, minus an overlap, and
+    upserts it batch_size rows at a time. Job Runs which were still running
+    when synced are requested again until they finish. The mirror is then queried locally, by job,
+    status and time range, through indexes.
+
+    The JSON of every Job Run and Alert is stored as returned by the API, and
+    queries return it as models, or as dictionaries with raw=True.
+
+    Example:
+        store = SyncStore('reporting.db')
+        store.sync(client)
+        failed = store.query_protection_runs(status='kFailure',
+                                             start_time_usecs=yesterday)
+
+    Attributes:
+        path (string): The path of the SQLite database.
+        overlap_usecs (int): The time requested before the high-water mark,
+            to pick up the changes made around the previous sync.
+        window_usecs (int): The width of the windows Job Runs are requested
+            in by the syncs following the first one, see
+            ProtectionRunsController.paginate_protection_runs. The first
+            sync requests the whole history at once, split as long as it
+            returns too many runs, instead of in windows since start_time.
+            None requests every sync that way.
+        max_alerts (int): The number of Alerts requested at once.
+        batch_size (int): The number of rows upserted at once.
+
+    """
+
+    RUNNING_STATUSES = ('kAccepted', 'kRunning', 'kCanceling')
+
+    batch_size = 1000
+
+    def __init__(self, path=':memory:', overlap_usecs=3600000000,
+                 window_usecs=7 * 86400000000, max_alerts=1000):
+        """Constructor for the SyncStore class
+
+        Args:
+            path (string, optional): The path of the SQLite database, created
+                if needed. The database is kept in memory by default.
+            overlap_usecs (int, optional): The overlap of the syncs, 1 hour by
+                default.
+            window_usecs (int, optional): The width of the windows of Job
+                Runs, 7 days by default.
+            max_alerts (int, optional): The page size of the Alerts.
+
+        """
+        self.path = path
+        self.overlap_usecs = overlap_usecs
+        self.window_usecs = window_usecs
+        self.max_alerts = max_alerts
+        self._lock = threading.RLock()
+        self.logger = logging.getLogger(__name__)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        """Closes the database."""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def cluster_of(client, cluster=None):
+        return cluster if cluster is not None else client.config.cluster_vip
+
+    def get_high_water_mark(self, cluster, kind):
+        """Returns the high-water mark recorded for a cluster.
+
+        Args:
+            cluster (string): The cluster.
+            kind (string): 'protection_runs' or 'alerts'.
+
+        Returns:
+            int: The time(usecs) the next sync starts from, None if the
+                cluster was never synced.
+
+        """
+        with self._lock:
+            row = self.connection.execute(
+                'SELECT high_water_mark FROM sync_state WHERE cluster = ? AND kind = ?',
+                (cluster, kind)).fetchone()
+        return row[0] if row else None
+
+    def sync(self, client, cluster=None, start_time_usecs=0):
+        """Syncs the Job Runs and the Alerts of a cluster.
+
+        Args:
+            client (CohesityClient): The client of the cluster.
+            cluster (string, optional): The name the cluster is stored under,
+                its VIP by default.
+            start_time_usecs (int, optional): Where the first sync of the
+                cluster starts from, the beginning of the history by default.
+
+        Returns:
+            dict: The number of Job Runs and Alerts upserted.
+
+        """
+        return {
+            'protection_runs': self.sync_protection_runs(client, cluster, start_time_usecs),
+            'alerts': self.sync_alerts(client, cluster, start_time_usecs),
+        }
+
+    def sync_protection_runs(self, client, cluster=None, start_time_usecs=0):
+        """Upserts the Job Runs of a cluster started since the high-water
+        mark, or still running at the previous sync.
+
+        Args:
+            client (CohesityClient): The client of the cluster.
+            cluster (string, optional): The name the cluster is stored under.
+            start_time_usecs (int, optional): The start of the first sync.
+
+        Returns:
+            int: The number of Job Runs upserted.
+
+        """
+        cluster = self.cluster_of(client, cluster)
+        since = self._since(cluster, 'protection_runs', start_time_usecs)
+        # The first sync has no high-water mark to bound its range: it is not
+        # requested one window at a time from start_time_usecs.
+        window_usecs = self.window_usecs
+        if self.get_high_water_mark(cluster, 'protection_runs') is None:
+            window_usecs = None
+        synced_at = int(time.time() * 1000000)
+        count = 0
+        rows = []
+        for run in client.protection_runs.raw().paginate_protection_runs(
+                since, window_usecs=window_usecs):
+            job_run_id = get_path(run, 'backupRun.jobRunId')
+            if run.get('jobId') is None or job_run_id is None:
+                continue
+            rows.append((cluster, run['jobId'], job_run_id, run.get('jobName'),
+                         get_path(run, 'backupRun.status'),
+                         get_path(run, 'backupRun.runType'),
+                         get_path(run, 'backupRun.stats.startTimeUsecs'),
+                         get_path(run, 'backupRun.stats.endTimeUsecs'),
+                         json.dumps(run)))
+            if len(rows) >= self.batch_size:
+                count += self._upsert('protection_runs', rows)
+                rows = []
+        count += self._upsert('protection_runs', rows)
+        with self._lock, self.connection:
+            # The next sync starts at the oldest unfinished run, if any.
+            running = self.connection.execute(
+                'SELECT MIN(start_time_usecs) FROM protection_runs WHERE cluster = ? AND '
+                'status IN ({})'.format(', '.join('?' * len(self.RUNNING_STATUSES))),
+                (cluster,) + self.RUNNING_STATUSES).fetchone()[0]
+            latest = self.connection.execute(
+                'SELECT MAX(start_time_usecs) FROM protection_runs WHERE cluster = ?',
+                (cluster,)).fetchone()[0]
+            mark = min(mark for mark in (running, latest, synced_at) if mark is not None)
+            self._set_high_water_mark(cluster, 'protection_runs', mark, synced_at)
+        return count
+
+    def sync_alerts(self, client, cluster=None, start_date_usecs=0):
+        """Upserts the Alerts of a cluster raised or updated since the
+        high-water mark.
+
+        The Alerts are requested newest first, max_alerts at a time, moving
+        the end date back until a request returns fewer Alerts. When more
+        than max_alerts Alerts were raised at the same time, those past the
+        first max_alerts cannot be requested: they are skipped with a
+        warning, and the high-water mark is left where it was.
+
+        Args:
+            client (CohesityClient): The client of the cluster.
+            cluster (string, optional): The name the cluster is stored under.
+            start_date_usecs (int, optional): The start of the first sync.
+
+        Returns:
+            int: The number of Alerts upserted.
+
+        """
+        cluster = self.cluster_of(client, cluster)
+        since = self._since(cluster, 'alerts', start_date_usecs)
+        synced_at = int(time.time() * 1000000)
+        alerts = client.alerts.raw()
+        seen = set()
+        complete = True
+        count = 0
+        end_date_usecs = None
+        while True:
+            page = alerts.get_alerts(self.max_alerts, start_date_usecs=since,
+                                     end_date_usecs=end_date_usecs) or []
+            new = [alert for alert in page if alert.get('id') not in seen]
+            seen.update(alert.get('id') for alert in new)
+            count += self._upsert('alerts', [
+                (cluster, alert['id'], alert.get('alertType'), alert.get('alertCategory'),
+                 alert.get('severity'), alert.get('alertState'),
+                 alert.get('firstTimestampUsecs'), alert.get('latestTimestampUsecs'),
+                 json.dumps(alert)) for alert in new if alert.get('id') is not None])
+            if len(page) < self.max_alerts:
+                break
+            oldest = [alert.get('latestTimestampUsecs') for alert in new
+                      if alert.get('latestTimestampUsecs') is not None]
+            if oldest:
+                end_date_usecs = min(oldest)
+                continue
+            # A full page of Alerts already synced: they were all raised at
+            # the same time, and the others raised then cannot be requested.
+            stamps = [alert.get('latestTimestampUsecs') for alert in page
+                      if alert.get('latestTimestampUsecs') is not None]
+            complete = False
+            if not stamps:
+                self.logger.warning("Alerts of {} could not be paged, some of them "
+                                    "are not synced.".format(cluster))
+                break
+            self.logger.warning("More than {} Alerts of {} were raised at {}, some of them "
+                                "are not synced.".format(self.max_alerts, cluster, min(stamps)))
+            end_date_usecs = min(stamps) - 1
+            if since is not None and end_date_usecs < since:
+                break
+        if complete:
+            with self._lock, self.connection:
+                latest = self.connection.execute(
+                    'SELECT MAX(latest_timestamp_usecs) FROM alerts WHERE cluster = ?',
+                    (cluster,)).fetchone()[0]
+                mark = min(latest, synced_at) if latest is not None else synced_at
+                self._set_high_water_mark(cluster, 'alerts', mark, synced_at)
+        return count
+
+    def query_protection_runs(self, cluster=None, job_id=None, status=None,
+                              start_time_usecs=None, end_time_usecs=None,
+                              limit=None, raw=False):
+        """Queries the mirrored Job Runs, newest first.
+
+        Args:
+            cluster (string, optional): Filter by cluster.
+            job_id (long|int, optional): Filter by Protection Job id.
+            status (string|list of string, optional): Filter by the status of
+                the backup run, e.g. 'kFailure'.
+            start_time_usecs (long|int, optional): Only the runs started at or
+                after this time.
+            end_time_usecs (long|int, optional): Only the runs started before
+                this time.
+            limit (int, optional): The maximum number of runs returned.
+            raw (bool, optional): True to return dictionaries instead of
+                models.
+
+        Returns:
+            list of ProtectionRunInstance: The matching Job Runs.
+
+        """
+        from cohesity_management_sdk.models.protection_run_instance import ProtectionRunInstance
+        return self._query('protection_runs', 'start_time_usecs',
+                           [('cluster', cluster), ('job_id', job_id), ('status', status)],
+                           start_time_usecs, end_time_usecs, limit,
+                           None if raw else ProtectionRunInstance.from_dictionary)
+
+    def query_alerts(self, cluster=None, severity=None, alert_state=None,
+                     alert_category=None, start_date_usecs=None,
+                     end_date_usecs=None, limit=None, raw=False):
+        """Queries the mirrored Alerts, the most recently raised first.
+
+        Args:
+            cluster (string, optional): Filter by cluster.
+            severity (string|list of string, optional): Filter by severity,
+                e.g. 'kCritical'.
+            alert_state (string|list of string, optional): Filter by state,
+                e.g. 'kOpen'.
+            alert_category (string|list of string, optional): Filter by
+                category.
+            start_date_usecs (long|int, optional): Only the Alerts last raised
+                at or after this time.
+            end_date_usecs (long|int, optional): Only the Alerts last raised
+                before this time.
+            limit (int, optional): The maximum number of Alerts returned.
+            raw (bool, optional): True to return dictionaries instead of
+                models.
+
+        Returns:
+            list of Alert: The matching Alerts.
+
+        """
+        from cohesity_management_sdk.models.alert import Alert
+        return self._query('alerts', 'latest_timestamp_usecs',
+                           [('cluster', cluster), ('severity', severity),
+                            ('alert_state', alert_state), ('alert_category', alert_category)],
+                           start_date_usecs, end_date_usecs, limit,
+                           None if raw else Alert.from_dictionary)
+
+    def _since(self, cluster, kind, start):
+        mark = self.get_high_water_mark(cluster, kind)
+        return start if mark is None else max(mark - self.overlap_usecs, start or 0)
+
+    def _upsert(self, table, rows):
+        if rows:
+            with self._lock, self.connection:
+                self.connection.executemany(
+                    'INSERT OR REPLACE INTO {} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)'.format(table),
+                    rows)
+        return len(rows)
+
+    def _set_high_water_mark(self, cluster, kind, mark, synced_at):
+        self.connection.execute(
+            'INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)',
+            (cluster, kind, mark, synced_at))
+
+    def _query(self, table, time_column, filters, start, end, limit, unboxing_function):
+        conditions = []
+        parameters = []
+        for column, value in filters:
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                conditions.append('{} IN ({})'.format(column, ', '.join('?' * len(value))))
+                parameters.extend(value)
+            else:
+                conditions.append('{} = ?'.format(column))
+                parameters.append(value)
+        if start is not None:
+            conditions.append('{} >= ?'.format(time_column))
+            parameters.append(start)
+        if end is not None:
+            conditions.append('{} < ?'.format(time_column))
+            parameters.append(end)
+        sql = 'SELECT document FROM {}'.format(table)
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY {} DESC'.format(time_column)
+        if limit is not None:
+            sql += ' LIMIT ?'
+            parameters.append(limit)
+        with self._lock:
+            documents = [row[0] for row in self.connection.execute(sql, parameters)]
+        if unboxing_function is None:
+            return [json.loads(document) for document in documents]
+        return [unboxing_function(json.loads(document)) for document in documents]
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Cohesity Inc.
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+# os.replace also overwrites on Windows, Python 2 only has os.rename.
+_replace = getattr(os, 'replace', os.rename)
+
+
+class TokenCache(object):
+
+    """Keeps the access tokens of the clients on disk, so that short lived
+    processes reuse the token of a previous one instead of logging in.
+
+    There is one file per cluster VIP, username and domain. The directory
+    and the files are only accessible to the user who created them, and
+    files are replaced atomically. A token is used until max_age seconds
+    after it was received. A token rejected by the cluster is replaced by a
+    fresh login.
+
+    Example:
+        client = CohesityClient(cluster_vip, username, password,
+                                token_cache='~/.cache/cohesity/tokens')
+
+    Attributes:
+        directory (string): The directory holding the tokens.
+        max_age (int): The number of seconds a token is used for.
+
+    """
+
+    def __init__(self, directory=None, max_age=12 * 3600):
+        """Constructor for the TokenCache class
+
+        Args:
+            directory (string, optional): The directory holding the tokens,
+                ~/.cache/cohesity_management_sdk/tokens by default.
+            max_age (int, optional): The number of seconds a token is used
+                for, 12 hours by default.
+
+        """
+        if directory is None:
+            directory = os.path.join('~', '.cache', 'cohesity_management_sdk', 'tokens')
+        self.directory = os.path.expanduser(directory)
+        self.max_age = max_age
+
+    @staticmethod
+    def resolve(token_cache):
+        """Returns the TokenCache of a configuration.
+
+        Args:
+            token_cache (TokenCache|string|bool): The token_cache of a
+                Configuration: a TokenCache, the path of its directory, or
+                True for the default one.
+
+        Returns:
+            TokenCache: The cache, None when the tokens are not cached.
+
+        """
+        if token_cache is None or token_cache is False:
+            return None
+        if isinstance(token_cache, TokenCache):
+            return token_cache
+        return TokenCache(None if token_cache is True else token_cache)
+
+    def get_path(self, cluster_vip, username, domain):
+        key = u'\0'.join([cluster_vip or '', username or '', domain or ''])
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + '.json')
+
+    def load(self, cluster_vip, username, domain):
+        """Reads the token of a user.
+
+        Args:
+            cluster_vip (string): The cluster VIP.
+            username (string): The login name of the user.
+            domain (string): The domain of the user.
+
+        Returns:
+            AccessToken: The token, None when there is none or it is older
+                than max_age.
+
+        """
+        from cohesity_management_sdk.models.access_token import AccessToken
+
+        try:
+            with open(self.get_path(cluster_vip, username, domain)) as f:
+                entry = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        if entry.get('clusterVip') != cluster_vip or \
+                entry.get('username') != username or \
+                entry.get('domain') != domain:
+            return None
+        expiry_time = min(entry.get('expiryTime', 0), entry.get('createdTime', 0) + self.max_age)
+        if expiry_time <= time.time():
+            return None
+        return AccessToken.from_dictionary(entry.get('token'))
+
+    def save(self, cluster_vip, username, domain, token):
+        """Writes the token of a user, readable by the current user only.
+
+        Failures to write are ignored, the token is then requested again by
+        the next process.
+
+        Args:
+            cluster_vip (string): The cluster VIP.
+            username (string): The login name of the user.
+            domain (string): The domain of the user.
+            token (AccessToken): The token.
+
+        """
+        now = time.time()
+        entry = {
+            'clusterVip': cluster_vip,
+            'username': username,
+            'domain': domain,
+            'createdTime': now,
+            'expiryTime': now + self.max_age,
+            'token': {
+                'accessToken': token.access_token,
+                'tokenType': token.token_type,
+                'privileges': token.privileges
+            }
+        }
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory, 0o700)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entry, f)
+                # mkstemp creates the file with the 0600 mode.
+                _replace(temp_path, self.get_path(cluster_vip, username, domain))
+            except Exception:
+                os.remove(temp_path)
+                raise
+        except (IOError, OSError):
+            pass
+
+    def delete(self, cluster_vip, username, domain):
+        """Removes the token of a user.
+
+        Args:
+            cluster_vip (string): The cluster VIP.
+            username (string): The login name of the user.
+            domain (string): The domain of the user.
+
+        """
+        try:
+            os.remove(self.get_path(cluster_vip, username, domain))
+        except (IOError, OSError):
+            pass
@@ -23,6 +23,10 @@ setup(
         'requests>=2.9.1, <3.0',
         'jsonpickle>=0.7.1, <1.0',
         'cachecontrol>=0.11.7, <1.0',
-        'python-dateutil>=2.5.3, <3.0'
-    ]
+        'python-dateutil>=2.5.3, <3.0',
+        'futures>=3.0; python_version < "3"'
+    ],
+    extras_require={
+        'async': ['aiohttp>=3.3, <4.0'],
+    }
 )